@@ -0,0 +1,157 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the throughput and the tail latency of CodeEngineV2 clients against
+the in-memory emulator of the Code Engine API, with a mix of reads, lists,
+updates and job run submissions sent from several threads.
+
+The emulator adds a latency drawn from an exponential distribution to every
+request and fails a fraction of them, so that the client overhead can be seen
+next to the latency of the server:
+
+    python benchmarks/bench_emulator.py --latency 0.005 --error-rate 0.01
+
+With --http, the clients send their requests to the emulator over HTTP on a
+local port instead of in-process.
+
+The emulator is the one of the tests, in `test/code_engine_emulator.py`.
+
+Usage, with the SDK installed:
+
+    python benchmarks/bench_emulator.py [--threads N ...] [--requests N] [--latency SECONDS] [--error-rate RATE] [--http]
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'test'))
+from code_engine_emulator import CodeEngineEmulator  # pylint: disable=wrong-import-position
+
+
+def new_operations(service: CodeEngineV2, project_id: str) -> List[Callable[[], object]]:
+    """
+    Returns the operations of the mix, by their weight.
+    """
+    return (
+        [lambda: service.get_app(project_id, 'my-app')] * 4
+        + [lambda: service.list_job_runs(project_id, job_name='my-job', limit=20)] * 3
+        + [lambda: service.update_app(project_id, 'my-app', '*', {'scale_max_instances': random.randint(1, 10)})]
+        + [lambda: service.create_job_run(project_id, job_name='my-job')] * 2
+    )
+
+
+def run(new_client: Callable[[], CodeEngineV2], project_id: str, threads: int, requests: int) -> Dict[str, float]:
+    """
+    Sends `requests` requests from `threads` threads, and returns the
+    throughput and the percentiles of the latency of the requests.
+    """
+    local = threading.local()
+
+    def call(_) -> tuple:
+        if not hasattr(local, 'operations'):
+            local.operations = new_operations(new_client(), project_id)
+        start = time.perf_counter()
+        try:
+            random.choice(local.operations)()
+            failed = False
+        except ApiException:
+            failed = True
+        return time.perf_counter() - start, failed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        results = list(executor.map(call, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in results)
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        'throughput': requests / elapsed,
+        'p50': quantiles[49],
+        'p95': quantiles[94],
+        'p99': quantiles[98],
+        'errors': sum(failed for _, failed in results) / requests,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--latency', type=float, default=0.0, help='the mean latency of the emulator, in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--http', action='store_true', help='serve the emulator over HTTP')
+    args = parser.parse_args()
+
+    emulator = CodeEngineEmulator(
+        latency=(lambda: random.expovariate(1 / args.latency)) if args.latency else 0.0,
+        error_status_codes=[500, 503],
+        seed=0,
+    )
+    server = None
+    if args.http:
+        server = emulator.serve()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        service_url = 'http://{0}:{1}/v2'.format(*server.server_address[:2])
+
+        def new_client():
+            service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+            service.set_service_url(service_url)
+            return service
+
+    else:
+        new_client = emulator.new_client
+
+    service = new_client()
+    project_id = service.create_project(name='my-project', resource_group_id='default').get_result()['id']
+    service.create_app(project_id, 'icr.io/codeengine/helloworld', 'my-app')
+    service.create_job(project_id, image_reference='icr.io/codeengine/helloworld', name='my-job')
+    emulator.error_rate = args.error_rate
+
+    print(
+        '{0:>8} {1:>12} {2:>10} {3:>10} {4:>10} {5:>8}'.format('threads', 'requests/s', 'p50', 'p95', 'p99', 'errors')
+    )
+    for threads in args.threads:
+        result = run(new_client, project_id, threads, args.requests)
+        print(
+            '{0:8} {1:12.0f} {2:7.2f} ms {3:7.2f} ms {4:7.2f} ms {5:7.1%}'.format(
+                threads,
+                result['throughput'],
+                result['p50'] * 1e3,
+                result['p95'] * 1e3,
+                result['p99'] * 1e3,
+                result['errors'],
+            )
+        )
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
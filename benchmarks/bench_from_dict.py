@@ -0,0 +1,143 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the time that from_dict() of the models takes with the generated
+decoders and with the generated from_dict() methods that they replace.
+
+Usage, with the SDK installed:
+
+    python benchmarks/bench_from_dict.py [--number N] [--repeat N]
+"""
+
+from contextlib import contextmanager
+import argparse
+import timeit
+
+from ibm_code_engine_sdk import code_engine_v2
+
+ENV_VAR = {'type': 'literal', 'name': 'MY_VARIABLE', 'value': 'my-value'}
+
+VOLUME_MOUNT = {'mount_path': '/data', 'name': 'data', 'reference': 'my-pds', 'type': 'persistent_data_store'}
+
+APP = {
+    'computed_env_variables': [ENV_VAR] * 4,
+    'created_at': '2026-03-27T10:00:00+01:00',
+    'endpoint': 'https://my-app.vg67hzldruk.eu-de.codeengine.appdomain.cloud',
+    'entity_tag': '2385407409',
+    'id': 'e33b1cv7-7390-4437-a5c2-130d5ccdddc3',
+    'image_port': 8080,
+    'image_reference': 'icr.io/codeengine/helloworld',
+    'managed_domain_mappings': 'local_public',
+    'name': 'my-app',
+    'probe_liveness': {'type': 'tcp', 'port': 8080},
+    'probe_readiness': {'type': 'tcp', 'port': 8080},
+    'project_id': '4e49b3e0-27a8-48d2-a784-c7ee48bb863b',
+    'region': 'us-east',
+    'resource_type': 'app_v2',
+    'run_arguments': [],
+    'run_commands': [],
+    'run_env_variables': [ENV_VAR] * 4,
+    'run_service_account': 'default',
+    'run_volume_mounts': [VOLUME_MOUNT],
+    'scale_concurrency': 100,
+    'scale_cpu_limit': '1',
+    'scale_ephemeral_storage_limit': '4G',
+    'scale_initial_instances': 1,
+    'scale_max_instances': 10,
+    'scale_memory_limit': '4G',
+    'scale_min_instances': 0,
+    'scale_request_timeout': 300,
+    'status': 'ready',
+    'status_details': {'latest_created_revision': 'my-app-00001', 'latest_ready_revision': 'my-app-00001'},
+}
+
+JOB_RUN = {
+    'computed_env_variables': [ENV_VAR] * 4,
+    'created_at': '2026-03-27T10:00:00+01:00',
+    'id': 'e33b1cv7-7390-4437-a5c2-130d5ccdddc3',
+    'image_reference': 'icr.io/codeengine/helloworld',
+    'job_name': 'my-job',
+    'name': 'my-job-run',
+    'project_id': '4e49b3e0-27a8-48d2-a784-c7ee48bb863b',
+    'region': 'us-east',
+    'resource_type': 'job_run_v2',
+    'run_arguments': [],
+    'run_commands': [],
+    'run_env_variables': [ENV_VAR] * 4,
+    'run_mode': 'task',
+    'run_service_account': 'default',
+    'run_volume_mounts': [VOLUME_MOUNT],
+    'scale_array_spec': '0-9',
+    'scale_cpu_limit': '1',
+    'scale_ephemeral_storage_limit': '4G',
+    'scale_max_execution_time': 7200,
+    'scale_memory_limit': '4G',
+    'scale_retry_limit': 3,
+    'status': 'completed',
+    'status_details': {'requested': 10, 'succeeded': 10, 'succeeded_indices': '0-9'},
+}
+
+CASES = [
+    ('EnvVar', code_engine_v2.EnvVar, ENV_VAR),
+    ('App', code_engine_v2.App, APP),
+    ('JobRun', code_engine_v2.JobRun, JOB_RUN),
+    ('JobRunList (100)', code_engine_v2.JobRunList, {'job_runs': [JOB_RUN] * 100, 'limit': 100}),
+]
+
+
+@contextmanager
+def generated_from_dict():
+    """
+    Restores the generated from_dict() of all models while the context is active.
+    """
+    decoders = {}
+    for model in (getattr(code_engine_v2, name) for name in code_engine_v2.__all__):
+        from_dict = vars(model).get('from_dict') if isinstance(model, type) else None
+        if isinstance(from_dict, classmethod) and hasattr(from_dict.__func__, '__wrapped__'):
+            decoders[model] = from_dict
+            model.from_dict = classmethod(from_dict.__func__.__wrapped__)
+    try:
+        yield
+    finally:
+        for model, from_dict in decoders.items():
+            model.from_dict = from_dict
+
+
+def measure(model: type, _dict: dict, number: int, repeat: int) -> float:
+    """
+    Returns the best time of one call of `model.from_dict(_dict)`, in microseconds.
+    """
+    return min(timeit.repeat(lambda: model.from_dict(_dict), number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print('{0:20} {1:>14} {2:>14} {3:>9}'.format('model', 'from_dict', 'decoder', 'speedup'))
+    for label, model, _dict in CASES:
+        number = max(args.number // 100, 1) if 'List' in label else args.number
+        with generated_from_dict():
+            baseline = measure(model, _dict, number, args.repeat)
+        decoded = measure(model, _dict, number, args.repeat)
+        print('{0:20} {1:11.2f} us {2:11.2f} us {3:8.2f}x'.format(label, baseline, decoded, baseline / decoded))
+
+
+if __name__ == '__main__':
+    main()
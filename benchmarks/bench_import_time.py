@@ -0,0 +1,94 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the time that importing names from code_engine_v2 takes in a new
+interpreter, after the core SDK and requests have been imported.
+
+Every statement is run once to write the bytecode of the modules to a
+temporary cache, and is then timed in new interpreters. The last statement
+imports every name, like importing the module did before it was split.
+
+Usage, with the SDK installed:
+
+    python benchmarks/bench_import_time.py [--repeat N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+STATEMENTS = [
+    'from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2',
+    'from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2, JobRun',
+    'from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2, JobRunsPager',
+    'from ibm_code_engine_sdk.code_engine_v2 import *',
+]
+
+# Times a statement after importing the dependencies of the SDK, and prints the time in seconds.
+SCRIPT = '''
+import time
+import ibm_cloud_sdk_core, requests
+start = time.perf_counter()
+{0}
+print(time.perf_counter() - start)
+'''
+
+
+def new_env(pycache_prefix: str) -> dict:
+    """
+    Returns the environment of the interpreters, which write the bytecode of
+    the modules to `pycache_prefix`.
+    """
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache_prefix)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def time_import(statement: str, env: dict) -> float:
+    """
+    Returns the time of `statement` in a new interpreter, in seconds.
+    """
+    output = subprocess.run(
+        [sys.executable, '-c', SCRIPT.format(statement)], env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return float(output)
+
+
+def measure(statement: str, repeat: int, env: dict) -> float:
+    """
+    Returns the best time of `statement` in new interpreters, in milliseconds.
+    """
+    return min(time_import(statement, env) for _ in range(repeat)) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pycache_prefix:
+        env = new_env(pycache_prefix)
+        print('{0:70} {1:>10}'.format('statement', 'time'))
+        for statement in STATEMENTS:
+            measure(statement, 1, env)
+            print('{0:70} {1:7.1f} ms'.format(statement, measure(statement, args.repeat, env)))
+
+
+if __name__ == '__main__':
+    main()
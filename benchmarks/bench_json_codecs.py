@@ -0,0 +1,54 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the time that the JSON codecs take to encode and decode a config map
+with large values.
+
+Usage, with the SDK and orjson installed:
+
+    python benchmarks/bench_json_codecs.py [--keys N] [--value-size BYTES] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from ibm_code_engine_sdk.json_codecs import OrjsonJSONCodec, StdlibJSONCodec
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('--keys', type=int, default=8)
+    parser.add_argument('--value-size', type=int, default=2**20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    value = ''.join(chr(ord('a') + i % 26) for i in range(args.value_size - 16)) + 'ünïcödé\n"quoted"'
+    config_map = {'name': 'my-config-map', 'data': {'KEY_{0}'.format(i): value for i in range(args.keys)}}
+    print('config map with {0} values of {1} bytes'.format(args.keys, args.value_size))
+    print('{0:10} {1:>12} {2:>12}'.format('codec', 'dumps', 'loads'))
+    for codec in (StdlibJSONCodec(), OrjsonJSONCodec()):
+        document = codec.dumps(config_map)
+        if isinstance(document, str):
+            document = document.encode('utf-8')
+        dumps = min(timeit.repeat(lambda: codec.dumps(config_map), number=1, repeat=args.repeat))
+        loads = min(timeit.repeat(lambda: codec.loads(document), number=1, repeat=args.repeat))
+        name = type(codec).__name__.replace('JSONCodec', '')
+        print('{0:10} {1:9.2f} ms {2:9.2f} ms'.format(name, dumps * 1e3, loads * 1e3))
+
+
+if __name__ == '__main__':
+    main()
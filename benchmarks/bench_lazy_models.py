@@ -0,0 +1,65 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the time that reading the name and status of every job run of a
+JobRunList takes with models and with lazy views.
+
+Usage, with the SDK installed:
+
+    python benchmarks/bench_lazy_models.py [--job-runs N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from ibm_code_engine_sdk.code_engine_v2 import JobRunList
+from ibm_code_engine_sdk.lazy_models import lazy_view
+
+from bench_from_dict import JOB_RUN
+
+
+def read_models(result: dict) -> list:
+    """
+    Converts the list to models and reads the name and status of its job runs.
+    """
+    return [(job_run.name, job_run.status) for job_run in JobRunList.from_dict(result).job_runs]
+
+
+def read_views(result: dict) -> list:
+    """
+    Wraps the list in a lazy view and reads the name and status of its job runs.
+    """
+    return [(job_run.name, job_run.status) for job_run in lazy_view(JobRunList, result).job_runs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('--job-runs', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    result = {'job_runs': [dict(JOB_RUN, name='my-job-run-{0}'.format(i)) for i in range(args.job_runs)], 'limit': 100}
+    models = min(timeit.repeat(lambda: read_models(result), number=1, repeat=args.repeat))
+    views = min(timeit.repeat(lambda: read_views(result), number=1, repeat=args.repeat))
+    print('{0} job runs, reading name and status'.format(args.job_runs))
+    print('models:       {0:10.2f} ms'.format(models * 1e3))
+    print('lazy views:   {0:10.2f} ms'.format(views * 1e3))
+    print('speedup:      {0:10.2f}x'.format(models / views))
+
+
+if __name__ == '__main__':
+    main()
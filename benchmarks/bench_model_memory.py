@@ -0,0 +1,100 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the memory that an inventory of job runs takes as models and as
+compact models.
+
+Usage, with the SDK installed:
+
+    python benchmarks/bench_model_memory.py [--job-runs N] [--env-variables N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from ibm_code_engine_sdk import code_engine_v2, compact_models
+
+
+def job_run_dict(index: int, env_variables: int) -> dict:
+    """
+    Returns the dict of a job run with `env_variables` environment variables.
+    """
+    env_vars = [
+        {'type': 'literal', 'name': 'VARIABLE_{0}'.format(i), 'value': 'value-{0}'.format(i)}
+        for i in range(env_variables)
+    ]
+    return {
+        'computed_env_variables': env_vars,
+        'created_at': '2026-03-27T10:00:00+01:00',
+        'href': 'https://api.au-syd.codeengine.cloud.ibm.com/v2/projects/p/job_runs/my-job-run-{0}'.format(index),
+        'id': 'e33b1cv7-7390-4437-a5c2-130d5ccdddc3',
+        'image_reference': 'icr.io/codeengine/helloworld',
+        'job_name': 'my-job',
+        'name': 'my-job-run-{0}'.format(index),
+        'project_id': '4e49b3e0-27a8-48d2-a784-c7ee48bb863b',
+        'region': 'us-east',
+        'resource_type': 'job_run_v2',
+        'run_arguments': [],
+        'run_commands': [],
+        'run_env_variables': env_vars,
+        'run_mode': 'task',
+        'run_service_account': 'default',
+        'run_volume_mounts': [
+            {'mount_path': '/data', 'name': 'data', 'reference': 'my-pds', 'type': 'persistent_data_store'}
+        ],
+        'scale_array_spec': '0-9',
+        'scale_cpu_limit': '1',
+        'scale_ephemeral_storage_limit': '4G',
+        'scale_max_execution_time': 7200,
+        'scale_memory_limit': '4G',
+        'scale_retry_limit': 3,
+        'status': 'completed',
+        'status_details': {'requested': 10, 'succeeded': 10, 'succeeded_indices': '0-9'},
+    }
+
+
+def measure(job_run_class: type, job_runs: list) -> int:
+    """
+    Returns the number of bytes allocated for the models of `job_runs`.
+    """
+    gc.collect()
+    tracemalloc.start()
+    models = [job_run_class.from_dict(job_run) for job_run in job_runs]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('--job-runs', type=int, default=50000)
+    parser.add_argument('--env-variables', type=int, default=24)
+    args = parser.parse_args()
+
+    job_runs = [job_run_dict(index, args.env_variables) for index in range(args.job_runs)]
+    models = measure(code_engine_v2.JobRun, job_runs)
+    compact = measure(compact_models.JobRun, job_runs)
+    print('{0} job runs with {1} environment variables each'.format(args.job_runs, args.env_variables))
+    print('models:          {0:10.1f} MiB'.format(models / 2**20))
+    print('compact models:  {0:10.1f} MiB'.format(compact / 2**20))
+    print('reduction:       {0:10.1%}'.format(1 - compact / models))
+
+
+if __name__ == '__main__':
+    main()
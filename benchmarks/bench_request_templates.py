@@ -0,0 +1,180 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the per-call overhead of the operations of CodeEngineV2 with the
+request templates and with the generated code that they replace, without
+sending the requests.
+
+Usage, with the SDK installed:
+
+    python benchmarks/bench_request_templates.py [--number N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+from ibm_cloud_sdk_core.utils import convert_model
+from ibm_code_engine_sdk.code_engine_v2 import AppPatch, CodeEngineV2
+from ibm_code_engine_sdk.common import get_sdk_headers
+
+PROJECT_ID = '15314cc3-85b4-4338-903f-c28cdee6d005'
+
+
+def generated_get_job_run(self, project_id: str, name: str, **kwargs):
+    """
+    get_job_run() as it was generated, before the request templates.
+    """
+    if not project_id:
+        raise ValueError('project_id must be provided')
+    if not name:
+        raise ValueError('name must be provided')
+    headers = {}
+    sdk_headers = get_sdk_headers(
+        service_name=self.DEFAULT_SERVICE_NAME,
+        service_version='V2',
+        operation_id='get_job_run',
+    )
+    headers.update(sdk_headers)
+
+    params = {
+        'version': self.version,
+    }
+
+    if 'headers' in kwargs:
+        headers.update(kwargs.get('headers'))
+        del kwargs['headers']
+    headers['Accept'] = 'application/json'
+
+    path_param_keys = ['project_id', 'name']
+    path_param_values = self.encode_path_vars(project_id, name)
+    path_param_dict = dict(zip(path_param_keys, path_param_values))
+    url = '/projects/{project_id}/job_runs/{name}'.format(**path_param_dict)
+    request = self.prepare_request(
+        method='GET',
+        url=url,
+        headers=headers,
+        params=params,
+    )
+
+    response = self.send(request, **kwargs)
+    return response
+
+
+def generated_update_app(self, project_id: str, name: str, if_match: str, app, **kwargs):
+    """
+    update_app() as it was generated, before the request templates.
+    """
+    if not project_id:
+        raise ValueError('project_id must be provided')
+    if not name:
+        raise ValueError('name must be provided')
+    if not if_match:
+        raise ValueError('if_match must be provided')
+    if app is None:
+        raise ValueError('app must be provided')
+    if isinstance(app, AppPatch):
+        app = convert_model(app)
+    headers = {
+        'If-Match': if_match,
+    }
+    sdk_headers = get_sdk_headers(
+        service_name=self.DEFAULT_SERVICE_NAME,
+        service_version='V2',
+        operation_id='update_app',
+    )
+    headers.update(sdk_headers)
+
+    params = {
+        'version': self.version,
+    }
+
+    data = self.json_codec.dumps(app)
+    headers['content-type'] = 'application/merge-patch+json'
+
+    if 'headers' in kwargs:
+        headers.update(kwargs.get('headers'))
+        del kwargs['headers']
+    headers['Accept'] = 'application/json'
+
+    path_param_keys = ['project_id', 'name']
+    path_param_values = self.encode_path_vars(project_id, name)
+    path_param_dict = dict(zip(path_param_keys, path_param_values))
+    url = '/projects/{project_id}/apps/{name}'.format(**path_param_dict)
+    request = self.prepare_request(
+        method='PATCH',
+        url=url,
+        headers=headers,
+        params=params,
+        data=data,
+    )
+
+    response = self.send(request, **kwargs)
+    return response
+
+
+def new_service(prepare_request: bool) -> CodeEngineV2:
+    """
+    Returns a client that returns its requests instead of sending them, and
+    that skips prepare_request() of the core unless `prepare_request` is set.
+    """
+    service = CodeEngineV2(authenticator=BearerTokenAuthenticator('token'))
+    service.set_service_url('https://api.au-syd.codeengine.cloud.ibm.com/v2')
+    service.send = lambda request, **kwargs: request
+    if not prepare_request:
+        service.prepare_request = lambda **kwargs: kwargs
+    return service
+
+
+def measure(function, number: int, repeat: int) -> float:
+    """
+    Returns the best time of one call of `function`, in microseconds.
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    app_patch = {'image_reference': 'icr.io/codeengine/helloworld'}
+    print('{0:36} {1:>14} {2:>14} {3:>9}'.format('operation', 'generated', 'templates', 'speedup'))
+    for prepare_request in (False, True):
+        service = new_service(prepare_request)
+        for label, baseline_function, function in [
+            (
+                'get_job_run',
+                lambda: generated_get_job_run(service, PROJECT_ID, 'my-job-run'),
+                lambda: service.get_job_run(PROJECT_ID, 'my-job-run'),
+            ),
+            (
+                'update_app',
+                lambda: generated_update_app(service, PROJECT_ID, 'my-app', '*', app_patch),
+                lambda: service.update_app(PROJECT_ID, 'my-app', '*', app_patch),
+            ),
+        ]:
+            if prepare_request:
+                label += ' + prepare_request()'
+            baseline = measure(baseline_function, args.number, args.repeat)
+            optimized = measure(function, args.number, args.repeat)
+            print('{0:36} {1:11.2f} us {2:11.2f} us {3:8.2f}x'.format(label, baseline, optimized, baseline / optimized))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the time that to_dict() of the models and the comparison of equal
+compact models take with the methods of the encoders module and with the
+methods that they replace.
+
+Usage, with the SDK installed:
+
+    python benchmarks/bench_to_dict.py [--number N] [--repeat N]
+"""
+
+from contextlib import contextmanager
+import argparse
+import timeit
+
+from ibm_code_engine_sdk import code_engine_v2, compact_models
+
+from bench_from_dict import APP, ENV_VAR, JOB_RUN, VOLUME_MOUNT
+
+JOB = {
+    'build': 'my-build',
+    'computed_env_variables': [ENV_VAR] * 4,
+    'created_at': '2026-03-27T10:00:00+01:00',
+    'entity_tag': '2385407409',
+    'id': 'e33b1cv7-7390-4437-a5c2-130d5ccdddc3',
+    'image_reference': 'icr.io/codeengine/helloworld',
+    'name': 'my-job',
+    'project_id': '4e49b3e0-27a8-48d2-a784-c7ee48bb863b',
+    'region': 'us-east',
+    'resource_type': 'job_v2',
+    'run_arguments': [],
+    'run_commands': [],
+    'run_env_variables': [ENV_VAR] * 4,
+    'run_mode': 'task',
+    'run_service_account': 'default',
+    'run_volume_mounts': [VOLUME_MOUNT],
+    'scale_array_spec': '0-9',
+    'scale_cpu_limit': '1',
+    'scale_ephemeral_storage_limit': '4G',
+    'scale_max_execution_time': 7200,
+    'scale_memory_limit': '4G',
+    'scale_retry_limit': 3,
+}
+
+BUILD_RUN = {
+    'build_name': 'my-build',
+    'created_at': '2026-03-27T10:00:00+01:00',
+    'id': 'e33b1cv7-7390-4437-a5c2-130d5ccdddc3',
+    'name': 'my-build-run',
+    'output_image': 'private.de.icr.io/icr_namespace/image-name',
+    'output_secret': 'ce-auto-icr-private-eu-de',
+    'project_id': '4e49b3e0-27a8-48d2-a784-c7ee48bb863b',
+    'region': 'us-east',
+    'resource_type': 'build_run_v2',
+    'run_build_params': [{'name': 'ARG', 'value': 'value', 'type': 'literal'}] * 2,
+    'service_account': 'default',
+    'source_type': 'git',
+    'source_url': 'https://github.com/IBM/CodeEngine',
+    'status': 'succeeded',
+    'status_details': {'reason': 'succeeded', 'start_time': '2026-03-27T10:00:00+01:00'},
+    'strategy_size': 'medium',
+    'strategy_type': 'dockerfile',
+    'timeout': 600,
+}
+
+CASES = [
+    ('App', code_engine_v2.App, APP),
+    ('Job', code_engine_v2.Job, JOB),
+    ('JobRun', code_engine_v2.JobRun, JOB_RUN),
+    ('BuildRun', code_engine_v2.BuildRun, BUILD_RUN),
+]
+
+
+@contextmanager
+def generated_methods():
+    """
+    Restores the to_dict() and __eq__() of all models and compact models while
+    the context is active.
+    """
+    methods = []
+    for model in [getattr(code_engine_v2, name) for name in code_engine_v2.__all__] + list(
+        vars(compact_models).values()
+    ):
+        if not isinstance(model, type):
+            continue
+        for name in ('to_dict', '__eq__'):
+            method = vars(model).get(name)
+            if hasattr(method, '__wrapped__'):
+                methods.append((model, name, method))
+                setattr(model, name, method.__wrapped__)
+    try:
+        yield
+    finally:
+        for model, name, method in methods:
+            setattr(model, name, method)
+
+
+def measure(function, number: int, repeat: int) -> float:
+    """
+    Returns the best time of one call of `function`, in microseconds.
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print('{0:20} {1:>14} {2:>14} {3:>9}'.format('operation', 'original', 'encoders', 'speedup'))
+    for label, model, _dict in CASES:
+        instance = model.from_dict(_dict)
+        compact = getattr(compact_models, model.__name__).from_dict(_dict)
+        other = getattr(compact_models, model.__name__).from_dict(_dict)
+        for operation, function in [
+            ('to_dict', lambda: instance.to_dict()),
+            ('compact ==', lambda: compact == other),
+        ]:
+            with generated_methods():
+                baseline = measure(function, args.number, args.repeat)
+            optimized = measure(function, args.number, args.repeat)
+            print(
+                '{0:20} {1:11.2f} us {2:11.2f} us {3:8.2f}x'.format(
+                    '{0} {1}'.format(label, operation), baseline, optimized, baseline / optimized
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,312 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Runs the benchmark suite of the SDK: the import time of its modules, the
+construction of clients, the per-call overhead of operations and the
+throughput of pagers against a mocked transport, and the conversion of the
+largest models from and to dicts.
+
+The results can be saved as a baseline, and later runs on the same machine
+compared with it to find the benchmarks that got slower. Baselines are not
+committed, since timings from other machines are not comparable:
+
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json [--threshold PERCENT]
+
+Usage, with the SDK installed:
+
+    python benchmarks/suite.py [--filter TEXT] [--repeat N] [--save FILE] [--compare FILE]
+"""
+
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import timeit
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+from ibm_code_engine_sdk.code_engine_v2 import App, BuildRun, CodeEngineV2, Job, JobRun, JobRunList, JobRunsPager
+from ibm_code_engine_sdk.metrics import MetricsCollector
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+import requests
+
+from bench_from_dict import APP, JOB_RUN
+from bench_import_time import new_env, time_import
+from bench_to_dict import BUILD_RUN, JOB
+
+PROJECT_ID = '15314cc3-85b4-4338-903f-c28cdee6d005'
+
+SERVICE_URL = 'https://api.au-syd.codeengine.cloud.ibm.com/v2'
+
+# The benchmarks, as (name, setup) pairs. setup() prepares a benchmark and
+# returns a function that returns the time of one operation, in seconds.
+BENCHMARKS: List[Tuple[str, Callable[[], Callable[[], float]]]] = []
+
+
+def benchmark(name: str):
+    """
+    Registers a benchmark.
+    """
+
+    def register(setup):
+        BENCHMARKS.append((name, setup))
+        return setup
+
+    return register
+
+
+def timed(function: Callable[[], object], number: int) -> Callable[[], float]:
+    """
+    Returns a function that returns the mean time of `number` calls of `function`.
+    """
+    return lambda: timeit.timeit(function, number=number) / number
+
+
+class MockAdapter(BaseAdapter):
+    """
+    MockAdapter answers every request of a session with a JSON response,
+    without any network I/O.
+    """
+
+    def __init__(self, respond: Callable[[requests.PreparedRequest], Tuple[int, bytes]]) -> None:
+        """
+        Initialize a MockAdapter object.
+        :param respond: Returns the status code and the body of the response to a request.
+        """
+        super().__init__()
+        self._respond = respond
+
+    def send(self, request, **kwargs) -> requests.Response:  # pylint: disable=arguments-differ
+        status_code, body = self._respond(request)
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+        response._content = body  # pylint: disable=protected-access
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def new_service(respond: Callable[[requests.PreparedRequest], Tuple[int, bytes]]) -> CodeEngineV2:
+    """
+    Returns a client whose requests are answered by a MockAdapter.
+    """
+    service = CodeEngineV2(authenticator=BearerTokenAuthenticator('token'))
+    service.set_service_url(SERVICE_URL)
+    service.get_http_client().mount('https://', MockAdapter(respond))
+    return service
+
+
+# The directory of the bytecode of the interpreters of the import benchmarks, which is removed on exit.
+_pycache = tempfile.TemporaryDirectory()
+
+
+def import_benchmark(name: str, statement: str) -> None:
+    """
+    Registers a benchmark of the time that `statement` takes in a new interpreter.
+    """
+
+    @benchmark(name)
+    def setup():
+        env = new_env(_pycache.name)
+        # Write the bytecode of the modules first.
+        time_import(statement, env)
+        return lambda: time_import(statement, env)
+
+
+import_benchmark('import/ibm_code_engine_sdk', 'import ibm_code_engine_sdk')
+import_benchmark('import/CodeEngineV2', 'from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2')
+import_benchmark('import/code_engine_v2 *', 'from ibm_code_engine_sdk.code_engine_v2 import *')
+
+
+@benchmark('client/new_instance')
+def new_instance():
+    os.environ.setdefault('CODE_ENGINE_AUTH_TYPE', 'noauth')
+    return timed(CodeEngineV2.new_instance, 200)
+
+
+def operation_benchmark(name: str, body: dict, call: Callable[[CodeEngineV2], object]) -> None:
+    """
+    Registers a benchmark of an operation whose response has the given body.
+    """
+
+    @benchmark('operation/' + name)
+    def setup():
+        content = json.dumps(body).encode('utf-8')
+        service = new_service(lambda request: (200, content))
+        return timed(lambda: call(service), 2000)
+
+
+operation_benchmark('get_job_run', JOB_RUN, lambda service: service.get_job_run(PROJECT_ID, 'my-job-run'))
+operation_benchmark(
+    'list_job_runs',
+    {'job_runs': [JOB_RUN] * 10, 'limit': 10},
+    lambda service: service.list_job_runs(PROJECT_ID, limit=10),
+)
+operation_benchmark(
+    'create_job_run',
+    JOB_RUN,
+    lambda service: service.create_job_run(PROJECT_ID, job_name='my-job', scale_array_spec='1-5'),
+)
+operation_benchmark(
+    'update_app', APP, lambda service: service.update_app(PROJECT_ID, 'my-app', '*', {'scale_max_instances': 5})
+)
+
+
+@benchmark('operation/get_job_run with metrics')
+def get_job_run_with_metrics():
+    content = json.dumps(JOB_RUN).encode('utf-8')
+    service = new_service(lambda request: (200, content))
+    service.set_metrics_sink(MetricsCollector())
+    return timed(lambda: service.get_job_run(PROJECT_ID, 'my-job-run'), 2000)
+
+
+@benchmark('pager/JobRunsPager 10 pages of 100')
+def job_runs_pager():
+    pages = 10
+    contents = {}
+    for page in range(pages):
+        result = {'job_runs': [JOB_RUN] * 100, 'limit': 100}
+        if page + 1 < pages:
+            result['next'] = {
+                'href': SERVICE_URL + '/projects/{0}/job_runs?start={1}'.format(PROJECT_ID, page + 1),
+                'start': str(page + 1),
+            }
+        contents[str(page)] = json.dumps(result).encode('utf-8')
+
+    def respond(request: requests.PreparedRequest) -> Tuple[int, bytes]:
+        start = parse_qs(urlsplit(request.url).query).get('start', ['0'])[0]
+        return 200, contents[start]
+
+    service = new_service(respond)
+    return timed(lambda: JobRunsPager(client=service, project_id=PROJECT_ID, limit=100).get_all(), 5)
+
+
+def model_benchmark(name: str, model: type, _dict: dict, number: int) -> None:
+    """
+    Registers benchmarks of from_dict() and to_dict() of a model.
+    """
+    instance = model.from_dict(_dict)
+    benchmark('model/{0}.from_dict'.format(name))(lambda: timed(lambda: model.from_dict(_dict), number))
+    benchmark('model/{0}.to_dict'.format(name))(lambda: timed(instance.to_dict, number))
+
+
+model_benchmark('App', App, APP, 2000)
+model_benchmark('Job', Job, JOB, 2000)
+model_benchmark('JobRun', JobRun, JOB_RUN, 2000)
+model_benchmark('BuildRun', BuildRun, BUILD_RUN, 2000)
+model_benchmark('JobRunList (100)', JobRunList, {'job_runs': [JOB_RUN] * 100, 'limit': 100}, 50)
+
+
+def format_time(seconds: float) -> str:
+    """
+    Formats a time in the most readable unit.
+    """
+    for unit, scale in (('s', 1), ('ms', 1e-3)):
+        if seconds >= scale:
+            return '{0:.2f} {1}'.format(seconds / scale, unit)
+    return '{0:.2f} us'.format(seconds / 1e-6)
+
+
+def run(names: List[str], repeat: int) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the benchmarks with the given names, and prints and returns their results.
+    """
+    results = {}
+    print('{0:45} {1:>12} {2:>12} {3:>12}'.format('benchmark', 'min', 'mean', 'stdev'))
+    for name, setup in BENCHMARKS:
+        if name not in names:
+            continue
+        measure = setup()
+        times = [measure() for _ in range(repeat)]
+        results[name] = {'min': min(times), 'mean': statistics.mean(times), 'stdev': statistics.pstdev(times)}
+        print(
+            '{0:45} {1:>12} {2:>12} {3:>12}'.format(
+                name,
+                format_time(min(times)),
+                format_time(statistics.mean(times)),
+                format_time(statistics.pstdev(times)),
+            )
+        )
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> int:
+    """
+    Prints the change of the best time of every benchmark against the
+    baseline, and returns the number of benchmarks that got slower by more
+    than `threshold` percent.
+    """
+    regressions = 0
+    print()
+    print('{0:45} {1:>12} {2:>12} {3:>9}'.format('benchmark', 'baseline', 'current', 'change'))
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = (result['min'] / baseline[name]['min'] - 1) * 100
+        slower = change > threshold
+        regressions += slower
+        print(
+            '{0:45} {1:>12} {2:>12} {3:+8.1f}%{4}'.format(
+                name,
+                format_time(baseline[name]['min']),
+                format_time(result['min']),
+                change,
+                '  slower' if slower else '',
+            )
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('--filter', default='', help='only run the benchmarks whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', help='save the results to this JSON file')
+    parser.add_argument('--compare', help='compare the results with the results saved in this JSON file')
+    parser.add_argument('--threshold', type=float, default=20.0, help='the change in percent that is a regression')
+    parser.add_argument('--list', action='store_true', help='list the benchmarks')
+    args = parser.parse_args()
+
+    names = [name for name, _ in BENCHMARKS if args.filter in name]
+    if args.list:
+        print('\n'.join(names))
+        return
+    results = run(names, args.repeat)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'python': sys.version, 'results': results}, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print('\n{0} benchmarks are more than {1}% slower than the baseline'.format(regressions, args.threshold))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers for array job runs of the Code Engine V2 service.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+import time
+
+from .code_engine_v2 import CodeEngineV2, JobRunStatus
+from .index_ranges import IndexRangeSet
+from .waiters import Backoff, JobRunsWaiter, WaiterTimeoutError
+
+# The properties of a job run that are passed on to the job runs that retry its failed indices.
+_RETRY_RUN_PROPERTIES = (
+    'job_name',
+    'run_arguments',
+    'run_as_user',
+    'run_commands',
+    'run_compute_resource_token_enabled',
+    'run_env_variables',
+    'run_mode',
+    'run_service_account',
+    'run_volume_mounts',
+    'scale_array_size_variable_override',
+    'scale_cpu_limit',
+    'scale_ephemeral_storage_limit',
+    'scale_max_execution_time',
+    'scale_memory_limit',
+    'scale_retry_limit',
+)
+
+# The properties that are only passed on for job runs that do not reference a job.
+_IMAGE_PROPERTIES = ('image_reference', 'image_secret')
+
+
+class FailedIndexRetrier:
+    """
+    FailedIndexRetrier watches an array job run and reruns only its failed
+    indices, instead of the whole array.
+
+    Once a job run finishes, the indices of its array that did not succeed are
+    submitted as new job runs with the same configuration and a
+    `scale_array_spec` that covers just those indices. Each index is retried at
+    most `max_retries` times, at most `max_parallel_runs` job runs are active at
+    any time, and the indices of a retry can be split over several job runs of
+    at most `max_indices_per_run` indices. The retries keep the original array
+    size in the JOB_ARRAY_SIZE environment variable.
+
+    The outcome of the original job run and all of its retries is merged into
+    one JobRunStatus.
+
+    :param dict job_runs: The number of the attempt of every job run, by name.
+           The original job run is attempt 0.
+    """
+
+    def __init__(
+        self,
+        client: CodeEngineV2,
+        project_id: str,
+        job_run_name: str,
+        *,
+        max_retries: int = 3,
+        max_parallel_runs: int = 4,
+        max_indices_per_run: Optional[int] = None,
+        on_retry: Optional[Callable[[dict], None]] = None,
+    ) -> None:
+        """
+        Initialize a FailedIndexRetrier object.
+        :param CodeEngineV2 client: The client used to watch and create the job
+               runs.
+        :param str project_id: The ID of the project.
+        :param str job_run_name: The name of the array job run to watch.
+        :param int max_retries: (optional) Maximum number of times that an index
+               is retried.
+        :param int max_parallel_runs: (optional) Maximum number of job runs that
+               are active at the same time, including the original job run.
+        :param int max_indices_per_run: (optional) Maximum number of indices per
+               retry job run. By default, all failed indices of a job run are
+               retried in one job run.
+        :param Callable on_retry: (optional) Called with every job run that is
+               created to retry failed indices.
+        """
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not job_run_name:
+            raise ValueError('job_run_name must be provided')
+        if max_retries < 0:
+            raise ValueError('max_retries must not be negative')
+        if max_parallel_runs < 1:
+            raise ValueError('max_parallel_runs must be at least 1')
+        if max_indices_per_run is not None and max_indices_per_run < 1:
+            raise ValueError('max_indices_per_run must be at least 1')
+        self._client = client
+        self._project_id = project_id
+        self._job_run_name = job_run_name
+        self._max_retries = max_retries
+        self._max_parallel_runs = max_parallel_runs
+        self._max_indices_per_run = max_indices_per_run
+        self._on_retry = on_retry
+        self._specs: Dict[str, Optional[IndexRangeSet]] = {}
+        self._retries: List[Tuple[int, IndexRangeSet]] = []
+        self._succeeded = IndexRangeSet()
+        self._failed = IndexRangeSet()
+        self._completion_time = None
+        self.job_runs: Dict[str, int] = {}
+
+    def run(self, *, timeout: float = 86400.0, backoff: Optional[Backoff] = None) -> JobRunStatus:
+        """
+        Waits for the job run and its retries to finish.
+        :param float timeout: (optional) Number of seconds to wait before a
+               WaiterTimeoutError is raised.
+        :param Backoff backoff: (optional) The delays between the polls. Defaults
+               to `Backoff(delay=5.0, max_delay=60.0)`.
+        :return: The merged status of the job run and its retries. Indices that
+                 still failed after their last retry are reported as failed.
+        :rtype: JobRunStatus
+        :raises WaiterTimeoutError: The job runs did not finish before the
+                timeout.
+        """
+        deadline = time.monotonic() + timeout
+        delays = (backoff or Backoff(delay=5.0, max_delay=60.0)).delays()
+        job_run = self._client.get_job_run(project_id=self._project_id, name=self._job_run_name).get_result()
+        prototype = self._get_retry_prototype(job_run)
+        requested = IndexRangeSet(job_run['scale_array_spec']) if job_run.get('scale_array_spec') else None
+        if requested is not None and prototype.get('scale_array_size_variable_override') is None:
+            prototype['scale_array_size_variable_override'] = len(requested)
+        self._specs = {self._job_run_name: requested}
+        self._retries = []
+        self._succeeded = IndexRangeSet()
+        self._failed = IndexRangeSet()
+        self._completion_time = None
+        self.job_runs = {self._job_run_name: 0}
+        waiter = JobRunsWaiter(self._client, self._project_id, [self._job_run_name], job_name=job_run.get('job_name'))
+        while True:
+            for finished in waiter.poll():
+                self._collect(finished)
+            while self._retries and len(waiter.pending) < self._max_parallel_runs:
+                attempt, indices = self._retries.pop(0)
+                retry = self._client.create_job_run(
+                    project_id=self._project_id,
+                    scale_array_spec=indices.to_array_spec(),
+                    **prototype,
+                ).get_result()
+                self._specs[retry['name']] = indices
+                self.job_runs[retry['name']] = attempt
+                waiter.add(retry['name'])
+                if self._on_retry is not None:
+                    self._on_retry(retry)
+            if not waiter.pending and not self._retries:
+                return self._get_status(job_run, requested)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise WaiterTimeoutError(
+                    'Job run {0} and its retries did not finish after {1} seconds'.format(self._job_run_name, timeout)
+                )
+            time.sleep(min(next(delays), remaining))
+
+    def _collect(self, job_run: dict) -> None:
+        # Records the outcome of a finished job run and schedules the retry of its failed indices.
+        status = JobRunStatus.from_dict(job_run.get('status_details') or {})
+        self._completion_time = status.completion_time or self._completion_time
+        succeeded = status.succeeded_index_set
+        spec = self._specs.get(job_run['name'])
+        failed = spec - succeeded if spec is not None else status.failed_index_set
+        self._succeeded = self._succeeded | succeeded
+        failed = failed - self._succeeded
+        if not failed:
+            return
+        attempt = self.job_runs[job_run['name']]
+        if attempt >= self._max_retries:
+            self._failed = self._failed | failed
+            return
+        for indices in failed.chunks(self._max_indices_per_run or len(failed)):
+            self._retries.append((attempt + 1, indices))
+
+    def _get_status(self, job_run: dict, requested: Optional[IndexRangeSet]) -> JobRunStatus:
+        failed = self._failed - self._succeeded
+        return JobRunStatus(
+            completion_time=self._completion_time,
+            failed=len(failed),
+            failed_indices=failed.to_array_spec(),
+            pending=0,
+            pending_indices='',
+            requested=len(requested) if requested is not None else len(self._succeeded | failed),
+            running=0,
+            running_indices='',
+            start_time=(job_run.get('status_details') or {}).get('start_time'),
+            succeeded=len(self._succeeded),
+            succeeded_indices=self._succeeded.to_array_spec(),
+        )
+
+    @staticmethod
+    def _get_retry_prototype(job_run: dict) -> dict:
+        properties = _RETRY_RUN_PROPERTIES if job_run.get('job_name') else _RETRY_RUN_PROPERTIES + _IMAGE_PROPERTIES
+        return {name: job_run[name] for name in properties if job_run.get(name) is not None}
@@ -0,0 +1,2060 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+asyncio support for the Code Engine V2 service.
+
+The HTTP transport is provided by the optional `httpx` package, which can be
+installed with `pip install "ibm-code-engine-sdk[async]"`.
+"""
+
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+import asyncio
+import logging
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
+from ibm_cloud_sdk_core.token_managers.token_manager import TokenManager
+from ibm_cloud_sdk_core.utils import is_json_mimetype
+
+from .code_engine_v2 import CodeEngineV2
+from .metrics import OperationMeasurement
+from .tracing import start_span
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+##############################################################################
+# Service
+##############################################################################
+
+
+class AsyncCodeEngineV2(CodeEngineV2):
+    """
+    The Code Engine V2 service, for use with asyncio.
+
+    AsyncCodeEngineV2 offers every operation of CodeEngineV2 with the same
+    parameters, authenticators and models. Each operation validates its
+    parameters and prepares the request immediately, and returns an awaitable
+    that sends the request without blocking the event loop:
+
+        response = await service.list_apps(project_id=project_id)
+
+    All operations of a client share one `httpx.AsyncClient` and therefore one
+    connection pool. Call `aclose()`, or use the client as an async context
+    manager, to release the connections.
+    """
+
+    def __init__(
+        self,
+        authenticator: Authenticator = None,
+        version: Optional[str] = None,
+    ) -> None:
+        """
+        Construct a new asyncio client for the Code Engine service.
+
+        :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
+               Get up to date information from https://github.com/IBM/python-sdk-core/blob/main/README.md
+               about initializing the authenticator of your choice.
+
+        :param str version: (optional) The API version, in format `YYYY-MM-DD`. For
+               the API behavior documented here, specify any date between `2021-03-31` and
+               `2026-03-27`.
+        """
+        if httpx is None:
+            raise ImportError(
+                'AsyncCodeEngineV2 requires the httpx package. '
+                'Install it with: pip install "ibm-code-engine-sdk[async]"'
+            )
+        CodeEngineV2.__init__(self, authenticator=authenticator, version=version)
+        # The requests are authenticated when they are sent, so that a token refresh does not block the event loop.
+        self.authenticator = _DeferredAuthenticator(self.authenticator)
+        self.async_http_client = None
+
+    def get_authenticator(self) -> Authenticator:
+        """
+        Get the authenticator of this service.
+
+        :return: The authenticator.
+        :rtype: Authenticator
+        """
+        return self.authenticator.authenticator
+
+    def get_async_http_client(self) -> 'httpx.AsyncClient':
+        """
+        Get the `httpx.AsyncClient` used to send requests. A client is created
+        on first use, honoring the SSL verification setting, the `verify`,
+        `cert` and `proxies` settings of `set_http_config()` and the cookie jar
+        of this service. Settings changed afterwards do not apply to the client.
+        """
+        if self.async_http_client is None:
+            verify = False if self.disable_ssl_verification else self.http_config.get('verify', True)
+            cert = self.http_config.get('cert')
+            if cert:
+                # The client certificate of requests, a file or a (certificate, key) tuple, is loaded into the SSL
+                # context of httpx.
+                verify = httpx.create_ssl_context(verify=verify)
+                if isinstance(cert, str):
+                    verify.load_cert_chain(cert)
+                else:
+                    verify.load_cert_chain(*cert)
+            mounts = {}
+            for pattern, proxy_url in (self.http_config.get('proxies') or {}).items():
+                # The proxies of requests are keyed by scheme, e.g. `https`, and those of httpx by URL pattern.
+                if '://' not in pattern:
+                    pattern += '://'
+                mounts[pattern] = (
+                    httpx.AsyncHTTPTransport(verify=verify, proxy=httpx.Proxy(proxy_url)) if proxy_url else None
+                )
+            self.async_http_client = httpx.AsyncClient(verify=verify, mounts=mounts or None, cookies=self.jar)
+        return self.async_http_client
+
+    def set_async_http_client(self, async_http_client: 'httpx.AsyncClient') -> None:
+        """
+        Set the `httpx.AsyncClient` used to send requests. A single client may
+        be shared by several services so that they share one connection pool.
+
+        :param httpx.AsyncClient async_http_client: The client to use.
+        """
+        if not isinstance(async_http_client, httpx.AsyncClient):
+            raise TypeError('async_http_client must be an httpx.AsyncClient')
+        self.async_http_client = async_http_client
+
+    async def aclose(self) -> None:
+        """
+        Close the `httpx.AsyncClient` used by this service and its connections.
+        """
+        if self.async_http_client is not None:
+            await self.async_http_client.aclose()
+            self.async_http_client = None
+
+    async def __aenter__(self) -> 'AsyncCodeEngineV2':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def send(self, request: dict, *, operation_id: Optional[str] = None, **kwargs) -> DetailedResponse:
+        """
+        Send a request and wrap the response in a DetailedResponse or raise an
+        ApiException, without blocking the event loop. Reads are served from
+        the client-side caches when they are enabled, the call is reported to
+        the metrics sink when one is set, and it is traced when tracing is
+        enabled.
+
+        The `timeout` of the request can be set through `set_http_config()` or
+        the `timeout` keyword argument of an operation. Retries that were
+        enabled with `enable_retries()` are applied to the request.
+
+        :param dict request: The request prepared by `prepare_request()`.
+        :param str operation_id: (optional) The operation that sends the request.
+        :return: The response from the request.
+        :rtype: DetailedResponse
+        """
+        metrics_sink = self.metrics_sink
+        tracer = self.tracer
+        if metrics_sink is None and tracer is None:
+            return await self._send_cached(request, **kwargs)
+        measurement = OperationMeasurement(operation_id, request)
+        span = tracer.start_operation(operation_id, request) if tracer is not None else None
+        try:
+            response = await self._send_cached(request, measurement=measurement, **kwargs)
+        except BaseException as e:
+            # Also ends the span of a call that is cancelled or interrupted, which detaches its context.
+            metrics = measurement.finish(metrics_sink, exception=e)
+            if span is not None:
+                span.end(metrics, e)
+            raise
+        metrics = measurement.finish(metrics_sink, response=response)
+        if span is not None:
+            span.end(metrics)
+        return response
+
+    async def _send_cached(self, request: dict, **kwargs) -> DetailedResponse:
+        # Sends a request, or serves it from the client-side caches.
+        cached_request = self._get_cached_request(request)
+        if cached_request is None:
+            return await self._send(request, **kwargs)
+        response = cached_request.before_send(request)
+        if response is not None:
+            return response
+        try:
+            response = await self._send(request, **kwargs)
+        except Exception as e:
+            response = cached_request.on_error(e)
+            if response is None:
+                raise
+            return response
+        cached_request.on_response(response)
+        return response
+
+    async def _send(
+        self, request: dict, *, measurement: Optional[OperationMeasurement] = None, **kwargs
+    ) -> DetailedResponse:
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            delay = rate_limiter.reserve(request['method'], request['url'][len(self.service_url) :])
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await self._authenticate(request)
+        timeout = self.http_config.get('timeout', kwargs.get('timeout', 60))
+        http_client = self.get_async_http_client()
+
+        attempt = 0
+        while True:
+            logger.debug('Sending HTTP request message')
+            try:
+                response = await http_client.request(
+                    request['method'],
+                    request['url'],
+                    headers=dict(request['headers']),
+                    params=request['params'],
+                    content=request['data'],
+                    files=request['files'] or None,
+                    timeout=timeout,
+                )
+            except httpx.TransportError:
+                if not self._is_retryable(request, attempt, None):
+                    raise
+                response = None
+            else:
+                logger.debug('Received HTTP response message, status code %d', response.status_code)
+                if not self._is_retryable(request, attempt, response):
+                    break
+            await asyncio.sleep(self._get_retry_delay(attempt, response))
+            attempt += 1
+        if measurement is not None:
+            measurement.on_response(response, attempt)
+
+        # Process a "success" response.
+        if 200 <= response.status_code <= 299:
+            if response.status_code == 204 or request['method'] == 'HEAD':
+                # There is no body content for a HEAD response or a 204 response.
+                result = None
+            elif not response.content:
+                result = None
+            elif is_json_mimetype(response.headers.get('Content-Type')):
+                # If this is a JSON response, then try to unmarshal it.
+                try:
+                    result = self.json_codec.loads(response.content)
+                except ValueError as err:
+                    raise ApiException(
+                        code=response.status_code,
+                        http_response=response,
+                        message='Error processing the HTTP response',
+                    ) from err
+            else:
+                # Non-JSON response, just use response body as-is.
+                result = response
+
+            return DetailedResponse(response=result, headers=response.headers, status_code=response.status_code)
+
+        # Received error status code from server, raise an APIException.
+        raise ApiException(response.status_code, http_response=response)
+
+    async def _authenticate(self, request: dict) -> None:
+        # Authenticates a request, on a worker thread when the authenticator has to fetch a token.
+        authenticator = self.authenticator.authenticator
+        token_manager = getattr(authenticator, 'token_manager', None)
+        if isinstance(token_manager, TokenManager) and (
+            token_manager._is_token_expired()  # pylint: disable=protected-access
+            or token_manager._token_needs_refresh()  # pylint: disable=protected-access
+        ):
+            await asyncio.to_thread(authenticator.authenticate, request)
+        else:
+            authenticator.authenticate(request)
+
+    def _is_retryable(self, request: dict, attempt: int, response: Optional['httpx.Response']) -> bool:
+        retry_config = self.retry_config
+        if retry_config is None or attempt >= retry_config.total:
+            return False
+        if retry_config.allowed_methods and request['method'] not in retry_config.allowed_methods:
+            return False
+        return response is None or response.status_code in retry_config.status_forcelist
+
+    def _get_retry_delay(self, attempt: int, response: Optional['httpx.Response']) -> float:
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        return min(self.retry_config.backoff_max, self.retry_config.backoff_factor * (2**attempt))
+
+
+class _DeferredAuthenticator(Authenticator):
+    """
+    _DeferredAuthenticator stands in for the authenticator of an
+    AsyncCodeEngineV2 while its requests are prepared, and leaves them
+    unauthenticated until they are sent.
+    """
+
+    def __init__(self, authenticator: Authenticator) -> None:
+        self.authenticator = authenticator
+
+    def authenticate(self, req: dict) -> None:
+        pass
+
+    def validate(self) -> None:
+        self.authenticator.validate()
+
+    def authentication_type(self) -> str:
+        return self.authenticator.authentication_type()
+
+    def __getattr__(self, name: str):
+        return getattr(self.authenticator, name)
+
+
+##############################################################################
+# Pagers
+##############################################################################
+
+
+class _AsyncPagePrefetcher:
+    """
+    _AsyncPagePrefetcher retrieves the pages of a list operation in a
+    background task so that the request for the next page overlaps with the
+    processing of the current one.
+    """
+
+    def __init__(
+        self,
+        *,
+        get_page: Callable[[Optional[str]], Awaitable[dict]],
+        start: str,
+        depth: int,
+    ) -> None:
+        """
+        Initialize a _AsyncPagePrefetcher object and start retrieving pages.
+        Must be called while an event loop is running.
+        :param Callable get_page: Retrieves the page that begins at the given
+               `start` token.
+        :param str start: The `start` token of the first page to be retrieved.
+        :param int depth: Maximum number of pages retrieved ahead of the caller.
+        """
+        self._get_page = get_page
+        self._pages = asyncio.Queue()
+        self._slots = asyncio.Semaphore(depth)
+        self._task = asyncio.ensure_future(self._run(start))
+
+    async def _run(self, start: str) -> None:
+        while start is not None:
+            await self._slots.acquire()
+            try:
+                result = await self._get_page(start)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self._pages.put_nowait((None, e))
+                return
+            self._pages.put_nowait((result, None))
+            start = None
+            next_page_link = result.get('next')
+            if next_page_link is not None:
+                start = next_page_link.get('start')
+
+    async def get(self) -> dict:
+        """
+        Returns the next retrieved page, waiting for it if necessary.
+        An error raised while retrieving a page is re-raised here, and again
+        on every subsequent call.
+        """
+        result, error = await self._pages.get()
+        self._slots.release()
+        if error is not None:
+            self._pages.put_nowait((None, error))
+            raise error
+        return result
+
+    def close(self) -> None:
+        """
+        Stops retrieving further pages.
+        """
+        self._task.cancel()
+
+
+class AsyncProjectsPager:
+    """
+    AsyncProjectsPager can be used to simplify the use of the "list_projects" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncProjectsPager object.
+        :param int limit: (optional) Optional maximum number of projects per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Project.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('projects')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncProjectsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_projects(
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Project.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of Project.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncAllowedOutboundDestinationsPager:
+    """
+    AsyncAllowedOutboundDestinationsPager can be used to simplify the use of the "list_allowed_outbound_destinations" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncAllowedOutboundDestinationsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of allowed outbound
+               destinations per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of AllowedOutboundDestination.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('allowed_outbound_destinations')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(
+            self._client, 'AsyncAllowedOutboundDestinationsPager.get_page', {'code_engine.page.start': start}
+        ):
+            response = await self._client.list_allowed_outbound_destinations(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of AllowedOutboundDestination.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of AllowedOutboundDestination.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncAppsPager:
+    """
+    AsyncAppsPager can be used to simplify the use of the "list_apps" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncAppsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of apps per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of App.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('apps')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncAppsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_apps(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of App.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of App.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncAppInstancesPager:
+    """
+    AsyncAppInstancesPager can be used to simplify the use of the "list_app_instances" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        app_name: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncAppInstancesPager object.
+        :param str project_id: The ID of the project.
+        :param str app_name: The name of your application.
+        :param int limit: (optional) Optional maximum number of apps per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._app_name = app_name
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of AppInstance.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('instances')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncAppInstancesPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_app_instances(
+                project_id=self._project_id,
+                app_name=self._app_name,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of AppInstance.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of AppInstance.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncAppRevisionsPager:
+    """
+    AsyncAppRevisionsPager can be used to simplify the use of the "list_app_revisions" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        app_name: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncAppRevisionsPager object.
+        :param str project_id: The ID of the project.
+        :param str app_name: The name of your application.
+        :param int limit: (optional) Optional maximum number of apps per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._app_name = app_name
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of AppRevision.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('revisions')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncAppRevisionsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_app_revisions(
+                project_id=self._project_id,
+                app_name=self._app_name,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of AppRevision.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of AppRevision.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncJobRunsPager:
+    """
+    AsyncJobRunsPager can be used to simplify the use of the "list_job_runs" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        job_name: str = None,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncJobRunsPager object.
+        :param str project_id: The ID of the project.
+        :param str job_name: (optional) Optional name of the job that you want to
+               use to filter.
+        :param int limit: (optional) Optional maximum number of job runs per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._job_name = job_name
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of JobRun.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('job_runs')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncJobRunsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_job_runs(
+                project_id=self._project_id,
+                job_name=self._job_name,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of JobRun.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of JobRun.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncJobsPager:
+    """
+    AsyncJobsPager can be used to simplify the use of the "list_jobs" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncJobsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of jobs per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Job.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('jobs')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncJobsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_jobs(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Job.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of Job.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncFunctionsPager:
+    """
+    AsyncFunctionsPager can be used to simplify the use of the "list_functions" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncFunctionsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of functions per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Function.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('functions')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncFunctionsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_functions(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Function.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of Function.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncBindingsPager:
+    """
+    AsyncBindingsPager can be used to simplify the use of the "list_bindings" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncBindingsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of bindings per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Binding.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('bindings')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncBindingsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_bindings(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Binding.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of Binding.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncBuildRunsPager:
+    """
+    AsyncBuildRunsPager can be used to simplify the use of the "list_build_runs" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        build_name: str = None,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncBuildRunsPager object.
+        :param str project_id: The ID of the project.
+        :param str build_name: (optional) Optional name of the build that should be
+               filtered for.
+        :param int limit: (optional) Optional maximum number of build runs per
+               page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._build_name = build_name
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of BuildRun.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('build_runs')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncBuildRunsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_build_runs(
+                project_id=self._project_id,
+                build_name=self._build_name,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of BuildRun.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of BuildRun.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncBuildsPager:
+    """
+    AsyncBuildsPager can be used to simplify the use of the "list_builds" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncBuildsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of builds per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Build.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('builds')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncBuildsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_builds(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Build.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of Build.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncDomainMappingsPager:
+    """
+    AsyncDomainMappingsPager can be used to simplify the use of the "list_domain_mappings" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncDomainMappingsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of domain mappings per
+               page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of DomainMapping.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('domain_mappings')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncDomainMappingsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_domain_mappings(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of DomainMapping.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of DomainMapping.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncConfigMapsPager:
+    """
+    AsyncConfigMapsPager can be used to simplify the use of the "list_config_maps" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncConfigMapsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of config maps per
+               page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of ConfigMap.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('config_maps')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncConfigMapsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_config_maps(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of ConfigMap.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of ConfigMap.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncSecretsPager:
+    """
+    AsyncSecretsPager can be used to simplify the use of the "list_secrets" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        format: str = None,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncSecretsPager object.
+        :param str project_id: The ID of the project.
+        :param str format: (optional) Secret format to filter results by.
+        :param int limit: (optional) Optional maximum number of secrets per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._format = format
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Secret.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('secrets')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncSecretsPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_secrets(
+                project_id=self._project_id,
+                format=self._format,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Secret.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of Secret.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AsyncPersistentDataStoresPager:
+    """
+    AsyncPersistentDataStoresPager can be used to simplify the use of the "list_persistent_data_stores" method
+    of AsyncCodeEngineV2.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AsyncPersistentDataStoresPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of persistent data
+               stores per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller in a background task. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of PersistentDataStore.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+
+        if self._prefetcher is not None:
+            result = await self._prefetcher.get()
+        else:
+            result = await self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _AsyncPagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('persistent_data_stores')
+
+    async def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AsyncPersistentDataStoresPager.get_page', {'code_engine.page.start': start}):
+            response = await self._client.list_persistent_data_stores(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            )
+            return response.get_result()
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of PersistentDataStore.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Returns an asynchronous iterator that yields results one at a time,
+        invoking get_next() only when the previously retrieved page has been
+        consumed. Use it with `async for`.
+        :return: An AsyncIterator[dict], where each element is a dict that represents an instance of PersistentDataStore.
+        :rtype: AsyncIterator[dict]
+        """
+        try:
+            while self.has_next():
+                for result in await self.get_next():
+                    yield result
+        finally:
+            # Cancels the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
@@ -0,0 +1,284 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers that run Code Engine V2 operations for many resources in parallel.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+import queue
+import threading
+
+from .code_engine_v2 import (
+    AllowedOutboundDestinationsPager,
+    AppInstancesPager,
+    AppRevisionsPager,
+    AppsPager,
+    BindingsPager,
+    BuildRunsPager,
+    BuildsPager,
+    CodeEngineV2,
+    ConfigMapsPager,
+    DomainMappingsPager,
+    FunctionsPager,
+    JobRunsPager,
+    JobsPager,
+    PersistentDataStoresPager,
+    SecretsPager,
+)
+from .concurrency import AdaptiveConcurrencyLimiter
+
+# The project-scoped pagers, by the kind of resource that they list.
+PROJECT_PAGERS = {
+    'allowed_outbound_destinations': AllowedOutboundDestinationsPager,
+    'app_instances': AppInstancesPager,
+    'app_revisions': AppRevisionsPager,
+    'apps': AppsPager,
+    'bindings': BindingsPager,
+    'build_runs': BuildRunsPager,
+    'builds': BuildsPager,
+    'config_maps': ConfigMapsPager,
+    'domain_mappings': DomainMappingsPager,
+    'functions': FunctionsPager,
+    'job_runs': JobRunsPager,
+    'jobs': JobsPager,
+    'persistent_data_stores': PersistentDataStoresPager,
+    'secrets': SecretsPager,
+}
+
+# Sentinel that a worker enqueues once it has listed all resources of a project.
+_DONE = object()
+
+
+class CrossProjectPager:
+    """
+    CrossProjectPager lists one kind of resource across many projects. The
+    pager of each project runs on a bounded pool of worker threads, and the
+    results of all projects are streamed to the caller as they arrive, tagged
+    with the ID of their project.
+
+    A project whose listing fails does not abort the others: its error is
+    recorded in `errors` and passed to the optional `on_error` callback.
+
+    With an AdaptiveConcurrencyLimiter, the pages are retrieved within its
+    limit, which adapts to the throttling of the API, and `max_workers` only
+    bounds the number of threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_ids: List[str],
+        kind: str,
+        max_workers: int = 8,
+        limit: int = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+        buffer_size: int = 1000,
+        concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize a CrossProjectPager object.
+        :param CodeEngineV2 client: The client used to list the resources.
+        :param List[str] project_ids: The IDs of the projects to list.
+        :param str kind: The kind of resource to list, one of the keys of
+               PROJECT_PAGERS, such as `apps`, `jobs` or `secrets`.
+        :param int max_workers: (optional) Maximum number of projects that are
+               listed concurrently.
+        :param int limit: (optional) Maximum number of resources per page.
+        :param Callable on_error: (optional) Called with the project ID and the
+               error when the listing of a project fails.
+        :param int buffer_size: (optional) Maximum number of results that are
+               retrieved ahead of the caller.
+        :param AdaptiveConcurrencyLimiter concurrency: (optional) Limits the
+               number of pages retrieved concurrently, and retrieves again the
+               pages that the API throttles.
+        :param kwargs: (optional) Additional parameters of the pager, such as
+               `job_name` for `job_runs` or `format` for `secrets`.
+        """
+        if kind not in PROJECT_PAGERS:
+            raise ValueError('kind must be one of: {0}'.format(', '.join(sorted(PROJECT_PAGERS))))
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        self._client = client
+        self._project_ids = list(project_ids)
+        self._pager_class = PROJECT_PAGERS[kind]
+        self._max_workers = max_workers
+        self._limit = limit
+        self._on_error = on_error
+        self._buffer_size = buffer_size
+        self._concurrency = concurrency
+        self._pager_kwargs = kwargs
+        self.errors: Dict[str, Exception] = {}
+
+    def __iter__(self) -> Iterator[Tuple[str, dict]]:
+        """
+        Returns an iterator over the resources of all projects, in the order in
+        which they are retrieved.
+        :return: An Iterator of (project_id, resource) tuples, where each resource
+               is a dict as returned by the pager of the project.
+        :rtype: Iterator[Tuple[str, dict]]
+        """
+        self.errors = {}
+        results = queue.Queue(maxsize=self._buffer_size)
+        stopped = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix='CrossProjectPager')
+        try:
+            for project_id in self._project_ids:
+                executor.submit(self._list_project, project_id, results, stopped)
+            pending = len(self._project_ids)
+            while pending:
+                project_id, resource, error = results.get()
+                if resource is not _DONE:
+                    yield project_id, resource
+                    continue
+                pending -= 1
+                if error is not None:
+                    self.errors[project_id] = error
+                    if self._on_error is not None:
+                        self._on_error(project_id, error)
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_all(self) -> List[Tuple[str, dict]]:
+        """
+        Returns the resources of all projects.
+        :return: A List of (project_id, resource) tuples.
+        :rtype: List[Tuple[str, dict]]
+        """
+        return list(self)
+
+    def _list_project(self, project_id: str, results: queue.Queue, stopped: threading.Event) -> None:
+        error = None
+        try:
+            pager = self._pager_class(
+                client=self._client,
+                project_id=project_id,
+                limit=self._limit,
+                **self._pager_kwargs,
+            )
+            while pager.has_next():
+                if self._concurrency is not None:
+                    page = self._concurrency.call(pager.get_next)
+                else:
+                    page = pager.get_next()
+                for resource in page:
+                    if not self._put(results, stopped, (project_id, resource, None)):
+                        return
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            error = e
+        self._put(results, stopped, (project_id, _DONE, error))
+
+    @staticmethod
+    def _put(results: queue.Queue, stopped: threading.Event, item: tuple) -> bool:
+        # Wait for room in the buffer, unless the caller stopped iterating.
+        while not stopped.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+
+class BulkResult(NamedTuple):
+    """
+    The outcome of a call of a bulk operation for one item.
+
+    :param item: The item.
+    :param result: The result of the call, or None if it failed.
+    :param Exception error: The error of the call, or None if it succeeded.
+    """
+
+    item: Any
+    result: Any
+    error: Optional[Exception]
+
+
+def run_bulk(
+    operation: Callable[[Any], Any],
+    items: Iterable[Any],
+    *,
+    concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+    max_workers: Optional[int] = None,
+) -> List[BulkResult]:
+    """
+    Calls an operation for many items in parallel, such as creating or
+    deleting many resources. A failed call does not abort the others.
+
+    With an AdaptiveConcurrencyLimiter, the number of concurrent calls adapts
+    to the throttling of the API, and the throttled calls are attempted again.
+    Otherwise, `max_workers` calls run at once.
+
+    :param Callable operation: Called with every item, e.g.
+           `lambda name: service.delete_app(project_id, name)`.
+    :param Iterable items: The items.
+    :param AdaptiveConcurrencyLimiter concurrency: (optional) Limits the number
+           of concurrent calls.
+    :param int max_workers: (optional) The number of threads. Defaults to the
+           highest limit of `concurrency`, or 8.
+    :return: The outcome of every item, in the order of the items.
+    :rtype: List[BulkResult]
+    """
+    if max_workers is None:
+        max_workers = concurrency.max_limit if concurrency is not None else 8
+    if max_workers < 1:
+        raise ValueError('max_workers must be at least 1')
+
+    def run(item) -> BulkResult:
+        try:
+            if concurrency is not None:
+                return BulkResult(item, concurrency.call(operation, item), None)
+            return BulkResult(item, operation(item), None)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return BulkResult(item, None, e)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='run_bulk') as executor:
+        return list(executor.map(run, items))
+
+
+def create_job_runs(
+    client: CodeEngineV2,
+    project_id: str,
+    job_runs: Iterable[dict],
+    *,
+    concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+    max_workers: Optional[int] = None,
+) -> List[BulkResult]:
+    """
+    Submits many job runs in parallel.
+
+    :param CodeEngineV2 client: The client used to create the job runs.
+    :param str project_id: The ID of the project.
+    :param Iterable[dict] job_runs: The keyword arguments of `create_job_run()`
+           for every job run, such as `{'job_name': 'my-job'}`.
+    :param AdaptiveConcurrencyLimiter concurrency: (optional) Limits the number
+           of concurrent submissions.
+    :param int max_workers: (optional) The number of threads.
+    :return: The outcome of every job run, whose result is the created job run
+             as a dict.
+    :rtype: List[BulkResult]
+    """
+    if not project_id:
+        raise ValueError('project_id must be provided')
+
+    def create(job_run: dict) -> dict:
+        return client.create_job_run(project_id=project_id, **job_run).get_result()
+
+    return run_bulk(create, job_runs, concurrency=concurrency, max_workers=max_workers)
@@ -0,0 +1,413 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client-side caches for the Code Engine V2 service.
+"""
+
+from collections import OrderedDict
+from typing import Iterable, NamedTuple, Optional, Tuple
+from urllib.parse import unquote
+import re
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+# Matches the path of a single resource within a project, e.g. /projects/{project_id}/apps/{name}
+_RESOURCE_PATH = re.compile(r'/projects/([^/]+)/([^/]+)/([^/]+)')
+
+# Matches the path of a project, e.g. /projects/{project_id}
+_PROJECT_PATH = re.compile(r'/projects/([^/]+)')
+
+# The kinds of resource that a binding can be attached to, by their `resource_type`.
+_COMPONENT_KINDS = {'app_v2': 'apps', 'job_v2': 'jobs'}
+
+# Matches the path of an endpoint of the service or of a project, e.g. /projects/{project_id}/egress_ips
+_ENDPOINT_PATH = re.compile(r'(?:/projects/([^/]+))?/([^/]+)')
+
+
+class _CacheEntry(NamedTuple):
+    entity_tag: str
+    result: dict
+    headers: dict
+
+
+class ResourceCache:
+    """
+    ResourceCache keeps the most recently read resources of a CodeEngineV2
+    client, keyed by (project_id, kind, name).
+
+    While the cache is enabled, reading a cached resource sends its entity tag
+    in the If-None-Match header. When the server answers 304 Not Modified, the
+    cached resource is returned without transferring or parsing it again.
+
+    The results served from the cache are shared between callers and must be
+    treated as read-only.
+    """
+
+    DEFAULT_KINDS = ('apps', 'builds', 'functions', 'jobs')
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1000,
+        kinds: Iterable[str] = DEFAULT_KINDS,
+    ) -> None:
+        """
+        Initialize a ResourceCache object.
+        :param int max_entries: (optional) Maximum number of cached resources.
+               The least recently used resource is evicted first.
+        :param Iterable[str] kinds: (optional) The kinds of resource to cache, as
+               they appear in the resource path. Defaults to apps, builds,
+               functions and jobs.
+        """
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        self.max_entries = max_entries
+        self.kinds = frozenset(kinds)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, project_id: str, kind: str, name: str) -> Optional[dict]:
+        """
+        Returns the cached resource, or None if it is not cached.
+        :param str project_id: The ID of the project.
+        :param str kind: The kind of the resource, e.g. `apps`.
+        :param str name: The name of the resource.
+        :rtype: dict
+        """
+        entry = self._entries.get((project_id, kind, name))
+        return entry.result if entry is not None else None
+
+    def invalidate(self, project_id: str, kind: Optional[str] = None, name: Optional[str] = None) -> None:
+        """
+        Removes cached resources. Omitting `name` removes all resources of the
+        kind, omitting `kind` removes all resources of the project.
+        :param str project_id: The ID of the project.
+        :param str kind: (optional) The kind of the resources, e.g. `apps`.
+        :param str name: (optional) The name of the resource.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == project_id and kind in (None, key[1]) and name in (None, key[2]):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Removes all cached resources.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def resource_key(self, path: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Returns the (project_id, kind, name) key of the resource addressed by
+        `path`, or None if the path does not address a cacheable resource.
+        :param str path: The path of the request, relative to the service URL.
+        """
+        match = _RESOURCE_PATH.fullmatch(path)
+        if match is None or match.group(2) not in self.kinds:
+            return None
+        return unquote(match.group(1)), match.group(2), unquote(match.group(3))
+
+    def before_send(self, request: dict, path: str) -> Optional[Tuple[Tuple[str, str, str], Optional[_CacheEntry]]]:
+        """
+        Prepares a request for a conditional read of a cached resource.
+        :param dict request: The request prepared by `prepare_request()`.
+        :param str path: The path of the request, relative to the service URL.
+        :return: The key of the resource and its cache entry, or None if the
+               request is not a cacheable read.
+        """
+        if request['method'] != 'GET' or 'If-None-Match' in request['headers']:
+            return None
+        key = self.resource_key(path)
+        if key is None:
+            return None
+        entry = self._entries.get(key)
+        if entry is not None:
+            request['headers']['If-None-Match'] = entry.entity_tag
+        return key, entry
+
+    def not_modified(self, key: Tuple[str, str, str], entry: _CacheEntry) -> DetailedResponse:
+        """
+        Returns the cached response of a resource that the server reported as
+        not modified.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return DetailedResponse(response=entry.result, headers=entry.headers, status_code=200)
+
+    def store(self, key: Tuple[str, str, str], response: DetailedResponse) -> None:
+        """
+        Caches the resource of a response, provided it carries an entity tag.
+        Otherwise, the cached resource is removed.
+        """
+        result = response.get_result()
+        headers = response.get_headers() or {}
+        entity_tag = (headers.get('ETag') or result.get('entity_tag')) if isinstance(result, dict) else None
+        if not entity_tag:
+            self.invalidate(*key)
+            return
+        with self._lock:
+            self._entries[key] = _CacheEntry(entity_tag, result, headers)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def after_write(self, method: str, path: str, response: Optional[DetailedResponse]) -> None:
+        """
+        Refreshes or removes the cached resources affected by a write.
+
+        A resource that is created, updated or replaced is refreshed from the
+        response when the response carries its entity tag, and removed
+        otherwise. Deleting a resource, or writing to one of its sub-resources
+        such as the revisions of an app, removes it. Deleting a project removes
+        all of its resources, and a change of bindings removes the app or job
+        that the binding is attached to.
+        :param str method: The HTTP method of the request.
+        :param str path: The path of the request, relative to the service URL.
+        :param DetailedResponse response: The response of the request, or None
+               if the request failed.
+        """
+        segments = [unquote(segment) for segment in path.strip('/').split('/')]
+        if len(segments) < 2 or segments[0] != 'projects':
+            return
+        project_id = segments[1]
+        if len(segments) == 2:
+            self.invalidate(project_id)
+            return
+        kind = segments[2]
+        result = response.get_result() if response is not None else None
+        if kind == 'bindings':
+            component = result.get('component') if isinstance(result, dict) else None
+            if isinstance(component, dict) and component.get('resource_type') in _COMPONENT_KINDS:
+                self.invalidate(project_id, _COMPONENT_KINDS[component['resource_type']], component.get('name'))
+            else:
+                for component_kind in _COMPONENT_KINDS.values():
+                    self.invalidate(project_id, component_kind)
+            return
+        if kind not in self.kinds:
+            return
+        if len(segments) == 3:
+            if method == 'POST' and isinstance(result, dict) and result.get('name'):
+                self.store((project_id, kind, result['name']), response)
+            return
+        key = (project_id, kind, segments[3])
+        if len(segments) == 4 and method in ('PATCH', 'POST', 'PUT') and response is not None:
+            self.store(key, response)
+        else:
+            self.invalidate(*key)
+
+
+class TTLCache:
+    """
+    TTLCache keeps the responses of read-only endpoints whose data rarely
+    changes, such as the function runtimes or the egress IP addresses of a
+    project, for a fixed time to live. Fresh responses are returned without
+    sending a request.
+
+    The cache holds at most `max_entries` responses and evicts the least
+    recently used one first. The results served from the cache are shared
+    between callers and must be treated as read-only.
+    """
+
+    DEFAULT_ENDPOINTS = ('egress_ips', 'function_runtimes', 'status_details')
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 300.0,
+        max_entries: int = 256,
+        endpoints: Iterable[str] = DEFAULT_ENDPOINTS,
+    ) -> None:
+        """
+        Initialize a TTLCache object.
+        :param float ttl: (optional) Number of seconds a response is served from
+               the cache.
+        :param int max_entries: (optional) Maximum number of cached responses.
+        :param Iterable[str] endpoints: (optional) The endpoints to cache, as the
+               last segment of their path. Defaults to egress_ips,
+               function_runtimes and status_details.
+        """
+        if ttl <= 0:
+            raise ValueError('ttl must be positive')
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.endpoints = frozenset(endpoints)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, project_id: Optional[str] = None, endpoint: Optional[str] = None) -> None:
+        """
+        Removes cached responses. Omitting `endpoint` removes the responses of
+        all endpoints of the project, omitting `project_id` removes the
+        responses of the endpoint for all projects and of the service itself.
+        :param str project_id: (optional) The ID of the project.
+        :param str endpoint: (optional) The endpoint, e.g. `egress_ips`.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if project_id in (None, key[0]) and endpoint in (None, key[1]):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Removes all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def request_key(self, request: dict, path: str) -> Optional[tuple]:
+        """
+        Returns the key of a request to a cached endpoint, or None if the
+        request is not a read of a cached endpoint.
+        :param dict request: The request prepared by `prepare_request()`.
+        :param str path: The path of the request, relative to the service URL.
+        """
+        if request['method'] != 'GET':
+            return None
+        match = _ENDPOINT_PATH.fullmatch(path)
+        if match is None or match.group(2) not in self.endpoints:
+            return None
+        project_id = unquote(match.group(1)) if match.group(1) is not None else None
+        return project_id, match.group(2), tuple(sorted((request['params'] or {}).items()))
+
+    def after_write(self, method: str, path: str) -> None:
+        """
+        Removes the cached responses affected by a write. Changing or deleting
+        a project removes the responses of all endpoints of the project.
+        :param str method: The HTTP method of the request.
+        :param str path: The path of the request, relative to the service URL.
+        """
+        match = _PROJECT_PATH.fullmatch(path)
+        if match is not None and method != 'GET':
+            self.invalidate(project_id=unquote(match.group(1)))
+
+    def get_response(self, key: tuple) -> Optional[DetailedResponse]:
+        """
+        Returns the cached response for `key`, or None if there is no fresh
+        response.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def store(self, key: tuple, response: DetailedResponse) -> None:
+        """
+        Caches a successful response for the time to live of the cache.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class CachedRequest:
+    """
+    CachedRequest follows one request of a client through its client-side
+    caches. Reads are answered from the caches or turned into conditional
+    reads, and writes refresh or remove the cached entries that they affect,
+    whether they succeed or fail.
+    """
+
+    def __init__(
+        self,
+        request: dict,
+        path: str,
+        *,
+        resource_cache: Optional[ResourceCache] = None,
+        ttl_cache: Optional[TTLCache] = None,
+    ) -> None:
+        """
+        Initialize a CachedRequest object.
+        :param dict request: The request prepared by `prepare_request()`.
+        :param str path: The path of the request, relative to the service URL.
+        :param ResourceCache resource_cache: (optional) The resource cache of
+               the client.
+        :param TTLCache ttl_cache: (optional) The TTL cache of the client.
+        """
+        self.method = request['method']
+        self.path = path
+        self.resource_cache = resource_cache
+        self.ttl_cache = ttl_cache
+        self._ttl_key = ttl_cache.request_key(request, path) if ttl_cache is not None else None
+        self._cached = None
+
+    def before_send(self, request: dict) -> Optional[DetailedResponse]:
+        """
+        Returns a fresh response from the TTL cache, or prepares the request for
+        a conditional read of a cached resource and returns None.
+        :param dict request: The request prepared by `prepare_request()`.
+        """
+        if self._ttl_key is not None:
+            response = self.ttl_cache.get_response(self._ttl_key)
+            if response is not None:
+                return response
+        if self.resource_cache is not None:
+            self._cached = self.resource_cache.before_send(request, self.path)
+        return None
+
+    def on_response(self, response: DetailedResponse) -> None:
+        """
+        Updates the caches with a successful response.
+        """
+        if self._ttl_key is not None:
+            self.ttl_cache.store(self._ttl_key, response)
+        if self._cached is not None:
+            self.resource_cache.store(self._cached[0], response)
+        if self.method != 'GET':
+            self._after_write(response)
+
+    def on_error(self, error: Exception) -> Optional[DetailedResponse]:
+        """
+        Returns the cached resource when the server reported it as not
+        modified. Otherwise, removes the cached entries that the failed request
+        may have made stale and returns None.
+        """
+        status_code = error.status_code if isinstance(error, ApiException) else None
+        if self._cached is not None:
+            key, entry = self._cached
+            if entry is not None and status_code == 304:
+                return self.resource_cache.not_modified(key, entry)
+            if status_code == 404:
+                self.resource_cache.invalidate(*key)
+        if self.method != 'GET':
+            self._after_write(None)
+        return None
+
+    def _after_write(self, response: Optional[DetailedResponse]) -> None:
+        if self.resource_cache is not None:
+            self.resource_cache.after_write(self.method, self.path, response)
+        if self.ttl_cache is not None:
+            self.ttl_cache.after_write(self.method, self.path)
@@ -0,0 +1,195 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+REST API for Code Engine
+
+API Version: 2.0.0
+
+The client, the models and the pagers of the service are defined in
+submodules, which are imported when one of their names is first used, so
+that importing the client does not import the models and the pagers:
+
+    from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2, JobRun
+"""
+
+from importlib import import_module
+from typing import Dict, List
+
+# The names that this module exports, by the submodule that defines them.
+_EXPORTS: Dict[str, List[str]] = {
+    '.service': [
+        'CodeEngineV2',
+        'ListSecretsEnums',
+    ],
+    '.models.common': [
+        'ComponentRef',
+        'EnvVar',
+        'EnvVarPrototype',
+        'ListFirstMetadata',
+        'ListNextMetadata',
+        'Probe',
+        'ProbePrototype',
+        'VolumeMount',
+        'VolumeMountPrototype',
+    ],
+    '.models.projects': [
+        'CbrStatus',
+        'EnforcementStatus',
+        'Project',
+        'ProjectEgressIPAddresses',
+        'ProjectList',
+        'ProjectStatusDetails',
+    ],
+    '.models.allowed_outbound_destinations': [
+        'AllowedOutboundDestination',
+        'AllowedOutboundDestinationList',
+        'AllowedOutboundDestinationPatch',
+        'AllowedOutboundDestinationPrototype',
+        'AllowedOutboundStatusDetails',
+        'EndpointGatewayDetails',
+        'PrivatePathServiceGatewayDetails',
+        'AllowedOutboundDestinationPatchCidrBlockDataPatch',
+        'AllowedOutboundDestinationPatchPrivatePathServiceGatewayDataPatch',
+        'AllowedOutboundDestinationPrototypeCidrBlockDataPrototype',
+        'AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype',
+        'AllowedOutboundDestinationCidrBlockData',
+        'AllowedOutboundDestinationPrivatePathServiceGatewayData',
+        'AllowedOutboundStatusDetailsPrivatePathServiceGatewayStatusDetails',
+    ],
+    '.models.apps': [
+        'App',
+        'AppInstance',
+        'AppInstanceList',
+        'AppInstanceStatusDetails',
+        'AppList',
+        'AppPatch',
+        'AppRevision',
+        'AppRevisionList',
+        'AppRevisionStatus',
+        'AppStatus',
+        'ContainerStatus',
+        'ContainerStatusDetails',
+    ],
+    '.models.jobs': [
+        'IndexDetails',
+        'Job',
+        'JobList',
+        'JobPatch',
+        'JobRun',
+        'JobRunList',
+        'JobRunStatus',
+    ],
+    '.models.functions': [
+        'Function',
+        'FunctionList',
+        'FunctionPatch',
+        'FunctionRuntime',
+        'FunctionRuntimeList',
+        'FunctionStatus',
+    ],
+    '.models.bindings': [
+        'Binding',
+        'BindingList',
+    ],
+    '.models.builds': [
+        'Build',
+        'BuildList',
+        'BuildParam',
+        'BuildParamPrototype',
+        'BuildPatch',
+        'BuildRun',
+        'BuildRunList',
+        'BuildRunStatus',
+        'BuildStatus',
+    ],
+    '.models.domain_mappings': [
+        'DomainMapping',
+        'DomainMappingList',
+        'DomainMappingPatch',
+        'DomainMappingStatus',
+    ],
+    '.models.config_maps': [
+        'ConfigMap',
+        'ConfigMapList',
+    ],
+    '.models.secrets': [
+        'OperatorSecretProps',
+        'OperatorSecretPrototypeProps',
+        'ResourceKeyRef',
+        'ResourceKeyRefPrototype',
+        'RoleRef',
+        'RoleRefPrototype',
+        'Secret',
+        'SecretData',
+        'SecretList',
+        'ServiceAccessSecretProps',
+        'ServiceAccessSecretPrototypeProps',
+        'ServiceIDRef',
+        'ServiceIDRefPrototype',
+        'ServiceInstanceRef',
+        'ServiceInstanceRefPrototype',
+        'SecretDataBasicAuthSecretData',
+        'SecretDataGenericSecretData',
+        'SecretDataHMACAuthSecretData',
+        'SecretDataRegistrySecretData',
+        'SecretDataSSHSecretData',
+        'SecretDataTLSSecretData',
+    ],
+    '.models.persistent_data_stores': [
+        'PersistentDataStore',
+        'PersistentDataStoreList',
+        'StorageData',
+        'StorageDataObjectStorageData',
+    ],
+    '.pagers': [
+        'ProjectsPager',
+        'AllowedOutboundDestinationsPager',
+        'AppsPager',
+        'AppInstancesPager',
+        'AppRevisionsPager',
+        'JobRunsPager',
+        'JobsPager',
+        'FunctionsPager',
+        'BindingsPager',
+        'BuildRunsPager',
+        'BuildsPager',
+        'DomainMappingsPager',
+        'ConfigMapsPager',
+        'SecretsPager',
+        'PersistentDataStoresPager',
+    ],
+}
+
+_SUBMODULES = {name: submodule for submodule, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name: str):
+    # Imports the submodule that defines a name when the name is first used (PEP 562).
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+    value = getattr(import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
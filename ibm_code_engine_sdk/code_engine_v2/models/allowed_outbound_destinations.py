@@ -0,0 +1,1302 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models of allowed outbound destinations.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+from .common import ListFirstMetadata, ListNextMetadata
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class AllowedOutboundDestination:
+    """
+    AllowedOutboundDestination Describes the model of an allowed outbound destination.
+
+    :param str entity_tag: (optional) The version of the allowed outbound
+          destination, which is used to achieve optimistic locking.
+    :param str name: (optional) The name of the allowed outbound destination.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str status: (optional) The current status of the outbound destination.
+    :param AllowedOutboundStatusDetails status_details: (optional)
+    :param str type: Specify the type of the allowed outbound destination. Allowed
+          types are: `cidr_block` and `private_path_service_gateway`.
+    """
+
+    def __init__(
+        self,
+        type: str,
+        *,
+        entity_tag: Optional[str] = None,
+        name: Optional[str] = None,
+        project_id: Optional[str] = None,
+        status: Optional[str] = None,
+        status_details: Optional['AllowedOutboundStatusDetails'] = None,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundDestination object.
+
+        :param str type: Specify the type of the allowed outbound destination.
+               Allowed types are: `cidr_block` and `private_path_service_gateway`.
+        :param str entity_tag: (optional) The version of the allowed outbound
+               destination, which is used to achieve optimistic locking.
+        :param str name: (optional) The name of the allowed outbound destination.
+        :param AllowedOutboundStatusDetails status_details: (optional)
+        """
+        msg = "Cannot instantiate base class. Instead, instantiate one of the defined subclasses: {0}".format(
+            ", ".join(
+                ['AllowedOutboundDestinationCidrBlockData', 'AllowedOutboundDestinationPrivatePathServiceGatewayData']
+            )
+        )
+        raise Exception(msg)
+
+    class StatusEnum(str, Enum):
+        """
+        The current status of the outbound destination.
+        """
+
+        READY = 'ready'
+        FAILED = 'failed'
+        DEPLOYING = 'deploying'
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the allowed outbound destination. Allowed types are:
+        `cidr_block` and `private_path_service_gateway`.
+        """
+
+        CIDR_BLOCK = 'cidr_block'
+        PRIVATE_PATH_SERVICE_GATEWAY = 'private_path_service_gateway'
+
+
+class AllowedOutboundDestinationList:
+    """
+    Contains a list of allowed outbound destinations and pagination information.
+
+    :param List[AllowedOutboundDestination] allowed_outbound_destinations: List of
+          all allowed outbound destinations.
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    """
+
+    def __init__(
+        self,
+        allowed_outbound_destinations: List['AllowedOutboundDestination'],
+        limit: int,
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundDestinationList object.
+
+        :param List[AllowedOutboundDestination] allowed_outbound_destinations: List
+               of all allowed outbound destinations.
+        :param int limit: Maximum number of resources per page.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.allowed_outbound_destinations = allowed_outbound_destinations
+        self.first = first
+        self.limit = limit
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AllowedOutboundDestinationList':
+        """Initialize a AllowedOutboundDestinationList object from a json dictionary."""
+        args = {}
+        if (allowed_outbound_destinations := _dict.get('allowed_outbound_destinations')) is not None:
+            args['allowed_outbound_destinations'] = allowed_outbound_destinations
+        else:
+            raise ValueError(
+                'Required property \'allowed_outbound_destinations\' not present in AllowedOutboundDestinationList JSON'
+            )
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in AllowedOutboundDestinationList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AllowedOutboundDestinationList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'allowed_outbound_destinations') and self.allowed_outbound_destinations is not None:
+            allowed_outbound_destinations_list = []
+            for v in self.allowed_outbound_destinations:
+                if isinstance(v, dict):
+                    allowed_outbound_destinations_list.append(v)
+                else:
+                    allowed_outbound_destinations_list.append(v.to_dict())
+            _dict['allowed_outbound_destinations'] = allowed_outbound_destinations_list
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AllowedOutboundDestinationList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AllowedOutboundDestinationList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AllowedOutboundDestinationList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class AllowedOutboundDestinationPatch:
+    """
+    The request model for allowed outbound destination update operations.
+
+    """
+
+    def __init__(
+        self,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundDestinationPatch object.
+
+        """
+        msg = "Cannot instantiate base class. Instead, instantiate one of the defined subclasses: {0}".format(
+            ", ".join(
+                [
+                    'AllowedOutboundDestinationPatchCidrBlockDataPatch',
+                    'AllowedOutboundDestinationPatchPrivatePathServiceGatewayDataPatch',
+                ]
+            )
+        )
+        raise Exception(msg)
+
+
+class AllowedOutboundDestinationPrototype:
+    """
+    AllowedOutboundDestinationPrototype is the request model for allowed outbound
+    destination create operations.
+
+    :param str name: The name of the allowed outbound destination.
+    :param str type: Specify the type of the allowed outbound destination. Allowed
+          types are: `cidr_block` and `private_path_service_gateway`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        type: str,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundDestinationPrototype object.
+
+        :param str name: The name of the allowed outbound destination.
+        :param str type: Specify the type of the allowed outbound destination.
+               Allowed types are: `cidr_block` and `private_path_service_gateway`.
+        """
+        msg = "Cannot instantiate base class. Instead, instantiate one of the defined subclasses: {0}".format(
+            ", ".join(
+                [
+                    'AllowedOutboundDestinationPrototypeCidrBlockDataPrototype',
+                    'AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype',
+                ]
+            )
+        )
+        raise Exception(msg)
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the allowed outbound destination. Allowed types are:
+        `cidr_block` and `private_path_service_gateway`.
+        """
+
+        CIDR_BLOCK = 'cidr_block'
+        PRIVATE_PATH_SERVICE_GATEWAY = 'private_path_service_gateway'
+
+
+class AllowedOutboundStatusDetails:
+    """
+    AllowedOutboundStatusDetails.
+
+    """
+
+    def __init__(
+        self,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundStatusDetails object.
+
+        """
+        msg = "Cannot instantiate base class. Instead, instantiate one of the defined subclasses: {0}".format(
+            ", ".join(['AllowedOutboundStatusDetailsPrivatePathServiceGatewayStatusDetails'])
+        )
+        raise Exception(msg)
+
+
+class EndpointGatewayDetails:
+    """
+    Optional information about the endpoint gateway located in the Code Engine VPC that
+    connects to the private path service gateway.
+
+    :param str account_id: (optional) The ID of the account that created the
+          endpoint gateway, e.g. 4329073d16d2f3663f74bfa955259139.
+    :param str created_at: (optional) The timestamp when the endpoint gateway was
+          created.
+    :param List[str] ips: (optional) The reserved IPs bound to this endpoint
+          gateway.
+    :param str name: (optional) The name for this endpoint gateway. The name is
+          unique across all endpoint gateways in the VPC.
+    """
+
+    def __init__(
+        self,
+        *,
+        account_id: Optional[str] = None,
+        created_at: Optional[str] = None,
+        ips: Optional[List[str]] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a EndpointGatewayDetails object.
+
+        """
+        self.account_id = account_id
+        self.created_at = created_at
+        self.ips = ips
+        self.name = name
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'EndpointGatewayDetails':
+        """Initialize a EndpointGatewayDetails object from a json dictionary."""
+        args = {}
+        if (account_id := _dict.get('account_id')) is not None:
+            args['account_id'] = account_id
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (ips := _dict.get('ips')) is not None:
+            args['ips'] = ips
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a EndpointGatewayDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'account_id') and getattr(self, 'account_id') is not None:
+            _dict['account_id'] = getattr(self, 'account_id')
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'ips') and getattr(self, 'ips') is not None:
+            _dict['ips'] = getattr(self, 'ips')
+        if hasattr(self, 'name') and getattr(self, 'name') is not None:
+            _dict['name'] = getattr(self, 'name')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this EndpointGatewayDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'EndpointGatewayDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'EndpointGatewayDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrivatePathServiceGatewayDetails:
+    """
+    Optional information about the private path service gateway that this allowed outbound
+    destination points to.
+
+    :param str id: (optional) The private path service gateway identifier.
+    :param str name: (optional) The name of private path service gateway.
+    :param List[str] service_endpoints: (optional) The fully qualified domain names
+          for this private path service gateway. The domains are used for endpoint
+          gateways to connect to the service and are configured in the VPC for each
+          endpoint gateway.
+    """
+
+    def __init__(
+        self,
+        *,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+        service_endpoints: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a PrivatePathServiceGatewayDetails object.
+
+        """
+        self.id = id
+        self.name = name
+        self.service_endpoints = service_endpoints
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrivatePathServiceGatewayDetails':
+        """Initialize a PrivatePathServiceGatewayDetails object from a json dictionary."""
+        args = {}
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (service_endpoints := _dict.get('service_endpoints')) is not None:
+            args['service_endpoints'] = service_endpoints
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrivatePathServiceGatewayDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'name') and getattr(self, 'name') is not None:
+            _dict['name'] = getattr(self, 'name')
+        if hasattr(self, 'service_endpoints') and getattr(self, 'service_endpoints') is not None:
+            _dict['service_endpoints'] = getattr(self, 'service_endpoints')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrivatePathServiceGatewayDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrivatePathServiceGatewayDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrivatePathServiceGatewayDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class AllowedOutboundDestinationPatchCidrBlockDataPatch(AllowedOutboundDestinationPatch):
+    """
+    Update an allowed outbound destination by using a CIDR block.
+
+    :param str cidr_block: (optional) The IPv4 address range.
+    """
+
+    def __init__(
+        self,
+        *,
+        cidr_block: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundDestinationPatchCidrBlockDataPatch object.
+
+        :param str cidr_block: (optional) The IPv4 address range.
+        """
+        # pylint: disable=super-init-not-called
+        self.cidr_block = cidr_block
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AllowedOutboundDestinationPatchCidrBlockDataPatch':
+        """Initialize a AllowedOutboundDestinationPatchCidrBlockDataPatch object from a json dictionary."""
+        args = {}
+        if (cidr_block := _dict.get('cidr_block')) is not None:
+            args['cidr_block'] = cidr_block
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AllowedOutboundDestinationPatchCidrBlockDataPatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'cidr_block') and self.cidr_block is not None:
+            _dict['cidr_block'] = self.cidr_block
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AllowedOutboundDestinationPatchCidrBlockDataPatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AllowedOutboundDestinationPatchCidrBlockDataPatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AllowedOutboundDestinationPatchCidrBlockDataPatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class AllowedOutboundDestinationPatchPrivatePathServiceGatewayDataPatch(AllowedOutboundDestinationPatch):
+    """
+    Updating properties of an allowed outbound destination of type VPC Private Path
+    service.
+
+    :param str isolation_policy: (optional) Optional property to specify the
+          isolation policy of the private path service gateway. If set to `shared`, other
+          projects within the same account or enterprise account family can connect to
+          Private Path service, too. If set to `dedicated` the gateway can only be used by
+          a single Code Engine project. If not specified the isolation policy will be set
+          to `shared`.
+    """
+
+    def __init__(
+        self,
+        *,
+        isolation_policy: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundDestinationPatchPrivatePathServiceGatewayDataPatch object.
+
+        :param str isolation_policy: (optional) Optional property to specify the
+               isolation policy of the private path service gateway. If set to `shared`,
+               other projects within the same account or enterprise account family can
+               connect to Private Path service, too. If set to `dedicated` the gateway can
+               only be used by a single Code Engine project. If not specified the
+               isolation policy will be set to `shared`.
+        """
+        # pylint: disable=super-init-not-called
+        self.isolation_policy = isolation_policy
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AllowedOutboundDestinationPatchPrivatePathServiceGatewayDataPatch':
+        """Initialize a AllowedOutboundDestinationPatchPrivatePathServiceGatewayDataPatch object from a json dictionary."""
+        args = {}
+        if (isolation_policy := _dict.get('isolation_policy')) is not None:
+            args['isolation_policy'] = isolation_policy
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AllowedOutboundDestinationPatchPrivatePathServiceGatewayDataPatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'isolation_policy') and self.isolation_policy is not None:
+            _dict['isolation_policy'] = self.isolation_policy
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AllowedOutboundDestinationPatchPrivatePathServiceGatewayDataPatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AllowedOutboundDestinationPatchPrivatePathServiceGatewayDataPatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AllowedOutboundDestinationPatchPrivatePathServiceGatewayDataPatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class IsolationPolicyEnum(str, Enum):
+        """
+        Optional property to specify the isolation policy of the private path service
+        gateway. If set to `shared`, other projects within the same account or enterprise
+        account family can connect to Private Path service, too. If set to `dedicated` the
+        gateway can only be used by a single Code Engine project. If not specified the
+        isolation policy will be set to `shared`.
+        """
+
+        SHARED = 'shared'
+        DEDICATED = 'dedicated'
+
+
+class AllowedOutboundDestinationPrototypeCidrBlockDataPrototype(AllowedOutboundDestinationPrototype):
+    """
+    Create an allowed outbound destination by using a CIDR block.
+
+    :param str name: The name of the allowed outbound destination.
+    :param str type: Specify the type of the allowed outbound destination. Allowed
+          types are: `cidr_block` and `private_path_service_gateway`.
+    :param str cidr_block: The IPv4 address range.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        type: str,
+        cidr_block: str,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundDestinationPrototypeCidrBlockDataPrototype object.
+
+        :param str name: The name of the allowed outbound destination.
+        :param str type: Specify the type of the allowed outbound destination.
+               Allowed types are: `cidr_block` and `private_path_service_gateway`.
+        :param str cidr_block: The IPv4 address range.
+        """
+        # pylint: disable=super-init-not-called
+        self.name = name
+        self.type = type
+        self.cidr_block = cidr_block
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AllowedOutboundDestinationPrototypeCidrBlockDataPrototype':
+        """Initialize a AllowedOutboundDestinationPrototypeCidrBlockDataPrototype object from a json dictionary."""
+        args = {}
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError(
+                'Required property \'name\' not present in AllowedOutboundDestinationPrototypeCidrBlockDataPrototype JSON'
+            )
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        else:
+            raise ValueError(
+                'Required property \'type\' not present in AllowedOutboundDestinationPrototypeCidrBlockDataPrototype JSON'
+            )
+        if (cidr_block := _dict.get('cidr_block')) is not None:
+            args['cidr_block'] = cidr_block
+        else:
+            raise ValueError(
+                'Required property \'cidr_block\' not present in AllowedOutboundDestinationPrototypeCidrBlockDataPrototype JSON'
+            )
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AllowedOutboundDestinationPrototypeCidrBlockDataPrototype object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        if hasattr(self, 'cidr_block') and self.cidr_block is not None:
+            _dict['cidr_block'] = self.cidr_block
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AllowedOutboundDestinationPrototypeCidrBlockDataPrototype object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AllowedOutboundDestinationPrototypeCidrBlockDataPrototype') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AllowedOutboundDestinationPrototypeCidrBlockDataPrototype') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the allowed outbound destination. Allowed types are:
+        `cidr_block` and `private_path_service_gateway`.
+        """
+
+        CIDR_BLOCK = 'cidr_block'
+        PRIVATE_PATH_SERVICE_GATEWAY = 'private_path_service_gateway'
+
+
+class AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype(AllowedOutboundDestinationPrototype):
+    """
+    Create an allowed outbound destination by connecting to a VPC Private Path service.
+
+    :param str name: The name of the allowed outbound destination.
+    :param str type: Specify the type of the allowed outbound destination. Allowed
+          types are: `cidr_block` and `private_path_service_gateway`.
+    :param str isolation_policy: (optional) Optional property to specify the
+          isolation policy of the private path service gateway. If set to `shared`, other
+          projects within the same account or enterprise account family can connect to
+          Private Path service, too. If set to `dedicated` the gateway can only be used by
+          a single Code Engine project. If not specified the isolation policy will be set
+          to `shared`.
+    :param str private_path_service_gateway_crn: The CRN of the Private Path
+          service. The CRN can be obtained in the resource details of the target Private
+          Path service. [Learn
+          more](https://cloud.ibm.com/docs/vpc?topic=vpc-pps-ui-communicate).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        type: str,
+        private_path_service_gateway_crn: str,
+        *,
+        isolation_policy: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype object.
+
+        :param str name: The name of the allowed outbound destination.
+        :param str type: Specify the type of the allowed outbound destination.
+               Allowed types are: `cidr_block` and `private_path_service_gateway`.
+        :param str private_path_service_gateway_crn: The CRN of the Private Path
+               service. The CRN can be obtained in the resource details of the target
+               Private Path service. [Learn
+               more](https://cloud.ibm.com/docs/vpc?topic=vpc-pps-ui-communicate).
+        :param str isolation_policy: (optional) Optional property to specify the
+               isolation policy of the private path service gateway. If set to `shared`,
+               other projects within the same account or enterprise account family can
+               connect to Private Path service, too. If set to `dedicated` the gateway can
+               only be used by a single Code Engine project. If not specified the
+               isolation policy will be set to `shared`.
+        """
+        # pylint: disable=super-init-not-called
+        self.name = name
+        self.type = type
+        self.isolation_policy = isolation_policy
+        self.private_path_service_gateway_crn = private_path_service_gateway_crn
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype':
+        """Initialize a AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype object from a json dictionary."""
+        args = {}
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError(
+                'Required property \'name\' not present in AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype JSON'
+            )
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        else:
+            raise ValueError(
+                'Required property \'type\' not present in AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype JSON'
+            )
+        if (isolation_policy := _dict.get('isolation_policy')) is not None:
+            args['isolation_policy'] = isolation_policy
+        if (private_path_service_gateway_crn := _dict.get('private_path_service_gateway_crn')) is not None:
+            args['private_path_service_gateway_crn'] = private_path_service_gateway_crn
+        else:
+            raise ValueError(
+                'Required property \'private_path_service_gateway_crn\' not present in AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype JSON'
+            )
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        if hasattr(self, 'isolation_policy') and self.isolation_policy is not None:
+            _dict['isolation_policy'] = self.isolation_policy
+        if hasattr(self, 'private_path_service_gateway_crn') and self.private_path_service_gateway_crn is not None:
+            _dict['private_path_service_gateway_crn'] = self.private_path_service_gateway_crn
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the allowed outbound destination. Allowed types are:
+        `cidr_block` and `private_path_service_gateway`.
+        """
+
+        CIDR_BLOCK = 'cidr_block'
+        PRIVATE_PATH_SERVICE_GATEWAY = 'private_path_service_gateway'
+
+    class IsolationPolicyEnum(str, Enum):
+        """
+        Optional property to specify the isolation policy of the private path service
+        gateway. If set to `shared`, other projects within the same account or enterprise
+        account family can connect to Private Path service, too. If set to `dedicated` the
+        gateway can only be used by a single Code Engine project. If not specified the
+        isolation policy will be set to `shared`.
+        """
+
+        SHARED = 'shared'
+        DEDICATED = 'dedicated'
+
+
+class AllowedOutboundDestinationCidrBlockData(AllowedOutboundDestination):
+    """
+    Allowed outbound destination of type CIDR block.
+
+    :param str entity_tag: (optional) The version of the allowed outbound
+          destination, which is used to achieve optimistic locking.
+    :param str name: (optional) The name of the allowed outbound destination.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str status: (optional) The current status of the outbound destination.
+    :param AllowedOutboundStatusDetails status_details: (optional)
+    :param str type: Specify the type of the allowed outbound destination. Allowed
+          types are: `cidr_block` and `private_path_service_gateway`.
+    :param str cidr_block: The IPv4 address range.
+    """
+
+    def __init__(
+        self,
+        type: str,
+        cidr_block: str,
+        *,
+        entity_tag: Optional[str] = None,
+        name: Optional[str] = None,
+        project_id: Optional[str] = None,
+        status: Optional[str] = None,
+        status_details: Optional['AllowedOutboundStatusDetails'] = None,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundDestinationCidrBlockData object.
+
+        :param str type: Specify the type of the allowed outbound destination.
+               Allowed types are: `cidr_block` and `private_path_service_gateway`.
+        :param str cidr_block: The IPv4 address range.
+        :param str entity_tag: (optional) The version of the allowed outbound
+               destination, which is used to achieve optimistic locking.
+        :param str name: (optional) The name of the allowed outbound destination.
+        :param AllowedOutboundStatusDetails status_details: (optional)
+        """
+        # pylint: disable=super-init-not-called
+        self.entity_tag = entity_tag
+        self.name = name
+        self.project_id = project_id
+        self.status = status
+        self.status_details = status_details
+        self.type = type
+        self.cidr_block = cidr_block
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AllowedOutboundDestinationCidrBlockData':
+        """Initialize a AllowedOutboundDestinationCidrBlockData object from a json dictionary."""
+        args = {}
+        if (entity_tag := _dict.get('entity_tag')) is not None:
+            args['entity_tag'] = entity_tag
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_details := _dict.get('status_details')) is not None:
+            args['status_details'] = status_details
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        else:
+            raise ValueError('Required property \'type\' not present in AllowedOutboundDestinationCidrBlockData JSON')
+        if (cidr_block := _dict.get('cidr_block')) is not None:
+            args['cidr_block'] = cidr_block
+        else:
+            raise ValueError(
+                'Required property \'cidr_block\' not present in AllowedOutboundDestinationCidrBlockData JSON'
+            )
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AllowedOutboundDestinationCidrBlockData object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'entity_tag') and self.entity_tag is not None:
+            _dict['entity_tag'] = self.entity_tag
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        if hasattr(self, 'status_details') and self.status_details is not None:
+            if isinstance(self.status_details, dict):
+                _dict['status_details'] = self.status_details
+            else:
+                _dict['status_details'] = self.status_details.to_dict()
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        if hasattr(self, 'cidr_block') and self.cidr_block is not None:
+            _dict['cidr_block'] = self.cidr_block
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AllowedOutboundDestinationCidrBlockData object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AllowedOutboundDestinationCidrBlockData') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AllowedOutboundDestinationCidrBlockData') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class StatusEnum(str, Enum):
+        """
+        The current status of the outbound destination.
+        """
+
+        READY = 'ready'
+        FAILED = 'failed'
+        DEPLOYING = 'deploying'
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the allowed outbound destination. Allowed types are:
+        `cidr_block` and `private_path_service_gateway`.
+        """
+
+        CIDR_BLOCK = 'cidr_block'
+        PRIVATE_PATH_SERVICE_GATEWAY = 'private_path_service_gateway'
+
+
+class AllowedOutboundDestinationPrivatePathServiceGatewayData(AllowedOutboundDestination):
+    """
+    Allowed outbound destination of type VPC Private Path service.
+
+    :param str entity_tag: (optional) The version of the allowed outbound
+          destination, which is used to achieve optimistic locking.
+    :param str name: (optional) The name of the allowed outbound destination.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str status: (optional) The current status of the outbound destination.
+    :param AllowedOutboundStatusDetails status_details: (optional)
+    :param str type: Specify the type of the allowed outbound destination. Allowed
+          types are: `cidr_block` and `private_path_service_gateway`.
+    :param str isolation_policy: Optional property to specify the isolation policy
+          of the private path service gateway. If set to `shared`, other projects within
+          the same account or enterprise account family can connect to Private Path
+          service, too. If set to `dedicated` the gateway can only be used by a single
+          Code Engine project. If not specified the isolation policy will be set to
+          `shared`.
+    :param str private_path_service_gateway_crn: The CRN of the Private Path
+          service.
+    """
+
+    def __init__(
+        self,
+        type: str,
+        isolation_policy: str,
+        private_path_service_gateway_crn: str,
+        *,
+        entity_tag: Optional[str] = None,
+        name: Optional[str] = None,
+        project_id: Optional[str] = None,
+        status: Optional[str] = None,
+        status_details: Optional['AllowedOutboundStatusDetails'] = None,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundDestinationPrivatePathServiceGatewayData object.
+
+        :param str type: Specify the type of the allowed outbound destination.
+               Allowed types are: `cidr_block` and `private_path_service_gateway`.
+        :param str isolation_policy: Optional property to specify the isolation
+               policy of the private path service gateway. If set to `shared`, other
+               projects within the same account or enterprise account family can connect
+               to Private Path service, too. If set to `dedicated` the gateway can only be
+               used by a single Code Engine project. If not specified the isolation policy
+               will be set to `shared`.
+        :param str private_path_service_gateway_crn: The CRN of the Private Path
+               service.
+        :param str entity_tag: (optional) The version of the allowed outbound
+               destination, which is used to achieve optimistic locking.
+        :param str name: (optional) The name of the allowed outbound destination.
+        :param AllowedOutboundStatusDetails status_details: (optional)
+        """
+        # pylint: disable=super-init-not-called
+        self.entity_tag = entity_tag
+        self.name = name
+        self.project_id = project_id
+        self.status = status
+        self.status_details = status_details
+        self.type = type
+        self.isolation_policy = isolation_policy
+        self.private_path_service_gateway_crn = private_path_service_gateway_crn
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AllowedOutboundDestinationPrivatePathServiceGatewayData':
+        """Initialize a AllowedOutboundDestinationPrivatePathServiceGatewayData object from a json dictionary."""
+        args = {}
+        if (entity_tag := _dict.get('entity_tag')) is not None:
+            args['entity_tag'] = entity_tag
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_details := _dict.get('status_details')) is not None:
+            args['status_details'] = status_details
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        else:
+            raise ValueError(
+                'Required property \'type\' not present in AllowedOutboundDestinationPrivatePathServiceGatewayData JSON'
+            )
+        if (isolation_policy := _dict.get('isolation_policy')) is not None:
+            args['isolation_policy'] = isolation_policy
+        else:
+            raise ValueError(
+                'Required property \'isolation_policy\' not present in AllowedOutboundDestinationPrivatePathServiceGatewayData JSON'
+            )
+        if (private_path_service_gateway_crn := _dict.get('private_path_service_gateway_crn')) is not None:
+            args['private_path_service_gateway_crn'] = private_path_service_gateway_crn
+        else:
+            raise ValueError(
+                'Required property \'private_path_service_gateway_crn\' not present in AllowedOutboundDestinationPrivatePathServiceGatewayData JSON'
+            )
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AllowedOutboundDestinationPrivatePathServiceGatewayData object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'entity_tag') and self.entity_tag is not None:
+            _dict['entity_tag'] = self.entity_tag
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        if hasattr(self, 'status_details') and self.status_details is not None:
+            if isinstance(self.status_details, dict):
+                _dict['status_details'] = self.status_details
+            else:
+                _dict['status_details'] = self.status_details.to_dict()
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        if hasattr(self, 'isolation_policy') and self.isolation_policy is not None:
+            _dict['isolation_policy'] = self.isolation_policy
+        if hasattr(self, 'private_path_service_gateway_crn') and self.private_path_service_gateway_crn is not None:
+            _dict['private_path_service_gateway_crn'] = self.private_path_service_gateway_crn
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AllowedOutboundDestinationPrivatePathServiceGatewayData object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AllowedOutboundDestinationPrivatePathServiceGatewayData') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AllowedOutboundDestinationPrivatePathServiceGatewayData') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class StatusEnum(str, Enum):
+        """
+        The current status of the outbound destination.
+        """
+
+        READY = 'ready'
+        FAILED = 'failed'
+        DEPLOYING = 'deploying'
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the allowed outbound destination. Allowed types are:
+        `cidr_block` and `private_path_service_gateway`.
+        """
+
+        CIDR_BLOCK = 'cidr_block'
+        PRIVATE_PATH_SERVICE_GATEWAY = 'private_path_service_gateway'
+
+    class IsolationPolicyEnum(str, Enum):
+        """
+        Optional property to specify the isolation policy of the private path service
+        gateway. If set to `shared`, other projects within the same account or enterprise
+        account family can connect to Private Path service, too. If set to `dedicated` the
+        gateway can only be used by a single Code Engine project. If not specified the
+        isolation policy will be set to `shared`.
+        """
+
+        SHARED = 'shared'
+        DEDICATED = 'dedicated'
+
+
+class AllowedOutboundStatusDetailsPrivatePathServiceGatewayStatusDetails(AllowedOutboundStatusDetails):
+    """
+    Detailed status information related to the corresponding VPC Private Path service.
+
+    :param EndpointGatewayDetails endpoint_gateway: (optional) Optional information
+          about the endpoint gateway located in the Code Engine VPC that connects to the
+          private path service gateway.
+    :param PrivatePathServiceGatewayDetails private_path_service_gateway: (optional)
+          Optional information about the private path service gateway that this allowed
+          outbound destination points to.
+    :param str reason: (optional) Optional information to provide more context in
+          case of a 'failed' or 'deploying' status.
+    """
+
+    def __init__(
+        self,
+        *,
+        endpoint_gateway: Optional['EndpointGatewayDetails'] = None,
+        private_path_service_gateway: Optional['PrivatePathServiceGatewayDetails'] = None,
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundStatusDetailsPrivatePathServiceGatewayStatusDetails object.
+
+        :param EndpointGatewayDetails endpoint_gateway: (optional) Optional
+               information about the endpoint gateway located in the Code Engine VPC that
+               connects to the private path service gateway.
+        :param PrivatePathServiceGatewayDetails private_path_service_gateway:
+               (optional) Optional information about the private path service gateway that
+               this allowed outbound destination points to.
+        """
+        # pylint: disable=super-init-not-called
+        self.endpoint_gateway = endpoint_gateway
+        self.private_path_service_gateway = private_path_service_gateway
+        self.reason = reason
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AllowedOutboundStatusDetailsPrivatePathServiceGatewayStatusDetails':
+        """Initialize a AllowedOutboundStatusDetailsPrivatePathServiceGatewayStatusDetails object from a json dictionary."""
+        args = {}
+        if (endpoint_gateway := _dict.get('endpoint_gateway')) is not None:
+            args['endpoint_gateway'] = EndpointGatewayDetails.from_dict(endpoint_gateway)
+        if (private_path_service_gateway := _dict.get('private_path_service_gateway')) is not None:
+            args['private_path_service_gateway'] = PrivatePathServiceGatewayDetails.from_dict(
+                private_path_service_gateway
+            )
+        if (reason := _dict.get('reason')) is not None:
+            args['reason'] = reason
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AllowedOutboundStatusDetailsPrivatePathServiceGatewayStatusDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'endpoint_gateway') and self.endpoint_gateway is not None:
+            if isinstance(self.endpoint_gateway, dict):
+                _dict['endpoint_gateway'] = self.endpoint_gateway
+            else:
+                _dict['endpoint_gateway'] = self.endpoint_gateway.to_dict()
+        if hasattr(self, 'private_path_service_gateway') and self.private_path_service_gateway is not None:
+            if isinstance(self.private_path_service_gateway, dict):
+                _dict['private_path_service_gateway'] = self.private_path_service_gateway
+            else:
+                _dict['private_path_service_gateway'] = self.private_path_service_gateway.to_dict()
+        if hasattr(self, 'reason') and getattr(self, 'reason') is not None:
+            _dict['reason'] = getattr(self, 'reason')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AllowedOutboundStatusDetailsPrivatePathServiceGatewayStatusDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AllowedOutboundStatusDetailsPrivatePathServiceGatewayStatusDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AllowedOutboundStatusDetailsPrivatePathServiceGatewayStatusDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ReasonEnum(str, Enum):
+        """
+        Optional information to provide more context in case of a 'failed' or 'deploying'
+        status.
+        """
+
+        READY = 'ready'
+        PRIVATE_PATH_CRN_INVALID = 'private_path_crn_invalid'
+        PRIVATE_PATH_NOT_IN_SAME_REGION = 'private_path_not_in_same_region'
+        PRIVATE_PATH_NOT_IN_SAME_ACCOUNT_FAMILY = 'private_path_not_in_same_account_family'
+        PRIVATE_PATH_NOT_FOUND = 'private_path_not_found'
+        PRIVATE_PATH_NOT_PUBLISHED = 'private_path_not_published'
+        PRIVATE_PATH_CONNECTION_ALREADY_EXISTS = 'private_path_connection_already_exists'
+        PRIVATE_PATH_CONNECTION_APPROVAL_DENIED = 'private_path_connection_approval_denied'
+        PRIVATE_PATH_CONNECTION_APPROVAL_PENDING = 'private_path_connection_approval_pending'
+        DEPLOYING = 'deploying'
+        FAILED = 'failed'
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'AllowedOutboundDestinationList': (
+        ModelField('allowed_outbound_destinations', required=True, to_dict_kind='list'),
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+    ),
+    'EndpointGatewayDetails': (
+        ModelField('account_id'),
+        ModelField('created_at'),
+        ModelField('ips'),
+        ModelField('name'),
+    ),
+    'PrivatePathServiceGatewayDetails': (
+        ModelField('id'),
+        ModelField('name'),
+        ModelField('service_endpoints'),
+    ),
+    'AllowedOutboundDestinationPatchCidrBlockDataPatch': (ModelField('cidr_block'),),
+    'AllowedOutboundDestinationPatchPrivatePathServiceGatewayDataPatch': (ModelField('isolation_policy'),),
+    'AllowedOutboundDestinationPrototypeCidrBlockDataPrototype': (
+        ModelField('name', required=True),
+        ModelField('type', required=True),
+        ModelField('cidr_block', required=True),
+    ),
+    'AllowedOutboundDestinationPrototypePrivatePathServiceGatewayDataPrototype': (
+        ModelField('name', required=True),
+        ModelField('type', required=True),
+        ModelField('isolation_policy'),
+        ModelField('private_path_service_gateway_crn', required=True),
+    ),
+    'AllowedOutboundDestinationCidrBlockData': (
+        ModelField('entity_tag'),
+        ModelField('name'),
+        ModelField('project_id'),
+        ModelField('status'),
+        ModelField('status_details', to_dict_kind='model'),
+        ModelField('type', required=True),
+        ModelField('cidr_block', required=True),
+    ),
+    'AllowedOutboundDestinationPrivatePathServiceGatewayData': (
+        ModelField('entity_tag'),
+        ModelField('name'),
+        ModelField('project_id'),
+        ModelField('status'),
+        ModelField('status_details', to_dict_kind='model'),
+        ModelField('type', required=True),
+        ModelField('isolation_policy', required=True),
+        ModelField('private_path_service_gateway_crn', required=True),
+    ),
+    'AllowedOutboundStatusDetailsPrivatePathServiceGatewayStatusDetails': (
+        ModelField('endpoint_gateway', 'model', 'EndpointGatewayDetails'),
+        ModelField('private_path_service_gateway', 'model', 'PrivatePathServiceGatewayDetails'),
+        ModelField('reason'),
+    ),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
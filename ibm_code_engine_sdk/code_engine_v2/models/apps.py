@@ -0,0 +1,2624 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models of apps, app revisions and app instances.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+from .common import (
+    EnvVar,
+    EnvVarPrototype,
+    ListFirstMetadata,
+    ListNextMetadata,
+    Probe,
+    ProbePrototype,
+    VolumeMount,
+    VolumeMountPrototype,
+)
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class App:
+    """
+    App is the response model for app resources.
+
+    :param str build: (optional) Reference to a build that is associated with the
+          application.
+    :param str build_run: (optional) Reference to a build run that is associated
+          with the application.
+    :param List[EnvVar] computed_env_variables: References to config maps, secrets
+          or literal values, which are defined and set by Code Engine and are exposed as
+          environment variables in the application.
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param str endpoint: (optional) Optional URL to invoke the app. Depending on
+          visibility,  this is accessible publicly or in the private network only. Empty
+          in case 'managed_domain_mappings' is set to 'local'.
+    :param str endpoint_internal: (optional) The URL to the app that is only visible
+          within the project.
+    :param str entity_tag: The version of the app instance, which is used to achieve
+          optimistic locking.
+    :param str href: (optional) When you provision a new app,  a URL is created
+          identifying the location of the instance.
+    :param str id: (optional) The identifier of the resource.
+    :param int image_port: (optional) Optional port the app listens on. While the
+          app will always be exposed via port `443` for end users, this port is used to
+          connect to the port that is exposed by the container image.
+    :param str image_reference: The name of the image that is used for this app. The
+          format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where `REGISTRY` and `TAG` are
+          optional. If `REGISTRY` is not specified, the default is `docker.io`. If `TAG`
+          is not specified, the default is `latest`. If the image reference points to a
+          registry that requires authentication, make sure to also specify the property
+          `image_secret`.
+    :param str image_secret: (optional) Optional name of the image registry access
+          secret. The image registry access secret is used to authenticate with a private
+          registry when you download the container image. If the image reference points to
+          a registry that requires authentication, the app will be created but cannot
+          reach the ready status, until this property is provided, too.
+    :param str managed_domain_mappings: Optional value controlling which of the
+          system managed domain mappings will be setup for the application. Valid values
+          are 'local_public', 'local_private' and 'local'. Visibility can only be
+          'local_private' if the project supports application private visibility.
+    :param str name: The name of the app.
+    :param Probe probe_liveness: (optional) Response model for probes.
+    :param Probe probe_readiness: (optional) Response model for probes.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the app.
+    :param List[str] run_arguments: Optional arguments for the app that are passed
+          to start the container. If not specified an empty string array will be applied
+          and the arguments specified by the container image, will be used to start the
+          container.
+    :param int run_as_user: (optional) Optional user ID (UID) to run the app.
+    :param List[str] run_commands: Optional commands for the app that are passed to
+          start the container. If not specified an empty string array will be applied and
+          the command specified by the container image, will be used to start the
+          container.
+    :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+          enable the use of a compute resource token mounted to the container file system.
+    :param List[EnvVar] run_env_variables: References to config maps, secrets or
+          literal values, which are defined by the app owner and are exposed as
+          environment variables in the application.
+    :param str run_service_account: Optional name of the service account. For
+          built-in service accounts, you can use the shortened names `manager` , `none`,
+          `reader`, and `writer`.
+    :param List[VolumeMount] run_volume_mounts: Mounts of config maps or secrets.
+    :param int scale_concurrency: (optional) Optional maximum number of requests
+          that can be processed concurrently per instance.
+    :param int scale_concurrency_target: (optional) Optional threshold of concurrent
+          requests per instance at which one or more additional instances are created. Use
+          this value to scale up instances based on concurrent number of requests. This
+          option defaults to the value of the `scale_concurrency` option, if not
+          specified.
+    :param str scale_cpu_limit: Optional number of CPU set for the instance of the
+          app. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+    :param int scale_down_delay: (optional) Optional amount of time in seconds that
+          delays the scale-down behavior for an app instance.
+    :param str scale_ephemeral_storage_limit: Optional amount of ephemeral storage
+          to set for the instance of the app. The amount specified as ephemeral storage,
+          must not exceed the amount of `scale_memory_limit`. The units for specifying
+          ephemeral storage are Megabyte (M) or Gigabyte (G), whereas G and M are the
+          shorthand expressions for GB and MB. For more information see [Units of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_initial_instances: (optional) Optional initial number of
+          instances that are created upon app creation or app update.
+    :param int scale_max_instances: Optional maximum number of instances for this
+          app. If you set this value to `0`, this property does not set a upper scaling
+          limit. However, the app scaling is still limited by the project quota for
+          instances. See [Limits and quotas for Code
+          Engine](https://cloud.ibm.com/docs/codeengine?topic=codeengine-limits).
+    :param str scale_memory_limit: Optional amount of memory set for the instance of
+          the app. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+          The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_min_instances: Optional minimum number of instances for this
+          app. If you set this value to `0`, the app will scale down to zero, if not hit
+          by any request for some time.
+    :param int scale_request_timeout: Optional amount of time in seconds that is
+          allowed for a running app to respond to a request.
+    :param str status: (optional) The current status of the app.
+    :param AppStatus status_details: (optional) The detailed status of the
+          application.
+    """
+
+    def __init__(
+        self,
+        computed_env_variables: List['EnvVar'],
+        entity_tag: str,
+        image_reference: str,
+        managed_domain_mappings: str,
+        name: str,
+        run_arguments: List[str],
+        run_commands: List[str],
+        run_env_variables: List['EnvVar'],
+        run_service_account: str,
+        run_volume_mounts: List['VolumeMount'],
+        scale_cpu_limit: str,
+        scale_ephemeral_storage_limit: str,
+        scale_max_instances: int,
+        scale_memory_limit: str,
+        scale_min_instances: int,
+        scale_request_timeout: int,
+        *,
+        build: Optional[str] = None,
+        build_run: Optional[str] = None,
+        created_at: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        endpoint_internal: Optional[str] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        image_port: Optional[int] = None,
+        image_secret: Optional[str] = None,
+        probe_liveness: Optional['Probe'] = None,
+        probe_readiness: Optional['Probe'] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        run_as_user: Optional[int] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        scale_concurrency: Optional[int] = None,
+        scale_concurrency_target: Optional[int] = None,
+        scale_down_delay: Optional[int] = None,
+        scale_initial_instances: Optional[int] = None,
+        status: Optional[str] = None,
+        status_details: Optional['AppStatus'] = None,
+    ) -> None:
+        """
+        Initialize a App object.
+
+        :param List[EnvVar] computed_env_variables: References to config maps,
+               secrets or literal values, which are defined and set by Code Engine and are
+               exposed as environment variables in the application.
+        :param str entity_tag: The version of the app instance, which is used to
+               achieve optimistic locking.
+        :param str image_reference: The name of the image that is used for this
+               app. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where `REGISTRY` and
+               `TAG` are optional. If `REGISTRY` is not specified, the default is
+               `docker.io`. If `TAG` is not specified, the default is `latest`. If the
+               image reference points to a registry that requires authentication, make
+               sure to also specify the property `image_secret`.
+        :param str managed_domain_mappings: Optional value controlling which of the
+               system managed domain mappings will be setup for the application. Valid
+               values are 'local_public', 'local_private' and 'local'. Visibility can only
+               be 'local_private' if the project supports application private visibility.
+        :param str name: The name of the app.
+        :param List[str] run_arguments: Optional arguments for the app that are
+               passed to start the container. If not specified an empty string array will
+               be applied and the arguments specified by the container image, will be used
+               to start the container.
+        :param List[str] run_commands: Optional commands for the app that are
+               passed to start the container. If not specified an empty string array will
+               be applied and the command specified by the container image, will be used
+               to start the container.
+        :param List[EnvVar] run_env_variables: References to config maps, secrets
+               or literal values, which are defined by the app owner and are exposed as
+               environment variables in the application.
+        :param str run_service_account: Optional name of the service account. For
+               built-in service accounts, you can use the shortened names `manager` ,
+               `none`, `reader`, and `writer`.
+        :param List[VolumeMount] run_volume_mounts: Mounts of config maps or
+               secrets.
+        :param str scale_cpu_limit: Optional number of CPU set for the instance of
+               the app. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param str scale_ephemeral_storage_limit: Optional amount of ephemeral
+               storage to set for the instance of the app. The amount specified as
+               ephemeral storage, must not exceed the amount of `scale_memory_limit`. The
+               units for specifying ephemeral storage are Megabyte (M) or Gigabyte (G),
+               whereas G and M are the shorthand expressions for GB and MB. For more
+               information see [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_max_instances: Optional maximum number of instances for
+               this app. If you set this value to `0`, this property does not set a upper
+               scaling limit. However, the app scaling is still limited by the project
+               quota for instances. See [Limits and quotas for Code
+               Engine](https://cloud.ibm.com/docs/codeengine?topic=codeengine-limits).
+        :param str scale_memory_limit: Optional amount of memory set for the
+               instance of the app. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_min_instances: Optional minimum number of instances for
+               this app. If you set this value to `0`, the app will scale down to zero, if
+               not hit by any request for some time.
+        :param int scale_request_timeout: Optional amount of time in seconds that
+               is allowed for a running app to respond to a request.
+        :param int image_port: (optional) Optional port the app listens on. While
+               the app will always be exposed via port `443` for end users, this port is
+               used to connect to the port that is exposed by the container image.
+        :param str image_secret: (optional) Optional name of the image registry
+               access secret. The image registry access secret is used to authenticate
+               with a private registry when you download the container image. If the image
+               reference points to a registry that requires authentication, the app will
+               be created but cannot reach the ready status, until this property is
+               provided, too.
+        :param Probe probe_liveness: (optional) Response model for probes.
+        :param Probe probe_readiness: (optional) Response model for probes.
+        :param int run_as_user: (optional) Optional user ID (UID) to run the app.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        :param int scale_concurrency: (optional) Optional maximum number of
+               requests that can be processed concurrently per instance.
+        :param int scale_concurrency_target: (optional) Optional threshold of
+               concurrent requests per instance at which one or more additional instances
+               are created. Use this value to scale up instances based on concurrent
+               number of requests. This option defaults to the value of the
+               `scale_concurrency` option, if not specified.
+        :param int scale_down_delay: (optional) Optional amount of time in seconds
+               that delays the scale-down behavior for an app instance.
+        :param int scale_initial_instances: (optional) Optional initial number of
+               instances that are created upon app creation or app update.
+        :param AppStatus status_details: (optional) The detailed status of the
+               application.
+        """
+        self.build = build
+        self.build_run = build_run
+        self.computed_env_variables = computed_env_variables
+        self.created_at = created_at
+        self.endpoint = endpoint
+        self.endpoint_internal = endpoint_internal
+        self.entity_tag = entity_tag
+        self.href = href
+        self.id = id
+        self.image_port = image_port
+        self.image_reference = image_reference
+        self.image_secret = image_secret
+        self.managed_domain_mappings = managed_domain_mappings
+        self.name = name
+        self.probe_liveness = probe_liveness
+        self.probe_readiness = probe_readiness
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+        self.run_arguments = run_arguments
+        self.run_as_user = run_as_user
+        self.run_commands = run_commands
+        self.run_compute_resource_token_enabled = run_compute_resource_token_enabled
+        self.run_env_variables = run_env_variables
+        self.run_service_account = run_service_account
+        self.run_volume_mounts = run_volume_mounts
+        self.scale_concurrency = scale_concurrency
+        self.scale_concurrency_target = scale_concurrency_target
+        self.scale_cpu_limit = scale_cpu_limit
+        self.scale_down_delay = scale_down_delay
+        self.scale_ephemeral_storage_limit = scale_ephemeral_storage_limit
+        self.scale_initial_instances = scale_initial_instances
+        self.scale_max_instances = scale_max_instances
+        self.scale_memory_limit = scale_memory_limit
+        self.scale_min_instances = scale_min_instances
+        self.scale_request_timeout = scale_request_timeout
+        self.status = status
+        self.status_details = status_details
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'App':
+        """Initialize a App object from a json dictionary."""
+        args = {}
+        if (build := _dict.get('build')) is not None:
+            args['build'] = build
+        if (build_run := _dict.get('build_run')) is not None:
+            args['build_run'] = build_run
+        if (computed_env_variables := _dict.get('computed_env_variables')) is not None:
+            args['computed_env_variables'] = [EnvVar.from_dict(v) for v in computed_env_variables]
+        else:
+            raise ValueError('Required property \'computed_env_variables\' not present in App JSON')
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (endpoint := _dict.get('endpoint')) is not None:
+            args['endpoint'] = endpoint
+        if (endpoint_internal := _dict.get('endpoint_internal')) is not None:
+            args['endpoint_internal'] = endpoint_internal
+        if (entity_tag := _dict.get('entity_tag')) is not None:
+            args['entity_tag'] = entity_tag
+        else:
+            raise ValueError('Required property \'entity_tag\' not present in App JSON')
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (image_port := _dict.get('image_port')) is not None:
+            args['image_port'] = image_port
+        if (image_reference := _dict.get('image_reference')) is not None:
+            args['image_reference'] = image_reference
+        else:
+            raise ValueError('Required property \'image_reference\' not present in App JSON')
+        if (image_secret := _dict.get('image_secret')) is not None:
+            args['image_secret'] = image_secret
+        if (managed_domain_mappings := _dict.get('managed_domain_mappings')) is not None:
+            args['managed_domain_mappings'] = managed_domain_mappings
+        else:
+            raise ValueError('Required property \'managed_domain_mappings\' not present in App JSON')
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError('Required property \'name\' not present in App JSON')
+        if (probe_liveness := _dict.get('probe_liveness')) is not None:
+            args['probe_liveness'] = Probe.from_dict(probe_liveness)
+        if (probe_readiness := _dict.get('probe_readiness')) is not None:
+            args['probe_readiness'] = Probe.from_dict(probe_readiness)
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (run_arguments := _dict.get('run_arguments')) is not None:
+            args['run_arguments'] = run_arguments
+        else:
+            raise ValueError('Required property \'run_arguments\' not present in App JSON')
+        if (run_as_user := _dict.get('run_as_user')) is not None:
+            args['run_as_user'] = run_as_user
+        if (run_commands := _dict.get('run_commands')) is not None:
+            args['run_commands'] = run_commands
+        else:
+            raise ValueError('Required property \'run_commands\' not present in App JSON')
+        if (run_compute_resource_token_enabled := _dict.get('run_compute_resource_token_enabled')) is not None:
+            args['run_compute_resource_token_enabled'] = run_compute_resource_token_enabled
+        if (run_env_variables := _dict.get('run_env_variables')) is not None:
+            args['run_env_variables'] = [EnvVar.from_dict(v) for v in run_env_variables]
+        else:
+            raise ValueError('Required property \'run_env_variables\' not present in App JSON')
+        if (run_service_account := _dict.get('run_service_account')) is not None:
+            args['run_service_account'] = run_service_account
+        else:
+            raise ValueError('Required property \'run_service_account\' not present in App JSON')
+        if (run_volume_mounts := _dict.get('run_volume_mounts')) is not None:
+            args['run_volume_mounts'] = [VolumeMount.from_dict(v) for v in run_volume_mounts]
+        else:
+            raise ValueError('Required property \'run_volume_mounts\' not present in App JSON')
+        if (scale_concurrency := _dict.get('scale_concurrency')) is not None:
+            args['scale_concurrency'] = scale_concurrency
+        if (scale_concurrency_target := _dict.get('scale_concurrency_target')) is not None:
+            args['scale_concurrency_target'] = scale_concurrency_target
+        if (scale_cpu_limit := _dict.get('scale_cpu_limit')) is not None:
+            args['scale_cpu_limit'] = scale_cpu_limit
+        else:
+            raise ValueError('Required property \'scale_cpu_limit\' not present in App JSON')
+        if (scale_down_delay := _dict.get('scale_down_delay')) is not None:
+            args['scale_down_delay'] = scale_down_delay
+        if (scale_ephemeral_storage_limit := _dict.get('scale_ephemeral_storage_limit')) is not None:
+            args['scale_ephemeral_storage_limit'] = scale_ephemeral_storage_limit
+        else:
+            raise ValueError('Required property \'scale_ephemeral_storage_limit\' not present in App JSON')
+        if (scale_initial_instances := _dict.get('scale_initial_instances')) is not None:
+            args['scale_initial_instances'] = scale_initial_instances
+        if (scale_max_instances := _dict.get('scale_max_instances')) is not None:
+            args['scale_max_instances'] = scale_max_instances
+        else:
+            raise ValueError('Required property \'scale_max_instances\' not present in App JSON')
+        if (scale_memory_limit := _dict.get('scale_memory_limit')) is not None:
+            args['scale_memory_limit'] = scale_memory_limit
+        else:
+            raise ValueError('Required property \'scale_memory_limit\' not present in App JSON')
+        if (scale_min_instances := _dict.get('scale_min_instances')) is not None:
+            args['scale_min_instances'] = scale_min_instances
+        else:
+            raise ValueError('Required property \'scale_min_instances\' not present in App JSON')
+        if (scale_request_timeout := _dict.get('scale_request_timeout')) is not None:
+            args['scale_request_timeout'] = scale_request_timeout
+        else:
+            raise ValueError('Required property \'scale_request_timeout\' not present in App JSON')
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_details := _dict.get('status_details')) is not None:
+            args['status_details'] = AppStatus.from_dict(status_details)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a App object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'build') and getattr(self, 'build') is not None:
+            _dict['build'] = getattr(self, 'build')
+        if hasattr(self, 'build_run') and getattr(self, 'build_run') is not None:
+            _dict['build_run'] = getattr(self, 'build_run')
+        if hasattr(self, 'computed_env_variables') and self.computed_env_variables is not None:
+            computed_env_variables_list = []
+            for v in self.computed_env_variables:
+                if isinstance(v, dict):
+                    computed_env_variables_list.append(v)
+                else:
+                    computed_env_variables_list.append(v.to_dict())
+            _dict['computed_env_variables'] = computed_env_variables_list
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'endpoint') and getattr(self, 'endpoint') is not None:
+            _dict['endpoint'] = getattr(self, 'endpoint')
+        if hasattr(self, 'endpoint_internal') and getattr(self, 'endpoint_internal') is not None:
+            _dict['endpoint_internal'] = getattr(self, 'endpoint_internal')
+        if hasattr(self, 'entity_tag') and self.entity_tag is not None:
+            _dict['entity_tag'] = self.entity_tag
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'image_port') and self.image_port is not None:
+            _dict['image_port'] = self.image_port
+        if hasattr(self, 'image_reference') and self.image_reference is not None:
+            _dict['image_reference'] = self.image_reference
+        if hasattr(self, 'image_secret') and self.image_secret is not None:
+            _dict['image_secret'] = self.image_secret
+        if hasattr(self, 'managed_domain_mappings') and self.managed_domain_mappings is not None:
+            _dict['managed_domain_mappings'] = self.managed_domain_mappings
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'probe_liveness') and self.probe_liveness is not None:
+            if isinstance(self.probe_liveness, dict):
+                _dict['probe_liveness'] = self.probe_liveness
+            else:
+                _dict['probe_liveness'] = self.probe_liveness.to_dict()
+        if hasattr(self, 'probe_readiness') and self.probe_readiness is not None:
+            if isinstance(self.probe_readiness, dict):
+                _dict['probe_readiness'] = self.probe_readiness
+            else:
+                _dict['probe_readiness'] = self.probe_readiness.to_dict()
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'run_arguments') and self.run_arguments is not None:
+            _dict['run_arguments'] = self.run_arguments
+        if hasattr(self, 'run_as_user') and self.run_as_user is not None:
+            _dict['run_as_user'] = self.run_as_user
+        if hasattr(self, 'run_commands') and self.run_commands is not None:
+            _dict['run_commands'] = self.run_commands
+        if hasattr(self, 'run_compute_resource_token_enabled') and self.run_compute_resource_token_enabled is not None:
+            _dict['run_compute_resource_token_enabled'] = self.run_compute_resource_token_enabled
+        if hasattr(self, 'run_env_variables') and self.run_env_variables is not None:
+            run_env_variables_list = []
+            for v in self.run_env_variables:
+                if isinstance(v, dict):
+                    run_env_variables_list.append(v)
+                else:
+                    run_env_variables_list.append(v.to_dict())
+            _dict['run_env_variables'] = run_env_variables_list
+        if hasattr(self, 'run_service_account') and self.run_service_account is not None:
+            _dict['run_service_account'] = self.run_service_account
+        if hasattr(self, 'run_volume_mounts') and self.run_volume_mounts is not None:
+            run_volume_mounts_list = []
+            for v in self.run_volume_mounts:
+                if isinstance(v, dict):
+                    run_volume_mounts_list.append(v)
+                else:
+                    run_volume_mounts_list.append(v.to_dict())
+            _dict['run_volume_mounts'] = run_volume_mounts_list
+        if hasattr(self, 'scale_concurrency') and self.scale_concurrency is not None:
+            _dict['scale_concurrency'] = self.scale_concurrency
+        if hasattr(self, 'scale_concurrency_target') and self.scale_concurrency_target is not None:
+            _dict['scale_concurrency_target'] = self.scale_concurrency_target
+        if hasattr(self, 'scale_cpu_limit') and self.scale_cpu_limit is not None:
+            _dict['scale_cpu_limit'] = self.scale_cpu_limit
+        if hasattr(self, 'scale_down_delay') and self.scale_down_delay is not None:
+            _dict['scale_down_delay'] = self.scale_down_delay
+        if hasattr(self, 'scale_ephemeral_storage_limit') and self.scale_ephemeral_storage_limit is not None:
+            _dict['scale_ephemeral_storage_limit'] = self.scale_ephemeral_storage_limit
+        if hasattr(self, 'scale_initial_instances') and self.scale_initial_instances is not None:
+            _dict['scale_initial_instances'] = self.scale_initial_instances
+        if hasattr(self, 'scale_max_instances') and self.scale_max_instances is not None:
+            _dict['scale_max_instances'] = self.scale_max_instances
+        if hasattr(self, 'scale_memory_limit') and self.scale_memory_limit is not None:
+            _dict['scale_memory_limit'] = self.scale_memory_limit
+        if hasattr(self, 'scale_min_instances') and self.scale_min_instances is not None:
+            _dict['scale_min_instances'] = self.scale_min_instances
+        if hasattr(self, 'scale_request_timeout') and self.scale_request_timeout is not None:
+            _dict['scale_request_timeout'] = self.scale_request_timeout
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        if hasattr(self, 'status_details') and self.status_details is not None:
+            if isinstance(self.status_details, dict):
+                _dict['status_details'] = self.status_details
+            else:
+                _dict['status_details'] = self.status_details.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this App object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'App') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'App') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ManagedDomainMappingsEnum(str, Enum):
+        """
+        Optional value controlling which of the system managed domain mappings will be
+        setup for the application. Valid values are 'local_public', 'local_private' and
+        'local'. Visibility can only be 'local_private' if the project supports
+        application private visibility.
+        """
+
+        LOCAL = 'local'
+        LOCAL_PRIVATE = 'local_private'
+        LOCAL_PUBLIC = 'local_public'
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the app.
+        """
+
+        APP_V2 = 'app_v2'
+
+    class RunServiceAccountEnum(str, Enum):
+        """
+        Optional name of the service account. For built-in service accounts, you can use
+        the shortened names `manager` , `none`, `reader`, and `writer`.
+        """
+
+        DEFAULT = 'default'
+        MANAGER = 'manager'
+        READER = 'reader'
+        WRITER = 'writer'
+        NONE = 'none'
+
+    class StatusEnum(str, Enum):
+        """
+        The current status of the app.
+        """
+
+        READY = 'ready'
+        DEPLOYING = 'deploying'
+        FAILED = 'failed'
+        WARNING = 'warning'
+
+
+class AppInstance:
+    """
+    AppInstance is the response model for app instance resources.
+
+    :param str app_name: The name of the application that is associated with this
+          instance.
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param str href: (optional) When you provision a new app instance, a URL is
+          created identifying the location of the instance.
+    :param str id: (optional) The identifier of the resource.
+    :param str name: (optional) The name of the app instance.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the app instance.
+    :param str revision_name: The name of the revision that is associated with this
+          instance.
+    :param str scale_cpu_limit: The number of CPU set for the instance. For valid
+          values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+    :param str scale_ephemeral_storage_limit: The amount of ephemeral storage set
+          for the instance. The amount specified as ephemeral storage, must not exceed the
+          amount of `scale_memory_limit`. The units for specifying ephemeral storage are
+          Megabyte (M) or Gigabyte (G), whereas G and M are the shorthand expressions for
+          GB and MB. For more information see [Units of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param str scale_memory_limit: The amount of memory set for the instance. For
+          valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+          The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param str status: (optional) The current status of the instance.
+    :param AppInstanceStatusDetails status_details: (optional) The status of the pod
+          and it's containers.
+    """
+
+    def __init__(
+        self,
+        app_name: str,
+        revision_name: str,
+        scale_cpu_limit: str,
+        scale_ephemeral_storage_limit: str,
+        scale_memory_limit: str,
+        *,
+        created_at: Optional[str] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        status: Optional[str] = None,
+        status_details: Optional['AppInstanceStatusDetails'] = None,
+    ) -> None:
+        """
+        Initialize a AppInstance object.
+
+        :param str app_name: The name of the application that is associated with
+               this instance.
+        :param str revision_name: The name of the revision that is associated with
+               this instance.
+        :param str scale_cpu_limit: The number of CPU set for the instance. For
+               valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param str scale_ephemeral_storage_limit: The amount of ephemeral storage
+               set for the instance. The amount specified as ephemeral storage, must not
+               exceed the amount of `scale_memory_limit`. The units for specifying
+               ephemeral storage are Megabyte (M) or Gigabyte (G), whereas G and M are the
+               shorthand expressions for GB and MB. For more information see [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param str scale_memory_limit: The amount of memory set for the instance.
+               For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param AppInstanceStatusDetails status_details: (optional) The status of
+               the pod and it's containers.
+        """
+        self.app_name = app_name
+        self.created_at = created_at
+        self.href = href
+        self.id = id
+        self.name = name
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+        self.revision_name = revision_name
+        self.scale_cpu_limit = scale_cpu_limit
+        self.scale_ephemeral_storage_limit = scale_ephemeral_storage_limit
+        self.scale_memory_limit = scale_memory_limit
+        self.status = status
+        self.status_details = status_details
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AppInstance':
+        """Initialize a AppInstance object from a json dictionary."""
+        args = {}
+        if (app_name := _dict.get('app_name')) is not None:
+            args['app_name'] = app_name
+        else:
+            raise ValueError('Required property \'app_name\' not present in AppInstance JSON')
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (revision_name := _dict.get('revision_name')) is not None:
+            args['revision_name'] = revision_name
+        else:
+            raise ValueError('Required property \'revision_name\' not present in AppInstance JSON')
+        if (scale_cpu_limit := _dict.get('scale_cpu_limit')) is not None:
+            args['scale_cpu_limit'] = scale_cpu_limit
+        else:
+            raise ValueError('Required property \'scale_cpu_limit\' not present in AppInstance JSON')
+        if (scale_ephemeral_storage_limit := _dict.get('scale_ephemeral_storage_limit')) is not None:
+            args['scale_ephemeral_storage_limit'] = scale_ephemeral_storage_limit
+        else:
+            raise ValueError('Required property \'scale_ephemeral_storage_limit\' not present in AppInstance JSON')
+        if (scale_memory_limit := _dict.get('scale_memory_limit')) is not None:
+            args['scale_memory_limit'] = scale_memory_limit
+        else:
+            raise ValueError('Required property \'scale_memory_limit\' not present in AppInstance JSON')
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_details := _dict.get('status_details')) is not None:
+            args['status_details'] = AppInstanceStatusDetails.from_dict(status_details)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AppInstance object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'app_name') and self.app_name is not None:
+            _dict['app_name'] = self.app_name
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'name') and getattr(self, 'name') is not None:
+            _dict['name'] = getattr(self, 'name')
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'revision_name') and self.revision_name is not None:
+            _dict['revision_name'] = self.revision_name
+        if hasattr(self, 'scale_cpu_limit') and self.scale_cpu_limit is not None:
+            _dict['scale_cpu_limit'] = self.scale_cpu_limit
+        if hasattr(self, 'scale_ephemeral_storage_limit') and self.scale_ephemeral_storage_limit is not None:
+            _dict['scale_ephemeral_storage_limit'] = self.scale_ephemeral_storage_limit
+        if hasattr(self, 'scale_memory_limit') and self.scale_memory_limit is not None:
+            _dict['scale_memory_limit'] = self.scale_memory_limit
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        if hasattr(self, 'status_details') and self.status_details is not None:
+            if isinstance(self.status_details, dict):
+                _dict['status_details'] = self.status_details
+            else:
+                _dict['status_details'] = self.status_details.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AppInstance object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AppInstance') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AppInstance') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the app instance.
+        """
+
+        APP_INSTANCE_V2 = 'app_instance_v2'
+
+    class StatusEnum(str, Enum):
+        """
+        The current status of the instance.
+        """
+
+        PENDING = 'pending'
+        RUNNING = 'running'
+        SUCCEEDED = 'succeeded'
+        FAILED = 'failed'
+
+
+class AppInstanceList:
+    """
+    Contains a list of app instances and pagination information.
+
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param List[AppInstance] instances: List of all app instances.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    """
+
+    def __init__(
+        self,
+        instances: List['AppInstance'],
+        limit: int,
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a AppInstanceList object.
+
+        :param List[AppInstance] instances: List of all app instances.
+        :param int limit: Maximum number of resources per page.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.first = first
+        self.instances = instances
+        self.limit = limit
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AppInstanceList':
+        """Initialize a AppInstanceList object from a json dictionary."""
+        args = {}
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (instances := _dict.get('instances')) is not None:
+            args['instances'] = [AppInstance.from_dict(v) for v in instances]
+        else:
+            raise ValueError('Required property \'instances\' not present in AppInstanceList JSON')
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in AppInstanceList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AppInstanceList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'instances') and self.instances is not None:
+            instances_list = []
+            for v in self.instances:
+                if isinstance(v, dict):
+                    instances_list.append(v)
+                else:
+                    instances_list.append(v.to_dict())
+            _dict['instances'] = instances_list
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AppInstanceList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AppInstanceList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AppInstanceList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class AppInstanceStatusDetails:
+    """
+    The status of the pod and it's containers.
+
+    :param int restarts: (optional) The number of restarts of the app instance.
+    :param ContainerStatus system_container: (optional) The status of a container.
+    :param ContainerStatus user_container: (optional) The status of a container.
+    """
+
+    def __init__(
+        self,
+        *,
+        restarts: Optional[int] = None,
+        system_container: Optional['ContainerStatus'] = None,
+        user_container: Optional['ContainerStatus'] = None,
+    ) -> None:
+        """
+        Initialize a AppInstanceStatusDetails object.
+
+        :param ContainerStatus system_container: (optional) The status of a
+               container.
+        :param ContainerStatus user_container: (optional) The status of a
+               container.
+        """
+        self.restarts = restarts
+        self.system_container = system_container
+        self.user_container = user_container
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AppInstanceStatusDetails':
+        """Initialize a AppInstanceStatusDetails object from a json dictionary."""
+        args = {}
+        if (restarts := _dict.get('restarts')) is not None:
+            args['restarts'] = restarts
+        if (system_container := _dict.get('system_container')) is not None:
+            args['system_container'] = ContainerStatus.from_dict(system_container)
+        if (user_container := _dict.get('user_container')) is not None:
+            args['user_container'] = ContainerStatus.from_dict(user_container)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AppInstanceStatusDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'restarts') and getattr(self, 'restarts') is not None:
+            _dict['restarts'] = getattr(self, 'restarts')
+        if hasattr(self, 'system_container') and self.system_container is not None:
+            if isinstance(self.system_container, dict):
+                _dict['system_container'] = self.system_container
+            else:
+                _dict['system_container'] = self.system_container.to_dict()
+        if hasattr(self, 'user_container') and self.user_container is not None:
+            if isinstance(self.user_container, dict):
+                _dict['user_container'] = self.user_container
+            else:
+                _dict['user_container'] = self.user_container.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AppInstanceStatusDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AppInstanceStatusDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AppInstanceStatusDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class AppList:
+    """
+    Contains a list of apps and pagination information.
+
+    :param List[App] apps: List of all apps.
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    """
+
+    def __init__(
+        self,
+        apps: List['App'],
+        limit: int,
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a AppList object.
+
+        :param List[App] apps: List of all apps.
+        :param int limit: Maximum number of resources per page.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.apps = apps
+        self.first = first
+        self.limit = limit
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AppList':
+        """Initialize a AppList object from a json dictionary."""
+        args = {}
+        if (apps := _dict.get('apps')) is not None:
+            args['apps'] = [App.from_dict(v) for v in apps]
+        else:
+            raise ValueError('Required property \'apps\' not present in AppList JSON')
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in AppList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AppList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'apps') and self.apps is not None:
+            apps_list = []
+            for v in self.apps:
+                if isinstance(v, dict):
+                    apps_list.append(v)
+                else:
+                    apps_list.append(v.to_dict())
+            _dict['apps'] = apps_list
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AppList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AppList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AppList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class AppPatch:
+    """
+    App is the request model for app update operations.
+
+    :param int image_port: (optional) Optional port the app listens on. While the
+          app will always be exposed via port `443` for end users, this port is used to
+          connect to the port that is exposed by the container image.
+    :param str image_reference: (optional) The name of the image that is used for
+          this app. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where `REGISTRY` and
+          `TAG` are optional. If `REGISTRY` is not specified, the default is `docker.io`.
+          If `TAG` is not specified, the default is `latest`. If the image reference
+          points to a registry that requires authentication, make sure to also specify the
+          property `image_secret`.
+    :param str image_secret: (optional) Optional name of the image registry access
+          secret. The image registry access secret is used to authenticate with a private
+          registry when you download the container image. If the image reference points to
+          a registry that requires authentication, the app will be created but cannot
+          reach the ready status, until this property is provided, too.
+    :param str managed_domain_mappings: (optional) Optional value controlling which
+          of the system managed domain mappings will be setup for the application. Valid
+          values are 'local_public', 'local_private' and 'local'. Visibility can only be
+          'local_private' if the project supports application private visibility.
+    :param ProbePrototype probe_liveness: (optional) Request model for probes.
+    :param ProbePrototype probe_readiness: (optional) Request model for probes.
+    :param List[str] run_arguments: (optional) Optional arguments for the app that
+          are passed to start the container. If not specified an empty string array will
+          be applied and the arguments specified by the container image, will be used to
+          start the container.
+    :param int run_as_user: (optional) Optional user ID (UID) to run the app.
+    :param List[str] run_commands: (optional) Optional commands for the app that are
+          passed to start the container. If not specified an empty string array will be
+          applied and the command specified by the container image, will be used to start
+          the container.
+    :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+          enable the use of a compute resource token mounted to the container file system.
+    :param List[EnvVarPrototype] run_env_variables: (optional) Optional references
+          to config maps, secrets or literal values.
+    :param str run_service_account: (optional) Optional name of the service account.
+          For built-in service accounts, you can use the shortened names `manager` ,
+          `none`, `reader`, and `writer`.
+    :param List[VolumeMountPrototype] run_volume_mounts: (optional) Optional mounts
+          of config maps or a secrets. In case this is provided, existing
+          `run_volume_mounts` will be overwritten.
+    :param int scale_concurrency: (optional) Optional maximum number of requests
+          that can be processed concurrently per instance.
+    :param int scale_concurrency_target: (optional) Optional threshold of concurrent
+          requests per instance at which one or more additional instances are created. Use
+          this value to scale up instances based on concurrent number of requests. This
+          option defaults to the value of the `scale_concurrency` option, if not
+          specified.
+    :param str scale_cpu_limit: (optional) Optional number of CPU set for the
+          instance of the app. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+    :param int scale_down_delay: (optional) Optional amount of time in seconds that
+          delays the scale-down behavior for an app instance.
+    :param str scale_ephemeral_storage_limit: (optional) Optional amount of
+          ephemeral storage to set for the instance of the app. The amount specified as
+          ephemeral storage, must not exceed the amount of `scale_memory_limit`. The units
+          for specifying ephemeral storage are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_initial_instances: (optional) Optional initial number of
+          instances that are created upon app creation or app update.
+    :param int scale_max_instances: (optional) Optional maximum number of instances
+          for this app. If you set this value to `0`, this property does not set a upper
+          scaling limit. However, the app scaling is still limited by the project quota
+          for instances. See [Limits and quotas for Code
+          Engine](https://cloud.ibm.com/docs/codeengine?topic=codeengine-limits).
+    :param str scale_memory_limit: (optional) Optional amount of memory set for the
+          instance of the app. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+          The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_min_instances: (optional) Optional minimum number of instances
+          for this app. If you set this value to `0`, the app will scale down to zero, if
+          not hit by any request for some time.
+    :param int scale_request_timeout: (optional) Optional amount of time in seconds
+          that is allowed for a running app to respond to a request.
+    """
+
+    def __init__(
+        self,
+        *,
+        image_port: Optional[int] = None,
+        image_reference: Optional[str] = None,
+        image_secret: Optional[str] = None,
+        managed_domain_mappings: Optional[str] = None,
+        probe_liveness: Optional['ProbePrototype'] = None,
+        probe_readiness: Optional['ProbePrototype'] = None,
+        run_arguments: Optional[List[str]] = None,
+        run_as_user: Optional[int] = None,
+        run_commands: Optional[List[str]] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        run_env_variables: Optional[List['EnvVarPrototype']] = None,
+        run_service_account: Optional[str] = None,
+        run_volume_mounts: Optional[List['VolumeMountPrototype']] = None,
+        scale_concurrency: Optional[int] = None,
+        scale_concurrency_target: Optional[int] = None,
+        scale_cpu_limit: Optional[str] = None,
+        scale_down_delay: Optional[int] = None,
+        scale_ephemeral_storage_limit: Optional[str] = None,
+        scale_initial_instances: Optional[int] = None,
+        scale_max_instances: Optional[int] = None,
+        scale_memory_limit: Optional[str] = None,
+        scale_min_instances: Optional[int] = None,
+        scale_request_timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a AppPatch object.
+
+        :param int image_port: (optional) Optional port the app listens on. While
+               the app will always be exposed via port `443` for end users, this port is
+               used to connect to the port that is exposed by the container image.
+        :param str image_reference: (optional) The name of the image that is used
+               for this app. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where
+               `REGISTRY` and `TAG` are optional. If `REGISTRY` is not specified, the
+               default is `docker.io`. If `TAG` is not specified, the default is `latest`.
+               If the image reference points to a registry that requires authentication,
+               make sure to also specify the property `image_secret`.
+        :param str image_secret: (optional) Optional name of the image registry
+               access secret. The image registry access secret is used to authenticate
+               with a private registry when you download the container image. If the image
+               reference points to a registry that requires authentication, the app will
+               be created but cannot reach the ready status, until this property is
+               provided, too.
+        :param str managed_domain_mappings: (optional) Optional value controlling
+               which of the system managed domain mappings will be setup for the
+               application. Valid values are 'local_public', 'local_private' and 'local'.
+               Visibility can only be 'local_private' if the project supports application
+               private visibility.
+        :param ProbePrototype probe_liveness: (optional) Request model for probes.
+        :param ProbePrototype probe_readiness: (optional) Request model for probes.
+        :param List[str] run_arguments: (optional) Optional arguments for the app
+               that are passed to start the container. If not specified an empty string
+               array will be applied and the arguments specified by the container image,
+               will be used to start the container.
+        :param int run_as_user: (optional) Optional user ID (UID) to run the app.
+        :param List[str] run_commands: (optional) Optional commands for the app
+               that are passed to start the container. If not specified an empty string
+               array will be applied and the command specified by the container image,
+               will be used to start the container.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        :param List[EnvVarPrototype] run_env_variables: (optional) Optional
+               references to config maps, secrets or literal values.
+        :param str run_service_account: (optional) Optional name of the service
+               account. For built-in service accounts, you can use the shortened names
+               `manager` , `none`, `reader`, and `writer`.
+        :param List[VolumeMountPrototype] run_volume_mounts: (optional) Optional
+               mounts of config maps or a secrets. In case this is provided, existing
+               `run_volume_mounts` will be overwritten.
+        :param int scale_concurrency: (optional) Optional maximum number of
+               requests that can be processed concurrently per instance.
+        :param int scale_concurrency_target: (optional) Optional threshold of
+               concurrent requests per instance at which one or more additional instances
+               are created. Use this value to scale up instances based on concurrent
+               number of requests. This option defaults to the value of the
+               `scale_concurrency` option, if not specified.
+        :param str scale_cpu_limit: (optional) Optional number of CPU set for the
+               instance of the app. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param int scale_down_delay: (optional) Optional amount of time in seconds
+               that delays the scale-down behavior for an app instance.
+        :param str scale_ephemeral_storage_limit: (optional) Optional amount of
+               ephemeral storage to set for the instance of the app. The amount specified
+               as ephemeral storage, must not exceed the amount of `scale_memory_limit`.
+               The units for specifying ephemeral storage are Megabyte (M) or Gigabyte
+               (G), whereas G and M are the shorthand expressions for GB and MB. For more
+               information see [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_initial_instances: (optional) Optional initial number of
+               instances that are created upon app creation or app update.
+        :param int scale_max_instances: (optional) Optional maximum number of
+               instances for this app. If you set this value to `0`, this property does
+               not set a upper scaling limit. However, the app scaling is still limited by
+               the project quota for instances. See [Limits and quotas for Code
+               Engine](https://cloud.ibm.com/docs/codeengine?topic=codeengine-limits).
+        :param str scale_memory_limit: (optional) Optional amount of memory set for
+               the instance of the app. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_min_instances: (optional) Optional minimum number of
+               instances for this app. If you set this value to `0`, the app will scale
+               down to zero, if not hit by any request for some time.
+        :param int scale_request_timeout: (optional) Optional amount of time in
+               seconds that is allowed for a running app to respond to a request.
+        """
+        self.image_port = image_port
+        self.image_reference = image_reference
+        self.image_secret = image_secret
+        self.managed_domain_mappings = managed_domain_mappings
+        self.probe_liveness = probe_liveness
+        self.probe_readiness = probe_readiness
+        self.run_arguments = run_arguments
+        self.run_as_user = run_as_user
+        self.run_commands = run_commands
+        self.run_compute_resource_token_enabled = run_compute_resource_token_enabled
+        self.run_env_variables = run_env_variables
+        self.run_service_account = run_service_account
+        self.run_volume_mounts = run_volume_mounts
+        self.scale_concurrency = scale_concurrency
+        self.scale_concurrency_target = scale_concurrency_target
+        self.scale_cpu_limit = scale_cpu_limit
+        self.scale_down_delay = scale_down_delay
+        self.scale_ephemeral_storage_limit = scale_ephemeral_storage_limit
+        self.scale_initial_instances = scale_initial_instances
+        self.scale_max_instances = scale_max_instances
+        self.scale_memory_limit = scale_memory_limit
+        self.scale_min_instances = scale_min_instances
+        self.scale_request_timeout = scale_request_timeout
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AppPatch':
+        """Initialize a AppPatch object from a json dictionary."""
+        args = {}
+        if (image_port := _dict.get('image_port')) is not None:
+            args['image_port'] = image_port
+        if (image_reference := _dict.get('image_reference')) is not None:
+            args['image_reference'] = image_reference
+        if (image_secret := _dict.get('image_secret')) is not None:
+            args['image_secret'] = image_secret
+        if (managed_domain_mappings := _dict.get('managed_domain_mappings')) is not None:
+            args['managed_domain_mappings'] = managed_domain_mappings
+        if (probe_liveness := _dict.get('probe_liveness')) is not None:
+            args['probe_liveness'] = ProbePrototype.from_dict(probe_liveness)
+        if (probe_readiness := _dict.get('probe_readiness')) is not None:
+            args['probe_readiness'] = ProbePrototype.from_dict(probe_readiness)
+        if (run_arguments := _dict.get('run_arguments')) is not None:
+            args['run_arguments'] = run_arguments
+        if (run_as_user := _dict.get('run_as_user')) is not None:
+            args['run_as_user'] = run_as_user
+        if (run_commands := _dict.get('run_commands')) is not None:
+            args['run_commands'] = run_commands
+        if (run_compute_resource_token_enabled := _dict.get('run_compute_resource_token_enabled')) is not None:
+            args['run_compute_resource_token_enabled'] = run_compute_resource_token_enabled
+        if (run_env_variables := _dict.get('run_env_variables')) is not None:
+            args['run_env_variables'] = [EnvVarPrototype.from_dict(v) for v in run_env_variables]
+        if (run_service_account := _dict.get('run_service_account')) is not None:
+            args['run_service_account'] = run_service_account
+        if (run_volume_mounts := _dict.get('run_volume_mounts')) is not None:
+            args['run_volume_mounts'] = [VolumeMountPrototype.from_dict(v) for v in run_volume_mounts]
+        if (scale_concurrency := _dict.get('scale_concurrency')) is not None:
+            args['scale_concurrency'] = scale_concurrency
+        if (scale_concurrency_target := _dict.get('scale_concurrency_target')) is not None:
+            args['scale_concurrency_target'] = scale_concurrency_target
+        if (scale_cpu_limit := _dict.get('scale_cpu_limit')) is not None:
+            args['scale_cpu_limit'] = scale_cpu_limit
+        if (scale_down_delay := _dict.get('scale_down_delay')) is not None:
+            args['scale_down_delay'] = scale_down_delay
+        if (scale_ephemeral_storage_limit := _dict.get('scale_ephemeral_storage_limit')) is not None:
+            args['scale_ephemeral_storage_limit'] = scale_ephemeral_storage_limit
+        if (scale_initial_instances := _dict.get('scale_initial_instances')) is not None:
+            args['scale_initial_instances'] = scale_initial_instances
+        if (scale_max_instances := _dict.get('scale_max_instances')) is not None:
+            args['scale_max_instances'] = scale_max_instances
+        if (scale_memory_limit := _dict.get('scale_memory_limit')) is not None:
+            args['scale_memory_limit'] = scale_memory_limit
+        if (scale_min_instances := _dict.get('scale_min_instances')) is not None:
+            args['scale_min_instances'] = scale_min_instances
+        if (scale_request_timeout := _dict.get('scale_request_timeout')) is not None:
+            args['scale_request_timeout'] = scale_request_timeout
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AppPatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'image_port') and self.image_port is not None:
+            _dict['image_port'] = self.image_port
+        if hasattr(self, 'image_reference') and self.image_reference is not None:
+            _dict['image_reference'] = self.image_reference
+        if hasattr(self, 'image_secret') and self.image_secret is not None:
+            _dict['image_secret'] = self.image_secret
+        if hasattr(self, 'managed_domain_mappings') and self.managed_domain_mappings is not None:
+            _dict['managed_domain_mappings'] = self.managed_domain_mappings
+        if hasattr(self, 'probe_liveness') and self.probe_liveness is not None:
+            if isinstance(self.probe_liveness, dict):
+                _dict['probe_liveness'] = self.probe_liveness
+            else:
+                _dict['probe_liveness'] = self.probe_liveness.to_dict()
+        if hasattr(self, 'probe_readiness') and self.probe_readiness is not None:
+            if isinstance(self.probe_readiness, dict):
+                _dict['probe_readiness'] = self.probe_readiness
+            else:
+                _dict['probe_readiness'] = self.probe_readiness.to_dict()
+        if hasattr(self, 'run_arguments') and self.run_arguments is not None:
+            _dict['run_arguments'] = self.run_arguments
+        if hasattr(self, 'run_as_user') and self.run_as_user is not None:
+            _dict['run_as_user'] = self.run_as_user
+        if hasattr(self, 'run_commands') and self.run_commands is not None:
+            _dict['run_commands'] = self.run_commands
+        if hasattr(self, 'run_compute_resource_token_enabled') and self.run_compute_resource_token_enabled is not None:
+            _dict['run_compute_resource_token_enabled'] = self.run_compute_resource_token_enabled
+        if hasattr(self, 'run_env_variables') and self.run_env_variables is not None:
+            run_env_variables_list = []
+            for v in self.run_env_variables:
+                if isinstance(v, dict):
+                    run_env_variables_list.append(v)
+                else:
+                    run_env_variables_list.append(v.to_dict())
+            _dict['run_env_variables'] = run_env_variables_list
+        if hasattr(self, 'run_service_account') and self.run_service_account is not None:
+            _dict['run_service_account'] = self.run_service_account
+        if hasattr(self, 'run_volume_mounts') and self.run_volume_mounts is not None:
+            run_volume_mounts_list = []
+            for v in self.run_volume_mounts:
+                if isinstance(v, dict):
+                    run_volume_mounts_list.append(v)
+                else:
+                    run_volume_mounts_list.append(v.to_dict())
+            _dict['run_volume_mounts'] = run_volume_mounts_list
+        if hasattr(self, 'scale_concurrency') and self.scale_concurrency is not None:
+            _dict['scale_concurrency'] = self.scale_concurrency
+        if hasattr(self, 'scale_concurrency_target') and self.scale_concurrency_target is not None:
+            _dict['scale_concurrency_target'] = self.scale_concurrency_target
+        if hasattr(self, 'scale_cpu_limit') and self.scale_cpu_limit is not None:
+            _dict['scale_cpu_limit'] = self.scale_cpu_limit
+        if hasattr(self, 'scale_down_delay') and self.scale_down_delay is not None:
+            _dict['scale_down_delay'] = self.scale_down_delay
+        if hasattr(self, 'scale_ephemeral_storage_limit') and self.scale_ephemeral_storage_limit is not None:
+            _dict['scale_ephemeral_storage_limit'] = self.scale_ephemeral_storage_limit
+        if hasattr(self, 'scale_initial_instances') and self.scale_initial_instances is not None:
+            _dict['scale_initial_instances'] = self.scale_initial_instances
+        if hasattr(self, 'scale_max_instances') and self.scale_max_instances is not None:
+            _dict['scale_max_instances'] = self.scale_max_instances
+        if hasattr(self, 'scale_memory_limit') and self.scale_memory_limit is not None:
+            _dict['scale_memory_limit'] = self.scale_memory_limit
+        if hasattr(self, 'scale_min_instances') and self.scale_min_instances is not None:
+            _dict['scale_min_instances'] = self.scale_min_instances
+        if hasattr(self, 'scale_request_timeout') and self.scale_request_timeout is not None:
+            _dict['scale_request_timeout'] = self.scale_request_timeout
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AppPatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AppPatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AppPatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ManagedDomainMappingsEnum(str, Enum):
+        """
+        Optional value controlling which of the system managed domain mappings will be
+        setup for the application. Valid values are 'local_public', 'local_private' and
+        'local'. Visibility can only be 'local_private' if the project supports
+        application private visibility.
+        """
+
+        LOCAL = 'local'
+        LOCAL_PRIVATE = 'local_private'
+        LOCAL_PUBLIC = 'local_public'
+
+    class RunServiceAccountEnum(str, Enum):
+        """
+        Optional name of the service account. For built-in service accounts, you can use
+        the shortened names `manager` , `none`, `reader`, and `writer`.
+        """
+
+        DEFAULT = 'default'
+        MANAGER = 'manager'
+        READER = 'reader'
+        WRITER = 'writer'
+        NONE = 'none'
+
+
+class AppRevision:
+    """
+    AppRevision is the response model for app revision resources.
+
+    :param str app_name: (optional) Name of the associated app.
+    :param List[EnvVar] computed_env_variables: References to config maps, secrets
+          or literal values, which are defined and set by Code Engine and are exposed as
+          environment variables in the application.
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param str href: (optional) When you provision a new revision,  a URL is created
+          identifying the location of the instance.
+    :param str id: (optional) The identifier of the resource.
+    :param int image_port: (optional) Optional port the app listens on. While the
+          app will always be exposed via port `443` for end users, this port is used to
+          connect to the port that is exposed by the container image.
+    :param str image_reference: The name of the image that is used for this app. The
+          format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where `REGISTRY` and `TAG` are
+          optional. If `REGISTRY` is not specified, the default is `docker.io`. If `TAG`
+          is not specified, the default is `latest`. If the image reference points to a
+          registry that requires authentication, make sure to also specify the property
+          `image_secret`.
+    :param str image_secret: (optional) Optional name of the image registry access
+          secret. The image registry access secret is used to authenticate with a private
+          registry when you download the container image. If the image reference points to
+          a registry that requires authentication, the app will be created but cannot
+          reach the ready status, until this property is provided, too.
+    :param str name: (optional) The name of the app revision.
+    :param Probe probe_liveness: (optional) Response model for probes.
+    :param Probe probe_readiness: (optional) Response model for probes.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the app revision.
+    :param List[str] run_arguments: Optional arguments for the app that are passed
+          to start the container. If not specified an empty string array will be applied
+          and the arguments specified by the container image, will be used to start the
+          container.
+    :param int run_as_user: (optional) Optional user ID (UID) to run the app.
+    :param List[str] run_commands: Optional commands for the app that are passed to
+          start the container. If not specified an empty string array will be applied and
+          the command specified by the container image, will be used to start the
+          container.
+    :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+          enable the use of a compute resource token mounted to the container file system.
+    :param List[EnvVar] run_env_variables: References to config maps, secrets or
+          literal values, which are defined by the app owner and are exposed as
+          environment variables in the application.
+    :param str run_service_account: Optional name of the service account. For
+          built-in service accounts, you can use the shortened names `manager` , `none`,
+          `reader`, and `writer`.
+    :param List[VolumeMount] run_volume_mounts: Mounts of config maps or secrets.
+    :param int scale_concurrency: (optional) Optional maximum number of requests
+          that can be processed concurrently per instance.
+    :param int scale_concurrency_target: (optional) Optional threshold of concurrent
+          requests per instance at which one or more additional instances are created. Use
+          this value to scale up instances based on concurrent number of requests. This
+          option defaults to the value of the `scale_concurrency` option, if not
+          specified.
+    :param str scale_cpu_limit: Optional number of CPU set for the instance of the
+          app. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+    :param int scale_down_delay: (optional) Optional amount of time in seconds that
+          delays the scale-down behavior for an app instance.
+    :param str scale_ephemeral_storage_limit: Optional amount of ephemeral storage
+          to set for the instance of the app. The amount specified as ephemeral storage,
+          must not exceed the amount of `scale_memory_limit`. The units for specifying
+          ephemeral storage are Megabyte (M) or Gigabyte (G), whereas G and M are the
+          shorthand expressions for GB and MB. For more information see [Units of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_initial_instances: (optional) Optional initial number of
+          instances that are created upon app creation or app update.
+    :param int scale_max_instances: Optional maximum number of instances for this
+          app. If you set this value to `0`, this property does not set a upper scaling
+          limit. However, the app scaling is still limited by the project quota for
+          instances. See [Limits and quotas for Code
+          Engine](https://cloud.ibm.com/docs/codeengine?topic=codeengine-limits).
+    :param str scale_memory_limit: Optional amount of memory set for the instance of
+          the app. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+          The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_min_instances: Optional minimum number of instances for this
+          app. If you set this value to `0`, the app will scale down to zero, if not hit
+          by any request for some time.
+    :param int scale_request_timeout: Optional amount of time in seconds that is
+          allowed for a running app to respond to a request.
+    :param str status: (optional) The current status of the app revision.
+    :param AppRevisionStatus status_details: (optional) The detailed status of the
+          application revision.
+    """
+
+    def __init__(
+        self,
+        computed_env_variables: List['EnvVar'],
+        image_reference: str,
+        run_arguments: List[str],
+        run_commands: List[str],
+        run_env_variables: List['EnvVar'],
+        run_service_account: str,
+        run_volume_mounts: List['VolumeMount'],
+        scale_cpu_limit: str,
+        scale_ephemeral_storage_limit: str,
+        scale_max_instances: int,
+        scale_memory_limit: str,
+        scale_min_instances: int,
+        scale_request_timeout: int,
+        *,
+        app_name: Optional[str] = None,
+        created_at: Optional[str] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        image_port: Optional[int] = None,
+        image_secret: Optional[str] = None,
+        name: Optional[str] = None,
+        probe_liveness: Optional['Probe'] = None,
+        probe_readiness: Optional['Probe'] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        run_as_user: Optional[int] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        scale_concurrency: Optional[int] = None,
+        scale_concurrency_target: Optional[int] = None,
+        scale_down_delay: Optional[int] = None,
+        scale_initial_instances: Optional[int] = None,
+        status: Optional[str] = None,
+        status_details: Optional['AppRevisionStatus'] = None,
+    ) -> None:
+        """
+        Initialize a AppRevision object.
+
+        :param List[EnvVar] computed_env_variables: References to config maps,
+               secrets or literal values, which are defined and set by Code Engine and are
+               exposed as environment variables in the application.
+        :param str image_reference: The name of the image that is used for this
+               app. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where `REGISTRY` and
+               `TAG` are optional. If `REGISTRY` is not specified, the default is
+               `docker.io`. If `TAG` is not specified, the default is `latest`. If the
+               image reference points to a registry that requires authentication, make
+               sure to also specify the property `image_secret`.
+        :param List[str] run_arguments: Optional arguments for the app that are
+               passed to start the container. If not specified an empty string array will
+               be applied and the arguments specified by the container image, will be used
+               to start the container.
+        :param List[str] run_commands: Optional commands for the app that are
+               passed to start the container. If not specified an empty string array will
+               be applied and the command specified by the container image, will be used
+               to start the container.
+        :param List[EnvVar] run_env_variables: References to config maps, secrets
+               or literal values, which are defined by the app owner and are exposed as
+               environment variables in the application.
+        :param str run_service_account: Optional name of the service account. For
+               built-in service accounts, you can use the shortened names `manager` ,
+               `none`, `reader`, and `writer`.
+        :param List[VolumeMount] run_volume_mounts: Mounts of config maps or
+               secrets.
+        :param str scale_cpu_limit: Optional number of CPU set for the instance of
+               the app. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param str scale_ephemeral_storage_limit: Optional amount of ephemeral
+               storage to set for the instance of the app. The amount specified as
+               ephemeral storage, must not exceed the amount of `scale_memory_limit`. The
+               units for specifying ephemeral storage are Megabyte (M) or Gigabyte (G),
+               whereas G and M are the shorthand expressions for GB and MB. For more
+               information see [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_max_instances: Optional maximum number of instances for
+               this app. If you set this value to `0`, this property does not set a upper
+               scaling limit. However, the app scaling is still limited by the project
+               quota for instances. See [Limits and quotas for Code
+               Engine](https://cloud.ibm.com/docs/codeengine?topic=codeengine-limits).
+        :param str scale_memory_limit: Optional amount of memory set for the
+               instance of the app. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_min_instances: Optional minimum number of instances for
+               this app. If you set this value to `0`, the app will scale down to zero, if
+               not hit by any request for some time.
+        :param int scale_request_timeout: Optional amount of time in seconds that
+               is allowed for a running app to respond to a request.
+        :param str app_name: (optional) Name of the associated app.
+        :param int image_port: (optional) Optional port the app listens on. While
+               the app will always be exposed via port `443` for end users, this port is
+               used to connect to the port that is exposed by the container image.
+        :param str image_secret: (optional) Optional name of the image registry
+               access secret. The image registry access secret is used to authenticate
+               with a private registry when you download the container image. If the image
+               reference points to a registry that requires authentication, the app will
+               be created but cannot reach the ready status, until this property is
+               provided, too.
+        :param Probe probe_liveness: (optional) Response model for probes.
+        :param Probe probe_readiness: (optional) Response model for probes.
+        :param int run_as_user: (optional) Optional user ID (UID) to run the app.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        :param int scale_concurrency: (optional) Optional maximum number of
+               requests that can be processed concurrently per instance.
+        :param int scale_concurrency_target: (optional) Optional threshold of
+               concurrent requests per instance at which one or more additional instances
+               are created. Use this value to scale up instances based on concurrent
+               number of requests. This option defaults to the value of the
+               `scale_concurrency` option, if not specified.
+        :param int scale_down_delay: (optional) Optional amount of time in seconds
+               that delays the scale-down behavior for an app instance.
+        :param int scale_initial_instances: (optional) Optional initial number of
+               instances that are created upon app creation or app update.
+        :param AppRevisionStatus status_details: (optional) The detailed status of
+               the application revision.
+        """
+        self.app_name = app_name
+        self.computed_env_variables = computed_env_variables
+        self.created_at = created_at
+        self.href = href
+        self.id = id
+        self.image_port = image_port
+        self.image_reference = image_reference
+        self.image_secret = image_secret
+        self.name = name
+        self.probe_liveness = probe_liveness
+        self.probe_readiness = probe_readiness
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+        self.run_arguments = run_arguments
+        self.run_as_user = run_as_user
+        self.run_commands = run_commands
+        self.run_compute_resource_token_enabled = run_compute_resource_token_enabled
+        self.run_env_variables = run_env_variables
+        self.run_service_account = run_service_account
+        self.run_volume_mounts = run_volume_mounts
+        self.scale_concurrency = scale_concurrency
+        self.scale_concurrency_target = scale_concurrency_target
+        self.scale_cpu_limit = scale_cpu_limit
+        self.scale_down_delay = scale_down_delay
+        self.scale_ephemeral_storage_limit = scale_ephemeral_storage_limit
+        self.scale_initial_instances = scale_initial_instances
+        self.scale_max_instances = scale_max_instances
+        self.scale_memory_limit = scale_memory_limit
+        self.scale_min_instances = scale_min_instances
+        self.scale_request_timeout = scale_request_timeout
+        self.status = status
+        self.status_details = status_details
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AppRevision':
+        """Initialize a AppRevision object from a json dictionary."""
+        args = {}
+        if (app_name := _dict.get('app_name')) is not None:
+            args['app_name'] = app_name
+        if (computed_env_variables := _dict.get('computed_env_variables')) is not None:
+            args['computed_env_variables'] = [EnvVar.from_dict(v) for v in computed_env_variables]
+        else:
+            raise ValueError('Required property \'computed_env_variables\' not present in AppRevision JSON')
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (image_port := _dict.get('image_port')) is not None:
+            args['image_port'] = image_port
+        if (image_reference := _dict.get('image_reference')) is not None:
+            args['image_reference'] = image_reference
+        else:
+            raise ValueError('Required property \'image_reference\' not present in AppRevision JSON')
+        if (image_secret := _dict.get('image_secret')) is not None:
+            args['image_secret'] = image_secret
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (probe_liveness := _dict.get('probe_liveness')) is not None:
+            args['probe_liveness'] = Probe.from_dict(probe_liveness)
+        if (probe_readiness := _dict.get('probe_readiness')) is not None:
+            args['probe_readiness'] = Probe.from_dict(probe_readiness)
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (run_arguments := _dict.get('run_arguments')) is not None:
+            args['run_arguments'] = run_arguments
+        else:
+            raise ValueError('Required property \'run_arguments\' not present in AppRevision JSON')
+        if (run_as_user := _dict.get('run_as_user')) is not None:
+            args['run_as_user'] = run_as_user
+        if (run_commands := _dict.get('run_commands')) is not None:
+            args['run_commands'] = run_commands
+        else:
+            raise ValueError('Required property \'run_commands\' not present in AppRevision JSON')
+        if (run_compute_resource_token_enabled := _dict.get('run_compute_resource_token_enabled')) is not None:
+            args['run_compute_resource_token_enabled'] = run_compute_resource_token_enabled
+        if (run_env_variables := _dict.get('run_env_variables')) is not None:
+            args['run_env_variables'] = [EnvVar.from_dict(v) for v in run_env_variables]
+        else:
+            raise ValueError('Required property \'run_env_variables\' not present in AppRevision JSON')
+        if (run_service_account := _dict.get('run_service_account')) is not None:
+            args['run_service_account'] = run_service_account
+        else:
+            raise ValueError('Required property \'run_service_account\' not present in AppRevision JSON')
+        if (run_volume_mounts := _dict.get('run_volume_mounts')) is not None:
+            args['run_volume_mounts'] = [VolumeMount.from_dict(v) for v in run_volume_mounts]
+        else:
+            raise ValueError('Required property \'run_volume_mounts\' not present in AppRevision JSON')
+        if (scale_concurrency := _dict.get('scale_concurrency')) is not None:
+            args['scale_concurrency'] = scale_concurrency
+        if (scale_concurrency_target := _dict.get('scale_concurrency_target')) is not None:
+            args['scale_concurrency_target'] = scale_concurrency_target
+        if (scale_cpu_limit := _dict.get('scale_cpu_limit')) is not None:
+            args['scale_cpu_limit'] = scale_cpu_limit
+        else:
+            raise ValueError('Required property \'scale_cpu_limit\' not present in AppRevision JSON')
+        if (scale_down_delay := _dict.get('scale_down_delay')) is not None:
+            args['scale_down_delay'] = scale_down_delay
+        if (scale_ephemeral_storage_limit := _dict.get('scale_ephemeral_storage_limit')) is not None:
+            args['scale_ephemeral_storage_limit'] = scale_ephemeral_storage_limit
+        else:
+            raise ValueError('Required property \'scale_ephemeral_storage_limit\' not present in AppRevision JSON')
+        if (scale_initial_instances := _dict.get('scale_initial_instances')) is not None:
+            args['scale_initial_instances'] = scale_initial_instances
+        if (scale_max_instances := _dict.get('scale_max_instances')) is not None:
+            args['scale_max_instances'] = scale_max_instances
+        else:
+            raise ValueError('Required property \'scale_max_instances\' not present in AppRevision JSON')
+        if (scale_memory_limit := _dict.get('scale_memory_limit')) is not None:
+            args['scale_memory_limit'] = scale_memory_limit
+        else:
+            raise ValueError('Required property \'scale_memory_limit\' not present in AppRevision JSON')
+        if (scale_min_instances := _dict.get('scale_min_instances')) is not None:
+            args['scale_min_instances'] = scale_min_instances
+        else:
+            raise ValueError('Required property \'scale_min_instances\' not present in AppRevision JSON')
+        if (scale_request_timeout := _dict.get('scale_request_timeout')) is not None:
+            args['scale_request_timeout'] = scale_request_timeout
+        else:
+            raise ValueError('Required property \'scale_request_timeout\' not present in AppRevision JSON')
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_details := _dict.get('status_details')) is not None:
+            args['status_details'] = AppRevisionStatus.from_dict(status_details)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AppRevision object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'app_name') and self.app_name is not None:
+            _dict['app_name'] = self.app_name
+        if hasattr(self, 'computed_env_variables') and self.computed_env_variables is not None:
+            computed_env_variables_list = []
+            for v in self.computed_env_variables:
+                if isinstance(v, dict):
+                    computed_env_variables_list.append(v)
+                else:
+                    computed_env_variables_list.append(v.to_dict())
+            _dict['computed_env_variables'] = computed_env_variables_list
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'image_port') and self.image_port is not None:
+            _dict['image_port'] = self.image_port
+        if hasattr(self, 'image_reference') and self.image_reference is not None:
+            _dict['image_reference'] = self.image_reference
+        if hasattr(self, 'image_secret') and self.image_secret is not None:
+            _dict['image_secret'] = self.image_secret
+        if hasattr(self, 'name') and getattr(self, 'name') is not None:
+            _dict['name'] = getattr(self, 'name')
+        if hasattr(self, 'probe_liveness') and self.probe_liveness is not None:
+            if isinstance(self.probe_liveness, dict):
+                _dict['probe_liveness'] = self.probe_liveness
+            else:
+                _dict['probe_liveness'] = self.probe_liveness.to_dict()
+        if hasattr(self, 'probe_readiness') and self.probe_readiness is not None:
+            if isinstance(self.probe_readiness, dict):
+                _dict['probe_readiness'] = self.probe_readiness
+            else:
+                _dict['probe_readiness'] = self.probe_readiness.to_dict()
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'run_arguments') and self.run_arguments is not None:
+            _dict['run_arguments'] = self.run_arguments
+        if hasattr(self, 'run_as_user') and self.run_as_user is not None:
+            _dict['run_as_user'] = self.run_as_user
+        if hasattr(self, 'run_commands') and self.run_commands is not None:
+            _dict['run_commands'] = self.run_commands
+        if hasattr(self, 'run_compute_resource_token_enabled') and self.run_compute_resource_token_enabled is not None:
+            _dict['run_compute_resource_token_enabled'] = self.run_compute_resource_token_enabled
+        if hasattr(self, 'run_env_variables') and self.run_env_variables is not None:
+            run_env_variables_list = []
+            for v in self.run_env_variables:
+                if isinstance(v, dict):
+                    run_env_variables_list.append(v)
+                else:
+                    run_env_variables_list.append(v.to_dict())
+            _dict['run_env_variables'] = run_env_variables_list
+        if hasattr(self, 'run_service_account') and self.run_service_account is not None:
+            _dict['run_service_account'] = self.run_service_account
+        if hasattr(self, 'run_volume_mounts') and self.run_volume_mounts is not None:
+            run_volume_mounts_list = []
+            for v in self.run_volume_mounts:
+                if isinstance(v, dict):
+                    run_volume_mounts_list.append(v)
+                else:
+                    run_volume_mounts_list.append(v.to_dict())
+            _dict['run_volume_mounts'] = run_volume_mounts_list
+        if hasattr(self, 'scale_concurrency') and self.scale_concurrency is not None:
+            _dict['scale_concurrency'] = self.scale_concurrency
+        if hasattr(self, 'scale_concurrency_target') and self.scale_concurrency_target is not None:
+            _dict['scale_concurrency_target'] = self.scale_concurrency_target
+        if hasattr(self, 'scale_cpu_limit') and self.scale_cpu_limit is not None:
+            _dict['scale_cpu_limit'] = self.scale_cpu_limit
+        if hasattr(self, 'scale_down_delay') and self.scale_down_delay is not None:
+            _dict['scale_down_delay'] = self.scale_down_delay
+        if hasattr(self, 'scale_ephemeral_storage_limit') and self.scale_ephemeral_storage_limit is not None:
+            _dict['scale_ephemeral_storage_limit'] = self.scale_ephemeral_storage_limit
+        if hasattr(self, 'scale_initial_instances') and self.scale_initial_instances is not None:
+            _dict['scale_initial_instances'] = self.scale_initial_instances
+        if hasattr(self, 'scale_max_instances') and self.scale_max_instances is not None:
+            _dict['scale_max_instances'] = self.scale_max_instances
+        if hasattr(self, 'scale_memory_limit') and self.scale_memory_limit is not None:
+            _dict['scale_memory_limit'] = self.scale_memory_limit
+        if hasattr(self, 'scale_min_instances') and self.scale_min_instances is not None:
+            _dict['scale_min_instances'] = self.scale_min_instances
+        if hasattr(self, 'scale_request_timeout') and self.scale_request_timeout is not None:
+            _dict['scale_request_timeout'] = self.scale_request_timeout
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        if hasattr(self, 'status_details') and self.status_details is not None:
+            if isinstance(self.status_details, dict):
+                _dict['status_details'] = self.status_details
+            else:
+                _dict['status_details'] = self.status_details.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AppRevision object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AppRevision') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AppRevision') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the app revision.
+        """
+
+        APP_REVISION_V2 = 'app_revision_v2'
+
+    class RunServiceAccountEnum(str, Enum):
+        """
+        Optional name of the service account. For built-in service accounts, you can use
+        the shortened names `manager` , `none`, `reader`, and `writer`.
+        """
+
+        DEFAULT = 'default'
+        MANAGER = 'manager'
+        READER = 'reader'
+        WRITER = 'writer'
+        NONE = 'none'
+
+    class StatusEnum(str, Enum):
+        """
+        The current status of the app revision.
+        """
+
+        READY = 'ready'
+        LOADING = 'loading'
+        WARNING = 'warning'
+        FAILED = 'failed'
+
+
+class AppRevisionList:
+    """
+    Contains a list of app revisions and pagination information.
+
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    :param List[AppRevision] revisions: List of all app revisions.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        revisions: List['AppRevision'],
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a AppRevisionList object.
+
+        :param int limit: Maximum number of resources per page.
+        :param List[AppRevision] revisions: List of all app revisions.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.first = first
+        self.limit = limit
+        self.next = next
+        self.revisions = revisions
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AppRevisionList':
+        """Initialize a AppRevisionList object from a json dictionary."""
+        args = {}
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in AppRevisionList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        if (revisions := _dict.get('revisions')) is not None:
+            args['revisions'] = [AppRevision.from_dict(v) for v in revisions]
+        else:
+            raise ValueError('Required property \'revisions\' not present in AppRevisionList JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AppRevisionList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        if hasattr(self, 'revisions') and self.revisions is not None:
+            revisions_list = []
+            for v in self.revisions:
+                if isinstance(v, dict):
+                    revisions_list.append(v)
+                else:
+                    revisions_list.append(v.to_dict())
+            _dict['revisions'] = revisions_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AppRevisionList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AppRevisionList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AppRevisionList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class AppRevisionStatus:
+    """
+    The detailed status of the application revision.
+
+    :param int actual_instances: (optional) The number of running instances of the
+          revision.
+    :param str reason: (optional) Optional information to provide more context in
+          case of a 'failed' or 'warning' status.
+    """
+
+    def __init__(
+        self,
+        *,
+        actual_instances: Optional[int] = None,
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a AppRevisionStatus object.
+
+        """
+        self.actual_instances = actual_instances
+        self.reason = reason
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AppRevisionStatus':
+        """Initialize a AppRevisionStatus object from a json dictionary."""
+        args = {}
+        if (actual_instances := _dict.get('actual_instances')) is not None:
+            args['actual_instances'] = actual_instances
+        if (reason := _dict.get('reason')) is not None:
+            args['reason'] = reason
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AppRevisionStatus object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'actual_instances') and getattr(self, 'actual_instances') is not None:
+            _dict['actual_instances'] = getattr(self, 'actual_instances')
+        if hasattr(self, 'reason') and getattr(self, 'reason') is not None:
+            _dict['reason'] = getattr(self, 'reason')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AppRevisionStatus object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AppRevisionStatus') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AppRevisionStatus') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ReasonEnum(str, Enum):
+        """
+        Optional information to provide more context in case of a 'failed' or 'warning'
+        status.
+        """
+
+        READY = 'ready'
+        WAITING = 'waiting'
+        DEPLOYING = 'deploying'
+        DEPLOYING_WAITING_FOR_RESOURCES = 'deploying_waiting_for_resources'
+        INITIAL_SCALE_NEVER_ACHIEVED = 'initial_scale_never_achieved'
+        FETCH_IMAGE_FAILED_UNKNOWN_MANIFEST = 'fetch_image_failed_unknown_manifest'
+        FETCH_IMAGE_FAILED_UNKNOWN_REPOSITORY = 'fetch_image_failed_unknown_repository'
+        FETCH_IMAGE_FAILED_REGISTRY_NOT_FOUND = 'fetch_image_failed_registry_not_found'
+        FETCH_IMAGE_FAILED_MISSING_PULL_SECRET = 'fetch_image_failed_missing_pull_secret'
+        FETCH_IMAGE_FAILED_WRONG_PULL_CREDENTIALS = 'fetch_image_failed_wrong_pull_credentials'
+        FETCH_IMAGE_FAILED_MISSING_PULL_CREDENTIALS = 'fetch_image_failed_missing_pull_credentials'
+        CONTAINER_FAILED_EXIT_CODE_0 = 'container_failed_exit_code_0'
+        CONTAINER_FAILED_EXIT_CODE_1 = 'container_failed_exit_code_1'
+        CONTAINER_FAILED_EXIT_CODE_139 = 'container_failed_exit_code_139'
+        CONTAINER_FAILED_EXIT_CODE_24 = 'container_failed_exit_code_24'
+        IMAGE_PULL_BACK_OFF = 'image_pull_back_off'
+        INVALID_TAR_HEADER_IMAGE_PULL_ERR = 'invalid_tar_header_image_pull_err'
+
+
+class AppStatus:
+    """
+    The detailed status of the application.
+
+    :param str latest_created_revision: (optional) Latest app revision that has been
+          created.
+    :param str latest_ready_revision: (optional) Latest app revision that reached a
+          ready state.
+    :param str reason: (optional) Optional information to provide more context in
+          case of a 'failed' or 'warning' status.
+    """
+
+    def __init__(
+        self,
+        *,
+        latest_created_revision: Optional[str] = None,
+        latest_ready_revision: Optional[str] = None,
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a AppStatus object.
+
+        """
+        self.latest_created_revision = latest_created_revision
+        self.latest_ready_revision = latest_ready_revision
+        self.reason = reason
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'AppStatus':
+        """Initialize a AppStatus object from a json dictionary."""
+        args = {}
+        if (latest_created_revision := _dict.get('latest_created_revision')) is not None:
+            args['latest_created_revision'] = latest_created_revision
+        if (latest_ready_revision := _dict.get('latest_ready_revision')) is not None:
+            args['latest_ready_revision'] = latest_ready_revision
+        if (reason := _dict.get('reason')) is not None:
+            args['reason'] = reason
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a AppStatus object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'latest_created_revision') and getattr(self, 'latest_created_revision') is not None:
+            _dict['latest_created_revision'] = getattr(self, 'latest_created_revision')
+        if hasattr(self, 'latest_ready_revision') and getattr(self, 'latest_ready_revision') is not None:
+            _dict['latest_ready_revision'] = getattr(self, 'latest_ready_revision')
+        if hasattr(self, 'reason') and getattr(self, 'reason') is not None:
+            _dict['reason'] = getattr(self, 'reason')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this AppStatus object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'AppStatus') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'AppStatus') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ReasonEnum(str, Enum):
+        """
+        Optional information to provide more context in case of a 'failed' or 'warning'
+        status.
+        """
+
+        READY = 'ready'
+        DEPLOYING = 'deploying'
+        WAITING_FOR_RESOURCES = 'waiting_for_resources'
+        NO_REVISION_READY = 'no_revision_ready'
+        READY_BUT_LATEST_REVISION_FAILED = 'ready_but_latest_revision_failed'
+
+
+class ContainerStatus:
+    """
+    The status of a container.
+
+    :param ContainerStatusDetails current_state: (optional) Details of the observed
+          container status.
+    :param ContainerStatusDetails last_observed_state: (optional) Details of the
+          observed container status.
+    """
+
+    def __init__(
+        self,
+        *,
+        current_state: Optional['ContainerStatusDetails'] = None,
+        last_observed_state: Optional['ContainerStatusDetails'] = None,
+    ) -> None:
+        """
+        Initialize a ContainerStatus object.
+
+        :param ContainerStatusDetails current_state: (optional) Details of the
+               observed container status.
+        :param ContainerStatusDetails last_observed_state: (optional) Details of
+               the observed container status.
+        """
+        self.current_state = current_state
+        self.last_observed_state = last_observed_state
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ContainerStatus':
+        """Initialize a ContainerStatus object from a json dictionary."""
+        args = {}
+        if (current_state := _dict.get('current_state')) is not None:
+            args['current_state'] = ContainerStatusDetails.from_dict(current_state)
+        if (last_observed_state := _dict.get('last_observed_state')) is not None:
+            args['last_observed_state'] = ContainerStatusDetails.from_dict(last_observed_state)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ContainerStatus object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'current_state') and self.current_state is not None:
+            if isinstance(self.current_state, dict):
+                _dict['current_state'] = self.current_state
+            else:
+                _dict['current_state'] = self.current_state.to_dict()
+        if hasattr(self, 'last_observed_state') and self.last_observed_state is not None:
+            if isinstance(self.last_observed_state, dict):
+                _dict['last_observed_state'] = self.last_observed_state
+            else:
+                _dict['last_observed_state'] = self.last_observed_state.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ContainerStatus object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ContainerStatus') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ContainerStatus') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ContainerStatusDetails:
+    """
+    Details of the observed container status.
+
+    :param str completed_at: (optional) The time the container terminated. Only
+          populated in an observed failure state.
+    :param str container_status: (optional) The status of the container.
+    :param int exit_code: (optional) The exit code of the last termination of the
+          container. Only populated in an observed failure state.
+    :param str reason: (optional) The reason the container is not yet running or has
+          failed. Only populated in non-running states.
+    :param str started_at: (optional) The time the container started.
+    """
+
+    def __init__(
+        self,
+        *,
+        completed_at: Optional[str] = None,
+        container_status: Optional[str] = None,
+        exit_code: Optional[int] = None,
+        reason: Optional[str] = None,
+        started_at: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ContainerStatusDetails object.
+
+        """
+        self.completed_at = completed_at
+        self.container_status = container_status
+        self.exit_code = exit_code
+        self.reason = reason
+        self.started_at = started_at
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ContainerStatusDetails':
+        """Initialize a ContainerStatusDetails object from a json dictionary."""
+        args = {}
+        if (completed_at := _dict.get('completed_at')) is not None:
+            args['completed_at'] = completed_at
+        if (container_status := _dict.get('container_status')) is not None:
+            args['container_status'] = container_status
+        if (exit_code := _dict.get('exit_code')) is not None:
+            args['exit_code'] = exit_code
+        if (reason := _dict.get('reason')) is not None:
+            args['reason'] = reason
+        if (started_at := _dict.get('started_at')) is not None:
+            args['started_at'] = started_at
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ContainerStatusDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'completed_at') and getattr(self, 'completed_at') is not None:
+            _dict['completed_at'] = getattr(self, 'completed_at')
+        if hasattr(self, 'container_status') and getattr(self, 'container_status') is not None:
+            _dict['container_status'] = getattr(self, 'container_status')
+        if hasattr(self, 'exit_code') and getattr(self, 'exit_code') is not None:
+            _dict['exit_code'] = getattr(self, 'exit_code')
+        if hasattr(self, 'reason') and getattr(self, 'reason') is not None:
+            _dict['reason'] = getattr(self, 'reason')
+        if hasattr(self, 'started_at') and getattr(self, 'started_at') is not None:
+            _dict['started_at'] = getattr(self, 'started_at')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ContainerStatusDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ContainerStatusDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ContainerStatusDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ContainerStatusEnum(str, Enum):
+        """
+        The status of the container.
+        """
+
+        RUNNING = 'running'
+        PENDING = 'pending'
+        TERMINATED = 'terminated'
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'App': (
+        ModelField('build'),
+        ModelField('build_run'),
+        ModelField('computed_env_variables', 'list', 'EnvVar', required=True),
+        ModelField('created_at'),
+        ModelField('endpoint'),
+        ModelField('endpoint_internal'),
+        ModelField('entity_tag', required=True),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('image_port'),
+        ModelField('image_reference', required=True),
+        ModelField('image_secret'),
+        ModelField('managed_domain_mappings', required=True),
+        ModelField('name', required=True),
+        ModelField('probe_liveness', 'model', 'Probe'),
+        ModelField('probe_readiness', 'model', 'Probe'),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+        ModelField('run_arguments', required=True),
+        ModelField('run_as_user'),
+        ModelField('run_commands', required=True),
+        ModelField('run_compute_resource_token_enabled'),
+        ModelField('run_env_variables', 'list', 'EnvVar', required=True),
+        ModelField('run_service_account', required=True),
+        ModelField('run_volume_mounts', 'list', 'VolumeMount', required=True),
+        ModelField('scale_concurrency'),
+        ModelField('scale_concurrency_target'),
+        ModelField('scale_cpu_limit', required=True),
+        ModelField('scale_down_delay'),
+        ModelField('scale_ephemeral_storage_limit', required=True),
+        ModelField('scale_initial_instances'),
+        ModelField('scale_max_instances', required=True),
+        ModelField('scale_memory_limit', required=True),
+        ModelField('scale_min_instances', required=True),
+        ModelField('scale_request_timeout', required=True),
+        ModelField('status'),
+        ModelField('status_details', 'model', 'AppStatus'),
+    ),
+    'AppInstance': (
+        ModelField('app_name', required=True),
+        ModelField('created_at'),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('name'),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+        ModelField('revision_name', required=True),
+        ModelField('scale_cpu_limit', required=True),
+        ModelField('scale_ephemeral_storage_limit', required=True),
+        ModelField('scale_memory_limit', required=True),
+        ModelField('status'),
+        ModelField('status_details', 'model', 'AppInstanceStatusDetails'),
+    ),
+    'AppInstanceList': (
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('instances', 'list', 'AppInstance', required=True),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+    ),
+    'AppInstanceStatusDetails': (
+        ModelField('restarts'),
+        ModelField('system_container', 'model', 'ContainerStatus'),
+        ModelField('user_container', 'model', 'ContainerStatus'),
+    ),
+    'AppList': (
+        ModelField('apps', 'list', 'App', required=True),
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+    ),
+    'AppPatch': (
+        ModelField('image_port'),
+        ModelField('image_reference'),
+        ModelField('image_secret'),
+        ModelField('managed_domain_mappings'),
+        ModelField('probe_liveness', 'model', 'ProbePrototype'),
+        ModelField('probe_readiness', 'model', 'ProbePrototype'),
+        ModelField('run_arguments'),
+        ModelField('run_as_user'),
+        ModelField('run_commands'),
+        ModelField('run_compute_resource_token_enabled'),
+        ModelField('run_env_variables', 'list', 'EnvVarPrototype'),
+        ModelField('run_service_account'),
+        ModelField('run_volume_mounts', 'list', 'VolumeMountPrototype'),
+        ModelField('scale_concurrency'),
+        ModelField('scale_concurrency_target'),
+        ModelField('scale_cpu_limit'),
+        ModelField('scale_down_delay'),
+        ModelField('scale_ephemeral_storage_limit'),
+        ModelField('scale_initial_instances'),
+        ModelField('scale_max_instances'),
+        ModelField('scale_memory_limit'),
+        ModelField('scale_min_instances'),
+        ModelField('scale_request_timeout'),
+    ),
+    'AppRevision': (
+        ModelField('app_name'),
+        ModelField('computed_env_variables', 'list', 'EnvVar', required=True),
+        ModelField('created_at'),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('image_port'),
+        ModelField('image_reference', required=True),
+        ModelField('image_secret'),
+        ModelField('name'),
+        ModelField('probe_liveness', 'model', 'Probe'),
+        ModelField('probe_readiness', 'model', 'Probe'),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+        ModelField('run_arguments', required=True),
+        ModelField('run_as_user'),
+        ModelField('run_commands', required=True),
+        ModelField('run_compute_resource_token_enabled'),
+        ModelField('run_env_variables', 'list', 'EnvVar', required=True),
+        ModelField('run_service_account', required=True),
+        ModelField('run_volume_mounts', 'list', 'VolumeMount', required=True),
+        ModelField('scale_concurrency'),
+        ModelField('scale_concurrency_target'),
+        ModelField('scale_cpu_limit', required=True),
+        ModelField('scale_down_delay'),
+        ModelField('scale_ephemeral_storage_limit', required=True),
+        ModelField('scale_initial_instances'),
+        ModelField('scale_max_instances', required=True),
+        ModelField('scale_memory_limit', required=True),
+        ModelField('scale_min_instances', required=True),
+        ModelField('scale_request_timeout', required=True),
+        ModelField('status'),
+        ModelField('status_details', 'model', 'AppRevisionStatus'),
+    ),
+    'AppRevisionList': (
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+        ModelField('revisions', 'list', 'AppRevision', required=True),
+    ),
+    'AppRevisionStatus': (
+        ModelField('actual_instances'),
+        ModelField('reason'),
+    ),
+    'AppStatus': (
+        ModelField('latest_created_revision'),
+        ModelField('latest_ready_revision'),
+        ModelField('reason'),
+    ),
+    'ContainerStatus': (
+        ModelField('current_state', 'model', 'ContainerStatusDetails'),
+        ModelField('last_observed_state', 'model', 'ContainerStatusDetails'),
+    ),
+    'ContainerStatusDetails': (
+        ModelField('completed_at'),
+        ModelField('container_status'),
+        ModelField('exit_code'),
+        ModelField('reason'),
+        ModelField('started_at'),
+    ),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
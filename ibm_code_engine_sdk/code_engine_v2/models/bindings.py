@@ -0,0 +1,293 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models of service bindings.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+from .common import ComponentRef, ListFirstMetadata, ListNextMetadata
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class Binding:
+    """
+    Describes the model of a binding.
+
+    :param ComponentRef component: A reference to another component.
+    :param str href: (optional) When you provision a new binding,  a URL is created
+          identifying the location of the instance.
+    :param str id: (optional) The ID of the binding.
+    :param str prefix: The value that is set as a prefix in the component that is
+          bound.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str resource_type: (optional) The type of the binding.
+    :param str secret_name: The service access secret that is bound to a component.
+    :param str status: (optional) The current status of the binding.
+    """
+
+    def __init__(
+        self,
+        component: 'ComponentRef',
+        prefix: str,
+        secret_name: str,
+        *,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a Binding object.
+
+        :param ComponentRef component: A reference to another component.
+        :param str prefix: The value that is set as a prefix in the component that
+               is bound.
+        :param str secret_name: The service access secret that is bound to a
+               component.
+        """
+        self.component = component
+        self.href = href
+        self.id = id
+        self.prefix = prefix
+        self.project_id = project_id
+        self.resource_type = resource_type
+        self.secret_name = secret_name
+        self.status = status
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Binding':
+        """Initialize a Binding object from a json dictionary."""
+        args = {}
+        if (component := _dict.get('component')) is not None:
+            args['component'] = ComponentRef.from_dict(component)
+        else:
+            raise ValueError('Required property \'component\' not present in Binding JSON')
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (prefix := _dict.get('prefix')) is not None:
+            args['prefix'] = prefix
+        else:
+            raise ValueError('Required property \'prefix\' not present in Binding JSON')
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (secret_name := _dict.get('secret_name')) is not None:
+            args['secret_name'] = secret_name
+        else:
+            raise ValueError('Required property \'secret_name\' not present in Binding JSON')
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Binding object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'component') and self.component is not None:
+            if isinstance(self.component, dict):
+                _dict['component'] = self.component
+            else:
+                _dict['component'] = self.component.to_dict()
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'prefix') and self.prefix is not None:
+            _dict['prefix'] = self.prefix
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'secret_name') and self.secret_name is not None:
+            _dict['secret_name'] = self.secret_name
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Binding object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Binding') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Binding') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the binding.
+        """
+
+        BINDING_V2 = 'binding_v2'
+
+
+class BindingList:
+    """
+    Contains a list of bindings and pagination information.
+
+    :param List[Binding] bindings: List of all bindings.
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    """
+
+    def __init__(
+        self,
+        bindings: List['Binding'],
+        limit: int,
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a BindingList object.
+
+        :param List[Binding] bindings: List of all bindings.
+        :param int limit: Maximum number of resources per page.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.bindings = bindings
+        self.first = first
+        self.limit = limit
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BindingList':
+        """Initialize a BindingList object from a json dictionary."""
+        args = {}
+        if (bindings := _dict.get('bindings')) is not None:
+            args['bindings'] = [Binding.from_dict(v) for v in bindings]
+        else:
+            raise ValueError('Required property \'bindings\' not present in BindingList JSON')
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in BindingList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BindingList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'bindings') and self.bindings is not None:
+            bindings_list = []
+            for v in self.bindings:
+                if isinstance(v, dict):
+                    bindings_list.append(v)
+                else:
+                    bindings_list.append(v.to_dict())
+            _dict['bindings'] = bindings_list
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BindingList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BindingList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BindingList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'Binding': (
+        ModelField('component', 'model', 'ComponentRef', required=True),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('prefix', required=True),
+        ModelField('project_id'),
+        ModelField('resource_type'),
+        ModelField('secret_name', required=True),
+        ModelField('status'),
+    ),
+    'BindingList': (
+        ModelField('bindings', 'list', 'Binding', required=True),
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+    ),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
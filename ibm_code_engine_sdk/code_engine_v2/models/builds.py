@@ -0,0 +1,1723 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models of builds and build runs.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+from .common import ListFirstMetadata, ListNextMetadata
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class Build:
+    """
+    Response model for build definitions.
+
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param str entity_tag: The version of the build instance, which is used to
+          achieve optimistic locking.
+    :param str href: (optional) When you provision a new build,  a URL is created
+          identifying the location of the instance.
+    :param str id: (optional) The identifier of the resource.
+    :param str name: (optional) The name of the build.
+    :param str output_image: The name of the image.
+    :param str output_secret: The secret that is required to access the image
+          registry. Make sure that the secret is granted with push permissions towards the
+          specified container registry namespace.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the build.
+    :param List[BuildParam] run_build_params: References to config maps and secret
+          keys, or literal values, which are defined by the build owner and are exposed as
+          build arguments in Docker files.
+    :param str source_context_dir: (optional) Optional directory in the repository
+          that contains the buildpacks file or the Dockerfile.
+    :param str source_revision: (optional) Commit, tag, or branch in the source
+          repository to pull. This field is optional if the `source_type` is `git` and
+          uses the HEAD of default branch if not specified. If the `source_type` value is
+          `local`, this field must be omitted.
+    :param str source_secret: (optional) Name of the secret that is used access the
+          repository source. This field is optional if the `source_type` is `git`.
+          Additionally, if the `source_url` points to a repository that requires
+          authentication, the build will be created but cannot access any source code,
+          until this property is provided, too. If the `source_type` value is `local`,
+          this field must be omitted.
+    :param str source_type: Specifies the type of source to determine if your build
+          source is in a repository or based on local source code.
+          * local - For builds from local source code.
+          * git - For builds from git version controlled source code.
+    :param str source_url: (optional) The URL of the code repository. This field is
+          required if the `source_type` is `git`. If the `source_type` value is `local`,
+          this field must be omitted. If the repository is publicly available you can
+          provide a 'https' URL like `https://github.com/IBM/CodeEngine`. If the
+          repository requires authentication, you need to provide a 'ssh' URL like
+          `git@github.com:IBM/CodeEngine.git` along with a `source_secret` that points to
+          a secret of format `ssh_auth`.
+    :param str status: (optional) The current status of the build.
+    :param BuildStatus status_details: (optional) The detailed status of the build.
+    :param str strategy_size: Optional size for the build, which determines the
+          amount of resources used. Build sizes are `small`, `medium`, `large`, `xlarge`,
+          `xxlarge`.
+    :param str strategy_spec_file: (optional) Optional path to the specification
+          file that is used for build strategies for building an image.
+    :param str strategy_type: The strategy to use for building the image.
+    :param int timeout: (optional) The maximum amount of time, in seconds, that can
+          pass before the build must succeed or fail.
+    """
+
+    def __init__(
+        self,
+        entity_tag: str,
+        output_image: str,
+        output_secret: str,
+        run_build_params: List['BuildParam'],
+        source_type: str,
+        strategy_size: str,
+        strategy_type: str,
+        *,
+        created_at: Optional[str] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        source_context_dir: Optional[str] = None,
+        source_revision: Optional[str] = None,
+        source_secret: Optional[str] = None,
+        source_url: Optional[str] = None,
+        status: Optional[str] = None,
+        status_details: Optional['BuildStatus'] = None,
+        strategy_spec_file: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a Build object.
+
+        :param str entity_tag: The version of the build instance, which is used to
+               achieve optimistic locking.
+        :param str output_image: The name of the image.
+        :param str output_secret: The secret that is required to access the image
+               registry. Make sure that the secret is granted with push permissions
+               towards the specified container registry namespace.
+        :param List[BuildParam] run_build_params: References to config maps and
+               secret keys, or literal values, which are defined by the build owner and
+               are exposed as build arguments in Docker files.
+        :param str source_type: Specifies the type of source to determine if your
+               build source is in a repository or based on local source code.
+               * local - For builds from local source code.
+               * git - For builds from git version controlled source code.
+        :param str strategy_size: Optional size for the build, which determines the
+               amount of resources used. Build sizes are `small`, `medium`, `large`,
+               `xlarge`, `xxlarge`.
+        :param str strategy_type: The strategy to use for building the image.
+        :param str name: (optional) The name of the build.
+        :param str source_context_dir: (optional) Optional directory in the
+               repository that contains the buildpacks file or the Dockerfile.
+        :param str source_revision: (optional) Commit, tag, or branch in the source
+               repository to pull. This field is optional if the `source_type` is `git`
+               and uses the HEAD of default branch if not specified. If the `source_type`
+               value is `local`, this field must be omitted.
+        :param str source_secret: (optional) Name of the secret that is used access
+               the repository source. This field is optional if the `source_type` is
+               `git`. Additionally, if the `source_url` points to a repository that
+               requires authentication, the build will be created but cannot access any
+               source code, until this property is provided, too. If the `source_type`
+               value is `local`, this field must be omitted.
+        :param str source_url: (optional) The URL of the code repository. This
+               field is required if the `source_type` is `git`. If the `source_type` value
+               is `local`, this field must be omitted. If the repository is publicly
+               available you can provide a 'https' URL like
+               `https://github.com/IBM/CodeEngine`. If the repository requires
+               authentication, you need to provide a 'ssh' URL like
+               `git@github.com:IBM/CodeEngine.git` along with a `source_secret` that
+               points to a secret of format `ssh_auth`.
+        :param BuildStatus status_details: (optional) The detailed status of the
+               build.
+        :param str strategy_spec_file: (optional) Optional path to the
+               specification file that is used for build strategies for building an image.
+        :param int timeout: (optional) The maximum amount of time, in seconds, that
+               can pass before the build must succeed or fail.
+        """
+        self.created_at = created_at
+        self.entity_tag = entity_tag
+        self.href = href
+        self.id = id
+        self.name = name
+        self.output_image = output_image
+        self.output_secret = output_secret
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+        self.run_build_params = run_build_params
+        self.source_context_dir = source_context_dir
+        self.source_revision = source_revision
+        self.source_secret = source_secret
+        self.source_type = source_type
+        self.source_url = source_url
+        self.status = status
+        self.status_details = status_details
+        self.strategy_size = strategy_size
+        self.strategy_spec_file = strategy_spec_file
+        self.strategy_type = strategy_type
+        self.timeout = timeout
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Build':
+        """Initialize a Build object from a json dictionary."""
+        args = {}
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (entity_tag := _dict.get('entity_tag')) is not None:
+            args['entity_tag'] = entity_tag
+        else:
+            raise ValueError('Required property \'entity_tag\' not present in Build JSON')
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (output_image := _dict.get('output_image')) is not None:
+            args['output_image'] = output_image
+        else:
+            raise ValueError('Required property \'output_image\' not present in Build JSON')
+        if (output_secret := _dict.get('output_secret')) is not None:
+            args['output_secret'] = output_secret
+        else:
+            raise ValueError('Required property \'output_secret\' not present in Build JSON')
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (run_build_params := _dict.get('run_build_params')) is not None:
+            args['run_build_params'] = [BuildParam.from_dict(v) for v in run_build_params]
+        else:
+            raise ValueError('Required property \'run_build_params\' not present in Build JSON')
+        if (source_context_dir := _dict.get('source_context_dir')) is not None:
+            args['source_context_dir'] = source_context_dir
+        if (source_revision := _dict.get('source_revision')) is not None:
+            args['source_revision'] = source_revision
+        if (source_secret := _dict.get('source_secret')) is not None:
+            args['source_secret'] = source_secret
+        if (source_type := _dict.get('source_type')) is not None:
+            args['source_type'] = source_type
+        else:
+            raise ValueError('Required property \'source_type\' not present in Build JSON')
+        if (source_url := _dict.get('source_url')) is not None:
+            args['source_url'] = source_url
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_details := _dict.get('status_details')) is not None:
+            args['status_details'] = BuildStatus.from_dict(status_details)
+        if (strategy_size := _dict.get('strategy_size')) is not None:
+            args['strategy_size'] = strategy_size
+        else:
+            raise ValueError('Required property \'strategy_size\' not present in Build JSON')
+        if (strategy_spec_file := _dict.get('strategy_spec_file')) is not None:
+            args['strategy_spec_file'] = strategy_spec_file
+        if (strategy_type := _dict.get('strategy_type')) is not None:
+            args['strategy_type'] = strategy_type
+        else:
+            raise ValueError('Required property \'strategy_type\' not present in Build JSON')
+        if (timeout := _dict.get('timeout')) is not None:
+            args['timeout'] = timeout
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Build object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'entity_tag') and self.entity_tag is not None:
+            _dict['entity_tag'] = self.entity_tag
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'output_image') and self.output_image is not None:
+            _dict['output_image'] = self.output_image
+        if hasattr(self, 'output_secret') and self.output_secret is not None:
+            _dict['output_secret'] = self.output_secret
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'run_build_params') and self.run_build_params is not None:
+            run_build_params_list = []
+            for v in self.run_build_params:
+                if isinstance(v, dict):
+                    run_build_params_list.append(v)
+                else:
+                    run_build_params_list.append(v.to_dict())
+            _dict['run_build_params'] = run_build_params_list
+        if hasattr(self, 'source_context_dir') and self.source_context_dir is not None:
+            _dict['source_context_dir'] = self.source_context_dir
+        if hasattr(self, 'source_revision') and self.source_revision is not None:
+            _dict['source_revision'] = self.source_revision
+        if hasattr(self, 'source_secret') and self.source_secret is not None:
+            _dict['source_secret'] = self.source_secret
+        if hasattr(self, 'source_type') and self.source_type is not None:
+            _dict['source_type'] = self.source_type
+        if hasattr(self, 'source_url') and self.source_url is not None:
+            _dict['source_url'] = self.source_url
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        if hasattr(self, 'status_details') and self.status_details is not None:
+            if isinstance(self.status_details, dict):
+                _dict['status_details'] = self.status_details
+            else:
+                _dict['status_details'] = self.status_details.to_dict()
+        if hasattr(self, 'strategy_size') and self.strategy_size is not None:
+            _dict['strategy_size'] = self.strategy_size
+        if hasattr(self, 'strategy_spec_file') and self.strategy_spec_file is not None:
+            _dict['strategy_spec_file'] = self.strategy_spec_file
+        if hasattr(self, 'strategy_type') and self.strategy_type is not None:
+            _dict['strategy_type'] = self.strategy_type
+        if hasattr(self, 'timeout') and self.timeout is not None:
+            _dict['timeout'] = self.timeout
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Build object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Build') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Build') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the build.
+        """
+
+        BUILD_V2 = 'build_v2'
+
+    class SourceTypeEnum(str, Enum):
+        """
+        Specifies the type of source to determine if your build source is in a repository
+        or based on local source code.
+        * local - For builds from local source code.
+        * git - For builds from git version controlled source code.
+        """
+
+        LOCAL = 'local'
+        GIT = 'git'
+
+    class StatusEnum(str, Enum):
+        """
+        The current status of the build.
+        """
+
+        READY = 'ready'
+        FAILED = 'failed'
+
+    class StrategySizeEnum(str, Enum):
+        """
+        Optional size for the build, which determines the amount of resources used. Build
+        sizes are `small`, `medium`, `large`, `xlarge`, `xxlarge`.
+        """
+
+        SMALL = 'small'
+        MEDIUM = 'medium'
+        LARGE = 'large'
+        XLARGE = 'xlarge'
+        XXLARGE = 'xxlarge'
+
+    class StrategyTypeEnum(str, Enum):
+        """
+        The strategy to use for building the image.
+        """
+
+        DOCKERFILE = 'dockerfile'
+        BUILDPACKS = 'buildpacks'
+
+
+class BuildList:
+    """
+    Contains a list of builds and pagination information.
+
+    :param List[Build] builds: List of all builds.
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    """
+
+    def __init__(
+        self,
+        builds: List['Build'],
+        limit: int,
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a BuildList object.
+
+        :param List[Build] builds: List of all builds.
+        :param int limit: Maximum number of resources per page.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.builds = builds
+        self.first = first
+        self.limit = limit
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BuildList':
+        """Initialize a BuildList object from a json dictionary."""
+        args = {}
+        if (builds := _dict.get('builds')) is not None:
+            args['builds'] = [Build.from_dict(v) for v in builds]
+        else:
+            raise ValueError('Required property \'builds\' not present in BuildList JSON')
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in BuildList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BuildList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'builds') and self.builds is not None:
+            builds_list = []
+            for v in self.builds:
+                if isinstance(v, dict):
+                    builds_list.append(v)
+                else:
+                    builds_list.append(v.to_dict())
+            _dict['builds'] = builds_list
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BuildList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BuildList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BuildList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class BuildParam:
+    """
+    Response model for build params.
+
+    :param str key: (optional) The key to reference as build param.
+    :param str name: (optional) The name of the build param.
+    :param str reference: (optional) The name of the secret or config map.
+    :param str type: Specify the type of the build param.
+    :param str value: (optional) The literal value of the build param.
+    """
+
+    def __init__(
+        self,
+        type: str,
+        *,
+        key: Optional[str] = None,
+        name: Optional[str] = None,
+        reference: Optional[str] = None,
+        value: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a BuildParam object.
+
+        :param str type: Specify the type of the build param.
+        :param str key: (optional) The key to reference as build param.
+        :param str name: (optional) The name of the build param.
+        :param str reference: (optional) The name of the secret or config map.
+        :param str value: (optional) The literal value of the build param.
+        """
+        self.key = key
+        self.name = name
+        self.reference = reference
+        self.type = type
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BuildParam':
+        """Initialize a BuildParam object from a json dictionary."""
+        args = {}
+        if (key := _dict.get('key')) is not None:
+            args['key'] = key
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (reference := _dict.get('reference')) is not None:
+            args['reference'] = reference
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        else:
+            raise ValueError('Required property \'type\' not present in BuildParam JSON')
+        if (value := _dict.get('value')) is not None:
+            args['value'] = value
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BuildParam object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'key') and self.key is not None:
+            _dict['key'] = self.key
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'reference') and self.reference is not None:
+            _dict['reference'] = self.reference
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        if hasattr(self, 'value') and self.value is not None:
+            _dict['value'] = self.value
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BuildParam object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BuildParam') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BuildParam') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the build param.
+        """
+
+        LITERAL = 'literal'
+        CONFIG_MAP_KEY_REFERENCE = 'config_map_key_reference'
+        SECRET_KEY_REFERENCE = 'secret_key_reference'
+
+
+class BuildParamPrototype:
+    """
+    Prototype model for build params.
+
+    :param str key: (optional) The key to reference as build param.
+    :param str name: (optional) The name of the build param.
+    :param str reference: (optional) The name of the secret or config map.
+    :param str type: Specify the type of the build param.
+    :param str value: (optional) The literal value of the build param.
+    """
+
+    def __init__(
+        self,
+        type: str,
+        *,
+        key: Optional[str] = None,
+        name: Optional[str] = None,
+        reference: Optional[str] = None,
+        value: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a BuildParamPrototype object.
+
+        :param str type: Specify the type of the build param.
+        :param str key: (optional) The key to reference as build param.
+        :param str name: (optional) The name of the build param.
+        :param str reference: (optional) The name of the secret or config map.
+        :param str value: (optional) The literal value of the build param.
+        """
+        self.key = key
+        self.name = name
+        self.reference = reference
+        self.type = type
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BuildParamPrototype':
+        """Initialize a BuildParamPrototype object from a json dictionary."""
+        args = {}
+        if (key := _dict.get('key')) is not None:
+            args['key'] = key
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (reference := _dict.get('reference')) is not None:
+            args['reference'] = reference
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        else:
+            raise ValueError('Required property \'type\' not present in BuildParamPrototype JSON')
+        if (value := _dict.get('value')) is not None:
+            args['value'] = value
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BuildParamPrototype object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'key') and self.key is not None:
+            _dict['key'] = self.key
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'reference') and self.reference is not None:
+            _dict['reference'] = self.reference
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        if hasattr(self, 'value') and self.value is not None:
+            _dict['value'] = self.value
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BuildParamPrototype object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BuildParamPrototype') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BuildParamPrototype') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the build param.
+        """
+
+        LITERAL = 'literal'
+        CONFIG_MAP_KEY_REFERENCE = 'config_map_key_reference'
+        SECRET_KEY_REFERENCE = 'secret_key_reference'
+
+
+class BuildPatch:
+    """
+    Patch a build object.
+
+    :param str output_image: (optional) The name of the image.
+    :param str output_secret: (optional) The secret that is required to access the
+          image registry. Make sure that the secret is granted with push permissions
+          towards the specified container registry namespace.
+    :param List[BuildParamPrototype] run_build_params: (optional) Optional
+          references to config maps and secret keys, or literal values that are exposed as
+          build arguments within the Docker file.
+    :param str source_context_dir: (optional) Optional directory in the repository
+          that contains the buildpacks file or the Dockerfile.
+    :param str source_revision: (optional) Commit, tag, or branch in the source
+          repository to pull. This field is optional if the `source_type` is `git` and
+          uses the HEAD of default branch if not specified. If the `source_type` value is
+          `local`, this field must be omitted.
+    :param str source_secret: (optional) Name of the secret that is used access the
+          repository source. This field is optional if the `source_type` is `git`.
+          Additionally, if the `source_url` points to a repository that requires
+          authentication, the build will be created but cannot access any source code,
+          until this property is provided, too. If the `source_type` value is `local`,
+          this field must be omitted.
+    :param str source_type: (optional) Specifies the type of source to determine if
+          your build source is in a repository or based on local source code.
+          * local - For builds from local source code.
+          * git - For builds from git version controlled source code.
+    :param str source_url: (optional) The URL of the code repository. This field is
+          required if the `source_type` is `git`. If the `source_type` value is `local`,
+          this field must be omitted. If the repository is publicly available you can
+          provide a 'https' URL like `https://github.com/IBM/CodeEngine`. If the
+          repository requires authentication, you need to provide a 'ssh' URL like
+          `git@github.com:IBM/CodeEngine.git` along with a `source_secret` that points to
+          a secret of format `ssh_auth`.
+    :param str strategy_size: (optional) Optional size for the build, which
+          determines the amount of resources used. Build sizes are `small`, `medium`,
+          `large`, `xlarge`, `xxlarge`.
+    :param str strategy_spec_file: (optional) Optional path to the specification
+          file that is used for build strategies for building an image.
+    :param str strategy_type: (optional) The strategy to use for building the image.
+    :param int timeout: (optional) The maximum amount of time, in seconds, that can
+          pass before the build must succeed or fail.
+    """
+
+    def __init__(
+        self,
+        *,
+        output_image: Optional[str] = None,
+        output_secret: Optional[str] = None,
+        run_build_params: Optional[List['BuildParamPrototype']] = None,
+        source_context_dir: Optional[str] = None,
+        source_revision: Optional[str] = None,
+        source_secret: Optional[str] = None,
+        source_type: Optional[str] = None,
+        source_url: Optional[str] = None,
+        strategy_size: Optional[str] = None,
+        strategy_spec_file: Optional[str] = None,
+        strategy_type: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a BuildPatch object.
+
+        :param str output_image: (optional) The name of the image.
+        :param str output_secret: (optional) The secret that is required to access
+               the image registry. Make sure that the secret is granted with push
+               permissions towards the specified container registry namespace.
+        :param List[BuildParamPrototype] run_build_params: (optional) Optional
+               references to config maps and secret keys, or literal values that are
+               exposed as build arguments within the Docker file.
+        :param str source_context_dir: (optional) Optional directory in the
+               repository that contains the buildpacks file or the Dockerfile.
+        :param str source_revision: (optional) Commit, tag, or branch in the source
+               repository to pull. This field is optional if the `source_type` is `git`
+               and uses the HEAD of default branch if not specified. If the `source_type`
+               value is `local`, this field must be omitted.
+        :param str source_secret: (optional) Name of the secret that is used access
+               the repository source. This field is optional if the `source_type` is
+               `git`. Additionally, if the `source_url` points to a repository that
+               requires authentication, the build will be created but cannot access any
+               source code, until this property is provided, too. If the `source_type`
+               value is `local`, this field must be omitted.
+        :param str source_type: (optional) Specifies the type of source to
+               determine if your build source is in a repository or based on local source
+               code.
+               * local - For builds from local source code.
+               * git - For builds from git version controlled source code.
+        :param str source_url: (optional) The URL of the code repository. This
+               field is required if the `source_type` is `git`. If the `source_type` value
+               is `local`, this field must be omitted. If the repository is publicly
+               available you can provide a 'https' URL like
+               `https://github.com/IBM/CodeEngine`. If the repository requires
+               authentication, you need to provide a 'ssh' URL like
+               `git@github.com:IBM/CodeEngine.git` along with a `source_secret` that
+               points to a secret of format `ssh_auth`.
+        :param str strategy_size: (optional) Optional size for the build, which
+               determines the amount of resources used. Build sizes are `small`, `medium`,
+               `large`, `xlarge`, `xxlarge`.
+        :param str strategy_spec_file: (optional) Optional path to the
+               specification file that is used for build strategies for building an image.
+        :param str strategy_type: (optional) The strategy to use for building the
+               image.
+        :param int timeout: (optional) The maximum amount of time, in seconds, that
+               can pass before the build must succeed or fail.
+        """
+        self.output_image = output_image
+        self.output_secret = output_secret
+        self.run_build_params = run_build_params
+        self.source_context_dir = source_context_dir
+        self.source_revision = source_revision
+        self.source_secret = source_secret
+        self.source_type = source_type
+        self.source_url = source_url
+        self.strategy_size = strategy_size
+        self.strategy_spec_file = strategy_spec_file
+        self.strategy_type = strategy_type
+        self.timeout = timeout
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BuildPatch':
+        """Initialize a BuildPatch object from a json dictionary."""
+        args = {}
+        if (output_image := _dict.get('output_image')) is not None:
+            args['output_image'] = output_image
+        if (output_secret := _dict.get('output_secret')) is not None:
+            args['output_secret'] = output_secret
+        if (run_build_params := _dict.get('run_build_params')) is not None:
+            args['run_build_params'] = [BuildParamPrototype.from_dict(v) for v in run_build_params]
+        if (source_context_dir := _dict.get('source_context_dir')) is not None:
+            args['source_context_dir'] = source_context_dir
+        if (source_revision := _dict.get('source_revision')) is not None:
+            args['source_revision'] = source_revision
+        if (source_secret := _dict.get('source_secret')) is not None:
+            args['source_secret'] = source_secret
+        if (source_type := _dict.get('source_type')) is not None:
+            args['source_type'] = source_type
+        if (source_url := _dict.get('source_url')) is not None:
+            args['source_url'] = source_url
+        if (strategy_size := _dict.get('strategy_size')) is not None:
+            args['strategy_size'] = strategy_size
+        if (strategy_spec_file := _dict.get('strategy_spec_file')) is not None:
+            args['strategy_spec_file'] = strategy_spec_file
+        if (strategy_type := _dict.get('strategy_type')) is not None:
+            args['strategy_type'] = strategy_type
+        if (timeout := _dict.get('timeout')) is not None:
+            args['timeout'] = timeout
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BuildPatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'output_image') and self.output_image is not None:
+            _dict['output_image'] = self.output_image
+        if hasattr(self, 'output_secret') and self.output_secret is not None:
+            _dict['output_secret'] = self.output_secret
+        if hasattr(self, 'run_build_params') and self.run_build_params is not None:
+            run_build_params_list = []
+            for v in self.run_build_params:
+                if isinstance(v, dict):
+                    run_build_params_list.append(v)
+                else:
+                    run_build_params_list.append(v.to_dict())
+            _dict['run_build_params'] = run_build_params_list
+        if hasattr(self, 'source_context_dir') and self.source_context_dir is not None:
+            _dict['source_context_dir'] = self.source_context_dir
+        if hasattr(self, 'source_revision') and self.source_revision is not None:
+            _dict['source_revision'] = self.source_revision
+        if hasattr(self, 'source_secret') and self.source_secret is not None:
+            _dict['source_secret'] = self.source_secret
+        if hasattr(self, 'source_type') and self.source_type is not None:
+            _dict['source_type'] = self.source_type
+        if hasattr(self, 'source_url') and self.source_url is not None:
+            _dict['source_url'] = self.source_url
+        if hasattr(self, 'strategy_size') and self.strategy_size is not None:
+            _dict['strategy_size'] = self.strategy_size
+        if hasattr(self, 'strategy_spec_file') and self.strategy_spec_file is not None:
+            _dict['strategy_spec_file'] = self.strategy_spec_file
+        if hasattr(self, 'strategy_type') and self.strategy_type is not None:
+            _dict['strategy_type'] = self.strategy_type
+        if hasattr(self, 'timeout') and self.timeout is not None:
+            _dict['timeout'] = self.timeout
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BuildPatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BuildPatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BuildPatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class SourceTypeEnum(str, Enum):
+        """
+        Specifies the type of source to determine if your build source is in a repository
+        or based on local source code.
+        * local - For builds from local source code.
+        * git - For builds from git version controlled source code.
+        """
+
+        LOCAL = 'local'
+        GIT = 'git'
+
+    class StrategySizeEnum(str, Enum):
+        """
+        Optional size for the build, which determines the amount of resources used. Build
+        sizes are `small`, `medium`, `large`, `xlarge`, `xxlarge`.
+        """
+
+        SMALL = 'small'
+        MEDIUM = 'medium'
+        LARGE = 'large'
+        XLARGE = 'xlarge'
+        XXLARGE = 'xxlarge'
+
+    class StrategyTypeEnum(str, Enum):
+        """
+        The strategy to use for building the image.
+        """
+
+        DOCKERFILE = 'dockerfile'
+        BUILDPACKS = 'buildpacks'
+
+
+class BuildRun:
+    """
+    Response model for build run objects.
+
+    :param str build_name: Optional name of the build on which this build run is
+          based on. If specified, the build run will inherit the configuration of the
+          referenced build. If not specified, make sure to specify at least the fields
+          `strategy_type`, `source_url`, `output_image` and `output_secret` to describe
+          the build run.
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param str href: (optional) When you trigger a new build run,  a URL is created
+          identifying the location of the instance.
+    :param str id: (optional) The identifier of the resource.
+    :param str name: The name of the build run.
+    :param str output_image: (optional) The name of the image.
+    :param str output_secret: (optional) The secret that is required to access the
+          image registry. Make sure that the secret is granted with push permissions
+          towards the specified container registry namespace.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the build run.
+    :param List[BuildParam] run_build_params: References to config maps and secret
+          keys, or literal values, which are defined by the build owner and are exposed as
+          build arguments in Docker files.
+    :param str service_account: Optional service account, which is used for resource
+          control.
+    :param str source_context_dir: (optional) Optional directory in the repository
+          that contains the buildpacks file or the Dockerfile.
+    :param str source_revision: (optional) Commit, tag, or branch in the source
+          repository to pull. This field is optional if the `source_type` is `git` and
+          uses the HEAD of default branch if not specified. If the `source_type` value is
+          `local`, this field must be omitted.
+    :param str source_secret: (optional) Name of the secret that is used access the
+          repository source. This field is optional if the `source_type` is `git`.
+          Additionally, if the `source_url` points to a repository that requires
+          authentication, the build will be created but cannot access any source code,
+          until this property is provided, too. If the `source_type` value is `local`,
+          this field must be omitted.
+    :param str source_type: Specifies the type of source to determine if your build
+          source is in a repository or based on local source code.
+          * local - For builds from local source code.
+          * git - For builds from git version controlled source code.
+    :param str source_url: (optional) The URL of the code repository. This field is
+          required if the `source_type` is `git`. If the `source_type` value is `local`,
+          this field must be omitted. If the repository is publicly available you can
+          provide a 'https' URL like `https://github.com/IBM/CodeEngine`. If the
+          repository requires authentication, you need to provide a 'ssh' URL like
+          `git@github.com:IBM/CodeEngine.git` along with a `source_secret` that points to
+          a secret of format `ssh_auth`.
+    :param str status: (optional) The current status of the build run.
+    :param BuildRunStatus status_details: (optional) Current status condition of a
+          build run.
+    :param str strategy_size: Optional size for the build, which determines the
+          amount of resources used. Build sizes are `small`, `medium`, `large`, `xlarge`,
+          `xxlarge`.
+    :param str strategy_spec_file: (optional) Optional path to the specification
+          file that is used for build strategies for building an image.
+    :param str strategy_type: The strategy to use for building the image.
+    :param int timeout: (optional) The maximum amount of time, in seconds, that can
+          pass before the build must succeed or fail.
+    """
+
+    def __init__(
+        self,
+        build_name: str,
+        name: str,
+        run_build_params: List['BuildParam'],
+        service_account: str,
+        source_type: str,
+        strategy_size: str,
+        strategy_type: str,
+        *,
+        created_at: Optional[str] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        output_image: Optional[str] = None,
+        output_secret: Optional[str] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        source_context_dir: Optional[str] = None,
+        source_revision: Optional[str] = None,
+        source_secret: Optional[str] = None,
+        source_url: Optional[str] = None,
+        status: Optional[str] = None,
+        status_details: Optional['BuildRunStatus'] = None,
+        strategy_spec_file: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a BuildRun object.
+
+        :param str build_name: Optional name of the build on which this build run
+               is based on. If specified, the build run will inherit the configuration of
+               the referenced build. If not specified, make sure to specify at least the
+               fields `strategy_type`, `source_url`, `output_image` and `output_secret` to
+               describe the build run.
+        :param str name: The name of the build run.
+        :param List[BuildParam] run_build_params: References to config maps and
+               secret keys, or literal values, which are defined by the build owner and
+               are exposed as build arguments in Docker files.
+        :param str service_account: Optional service account, which is used for
+               resource control.
+        :param str source_type: Specifies the type of source to determine if your
+               build source is in a repository or based on local source code.
+               * local - For builds from local source code.
+               * git - For builds from git version controlled source code.
+        :param str strategy_size: Optional size for the build, which determines the
+               amount of resources used. Build sizes are `small`, `medium`, `large`,
+               `xlarge`, `xxlarge`.
+        :param str strategy_type: The strategy to use for building the image.
+        :param str output_image: (optional) The name of the image.
+        :param str output_secret: (optional) The secret that is required to access
+               the image registry. Make sure that the secret is granted with push
+               permissions towards the specified container registry namespace.
+        :param str source_context_dir: (optional) Optional directory in the
+               repository that contains the buildpacks file or the Dockerfile.
+        :param str source_revision: (optional) Commit, tag, or branch in the source
+               repository to pull. This field is optional if the `source_type` is `git`
+               and uses the HEAD of default branch if not specified. If the `source_type`
+               value is `local`, this field must be omitted.
+        :param str source_secret: (optional) Name of the secret that is used access
+               the repository source. This field is optional if the `source_type` is
+               `git`. Additionally, if the `source_url` points to a repository that
+               requires authentication, the build will be created but cannot access any
+               source code, until this property is provided, too. If the `source_type`
+               value is `local`, this field must be omitted.
+        :param str source_url: (optional) The URL of the code repository. This
+               field is required if the `source_type` is `git`. If the `source_type` value
+               is `local`, this field must be omitted. If the repository is publicly
+               available you can provide a 'https' URL like
+               `https://github.com/IBM/CodeEngine`. If the repository requires
+               authentication, you need to provide a 'ssh' URL like
+               `git@github.com:IBM/CodeEngine.git` along with a `source_secret` that
+               points to a secret of format `ssh_auth`.
+        :param BuildRunStatus status_details: (optional) Current status condition
+               of a build run.
+        :param str strategy_spec_file: (optional) Optional path to the
+               specification file that is used for build strategies for building an image.
+        :param int timeout: (optional) The maximum amount of time, in seconds, that
+               can pass before the build must succeed or fail.
+        """
+        self.build_name = build_name
+        self.created_at = created_at
+        self.href = href
+        self.id = id
+        self.name = name
+        self.output_image = output_image
+        self.output_secret = output_secret
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+        self.run_build_params = run_build_params
+        self.service_account = service_account
+        self.source_context_dir = source_context_dir
+        self.source_revision = source_revision
+        self.source_secret = source_secret
+        self.source_type = source_type
+        self.source_url = source_url
+        self.status = status
+        self.status_details = status_details
+        self.strategy_size = strategy_size
+        self.strategy_spec_file = strategy_spec_file
+        self.strategy_type = strategy_type
+        self.timeout = timeout
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BuildRun':
+        """Initialize a BuildRun object from a json dictionary."""
+        args = {}
+        if (build_name := _dict.get('build_name')) is not None:
+            args['build_name'] = build_name
+        else:
+            raise ValueError('Required property \'build_name\' not present in BuildRun JSON')
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError('Required property \'name\' not present in BuildRun JSON')
+        if (output_image := _dict.get('output_image')) is not None:
+            args['output_image'] = output_image
+        if (output_secret := _dict.get('output_secret')) is not None:
+            args['output_secret'] = output_secret
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (run_build_params := _dict.get('run_build_params')) is not None:
+            args['run_build_params'] = [BuildParam.from_dict(v) for v in run_build_params]
+        else:
+            raise ValueError('Required property \'run_build_params\' not present in BuildRun JSON')
+        if (service_account := _dict.get('service_account')) is not None:
+            args['service_account'] = service_account
+        else:
+            raise ValueError('Required property \'service_account\' not present in BuildRun JSON')
+        if (source_context_dir := _dict.get('source_context_dir')) is not None:
+            args['source_context_dir'] = source_context_dir
+        if (source_revision := _dict.get('source_revision')) is not None:
+            args['source_revision'] = source_revision
+        if (source_secret := _dict.get('source_secret')) is not None:
+            args['source_secret'] = source_secret
+        if (source_type := _dict.get('source_type')) is not None:
+            args['source_type'] = source_type
+        else:
+            raise ValueError('Required property \'source_type\' not present in BuildRun JSON')
+        if (source_url := _dict.get('source_url')) is not None:
+            args['source_url'] = source_url
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_details := _dict.get('status_details')) is not None:
+            args['status_details'] = BuildRunStatus.from_dict(status_details)
+        if (strategy_size := _dict.get('strategy_size')) is not None:
+            args['strategy_size'] = strategy_size
+        else:
+            raise ValueError('Required property \'strategy_size\' not present in BuildRun JSON')
+        if (strategy_spec_file := _dict.get('strategy_spec_file')) is not None:
+            args['strategy_spec_file'] = strategy_spec_file
+        if (strategy_type := _dict.get('strategy_type')) is not None:
+            args['strategy_type'] = strategy_type
+        else:
+            raise ValueError('Required property \'strategy_type\' not present in BuildRun JSON')
+        if (timeout := _dict.get('timeout')) is not None:
+            args['timeout'] = timeout
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BuildRun object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'build_name') and self.build_name is not None:
+            _dict['build_name'] = self.build_name
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'output_image') and self.output_image is not None:
+            _dict['output_image'] = self.output_image
+        if hasattr(self, 'output_secret') and self.output_secret is not None:
+            _dict['output_secret'] = self.output_secret
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'run_build_params') and self.run_build_params is not None:
+            run_build_params_list = []
+            for v in self.run_build_params:
+                if isinstance(v, dict):
+                    run_build_params_list.append(v)
+                else:
+                    run_build_params_list.append(v.to_dict())
+            _dict['run_build_params'] = run_build_params_list
+        if hasattr(self, 'service_account') and self.service_account is not None:
+            _dict['service_account'] = self.service_account
+        if hasattr(self, 'source_context_dir') and self.source_context_dir is not None:
+            _dict['source_context_dir'] = self.source_context_dir
+        if hasattr(self, 'source_revision') and self.source_revision is not None:
+            _dict['source_revision'] = self.source_revision
+        if hasattr(self, 'source_secret') and self.source_secret is not None:
+            _dict['source_secret'] = self.source_secret
+        if hasattr(self, 'source_type') and self.source_type is not None:
+            _dict['source_type'] = self.source_type
+        if hasattr(self, 'source_url') and self.source_url is not None:
+            _dict['source_url'] = self.source_url
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        if hasattr(self, 'status_details') and self.status_details is not None:
+            if isinstance(self.status_details, dict):
+                _dict['status_details'] = self.status_details
+            else:
+                _dict['status_details'] = self.status_details.to_dict()
+        if hasattr(self, 'strategy_size') and self.strategy_size is not None:
+            _dict['strategy_size'] = self.strategy_size
+        if hasattr(self, 'strategy_spec_file') and self.strategy_spec_file is not None:
+            _dict['strategy_spec_file'] = self.strategy_spec_file
+        if hasattr(self, 'strategy_type') and self.strategy_type is not None:
+            _dict['strategy_type'] = self.strategy_type
+        if hasattr(self, 'timeout') and self.timeout is not None:
+            _dict['timeout'] = self.timeout
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BuildRun object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BuildRun') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BuildRun') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the build run.
+        """
+
+        BUILD_RUN_V2 = 'build_run_v2'
+
+    class ServiceAccountEnum(str, Enum):
+        """
+        Optional service account, which is used for resource control.
+        """
+
+        DEFAULT = 'default'
+        MANAGER = 'manager'
+        READER = 'reader'
+        WRITER = 'writer'
+        NONE = 'none'
+
+    class SourceTypeEnum(str, Enum):
+        """
+        Specifies the type of source to determine if your build source is in a repository
+        or based on local source code.
+        * local - For builds from local source code.
+        * git - For builds from git version controlled source code.
+        """
+
+        LOCAL = 'local'
+        GIT = 'git'
+
+    class StatusEnum(str, Enum):
+        """
+        The current status of the build run.
+        """
+
+        SUCCEEDED = 'succeeded'
+        RUNNING = 'running'
+        PENDING = 'pending'
+        FAILED = 'failed'
+
+    class StrategySizeEnum(str, Enum):
+        """
+        Optional size for the build, which determines the amount of resources used. Build
+        sizes are `small`, `medium`, `large`, `xlarge`, `xxlarge`.
+        """
+
+        SMALL = 'small'
+        MEDIUM = 'medium'
+        LARGE = 'large'
+        XLARGE = 'xlarge'
+        XXLARGE = 'xxlarge'
+
+    class StrategyTypeEnum(str, Enum):
+        """
+        The strategy to use for building the image.
+        """
+
+        DOCKERFILE = 'dockerfile'
+        BUILDPACKS = 'buildpacks'
+
+
+class BuildRunList:
+    """
+    Contains a list of build runs and pagination information.
+
+    :param List[BuildRun] build_runs: List of all build runs.
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    """
+
+    def __init__(
+        self,
+        build_runs: List['BuildRun'],
+        limit: int,
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a BuildRunList object.
+
+        :param List[BuildRun] build_runs: List of all build runs.
+        :param int limit: Maximum number of resources per page.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.build_runs = build_runs
+        self.first = first
+        self.limit = limit
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BuildRunList':
+        """Initialize a BuildRunList object from a json dictionary."""
+        args = {}
+        if (build_runs := _dict.get('build_runs')) is not None:
+            args['build_runs'] = [BuildRun.from_dict(v) for v in build_runs]
+        else:
+            raise ValueError('Required property \'build_runs\' not present in BuildRunList JSON')
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in BuildRunList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BuildRunList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'build_runs') and self.build_runs is not None:
+            build_runs_list = []
+            for v in self.build_runs:
+                if isinstance(v, dict):
+                    build_runs_list.append(v)
+                else:
+                    build_runs_list.append(v.to_dict())
+            _dict['build_runs'] = build_runs_list
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BuildRunList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BuildRunList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BuildRunList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class BuildRunStatus:
+    """
+    Current status condition of a build run.
+
+    :param str completion_time: (optional) Time the build run completed.
+    :param str git_branch_name: (optional) The default branch name of the git
+          source.
+    :param str git_commit_author: (optional) The commit author of a git source.
+    :param str git_commit_sha: (optional) The commit sha of the git source.
+    :param str output_digest: (optional) Describes the time the build run completed.
+    :param str reason: (optional) Optional information to provide more context in
+          case of a 'failed' or 'warning' status.
+    :param str source_timestamp: (optional) The timestamp of the source.
+    :param str start_time: (optional) Time the build run started.
+    """
+
+    def __init__(
+        self,
+        *,
+        completion_time: Optional[str] = None,
+        git_branch_name: Optional[str] = None,
+        git_commit_author: Optional[str] = None,
+        git_commit_sha: Optional[str] = None,
+        output_digest: Optional[str] = None,
+        reason: Optional[str] = None,
+        source_timestamp: Optional[str] = None,
+        start_time: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a BuildRunStatus object.
+
+        """
+        self.completion_time = completion_time
+        self.git_branch_name = git_branch_name
+        self.git_commit_author = git_commit_author
+        self.git_commit_sha = git_commit_sha
+        self.output_digest = output_digest
+        self.reason = reason
+        self.source_timestamp = source_timestamp
+        self.start_time = start_time
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BuildRunStatus':
+        """Initialize a BuildRunStatus object from a json dictionary."""
+        args = {}
+        if (completion_time := _dict.get('completion_time')) is not None:
+            args['completion_time'] = completion_time
+        if (git_branch_name := _dict.get('git_branch_name')) is not None:
+            args['git_branch_name'] = git_branch_name
+        if (git_commit_author := _dict.get('git_commit_author')) is not None:
+            args['git_commit_author'] = git_commit_author
+        if (git_commit_sha := _dict.get('git_commit_sha')) is not None:
+            args['git_commit_sha'] = git_commit_sha
+        if (output_digest := _dict.get('output_digest')) is not None:
+            args['output_digest'] = output_digest
+        if (reason := _dict.get('reason')) is not None:
+            args['reason'] = reason
+        if (source_timestamp := _dict.get('source_timestamp')) is not None:
+            args['source_timestamp'] = source_timestamp
+        if (start_time := _dict.get('start_time')) is not None:
+            args['start_time'] = start_time
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BuildRunStatus object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'completion_time') and getattr(self, 'completion_time') is not None:
+            _dict['completion_time'] = getattr(self, 'completion_time')
+        if hasattr(self, 'git_branch_name') and getattr(self, 'git_branch_name') is not None:
+            _dict['git_branch_name'] = getattr(self, 'git_branch_name')
+        if hasattr(self, 'git_commit_author') and getattr(self, 'git_commit_author') is not None:
+            _dict['git_commit_author'] = getattr(self, 'git_commit_author')
+        if hasattr(self, 'git_commit_sha') and getattr(self, 'git_commit_sha') is not None:
+            _dict['git_commit_sha'] = getattr(self, 'git_commit_sha')
+        if hasattr(self, 'output_digest') and getattr(self, 'output_digest') is not None:
+            _dict['output_digest'] = getattr(self, 'output_digest')
+        if hasattr(self, 'reason') and getattr(self, 'reason') is not None:
+            _dict['reason'] = getattr(self, 'reason')
+        if hasattr(self, 'source_timestamp') and getattr(self, 'source_timestamp') is not None:
+            _dict['source_timestamp'] = getattr(self, 'source_timestamp')
+        if hasattr(self, 'start_time') and getattr(self, 'start_time') is not None:
+            _dict['start_time'] = getattr(self, 'start_time')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BuildRunStatus object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BuildRunStatus') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BuildRunStatus') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ReasonEnum(str, Enum):
+        """
+        Optional information to provide more context in case of a 'failed' or 'warning'
+        status.
+        """
+
+        SUCCEEDED = 'succeeded'
+        RUNNING = 'running'
+        PENDING = 'pending'
+        FAILED_TO_EXECUTE_BUILD_RUN = 'failed_to_execute_build_run'
+        EXCEEDED_EPHEMERAL_STORAGE = 'exceeded_ephemeral_storage'
+        MISSING_REGISTRY_ACCESS = 'missing_registry_access'
+        MISSING_CODE_REPO_ACCESS = 'missing_code_repo_access'
+        MISSING_SECRETS = 'missing_secrets'
+        UNKNOWN_STRATEGY = 'unknown_strategy'
+        INVALID_BUILD_CONFIGURATION = 'invalid_build_configuration'
+        POD_EVICTED_BECAUSE_OF_STORAGE_QUOTA_EXCEEDS = 'pod_evicted_because_of_storage_quota_exceeds'
+        POD_EVICTED = 'pod_evicted'
+        MISSING_TASK_RUN = 'missing_task_run'
+        TASK_RUN_GENERATION_FAILED = 'task_run_generation_failed'
+        BUILD_NOT_FOUND = 'build_not_found'
+        TIMEOUT = 'timeout'
+        FAILED = 'failed'
+
+
+class BuildStatus:
+    """
+    The detailed status of the build.
+
+    :param str reason: (optional) Optional information to provide more context in
+          case of a 'failed' or 'warning' status.
+    """
+
+    def __init__(
+        self,
+        *,
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a BuildStatus object.
+
+        """
+        self.reason = reason
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BuildStatus':
+        """Initialize a BuildStatus object from a json dictionary."""
+        args = {}
+        if (reason := _dict.get('reason')) is not None:
+            args['reason'] = reason
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BuildStatus object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'reason') and getattr(self, 'reason') is not None:
+            _dict['reason'] = getattr(self, 'reason')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BuildStatus object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BuildStatus') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BuildStatus') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ReasonEnum(str, Enum):
+        """
+        Optional information to provide more context in case of a 'failed' or 'warning'
+        status.
+        """
+
+        REGISTERED = 'registered'
+        STRATEGY_NOT_FOUND = 'strategy_not_found'
+        CLUSTER_BUILD_STRATEGY_NOT_FOUND = 'cluster_build_strategy_not_found'
+        SET_OWNER_REFERENCE_FAILED = 'set_owner_reference_failed'
+        SPEC_SOURCE_SECRET_NOT_FOUND = 'spec_source_secret_not_found'
+        SPEC_OUTPUT_SECRET_REF_NOT_FOUND = 'spec_output_secret_ref_not_found'
+        SPEC_RUNTIME_SECRET_REF_NOT_FOUND = 'spec_runtime_secret_ref_not_found'
+        MULTIPLE_SECRET_REF_NOT_FOUND = 'multiple_secret_ref_not_found'
+        RUNTIME_PATHS_CAN_NOT_BE_EMPTY = 'runtime_paths_can_not_be_empty'
+        REMOTE_REPOSITORY_UNREACHABLE = 'remote_repository_unreachable'
+        FAILED = 'failed'
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'Build': (
+        ModelField('created_at'),
+        ModelField('entity_tag', required=True),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('name'),
+        ModelField('output_image', required=True),
+        ModelField('output_secret', required=True),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+        ModelField('run_build_params', 'list', 'BuildParam', required=True),
+        ModelField('source_context_dir'),
+        ModelField('source_revision'),
+        ModelField('source_secret'),
+        ModelField('source_type', required=True),
+        ModelField('source_url'),
+        ModelField('status'),
+        ModelField('status_details', 'model', 'BuildStatus'),
+        ModelField('strategy_size', required=True),
+        ModelField('strategy_spec_file'),
+        ModelField('strategy_type', required=True),
+        ModelField('timeout'),
+    ),
+    'BuildList': (
+        ModelField('builds', 'list', 'Build', required=True),
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+    ),
+    'BuildParam': (
+        ModelField('key'),
+        ModelField('name'),
+        ModelField('reference'),
+        ModelField('type', required=True),
+        ModelField('value'),
+    ),
+    'BuildParamPrototype': (
+        ModelField('key'),
+        ModelField('name'),
+        ModelField('reference'),
+        ModelField('type', required=True),
+        ModelField('value'),
+    ),
+    'BuildPatch': (
+        ModelField('output_image'),
+        ModelField('output_secret'),
+        ModelField('run_build_params', 'list', 'BuildParamPrototype'),
+        ModelField('source_context_dir'),
+        ModelField('source_revision'),
+        ModelField('source_secret'),
+        ModelField('source_type'),
+        ModelField('source_url'),
+        ModelField('strategy_size'),
+        ModelField('strategy_spec_file'),
+        ModelField('strategy_type'),
+        ModelField('timeout'),
+    ),
+    'BuildRun': (
+        ModelField('build_name', required=True),
+        ModelField('created_at'),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('name', required=True),
+        ModelField('output_image'),
+        ModelField('output_secret'),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+        ModelField('run_build_params', 'list', 'BuildParam', required=True),
+        ModelField('service_account', required=True),
+        ModelField('source_context_dir'),
+        ModelField('source_revision'),
+        ModelField('source_secret'),
+        ModelField('source_type', required=True),
+        ModelField('source_url'),
+        ModelField('status'),
+        ModelField('status_details', 'model', 'BuildRunStatus'),
+        ModelField('strategy_size', required=True),
+        ModelField('strategy_spec_file'),
+        ModelField('strategy_type', required=True),
+        ModelField('timeout'),
+    ),
+    'BuildRunList': (
+        ModelField('build_runs', 'list', 'BuildRun', required=True),
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+    ),
+    'BuildRunStatus': (
+        ModelField('completion_time'),
+        ModelField('git_branch_name'),
+        ModelField('git_commit_author'),
+        ModelField('git_commit_sha'),
+        ModelField('output_digest'),
+        ModelField('reason'),
+        ModelField('source_timestamp'),
+        ModelField('start_time'),
+    ),
+    'BuildStatus': (ModelField('reason'),),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
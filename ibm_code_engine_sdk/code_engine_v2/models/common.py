@@ -0,0 +1,997 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models that are shared by several resources, such as environment
+variables, volume mounts, probes and list metadata.
+"""
+
+from enum import Enum
+from typing import Dict, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class ComponentRef:
+    """
+    A reference to another component.
+
+    :param str name: The name of the referenced component.
+    :param str resource_type: The type of the referenced resource.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        resource_type: str,
+    ) -> None:
+        """
+        Initialize a ComponentRef object.
+
+        :param str name: The name of the referenced component.
+        :param str resource_type: The type of the referenced resource.
+        """
+        self.name = name
+        self.resource_type = resource_type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ComponentRef':
+        """Initialize a ComponentRef object from a json dictionary."""
+        args = {}
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError('Required property \'name\' not present in ComponentRef JSON')
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        else:
+            raise ValueError('Required property \'resource_type\' not present in ComponentRef JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ComponentRef object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'resource_type') and self.resource_type is not None:
+            _dict['resource_type'] = self.resource_type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ComponentRef object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ComponentRef') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ComponentRef') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class EnvVar:
+    """
+    Response model for environment variables.
+
+    :param str key: (optional) The key to reference as environment variable.
+    :param str name: (optional) The name of the environment variable.
+    :param str prefix: (optional) A prefix that can be added to all keys of a full
+          secret or config map reference.
+    :param str reference: (optional) The name of the secret or config map.
+    :param str type: Specify the type of the environment variable.
+    :param str value: (optional) The literal value of the environment variable.
+    """
+
+    def __init__(
+        self,
+        type: str,
+        *,
+        key: Optional[str] = None,
+        name: Optional[str] = None,
+        prefix: Optional[str] = None,
+        reference: Optional[str] = None,
+        value: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a EnvVar object.
+
+        :param str type: Specify the type of the environment variable.
+        :param str key: (optional) The key to reference as environment variable.
+        :param str name: (optional) The name of the environment variable.
+        :param str prefix: (optional) A prefix that can be added to all keys of a
+               full secret or config map reference.
+        :param str reference: (optional) The name of the secret or config map.
+        :param str value: (optional) The literal value of the environment variable.
+        """
+        self.key = key
+        self.name = name
+        self.prefix = prefix
+        self.reference = reference
+        self.type = type
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'EnvVar':
+        """Initialize a EnvVar object from a json dictionary."""
+        args = {}
+        if (key := _dict.get('key')) is not None:
+            args['key'] = key
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (prefix := _dict.get('prefix')) is not None:
+            args['prefix'] = prefix
+        if (reference := _dict.get('reference')) is not None:
+            args['reference'] = reference
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        else:
+            raise ValueError('Required property \'type\' not present in EnvVar JSON')
+        if (value := _dict.get('value')) is not None:
+            args['value'] = value
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a EnvVar object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'key') and self.key is not None:
+            _dict['key'] = self.key
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'prefix') and self.prefix is not None:
+            _dict['prefix'] = self.prefix
+        if hasattr(self, 'reference') and self.reference is not None:
+            _dict['reference'] = self.reference
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        if hasattr(self, 'value') and self.value is not None:
+            _dict['value'] = self.value
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this EnvVar object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'EnvVar') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'EnvVar') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the environment variable.
+        """
+
+        LITERAL = 'literal'
+        CONFIG_MAP_FULL_REFERENCE = 'config_map_full_reference'
+        SECRET_FULL_REFERENCE = 'secret_full_reference'
+        CONFIG_MAP_KEY_REFERENCE = 'config_map_key_reference'
+        SECRET_KEY_REFERENCE = 'secret_key_reference'
+
+
+class EnvVarPrototype:
+    """
+    Prototype model for environment variables.
+
+    :param str key: (optional) The key to reference as environment variable.
+    :param str name: (optional) The name of the environment variable.
+    :param str prefix: (optional) A prefix that can be added to all keys of a full
+          secret or config map reference.
+    :param str reference: (optional) The name of the secret or config map.
+    :param str type: (optional) Specify the type of the environment variable.
+    :param str value: (optional) The literal value of the environment variable.
+    """
+
+    def __init__(
+        self,
+        *,
+        key: Optional[str] = None,
+        name: Optional[str] = None,
+        prefix: Optional[str] = None,
+        reference: Optional[str] = None,
+        type: Optional[str] = None,
+        value: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a EnvVarPrototype object.
+
+        :param str key: (optional) The key to reference as environment variable.
+        :param str name: (optional) The name of the environment variable.
+        :param str prefix: (optional) A prefix that can be added to all keys of a
+               full secret or config map reference.
+        :param str reference: (optional) The name of the secret or config map.
+        :param str type: (optional) Specify the type of the environment variable.
+        :param str value: (optional) The literal value of the environment variable.
+        """
+        self.key = key
+        self.name = name
+        self.prefix = prefix
+        self.reference = reference
+        self.type = type
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'EnvVarPrototype':
+        """Initialize a EnvVarPrototype object from a json dictionary."""
+        args = {}
+        if (key := _dict.get('key')) is not None:
+            args['key'] = key
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (prefix := _dict.get('prefix')) is not None:
+            args['prefix'] = prefix
+        if (reference := _dict.get('reference')) is not None:
+            args['reference'] = reference
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        if (value := _dict.get('value')) is not None:
+            args['value'] = value
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a EnvVarPrototype object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'key') and self.key is not None:
+            _dict['key'] = self.key
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'prefix') and self.prefix is not None:
+            _dict['prefix'] = self.prefix
+        if hasattr(self, 'reference') and self.reference is not None:
+            _dict['reference'] = self.reference
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        if hasattr(self, 'value') and self.value is not None:
+            _dict['value'] = self.value
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this EnvVarPrototype object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'EnvVarPrototype') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'EnvVarPrototype') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the environment variable.
+        """
+
+        LITERAL = 'literal'
+        CONFIG_MAP_FULL_REFERENCE = 'config_map_full_reference'
+        SECRET_FULL_REFERENCE = 'secret_full_reference'
+        CONFIG_MAP_KEY_REFERENCE = 'config_map_key_reference'
+        SECRET_KEY_REFERENCE = 'secret_key_reference'
+
+
+class ListFirstMetadata:
+    """
+    Describes properties needed to retrieve the first page of a result list.
+
+    :param str href: (optional) Href that points to the first page.
+    """
+
+    def __init__(
+        self,
+        *,
+        href: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ListFirstMetadata object.
+
+        :param str href: (optional) Href that points to the first page.
+        """
+        self.href = href
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ListFirstMetadata':
+        """Initialize a ListFirstMetadata object from a json dictionary."""
+        args = {}
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ListFirstMetadata object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'href') and self.href is not None:
+            _dict['href'] = self.href
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ListFirstMetadata object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ListFirstMetadata') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ListFirstMetadata') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ListNextMetadata:
+    """
+    Describes properties needed to retrieve the next page of a result list.
+
+    :param str href: (optional) Href that points to the next page.
+    :param str start: (optional) Token.
+    """
+
+    def __init__(
+        self,
+        *,
+        href: Optional[str] = None,
+        start: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ListNextMetadata object.
+
+        :param str href: (optional) Href that points to the next page.
+        :param str start: (optional) Token.
+        """
+        self.href = href
+        self.start = start
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ListNextMetadata':
+        """Initialize a ListNextMetadata object from a json dictionary."""
+        args = {}
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (start := _dict.get('start')) is not None:
+            args['start'] = start
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ListNextMetadata object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'href') and self.href is not None:
+            _dict['href'] = self.href
+        if hasattr(self, 'start') and self.start is not None:
+            _dict['start'] = self.start
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ListNextMetadata object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ListNextMetadata') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ListNextMetadata') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class Probe:
+    """
+    Response model for probes.
+
+    :param int failure_threshold: (optional) The number of consecutive, unsuccessful
+          checks for the probe to be considered failed.
+    :param int initial_delay: (optional) The amount of time in seconds to wait
+          before the first probe check is performed.
+    :param int interval: (optional) The amount of time in seconds between probe
+          checks.
+    :param str path: (optional) The path of the HTTP request to the resource. A path
+          is only supported for a probe with a `type` of `http`.
+    :param int port: (optional) The port on which to probe the resource.
+    :param int timeout: (optional) The amount of time in seconds that the probe
+          waits for a response from the application before it times out and fails.
+    :param str type: Specifies whether to use HTTP or TCP for the probe checks. The
+          default is TCP.
+    """
+
+    def __init__(
+        self,
+        type: str,
+        *,
+        failure_threshold: Optional[int] = None,
+        initial_delay: Optional[int] = None,
+        interval: Optional[int] = None,
+        path: Optional[str] = None,
+        port: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a Probe object.
+
+        :param str type: Specifies whether to use HTTP or TCP for the probe checks.
+               The default is TCP.
+        :param int failure_threshold: (optional) The number of consecutive,
+               unsuccessful checks for the probe to be considered failed.
+        :param int initial_delay: (optional) The amount of time in seconds to wait
+               before the first probe check is performed.
+        :param int interval: (optional) The amount of time in seconds between probe
+               checks.
+        :param str path: (optional) The path of the HTTP request to the resource. A
+               path is only supported for a probe with a `type` of `http`.
+        :param int port: (optional) The port on which to probe the resource.
+        :param int timeout: (optional) The amount of time in seconds that the probe
+               waits for a response from the application before it times out and fails.
+        """
+        self.failure_threshold = failure_threshold
+        self.initial_delay = initial_delay
+        self.interval = interval
+        self.path = path
+        self.port = port
+        self.timeout = timeout
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Probe':
+        """Initialize a Probe object from a json dictionary."""
+        args = {}
+        if (failure_threshold := _dict.get('failure_threshold')) is not None:
+            args['failure_threshold'] = failure_threshold
+        if (initial_delay := _dict.get('initial_delay')) is not None:
+            args['initial_delay'] = initial_delay
+        if (interval := _dict.get('interval')) is not None:
+            args['interval'] = interval
+        if (path := _dict.get('path')) is not None:
+            args['path'] = path
+        if (port := _dict.get('port')) is not None:
+            args['port'] = port
+        if (timeout := _dict.get('timeout')) is not None:
+            args['timeout'] = timeout
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        else:
+            raise ValueError('Required property \'type\' not present in Probe JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Probe object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'failure_threshold') and self.failure_threshold is not None:
+            _dict['failure_threshold'] = self.failure_threshold
+        if hasattr(self, 'initial_delay') and self.initial_delay is not None:
+            _dict['initial_delay'] = self.initial_delay
+        if hasattr(self, 'interval') and self.interval is not None:
+            _dict['interval'] = self.interval
+        if hasattr(self, 'path') and self.path is not None:
+            _dict['path'] = self.path
+        if hasattr(self, 'port') and self.port is not None:
+            _dict['port'] = self.port
+        if hasattr(self, 'timeout') and self.timeout is not None:
+            _dict['timeout'] = self.timeout
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Probe object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Probe') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Probe') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class TypeEnum(str, Enum):
+        """
+        Specifies whether to use HTTP or TCP for the probe checks. The default is TCP.
+        """
+
+        TCP = 'tcp'
+        HTTP = 'http'
+
+
+class ProbePrototype:
+    """
+    Request model for probes.
+
+    :param int failure_threshold: (optional) The number of consecutive, unsuccessful
+          checks for the probe to be considered failed.
+    :param int initial_delay: (optional) The amount of time in seconds to wait
+          before the first probe check is performed.
+    :param int interval: (optional) The amount of time in seconds between probe
+          checks.
+    :param str path: (optional) The path of the HTTP request to the resource. A path
+          is only supported for a probe with a `type` of `http`.
+    :param int port: (optional) The port on which to probe the resource.
+    :param int timeout: (optional) The amount of time in seconds that the probe
+          waits for a response from the application before it times out and fails.
+    :param str type: (optional) Specifies whether to use HTTP or TCP for the probe
+          checks. The default is TCP.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: Optional[int] = None,
+        initial_delay: Optional[int] = None,
+        interval: Optional[int] = None,
+        path: Optional[str] = None,
+        port: Optional[int] = None,
+        timeout: Optional[int] = None,
+        type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ProbePrototype object.
+
+        :param int failure_threshold: (optional) The number of consecutive,
+               unsuccessful checks for the probe to be considered failed.
+        :param int initial_delay: (optional) The amount of time in seconds to wait
+               before the first probe check is performed.
+        :param int interval: (optional) The amount of time in seconds between probe
+               checks.
+        :param str path: (optional) The path of the HTTP request to the resource. A
+               path is only supported for a probe with a `type` of `http`.
+        :param int port: (optional) The port on which to probe the resource.
+        :param int timeout: (optional) The amount of time in seconds that the probe
+               waits for a response from the application before it times out and fails.
+        :param str type: (optional) Specifies whether to use HTTP or TCP for the
+               probe checks. The default is TCP.
+        """
+        self.failure_threshold = failure_threshold
+        self.initial_delay = initial_delay
+        self.interval = interval
+        self.path = path
+        self.port = port
+        self.timeout = timeout
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ProbePrototype':
+        """Initialize a ProbePrototype object from a json dictionary."""
+        args = {}
+        if (failure_threshold := _dict.get('failure_threshold')) is not None:
+            args['failure_threshold'] = failure_threshold
+        if (initial_delay := _dict.get('initial_delay')) is not None:
+            args['initial_delay'] = initial_delay
+        if (interval := _dict.get('interval')) is not None:
+            args['interval'] = interval
+        if (path := _dict.get('path')) is not None:
+            args['path'] = path
+        if (port := _dict.get('port')) is not None:
+            args['port'] = port
+        if (timeout := _dict.get('timeout')) is not None:
+            args['timeout'] = timeout
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ProbePrototype object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'failure_threshold') and self.failure_threshold is not None:
+            _dict['failure_threshold'] = self.failure_threshold
+        if hasattr(self, 'initial_delay') and self.initial_delay is not None:
+            _dict['initial_delay'] = self.initial_delay
+        if hasattr(self, 'interval') and self.interval is not None:
+            _dict['interval'] = self.interval
+        if hasattr(self, 'path') and self.path is not None:
+            _dict['path'] = self.path
+        if hasattr(self, 'port') and self.port is not None:
+            _dict['port'] = self.port
+        if hasattr(self, 'timeout') and self.timeout is not None:
+            _dict['timeout'] = self.timeout
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ProbePrototype object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ProbePrototype') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ProbePrototype') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class TypeEnum(str, Enum):
+        """
+        Specifies whether to use HTTP or TCP for the probe checks. The default is TCP.
+        """
+
+        TCP = 'tcp'
+        HTTP = 'http'
+
+
+class VolumeMount:
+    """
+    Response model of a volume mount.
+
+    :param str mount_path: The path that should be mounted.
+    :param bool read_only: (optional) Optional flag for a volume mount of type
+          'persistent_data_store' to specify whether it is read-only.
+    :param str reference: The name of the referenced secret, config map, or
+          persistent data store.
+    :param str sub_path: (optional) The path mounted at the mount path.
+    :param str type: Specify the type of the volume mount. Allowed types are:
+          'config_map', 'persistent_data_store', 'secret'.
+    """
+
+    def __init__(
+        self,
+        mount_path: str,
+        reference: str,
+        type: str,
+        *,
+        read_only: Optional[bool] = None,
+        sub_path: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a VolumeMount object.
+
+        :param str mount_path: The path that should be mounted.
+        :param str reference: The name of the referenced secret, config map, or
+               persistent data store.
+        :param str type: Specify the type of the volume mount. Allowed types are:
+               'config_map', 'persistent_data_store', 'secret'.
+        :param bool read_only: (optional) Optional flag for a volume mount of type
+               'persistent_data_store' to specify whether it is read-only.
+        :param str sub_path: (optional) The path mounted at the mount path.
+        """
+        self.mount_path = mount_path
+        self.read_only = read_only
+        self.reference = reference
+        self.sub_path = sub_path
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'VolumeMount':
+        """Initialize a VolumeMount object from a json dictionary."""
+        args = {}
+        if (mount_path := _dict.get('mount_path')) is not None:
+            args['mount_path'] = mount_path
+        else:
+            raise ValueError('Required property \'mount_path\' not present in VolumeMount JSON')
+        if (read_only := _dict.get('read_only')) is not None:
+            args['read_only'] = read_only
+        if (reference := _dict.get('reference')) is not None:
+            args['reference'] = reference
+        else:
+            raise ValueError('Required property \'reference\' not present in VolumeMount JSON')
+        if (sub_path := _dict.get('sub_path')) is not None:
+            args['sub_path'] = sub_path
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        else:
+            raise ValueError('Required property \'type\' not present in VolumeMount JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a VolumeMount object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'mount_path') and self.mount_path is not None:
+            _dict['mount_path'] = self.mount_path
+        if hasattr(self, 'read_only') and self.read_only is not None:
+            _dict['read_only'] = self.read_only
+        if hasattr(self, 'reference') and self.reference is not None:
+            _dict['reference'] = self.reference
+        if hasattr(self, 'sub_path') and self.sub_path is not None:
+            _dict['sub_path'] = self.sub_path
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this VolumeMount object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'VolumeMount') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'VolumeMount') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the volume mount. Allowed types are: 'config_map',
+        'persistent_data_store', 'secret'.
+        """
+
+        CONFIG_MAP = 'config_map'
+        PERSISTENT_DATA_STORE = 'persistent_data_store'
+        SECRET = 'secret'
+
+
+class VolumeMountPrototype:
+    """
+    Prototype model of a volume mount.
+
+    :param str mount_path: The path that should be mounted.
+    :param bool read_only: (optional) Optional flag for a volume mount of type
+          'persistent_data_store' to specify whether it is read-only.
+    :param str reference: The name of the referenced secret, config map, or
+          persistent data store.
+    :param str sub_path: (optional) The path mounted at the mount path.
+    :param str type: Specify the type of the volume mount. Allowed types are:
+          'config_map', 'persistent_data_store', 'secret'.
+    """
+
+    def __init__(
+        self,
+        mount_path: str,
+        reference: str,
+        type: str,
+        *,
+        read_only: Optional[bool] = None,
+        sub_path: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a VolumeMountPrototype object.
+
+        :param str mount_path: The path that should be mounted.
+        :param str reference: The name of the referenced secret, config map, or
+               persistent data store.
+        :param str type: Specify the type of the volume mount. Allowed types are:
+               'config_map', 'persistent_data_store', 'secret'.
+        :param bool read_only: (optional) Optional flag for a volume mount of type
+               'persistent_data_store' to specify whether it is read-only.
+        :param str sub_path: (optional) The path mounted at the mount path.
+        """
+        self.mount_path = mount_path
+        self.read_only = read_only
+        self.reference = reference
+        self.sub_path = sub_path
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'VolumeMountPrototype':
+        """Initialize a VolumeMountPrototype object from a json dictionary."""
+        args = {}
+        if (mount_path := _dict.get('mount_path')) is not None:
+            args['mount_path'] = mount_path
+        else:
+            raise ValueError('Required property \'mount_path\' not present in VolumeMountPrototype JSON')
+        if (read_only := _dict.get('read_only')) is not None:
+            args['read_only'] = read_only
+        if (reference := _dict.get('reference')) is not None:
+            args['reference'] = reference
+        else:
+            raise ValueError('Required property \'reference\' not present in VolumeMountPrototype JSON')
+        if (sub_path := _dict.get('sub_path')) is not None:
+            args['sub_path'] = sub_path
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        else:
+            raise ValueError('Required property \'type\' not present in VolumeMountPrototype JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a VolumeMountPrototype object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'mount_path') and self.mount_path is not None:
+            _dict['mount_path'] = self.mount_path
+        if hasattr(self, 'read_only') and self.read_only is not None:
+            _dict['read_only'] = self.read_only
+        if hasattr(self, 'reference') and self.reference is not None:
+            _dict['reference'] = self.reference
+        if hasattr(self, 'sub_path') and self.sub_path is not None:
+            _dict['sub_path'] = self.sub_path
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this VolumeMountPrototype object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'VolumeMountPrototype') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'VolumeMountPrototype') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class TypeEnum(str, Enum):
+        """
+        Specify the type of the volume mount. Allowed types are: 'config_map',
+        'persistent_data_store', 'secret'.
+        """
+
+        CONFIG_MAP = 'config_map'
+        PERSISTENT_DATA_STORE = 'persistent_data_store'
+        SECRET = 'secret'
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'ComponentRef': (
+        ModelField('name', required=True),
+        ModelField('resource_type', required=True),
+    ),
+    'EnvVar': (
+        ModelField('key'),
+        ModelField('name'),
+        ModelField('prefix'),
+        ModelField('reference'),
+        ModelField('type', required=True),
+        ModelField('value'),
+    ),
+    'EnvVarPrototype': (
+        ModelField('key'),
+        ModelField('name'),
+        ModelField('prefix'),
+        ModelField('reference'),
+        ModelField('type'),
+        ModelField('value'),
+    ),
+    'ListFirstMetadata': (ModelField('href'),),
+    'ListNextMetadata': (
+        ModelField('href'),
+        ModelField('start'),
+    ),
+    'Probe': (
+        ModelField('failure_threshold'),
+        ModelField('initial_delay'),
+        ModelField('interval'),
+        ModelField('path'),
+        ModelField('port'),
+        ModelField('timeout'),
+        ModelField('type', required=True),
+    ),
+    'ProbePrototype': (
+        ModelField('failure_threshold'),
+        ModelField('initial_delay'),
+        ModelField('interval'),
+        ModelField('path'),
+        ModelField('port'),
+        ModelField('timeout'),
+        ModelField('type'),
+    ),
+    'VolumeMount': (
+        ModelField('mount_path', required=True),
+        ModelField('read_only'),
+        ModelField('reference', required=True),
+        ModelField('sub_path'),
+        ModelField('type', required=True),
+    ),
+    'VolumeMountPrototype': (
+        ModelField('mount_path', required=True),
+        ModelField('read_only'),
+        ModelField('reference', required=True),
+        ModelField('sub_path'),
+        ModelField('type', required=True),
+    ),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
@@ -0,0 +1,299 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models of config maps.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+from .common import ListFirstMetadata, ListNextMetadata
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class ConfigMap:
+    """
+    Describes the model of a configmap.
+
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param dict data: (optional) The key-value pair for the config map. Values must
+          be specified in `KEY=VALUE` format.
+    :param str entity_tag: The version of the config map instance, which is used to
+          achieve optimistic locking.
+    :param str href: (optional) When you provision a new config map,  a URL is
+          created identifying the location of the instance.
+    :param str id: (optional) The identifier of the resource.
+    :param str name: The name of the config map.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the config map.
+    """
+
+    def __init__(
+        self,
+        entity_tag: str,
+        name: str,
+        *,
+        created_at: Optional[str] = None,
+        data: Optional[dict] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ConfigMap object.
+
+        :param str entity_tag: The version of the config map instance, which is
+               used to achieve optimistic locking.
+        :param str name: The name of the config map.
+        :param dict data: (optional) The key-value pair for the config map. Values
+               must be specified in `KEY=VALUE` format.
+        """
+        self.created_at = created_at
+        self.data = data
+        self.entity_tag = entity_tag
+        self.href = href
+        self.id = id
+        self.name = name
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ConfigMap':
+        """Initialize a ConfigMap object from a json dictionary."""
+        args = {}
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (data := _dict.get('data')) is not None:
+            args['data'] = data
+        if (entity_tag := _dict.get('entity_tag')) is not None:
+            args['entity_tag'] = entity_tag
+        else:
+            raise ValueError('Required property \'entity_tag\' not present in ConfigMap JSON')
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError('Required property \'name\' not present in ConfigMap JSON')
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ConfigMap object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'data') and self.data is not None:
+            _dict['data'] = self.data
+        if hasattr(self, 'entity_tag') and self.entity_tag is not None:
+            _dict['entity_tag'] = self.entity_tag
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ConfigMap object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ConfigMap') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ConfigMap') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the config map.
+        """
+
+        CONFIG_MAP_V2 = 'config_map_v2'
+
+
+class ConfigMapList:
+    """
+    Contains a list of config maps and pagination information.
+
+    :param List[ConfigMap] config_maps: List of all config maps.
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    """
+
+    def __init__(
+        self,
+        config_maps: List['ConfigMap'],
+        limit: int,
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a ConfigMapList object.
+
+        :param List[ConfigMap] config_maps: List of all config maps.
+        :param int limit: Maximum number of resources per page.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.config_maps = config_maps
+        self.first = first
+        self.limit = limit
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ConfigMapList':
+        """Initialize a ConfigMapList object from a json dictionary."""
+        args = {}
+        if (config_maps := _dict.get('config_maps')) is not None:
+            args['config_maps'] = [ConfigMap.from_dict(v) for v in config_maps]
+        else:
+            raise ValueError('Required property \'config_maps\' not present in ConfigMapList JSON')
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in ConfigMapList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ConfigMapList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'config_maps') and self.config_maps is not None:
+            config_maps_list = []
+            for v in self.config_maps:
+                if isinstance(v, dict):
+                    config_maps_list.append(v)
+                else:
+                    config_maps_list.append(v.to_dict())
+            _dict['config_maps'] = config_maps_list
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ConfigMapList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ConfigMapList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ConfigMapList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'ConfigMap': (
+        ModelField('created_at'),
+        ModelField('data'),
+        ModelField('entity_tag', required=True),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('name', required=True),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+    ),
+    'ConfigMapList': (
+        ModelField('config_maps', 'list', 'ConfigMap', required=True),
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+    ),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
@@ -0,0 +1,534 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models of domain mappings.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+from .common import ComponentRef, ListFirstMetadata, ListNextMetadata
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class DomainMapping:
+    """
+    Response model for domain mapping definitions.
+
+    :param str cname_target: (optional) The value of the CNAME record that must be
+          configured in the DNS settings of the domain, to route traffic properly to the
+          target Code Engine region.
+    :param ComponentRef component: A reference to another component.
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param str entity_tag: The version of the domain mapping instance, which is used
+          to achieve optimistic locking.
+    :param str href: (optional) When you provision a new domain mapping, a URL is
+          created identifying the location of the instance.
+    :param str id: (optional) The identifier of the resource.
+    :param str name: The name of the domain mapping.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the Code Engine resource.
+    :param str status: (optional) The current status of the domain mapping.
+    :param DomainMappingStatus status_details: (optional) The detailed status of the
+          domain mapping.
+    :param str tls_secret: The name of the TLS secret that includes the certificate
+          and private key of this domain mapping.
+    :param bool user_managed: (optional) Specifies whether the domain mapping is
+          managed by the user or by Code Engine.
+    :param str visibility: (optional) Specifies whether the domain mapping is
+          reachable through the public internet, or private IBM network, or only through
+          other components within the same Code Engine project.
+    """
+
+    def __init__(
+        self,
+        component: 'ComponentRef',
+        entity_tag: str,
+        name: str,
+        tls_secret: str,
+        *,
+        cname_target: Optional[str] = None,
+        created_at: Optional[str] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        status: Optional[str] = None,
+        status_details: Optional['DomainMappingStatus'] = None,
+        user_managed: Optional[bool] = None,
+        visibility: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a DomainMapping object.
+
+        :param ComponentRef component: A reference to another component.
+        :param str entity_tag: The version of the domain mapping instance, which is
+               used to achieve optimistic locking.
+        :param str name: The name of the domain mapping.
+        :param str tls_secret: The name of the TLS secret that includes the
+               certificate and private key of this domain mapping.
+        :param DomainMappingStatus status_details: (optional) The detailed status
+               of the domain mapping.
+        """
+        self.cname_target = cname_target
+        self.component = component
+        self.created_at = created_at
+        self.entity_tag = entity_tag
+        self.href = href
+        self.id = id
+        self.name = name
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+        self.status = status
+        self.status_details = status_details
+        self.tls_secret = tls_secret
+        self.user_managed = user_managed
+        self.visibility = visibility
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DomainMapping':
+        """Initialize a DomainMapping object from a json dictionary."""
+        args = {}
+        if (cname_target := _dict.get('cname_target')) is not None:
+            args['cname_target'] = cname_target
+        if (component := _dict.get('component')) is not None:
+            args['component'] = ComponentRef.from_dict(component)
+        else:
+            raise ValueError('Required property \'component\' not present in DomainMapping JSON')
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (entity_tag := _dict.get('entity_tag')) is not None:
+            args['entity_tag'] = entity_tag
+        else:
+            raise ValueError('Required property \'entity_tag\' not present in DomainMapping JSON')
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError('Required property \'name\' not present in DomainMapping JSON')
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_details := _dict.get('status_details')) is not None:
+            args['status_details'] = DomainMappingStatus.from_dict(status_details)
+        if (tls_secret := _dict.get('tls_secret')) is not None:
+            args['tls_secret'] = tls_secret
+        else:
+            raise ValueError('Required property \'tls_secret\' not present in DomainMapping JSON')
+        if (user_managed := _dict.get('user_managed')) is not None:
+            args['user_managed'] = user_managed
+        if (visibility := _dict.get('visibility')) is not None:
+            args['visibility'] = visibility
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DomainMapping object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'cname_target') and getattr(self, 'cname_target') is not None:
+            _dict['cname_target'] = getattr(self, 'cname_target')
+        if hasattr(self, 'component') and self.component is not None:
+            if isinstance(self.component, dict):
+                _dict['component'] = self.component
+            else:
+                _dict['component'] = self.component.to_dict()
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'entity_tag') and self.entity_tag is not None:
+            _dict['entity_tag'] = self.entity_tag
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        if hasattr(self, 'status_details') and self.status_details is not None:
+            if isinstance(self.status_details, dict):
+                _dict['status_details'] = self.status_details
+            else:
+                _dict['status_details'] = self.status_details.to_dict()
+        if hasattr(self, 'tls_secret') and self.tls_secret is not None:
+            _dict['tls_secret'] = self.tls_secret
+        if hasattr(self, 'user_managed') and getattr(self, 'user_managed') is not None:
+            _dict['user_managed'] = getattr(self, 'user_managed')
+        if hasattr(self, 'visibility') and getattr(self, 'visibility') is not None:
+            _dict['visibility'] = getattr(self, 'visibility')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DomainMapping object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DomainMapping') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DomainMapping') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the Code Engine resource.
+        """
+
+        DOMAIN_MAPPING_V2 = 'domain_mapping_v2'
+
+    class StatusEnum(str, Enum):
+        """
+        The current status of the domain mapping.
+        """
+
+        READY = 'ready'
+        FAILED = 'failed'
+        DEPLOYING = 'deploying'
+
+    class VisibilityEnum(str, Enum):
+        """
+        Specifies whether the domain mapping is reachable through the public internet, or
+        private IBM network, or only through other components within the same Code Engine
+        project.
+        """
+
+        CUSTOM = 'custom'
+        PRIVATE = 'private'
+        PROJECT = 'project'
+        PUBLIC = 'public'
+
+
+class DomainMappingList:
+    """
+    Contains a list of domain mappings and pagination information.
+
+    :param List[DomainMapping] domain_mappings: List of all domain mappings.
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    """
+
+    def __init__(
+        self,
+        domain_mappings: List['DomainMapping'],
+        limit: int,
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a DomainMappingList object.
+
+        :param List[DomainMapping] domain_mappings: List of all domain mappings.
+        :param int limit: Maximum number of resources per page.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.domain_mappings = domain_mappings
+        self.first = first
+        self.limit = limit
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DomainMappingList':
+        """Initialize a DomainMappingList object from a json dictionary."""
+        args = {}
+        if (domain_mappings := _dict.get('domain_mappings')) is not None:
+            args['domain_mappings'] = [DomainMapping.from_dict(v) for v in domain_mappings]
+        else:
+            raise ValueError('Required property \'domain_mappings\' not present in DomainMappingList JSON')
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in DomainMappingList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DomainMappingList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'domain_mappings') and self.domain_mappings is not None:
+            domain_mappings_list = []
+            for v in self.domain_mappings:
+                if isinstance(v, dict):
+                    domain_mappings_list.append(v)
+                else:
+                    domain_mappings_list.append(v.to_dict())
+            _dict['domain_mappings'] = domain_mappings_list
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DomainMappingList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DomainMappingList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DomainMappingList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class DomainMappingPatch:
+    """
+    Patch a domain mappings object.
+
+    :param ComponentRef component: (optional) A reference to another component.
+    :param str tls_secret: (optional) The name of the TLS secret that includes the
+          certificate and private key of this domain mapping.
+    """
+
+    def __init__(
+        self,
+        *,
+        component: Optional['ComponentRef'] = None,
+        tls_secret: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a DomainMappingPatch object.
+
+        :param ComponentRef component: (optional) A reference to another component.
+        :param str tls_secret: (optional) The name of the TLS secret that includes
+               the certificate and private key of this domain mapping.
+        """
+        self.component = component
+        self.tls_secret = tls_secret
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DomainMappingPatch':
+        """Initialize a DomainMappingPatch object from a json dictionary."""
+        args = {}
+        if (component := _dict.get('component')) is not None:
+            args['component'] = ComponentRef.from_dict(component)
+        if (tls_secret := _dict.get('tls_secret')) is not None:
+            args['tls_secret'] = tls_secret
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DomainMappingPatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'component') and self.component is not None:
+            if isinstance(self.component, dict):
+                _dict['component'] = self.component
+            else:
+                _dict['component'] = self.component.to_dict()
+        if hasattr(self, 'tls_secret') and self.tls_secret is not None:
+            _dict['tls_secret'] = self.tls_secret
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DomainMappingPatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DomainMappingPatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DomainMappingPatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class DomainMappingStatus:
+    """
+    The detailed status of the domain mapping.
+
+    :param str reason: (optional) Optional information to provide more context in
+          case of a 'failed' or 'warning' status.
+    """
+
+    def __init__(
+        self,
+        *,
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a DomainMappingStatus object.
+
+        """
+        self.reason = reason
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DomainMappingStatus':
+        """Initialize a DomainMappingStatus object from a json dictionary."""
+        args = {}
+        if (reason := _dict.get('reason')) is not None:
+            args['reason'] = reason
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DomainMappingStatus object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'reason') and getattr(self, 'reason') is not None:
+            _dict['reason'] = getattr(self, 'reason')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DomainMappingStatus object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DomainMappingStatus') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DomainMappingStatus') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ReasonEnum(str, Enum):
+        """
+        Optional information to provide more context in case of a 'failed' or 'warning'
+        status.
+        """
+
+        READY = 'ready'
+        DOMAIN_ALREADY_CLAIMED = 'domain_already_claimed'
+        APP_REF_FAILED = 'app_ref_failed'
+        FAILED_RECONCILE_INGRESS = 'failed_reconcile_ingress'
+        DEPLOYING = 'deploying'
+        FAILED = 'failed'
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'DomainMapping': (
+        ModelField('cname_target'),
+        ModelField('component', 'model', 'ComponentRef', required=True),
+        ModelField('created_at'),
+        ModelField('entity_tag', required=True),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('name', required=True),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+        ModelField('status'),
+        ModelField('status_details', 'model', 'DomainMappingStatus'),
+        ModelField('tls_secret', required=True),
+        ModelField('user_managed'),
+        ModelField('visibility'),
+    ),
+    'DomainMappingList': (
+        ModelField('domain_mappings', 'list', 'DomainMapping', required=True),
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+    ),
+    'DomainMappingPatch': (
+        ModelField('component', 'model', 'ComponentRef'),
+        ModelField('tls_secret'),
+    ),
+    'DomainMappingStatus': (ModelField('reason'),),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
@@ -0,0 +1,1045 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models of functions and function runtimes.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+from .common import EnvVar, EnvVarPrototype, ListFirstMetadata, ListNextMetadata
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class Function:
+    """
+    Function is the response model for function resources.
+
+    :param bool code_binary: Specifies whether the code is binary or not. Defaults
+          to false when `code_reference` is set to a data URL. When `code_reference` is
+          set to a code bundle URL, this field is always true.
+    :param str code_main: (optional) Specifies the name of the function that should
+          be invoked.
+    :param str code_reference: Specifies either a reference to a code bundle or the
+          source code itself. To specify the source code, use the data URL scheme and
+          include the source code as base64 encoded. The data URL scheme is defined in
+          [RFC 2397](https://tools.ietf.org/html/rfc2397).
+    :param str code_secret: (optional) The name of the secret that is used to access
+          the specified `code_reference`. The secret is used to authenticate with a
+          non-public endpoint that is specified as`code_reference`.
+    :param List[EnvVar] computed_env_variables: References to config maps, secrets
+          or literal values, which are defined and set by Code Engine and are exposed as
+          environment variables in the function.
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param str endpoint: (optional) URL to invoke the function.
+    :param str endpoint_internal: (optional) URL to function that is only visible
+          within the project.
+    :param str entity_tag: The version of the function instance, which is used to
+          achieve optimistic locking.
+    :param str href: (optional) When you provision a new function, a relative URL
+          path is created identifying the location of the instance.
+    :param str id: (optional) The identifier of the resource.
+    :param str managed_domain_mappings: Optional value controlling which of the
+          system managed domain mappings will be setup for the function. Valid values are
+          'local_public', 'local_private' and 'local'. Visibility can only be
+          'local_private' if the project supports function private visibility.
+    :param str name: The name of the function.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the function.
+    :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+          enable the use of a compute resource token mounted to the container file system.
+    :param List[EnvVar] run_env_variables: References to config maps, secrets or
+          literal values, which are defined by the function owner and are exposed as
+          environment variables in the function.
+    :param str runtime: The managed runtime used to execute the injected code.
+    :param int scale_concurrency: Number of parallel requests handled by a single
+          instance, supported only by Node.js, default is `1`.
+    :param str scale_cpu_limit: Optional amount of CPU set for the instance of the
+          function. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+    :param int scale_down_delay: Optional amount of time in seconds that delays the
+          scale down behavior for a function.
+    :param int scale_max_execution_time: Timeout in secs after which the function is
+          terminated.
+    :param str scale_memory_limit: Optional amount of memory set for the instance of
+          the function. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+          The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param str status: (optional) The current status of the function.
+    :param FunctionStatus status_details: The detailed status of the function.
+    """
+
+    def __init__(
+        self,
+        code_binary: bool,
+        code_reference: str,
+        computed_env_variables: List['EnvVar'],
+        entity_tag: str,
+        managed_domain_mappings: str,
+        name: str,
+        run_env_variables: List['EnvVar'],
+        runtime: str,
+        scale_concurrency: int,
+        scale_cpu_limit: str,
+        scale_down_delay: int,
+        scale_max_execution_time: int,
+        scale_memory_limit: str,
+        status_details: 'FunctionStatus',
+        *,
+        code_main: Optional[str] = None,
+        code_secret: Optional[str] = None,
+        created_at: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        endpoint_internal: Optional[str] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        status: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a Function object.
+
+        :param bool code_binary: Specifies whether the code is binary or not.
+               Defaults to false when `code_reference` is set to a data URL. When
+               `code_reference` is set to a code bundle URL, this field is always true.
+        :param str code_reference: Specifies either a reference to a code bundle or
+               the source code itself. To specify the source code, use the data URL scheme
+               and include the source code as base64 encoded. The data URL scheme is
+               defined in [RFC 2397](https://tools.ietf.org/html/rfc2397).
+        :param List[EnvVar] computed_env_variables: References to config maps,
+               secrets or literal values, which are defined and set by Code Engine and are
+               exposed as environment variables in the function.
+        :param str entity_tag: The version of the function instance, which is used
+               to achieve optimistic locking.
+        :param str managed_domain_mappings: Optional value controlling which of the
+               system managed domain mappings will be setup for the function. Valid values
+               are 'local_public', 'local_private' and 'local'. Visibility can only be
+               'local_private' if the project supports function private visibility.
+        :param str name: The name of the function.
+        :param List[EnvVar] run_env_variables: References to config maps, secrets
+               or literal values, which are defined by the function owner and are exposed
+               as environment variables in the function.
+        :param str runtime: The managed runtime used to execute the injected code.
+        :param int scale_concurrency: Number of parallel requests handled by a
+               single instance, supported only by Node.js, default is `1`.
+        :param str scale_cpu_limit: Optional amount of CPU set for the instance of
+               the function. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param int scale_down_delay: Optional amount of time in seconds that delays
+               the scale down behavior for a function.
+        :param int scale_max_execution_time: Timeout in secs after which the
+               function is terminated.
+        :param str scale_memory_limit: Optional amount of memory set for the
+               instance of the function. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param FunctionStatus status_details: The detailed status of the function.
+        :param str code_main: (optional) Specifies the name of the function that
+               should be invoked.
+        :param str code_secret: (optional) The name of the secret that is used to
+               access the specified `code_reference`. The secret is used to authenticate
+               with a non-public endpoint that is specified as`code_reference`.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        """
+        self.code_binary = code_binary
+        self.code_main = code_main
+        self.code_reference = code_reference
+        self.code_secret = code_secret
+        self.computed_env_variables = computed_env_variables
+        self.created_at = created_at
+        self.endpoint = endpoint
+        self.endpoint_internal = endpoint_internal
+        self.entity_tag = entity_tag
+        self.href = href
+        self.id = id
+        self.managed_domain_mappings = managed_domain_mappings
+        self.name = name
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+        self.run_compute_resource_token_enabled = run_compute_resource_token_enabled
+        self.run_env_variables = run_env_variables
+        self.runtime = runtime
+        self.scale_concurrency = scale_concurrency
+        self.scale_cpu_limit = scale_cpu_limit
+        self.scale_down_delay = scale_down_delay
+        self.scale_max_execution_time = scale_max_execution_time
+        self.scale_memory_limit = scale_memory_limit
+        self.status = status
+        self.status_details = status_details
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Function':
+        """Initialize a Function object from a json dictionary."""
+        args = {}
+        if (code_binary := _dict.get('code_binary')) is not None:
+            args['code_binary'] = code_binary
+        else:
+            raise ValueError('Required property \'code_binary\' not present in Function JSON')
+        if (code_main := _dict.get('code_main')) is not None:
+            args['code_main'] = code_main
+        if (code_reference := _dict.get('code_reference')) is not None:
+            args['code_reference'] = code_reference
+        else:
+            raise ValueError('Required property \'code_reference\' not present in Function JSON')
+        if (code_secret := _dict.get('code_secret')) is not None:
+            args['code_secret'] = code_secret
+        if (computed_env_variables := _dict.get('computed_env_variables')) is not None:
+            args['computed_env_variables'] = [EnvVar.from_dict(v) for v in computed_env_variables]
+        else:
+            raise ValueError('Required property \'computed_env_variables\' not present in Function JSON')
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (endpoint := _dict.get('endpoint')) is not None:
+            args['endpoint'] = endpoint
+        if (endpoint_internal := _dict.get('endpoint_internal')) is not None:
+            args['endpoint_internal'] = endpoint_internal
+        if (entity_tag := _dict.get('entity_tag')) is not None:
+            args['entity_tag'] = entity_tag
+        else:
+            raise ValueError('Required property \'entity_tag\' not present in Function JSON')
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (managed_domain_mappings := _dict.get('managed_domain_mappings')) is not None:
+            args['managed_domain_mappings'] = managed_domain_mappings
+        else:
+            raise ValueError('Required property \'managed_domain_mappings\' not present in Function JSON')
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError('Required property \'name\' not present in Function JSON')
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (run_compute_resource_token_enabled := _dict.get('run_compute_resource_token_enabled')) is not None:
+            args['run_compute_resource_token_enabled'] = run_compute_resource_token_enabled
+        if (run_env_variables := _dict.get('run_env_variables')) is not None:
+            args['run_env_variables'] = [EnvVar.from_dict(v) for v in run_env_variables]
+        else:
+            raise ValueError('Required property \'run_env_variables\' not present in Function JSON')
+        if (runtime := _dict.get('runtime')) is not None:
+            args['runtime'] = runtime
+        else:
+            raise ValueError('Required property \'runtime\' not present in Function JSON')
+        if (scale_concurrency := _dict.get('scale_concurrency')) is not None:
+            args['scale_concurrency'] = scale_concurrency
+        else:
+            raise ValueError('Required property \'scale_concurrency\' not present in Function JSON')
+        if (scale_cpu_limit := _dict.get('scale_cpu_limit')) is not None:
+            args['scale_cpu_limit'] = scale_cpu_limit
+        else:
+            raise ValueError('Required property \'scale_cpu_limit\' not present in Function JSON')
+        if (scale_down_delay := _dict.get('scale_down_delay')) is not None:
+            args['scale_down_delay'] = scale_down_delay
+        else:
+            raise ValueError('Required property \'scale_down_delay\' not present in Function JSON')
+        if (scale_max_execution_time := _dict.get('scale_max_execution_time')) is not None:
+            args['scale_max_execution_time'] = scale_max_execution_time
+        else:
+            raise ValueError('Required property \'scale_max_execution_time\' not present in Function JSON')
+        if (scale_memory_limit := _dict.get('scale_memory_limit')) is not None:
+            args['scale_memory_limit'] = scale_memory_limit
+        else:
+            raise ValueError('Required property \'scale_memory_limit\' not present in Function JSON')
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_details := _dict.get('status_details')) is not None:
+            args['status_details'] = FunctionStatus.from_dict(status_details)
+        else:
+            raise ValueError('Required property \'status_details\' not present in Function JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Function object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'code_binary') and self.code_binary is not None:
+            _dict['code_binary'] = self.code_binary
+        if hasattr(self, 'code_main') and self.code_main is not None:
+            _dict['code_main'] = self.code_main
+        if hasattr(self, 'code_reference') and self.code_reference is not None:
+            _dict['code_reference'] = self.code_reference
+        if hasattr(self, 'code_secret') and self.code_secret is not None:
+            _dict['code_secret'] = self.code_secret
+        if hasattr(self, 'computed_env_variables') and self.computed_env_variables is not None:
+            computed_env_variables_list = []
+            for v in self.computed_env_variables:
+                if isinstance(v, dict):
+                    computed_env_variables_list.append(v)
+                else:
+                    computed_env_variables_list.append(v.to_dict())
+            _dict['computed_env_variables'] = computed_env_variables_list
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'endpoint') and getattr(self, 'endpoint') is not None:
+            _dict['endpoint'] = getattr(self, 'endpoint')
+        if hasattr(self, 'endpoint_internal') and getattr(self, 'endpoint_internal') is not None:
+            _dict['endpoint_internal'] = getattr(self, 'endpoint_internal')
+        if hasattr(self, 'entity_tag') and self.entity_tag is not None:
+            _dict['entity_tag'] = self.entity_tag
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'managed_domain_mappings') and self.managed_domain_mappings is not None:
+            _dict['managed_domain_mappings'] = self.managed_domain_mappings
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'run_compute_resource_token_enabled') and self.run_compute_resource_token_enabled is not None:
+            _dict['run_compute_resource_token_enabled'] = self.run_compute_resource_token_enabled
+        if hasattr(self, 'run_env_variables') and self.run_env_variables is not None:
+            run_env_variables_list = []
+            for v in self.run_env_variables:
+                if isinstance(v, dict):
+                    run_env_variables_list.append(v)
+                else:
+                    run_env_variables_list.append(v.to_dict())
+            _dict['run_env_variables'] = run_env_variables_list
+        if hasattr(self, 'runtime') and self.runtime is not None:
+            _dict['runtime'] = self.runtime
+        if hasattr(self, 'scale_concurrency') and self.scale_concurrency is not None:
+            _dict['scale_concurrency'] = self.scale_concurrency
+        if hasattr(self, 'scale_cpu_limit') and self.scale_cpu_limit is not None:
+            _dict['scale_cpu_limit'] = self.scale_cpu_limit
+        if hasattr(self, 'scale_down_delay') and self.scale_down_delay is not None:
+            _dict['scale_down_delay'] = self.scale_down_delay
+        if hasattr(self, 'scale_max_execution_time') and self.scale_max_execution_time is not None:
+            _dict['scale_max_execution_time'] = self.scale_max_execution_time
+        if hasattr(self, 'scale_memory_limit') and self.scale_memory_limit is not None:
+            _dict['scale_memory_limit'] = self.scale_memory_limit
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        if hasattr(self, 'status_details') and self.status_details is not None:
+            if isinstance(self.status_details, dict):
+                _dict['status_details'] = self.status_details
+            else:
+                _dict['status_details'] = self.status_details.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Function object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Function') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Function') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ManagedDomainMappingsEnum(str, Enum):
+        """
+        Optional value controlling which of the system managed domain mappings will be
+        setup for the function. Valid values are 'local_public', 'local_private' and
+        'local'. Visibility can only be 'local_private' if the project supports function
+        private visibility.
+        """
+
+        LOCAL = 'local'
+        LOCAL_PRIVATE = 'local_private'
+        LOCAL_PUBLIC = 'local_public'
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the function.
+        """
+
+        FUNCTION_V2 = 'function_v2'
+
+    class StatusEnum(str, Enum):
+        """
+        The current status of the function.
+        """
+
+        OFFLINE = 'offline'
+        DEPLOYING = 'deploying'
+        READY = 'ready'
+        FAILED = 'failed'
+
+
+class FunctionList:
+    """
+    Contains a list of functions and pagination information.
+
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param List[Function] functions: List of all functions.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    """
+
+    def __init__(
+        self,
+        functions: List['Function'],
+        limit: int,
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a FunctionList object.
+
+        :param List[Function] functions: List of all functions.
+        :param int limit: Maximum number of resources per page.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.first = first
+        self.functions = functions
+        self.limit = limit
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'FunctionList':
+        """Initialize a FunctionList object from a json dictionary."""
+        args = {}
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (functions := _dict.get('functions')) is not None:
+            args['functions'] = [Function.from_dict(v) for v in functions]
+        else:
+            raise ValueError('Required property \'functions\' not present in FunctionList JSON')
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in FunctionList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a FunctionList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'functions') and self.functions is not None:
+            functions_list = []
+            for v in self.functions:
+                if isinstance(v, dict):
+                    functions_list.append(v)
+                else:
+                    functions_list.append(v.to_dict())
+            _dict['functions'] = functions_list
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this FunctionList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'FunctionList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'FunctionList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class FunctionPatch:
+    """
+    Request model for function update operations.
+
+    :param bool code_binary: (optional) Specifies whether the code is binary or not.
+          Defaults to false when `code_reference` is set to a data URL. When
+          `code_reference` is set to a code bundle URL, this field is always true.
+    :param str code_main: (optional) Specifies the name of the function that should
+          be invoked.
+    :param str code_reference: (optional) Specifies either a reference to a code
+          bundle or the source code itself. To specify the source code, use the data URL
+          scheme and include the source code as base64 encoded. The data URL scheme is
+          defined in [RFC 2397](https://tools.ietf.org/html/rfc2397).
+    :param str code_secret: (optional) The name of the secret that is used to access
+          the specified `code_reference`. The secret is used to authenticate with a
+          non-public endpoint that is specified as`code_reference`.
+    :param str managed_domain_mappings: (optional) Optional value controlling which
+          of the system managed domain mappings will be setup for the function. Valid
+          values are 'local_public', 'local_private' and 'local'. Visibility can only be
+          'local_private' if the project supports function private visibility.
+    :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+          enable the use of a compute resource token mounted to the container file system.
+    :param List[EnvVarPrototype] run_env_variables: (optional) Optional references
+          to config maps, secrets or literal values.
+    :param str runtime: (optional) The managed runtime used to execute the injected
+          code.
+    :param int scale_concurrency: (optional) Number of parallel requests handled by
+          a single instance, supported only by Node.js, default is `1`.
+    :param str scale_cpu_limit: (optional) Optional amount of CPU set for the
+          instance of the function. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+    :param int scale_down_delay: (optional) Optional amount of time in seconds that
+          delays the scale down behavior for a function.
+    :param int scale_max_execution_time: (optional) Timeout in secs after which the
+          function is terminated.
+    :param str scale_memory_limit: (optional) Optional amount of memory set for the
+          instance of the function. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+          The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    """
+
+    def __init__(
+        self,
+        *,
+        code_binary: Optional[bool] = None,
+        code_main: Optional[str] = None,
+        code_reference: Optional[str] = None,
+        code_secret: Optional[str] = None,
+        managed_domain_mappings: Optional[str] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        run_env_variables: Optional[List['EnvVarPrototype']] = None,
+        runtime: Optional[str] = None,
+        scale_concurrency: Optional[int] = None,
+        scale_cpu_limit: Optional[str] = None,
+        scale_down_delay: Optional[int] = None,
+        scale_max_execution_time: Optional[int] = None,
+        scale_memory_limit: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a FunctionPatch object.
+
+        :param bool code_binary: (optional) Specifies whether the code is binary or
+               not. Defaults to false when `code_reference` is set to a data URL. When
+               `code_reference` is set to a code bundle URL, this field is always true.
+        :param str code_main: (optional) Specifies the name of the function that
+               should be invoked.
+        :param str code_reference: (optional) Specifies either a reference to a
+               code bundle or the source code itself. To specify the source code, use the
+               data URL scheme and include the source code as base64 encoded. The data URL
+               scheme is defined in [RFC 2397](https://tools.ietf.org/html/rfc2397).
+        :param str code_secret: (optional) The name of the secret that is used to
+               access the specified `code_reference`. The secret is used to authenticate
+               with a non-public endpoint that is specified as`code_reference`.
+        :param str managed_domain_mappings: (optional) Optional value controlling
+               which of the system managed domain mappings will be setup for the function.
+               Valid values are 'local_public', 'local_private' and 'local'. Visibility
+               can only be 'local_private' if the project supports function private
+               visibility.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        :param List[EnvVarPrototype] run_env_variables: (optional) Optional
+               references to config maps, secrets or literal values.
+        :param str runtime: (optional) The managed runtime used to execute the
+               injected code.
+        :param int scale_concurrency: (optional) Number of parallel requests
+               handled by a single instance, supported only by Node.js, default is `1`.
+        :param str scale_cpu_limit: (optional) Optional amount of CPU set for the
+               instance of the function. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param int scale_down_delay: (optional) Optional amount of time in seconds
+               that delays the scale down behavior for a function.
+        :param int scale_max_execution_time: (optional) Timeout in secs after which
+               the function is terminated.
+        :param str scale_memory_limit: (optional) Optional amount of memory set for
+               the instance of the function. For valid values see [Supported memory and
+               CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        """
+        self.code_binary = code_binary
+        self.code_main = code_main
+        self.code_reference = code_reference
+        self.code_secret = code_secret
+        self.managed_domain_mappings = managed_domain_mappings
+        self.run_compute_resource_token_enabled = run_compute_resource_token_enabled
+        self.run_env_variables = run_env_variables
+        self.runtime = runtime
+        self.scale_concurrency = scale_concurrency
+        self.scale_cpu_limit = scale_cpu_limit
+        self.scale_down_delay = scale_down_delay
+        self.scale_max_execution_time = scale_max_execution_time
+        self.scale_memory_limit = scale_memory_limit
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'FunctionPatch':
+        """Initialize a FunctionPatch object from a json dictionary."""
+        args = {}
+        if (code_binary := _dict.get('code_binary')) is not None:
+            args['code_binary'] = code_binary
+        if (code_main := _dict.get('code_main')) is not None:
+            args['code_main'] = code_main
+        if (code_reference := _dict.get('code_reference')) is not None:
+            args['code_reference'] = code_reference
+        if (code_secret := _dict.get('code_secret')) is not None:
+            args['code_secret'] = code_secret
+        if (managed_domain_mappings := _dict.get('managed_domain_mappings')) is not None:
+            args['managed_domain_mappings'] = managed_domain_mappings
+        if (run_compute_resource_token_enabled := _dict.get('run_compute_resource_token_enabled')) is not None:
+            args['run_compute_resource_token_enabled'] = run_compute_resource_token_enabled
+        if (run_env_variables := _dict.get('run_env_variables')) is not None:
+            args['run_env_variables'] = [EnvVarPrototype.from_dict(v) for v in run_env_variables]
+        if (runtime := _dict.get('runtime')) is not None:
+            args['runtime'] = runtime
+        if (scale_concurrency := _dict.get('scale_concurrency')) is not None:
+            args['scale_concurrency'] = scale_concurrency
+        if (scale_cpu_limit := _dict.get('scale_cpu_limit')) is not None:
+            args['scale_cpu_limit'] = scale_cpu_limit
+        if (scale_down_delay := _dict.get('scale_down_delay')) is not None:
+            args['scale_down_delay'] = scale_down_delay
+        if (scale_max_execution_time := _dict.get('scale_max_execution_time')) is not None:
+            args['scale_max_execution_time'] = scale_max_execution_time
+        if (scale_memory_limit := _dict.get('scale_memory_limit')) is not None:
+            args['scale_memory_limit'] = scale_memory_limit
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a FunctionPatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'code_binary') and self.code_binary is not None:
+            _dict['code_binary'] = self.code_binary
+        if hasattr(self, 'code_main') and self.code_main is not None:
+            _dict['code_main'] = self.code_main
+        if hasattr(self, 'code_reference') and self.code_reference is not None:
+            _dict['code_reference'] = self.code_reference
+        if hasattr(self, 'code_secret') and self.code_secret is not None:
+            _dict['code_secret'] = self.code_secret
+        if hasattr(self, 'managed_domain_mappings') and self.managed_domain_mappings is not None:
+            _dict['managed_domain_mappings'] = self.managed_domain_mappings
+        if hasattr(self, 'run_compute_resource_token_enabled') and self.run_compute_resource_token_enabled is not None:
+            _dict['run_compute_resource_token_enabled'] = self.run_compute_resource_token_enabled
+        if hasattr(self, 'run_env_variables') and self.run_env_variables is not None:
+            run_env_variables_list = []
+            for v in self.run_env_variables:
+                if isinstance(v, dict):
+                    run_env_variables_list.append(v)
+                else:
+                    run_env_variables_list.append(v.to_dict())
+            _dict['run_env_variables'] = run_env_variables_list
+        if hasattr(self, 'runtime') and self.runtime is not None:
+            _dict['runtime'] = self.runtime
+        if hasattr(self, 'scale_concurrency') and self.scale_concurrency is not None:
+            _dict['scale_concurrency'] = self.scale_concurrency
+        if hasattr(self, 'scale_cpu_limit') and self.scale_cpu_limit is not None:
+            _dict['scale_cpu_limit'] = self.scale_cpu_limit
+        if hasattr(self, 'scale_down_delay') and self.scale_down_delay is not None:
+            _dict['scale_down_delay'] = self.scale_down_delay
+        if hasattr(self, 'scale_max_execution_time') and self.scale_max_execution_time is not None:
+            _dict['scale_max_execution_time'] = self.scale_max_execution_time
+        if hasattr(self, 'scale_memory_limit') and self.scale_memory_limit is not None:
+            _dict['scale_memory_limit'] = self.scale_memory_limit
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this FunctionPatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'FunctionPatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'FunctionPatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ManagedDomainMappingsEnum(str, Enum):
+        """
+        Optional value controlling which of the system managed domain mappings will be
+        setup for the function. Valid values are 'local_public', 'local_private' and
+        'local'. Visibility can only be 'local_private' if the project supports function
+        private visibility.
+        """
+
+        LOCAL = 'local'
+        LOCAL_PRIVATE = 'local_private'
+        LOCAL_PUBLIC = 'local_public'
+
+
+class FunctionRuntime:
+    """
+    Response model for Function runtime objects.
+
+    :param bool default: (optional) Whether the function runtime is the default for
+          the code bundle family.
+    :param bool deprecated: (optional) Whether the function runtime is deprecated.
+    :param str family: (optional) The code bundle family of the function runtime.
+    :param str id: (optional) The ID of the function runtime.
+    :param str name: (optional) The name of the function runtime.
+    :param bool optimized: (optional) Whether the function runtime is optimized.
+    """
+
+    def __init__(
+        self,
+        *,
+        default: Optional[bool] = None,
+        deprecated: Optional[bool] = None,
+        family: Optional[str] = None,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+        optimized: Optional[bool] = None,
+    ) -> None:
+        """
+        Initialize a FunctionRuntime object.
+
+        """
+        self.default = default
+        self.deprecated = deprecated
+        self.family = family
+        self.id = id
+        self.name = name
+        self.optimized = optimized
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'FunctionRuntime':
+        """Initialize a FunctionRuntime object from a json dictionary."""
+        args = {}
+        if (default := _dict.get('default')) is not None:
+            args['default'] = default
+        if (deprecated := _dict.get('deprecated')) is not None:
+            args['deprecated'] = deprecated
+        if (family := _dict.get('family')) is not None:
+            args['family'] = family
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (optimized := _dict.get('optimized')) is not None:
+            args['optimized'] = optimized
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a FunctionRuntime object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'default') and getattr(self, 'default') is not None:
+            _dict['default'] = getattr(self, 'default')
+        if hasattr(self, 'deprecated') and getattr(self, 'deprecated') is not None:
+            _dict['deprecated'] = getattr(self, 'deprecated')
+        if hasattr(self, 'family') and getattr(self, 'family') is not None:
+            _dict['family'] = getattr(self, 'family')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'name') and getattr(self, 'name') is not None:
+            _dict['name'] = getattr(self, 'name')
+        if hasattr(self, 'optimized') and getattr(self, 'optimized') is not None:
+            _dict['optimized'] = getattr(self, 'optimized')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this FunctionRuntime object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'FunctionRuntime') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'FunctionRuntime') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class FunctionRuntimeList:
+    """
+    Contains a list of Function runtimes.
+
+    :param List[FunctionRuntime] function_runtimes: List of all Function runtimes.
+    """
+
+    def __init__(
+        self,
+        function_runtimes: List['FunctionRuntime'],
+    ) -> None:
+        """
+        Initialize a FunctionRuntimeList object.
+
+        :param List[FunctionRuntime] function_runtimes: List of all Function
+               runtimes.
+        """
+        self.function_runtimes = function_runtimes
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'FunctionRuntimeList':
+        """Initialize a FunctionRuntimeList object from a json dictionary."""
+        args = {}
+        if (function_runtimes := _dict.get('function_runtimes')) is not None:
+            args['function_runtimes'] = [FunctionRuntime.from_dict(v) for v in function_runtimes]
+        else:
+            raise ValueError('Required property \'function_runtimes\' not present in FunctionRuntimeList JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a FunctionRuntimeList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'function_runtimes') and self.function_runtimes is not None:
+            function_runtimes_list = []
+            for v in self.function_runtimes:
+                if isinstance(v, dict):
+                    function_runtimes_list.append(v)
+                else:
+                    function_runtimes_list.append(v.to_dict())
+            _dict['function_runtimes'] = function_runtimes_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this FunctionRuntimeList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'FunctionRuntimeList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'FunctionRuntimeList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class FunctionStatus:
+    """
+    The detailed status of the function.
+
+    :param str reason: (optional) Provides additional information about the status
+          of the function.
+    """
+
+    def __init__(
+        self,
+        *,
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a FunctionStatus object.
+
+        """
+        self.reason = reason
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'FunctionStatus':
+        """Initialize a FunctionStatus object from a json dictionary."""
+        args = {}
+        if (reason := _dict.get('reason')) is not None:
+            args['reason'] = reason
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a FunctionStatus object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'reason') and getattr(self, 'reason') is not None:
+            _dict['reason'] = getattr(self, 'reason')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this FunctionStatus object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'FunctionStatus') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'FunctionStatus') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ReasonEnum(str, Enum):
+        """
+        Provides additional information about the status of the function.
+        """
+
+        OFFLINE = 'offline'
+        DEPLOYING_CONFIGURING_ROUTES = 'deploying_configuring_routes'
+        READY_UPDATE_IN_PROGRESS = 'ready_update_in_progress'
+        DEPLOYING = 'deploying'
+        READY_LAST_UPDATE_FAILED = 'ready_last_update_failed'
+        READY = 'ready'
+        UNKNOWN_REASON = 'unknown_reason'
+        NO_CODE_BUNDLE = 'no_code_bundle'
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'Function': (
+        ModelField('code_binary', required=True),
+        ModelField('code_main'),
+        ModelField('code_reference', required=True),
+        ModelField('code_secret'),
+        ModelField('computed_env_variables', 'list', 'EnvVar', required=True),
+        ModelField('created_at'),
+        ModelField('endpoint'),
+        ModelField('endpoint_internal'),
+        ModelField('entity_tag', required=True),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('managed_domain_mappings', required=True),
+        ModelField('name', required=True),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+        ModelField('run_compute_resource_token_enabled'),
+        ModelField('run_env_variables', 'list', 'EnvVar', required=True),
+        ModelField('runtime', required=True),
+        ModelField('scale_concurrency', required=True),
+        ModelField('scale_cpu_limit', required=True),
+        ModelField('scale_down_delay', required=True),
+        ModelField('scale_max_execution_time', required=True),
+        ModelField('scale_memory_limit', required=True),
+        ModelField('status'),
+        ModelField('status_details', 'model', 'FunctionStatus', required=True),
+    ),
+    'FunctionList': (
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('functions', 'list', 'Function', required=True),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+    ),
+    'FunctionPatch': (
+        ModelField('code_binary'),
+        ModelField('code_main'),
+        ModelField('code_reference'),
+        ModelField('code_secret'),
+        ModelField('managed_domain_mappings'),
+        ModelField('run_compute_resource_token_enabled'),
+        ModelField('run_env_variables', 'list', 'EnvVarPrototype'),
+        ModelField('runtime'),
+        ModelField('scale_concurrency'),
+        ModelField('scale_cpu_limit'),
+        ModelField('scale_down_delay'),
+        ModelField('scale_max_execution_time'),
+        ModelField('scale_memory_limit'),
+    ),
+    'FunctionRuntime': (
+        ModelField('default'),
+        ModelField('deprecated'),
+        ModelField('family'),
+        ModelField('id'),
+        ModelField('name'),
+        ModelField('optimized'),
+    ),
+    'FunctionRuntimeList': (ModelField('function_runtimes', 'list', 'FunctionRuntime', required=True),),
+    'FunctionStatus': (ModelField('reason'),),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
@@ -0,0 +1,1855 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models of jobs and job runs.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+from ...index_ranges import IndexRangeSet, get_index_set
+from .common import EnvVar, EnvVarPrototype, ListFirstMetadata, ListNextMetadata, VolumeMount, VolumeMountPrototype
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class IndexDetails:
+    """
+    IndexDetails.
+
+    :param str finished_at: (optional) The timestamp when the job run index finished
+          processing.
+    :param str last_failure_reason: (optional) Reason why latest retry of the job
+          run index failed. Possible values include but are not limited to `OOMKilled`,
+          `ContainerExitedCode1` or `ExceededEphemeralStorage`.
+    :param int retries: (optional) Number of retries of this job run index.
+    :param str started_at: (optional) The timestamp when the job run index started
+          processing.
+    :param str status: (optional) Current status of the job run index.
+    """
+
+    def __init__(
+        self,
+        *,
+        finished_at: Optional[str] = None,
+        last_failure_reason: Optional[str] = None,
+        retries: Optional[int] = None,
+        started_at: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a IndexDetails object.
+
+        """
+        self.finished_at = finished_at
+        self.last_failure_reason = last_failure_reason
+        self.retries = retries
+        self.started_at = started_at
+        self.status = status
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'IndexDetails':
+        """Initialize a IndexDetails object from a json dictionary."""
+        args = {}
+        if (finished_at := _dict.get('finished_at')) is not None:
+            args['finished_at'] = finished_at
+        if (last_failure_reason := _dict.get('last_failure_reason')) is not None:
+            args['last_failure_reason'] = last_failure_reason
+        if (retries := _dict.get('retries')) is not None:
+            args['retries'] = retries
+        if (started_at := _dict.get('started_at')) is not None:
+            args['started_at'] = started_at
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a IndexDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'finished_at') and getattr(self, 'finished_at') is not None:
+            _dict['finished_at'] = getattr(self, 'finished_at')
+        if hasattr(self, 'last_failure_reason') and getattr(self, 'last_failure_reason') is not None:
+            _dict['last_failure_reason'] = getattr(self, 'last_failure_reason')
+        if hasattr(self, 'retries') and getattr(self, 'retries') is not None:
+            _dict['retries'] = getattr(self, 'retries')
+        if hasattr(self, 'started_at') and getattr(self, 'started_at') is not None:
+            _dict['started_at'] = getattr(self, 'started_at')
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this IndexDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'IndexDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'IndexDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class StatusEnum(str, Enum):
+        """
+        Current status of the job run index.
+        """
+
+        PENDING = 'pending'
+        RUNNING = 'running'
+        SUCCEEDED = 'succeeded'
+        FAILED = 'failed'
+        UNKNOWN = 'unknown'
+
+
+class Job:
+    """
+    Job is the response model for job resources.
+
+    :param str build: (optional) Reference to a build that is associated with the
+          job.
+    :param str build_run: (optional) Reference to a build run that is associated
+          with the job.
+    :param List[EnvVar] computed_env_variables: References to config maps, secrets
+          or literal values, which are defined and set by Code Engine and are exposed as
+          environment variables in the job run.
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param str entity_tag: The version of the job instance, which is used to achieve
+          optimistic locking.
+    :param str href: (optional) When you provision a new job,  a URL is created
+          identifying the location of the instance.
+    :param str id: (optional) The identifier of the resource.
+    :param str image_reference: The name of the image that is used for this job. The
+          format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where `REGISTRY` and `TAG` are
+          optional. If `REGISTRY` is not specified, the default is `docker.io`. If `TAG`
+          is not specified, the default is `latest`. If the image reference points to a
+          registry that requires authentication, make sure to also specify the property
+          `image_secret`.
+    :param str image_secret: (optional) The name of the image registry access
+          secret. The image registry access secret is used to authenticate with a private
+          registry when you download the container image. If the image reference points to
+          a registry that requires authentication, the job / job runs will be created but
+          submitted job runs will fail, until this property is provided, too. This
+          property must not be set on a job run, which references a job template.
+    :param str name: The name of the job.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the job.
+    :param List[str] run_arguments: Set arguments for the job that are passed to
+          start job run containers. If not specified an empty string array will be applied
+          and the arguments specified by the container image, will be used to start the
+          container.
+    :param int run_as_user: (optional) The user ID (UID) to run the job.
+    :param List[str] run_commands: Set commands for the job that are passed to start
+          job run containers. If not specified an empty string array will be applied and
+          the command specified by the container image, will be used to start the
+          container.
+    :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+          enable the use of a compute resource token mounted to the container file system.
+    :param List[EnvVar] run_env_variables: References to config maps, secrets or
+          literal values, which are defined by the function owner and are exposed as
+          environment variables in the job run.
+    :param str run_mode: The mode for runs of the job. Valid values are `task` and
+          `daemon`. In `task` mode, the `max_execution_time` and `retry_limit` properties
+          apply. In `daemon` mode, since there is no timeout and failed instances are
+          restarted indefinitely, the `max_execution_time` and `retry_limit` properties
+          are not allowed.
+    :param str run_service_account: The name of the service account. For built-in
+          service accounts, you can use the shortened names `manager`, `none`, `reader`,
+          and `writer`. This property must not be set on a job run, which references a job
+          template.
+    :param List[VolumeMount] run_volume_mounts: Optional mounts of config maps or
+          secrets.
+    :param str scale_array_spec: Define a custom set of array indices as a
+          comma-separated list containing single values and hyphen-separated ranges, such
+          as  5,12-14,23,27. Each instance gets its array index value from the environment
+          variable JOB_INDEX. The number of unique array indices that you specify with
+          this parameter determines the number of job instances to run.
+    :param str scale_cpu_limit: Optional amount of CPU set for the instance of the
+          job. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+    :param str scale_ephemeral_storage_limit: Optional amount of ephemeral storage
+          to set for the instance of the job. The amount specified as ephemeral storage,
+          must not exceed the amount of `scale_memory_limit`. The units for specifying
+          ephemeral storage are Megabyte (M) or Gigabyte (G), whereas G and M are the
+          shorthand expressions for GB and MB. For more information see [Units of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_max_execution_time: (optional) The maximum execution time in
+          seconds for runs of the job. This property can only be specified if `run_mode`
+          is `task`.
+    :param str scale_memory_limit: Optional amount of memory set for the instance of
+          the job. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+          The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_retry_limit: (optional) The number of times to rerun an
+          instance of the job before the job is marked as failed. This property can only
+          be specified if `run_mode` is `task`.
+    """
+
+    def __init__(
+        self,
+        computed_env_variables: List['EnvVar'],
+        entity_tag: str,
+        image_reference: str,
+        name: str,
+        run_arguments: List[str],
+        run_commands: List[str],
+        run_env_variables: List['EnvVar'],
+        run_mode: str,
+        run_service_account: str,
+        run_volume_mounts: List['VolumeMount'],
+        scale_array_spec: str,
+        scale_cpu_limit: str,
+        scale_ephemeral_storage_limit: str,
+        scale_memory_limit: str,
+        *,
+        build: Optional[str] = None,
+        build_run: Optional[str] = None,
+        created_at: Optional[str] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        image_secret: Optional[str] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        run_as_user: Optional[int] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        scale_max_execution_time: Optional[int] = None,
+        scale_retry_limit: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a Job object.
+
+        :param List[EnvVar] computed_env_variables: References to config maps,
+               secrets or literal values, which are defined and set by Code Engine and are
+               exposed as environment variables in the job run.
+        :param str entity_tag: The version of the job instance, which is used to
+               achieve optimistic locking.
+        :param str image_reference: The name of the image that is used for this
+               job. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where `REGISTRY` and
+               `TAG` are optional. If `REGISTRY` is not specified, the default is
+               `docker.io`. If `TAG` is not specified, the default is `latest`. If the
+               image reference points to a registry that requires authentication, make
+               sure to also specify the property `image_secret`.
+        :param str name: The name of the job.
+        :param List[str] run_arguments: Set arguments for the job that are passed
+               to start job run containers. If not specified an empty string array will be
+               applied and the arguments specified by the container image, will be used to
+               start the container.
+        :param List[str] run_commands: Set commands for the job that are passed to
+               start job run containers. If not specified an empty string array will be
+               applied and the command specified by the container image, will be used to
+               start the container.
+        :param List[EnvVar] run_env_variables: References to config maps, secrets
+               or literal values, which are defined by the function owner and are exposed
+               as environment variables in the job run.
+        :param str run_mode: The mode for runs of the job. Valid values are `task`
+               and `daemon`. In `task` mode, the `max_execution_time` and `retry_limit`
+               properties apply. In `daemon` mode, since there is no timeout and failed
+               instances are restarted indefinitely, the `max_execution_time` and
+               `retry_limit` properties are not allowed.
+        :param str run_service_account: The name of the service account. For
+               built-in service accounts, you can use the shortened names `manager`,
+               `none`, `reader`, and `writer`. This property must not be set on a job run,
+               which references a job template.
+        :param List[VolumeMount] run_volume_mounts: Optional mounts of config maps
+               or secrets.
+        :param str scale_array_spec: Define a custom set of array indices as a
+               comma-separated list containing single values and hyphen-separated ranges,
+               such as  5,12-14,23,27. Each instance gets its array index value from the
+               environment variable JOB_INDEX. The number of unique array indices that you
+               specify with this parameter determines the number of job instances to run.
+        :param str scale_cpu_limit: Optional amount of CPU set for the instance of
+               the job. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param str scale_ephemeral_storage_limit: Optional amount of ephemeral
+               storage to set for the instance of the job. The amount specified as
+               ephemeral storage, must not exceed the amount of `scale_memory_limit`. The
+               units for specifying ephemeral storage are Megabyte (M) or Gigabyte (G),
+               whereas G and M are the shorthand expressions for GB and MB. For more
+               information see [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param str scale_memory_limit: Optional amount of memory set for the
+               instance of the job. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param str image_secret: (optional) The name of the image registry access
+               secret. The image registry access secret is used to authenticate with a
+               private registry when you download the container image. If the image
+               reference points to a registry that requires authentication, the job / job
+               runs will be created but submitted job runs will fail, until this property
+               is provided, too. This property must not be set on a job run, which
+               references a job template.
+        :param int run_as_user: (optional) The user ID (UID) to run the job.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        :param int scale_max_execution_time: (optional) The maximum execution time
+               in seconds for runs of the job. This property can only be specified if
+               `run_mode` is `task`.
+        :param int scale_retry_limit: (optional) The number of times to rerun an
+               instance of the job before the job is marked as failed. This property can
+               only be specified if `run_mode` is `task`.
+        """
+        self.build = build
+        self.build_run = build_run
+        self.computed_env_variables = computed_env_variables
+        self.created_at = created_at
+        self.entity_tag = entity_tag
+        self.href = href
+        self.id = id
+        self.image_reference = image_reference
+        self.image_secret = image_secret
+        self.name = name
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+        self.run_arguments = run_arguments
+        self.run_as_user = run_as_user
+        self.run_commands = run_commands
+        self.run_compute_resource_token_enabled = run_compute_resource_token_enabled
+        self.run_env_variables = run_env_variables
+        self.run_mode = run_mode
+        self.run_service_account = run_service_account
+        self.run_volume_mounts = run_volume_mounts
+        self.scale_array_spec = scale_array_spec
+        self.scale_cpu_limit = scale_cpu_limit
+        self.scale_ephemeral_storage_limit = scale_ephemeral_storage_limit
+        self.scale_max_execution_time = scale_max_execution_time
+        self.scale_memory_limit = scale_memory_limit
+        self.scale_retry_limit = scale_retry_limit
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Job':
+        """Initialize a Job object from a json dictionary."""
+        args = {}
+        if (build := _dict.get('build')) is not None:
+            args['build'] = build
+        if (build_run := _dict.get('build_run')) is not None:
+            args['build_run'] = build_run
+        if (computed_env_variables := _dict.get('computed_env_variables')) is not None:
+            args['computed_env_variables'] = [EnvVar.from_dict(v) for v in computed_env_variables]
+        else:
+            raise ValueError('Required property \'computed_env_variables\' not present in Job JSON')
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (entity_tag := _dict.get('entity_tag')) is not None:
+            args['entity_tag'] = entity_tag
+        else:
+            raise ValueError('Required property \'entity_tag\' not present in Job JSON')
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (image_reference := _dict.get('image_reference')) is not None:
+            args['image_reference'] = image_reference
+        else:
+            raise ValueError('Required property \'image_reference\' not present in Job JSON')
+        if (image_secret := _dict.get('image_secret')) is not None:
+            args['image_secret'] = image_secret
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError('Required property \'name\' not present in Job JSON')
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (run_arguments := _dict.get('run_arguments')) is not None:
+            args['run_arguments'] = run_arguments
+        else:
+            raise ValueError('Required property \'run_arguments\' not present in Job JSON')
+        if (run_as_user := _dict.get('run_as_user')) is not None:
+            args['run_as_user'] = run_as_user
+        if (run_commands := _dict.get('run_commands')) is not None:
+            args['run_commands'] = run_commands
+        else:
+            raise ValueError('Required property \'run_commands\' not present in Job JSON')
+        if (run_compute_resource_token_enabled := _dict.get('run_compute_resource_token_enabled')) is not None:
+            args['run_compute_resource_token_enabled'] = run_compute_resource_token_enabled
+        if (run_env_variables := _dict.get('run_env_variables')) is not None:
+            args['run_env_variables'] = [EnvVar.from_dict(v) for v in run_env_variables]
+        else:
+            raise ValueError('Required property \'run_env_variables\' not present in Job JSON')
+        if (run_mode := _dict.get('run_mode')) is not None:
+            args['run_mode'] = run_mode
+        else:
+            raise ValueError('Required property \'run_mode\' not present in Job JSON')
+        if (run_service_account := _dict.get('run_service_account')) is not None:
+            args['run_service_account'] = run_service_account
+        else:
+            raise ValueError('Required property \'run_service_account\' not present in Job JSON')
+        if (run_volume_mounts := _dict.get('run_volume_mounts')) is not None:
+            args['run_volume_mounts'] = [VolumeMount.from_dict(v) for v in run_volume_mounts]
+        else:
+            raise ValueError('Required property \'run_volume_mounts\' not present in Job JSON')
+        if (scale_array_spec := _dict.get('scale_array_spec')) is not None:
+            args['scale_array_spec'] = scale_array_spec
+        else:
+            raise ValueError('Required property \'scale_array_spec\' not present in Job JSON')
+        if (scale_cpu_limit := _dict.get('scale_cpu_limit')) is not None:
+            args['scale_cpu_limit'] = scale_cpu_limit
+        else:
+            raise ValueError('Required property \'scale_cpu_limit\' not present in Job JSON')
+        if (scale_ephemeral_storage_limit := _dict.get('scale_ephemeral_storage_limit')) is not None:
+            args['scale_ephemeral_storage_limit'] = scale_ephemeral_storage_limit
+        else:
+            raise ValueError('Required property \'scale_ephemeral_storage_limit\' not present in Job JSON')
+        if (scale_max_execution_time := _dict.get('scale_max_execution_time')) is not None:
+            args['scale_max_execution_time'] = scale_max_execution_time
+        if (scale_memory_limit := _dict.get('scale_memory_limit')) is not None:
+            args['scale_memory_limit'] = scale_memory_limit
+        else:
+            raise ValueError('Required property \'scale_memory_limit\' not present in Job JSON')
+        if (scale_retry_limit := _dict.get('scale_retry_limit')) is not None:
+            args['scale_retry_limit'] = scale_retry_limit
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Job object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'build') and getattr(self, 'build') is not None:
+            _dict['build'] = getattr(self, 'build')
+        if hasattr(self, 'build_run') and getattr(self, 'build_run') is not None:
+            _dict['build_run'] = getattr(self, 'build_run')
+        if hasattr(self, 'computed_env_variables') and self.computed_env_variables is not None:
+            computed_env_variables_list = []
+            for v in self.computed_env_variables:
+                if isinstance(v, dict):
+                    computed_env_variables_list.append(v)
+                else:
+                    computed_env_variables_list.append(v.to_dict())
+            _dict['computed_env_variables'] = computed_env_variables_list
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'entity_tag') and self.entity_tag is not None:
+            _dict['entity_tag'] = self.entity_tag
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'image_reference') and self.image_reference is not None:
+            _dict['image_reference'] = self.image_reference
+        if hasattr(self, 'image_secret') and self.image_secret is not None:
+            _dict['image_secret'] = self.image_secret
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'run_arguments') and self.run_arguments is not None:
+            _dict['run_arguments'] = self.run_arguments
+        if hasattr(self, 'run_as_user') and self.run_as_user is not None:
+            _dict['run_as_user'] = self.run_as_user
+        if hasattr(self, 'run_commands') and self.run_commands is not None:
+            _dict['run_commands'] = self.run_commands
+        if hasattr(self, 'run_compute_resource_token_enabled') and self.run_compute_resource_token_enabled is not None:
+            _dict['run_compute_resource_token_enabled'] = self.run_compute_resource_token_enabled
+        if hasattr(self, 'run_env_variables') and self.run_env_variables is not None:
+            run_env_variables_list = []
+            for v in self.run_env_variables:
+                if isinstance(v, dict):
+                    run_env_variables_list.append(v)
+                else:
+                    run_env_variables_list.append(v.to_dict())
+            _dict['run_env_variables'] = run_env_variables_list
+        if hasattr(self, 'run_mode') and self.run_mode is not None:
+            _dict['run_mode'] = self.run_mode
+        if hasattr(self, 'run_service_account') and self.run_service_account is not None:
+            _dict['run_service_account'] = self.run_service_account
+        if hasattr(self, 'run_volume_mounts') and self.run_volume_mounts is not None:
+            run_volume_mounts_list = []
+            for v in self.run_volume_mounts:
+                if isinstance(v, dict):
+                    run_volume_mounts_list.append(v)
+                else:
+                    run_volume_mounts_list.append(v.to_dict())
+            _dict['run_volume_mounts'] = run_volume_mounts_list
+        if hasattr(self, 'scale_array_spec') and self.scale_array_spec is not None:
+            _dict['scale_array_spec'] = self.scale_array_spec
+        if hasattr(self, 'scale_cpu_limit') and self.scale_cpu_limit is not None:
+            _dict['scale_cpu_limit'] = self.scale_cpu_limit
+        if hasattr(self, 'scale_ephemeral_storage_limit') and self.scale_ephemeral_storage_limit is not None:
+            _dict['scale_ephemeral_storage_limit'] = self.scale_ephemeral_storage_limit
+        if hasattr(self, 'scale_max_execution_time') and self.scale_max_execution_time is not None:
+            _dict['scale_max_execution_time'] = self.scale_max_execution_time
+        if hasattr(self, 'scale_memory_limit') and self.scale_memory_limit is not None:
+            _dict['scale_memory_limit'] = self.scale_memory_limit
+        if hasattr(self, 'scale_retry_limit') and self.scale_retry_limit is not None:
+            _dict['scale_retry_limit'] = self.scale_retry_limit
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Job object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Job') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Job') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the job.
+        """
+
+        JOB_V2 = 'job_v2'
+
+    class RunModeEnum(str, Enum):
+        """
+        The mode for runs of the job. Valid values are `task` and `daemon`. In `task`
+        mode, the `max_execution_time` and `retry_limit` properties apply. In `daemon`
+        mode, since there is no timeout and failed instances are restarted indefinitely,
+        the `max_execution_time` and `retry_limit` properties are not allowed.
+        """
+
+        TASK = 'task'
+        DAEMON = 'daemon'
+
+    class RunServiceAccountEnum(str, Enum):
+        """
+        The name of the service account. For built-in service accounts, you can use the
+        shortened names `manager`, `none`, `reader`, and `writer`. This property must not
+        be set on a job run, which references a job template.
+        """
+
+        DEFAULT = 'default'
+        MANAGER = 'manager'
+        READER = 'reader'
+        WRITER = 'writer'
+        NONE = 'none'
+
+
+class JobList:
+    """
+    Contains a list of jobs and pagination information.
+
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param List[Job] jobs: List of all jobs.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    """
+
+    def __init__(
+        self,
+        jobs: List['Job'],
+        limit: int,
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a JobList object.
+
+        :param List[Job] jobs: List of all jobs.
+        :param int limit: Maximum number of resources per page.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.first = first
+        self.jobs = jobs
+        self.limit = limit
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'JobList':
+        """Initialize a JobList object from a json dictionary."""
+        args = {}
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (jobs := _dict.get('jobs')) is not None:
+            args['jobs'] = [Job.from_dict(v) for v in jobs]
+        else:
+            raise ValueError('Required property \'jobs\' not present in JobList JSON')
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in JobList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a JobList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'jobs') and self.jobs is not None:
+            jobs_list = []
+            for v in self.jobs:
+                if isinstance(v, dict):
+                    jobs_list.append(v)
+                else:
+                    jobs_list.append(v.to_dict())
+            _dict['jobs'] = jobs_list
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this JobList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'JobList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'JobList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class JobPatch:
+    """
+    Request model for job update operations.
+
+    :param str image_reference: (optional) The name of the image that is used for
+          this job. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where `REGISTRY` and
+          `TAG` are optional. If `REGISTRY` is not specified, the default is `docker.io`.
+          If `TAG` is not specified, the default is `latest`. If the image reference
+          points to a registry that requires authentication, make sure to also specify the
+          property `image_secret`.
+    :param str image_secret: (optional) The name of the image registry access
+          secret. The image registry access secret is used to authenticate with a private
+          registry when you download the container image. If the image reference points to
+          a registry that requires authentication, the job / job runs will be created but
+          submitted job runs will fail, until this property is provided, too. This
+          property must not be set on a job run, which references a job template.
+    :param List[str] run_arguments: (optional) Set arguments for the job that are
+          passed to start job run containers. If not specified an empty string array will
+          be applied and the arguments specified by the container image, will be used to
+          start the container.
+    :param int run_as_user: (optional) The user ID (UID) to run the job.
+    :param List[str] run_commands: (optional) Set commands for the job that are
+          passed to start job run containers. If not specified an empty string array will
+          be applied and the command specified by the container image, will be used to
+          start the container.
+    :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+          enable the use of a compute resource token mounted to the container file system.
+    :param List[EnvVarPrototype] run_env_variables: (optional) Optional references
+          to config maps, secrets or literal values.
+    :param str run_mode: (optional) The mode for runs of the job. Valid values are
+          `task` and `daemon`. In `task` mode, the `max_execution_time` and `retry_limit`
+          properties apply. In `daemon` mode, since there is no timeout and failed
+          instances are restarted indefinitely, the `max_execution_time` and `retry_limit`
+          properties are not allowed.
+    :param str run_service_account: (optional) The name of the service account. For
+          built-in service accounts, you can use the shortened names `manager`, `none`,
+          `reader`, and `writer`. This property must not be set on a job run, which
+          references a job template.
+    :param List[VolumeMountPrototype] run_volume_mounts: (optional) Optional mounts
+          of config maps or a secrets. In case this is provided, existing
+          `run_volume_mounts` will be overwritten.
+    :param str scale_array_spec: (optional) Define a custom set of array indices as
+          a comma-separated list containing single values and hyphen-separated ranges,
+          such as  5,12-14,23,27. Each instance gets its array index value from the
+          environment variable JOB_INDEX. The number of unique array indices that you
+          specify with this parameter determines the number of job instances to run.
+    :param str scale_cpu_limit: (optional) Optional amount of CPU set for the
+          instance of the job. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+    :param str scale_ephemeral_storage_limit: (optional) Optional amount of
+          ephemeral storage to set for the instance of the job. The amount specified as
+          ephemeral storage, must not exceed the amount of `scale_memory_limit`. The units
+          for specifying ephemeral storage are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_max_execution_time: (optional) The maximum execution time in
+          seconds for runs of the job. This property can only be specified if `run_mode`
+          is `task`.
+    :param str scale_memory_limit: (optional) Optional amount of memory set for the
+          instance of the job. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+          The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_retry_limit: (optional) The number of times to rerun an
+          instance of the job before the job is marked as failed. This property can only
+          be specified if `run_mode` is `task`.
+    """
+
+    def __init__(
+        self,
+        *,
+        image_reference: Optional[str] = None,
+        image_secret: Optional[str] = None,
+        run_arguments: Optional[List[str]] = None,
+        run_as_user: Optional[int] = None,
+        run_commands: Optional[List[str]] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        run_env_variables: Optional[List['EnvVarPrototype']] = None,
+        run_mode: Optional[str] = None,
+        run_service_account: Optional[str] = None,
+        run_volume_mounts: Optional[List['VolumeMountPrototype']] = None,
+        scale_array_spec: Optional[str] = None,
+        scale_cpu_limit: Optional[str] = None,
+        scale_ephemeral_storage_limit: Optional[str] = None,
+        scale_max_execution_time: Optional[int] = None,
+        scale_memory_limit: Optional[str] = None,
+        scale_retry_limit: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a JobPatch object.
+
+        :param str image_reference: (optional) The name of the image that is used
+               for this job. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where
+               `REGISTRY` and `TAG` are optional. If `REGISTRY` is not specified, the
+               default is `docker.io`. If `TAG` is not specified, the default is `latest`.
+               If the image reference points to a registry that requires authentication,
+               make sure to also specify the property `image_secret`.
+        :param str image_secret: (optional) The name of the image registry access
+               secret. The image registry access secret is used to authenticate with a
+               private registry when you download the container image. If the image
+               reference points to a registry that requires authentication, the job / job
+               runs will be created but submitted job runs will fail, until this property
+               is provided, too. This property must not be set on a job run, which
+               references a job template.
+        :param List[str] run_arguments: (optional) Set arguments for the job that
+               are passed to start job run containers. If not specified an empty string
+               array will be applied and the arguments specified by the container image,
+               will be used to start the container.
+        :param int run_as_user: (optional) The user ID (UID) to run the job.
+        :param List[str] run_commands: (optional) Set commands for the job that are
+               passed to start job run containers. If not specified an empty string array
+               will be applied and the command specified by the container image, will be
+               used to start the container.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        :param List[EnvVarPrototype] run_env_variables: (optional) Optional
+               references to config maps, secrets or literal values.
+        :param str run_mode: (optional) The mode for runs of the job. Valid values
+               are `task` and `daemon`. In `task` mode, the `max_execution_time` and
+               `retry_limit` properties apply. In `daemon` mode, since there is no timeout
+               and failed instances are restarted indefinitely, the `max_execution_time`
+               and `retry_limit` properties are not allowed.
+        :param str run_service_account: (optional) The name of the service account.
+               For built-in service accounts, you can use the shortened names `manager`,
+               `none`, `reader`, and `writer`. This property must not be set on a job run,
+               which references a job template.
+        :param List[VolumeMountPrototype] run_volume_mounts: (optional) Optional
+               mounts of config maps or a secrets. In case this is provided, existing
+               `run_volume_mounts` will be overwritten.
+        :param str scale_array_spec: (optional) Define a custom set of array
+               indices as a comma-separated list containing single values and
+               hyphen-separated ranges, such as  5,12-14,23,27. Each instance gets its
+               array index value from the environment variable JOB_INDEX. The number of
+               unique array indices that you specify with this parameter determines the
+               number of job instances to run.
+        :param str scale_cpu_limit: (optional) Optional amount of CPU set for the
+               instance of the job. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param str scale_ephemeral_storage_limit: (optional) Optional amount of
+               ephemeral storage to set for the instance of the job. The amount specified
+               as ephemeral storage, must not exceed the amount of `scale_memory_limit`.
+               The units for specifying ephemeral storage are Megabyte (M) or Gigabyte
+               (G), whereas G and M are the shorthand expressions for GB and MB. For more
+               information see [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_max_execution_time: (optional) The maximum execution time
+               in seconds for runs of the job. This property can only be specified if
+               `run_mode` is `task`.
+        :param str scale_memory_limit: (optional) Optional amount of memory set for
+               the instance of the job. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_retry_limit: (optional) The number of times to rerun an
+               instance of the job before the job is marked as failed. This property can
+               only be specified if `run_mode` is `task`.
+        """
+        self.image_reference = image_reference
+        self.image_secret = image_secret
+        self.run_arguments = run_arguments
+        self.run_as_user = run_as_user
+        self.run_commands = run_commands
+        self.run_compute_resource_token_enabled = run_compute_resource_token_enabled
+        self.run_env_variables = run_env_variables
+        self.run_mode = run_mode
+        self.run_service_account = run_service_account
+        self.run_volume_mounts = run_volume_mounts
+        self.scale_array_spec = scale_array_spec
+        self.scale_cpu_limit = scale_cpu_limit
+        self.scale_ephemeral_storage_limit = scale_ephemeral_storage_limit
+        self.scale_max_execution_time = scale_max_execution_time
+        self.scale_memory_limit = scale_memory_limit
+        self.scale_retry_limit = scale_retry_limit
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'JobPatch':
+        """Initialize a JobPatch object from a json dictionary."""
+        args = {}
+        if (image_reference := _dict.get('image_reference')) is not None:
+            args['image_reference'] = image_reference
+        if (image_secret := _dict.get('image_secret')) is not None:
+            args['image_secret'] = image_secret
+        if (run_arguments := _dict.get('run_arguments')) is not None:
+            args['run_arguments'] = run_arguments
+        if (run_as_user := _dict.get('run_as_user')) is not None:
+            args['run_as_user'] = run_as_user
+        if (run_commands := _dict.get('run_commands')) is not None:
+            args['run_commands'] = run_commands
+        if (run_compute_resource_token_enabled := _dict.get('run_compute_resource_token_enabled')) is not None:
+            args['run_compute_resource_token_enabled'] = run_compute_resource_token_enabled
+        if (run_env_variables := _dict.get('run_env_variables')) is not None:
+            args['run_env_variables'] = [EnvVarPrototype.from_dict(v) for v in run_env_variables]
+        if (run_mode := _dict.get('run_mode')) is not None:
+            args['run_mode'] = run_mode
+        if (run_service_account := _dict.get('run_service_account')) is not None:
+            args['run_service_account'] = run_service_account
+        if (run_volume_mounts := _dict.get('run_volume_mounts')) is not None:
+            args['run_volume_mounts'] = [VolumeMountPrototype.from_dict(v) for v in run_volume_mounts]
+        if (scale_array_spec := _dict.get('scale_array_spec')) is not None:
+            args['scale_array_spec'] = scale_array_spec
+        if (scale_cpu_limit := _dict.get('scale_cpu_limit')) is not None:
+            args['scale_cpu_limit'] = scale_cpu_limit
+        if (scale_ephemeral_storage_limit := _dict.get('scale_ephemeral_storage_limit')) is not None:
+            args['scale_ephemeral_storage_limit'] = scale_ephemeral_storage_limit
+        if (scale_max_execution_time := _dict.get('scale_max_execution_time')) is not None:
+            args['scale_max_execution_time'] = scale_max_execution_time
+        if (scale_memory_limit := _dict.get('scale_memory_limit')) is not None:
+            args['scale_memory_limit'] = scale_memory_limit
+        if (scale_retry_limit := _dict.get('scale_retry_limit')) is not None:
+            args['scale_retry_limit'] = scale_retry_limit
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a JobPatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'image_reference') and self.image_reference is not None:
+            _dict['image_reference'] = self.image_reference
+        if hasattr(self, 'image_secret') and self.image_secret is not None:
+            _dict['image_secret'] = self.image_secret
+        if hasattr(self, 'run_arguments') and self.run_arguments is not None:
+            _dict['run_arguments'] = self.run_arguments
+        if hasattr(self, 'run_as_user') and self.run_as_user is not None:
+            _dict['run_as_user'] = self.run_as_user
+        if hasattr(self, 'run_commands') and self.run_commands is not None:
+            _dict['run_commands'] = self.run_commands
+        if hasattr(self, 'run_compute_resource_token_enabled') and self.run_compute_resource_token_enabled is not None:
+            _dict['run_compute_resource_token_enabled'] = self.run_compute_resource_token_enabled
+        if hasattr(self, 'run_env_variables') and self.run_env_variables is not None:
+            run_env_variables_list = []
+            for v in self.run_env_variables:
+                if isinstance(v, dict):
+                    run_env_variables_list.append(v)
+                else:
+                    run_env_variables_list.append(v.to_dict())
+            _dict['run_env_variables'] = run_env_variables_list
+        if hasattr(self, 'run_mode') and self.run_mode is not None:
+            _dict['run_mode'] = self.run_mode
+        if hasattr(self, 'run_service_account') and self.run_service_account is not None:
+            _dict['run_service_account'] = self.run_service_account
+        if hasattr(self, 'run_volume_mounts') and self.run_volume_mounts is not None:
+            run_volume_mounts_list = []
+            for v in self.run_volume_mounts:
+                if isinstance(v, dict):
+                    run_volume_mounts_list.append(v)
+                else:
+                    run_volume_mounts_list.append(v.to_dict())
+            _dict['run_volume_mounts'] = run_volume_mounts_list
+        if hasattr(self, 'scale_array_spec') and self.scale_array_spec is not None:
+            _dict['scale_array_spec'] = self.scale_array_spec
+        if hasattr(self, 'scale_cpu_limit') and self.scale_cpu_limit is not None:
+            _dict['scale_cpu_limit'] = self.scale_cpu_limit
+        if hasattr(self, 'scale_ephemeral_storage_limit') and self.scale_ephemeral_storage_limit is not None:
+            _dict['scale_ephemeral_storage_limit'] = self.scale_ephemeral_storage_limit
+        if hasattr(self, 'scale_max_execution_time') and self.scale_max_execution_time is not None:
+            _dict['scale_max_execution_time'] = self.scale_max_execution_time
+        if hasattr(self, 'scale_memory_limit') and self.scale_memory_limit is not None:
+            _dict['scale_memory_limit'] = self.scale_memory_limit
+        if hasattr(self, 'scale_retry_limit') and self.scale_retry_limit is not None:
+            _dict['scale_retry_limit'] = self.scale_retry_limit
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this JobPatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'JobPatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'JobPatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class RunModeEnum(str, Enum):
+        """
+        The mode for runs of the job. Valid values are `task` and `daemon`. In `task`
+        mode, the `max_execution_time` and `retry_limit` properties apply. In `daemon`
+        mode, since there is no timeout and failed instances are restarted indefinitely,
+        the `max_execution_time` and `retry_limit` properties are not allowed.
+        """
+
+        TASK = 'task'
+        DAEMON = 'daemon'
+
+    class RunServiceAccountEnum(str, Enum):
+        """
+        The name of the service account. For built-in service accounts, you can use the
+        shortened names `manager`, `none`, `reader`, and `writer`. This property must not
+        be set on a job run, which references a job template.
+        """
+
+        DEFAULT = 'default'
+        MANAGER = 'manager'
+        READER = 'reader'
+        WRITER = 'writer'
+        NONE = 'none'
+
+
+class JobRun:
+    """
+    Response model for job run resources.
+
+    :param List[EnvVar] computed_env_variables: References to config maps, secrets
+          or literal values, which are defined and set by Code Engine and are exposed as
+          environment variables in the job run.
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param str href: (optional) When you provision a new job run,  a URL is created
+          identifying the location of the instance.
+    :param str id: (optional) The identifier of the resource.
+    :param str image_reference: (optional) The name of the image that is used for
+          this job. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where `REGISTRY` and
+          `TAG` are optional. If `REGISTRY` is not specified, the default is `docker.io`.
+          If `TAG` is not specified, the default is `latest`. If the image reference
+          points to a registry that requires authentication, make sure to also specify the
+          property `image_secret`.
+    :param str image_secret: (optional) The name of the image registry access
+          secret. The image registry access secret is used to authenticate with a private
+          registry when you download the container image. If the image reference points to
+          a registry that requires authentication, the job / job runs will be created but
+          submitted job runs will fail, until this property is provided, too. This
+          property must not be set on a job run, which references a job template.
+    :param str job_name: (optional) Optional name of the job reference of this job
+          run. If specified, the job run will inherit the configuration of the referenced
+          job.
+    :param str name: (optional) The name of the job run.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the job run.
+    :param List[str] run_arguments: Set arguments for the job that are passed to
+          start job run containers. If not specified an empty string array will be applied
+          and the arguments specified by the container image, will be used to start the
+          container.
+    :param int run_as_user: (optional) The user ID (UID) to run the job.
+    :param List[str] run_commands: Set commands for the job that are passed to start
+          job run containers. If not specified an empty string array will be applied and
+          the command specified by the container image, will be used to start the
+          container.
+    :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+          enable the use of a compute resource token mounted to the container file system.
+    :param List[EnvVar] run_env_variables: References to config maps, secrets or
+          literal values, which are defined by the function owner and are exposed as
+          environment variables in the job run.
+    :param str run_mode: (optional) The mode for runs of the job. Valid values are
+          `task` and `daemon`. In `task` mode, the `max_execution_time` and `retry_limit`
+          properties apply. In `daemon` mode, since there is no timeout and failed
+          instances are restarted indefinitely, the `max_execution_time` and `retry_limit`
+          properties are not allowed.
+    :param str run_service_account: (optional) The name of the service account. For
+          built-in service accounts, you can use the shortened names `manager`, `none`,
+          `reader`, and `writer`. This property must not be set on a job run, which
+          references a job template.
+    :param List[VolumeMount] run_volume_mounts: Optional mounts of config maps or
+          secrets.
+    :param int scale_array_size_variable_override: (optional) Optional value to
+          override the JOB_ARRAY_SIZE environment variable for a job run.
+    :param str scale_array_spec: (optional) Define a custom set of array indices as
+          a comma-separated list containing single values and hyphen-separated ranges,
+          such as  5,12-14,23,27. Each instance gets its array index value from the
+          environment variable JOB_INDEX. The number of unique array indices that you
+          specify with this parameter determines the number of job instances to run.
+    :param str scale_cpu_limit: (optional) Optional amount of CPU set for the
+          instance of the job. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+    :param str scale_ephemeral_storage_limit: (optional) Optional amount of
+          ephemeral storage to set for the instance of the job. The amount specified as
+          ephemeral storage, must not exceed the amount of `scale_memory_limit`. The units
+          for specifying ephemeral storage are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_max_execution_time: (optional) The maximum execution time in
+          seconds for runs of the job. This property can only be specified if `run_mode`
+          is `task`.
+    :param str scale_memory_limit: (optional) Optional amount of memory set for the
+          instance of the job. For valid values see [Supported memory and CPU
+          combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+          The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G and
+          M are the shorthand expressions for GB and MB. For more information see [Units
+          of
+          measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+    :param int scale_retry_limit: (optional) The number of times to rerun an
+          instance of the job before the job is marked as failed. This property can only
+          be specified if `run_mode` is `task`.
+    :param str status: (optional) The current status of the job run.
+    :param JobRunStatus status_details: (optional) The detailed status of the job
+          run.
+    """
+
+    def __init__(
+        self,
+        computed_env_variables: List['EnvVar'],
+        run_arguments: List[str],
+        run_commands: List[str],
+        run_env_variables: List['EnvVar'],
+        run_volume_mounts: List['VolumeMount'],
+        *,
+        created_at: Optional[str] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        image_reference: Optional[str] = None,
+        image_secret: Optional[str] = None,
+        job_name: Optional[str] = None,
+        name: Optional[str] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        run_as_user: Optional[int] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        run_mode: Optional[str] = None,
+        run_service_account: Optional[str] = None,
+        scale_array_size_variable_override: Optional[int] = None,
+        scale_array_spec: Optional[str] = None,
+        scale_cpu_limit: Optional[str] = None,
+        scale_ephemeral_storage_limit: Optional[str] = None,
+        scale_max_execution_time: Optional[int] = None,
+        scale_memory_limit: Optional[str] = None,
+        scale_retry_limit: Optional[int] = None,
+        status: Optional[str] = None,
+        status_details: Optional['JobRunStatus'] = None,
+    ) -> None:
+        """
+        Initialize a JobRun object.
+
+        :param List[EnvVar] computed_env_variables: References to config maps,
+               secrets or literal values, which are defined and set by Code Engine and are
+               exposed as environment variables in the job run.
+        :param List[str] run_arguments: Set arguments for the job that are passed
+               to start job run containers. If not specified an empty string array will be
+               applied and the arguments specified by the container image, will be used to
+               start the container.
+        :param List[str] run_commands: Set commands for the job that are passed to
+               start job run containers. If not specified an empty string array will be
+               applied and the command specified by the container image, will be used to
+               start the container.
+        :param List[EnvVar] run_env_variables: References to config maps, secrets
+               or literal values, which are defined by the function owner and are exposed
+               as environment variables in the job run.
+        :param List[VolumeMount] run_volume_mounts: Optional mounts of config maps
+               or secrets.
+        :param str image_reference: (optional) The name of the image that is used
+               for this job. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where
+               `REGISTRY` and `TAG` are optional. If `REGISTRY` is not specified, the
+               default is `docker.io`. If `TAG` is not specified, the default is `latest`.
+               If the image reference points to a registry that requires authentication,
+               make sure to also specify the property `image_secret`.
+        :param str image_secret: (optional) The name of the image registry access
+               secret. The image registry access secret is used to authenticate with a
+               private registry when you download the container image. If the image
+               reference points to a registry that requires authentication, the job / job
+               runs will be created but submitted job runs will fail, until this property
+               is provided, too. This property must not be set on a job run, which
+               references a job template.
+        :param str job_name: (optional) Optional name of the job reference of this
+               job run. If specified, the job run will inherit the configuration of the
+               referenced job.
+        :param str name: (optional) The name of the job run.
+        :param int run_as_user: (optional) The user ID (UID) to run the job.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        :param str run_mode: (optional) The mode for runs of the job. Valid values
+               are `task` and `daemon`. In `task` mode, the `max_execution_time` and
+               `retry_limit` properties apply. In `daemon` mode, since there is no timeout
+               and failed instances are restarted indefinitely, the `max_execution_time`
+               and `retry_limit` properties are not allowed.
+        :param str run_service_account: (optional) The name of the service account.
+               For built-in service accounts, you can use the shortened names `manager`,
+               `none`, `reader`, and `writer`. This property must not be set on a job run,
+               which references a job template.
+        :param int scale_array_size_variable_override: (optional) Optional value to
+               override the JOB_ARRAY_SIZE environment variable for a job run.
+        :param str scale_array_spec: (optional) Define a custom set of array
+               indices as a comma-separated list containing single values and
+               hyphen-separated ranges, such as  5,12-14,23,27. Each instance gets its
+               array index value from the environment variable JOB_INDEX. The number of
+               unique array indices that you specify with this parameter determines the
+               number of job instances to run.
+        :param str scale_cpu_limit: (optional) Optional amount of CPU set for the
+               instance of the job. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param str scale_ephemeral_storage_limit: (optional) Optional amount of
+               ephemeral storage to set for the instance of the job. The amount specified
+               as ephemeral storage, must not exceed the amount of `scale_memory_limit`.
+               The units for specifying ephemeral storage are Megabyte (M) or Gigabyte
+               (G), whereas G and M are the shorthand expressions for GB and MB. For more
+               information see [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_max_execution_time: (optional) The maximum execution time
+               in seconds for runs of the job. This property can only be specified if
+               `run_mode` is `task`.
+        :param str scale_memory_limit: (optional) Optional amount of memory set for
+               the instance of the job. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_retry_limit: (optional) The number of times to rerun an
+               instance of the job before the job is marked as failed. This property can
+               only be specified if `run_mode` is `task`.
+        :param JobRunStatus status_details: (optional) The detailed status of the
+               job run.
+        """
+        self.computed_env_variables = computed_env_variables
+        self.created_at = created_at
+        self.href = href
+        self.id = id
+        self.image_reference = image_reference
+        self.image_secret = image_secret
+        self.job_name = job_name
+        self.name = name
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+        self.run_arguments = run_arguments
+        self.run_as_user = run_as_user
+        self.run_commands = run_commands
+        self.run_compute_resource_token_enabled = run_compute_resource_token_enabled
+        self.run_env_variables = run_env_variables
+        self.run_mode = run_mode
+        self.run_service_account = run_service_account
+        self.run_volume_mounts = run_volume_mounts
+        self.scale_array_size_variable_override = scale_array_size_variable_override
+        self.scale_array_spec = scale_array_spec
+        self.scale_cpu_limit = scale_cpu_limit
+        self.scale_ephemeral_storage_limit = scale_ephemeral_storage_limit
+        self.scale_max_execution_time = scale_max_execution_time
+        self.scale_memory_limit = scale_memory_limit
+        self.scale_retry_limit = scale_retry_limit
+        self.status = status
+        self.status_details = status_details
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'JobRun':
+        """Initialize a JobRun object from a json dictionary."""
+        args = {}
+        if (computed_env_variables := _dict.get('computed_env_variables')) is not None:
+            args['computed_env_variables'] = [EnvVar.from_dict(v) for v in computed_env_variables]
+        else:
+            raise ValueError('Required property \'computed_env_variables\' not present in JobRun JSON')
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (image_reference := _dict.get('image_reference')) is not None:
+            args['image_reference'] = image_reference
+        if (image_secret := _dict.get('image_secret')) is not None:
+            args['image_secret'] = image_secret
+        if (job_name := _dict.get('job_name')) is not None:
+            args['job_name'] = job_name
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (run_arguments := _dict.get('run_arguments')) is not None:
+            args['run_arguments'] = run_arguments
+        else:
+            raise ValueError('Required property \'run_arguments\' not present in JobRun JSON')
+        if (run_as_user := _dict.get('run_as_user')) is not None:
+            args['run_as_user'] = run_as_user
+        if (run_commands := _dict.get('run_commands')) is not None:
+            args['run_commands'] = run_commands
+        else:
+            raise ValueError('Required property \'run_commands\' not present in JobRun JSON')
+        if (run_compute_resource_token_enabled := _dict.get('run_compute_resource_token_enabled')) is not None:
+            args['run_compute_resource_token_enabled'] = run_compute_resource_token_enabled
+        if (run_env_variables := _dict.get('run_env_variables')) is not None:
+            args['run_env_variables'] = [EnvVar.from_dict(v) for v in run_env_variables]
+        else:
+            raise ValueError('Required property \'run_env_variables\' not present in JobRun JSON')
+        if (run_mode := _dict.get('run_mode')) is not None:
+            args['run_mode'] = run_mode
+        if (run_service_account := _dict.get('run_service_account')) is not None:
+            args['run_service_account'] = run_service_account
+        if (run_volume_mounts := _dict.get('run_volume_mounts')) is not None:
+            args['run_volume_mounts'] = [VolumeMount.from_dict(v) for v in run_volume_mounts]
+        else:
+            raise ValueError('Required property \'run_volume_mounts\' not present in JobRun JSON')
+        if (scale_array_size_variable_override := _dict.get('scale_array_size_variable_override')) is not None:
+            args['scale_array_size_variable_override'] = scale_array_size_variable_override
+        if (scale_array_spec := _dict.get('scale_array_spec')) is not None:
+            args['scale_array_spec'] = scale_array_spec
+        if (scale_cpu_limit := _dict.get('scale_cpu_limit')) is not None:
+            args['scale_cpu_limit'] = scale_cpu_limit
+        if (scale_ephemeral_storage_limit := _dict.get('scale_ephemeral_storage_limit')) is not None:
+            args['scale_ephemeral_storage_limit'] = scale_ephemeral_storage_limit
+        if (scale_max_execution_time := _dict.get('scale_max_execution_time')) is not None:
+            args['scale_max_execution_time'] = scale_max_execution_time
+        if (scale_memory_limit := _dict.get('scale_memory_limit')) is not None:
+            args['scale_memory_limit'] = scale_memory_limit
+        if (scale_retry_limit := _dict.get('scale_retry_limit')) is not None:
+            args['scale_retry_limit'] = scale_retry_limit
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_details := _dict.get('status_details')) is not None:
+            args['status_details'] = JobRunStatus.from_dict(status_details)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a JobRun object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'computed_env_variables') and self.computed_env_variables is not None:
+            computed_env_variables_list = []
+            for v in self.computed_env_variables:
+                if isinstance(v, dict):
+                    computed_env_variables_list.append(v)
+                else:
+                    computed_env_variables_list.append(v.to_dict())
+            _dict['computed_env_variables'] = computed_env_variables_list
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'image_reference') and self.image_reference is not None:
+            _dict['image_reference'] = self.image_reference
+        if hasattr(self, 'image_secret') and self.image_secret is not None:
+            _dict['image_secret'] = self.image_secret
+        if hasattr(self, 'job_name') and self.job_name is not None:
+            _dict['job_name'] = self.job_name
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'run_arguments') and self.run_arguments is not None:
+            _dict['run_arguments'] = self.run_arguments
+        if hasattr(self, 'run_as_user') and self.run_as_user is not None:
+            _dict['run_as_user'] = self.run_as_user
+        if hasattr(self, 'run_commands') and self.run_commands is not None:
+            _dict['run_commands'] = self.run_commands
+        if hasattr(self, 'run_compute_resource_token_enabled') and self.run_compute_resource_token_enabled is not None:
+            _dict['run_compute_resource_token_enabled'] = self.run_compute_resource_token_enabled
+        if hasattr(self, 'run_env_variables') and self.run_env_variables is not None:
+            run_env_variables_list = []
+            for v in self.run_env_variables:
+                if isinstance(v, dict):
+                    run_env_variables_list.append(v)
+                else:
+                    run_env_variables_list.append(v.to_dict())
+            _dict['run_env_variables'] = run_env_variables_list
+        if hasattr(self, 'run_mode') and self.run_mode is not None:
+            _dict['run_mode'] = self.run_mode
+        if hasattr(self, 'run_service_account') and self.run_service_account is not None:
+            _dict['run_service_account'] = self.run_service_account
+        if hasattr(self, 'run_volume_mounts') and self.run_volume_mounts is not None:
+            run_volume_mounts_list = []
+            for v in self.run_volume_mounts:
+                if isinstance(v, dict):
+                    run_volume_mounts_list.append(v)
+                else:
+                    run_volume_mounts_list.append(v.to_dict())
+            _dict['run_volume_mounts'] = run_volume_mounts_list
+        if hasattr(self, 'scale_array_size_variable_override') and self.scale_array_size_variable_override is not None:
+            _dict['scale_array_size_variable_override'] = self.scale_array_size_variable_override
+        if hasattr(self, 'scale_array_spec') and self.scale_array_spec is not None:
+            _dict['scale_array_spec'] = self.scale_array_spec
+        if hasattr(self, 'scale_cpu_limit') and self.scale_cpu_limit is not None:
+            _dict['scale_cpu_limit'] = self.scale_cpu_limit
+        if hasattr(self, 'scale_ephemeral_storage_limit') and self.scale_ephemeral_storage_limit is not None:
+            _dict['scale_ephemeral_storage_limit'] = self.scale_ephemeral_storage_limit
+        if hasattr(self, 'scale_max_execution_time') and self.scale_max_execution_time is not None:
+            _dict['scale_max_execution_time'] = self.scale_max_execution_time
+        if hasattr(self, 'scale_memory_limit') and self.scale_memory_limit is not None:
+            _dict['scale_memory_limit'] = self.scale_memory_limit
+        if hasattr(self, 'scale_retry_limit') and self.scale_retry_limit is not None:
+            _dict['scale_retry_limit'] = self.scale_retry_limit
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        if hasattr(self, 'status_details') and self.status_details is not None:
+            if isinstance(self.status_details, dict):
+                _dict['status_details'] = self.status_details
+            else:
+                _dict['status_details'] = self.status_details.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this JobRun object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'JobRun') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'JobRun') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the job run.
+        """
+
+        JOB_RUN_V2 = 'job_run_v2'
+
+    class RunModeEnum(str, Enum):
+        """
+        The mode for runs of the job. Valid values are `task` and `daemon`. In `task`
+        mode, the `max_execution_time` and `retry_limit` properties apply. In `daemon`
+        mode, since there is no timeout and failed instances are restarted indefinitely,
+        the `max_execution_time` and `retry_limit` properties are not allowed.
+        """
+
+        TASK = 'task'
+        DAEMON = 'daemon'
+
+    class RunServiceAccountEnum(str, Enum):
+        """
+        The name of the service account. For built-in service accounts, you can use the
+        shortened names `manager`, `none`, `reader`, and `writer`. This property must not
+        be set on a job run, which references a job template.
+        """
+
+        DEFAULT = 'default'
+        MANAGER = 'manager'
+        READER = 'reader'
+        WRITER = 'writer'
+        NONE = 'none'
+
+    class StatusEnum(str, Enum):
+        """
+        The current status of the job run.
+        """
+
+        FAILED = 'failed'
+        COMPLETED = 'completed'
+        RUNNING = 'running'
+        PENDING = 'pending'
+
+
+class JobRunList:
+    """
+    Contains a list of job runs and pagination information.
+
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param List[JobRun] job_runs: List of all jobs.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    """
+
+    def __init__(
+        self,
+        job_runs: List['JobRun'],
+        limit: int,
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a JobRunList object.
+
+        :param List[JobRun] job_runs: List of all jobs.
+        :param int limit: Maximum number of resources per page.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.first = first
+        self.job_runs = job_runs
+        self.limit = limit
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'JobRunList':
+        """Initialize a JobRunList object from a json dictionary."""
+        args = {}
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (job_runs := _dict.get('job_runs')) is not None:
+            args['job_runs'] = [JobRun.from_dict(v) for v in job_runs]
+        else:
+            raise ValueError('Required property \'job_runs\' not present in JobRunList JSON')
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in JobRunList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a JobRunList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'job_runs') and self.job_runs is not None:
+            job_runs_list = []
+            for v in self.job_runs:
+                if isinstance(v, dict):
+                    job_runs_list.append(v)
+                else:
+                    job_runs_list.append(v.to_dict())
+            _dict['job_runs'] = job_runs_list
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this JobRunList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'JobRunList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'JobRunList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class JobRunStatus:
+    """
+    The detailed status of the job run.
+
+    :param str completion_time: (optional) Time the job run completed.
+    :param int failed: (optional) Number of failed job run instances.
+    :param str failed_indices: (optional) List of job run indices that failed.
+    :param dict indices_details: (optional) Detailed process information per index.
+    :param int pending: (optional) Number of pending job run instances.
+    :param str pending_indices: (optional) List of job run indices that are pending.
+    :param int requested: (optional) Number of requested job run instances.
+    :param int running: (optional) Number of running job run instances.
+    :param str running_indices: (optional) List of job run indices that are running.
+    :param str start_time: (optional) Time the job run started.
+    :param int succeeded: (optional) Number of succeeded job run instances.
+    :param str succeeded_indices: (optional) List of job run indices that succeeded.
+    :param int unknown: (optional) Number of job run instances with unknown state.
+    """
+
+    def __init__(
+        self,
+        *,
+        completion_time: Optional[str] = None,
+        failed: Optional[int] = None,
+        failed_indices: Optional[str] = None,
+        indices_details: Optional[dict] = None,
+        pending: Optional[int] = None,
+        pending_indices: Optional[str] = None,
+        requested: Optional[int] = None,
+        running: Optional[int] = None,
+        running_indices: Optional[str] = None,
+        start_time: Optional[str] = None,
+        succeeded: Optional[int] = None,
+        succeeded_indices: Optional[str] = None,
+        unknown: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a JobRunStatus object.
+
+        :param dict indices_details: (optional) Detailed process information per
+               index.
+        """
+        self.completion_time = completion_time
+        self.failed = failed
+        self.failed_indices = failed_indices
+        self.indices_details = indices_details
+        self.pending = pending
+        self.pending_indices = pending_indices
+        self.requested = requested
+        self.running = running
+        self.running_indices = running_indices
+        self.start_time = start_time
+        self.succeeded = succeeded
+        self.succeeded_indices = succeeded_indices
+        self.unknown = unknown
+
+    @property
+    def failed_index_set(self) -> IndexRangeSet:
+        """The indices that failed, as an IndexRangeSet."""
+        return get_index_set(self.failed_indices)
+
+    @property
+    def pending_index_set(self) -> IndexRangeSet:
+        """The indices that are pending, as an IndexRangeSet."""
+        return get_index_set(self.pending_indices)
+
+    @property
+    def running_index_set(self) -> IndexRangeSet:
+        """The indices that are running, as an IndexRangeSet."""
+        return get_index_set(self.running_indices)
+
+    @property
+    def succeeded_index_set(self) -> IndexRangeSet:
+        """The indices that succeeded, as an IndexRangeSet."""
+        return get_index_set(self.succeeded_indices)
+
+    def get_retry_array_spec(self) -> Optional[str]:
+        """
+        Returns the `scale_array_spec` that reruns only the failed indices of
+        the job run with `create_job_run()`, or None if no index failed.
+        """
+        failed_index_set = self.failed_index_set
+        return failed_index_set.to_array_spec() if failed_index_set else None
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'JobRunStatus':
+        """Initialize a JobRunStatus object from a json dictionary."""
+        args = {}
+        if (completion_time := _dict.get('completion_time')) is not None:
+            args['completion_time'] = completion_time
+        if (failed := _dict.get('failed')) is not None:
+            args['failed'] = failed
+        if (failed_indices := _dict.get('failed_indices')) is not None:
+            args['failed_indices'] = failed_indices
+        if (indices_details := _dict.get('indices_details')) is not None:
+            args['indices_details'] = {k: IndexDetails.from_dict(v) for k, v in indices_details.items()}
+        if (pending := _dict.get('pending')) is not None:
+            args['pending'] = pending
+        if (pending_indices := _dict.get('pending_indices')) is not None:
+            args['pending_indices'] = pending_indices
+        if (requested := _dict.get('requested')) is not None:
+            args['requested'] = requested
+        if (running := _dict.get('running')) is not None:
+            args['running'] = running
+        if (running_indices := _dict.get('running_indices')) is not None:
+            args['running_indices'] = running_indices
+        if (start_time := _dict.get('start_time')) is not None:
+            args['start_time'] = start_time
+        if (succeeded := _dict.get('succeeded')) is not None:
+            args['succeeded'] = succeeded
+        if (succeeded_indices := _dict.get('succeeded_indices')) is not None:
+            args['succeeded_indices'] = succeeded_indices
+        if (unknown := _dict.get('unknown')) is not None:
+            args['unknown'] = unknown
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a JobRunStatus object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'completion_time') and getattr(self, 'completion_time') is not None:
+            _dict['completion_time'] = getattr(self, 'completion_time')
+        if hasattr(self, 'failed') and getattr(self, 'failed') is not None:
+            _dict['failed'] = getattr(self, 'failed')
+        if hasattr(self, 'failed_indices') and getattr(self, 'failed_indices') is not None:
+            _dict['failed_indices'] = getattr(self, 'failed_indices')
+        if hasattr(self, 'indices_details') and self.indices_details is not None:
+            indices_details_map = {}
+            for k, v in self.indices_details.items():
+                if isinstance(v, dict):
+                    indices_details_map[k] = v
+                else:
+                    indices_details_map[k] = v.to_dict()
+            _dict['indices_details'] = indices_details_map
+        if hasattr(self, 'pending') and getattr(self, 'pending') is not None:
+            _dict['pending'] = getattr(self, 'pending')
+        if hasattr(self, 'pending_indices') and getattr(self, 'pending_indices') is not None:
+            _dict['pending_indices'] = getattr(self, 'pending_indices')
+        if hasattr(self, 'requested') and getattr(self, 'requested') is not None:
+            _dict['requested'] = getattr(self, 'requested')
+        if hasattr(self, 'running') and getattr(self, 'running') is not None:
+            _dict['running'] = getattr(self, 'running')
+        if hasattr(self, 'running_indices') and getattr(self, 'running_indices') is not None:
+            _dict['running_indices'] = getattr(self, 'running_indices')
+        if hasattr(self, 'start_time') and getattr(self, 'start_time') is not None:
+            _dict['start_time'] = getattr(self, 'start_time')
+        if hasattr(self, 'succeeded') and getattr(self, 'succeeded') is not None:
+            _dict['succeeded'] = getattr(self, 'succeeded')
+        if hasattr(self, 'succeeded_indices') and getattr(self, 'succeeded_indices') is not None:
+            _dict['succeeded_indices'] = getattr(self, 'succeeded_indices')
+        if hasattr(self, 'unknown') and getattr(self, 'unknown') is not None:
+            _dict['unknown'] = getattr(self, 'unknown')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this JobRunStatus object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'JobRunStatus') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'JobRunStatus') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'IndexDetails': (
+        ModelField('finished_at'),
+        ModelField('last_failure_reason'),
+        ModelField('retries'),
+        ModelField('started_at'),
+        ModelField('status'),
+    ),
+    'Job': (
+        ModelField('build'),
+        ModelField('build_run'),
+        ModelField('computed_env_variables', 'list', 'EnvVar', required=True),
+        ModelField('created_at'),
+        ModelField('entity_tag', required=True),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('image_reference', required=True),
+        ModelField('image_secret'),
+        ModelField('name', required=True),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+        ModelField('run_arguments', required=True),
+        ModelField('run_as_user'),
+        ModelField('run_commands', required=True),
+        ModelField('run_compute_resource_token_enabled'),
+        ModelField('run_env_variables', 'list', 'EnvVar', required=True),
+        ModelField('run_mode', required=True),
+        ModelField('run_service_account', required=True),
+        ModelField('run_volume_mounts', 'list', 'VolumeMount', required=True),
+        ModelField('scale_array_spec', required=True),
+        ModelField('scale_cpu_limit', required=True),
+        ModelField('scale_ephemeral_storage_limit', required=True),
+        ModelField('scale_max_execution_time'),
+        ModelField('scale_memory_limit', required=True),
+        ModelField('scale_retry_limit'),
+    ),
+    'JobList': (
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('jobs', 'list', 'Job', required=True),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+    ),
+    'JobPatch': (
+        ModelField('image_reference'),
+        ModelField('image_secret'),
+        ModelField('run_arguments'),
+        ModelField('run_as_user'),
+        ModelField('run_commands'),
+        ModelField('run_compute_resource_token_enabled'),
+        ModelField('run_env_variables', 'list', 'EnvVarPrototype'),
+        ModelField('run_mode'),
+        ModelField('run_service_account'),
+        ModelField('run_volume_mounts', 'list', 'VolumeMountPrototype'),
+        ModelField('scale_array_spec'),
+        ModelField('scale_cpu_limit'),
+        ModelField('scale_ephemeral_storage_limit'),
+        ModelField('scale_max_execution_time'),
+        ModelField('scale_memory_limit'),
+        ModelField('scale_retry_limit'),
+    ),
+    'JobRun': (
+        ModelField('computed_env_variables', 'list', 'EnvVar', required=True),
+        ModelField('created_at'),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('image_reference'),
+        ModelField('image_secret'),
+        ModelField('job_name'),
+        ModelField('name'),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+        ModelField('run_arguments', required=True),
+        ModelField('run_as_user'),
+        ModelField('run_commands', required=True),
+        ModelField('run_compute_resource_token_enabled'),
+        ModelField('run_env_variables', 'list', 'EnvVar', required=True),
+        ModelField('run_mode'),
+        ModelField('run_service_account'),
+        ModelField('run_volume_mounts', 'list', 'VolumeMount', required=True),
+        ModelField('scale_array_size_variable_override'),
+        ModelField('scale_array_spec'),
+        ModelField('scale_cpu_limit'),
+        ModelField('scale_ephemeral_storage_limit'),
+        ModelField('scale_max_execution_time'),
+        ModelField('scale_memory_limit'),
+        ModelField('scale_retry_limit'),
+        ModelField('status'),
+        ModelField('status_details', 'model', 'JobRunStatus'),
+    ),
+    'JobRunList': (
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('job_runs', 'list', 'JobRun', required=True),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+    ),
+    'JobRunStatus': (
+        ModelField('completion_time'),
+        ModelField('failed'),
+        ModelField('failed_indices'),
+        ModelField('indices_details', 'dict', 'IndexDetails'),
+        ModelField('pending'),
+        ModelField('pending_indices'),
+        ModelField('requested'),
+        ModelField('running'),
+        ModelField('running_indices'),
+        ModelField('start_time'),
+        ModelField('succeeded'),
+        ModelField('succeeded_indices'),
+        ModelField('unknown'),
+    ),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
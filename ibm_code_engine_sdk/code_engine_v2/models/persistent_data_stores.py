@@ -0,0 +1,471 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models of persistent data stores.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+from .common import ListFirstMetadata, ListNextMetadata
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class PersistentDataStore:
+    """
+    Describes the model of a persistent data store.
+
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param StorageData data: Data container that allows to specify config parameters
+          and their values as a key-value map. Each key field must consist of alphanumeric
+          characters, `-`, `_` or `.` and must not exceed a max length of 253 characters.
+          Each value field can consists of any character and must not exceed a max length
+          of 1048576 characters.
+    :param str entity_tag: The version of the persistent data store, which is used
+          to achieve optimistic locking.
+    :param str id: (optional) The identifier of the resource.
+    :param str name: The name of the persistent data store.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the persistent data store.
+    :param str storage_type: Specify the storage type of the persistent data store.
+    """
+
+    def __init__(
+        self,
+        data: 'StorageData',
+        entity_tag: str,
+        name: str,
+        storage_type: str,
+        *,
+        created_at: Optional[str] = None,
+        id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a PersistentDataStore object.
+
+        :param StorageData data: Data container that allows to specify config
+               parameters and their values as a key-value map. Each key field must consist
+               of alphanumeric characters, `-`, `_` or `.` and must not exceed a max
+               length of 253 characters. Each value field can consists of any character
+               and must not exceed a max length of 1048576 characters.
+        :param str entity_tag: The version of the persistent data store, which is
+               used to achieve optimistic locking.
+        :param str name: The name of the persistent data store.
+        :param str storage_type: Specify the storage type of the persistent data
+               store.
+        """
+        self.created_at = created_at
+        self.data = data
+        self.entity_tag = entity_tag
+        self.id = id
+        self.name = name
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+        self.storage_type = storage_type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PersistentDataStore':
+        """Initialize a PersistentDataStore object from a json dictionary."""
+        args = {}
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (data := _dict.get('data')) is not None:
+            args['data'] = data
+        else:
+            raise ValueError('Required property \'data\' not present in PersistentDataStore JSON')
+        if (entity_tag := _dict.get('entity_tag')) is not None:
+            args['entity_tag'] = entity_tag
+        else:
+            raise ValueError('Required property \'entity_tag\' not present in PersistentDataStore JSON')
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError('Required property \'name\' not present in PersistentDataStore JSON')
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (storage_type := _dict.get('storage_type')) is not None:
+            args['storage_type'] = storage_type
+        else:
+            raise ValueError('Required property \'storage_type\' not present in PersistentDataStore JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PersistentDataStore object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'data') and self.data is not None:
+            if isinstance(self.data, dict):
+                _dict['data'] = self.data
+            else:
+                _dict['data'] = self.data.to_dict()
+        if hasattr(self, 'entity_tag') and self.entity_tag is not None:
+            _dict['entity_tag'] = self.entity_tag
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'storage_type') and self.storage_type is not None:
+            _dict['storage_type'] = self.storage_type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PersistentDataStore object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PersistentDataStore') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PersistentDataStore') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the persistent data store.
+        """
+
+        PERSISTENT_DATA_STORE_V2 = 'persistent_data_store_v2'
+
+    class StorageTypeEnum(str, Enum):
+        """
+        Specify the storage type of the persistent data store.
+        """
+
+        OBJECT_STORAGE = 'object_storage'
+
+
+class PersistentDataStoreList:
+    """
+    List of all persistent data stores.
+
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    :param List[PersistentDataStore] persistent_data_stores: List of persistent data
+          stores.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        persistent_data_stores: List['PersistentDataStore'],
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a PersistentDataStoreList object.
+
+        :param int limit: Maximum number of resources per page.
+        :param List[PersistentDataStore] persistent_data_stores: List of persistent
+               data stores.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.first = first
+        self.limit = limit
+        self.next = next
+        self.persistent_data_stores = persistent_data_stores
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PersistentDataStoreList':
+        """Initialize a PersistentDataStoreList object from a json dictionary."""
+        args = {}
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in PersistentDataStoreList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        if (persistent_data_stores := _dict.get('persistent_data_stores')) is not None:
+            args['persistent_data_stores'] = [PersistentDataStore.from_dict(v) for v in persistent_data_stores]
+        else:
+            raise ValueError('Required property \'persistent_data_stores\' not present in PersistentDataStoreList JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PersistentDataStoreList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        if hasattr(self, 'persistent_data_stores') and self.persistent_data_stores is not None:
+            persistent_data_stores_list = []
+            for v in self.persistent_data_stores:
+                if isinstance(v, dict):
+                    persistent_data_stores_list.append(v)
+                else:
+                    persistent_data_stores_list.append(v.to_dict())
+            _dict['persistent_data_stores'] = persistent_data_stores_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PersistentDataStoreList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PersistentDataStoreList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PersistentDataStoreList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class StorageData:
+    """
+    Data container that allows to specify config parameters and their values as a
+    key-value map. Each key field must consist of alphanumeric characters, `-`, `_` or `.`
+    and must not exceed a max length of 253 characters. Each value field can consists of
+    any character and must not exceed a max length of 1048576 characters.
+
+
+    This type supports additional properties of type str.
+    """
+
+    def __init__(
+        self,
+        **kwargs: Optional[str],
+    ) -> None:
+        """
+        Initialize a StorageData object.
+
+        :param str **kwargs: (optional) Additional properties of type str
+        """
+        msg = "Cannot instantiate base class. Instead, instantiate one of the defined subclasses: {0}".format(
+            ", ".join(['StorageDataObjectStorageData'])
+        )
+        raise Exception(msg)
+
+
+class StorageDataObjectStorageData(StorageData):
+    """
+    Data container that allows to specify config parameters and their values as a
+    key-value map. Each key field must consist of alphanumeric characters, `-`, `_` or `.`
+    and must not exceed a max length of 253 characters. Each value field can consists of
+    any character and must not exceed a max length of 1048576 characters.
+
+    :param str bucket_location: Specify the location of the bucket.
+    :param str bucket_name: Specify the name of the bucket.
+    :param str secret_name: Specify the name of the HMAC secret.
+
+    This type supports additional properties of type str.
+    """
+
+    # The set of defined properties for the class
+    _properties = frozenset(['bucket_location', 'bucket_name', 'secret_name'])
+
+    def __init__(
+        self,
+        bucket_location: str,
+        bucket_name: str,
+        secret_name: str,
+        **kwargs: Optional[str],
+    ) -> None:
+        """
+        Initialize a StorageDataObjectStorageData object.
+
+        :param str bucket_location: Specify the location of the bucket.
+        :param str bucket_name: Specify the name of the bucket.
+        :param str secret_name: Specify the name of the HMAC secret.
+        :param str **kwargs: (optional) Additional properties of type str
+        """
+        # pylint: disable=super-init-not-called
+        self.bucket_location = bucket_location
+        self.bucket_name = bucket_name
+        self.secret_name = secret_name
+        for k, v in kwargs.items():
+            if k not in StorageDataObjectStorageData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'StorageDataObjectStorageData':
+        """Initialize a StorageDataObjectStorageData object from a json dictionary."""
+        args = {}
+        if (bucket_location := _dict.get('bucket_location')) is not None:
+            args['bucket_location'] = bucket_location
+        else:
+            raise ValueError('Required property \'bucket_location\' not present in StorageDataObjectStorageData JSON')
+        if (bucket_name := _dict.get('bucket_name')) is not None:
+            args['bucket_name'] = bucket_name
+        else:
+            raise ValueError('Required property \'bucket_name\' not present in StorageDataObjectStorageData JSON')
+        if (secret_name := _dict.get('secret_name')) is not None:
+            args['secret_name'] = secret_name
+        else:
+            raise ValueError('Required property \'secret_name\' not present in StorageDataObjectStorageData JSON')
+        for k, v in _dict.items():
+            if k not in cls._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                args[k] = v
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a StorageDataObjectStorageData object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'bucket_location') and self.bucket_location is not None:
+            _dict['bucket_location'] = self.bucket_location
+        if hasattr(self, 'bucket_name') and self.bucket_name is not None:
+            _dict['bucket_name'] = self.bucket_name
+        if hasattr(self, 'secret_name') and self.secret_name is not None:
+            _dict['secret_name'] = self.secret_name
+        for k in [_k for _k in vars(self).keys() if _k not in StorageDataObjectStorageData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def get_properties(self) -> Dict:
+        """Return the additional properties from this instance of StorageDataObjectStorageData in the form of a dict."""
+        _dict = {}
+        for k in [_k for _k in vars(self).keys() if _k not in StorageDataObjectStorageData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def set_properties(self, _dict: dict):
+        """Set a dictionary of additional properties in this instance of StorageDataObjectStorageData"""
+        for k in [_k for _k in vars(self).keys() if _k not in StorageDataObjectStorageData._properties]:
+            delattr(self, k)
+        for k, v in _dict.items():
+            if k not in StorageDataObjectStorageData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    def __str__(self) -> str:
+        """Return a `str` version of this StorageDataObjectStorageData object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'StorageDataObjectStorageData') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'StorageDataObjectStorageData') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'PersistentDataStore': (
+        ModelField('created_at'),
+        ModelField('data', required=True, to_dict_kind='model'),
+        ModelField('entity_tag', required=True),
+        ModelField('id'),
+        ModelField('name', required=True),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+        ModelField('storage_type', required=True),
+    ),
+    'PersistentDataStoreList': (
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+        ModelField('persistent_data_stores', 'list', 'PersistentDataStore', required=True),
+    ),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
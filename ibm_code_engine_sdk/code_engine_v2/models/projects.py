@@ -0,0 +1,686 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models of projects.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+from .common import ListFirstMetadata, ListNextMetadata
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class CbrStatus:
+    """
+    Status of the Context-based-restriction configuration applicable for this project.
+
+    :param EnforcementStatus data_plane: Describes the model of the enforcement
+          status of a CBR status.
+    """
+
+    def __init__(
+        self,
+        data_plane: 'EnforcementStatus',
+    ) -> None:
+        """
+        Initialize a CbrStatus object.
+
+        :param EnforcementStatus data_plane: Describes the model of the enforcement
+               status of a CBR status.
+        """
+        self.data_plane = data_plane
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'CbrStatus':
+        """Initialize a CbrStatus object from a json dictionary."""
+        args = {}
+        if (data_plane := _dict.get('data_plane')) is not None:
+            args['data_plane'] = EnforcementStatus.from_dict(data_plane)
+        else:
+            raise ValueError('Required property \'data_plane\' not present in CbrStatus JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a CbrStatus object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'data_plane') and self.data_plane is not None:
+            if isinstance(self.data_plane, dict):
+                _dict['data_plane'] = self.data_plane
+            else:
+                _dict['data_plane'] = self.data_plane.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this CbrStatus object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'CbrStatus') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'CbrStatus') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class EnforcementStatus:
+    """
+    Describes the model of the enforcement status of a CBR status.
+
+    :param str enforcement: Detailed information on the condition of the CBR
+          enforcement.
+    :param str last_synced_at: (optional) Date time information specifying when the
+          last synchronization happened.
+    """
+
+    def __init__(
+        self,
+        enforcement: str,
+        *,
+        last_synced_at: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a EnforcementStatus object.
+
+        :param str enforcement: Detailed information on the condition of the CBR
+               enforcement.
+        :param str last_synced_at: (optional) Date time information specifying when
+               the last synchronization happened.
+        """
+        self.enforcement = enforcement
+        self.last_synced_at = last_synced_at
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'EnforcementStatus':
+        """Initialize a EnforcementStatus object from a json dictionary."""
+        args = {}
+        if (enforcement := _dict.get('enforcement')) is not None:
+            args['enforcement'] = enforcement
+        else:
+            raise ValueError('Required property \'enforcement\' not present in EnforcementStatus JSON')
+        if (last_synced_at := _dict.get('last_synced_at')) is not None:
+            args['last_synced_at'] = last_synced_at
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a EnforcementStatus object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'enforcement') and self.enforcement is not None:
+            _dict['enforcement'] = self.enforcement
+        if hasattr(self, 'last_synced_at') and self.last_synced_at is not None:
+            _dict['last_synced_at'] = self.last_synced_at
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this EnforcementStatus object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'EnforcementStatus') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'EnforcementStatus') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class EnforcementEnum(str, Enum):
+        """
+        Detailed information on the condition of the CBR enforcement.
+        """
+
+        APPLIED = 'applied'
+        OUT_OF_SYNC = 'out_of_sync'
+        NONE = 'none'
+        UNKNOWN = 'unknown'
+
+
+class Project:
+    """
+    Describes the model of a project.
+
+    :param str account_id: (optional) The ID of the account of the project, e.g.
+          4329073d16d2f3663f74bfa955259139.
+    :param str created_at: (optional) The timestamp when the project was created.
+    :param str crn: (optional) The CRN of the project.
+    :param str href: (optional) When you provision a new resource, a URL is created
+          identifying the location of the instance.
+    :param str id: (optional) The ID of the project.
+    :param str name: The name of the project.
+    :param str region: (optional) The region for your project deployment. Possible
+          values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa', 'jp-tok',
+          'us-east', 'us-south'.
+    :param str resource_group_id: The ID of the resource group.
+    :param str resource_type: (optional) The type of the project.
+    :param str status: (optional) The current state of the project. For example,
+          when the project is created and is ready for use, the status of the project is
+          active.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        resource_group_id: str,
+        *,
+        account_id: Optional[str] = None,
+        created_at: Optional[str] = None,
+        crn: Optional[str] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a Project object.
+
+        :param str name: The name of the project.
+        :param str resource_group_id: The ID of the resource group.
+        """
+        self.account_id = account_id
+        self.created_at = created_at
+        self.crn = crn
+        self.href = href
+        self.id = id
+        self.name = name
+        self.region = region
+        self.resource_group_id = resource_group_id
+        self.resource_type = resource_type
+        self.status = status
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Project':
+        """Initialize a Project object from a json dictionary."""
+        args = {}
+        if (account_id := _dict.get('account_id')) is not None:
+            args['account_id'] = account_id
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (crn := _dict.get('crn')) is not None:
+            args['crn'] = crn
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError('Required property \'name\' not present in Project JSON')
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_group_id := _dict.get('resource_group_id')) is not None:
+            args['resource_group_id'] = resource_group_id
+        else:
+            raise ValueError('Required property \'resource_group_id\' not present in Project JSON')
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Project object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'account_id') and getattr(self, 'account_id') is not None:
+            _dict['account_id'] = getattr(self, 'account_id')
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'crn') and getattr(self, 'crn') is not None:
+            _dict['crn'] = getattr(self, 'crn')
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_group_id') and self.resource_group_id is not None:
+            _dict['resource_group_id'] = self.resource_group_id
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'status') and getattr(self, 'status') is not None:
+            _dict['status'] = getattr(self, 'status')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Project object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Project') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Project') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the project.
+        """
+
+        PROJECT_V2 = 'project_v2'
+
+    class StatusEnum(str, Enum):
+        """
+        The current state of the project. For example, when the project is created and is
+        ready for use, the status of the project is active.
+        """
+
+        ACTIVE = 'active'
+        INACTIVE = 'inactive'
+        PENDING_REMOVAL = 'pending_removal'
+        HARD_DELETING = 'hard_deleting'
+        HARD_DELETION_FAILED = 'hard_deletion_failed'
+        HARD_DELETED = 'hard_deleted'
+        DELETING = 'deleting'
+        DELETION_FAILED = 'deletion_failed'
+        SOFT_DELETED = 'soft_deleted'
+        PREPARING = 'preparing'
+        CREATING = 'creating'
+        CREATION_FAILED = 'creation_failed'
+
+
+class ProjectEgressIPAddresses:
+    """
+    Describes the model of egress IP addresses.
+
+    :param List[str] private: (optional) List of IBM private network IP addresses.
+    :param List[str] public: (optional) List of public IP addresses.
+    """
+
+    def __init__(
+        self,
+        *,
+        private: Optional[List[str]] = None,
+        public: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a ProjectEgressIPAddresses object.
+
+        :param List[str] private: (optional) List of IBM private network IP
+               addresses.
+        :param List[str] public: (optional) List of public IP addresses.
+        """
+        self.private = private
+        self.public = public
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ProjectEgressIPAddresses':
+        """Initialize a ProjectEgressIPAddresses object from a json dictionary."""
+        args = {}
+        if (private := _dict.get('private')) is not None:
+            args['private'] = private
+        if (public := _dict.get('public')) is not None:
+            args['public'] = public
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ProjectEgressIPAddresses object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'private') and self.private is not None:
+            _dict['private'] = self.private
+        if hasattr(self, 'public') and self.public is not None:
+            _dict['public'] = self.public
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ProjectEgressIPAddresses object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ProjectEgressIPAddresses') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ProjectEgressIPAddresses') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ProjectList:
+    """
+    Contains a list of projects and pagination information.
+
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    :param List[Project] projects: List of projects.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        projects: List['Project'],
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a ProjectList object.
+
+        :param int limit: Maximum number of resources per page.
+        :param List[Project] projects: List of projects.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.first = first
+        self.limit = limit
+        self.next = next
+        self.projects = projects
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ProjectList':
+        """Initialize a ProjectList object from a json dictionary."""
+        args = {}
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in ProjectList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        if (projects := _dict.get('projects')) is not None:
+            args['projects'] = [Project.from_dict(v) for v in projects]
+        else:
+            raise ValueError('Required property \'projects\' not present in ProjectList JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ProjectList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        if hasattr(self, 'projects') and self.projects is not None:
+            projects_list = []
+            for v in self.projects:
+                if isinstance(v, dict):
+                    projects_list.append(v)
+                else:
+                    projects_list.append(v.to_dict())
+            _dict['projects'] = projects_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ProjectList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ProjectList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ProjectList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ProjectStatusDetails:
+    """
+    Describes the model of a project status details.
+
+    :param CbrStatus cbr: Status of the Context-based-restriction configuration
+          applicable for this project.
+    :param str domain: Status of the domain created for the project.
+    :param str project: Defines whether a project is enabled for management and
+          consumption.
+    :param str vpe: Status of the Virtual Private Endpoint that exposes the project
+          on the IBM Cloud private network.
+    :param bool vpe_not_enabled: (optional) Return true when project is not VPE
+          enabled.
+    """
+
+    def __init__(
+        self,
+        cbr: 'CbrStatus',
+        domain: str,
+        project: str,
+        vpe: str,
+        *,
+        vpe_not_enabled: Optional[bool] = None,
+    ) -> None:
+        """
+        Initialize a ProjectStatusDetails object.
+
+        :param CbrStatus cbr: Status of the Context-based-restriction configuration
+               applicable for this project.
+        :param str domain: Status of the domain created for the project.
+        :param str project: Defines whether a project is enabled for management and
+               consumption.
+        :param str vpe: Status of the Virtual Private Endpoint that exposes the
+               project on the IBM Cloud private network.
+        :param bool vpe_not_enabled: (optional) Return true when project is not VPE
+               enabled.
+        """
+        self.cbr = cbr
+        self.domain = domain
+        self.project = project
+        self.vpe = vpe
+        self.vpe_not_enabled = vpe_not_enabled
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ProjectStatusDetails':
+        """Initialize a ProjectStatusDetails object from a json dictionary."""
+        args = {}
+        if (cbr := _dict.get('cbr')) is not None:
+            args['cbr'] = CbrStatus.from_dict(cbr)
+        else:
+            raise ValueError('Required property \'cbr\' not present in ProjectStatusDetails JSON')
+        if (domain := _dict.get('domain')) is not None:
+            args['domain'] = domain
+        else:
+            raise ValueError('Required property \'domain\' not present in ProjectStatusDetails JSON')
+        if (project := _dict.get('project')) is not None:
+            args['project'] = project
+        else:
+            raise ValueError('Required property \'project\' not present in ProjectStatusDetails JSON')
+        if (vpe := _dict.get('vpe')) is not None:
+            args['vpe'] = vpe
+        else:
+            raise ValueError('Required property \'vpe\' not present in ProjectStatusDetails JSON')
+        if (vpe_not_enabled := _dict.get('vpe_not_enabled')) is not None:
+            args['vpe_not_enabled'] = vpe_not_enabled
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ProjectStatusDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'cbr') and self.cbr is not None:
+            if isinstance(self.cbr, dict):
+                _dict['cbr'] = self.cbr
+            else:
+                _dict['cbr'] = self.cbr.to_dict()
+        if hasattr(self, 'domain') and self.domain is not None:
+            _dict['domain'] = self.domain
+        if hasattr(self, 'project') and self.project is not None:
+            _dict['project'] = self.project
+        if hasattr(self, 'vpe') and self.vpe is not None:
+            _dict['vpe'] = self.vpe
+        if hasattr(self, 'vpe_not_enabled') and self.vpe_not_enabled is not None:
+            _dict['vpe_not_enabled'] = self.vpe_not_enabled
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ProjectStatusDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ProjectStatusDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ProjectStatusDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class DomainEnum(str, Enum):
+        """
+        Status of the domain created for the project.
+        """
+
+        UNKNOWN = 'unknown'
+        READY = 'ready'
+
+    class ProjectEnum(str, Enum):
+        """
+        Defines whether a project is enabled for management and consumption.
+        """
+
+        ENABLED = 'enabled'
+        DISABLED = 'disabled'
+
+    class VpeEnum(str, Enum):
+        """
+        Status of the Virtual Private Endpoint that exposes the project on the IBM Cloud
+        private network.
+        """
+
+        READY = 'ready'
+        UNKNOWN = 'unknown'
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'CbrStatus': (ModelField('data_plane', 'model', 'EnforcementStatus', required=True),),
+    'EnforcementStatus': (
+        ModelField('enforcement', required=True),
+        ModelField('last_synced_at'),
+    ),
+    'Project': (
+        ModelField('account_id'),
+        ModelField('created_at'),
+        ModelField('crn'),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('name', required=True),
+        ModelField('region'),
+        ModelField('resource_group_id', required=True),
+        ModelField('resource_type'),
+        ModelField('status'),
+    ),
+    'ProjectEgressIPAddresses': (
+        ModelField('private'),
+        ModelField('public'),
+    ),
+    'ProjectList': (
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+        ModelField('projects', 'list', 'Project', required=True),
+    ),
+    'ProjectStatusDetails': (
+        ModelField('cbr', 'model', 'CbrStatus', required=True),
+        ModelField('domain', required=True),
+        ModelField('project', required=True),
+        ModelField('vpe', required=True),
+        ModelField('vpe_not_enabled'),
+    ),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
@@ -0,0 +1,1998 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The models of secrets and their data.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from ...decoders import ModelField, install_decoders
+from ...encoders import install_encoders
+from .common import ListFirstMetadata, ListNextMetadata
+
+##############################################################################
+# Models
+##############################################################################
+
+
+class OperatorSecretProps:
+    """
+    Properties for the IBM Cloud Operator Secret.
+
+    :param str apikey_id: The ID of the apikey associated with the operator secret.
+    :param List[str] resource_group_ids: The list of resource groups (by ID) that
+          the operator secret can bind services in.
+    :param ServiceIDRef serviceid: A reference to a Service ID.
+    :param bool user_managed: Specifies whether the operator secret is user managed.
+    """
+
+    def __init__(
+        self,
+        apikey_id: str,
+        resource_group_ids: List[str],
+        serviceid: 'ServiceIDRef',
+        user_managed: bool,
+    ) -> None:
+        """
+        Initialize a OperatorSecretProps object.
+
+        :param str apikey_id: The ID of the apikey associated with the operator
+               secret.
+        :param List[str] resource_group_ids: The list of resource groups (by ID)
+               that the operator secret can bind services in.
+        :param ServiceIDRef serviceid: A reference to a Service ID.
+        :param bool user_managed: Specifies whether the operator secret is user
+               managed.
+        """
+        self.apikey_id = apikey_id
+        self.resource_group_ids = resource_group_ids
+        self.serviceid = serviceid
+        self.user_managed = user_managed
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'OperatorSecretProps':
+        """Initialize a OperatorSecretProps object from a json dictionary."""
+        args = {}
+        if (apikey_id := _dict.get('apikey_id')) is not None:
+            args['apikey_id'] = apikey_id
+        else:
+            raise ValueError('Required property \'apikey_id\' not present in OperatorSecretProps JSON')
+        if (resource_group_ids := _dict.get('resource_group_ids')) is not None:
+            args['resource_group_ids'] = resource_group_ids
+        else:
+            raise ValueError('Required property \'resource_group_ids\' not present in OperatorSecretProps JSON')
+        if (serviceid := _dict.get('serviceid')) is not None:
+            args['serviceid'] = ServiceIDRef.from_dict(serviceid)
+        else:
+            raise ValueError('Required property \'serviceid\' not present in OperatorSecretProps JSON')
+        if (user_managed := _dict.get('user_managed')) is not None:
+            args['user_managed'] = user_managed
+        else:
+            raise ValueError('Required property \'user_managed\' not present in OperatorSecretProps JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a OperatorSecretProps object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'apikey_id') and self.apikey_id is not None:
+            _dict['apikey_id'] = self.apikey_id
+        if hasattr(self, 'resource_group_ids') and self.resource_group_ids is not None:
+            _dict['resource_group_ids'] = self.resource_group_ids
+        if hasattr(self, 'serviceid') and self.serviceid is not None:
+            if isinstance(self.serviceid, dict):
+                _dict['serviceid'] = self.serviceid
+            else:
+                _dict['serviceid'] = self.serviceid.to_dict()
+        if hasattr(self, 'user_managed') and self.user_managed is not None:
+            _dict['user_managed'] = self.user_managed
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this OperatorSecretProps object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'OperatorSecretProps') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'OperatorSecretProps') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class OperatorSecretPrototypeProps:
+    """
+    Properties for the IBM Cloud Operator Secrets.
+
+    :param List[str] resource_group_ids: (optional) The list of resource groups (by
+          ID) that the operator secret can bind services in.
+    :param ServiceIDRefPrototype serviceid: (optional) A reference to the Service
+          ID.
+    """
+
+    def __init__(
+        self,
+        *,
+        resource_group_ids: Optional[List[str]] = None,
+        serviceid: Optional['ServiceIDRefPrototype'] = None,
+    ) -> None:
+        """
+        Initialize a OperatorSecretPrototypeProps object.
+
+        :param List[str] resource_group_ids: (optional) The list of resource groups
+               (by ID) that the operator secret can bind services in.
+        :param ServiceIDRefPrototype serviceid: (optional) A reference to the
+               Service ID.
+        """
+        self.resource_group_ids = resource_group_ids
+        self.serviceid = serviceid
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'OperatorSecretPrototypeProps':
+        """Initialize a OperatorSecretPrototypeProps object from a json dictionary."""
+        args = {}
+        if (resource_group_ids := _dict.get('resource_group_ids')) is not None:
+            args['resource_group_ids'] = resource_group_ids
+        if (serviceid := _dict.get('serviceid')) is not None:
+            args['serviceid'] = ServiceIDRefPrototype.from_dict(serviceid)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a OperatorSecretPrototypeProps object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'resource_group_ids') and self.resource_group_ids is not None:
+            _dict['resource_group_ids'] = self.resource_group_ids
+        if hasattr(self, 'serviceid') and self.serviceid is not None:
+            if isinstance(self.serviceid, dict):
+                _dict['serviceid'] = self.serviceid
+            else:
+                _dict['serviceid'] = self.serviceid.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this OperatorSecretPrototypeProps object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'OperatorSecretPrototypeProps') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'OperatorSecretPrototypeProps') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ResourceKeyRef:
+    """
+    The service credential associated with the secret.
+
+    :param str id: (optional) ID of the service credential associated with the
+          secret.
+    :param str name: (optional) Name of the service credential associated with the
+          secret.
+    """
+
+    def __init__(
+        self,
+        *,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ResourceKeyRef object.
+
+        :param str id: (optional) ID of the service credential associated with the
+               secret.
+        :param str name: (optional) Name of the service credential associated with
+               the secret.
+        """
+        self.id = id
+        self.name = name
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ResourceKeyRef':
+        """Initialize a ResourceKeyRef object from a json dictionary."""
+        args = {}
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ResourceKeyRef object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'id') and self.id is not None:
+            _dict['id'] = self.id
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ResourceKeyRef object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ResourceKeyRef') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ResourceKeyRef') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ResourceKeyRefPrototype:
+    """
+    The service credential associated with the secret.
+
+    :param str id: (optional) ID of the service credential associated with the
+          secret.
+    """
+
+    def __init__(
+        self,
+        *,
+        id: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ResourceKeyRefPrototype object.
+
+        :param str id: (optional) ID of the service credential associated with the
+               secret.
+        """
+        self.id = id
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ResourceKeyRefPrototype':
+        """Initialize a ResourceKeyRefPrototype object from a json dictionary."""
+        args = {}
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ResourceKeyRefPrototype object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'id') and self.id is not None:
+            _dict['id'] = self.id
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ResourceKeyRefPrototype object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ResourceKeyRefPrototype') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ResourceKeyRefPrototype') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class RoleRef:
+    """
+    A reference to the Role and Role CRN for service binding.
+
+    :param str crn: (optional) CRN of the IAM Role for this service access secret.
+    :param str name: (optional) Role of the service credential.
+    """
+
+    def __init__(
+        self,
+        *,
+        crn: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a RoleRef object.
+
+        :param str crn: (optional) CRN of the IAM Role for this service access
+               secret.
+        :param str name: (optional) Role of the service credential.
+        """
+        self.crn = crn
+        self.name = name
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'RoleRef':
+        """Initialize a RoleRef object from a json dictionary."""
+        args = {}
+        if (crn := _dict.get('crn')) is not None:
+            args['crn'] = crn
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a RoleRef object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'crn') and self.crn is not None:
+            _dict['crn'] = self.crn
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this RoleRef object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'RoleRef') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'RoleRef') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class RoleRefPrototype:
+    """
+    A reference to the Role and Role CRN for service binding.
+
+    :param str crn: (optional) CRN of the IAM Role for this service access secret.
+    """
+
+    def __init__(
+        self,
+        *,
+        crn: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a RoleRefPrototype object.
+
+        :param str crn: (optional) CRN of the IAM Role for this service access
+               secret.
+        """
+        self.crn = crn
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'RoleRefPrototype':
+        """Initialize a RoleRefPrototype object from a json dictionary."""
+        args = {}
+        if (crn := _dict.get('crn')) is not None:
+            args['crn'] = crn
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a RoleRefPrototype object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'crn') and self.crn is not None:
+            _dict['crn'] = self.crn
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this RoleRefPrototype object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'RoleRefPrototype') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'RoleRefPrototype') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class Secret:
+    """
+    Describes the model of a secret.
+
+    :param str created_at: (optional) The timestamp when the resource was created.
+    :param dict data: (optional) Data container that allows to specify config
+          parameters and their values as a key-value map. Each key field must consist of
+          alphanumeric characters, `-`, `_` or `.` and must not exceed a max length of 253
+          characters. Each value field can consists of any character and must not exceed a
+          max length of 1048576 characters.
+    :param str entity_tag: The version of the secret instance, which is used to
+          achieve optimistic locking.
+    :param str format: Specify the format of the secret.
+    :param str generated_by: (optional) Specifies whether the secret is user
+          generated.
+    :param str href: (optional) When you provision a new secret,  a URL is created
+          identifying the location of the instance.
+    :param str id: (optional) The identifier of the resource.
+    :param str name: The name of the secret.
+    :param str project_id: (optional) The ID of the project in which the resource is
+          located.
+    :param str region: (optional) The region of the project the resource is located
+          in. Possible values: 'au-syd', 'br-sao', 'ca-tor', 'eu-de', 'eu-gb', 'jp-osa',
+          'jp-tok', 'us-east', 'us-south'.
+    :param str resource_type: (optional) The type of the secret.
+    :param ServiceAccessSecretProps service_access: (optional) Properties for
+          Service Access Secrets.
+    :param OperatorSecretProps service_operator: (optional) Properties for the IBM
+          Cloud Operator Secret.
+    """
+
+    def __init__(
+        self,
+        entity_tag: str,
+        format: str,
+        name: str,
+        *,
+        created_at: Optional[str] = None,
+        data: Optional[dict] = None,
+        generated_by: Optional[str] = None,
+        href: Optional[str] = None,
+        id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        service_access: Optional['ServiceAccessSecretProps'] = None,
+        service_operator: Optional['OperatorSecretProps'] = None,
+    ) -> None:
+        """
+        Initialize a Secret object.
+
+        :param str entity_tag: The version of the secret instance, which is used to
+               achieve optimistic locking.
+        :param str format: Specify the format of the secret.
+        :param str name: The name of the secret.
+        :param dict data: (optional) Data container that allows to specify config
+               parameters and their values as a key-value map. Each key field must consist
+               of alphanumeric characters, `-`, `_` or `.` and must not exceed a max
+               length of 253 characters. Each value field can consists of any character
+               and must not exceed a max length of 1048576 characters.
+        :param ServiceAccessSecretProps service_access: (optional) Properties for
+               Service Access Secrets.
+        :param OperatorSecretProps service_operator: (optional) Properties for the
+               IBM Cloud Operator Secret.
+        """
+        self.created_at = created_at
+        self.data = data
+        self.entity_tag = entity_tag
+        self.format = format
+        self.generated_by = generated_by
+        self.href = href
+        self.id = id
+        self.name = name
+        self.project_id = project_id
+        self.region = region
+        self.resource_type = resource_type
+        self.service_access = service_access
+        self.service_operator = service_operator
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Secret':
+        """Initialize a Secret object from a json dictionary."""
+        args = {}
+        if (created_at := _dict.get('created_at')) is not None:
+            args['created_at'] = created_at
+        if (data := _dict.get('data')) is not None:
+            args['data'] = data
+        if (entity_tag := _dict.get('entity_tag')) is not None:
+            args['entity_tag'] = entity_tag
+        else:
+            raise ValueError('Required property \'entity_tag\' not present in Secret JSON')
+        if (format := _dict.get('format')) is not None:
+            args['format'] = format
+        else:
+            raise ValueError('Required property \'format\' not present in Secret JSON')
+        if (generated_by := _dict.get('generated_by')) is not None:
+            args['generated_by'] = generated_by
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        else:
+            raise ValueError('Required property \'name\' not present in Secret JSON')
+        if (project_id := _dict.get('project_id')) is not None:
+            args['project_id'] = project_id
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (resource_type := _dict.get('resource_type')) is not None:
+            args['resource_type'] = resource_type
+        if (service_access := _dict.get('service_access')) is not None:
+            args['service_access'] = ServiceAccessSecretProps.from_dict(service_access)
+        if (service_operator := _dict.get('service_operator')) is not None:
+            args['service_operator'] = OperatorSecretProps.from_dict(service_operator)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Secret object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'created_at') and getattr(self, 'created_at') is not None:
+            _dict['created_at'] = getattr(self, 'created_at')
+        if hasattr(self, 'data') and self.data is not None:
+            _dict['data'] = self.data
+        if hasattr(self, 'entity_tag') and self.entity_tag is not None:
+            _dict['entity_tag'] = self.entity_tag
+        if hasattr(self, 'format') and self.format is not None:
+            _dict['format'] = self.format
+        if hasattr(self, 'generated_by') and getattr(self, 'generated_by') is not None:
+            _dict['generated_by'] = getattr(self, 'generated_by')
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        if hasattr(self, 'id') and getattr(self, 'id') is not None:
+            _dict['id'] = getattr(self, 'id')
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'project_id') and getattr(self, 'project_id') is not None:
+            _dict['project_id'] = getattr(self, 'project_id')
+        if hasattr(self, 'region') and getattr(self, 'region') is not None:
+            _dict['region'] = getattr(self, 'region')
+        if hasattr(self, 'resource_type') and getattr(self, 'resource_type') is not None:
+            _dict['resource_type'] = getattr(self, 'resource_type')
+        if hasattr(self, 'service_access') and self.service_access is not None:
+            if isinstance(self.service_access, dict):
+                _dict['service_access'] = self.service_access
+            else:
+                _dict['service_access'] = self.service_access.to_dict()
+        if hasattr(self, 'service_operator') and self.service_operator is not None:
+            if isinstance(self.service_operator, dict):
+                _dict['service_operator'] = self.service_operator
+            else:
+                _dict['service_operator'] = self.service_operator.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Secret object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Secret') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Secret') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class FormatEnum(str, Enum):
+        """
+        Specify the format of the secret.
+        """
+
+        GENERIC = 'generic'
+        SSH_AUTH = 'ssh_auth'
+        BASIC_AUTH = 'basic_auth'
+        HMAC_AUTH = 'hmac_auth'
+        TLS = 'tls'
+        SERVICE_ACCESS = 'service_access'
+        REGISTRY = 'registry'
+        SERVICE_OPERATOR = 'service_operator'
+        OTHER = 'other'
+
+    class GeneratedByEnum(str, Enum):
+        """
+        Specifies whether the secret is user generated.
+        """
+
+        USER = 'user'
+        SYSTEM = 'system'
+
+    class ResourceTypeEnum(str, Enum):
+        """
+        The type of the secret.
+        """
+
+        SECRET_V2 = 'secret_v2'
+        SECRET_AUTH_SSH_V2 = 'secret_auth_ssh_v2'
+        SECRET_BASIC_AUTH_V2 = 'secret_basic_auth_v2'
+        SECRET_GENERIC_V2 = 'secret_generic_v2'
+        SECRET_OPERATOR_V2 = 'secret_operator_v2'
+        SECRET_OTHER_V2 = 'secret_other_v2'
+        SECRET_REGISTRY_V2 = 'secret_registry_v2'
+        SECRET_SERVICE_ACCESS_V2 = 'secret_service_access_v2'
+        SECRET_TLS_V2 = 'secret_tls_v2'
+        SECRET_HMAC_AUTH_V2 = 'secret_hmac_auth_v2'
+
+
+class SecretData:
+    """
+    Data container that allows to specify config parameters and their values as a
+    key-value map. Each key field must consist of alphanumeric characters, `-`, `_` or `.`
+    and must not exceed a max length of 253 characters. Each value field can consists of
+    any character and must not exceed a max length of 1048576 characters.
+
+
+    This type supports additional properties of type str.
+    """
+
+    def __init__(
+        self,
+        **kwargs: Optional[str],
+    ) -> None:
+        """
+        Initialize a SecretData object.
+
+        :param str **kwargs: (optional) Additional properties of type str
+        """
+        msg = "Cannot instantiate base class. Instead, instantiate one of the defined subclasses: {0}".format(
+            ", ".join(
+                [
+                    'SecretDataGenericSecretData',
+                    'SecretDataBasicAuthSecretData',
+                    'SecretDataRegistrySecretData',
+                    'SecretDataSSHSecretData',
+                    'SecretDataHMACAuthSecretData',
+                    'SecretDataTLSSecretData',
+                ]
+            )
+        )
+        raise Exception(msg)
+
+
+class SecretList:
+    """
+    List of secret resources.
+
+    :param ListFirstMetadata first: (optional) Describes properties needed to
+          retrieve the first page of a result list.
+    :param int limit: Maximum number of resources per page.
+    :param ListNextMetadata next: (optional) Describes properties needed to retrieve
+          the next page of a result list.
+    :param List[Secret] secrets: List of secrets.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        secrets: List['Secret'],
+        *,
+        first: Optional['ListFirstMetadata'] = None,
+        next: Optional['ListNextMetadata'] = None,
+    ) -> None:
+        """
+        Initialize a SecretList object.
+
+        :param int limit: Maximum number of resources per page.
+        :param List[Secret] secrets: List of secrets.
+        :param ListFirstMetadata first: (optional) Describes properties needed to
+               retrieve the first page of a result list.
+        :param ListNextMetadata next: (optional) Describes properties needed to
+               retrieve the next page of a result list.
+        """
+        self.first = first
+        self.limit = limit
+        self.next = next
+        self.secrets = secrets
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SecretList':
+        """Initialize a SecretList object from a json dictionary."""
+        args = {}
+        if (first := _dict.get('first')) is not None:
+            args['first'] = ListFirstMetadata.from_dict(first)
+        if (limit := _dict.get('limit')) is not None:
+            args['limit'] = limit
+        else:
+            raise ValueError('Required property \'limit\' not present in SecretList JSON')
+        if (next := _dict.get('next')) is not None:
+            args['next'] = ListNextMetadata.from_dict(next)
+        if (secrets := _dict.get('secrets')) is not None:
+            args['secrets'] = [Secret.from_dict(v) for v in secrets]
+        else:
+            raise ValueError('Required property \'secrets\' not present in SecretList JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SecretList object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'limit') and self.limit is not None:
+            _dict['limit'] = self.limit
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        if hasattr(self, 'secrets') and self.secrets is not None:
+            secrets_list = []
+            for v in self.secrets:
+                if isinstance(v, dict):
+                    secrets_list.append(v)
+                else:
+                    secrets_list.append(v.to_dict())
+            _dict['secrets'] = secrets_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SecretList object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SecretList') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SecretList') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ServiceAccessSecretProps:
+    """
+    Properties for Service Access Secrets.
+
+    :param ResourceKeyRef resource_key: (optional) The service credential associated
+          with the secret.
+    :param RoleRef role: (optional) A reference to the Role and Role CRN for service
+          binding.
+    :param ServiceInstanceRef service_instance: The IBM Cloud service instance
+          associated with the secret.
+    :param ServiceIDRef serviceid: (optional) A reference to a Service ID.
+    """
+
+    def __init__(
+        self,
+        service_instance: 'ServiceInstanceRef',
+        *,
+        resource_key: Optional['ResourceKeyRef'] = None,
+        role: Optional['RoleRef'] = None,
+        serviceid: Optional['ServiceIDRef'] = None,
+    ) -> None:
+        """
+        Initialize a ServiceAccessSecretProps object.
+
+        :param ServiceInstanceRef service_instance: The IBM Cloud service instance
+               associated with the secret.
+        :param ResourceKeyRef resource_key: (optional) The service credential
+               associated with the secret.
+        :param RoleRef role: (optional) A reference to the Role and Role CRN for
+               service binding.
+        :param ServiceIDRef serviceid: (optional) A reference to a Service ID.
+        """
+        self.resource_key = resource_key
+        self.role = role
+        self.service_instance = service_instance
+        self.serviceid = serviceid
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ServiceAccessSecretProps':
+        """Initialize a ServiceAccessSecretProps object from a json dictionary."""
+        args = {}
+        if (resource_key := _dict.get('resource_key')) is not None:
+            args['resource_key'] = ResourceKeyRef.from_dict(resource_key)
+        if (role := _dict.get('role')) is not None:
+            args['role'] = RoleRef.from_dict(role)
+        if (service_instance := _dict.get('service_instance')) is not None:
+            args['service_instance'] = ServiceInstanceRef.from_dict(service_instance)
+        else:
+            raise ValueError('Required property \'service_instance\' not present in ServiceAccessSecretProps JSON')
+        if (serviceid := _dict.get('serviceid')) is not None:
+            args['serviceid'] = ServiceIDRef.from_dict(serviceid)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ServiceAccessSecretProps object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'resource_key') and self.resource_key is not None:
+            if isinstance(self.resource_key, dict):
+                _dict['resource_key'] = self.resource_key
+            else:
+                _dict['resource_key'] = self.resource_key.to_dict()
+        if hasattr(self, 'role') and self.role is not None:
+            if isinstance(self.role, dict):
+                _dict['role'] = self.role
+            else:
+                _dict['role'] = self.role.to_dict()
+        if hasattr(self, 'service_instance') and self.service_instance is not None:
+            if isinstance(self.service_instance, dict):
+                _dict['service_instance'] = self.service_instance
+            else:
+                _dict['service_instance'] = self.service_instance.to_dict()
+        if hasattr(self, 'serviceid') and self.serviceid is not None:
+            if isinstance(self.serviceid, dict):
+                _dict['serviceid'] = self.serviceid
+            else:
+                _dict['serviceid'] = self.serviceid.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ServiceAccessSecretProps object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ServiceAccessSecretProps') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ServiceAccessSecretProps') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ServiceAccessSecretPrototypeProps:
+    """
+    Properties for Service Access Secrets.
+
+    :param ResourceKeyRefPrototype resource_key: (optional) The service credential
+          associated with the secret.
+    :param RoleRefPrototype role: (optional) A reference to the Role and Role CRN
+          for service binding.
+    :param ServiceInstanceRefPrototype service_instance: The IBM Cloud service
+          instance associated with the secret.
+    :param ServiceIDRef serviceid: (optional) A reference to a Service ID.
+    """
+
+    def __init__(
+        self,
+        service_instance: 'ServiceInstanceRefPrototype',
+        *,
+        resource_key: Optional['ResourceKeyRefPrototype'] = None,
+        role: Optional['RoleRefPrototype'] = None,
+        serviceid: Optional['ServiceIDRef'] = None,
+    ) -> None:
+        """
+        Initialize a ServiceAccessSecretPrototypeProps object.
+
+        :param ServiceInstanceRefPrototype service_instance: The IBM Cloud service
+               instance associated with the secret.
+        :param ResourceKeyRefPrototype resource_key: (optional) The service
+               credential associated with the secret.
+        :param RoleRefPrototype role: (optional) A reference to the Role and Role
+               CRN for service binding.
+        :param ServiceIDRef serviceid: (optional) A reference to a Service ID.
+        """
+        self.resource_key = resource_key
+        self.role = role
+        self.service_instance = service_instance
+        self.serviceid = serviceid
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ServiceAccessSecretPrototypeProps':
+        """Initialize a ServiceAccessSecretPrototypeProps object from a json dictionary."""
+        args = {}
+        if (resource_key := _dict.get('resource_key')) is not None:
+            args['resource_key'] = ResourceKeyRefPrototype.from_dict(resource_key)
+        if (role := _dict.get('role')) is not None:
+            args['role'] = RoleRefPrototype.from_dict(role)
+        if (service_instance := _dict.get('service_instance')) is not None:
+            args['service_instance'] = ServiceInstanceRefPrototype.from_dict(service_instance)
+        else:
+            raise ValueError(
+                'Required property \'service_instance\' not present in ServiceAccessSecretPrototypeProps JSON'
+            )
+        if (serviceid := _dict.get('serviceid')) is not None:
+            args['serviceid'] = ServiceIDRef.from_dict(serviceid)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ServiceAccessSecretPrototypeProps object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'resource_key') and self.resource_key is not None:
+            if isinstance(self.resource_key, dict):
+                _dict['resource_key'] = self.resource_key
+            else:
+                _dict['resource_key'] = self.resource_key.to_dict()
+        if hasattr(self, 'role') and self.role is not None:
+            if isinstance(self.role, dict):
+                _dict['role'] = self.role
+            else:
+                _dict['role'] = self.role.to_dict()
+        if hasattr(self, 'service_instance') and self.service_instance is not None:
+            if isinstance(self.service_instance, dict):
+                _dict['service_instance'] = self.service_instance
+            else:
+                _dict['service_instance'] = self.service_instance.to_dict()
+        if hasattr(self, 'serviceid') and self.serviceid is not None:
+            if isinstance(self.serviceid, dict):
+                _dict['serviceid'] = self.serviceid
+            else:
+                _dict['serviceid'] = self.serviceid.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ServiceAccessSecretPrototypeProps object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ServiceAccessSecretPrototypeProps') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ServiceAccessSecretPrototypeProps') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ServiceIDRef:
+    """
+    A reference to a Service ID.
+
+    :param str crn: (optional) CRN value of a Service ID.
+    :param str id: (optional) The ID of the Service ID.
+    """
+
+    def __init__(
+        self,
+        *,
+        crn: Optional[str] = None,
+        id: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ServiceIDRef object.
+
+        :param str crn: (optional) CRN value of a Service ID.
+        :param str id: (optional) The ID of the Service ID.
+        """
+        self.crn = crn
+        self.id = id
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ServiceIDRef':
+        """Initialize a ServiceIDRef object from a json dictionary."""
+        args = {}
+        if (crn := _dict.get('crn')) is not None:
+            args['crn'] = crn
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ServiceIDRef object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'crn') and self.crn is not None:
+            _dict['crn'] = self.crn
+        if hasattr(self, 'id') and self.id is not None:
+            _dict['id'] = self.id
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ServiceIDRef object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ServiceIDRef') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ServiceIDRef') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ServiceIDRefPrototype:
+    """
+    A reference to the Service ID.
+
+    :param str id: (optional) The ID of the Service ID.
+    """
+
+    def __init__(
+        self,
+        *,
+        id: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ServiceIDRefPrototype object.
+
+        :param str id: (optional) The ID of the Service ID.
+        """
+        self.id = id
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ServiceIDRefPrototype':
+        """Initialize a ServiceIDRefPrototype object from a json dictionary."""
+        args = {}
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ServiceIDRefPrototype object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'id') and self.id is not None:
+            _dict['id'] = self.id
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ServiceIDRefPrototype object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ServiceIDRefPrototype') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ServiceIDRefPrototype') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ServiceInstanceRef:
+    """
+    The IBM Cloud service instance associated with the secret.
+
+    :param str id: (optional) ID of the IBM Cloud service instance associated with
+          the secret.
+    :param str type: (optional) Type of IBM Cloud service associated with the
+          secret.
+    """
+
+    def __init__(
+        self,
+        *,
+        id: Optional[str] = None,
+        type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ServiceInstanceRef object.
+
+        :param str id: (optional) ID of the IBM Cloud service instance associated
+               with the secret.
+        :param str type: (optional) Type of IBM Cloud service associated with the
+               secret.
+        """
+        self.id = id
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ServiceInstanceRef':
+        """Initialize a ServiceInstanceRef object from a json dictionary."""
+        args = {}
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ServiceInstanceRef object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'id') and self.id is not None:
+            _dict['id'] = self.id
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ServiceInstanceRef object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ServiceInstanceRef') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ServiceInstanceRef') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ServiceInstanceRefPrototype:
+    """
+    The IBM Cloud service instance associated with the secret.
+
+    :param str id: (optional) ID of the IBM Cloud service instance associated with
+          the secret.
+    """
+
+    def __init__(
+        self,
+        *,
+        id: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ServiceInstanceRefPrototype object.
+
+        :param str id: (optional) ID of the IBM Cloud service instance associated
+               with the secret.
+        """
+        self.id = id
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ServiceInstanceRefPrototype':
+        """Initialize a ServiceInstanceRefPrototype object from a json dictionary."""
+        args = {}
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ServiceInstanceRefPrototype object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'id') and self.id is not None:
+            _dict['id'] = self.id
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ServiceInstanceRefPrototype object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ServiceInstanceRefPrototype') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ServiceInstanceRefPrototype') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SecretDataBasicAuthSecretData(SecretData):
+    """
+    SecretDataBasicAuthSecretData.
+
+    :param str password: Basic auth password.
+    :param str username: Basic auth username.
+
+    This type supports additional properties of type str.
+    """
+
+    # The set of defined properties for the class
+    _properties = frozenset(['password', 'username'])
+
+    def __init__(
+        self,
+        password: str,
+        username: str,
+        **kwargs: Optional[str],
+    ) -> None:
+        """
+        Initialize a SecretDataBasicAuthSecretData object.
+
+        :param str password: Basic auth password.
+        :param str username: Basic auth username.
+        :param str **kwargs: (optional) Additional properties of type str
+        """
+        # pylint: disable=super-init-not-called
+        self.password = password
+        self.username = username
+        for k, v in kwargs.items():
+            if k not in SecretDataBasicAuthSecretData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SecretDataBasicAuthSecretData':
+        """Initialize a SecretDataBasicAuthSecretData object from a json dictionary."""
+        args = {}
+        if (password := _dict.get('password')) is not None:
+            args['password'] = password
+        else:
+            raise ValueError('Required property \'password\' not present in SecretDataBasicAuthSecretData JSON')
+        if (username := _dict.get('username')) is not None:
+            args['username'] = username
+        else:
+            raise ValueError('Required property \'username\' not present in SecretDataBasicAuthSecretData JSON')
+        for k, v in _dict.items():
+            if k not in cls._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                args[k] = v
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SecretDataBasicAuthSecretData object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'password') and self.password is not None:
+            _dict['password'] = self.password
+        if hasattr(self, 'username') and self.username is not None:
+            _dict['username'] = self.username
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataBasicAuthSecretData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def get_properties(self) -> Dict:
+        """Return the additional properties from this instance of SecretDataBasicAuthSecretData in the form of a dict."""
+        _dict = {}
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataBasicAuthSecretData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def set_properties(self, _dict: dict):
+        """Set a dictionary of additional properties in this instance of SecretDataBasicAuthSecretData"""
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataBasicAuthSecretData._properties]:
+            delattr(self, k)
+        for k, v in _dict.items():
+            if k not in SecretDataBasicAuthSecretData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SecretDataBasicAuthSecretData object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SecretDataBasicAuthSecretData') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SecretDataBasicAuthSecretData') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SecretDataGenericSecretData(SecretData):
+    """
+    Data container that allows to specify config parameters and their values as a
+    key-value map. Each key field must consist of alphanumeric characters, `-`, `_` or `.`
+    and must not be exceed a max length of 253 characters. Each value field can consists
+    of any character and must not be exceed a max length of 1048576 characters.
+
+
+    This type supports additional properties of type str.
+    """
+
+    def __init__(
+        self,
+        **kwargs: Optional[str],
+    ) -> None:
+        """
+        Initialize a SecretDataGenericSecretData object.
+
+        :param str **kwargs: (optional) Additional properties of type str
+        """
+        # pylint: disable=super-init-not-called
+        for k, v in kwargs.items():
+            if not isinstance(v, str):
+                raise ValueError('Value for additional property {} must be of type str'.format(k))
+            setattr(self, k, v)
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SecretDataGenericSecretData':
+        """Initialize a SecretDataGenericSecretData object from a json dictionary."""
+        args = {}
+        for k, v in _dict.items():
+            if not isinstance(v, str):
+                raise ValueError('Value for additional property {} must be of type str'.format(k))
+            args[k] = v
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SecretDataGenericSecretData object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        for k in [_k for _k in vars(self).keys()]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def get_properties(self) -> Dict:
+        """Return the additional properties from this instance of SecretDataGenericSecretData in the form of a dict."""
+        _dict = {}
+        for k in [_k for _k in vars(self).keys()]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def set_properties(self, _dict: dict):
+        """Set a dictionary of additional properties in this instance of SecretDataGenericSecretData"""
+        for k in [_k for _k in vars(self).keys()]:
+            delattr(self, k)
+        for k, v in _dict.items():
+            if not isinstance(v, str):
+                raise ValueError('Value for additional property {} must be of type str'.format(k))
+            setattr(self, k, v)
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SecretDataGenericSecretData object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SecretDataGenericSecretData') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SecretDataGenericSecretData') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SecretDataHMACAuthSecretData(SecretData):
+    """
+    Secret Data field used by HMAC secrets.
+
+    :param str access_key_id: HMAC access key id.
+    :param str secret_access_key: HMAC secret access key.
+
+    This type supports additional properties of type str.
+    """
+
+    # The set of defined properties for the class
+    _properties = frozenset(['access_key_id', 'secret_access_key'])
+
+    def __init__(
+        self,
+        access_key_id: str,
+        secret_access_key: str,
+        **kwargs: Optional[str],
+    ) -> None:
+        """
+        Initialize a SecretDataHMACAuthSecretData object.
+
+        :param str access_key_id: HMAC access key id.
+        :param str secret_access_key: HMAC secret access key.
+        :param str **kwargs: (optional) Additional properties of type str
+        """
+        # pylint: disable=super-init-not-called
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        for k, v in kwargs.items():
+            if k not in SecretDataHMACAuthSecretData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SecretDataHMACAuthSecretData':
+        """Initialize a SecretDataHMACAuthSecretData object from a json dictionary."""
+        args = {}
+        if (access_key_id := _dict.get('access_key_id')) is not None:
+            args['access_key_id'] = access_key_id
+        else:
+            raise ValueError('Required property \'access_key_id\' not present in SecretDataHMACAuthSecretData JSON')
+        if (secret_access_key := _dict.get('secret_access_key')) is not None:
+            args['secret_access_key'] = secret_access_key
+        else:
+            raise ValueError('Required property \'secret_access_key\' not present in SecretDataHMACAuthSecretData JSON')
+        for k, v in _dict.items():
+            if k not in cls._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                args[k] = v
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SecretDataHMACAuthSecretData object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'access_key_id') and self.access_key_id is not None:
+            _dict['access_key_id'] = self.access_key_id
+        if hasattr(self, 'secret_access_key') and self.secret_access_key is not None:
+            _dict['secret_access_key'] = self.secret_access_key
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataHMACAuthSecretData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def get_properties(self) -> Dict:
+        """Return the additional properties from this instance of SecretDataHMACAuthSecretData in the form of a dict."""
+        _dict = {}
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataHMACAuthSecretData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def set_properties(self, _dict: dict):
+        """Set a dictionary of additional properties in this instance of SecretDataHMACAuthSecretData"""
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataHMACAuthSecretData._properties]:
+            delattr(self, k)
+        for k, v in _dict.items():
+            if k not in SecretDataHMACAuthSecretData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SecretDataHMACAuthSecretData object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SecretDataHMACAuthSecretData') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SecretDataHMACAuthSecretData') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SecretDataRegistrySecretData(SecretData):
+    """
+    SecretDataRegistrySecretData.
+
+    :param str email: (optional) Registry email address.
+    :param str password: Registry password.
+    :param str server: Registry server.
+    :param str username: Registry username.
+
+    This type supports additional properties of type str.
+    """
+
+    # The set of defined properties for the class
+    _properties = frozenset(['email', 'password', 'server', 'username'])
+
+    def __init__(
+        self,
+        password: str,
+        server: str,
+        username: str,
+        *,
+        email: Optional[str] = None,
+        **kwargs: Optional[str],
+    ) -> None:
+        """
+        Initialize a SecretDataRegistrySecretData object.
+
+        :param str password: Registry password.
+        :param str server: Registry server.
+        :param str username: Registry username.
+        :param str email: (optional) Registry email address.
+        :param str **kwargs: (optional) Additional properties of type str
+        """
+        # pylint: disable=super-init-not-called
+        self.email = email
+        self.password = password
+        self.server = server
+        self.username = username
+        for k, v in kwargs.items():
+            if k not in SecretDataRegistrySecretData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SecretDataRegistrySecretData':
+        """Initialize a SecretDataRegistrySecretData object from a json dictionary."""
+        args = {}
+        if (email := _dict.get('email')) is not None:
+            args['email'] = email
+        if (password := _dict.get('password')) is not None:
+            args['password'] = password
+        else:
+            raise ValueError('Required property \'password\' not present in SecretDataRegistrySecretData JSON')
+        if (server := _dict.get('server')) is not None:
+            args['server'] = server
+        else:
+            raise ValueError('Required property \'server\' not present in SecretDataRegistrySecretData JSON')
+        if (username := _dict.get('username')) is not None:
+            args['username'] = username
+        else:
+            raise ValueError('Required property \'username\' not present in SecretDataRegistrySecretData JSON')
+        for k, v in _dict.items():
+            if k not in cls._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                args[k] = v
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SecretDataRegistrySecretData object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'email') and self.email is not None:
+            _dict['email'] = self.email
+        if hasattr(self, 'password') and self.password is not None:
+            _dict['password'] = self.password
+        if hasattr(self, 'server') and self.server is not None:
+            _dict['server'] = self.server
+        if hasattr(self, 'username') and self.username is not None:
+            _dict['username'] = self.username
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataRegistrySecretData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def get_properties(self) -> Dict:
+        """Return the additional properties from this instance of SecretDataRegistrySecretData in the form of a dict."""
+        _dict = {}
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataRegistrySecretData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def set_properties(self, _dict: dict):
+        """Set a dictionary of additional properties in this instance of SecretDataRegistrySecretData"""
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataRegistrySecretData._properties]:
+            delattr(self, k)
+        for k, v in _dict.items():
+            if k not in SecretDataRegistrySecretData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SecretDataRegistrySecretData object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SecretDataRegistrySecretData') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SecretDataRegistrySecretData') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SecretDataSSHSecretData(SecretData):
+    """
+    Secret Data field used by SSH secrets.
+
+    :param str known_hosts: (optional) Known hosts.
+    :param str ssh_key: SSH key.
+
+    This type supports additional properties of type str.
+    """
+
+    # The set of defined properties for the class
+    _properties = frozenset(['known_hosts', 'ssh_key'])
+
+    def __init__(
+        self,
+        ssh_key: str,
+        *,
+        known_hosts: Optional[str] = None,
+        **kwargs: Optional[str],
+    ) -> None:
+        """
+        Initialize a SecretDataSSHSecretData object.
+
+        :param str ssh_key: SSH key.
+        :param str known_hosts: (optional) Known hosts.
+        :param str **kwargs: (optional) Additional properties of type str
+        """
+        # pylint: disable=super-init-not-called
+        self.known_hosts = known_hosts
+        self.ssh_key = ssh_key
+        for k, v in kwargs.items():
+            if k not in SecretDataSSHSecretData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SecretDataSSHSecretData':
+        """Initialize a SecretDataSSHSecretData object from a json dictionary."""
+        args = {}
+        if (known_hosts := _dict.get('known_hosts')) is not None:
+            args['known_hosts'] = known_hosts
+        if (ssh_key := _dict.get('ssh_key')) is not None:
+            args['ssh_key'] = ssh_key
+        else:
+            raise ValueError('Required property \'ssh_key\' not present in SecretDataSSHSecretData JSON')
+        for k, v in _dict.items():
+            if k not in cls._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                args[k] = v
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SecretDataSSHSecretData object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'known_hosts') and self.known_hosts is not None:
+            _dict['known_hosts'] = self.known_hosts
+        if hasattr(self, 'ssh_key') and self.ssh_key is not None:
+            _dict['ssh_key'] = self.ssh_key
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataSSHSecretData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def get_properties(self) -> Dict:
+        """Return the additional properties from this instance of SecretDataSSHSecretData in the form of a dict."""
+        _dict = {}
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataSSHSecretData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def set_properties(self, _dict: dict):
+        """Set a dictionary of additional properties in this instance of SecretDataSSHSecretData"""
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataSSHSecretData._properties]:
+            delattr(self, k)
+        for k, v in _dict.items():
+            if k not in SecretDataSSHSecretData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SecretDataSSHSecretData object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SecretDataSSHSecretData') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SecretDataSSHSecretData') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SecretDataTLSSecretData(SecretData):
+    """
+    SecretDataTLSSecretData.
+
+    :param str tls_cert: The TLS certificate used in a TLS secret.
+    :param str tls_key: The TLS key used in a TLS secret.
+
+    This type supports additional properties of type str.
+    """
+
+    # The set of defined properties for the class
+    _properties = frozenset(['tls_cert', 'tls_key'])
+
+    def __init__(
+        self,
+        tls_cert: str,
+        tls_key: str,
+        **kwargs: Optional[str],
+    ) -> None:
+        """
+        Initialize a SecretDataTLSSecretData object.
+
+        :param str tls_cert: The TLS certificate used in a TLS secret.
+        :param str tls_key: The TLS key used in a TLS secret.
+        :param str **kwargs: (optional) Additional properties of type str
+        """
+        # pylint: disable=super-init-not-called
+        self.tls_cert = tls_cert
+        self.tls_key = tls_key
+        for k, v in kwargs.items():
+            if k not in SecretDataTLSSecretData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SecretDataTLSSecretData':
+        """Initialize a SecretDataTLSSecretData object from a json dictionary."""
+        args = {}
+        if (tls_cert := _dict.get('tls_cert')) is not None:
+            args['tls_cert'] = tls_cert
+        else:
+            raise ValueError('Required property \'tls_cert\' not present in SecretDataTLSSecretData JSON')
+        if (tls_key := _dict.get('tls_key')) is not None:
+            args['tls_key'] = tls_key
+        else:
+            raise ValueError('Required property \'tls_key\' not present in SecretDataTLSSecretData JSON')
+        for k, v in _dict.items():
+            if k not in cls._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                args[k] = v
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SecretDataTLSSecretData object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'tls_cert') and self.tls_cert is not None:
+            _dict['tls_cert'] = self.tls_cert
+        if hasattr(self, 'tls_key') and self.tls_key is not None:
+            _dict['tls_key'] = self.tls_key
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataTLSSecretData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def get_properties(self) -> Dict:
+        """Return the additional properties from this instance of SecretDataTLSSecretData in the form of a dict."""
+        _dict = {}
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataTLSSecretData._properties]:
+            _dict[k] = getattr(self, k)
+        return _dict
+
+    def set_properties(self, _dict: dict):
+        """Set a dictionary of additional properties in this instance of SecretDataTLSSecretData"""
+        for k in [_k for _k in vars(self).keys() if _k not in SecretDataTLSSecretData._properties]:
+            delattr(self, k)
+        for k, v in _dict.items():
+            if k not in SecretDataTLSSecretData._properties:
+                if not isinstance(v, str):
+                    raise ValueError('Value for additional property {} must be of type str'.format(k))
+                setattr(self, k, v)
+            else:
+                raise ValueError('Property {} cannot be specified as an additional property'.format(k))
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SecretDataTLSSecretData object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SecretDataTLSSecretData') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SecretDataTLSSecretData') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+# The properties of the models, generated by tools/generate_model_fields.py.
+_FIELDS = {
+    'OperatorSecretProps': (
+        ModelField('apikey_id', required=True),
+        ModelField('resource_group_ids', required=True),
+        ModelField('serviceid', 'model', 'ServiceIDRef', required=True),
+        ModelField('user_managed', required=True),
+    ),
+    'OperatorSecretPrototypeProps': (
+        ModelField('resource_group_ids'),
+        ModelField('serviceid', 'model', 'ServiceIDRefPrototype'),
+    ),
+    'ResourceKeyRef': (
+        ModelField('id'),
+        ModelField('name'),
+    ),
+    'ResourceKeyRefPrototype': (ModelField('id'),),
+    'RoleRef': (
+        ModelField('crn'),
+        ModelField('name'),
+    ),
+    'RoleRefPrototype': (ModelField('crn'),),
+    'Secret': (
+        ModelField('created_at'),
+        ModelField('data'),
+        ModelField('entity_tag', required=True),
+        ModelField('format', required=True),
+        ModelField('generated_by'),
+        ModelField('href'),
+        ModelField('id'),
+        ModelField('name', required=True),
+        ModelField('project_id'),
+        ModelField('region'),
+        ModelField('resource_type'),
+        ModelField('service_access', 'model', 'ServiceAccessSecretProps'),
+        ModelField('service_operator', 'model', 'OperatorSecretProps'),
+    ),
+    'SecretList': (
+        ModelField('first', 'model', 'ListFirstMetadata'),
+        ModelField('limit', required=True),
+        ModelField('next', 'model', 'ListNextMetadata'),
+        ModelField('secrets', 'list', 'Secret', required=True),
+    ),
+    'ServiceAccessSecretProps': (
+        ModelField('resource_key', 'model', 'ResourceKeyRef'),
+        ModelField('role', 'model', 'RoleRef'),
+        ModelField('service_instance', 'model', 'ServiceInstanceRef', required=True),
+        ModelField('serviceid', 'model', 'ServiceIDRef'),
+    ),
+    'ServiceAccessSecretPrototypeProps': (
+        ModelField('resource_key', 'model', 'ResourceKeyRefPrototype'),
+        ModelField('role', 'model', 'RoleRefPrototype'),
+        ModelField('service_instance', 'model', 'ServiceInstanceRefPrototype', required=True),
+        ModelField('serviceid', 'model', 'ServiceIDRef'),
+    ),
+    'ServiceIDRef': (
+        ModelField('crn'),
+        ModelField('id'),
+    ),
+    'ServiceIDRefPrototype': (ModelField('id'),),
+    'ServiceInstanceRef': (
+        ModelField('id'),
+        ModelField('type'),
+    ),
+    'ServiceInstanceRefPrototype': (ModelField('id'),),
+}
+
+# Replace the from_dict() and to_dict() of the models with generated methods, see
+# the decoders and encoders modules.
+_models = [model for model in list(globals().values()) if isinstance(model, type) and model.__module__ == __name__]
+install_decoders(_models, globals(), _FIELDS)
+install_encoders(_models, _FIELDS)
+del _models
@@ -0,0 +1,1724 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The pagers of the list operations of the Code Engine V2 service.
+"""
+
+from typing import Callable, Iterator, List, Optional
+import contextvars
+import queue
+import threading
+import weakref
+
+from ..tracing import start_span
+from .service import CodeEngineV2
+
+##############################################################################
+# Pagers
+##############################################################################
+
+
+class _PagePrefetcher:
+    """
+    _PagePrefetcher retrieves the pages of a list operation on a background
+    thread so that the request for the next page overlaps with the processing
+    of the current one.
+
+    The thread holds the pager only while it retrieves a page, so a pager that
+    is abandoned before its last page, without `close()`, can be garbage
+    collected. The thread then stops.
+    """
+
+    def __init__(
+        self,
+        *,
+        get_page: Callable[[Optional[str]], dict],
+        start: str,
+        depth: int,
+    ) -> None:
+        """
+        Initialize a _PagePrefetcher object and start retrieving pages.
+        :param Callable get_page: The method of the pager that retrieves the
+               page that begins at the given `start` token.
+        :param str start: The `start` token of the first page to be retrieved.
+        :param int depth: Maximum number of pages retrieved ahead of the caller.
+        """
+        self._get_page = weakref.WeakMethod(get_page)
+        self._pages = queue.Queue()
+        self._slots = threading.Semaphore(depth)
+        self._closed = False
+        weakref.finalize(get_page.__self__, self.close)
+        # The thread runs in a copy of the context of the caller, so that the pages are traced under its span.
+        context = contextvars.copy_context()
+        self._thread = threading.Thread(target=context.run, args=(self._run, start), daemon=True)
+        self._thread.start()
+
+    def _run(self, start: str) -> None:
+        while start is not None:
+            self._slots.acquire()
+            get_page = self._get_page()
+            if self._closed or get_page is None:
+                return
+            try:
+                result = get_page(start)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self._pages.put((None, e))
+                return
+            finally:
+                # Releases the pager while the thread waits for a slot.
+                get_page = None
+            self._pages.put((result, None))
+            start = None
+            next_page_link = result.get('next')
+            if next_page_link is not None:
+                start = next_page_link.get('start')
+
+    def get(self) -> dict:
+        """
+        Returns the next retrieved page, waiting for it if necessary.
+        An error raised while retrieving a page is re-raised here, and again
+        on every subsequent call.
+        """
+        result, error = self._pages.get()
+        self._slots.release()
+        if error is not None:
+            self._pages.put((None, error))
+            raise error
+        return result
+
+    def close(self) -> None:
+        """
+        Stops retrieving further pages.
+        """
+        if not self._closed:
+            self._closed = True
+            self._slots.release()
+
+
+class ProjectsPager:
+    """
+    ProjectsPager can be used to simplify the use of the "list_projects" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a ProjectsPager object.
+        :param int limit: (optional) Optional maximum number of projects per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Project.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('projects')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'ProjectsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_projects(
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Project.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of Project.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AllowedOutboundDestinationsPager:
+    """
+    AllowedOutboundDestinationsPager can be used to simplify the use of the "list_allowed_outbound_destinations" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AllowedOutboundDestinationsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of allowed outbound
+               destinations per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of AllowedOutboundDestination.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('allowed_outbound_destinations')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AllowedOutboundDestinationsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_allowed_outbound_destinations(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of AllowedOutboundDestination.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of AllowedOutboundDestination.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AppsPager:
+    """
+    AppsPager can be used to simplify the use of the "list_apps" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AppsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of apps per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of App.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('apps')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AppsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_apps(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of App.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of App.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AppInstancesPager:
+    """
+    AppInstancesPager can be used to simplify the use of the "list_app_instances" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        app_name: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AppInstancesPager object.
+        :param str project_id: The ID of the project.
+        :param str app_name: The name of your application.
+        :param int limit: (optional) Optional maximum number of apps per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._app_name = app_name
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of AppInstance.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('instances')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AppInstancesPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_app_instances(
+                project_id=self._project_id,
+                app_name=self._app_name,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of AppInstance.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of AppInstance.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class AppRevisionsPager:
+    """
+    AppRevisionsPager can be used to simplify the use of the "list_app_revisions" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        app_name: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a AppRevisionsPager object.
+        :param str project_id: The ID of the project.
+        :param str app_name: The name of your application.
+        :param int limit: (optional) Optional maximum number of apps per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._app_name = app_name
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of AppRevision.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('revisions')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'AppRevisionsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_app_revisions(
+                project_id=self._project_id,
+                app_name=self._app_name,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of AppRevision.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of AppRevision.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class JobRunsPager:
+    """
+    JobRunsPager can be used to simplify the use of the "list_job_runs" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        job_name: str = None,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a JobRunsPager object.
+        :param str project_id: The ID of the project.
+        :param str job_name: (optional) Optional name of the job that you want to
+               use to filter.
+        :param int limit: (optional) Optional maximum number of job runs per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._job_name = job_name
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of JobRun.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('job_runs')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'JobRunsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_job_runs(
+                project_id=self._project_id,
+                job_name=self._job_name,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of JobRun.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of JobRun.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class JobsPager:
+    """
+    JobsPager can be used to simplify the use of the "list_jobs" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a JobsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of jobs per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Job.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('jobs')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'JobsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_jobs(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Job.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of Job.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class FunctionsPager:
+    """
+    FunctionsPager can be used to simplify the use of the "list_functions" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a FunctionsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of functions per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Function.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('functions')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'FunctionsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_functions(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Function.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of Function.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class BindingsPager:
+    """
+    BindingsPager can be used to simplify the use of the "list_bindings" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a BindingsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of bindings per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Binding.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('bindings')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'BindingsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_bindings(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Binding.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of Binding.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class BuildRunsPager:
+    """
+    BuildRunsPager can be used to simplify the use of the "list_build_runs" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        build_name: str = None,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a BuildRunsPager object.
+        :param str project_id: The ID of the project.
+        :param str build_name: (optional) Optional name of the build that should be
+               filtered for.
+        :param int limit: (optional) Optional maximum number of build runs per
+               page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._build_name = build_name
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of BuildRun.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('build_runs')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'BuildRunsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_build_runs(
+                project_id=self._project_id,
+                build_name=self._build_name,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of BuildRun.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of BuildRun.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class BuildsPager:
+    """
+    BuildsPager can be used to simplify the use of the "list_builds" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a BuildsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of builds per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Build.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('builds')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'BuildsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_builds(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Build.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of Build.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class DomainMappingsPager:
+    """
+    DomainMappingsPager can be used to simplify the use of the "list_domain_mappings" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a DomainMappingsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of domain mappings per
+               page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of DomainMapping.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('domain_mappings')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'DomainMappingsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_domain_mappings(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of DomainMapping.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of DomainMapping.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class ConfigMapsPager:
+    """
+    ConfigMapsPager can be used to simplify the use of the "list_config_maps" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a ConfigMapsPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of config maps per
+               page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of ConfigMap.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('config_maps')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'ConfigMapsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_config_maps(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of ConfigMap.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of ConfigMap.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class SecretsPager:
+    """
+    SecretsPager can be used to simplify the use of the "list_secrets" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        format: str = None,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a SecretsPager object.
+        :param str project_id: The ID of the project.
+        :param str format: (optional) Secret format to filter results by.
+        :param int limit: (optional) Optional maximum number of secrets per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._format = format
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of Secret.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('secrets')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'SecretsPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_secrets(
+                project_id=self._project_id,
+                format=self._format,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of Secret.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of Secret.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class PersistentDataStoresPager:
+    """
+    PersistentDataStoresPager can be used to simplify the use of the "list_persistent_data_stores" method.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: CodeEngineV2,
+        project_id: str,
+        limit: int = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Initialize a PersistentDataStoresPager object.
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of persistent data
+               stores per page.
+        :param int prefetch: (optional) Number of pages to retrieve ahead of the
+               caller on a background thread. By default, pages are only
+               retrieved when requested.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._project_id = project_id
+        self._limit = limit
+        self._prefetch = prefetch
+        self._prefetcher = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents an instance of PersistentDataStore.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration(message='No more results available')
+
+        if self._prefetcher is not None:
+            result = self._prefetcher.get()
+        else:
+            result = self._get_page(self._page_context.get('next'))
+
+        next = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = next_page_link.get('start')
+        self._page_context['next'] = next
+        if next is None:
+            self._has_next = False
+        elif self._prefetch and self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(get_page=self._get_page, start=next, depth=self._prefetch)
+
+        return result.get('persistent_data_stores')
+
+    def _get_page(self, start: Optional[str]) -> dict:
+        with start_span(self._client, 'PersistentDataStoresPager.get_page', {'code_engine.page.start': start}):
+            return self._client.list_persistent_data_stores(
+                project_id=self._project_id,
+                limit=self._limit,
+                start=start,
+            ).get_result()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of PersistentDataStore.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields results one at a time, invoking
+        get_next() only when the previously retrieved page has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of PersistentDataStore.
+        :rtype: Iterator[dict]
+        """
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            # Stops the prefetching of pages when the caller leaves the iteration early.
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the retrieval of further pages. Pages that are being prefetched
+        in the background are discarded.
+        """
+        self._has_next = False
+        if self._prefetcher is not None:
+            self._prefetcher.close()
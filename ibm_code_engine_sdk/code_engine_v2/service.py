@@ -0,0 +1,4397 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# IBM OpenAPI SDK Code Generator Version: 3.102.0-615ec964-20250307-203034
+
+"""
+The client of the Code Engine V2 service.
+"""
+
+from enum import Enum
+from typing import List, Optional
+
+from ibm_cloud_sdk_core import ApiException, BaseService, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
+from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
+from ibm_cloud_sdk_core.utils import convert_model, is_json_mimetype
+import requests
+
+from ..cache import CachedRequest, ResourceCache, TTLCache
+from ..common import get_sdk_headers
+from ..json_codecs import JSONCodec, StdlibJSONCodec, get_default_codec
+from ..metrics import MetricsSink, OperationMeasurement
+from ..rate_limit import RateLimiter
+from ..request_templates import RequestTemplate
+from ..tracing import CodeEngineTracer
+
+##############################################################################
+# Service
+##############################################################################
+
+
+class CodeEngineV2(BaseService):
+    """The Code Engine V2 service."""
+
+    DEFAULT_SERVICE_URL = 'https://api.au-syd.codeengine.cloud.ibm.com/v2'
+    DEFAULT_SERVICE_NAME = 'code_engine'
+
+    @classmethod
+    def new_instance(
+        cls,
+        service_name: str = DEFAULT_SERVICE_NAME,
+        version: Optional[str] = None,
+    ) -> 'CodeEngineV2':
+        """
+        Return a new client for the Code Engine service using the specified
+               parameters and external configuration.
+
+        :param str version: (optional) The API version, in format `YYYY-MM-DD`. For
+               the API behavior documented here, specify any date between `2021-03-31` and
+               `2026-03-27`.
+        """
+        authenticator = get_authenticator_from_environment(service_name)
+        service = cls(
+            authenticator,
+            version,
+        )
+        service.configure_service(service_name)
+        return service
+
+    def __init__(
+        self,
+        authenticator: Authenticator = None,
+        version: Optional[str] = None,
+    ) -> None:
+        """
+        Construct a new client for the Code Engine service.
+
+        :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
+               Get up to date information from https://github.com/IBM/python-sdk-core/blob/main/README.md
+               about initializing the authenticator of your choice.
+
+        :param str version: (optional) The API version, in format `YYYY-MM-DD`. For
+               the API behavior documented here, specify any date between `2021-03-31` and
+               `2026-03-27`.
+        """
+        BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        self.version = version
+        self.resource_cache = None
+        self.ttl_cache = None
+        self.json_codec = get_default_codec()
+        self.metrics_sink = None
+        self.tracer = None
+        self.rate_limiter = None
+        self._request_templates = {}
+
+    def set_json_codec(self, json_codec: Optional[JSONCodec]) -> None:
+        """
+        Set the codec that encodes the request bodies and decodes the JSON
+        response bodies of this client.
+
+        :param JSONCodec json_codec: The codec, such as an OrjsonJSONCodec, or
+               None for the default codec, which uses the json module of the
+               standard library.
+        """
+        self.json_codec = json_codec if json_codec is not None else get_default_codec()
+
+    def get_json_codec(self) -> JSONCodec:
+        """
+        Get the codec that encodes the request bodies and decodes the JSON
+        response bodies of this client.
+
+        :return: The codec.
+        :rtype: JSONCodec
+        """
+        return self.json_codec
+
+    def set_metrics_sink(self, metrics_sink: Optional[MetricsSink]) -> None:
+        """
+        Set the sink that receives the metrics of every call of an operation of
+        this client: its duration, status code, retries and body sizes.
+
+        :param MetricsSink metrics_sink: The sink, such as a MetricsCollector, or
+               None to stop measuring the calls.
+        """
+        self.metrics_sink = metrics_sink
+
+    def get_metrics_sink(self) -> Optional[MetricsSink]:
+        """
+        Get the sink that receives the metrics of the calls of this client.
+
+        :return: The sink, or None when the calls are not measured.
+        :rtype: MetricsSink
+        """
+        return self.metrics_sink
+
+    def set_rate_limiter(self, rate_limiter: Optional[RateLimiter]) -> None:
+        """
+        Set the rate limiter that delays the requests of this client to stay
+        under its limits. A rate limiter can be shared by the clients of a
+        process, such as the one returned by
+        `ibm_code_engine_sdk.rate_limit.get_shared_rate_limiter()`.
+
+        The wait for the rate limiter counts in the duration of a call that is
+        reported to the metrics sink. Reads served from the client-side caches
+        without a request do not wait.
+
+        :param RateLimiter rate_limiter: The rate limiter, or None to send the
+               requests without delay.
+        """
+        self.rate_limiter = rate_limiter
+
+    def get_rate_limiter(self) -> Optional[RateLimiter]:
+        """
+        Get the rate limiter of the requests of this client.
+
+        :return: The rate limiter, or None when the requests are not limited.
+        :rtype: RateLimiter
+        """
+        return self.rate_limiter
+
+    def enable_tracing(
+        self,
+        *,
+        tracer: Optional['Tracer'] = None,
+        tracer_provider: Optional['TracerProvider'] = None,
+    ) -> CodeEngineTracer:
+        """
+        Enable the OpenTelemetry tracing of this client. Every call of an
+        operation opens a span, whose context is sent to the service in the
+        trace context headers of the request, and the pagers and waiters open
+        a span for every page and every poll. Requires the opentelemetry-api
+        package.
+
+        :param Tracer tracer: (optional) The OpenTelemetry tracer of the spans.
+        :param TracerProvider tracer_provider: (optional) The provider of the
+               tracer, when no tracer is given. Defaults to the global tracer
+               provider.
+        :return: The tracer of this client.
+        :rtype: CodeEngineTracer
+        """
+        self.tracer = CodeEngineTracer(tracer, tracer_provider=tracer_provider)
+        return self.tracer
+
+    def disable_tracing(self) -> None:
+        """
+        Disable the OpenTelemetry tracing of this client.
+        """
+        self.tracer = None
+
+    def enable_resource_cache(
+        self,
+        *,
+        max_entries: int = 1000,
+        kinds: Optional[List[str]] = None,
+    ) -> ResourceCache:
+        """
+        Enable the client-side cache of resources read by this client.
+
+        Reads of a cached app, job, build or function send its entity tag in the
+        If-None-Match header, and the cached resource is returned when the
+        server answers 304 Not Modified. Results served from the cache are
+        shared and must be treated as read-only.
+
+        :param int max_entries: (optional) Maximum number of cached resources.
+        :param List[str] kinds: (optional) The kinds of resource to cache, such as
+               `apps` or `config_maps`. Defaults to apps, builds, functions and
+               jobs.
+        :return: The cache, which can be used to inspect or invalidate entries.
+        :rtype: ResourceCache
+        """
+        self.resource_cache = ResourceCache(max_entries=max_entries, kinds=kinds or ResourceCache.DEFAULT_KINDS)
+        return self.resource_cache
+
+    def disable_resource_cache(self) -> None:
+        """
+        Disable the client-side cache of resources and discard its entries.
+        """
+        self.resource_cache = None
+
+    def enable_ttl_cache(
+        self,
+        *,
+        ttl: float = 300.0,
+        max_entries: int = 256,
+        endpoints: Optional[List[str]] = None,
+    ) -> TTLCache:
+        """
+        Enable the client-side cache of read-only endpoints whose data rarely
+        changes: list_function_runtimes, get_project_egress_ips and
+        get_project_status_details. Their responses are reused for `ttl`
+        seconds without sending a request. Results served from the cache are
+        shared and must be treated as read-only.
+
+        :param float ttl: (optional) Number of seconds a response is reused.
+        :param int max_entries: (optional) Maximum number of cached responses.
+        :param List[str] endpoints: (optional) The endpoints to cache, as the last
+               segment of their path. Defaults to function_runtimes, egress_ips
+               and status_details.
+        :return: The cache, which can be used to invalidate entries.
+        :rtype: TTLCache
+        """
+        self.ttl_cache = TTLCache(ttl=ttl, max_entries=max_entries, endpoints=endpoints or TTLCache.DEFAULT_ENDPOINTS)
+        return self.ttl_cache
+
+    def disable_ttl_cache(self) -> None:
+        """
+        Disable the client-side cache of read-only endpoints and discard its
+        entries.
+        """
+        self.ttl_cache = None
+
+    def send(self, request: dict, *, operation_id: Optional[str] = None, **kwargs) -> DetailedResponse:
+        """
+        Send a request and wrap the response in a DetailedResponse or raise an
+        ApiException. Reads are served from the client-side caches when they
+        are enabled, the call is reported to the metrics sink when one is set,
+        and it is traced when tracing is enabled.
+
+        :param dict request: The request prepared by `prepare_request()`.
+        :param str operation_id: (optional) The operation that sends the request.
+        :return: The response from the request.
+        :rtype: DetailedResponse
+        """
+        metrics_sink = self.metrics_sink
+        tracer = self.tracer
+        if metrics_sink is None and tracer is None:
+            return self._send_cached(request, **kwargs)
+        measurement = OperationMeasurement(operation_id, request)
+        span = tracer.start_operation(operation_id, request) if tracer is not None else None
+        try:
+            response = self._send_cached(request, **measurement.add_hook(kwargs))
+        except BaseException as e:
+            # Also ends the span of a call that is cancelled or interrupted, which detaches its context.
+            metrics = measurement.finish(metrics_sink, exception=e)
+            if span is not None:
+                span.end(metrics, e)
+            raise
+        metrics = measurement.finish(metrics_sink, response=response)
+        if span is not None:
+            span.end(metrics)
+        return response
+
+    def _send_cached(self, request: dict, **kwargs) -> DetailedResponse:
+        # Sends a request, or serves it from the client-side caches.
+        cached_request = self._get_cached_request(request)
+        if cached_request is None:
+            return self._send_with_codec(request, **kwargs)
+        response = cached_request.before_send(request)
+        if response is not None:
+            return response
+        try:
+            response = self._send_with_codec(request, **kwargs)
+        except Exception as e:
+            response = cached_request.on_error(e)
+            if response is None:
+                raise
+            return response
+        cached_request.on_response(response)
+        return response
+
+    def _send_with_codec(self, request: dict, **kwargs) -> DetailedResponse:
+        # Sends a request, and decodes a JSON response body with the codec of the client.
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire(request['method'], request['url'][len(self.service_url) :])
+        json_codec = self.json_codec
+        if type(json_codec) is StdlibJSONCodec or kwargs.get('stream'):
+            # The core decodes response bodies with the standard library as well.
+            return BaseService.send(self, request, **kwargs)
+        hooks = dict(kwargs.get('hooks') or {})
+        response_hooks = hooks.get('response') or []
+        hooks['response'] = ([response_hooks] if callable(response_hooks) else list(response_hooks)) + [
+            self._release_empty_response
+        ]
+        response = BaseService.send(self, request, **dict(kwargs, stream=True, hooks=hooks))
+        http_response = response.get_result()
+        if not isinstance(http_response, requests.Response):
+            return response
+        result = http_response
+        if not http_response.content:
+            result = None
+        elif is_json_mimetype(http_response.headers.get('Content-Type')):
+            try:
+                result = json_codec.loads(http_response.content)
+            except ValueError as err:
+                raise ApiException(
+                    code=http_response.status_code,
+                    http_response=http_response,
+                    message='Error processing the HTTP response',
+                ) from err
+        return DetailedResponse(response=result, headers=response.get_headers(), status_code=response.get_status_code())
+
+    @staticmethod
+    def _release_empty_response(response: requests.Response, **kwargs) -> None:
+        # The core returns no result for a 204 or HEAD response, so it never reads their streamed body. Reading the
+        # empty body and closing the response releases the connection to the pool, where it is kept alive.
+        # pylint: disable=unused-argument
+        if response.status_code == 204 or response.request.method == 'HEAD':
+            response.content  # pylint: disable=pointless-statement
+            response.close()
+
+    def _get_request_template(self, operation_id: str, path: str, **kwargs) -> RequestTemplate:
+        # Returns the request template of an operation, which is built on the first call of the operation.
+        request_template = self._request_templates.get(operation_id)
+        if request_template is None:
+            sdk_headers = get_sdk_headers(
+                service_name=self.DEFAULT_SERVICE_NAME,
+                service_version='V2',
+                operation_id=operation_id,
+            )
+            request_template = RequestTemplate(operation_id, path, sdk_headers, **kwargs)
+            self._request_templates[operation_id] = request_template
+        return request_template
+
+    def _get_cached_request(self, request: dict) -> Optional[CachedRequest]:
+        # Returns None while both client-side caches are disabled.
+        resource_cache, ttl_cache = self.resource_cache, self.ttl_cache
+        if resource_cache is None and ttl_cache is None:
+            return None
+        path = request['url'][len(self.service_url) :]
+        return CachedRequest(request, path, resource_cache=resource_cache, ttl_cache=ttl_cache)
+
+    #########################
+    # Projects
+    #########################
+
+    def list_projects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List all projects.
+
+        List all projects in the current account.
+
+        :param int limit: (optional) Optional maximum number of projects per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. Any additional query parameters are
+               ignored if a page token is present. If omitted, the first page of results
+               is returned. This value is obtained from the 'start' query parameter in the
+               `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ProjectList` object
+        """
+
+        request_template = self._get_request_template(
+            'list_projects',
+            '/projects',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url()
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_project(
+        self,
+        name: str,
+        *,
+        resource_group_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create a project.
+
+        Create a Code Engine project on IBM Cloud. The project will be created in the
+        region that corresponds to the API endpoint that is being called.
+
+        :param str name: The name of the project.
+        :param str resource_group_id: (optional) Optional ID of the resource group
+               for your project deployment. If this field is not defined, the default
+               resource group of the account will be used.
+        :param List[str] tags: (optional) Optional list of labels to assign to your
+               project. Tags are not part of the project resource that is returned by the
+               server, but can be obtained and managed through the Global Tagging API in
+               IBM Cloud. Find more information on [Global Tagging API
+               docs](https://cloud.ibm.com/apidocs/tagging).
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Project` object
+        """
+
+        if name is None:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'create_project',
+            '/projects',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'name': name,
+            'resource_group_id': resource_group_id,
+            'tags': tags,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url()
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_project(
+        self,
+        id: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete a project.
+
+        Delete a project.
+
+        :param str id: The ID of the project.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not id:
+            raise ValueError('id must be provided')
+        request_template = self._get_request_template(
+            'delete_project',
+            '/projects/{id}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(id)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_project(
+        self,
+        id: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get a project.
+
+        Display the details of a single project.
+
+        :param str id: The ID of the project.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Project` object
+        """
+
+        if not id:
+            raise ValueError('id must be provided')
+        request_template = self._get_request_template(
+            'get_project',
+            '/projects/{id}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def list_allowed_outbound_destinations(
+        self,
+        project_id: str,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List allowed outbound destinations.
+
+        List all allowed outbound destinations in a project.
+
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of allowed outbound
+               destinations per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `AllowedOutboundDestinationList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_allowed_outbound_destinations',
+            '/projects/{project_id}/allowed_outbound_destinations',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_allowed_outbound_destination(
+        self,
+        project_id: str,
+        allowed_outbound_destination: 'AllowedOutboundDestinationPrototype',
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create an allowed outbound destination.
+
+        Create an allowed outbound destination.
+
+        :param str project_id: The ID of the project.
+        :param AllowedOutboundDestinationPrototype allowed_outbound_destination:
+               AllowedOutboundDestination prototype.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `AllowedOutboundDestination` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if allowed_outbound_destination is None:
+            raise ValueError('allowed_outbound_destination must be provided')
+        allowed_outbound_destination = convert_model(allowed_outbound_destination)
+        request_template = self._get_request_template(
+            'create_allowed_outbound_destination',
+            '/projects/{project_id}/allowed_outbound_destinations',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = self.json_codec.dumps(allowed_outbound_destination)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_allowed_outbound_destination(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete an allowed outbound destination.
+
+        Delete an allowed outbound destination.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your allowed outbound destination.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_allowed_outbound_destination',
+            '/projects/{project_id}/allowed_outbound_destinations/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_allowed_outbound_destination(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get an allowed outbound destination.
+
+        Display the details of an allowed outbound destination.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your allowed outbound destination.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `AllowedOutboundDestination` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_allowed_outbound_destination',
+            '/projects/{project_id}/allowed_outbound_destinations/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def update_allowed_outbound_destination(
+        self,
+        project_id: str,
+        name: str,
+        if_match: str,
+        allowed_outbound_destination: 'AllowedOutboundDestinationPatch',
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Update an allowed outbound destination.
+
+        Update an allowed outbound destination.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your allowed outbound destination.
+        :param str if_match: Version of the allowed outbound destination to be
+               updated. Specify the version that you retrieved as entity_tag (ETag header)
+               when reading the allowed outbound destination. This value helps identifying
+               parallel usage of this API. Pass * to indicate to update any version
+               available. This might result in stale updates.
+        :param AllowedOutboundDestinationPatch allowed_outbound_destination:
+               AllowedOutboundDestination patch.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `AllowedOutboundDestination` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        if not if_match:
+            raise ValueError('if_match must be provided')
+        if allowed_outbound_destination is None:
+            raise ValueError('allowed_outbound_destination must be provided')
+        allowed_outbound_destination = convert_model(allowed_outbound_destination)
+        request_template = self._get_request_template(
+            'update_allowed_outbound_destination',
+            '/projects/{project_id}/allowed_outbound_destinations/{name}',
+            accept='application/json',
+            content_type='application/merge-patch+json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None), {'If-Match': if_match})
+
+        params = {
+            'version': self.version,
+        }
+
+        data = self.json_codec.dumps(allowed_outbound_destination)
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='PATCH',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_project_egress_ips(
+        self,
+        project_id: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List egress IP addresses.
+
+        Lists all egress IP addresses (public and private) that are used by components
+        running in this project. For information about using egress IP addresses, see
+        [Code Engine public and private IP
+        addresses](https://cloud.ibm.com/docs/codeengine?topic=codeengine-network-addresses).
+
+        :param str project_id: The ID of the project.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ProjectEgressIPAddresses` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'get_project_egress_ips',
+            '/projects/{project_id}/egress_ips',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_project_status_details(
+        self,
+        project_id: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get the status details for a project.
+
+        Retrieves status details about the given project.
+
+        :param str project_id: The ID of the project.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ProjectStatusDetails` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'get_project_status_details',
+            '/projects/{project_id}/status_details',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    #########################
+    # Applications
+    #########################
+
+    def list_apps(
+        self,
+        project_id: str,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List applications.
+
+        List all applications in a project.
+
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of apps per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `AppList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_apps',
+            '/projects/{project_id}/apps',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_app(
+        self,
+        project_id: str,
+        image_reference: str,
+        name: str,
+        *,
+        image_port: Optional[int] = None,
+        image_secret: Optional[str] = None,
+        managed_domain_mappings: Optional[str] = None,
+        probe_liveness: Optional['ProbePrototype'] = None,
+        probe_readiness: Optional['ProbePrototype'] = None,
+        run_arguments: Optional[List[str]] = None,
+        run_as_user: Optional[int] = None,
+        run_commands: Optional[List[str]] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        run_env_variables: Optional[List['EnvVarPrototype']] = None,
+        run_service_account: Optional[str] = None,
+        run_volume_mounts: Optional[List['VolumeMountPrototype']] = None,
+        scale_concurrency: Optional[int] = None,
+        scale_concurrency_target: Optional[int] = None,
+        scale_cpu_limit: Optional[str] = None,
+        scale_down_delay: Optional[int] = None,
+        scale_ephemeral_storage_limit: Optional[str] = None,
+        scale_initial_instances: Optional[int] = None,
+        scale_max_instances: Optional[int] = None,
+        scale_memory_limit: Optional[str] = None,
+        scale_min_instances: Optional[int] = None,
+        scale_request_timeout: Optional[int] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create an application.
+
+        Create an application.
+
+        :param str project_id: The ID of the project.
+        :param str image_reference: The name of the image that is used for this
+               app. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where `REGISTRY` and
+               `TAG` are optional. If `REGISTRY` is not specified, the default is
+               `docker.io`. If `TAG` is not specified, the default is `latest`. If the
+               image reference points to a registry that requires authentication, make
+               sure to also specify the property `image_secret`.
+        :param str name: The name of the app. Use a name that is unique within the
+               project.
+        :param int image_port: (optional) Optional port the app listens on. While
+               the app will always be exposed via port `443` for end users, this port is
+               used to connect to the port that is exposed by the container image.
+        :param str image_secret: (optional) Optional name of the image registry
+               access secret. The image registry access secret is used to authenticate
+               with a private registry when you download the container image. If the image
+               reference points to a registry that requires authentication, the app will
+               be created but cannot reach the ready status, until this property is
+               provided, too.
+        :param str managed_domain_mappings: (optional) Optional value controlling
+               which of the system managed domain mappings will be setup for the
+               application. Valid values are 'local_public', 'local_private' and 'local'.
+               Visibility can only be 'local_private' if the project supports application
+               private visibility.
+        :param ProbePrototype probe_liveness: (optional) Request model for probes.
+        :param ProbePrototype probe_readiness: (optional) Request model for probes.
+        :param List[str] run_arguments: (optional) Optional arguments for the app
+               that are passed to start the container. If not specified an empty string
+               array will be applied and the arguments specified by the container image,
+               will be used to start the container.
+        :param int run_as_user: (optional) Optional user ID (UID) to run the app.
+        :param List[str] run_commands: (optional) Optional commands for the app
+               that are passed to start the container. If not specified an empty string
+               array will be applied and the command specified by the container image,
+               will be used to start the container.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        :param List[EnvVarPrototype] run_env_variables: (optional) Optional
+               references to config maps, secrets or literal values that are exposed as
+               environment variables within the running application.
+        :param str run_service_account: (optional) Optional name of the service
+               account. For built-in service accounts, you can use the shortened names
+               `manager` , `none`, `reader`, and `writer`.
+        :param List[VolumeMountPrototype] run_volume_mounts: (optional) Optional
+               mounts of config maps or a secrets.
+        :param int scale_concurrency: (optional) Optional maximum number of
+               requests that can be processed concurrently per instance.
+        :param int scale_concurrency_target: (optional) Optional threshold of
+               concurrent requests per instance at which one or more additional instances
+               are created. Use this value to scale up instances based on concurrent
+               number of requests. This option defaults to the value of the
+               `scale_concurrency` option, if not specified.
+        :param str scale_cpu_limit: (optional) Optional number of CPU set for the
+               instance of the app. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param int scale_down_delay: (optional) Optional amount of time in seconds
+               that delays the scale-down behavior for an app instance.
+        :param str scale_ephemeral_storage_limit: (optional) Optional amount of
+               ephemeral storage to set for the instance of the app. The amount specified
+               as ephemeral storage, must not exceed the amount of `scale_memory_limit`.
+               The units for specifying ephemeral storage are Megabyte (M) or Gigabyte
+               (G), whereas G and M are the shorthand expressions for GB and MB. For more
+               information see [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_initial_instances: (optional) Optional initial number of
+               instances that are created upon app creation or app update.
+        :param int scale_max_instances: (optional) Optional maximum number of
+               instances for this app. If you set this value to `0`, this property does
+               not set a upper scaling limit. However, the app scaling is still limited by
+               the project quota for instances. See [Limits and quotas for Code
+               Engine](https://cloud.ibm.com/docs/codeengine?topic=codeengine-limits).
+        :param str scale_memory_limit: (optional) Optional amount of memory set for
+               the instance of the app. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_min_instances: (optional) Optional minimum number of
+               instances for this app. If you set this value to `0`, the app will scale
+               down to zero, if not hit by any request for some time.
+        :param int scale_request_timeout: (optional) Optional amount of time in
+               seconds that is allowed for a running app to respond to a request.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `App` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if image_reference is None:
+            raise ValueError('image_reference must be provided')
+        if name is None:
+            raise ValueError('name must be provided')
+        if probe_liveness is not None:
+            probe_liveness = convert_model(probe_liveness)
+        if probe_readiness is not None:
+            probe_readiness = convert_model(probe_readiness)
+        if run_env_variables is not None:
+            run_env_variables = [convert_model(x) for x in run_env_variables]
+        if run_volume_mounts is not None:
+            run_volume_mounts = [convert_model(x) for x in run_volume_mounts]
+        request_template = self._get_request_template(
+            'create_app',
+            '/projects/{project_id}/apps',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'image_reference': image_reference,
+            'name': name,
+            'image_port': image_port,
+            'image_secret': image_secret,
+            'managed_domain_mappings': managed_domain_mappings,
+            'probe_liveness': probe_liveness,
+            'probe_readiness': probe_readiness,
+            'run_arguments': run_arguments,
+            'run_as_user': run_as_user,
+            'run_commands': run_commands,
+            'run_compute_resource_token_enabled': run_compute_resource_token_enabled,
+            'run_env_variables': run_env_variables,
+            'run_service_account': run_service_account,
+            'run_volume_mounts': run_volume_mounts,
+            'scale_concurrency': scale_concurrency,
+            'scale_concurrency_target': scale_concurrency_target,
+            'scale_cpu_limit': scale_cpu_limit,
+            'scale_down_delay': scale_down_delay,
+            'scale_ephemeral_storage_limit': scale_ephemeral_storage_limit,
+            'scale_initial_instances': scale_initial_instances,
+            'scale_max_instances': scale_max_instances,
+            'scale_memory_limit': scale_memory_limit,
+            'scale_min_instances': scale_min_instances,
+            'scale_request_timeout': scale_request_timeout,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def list_app_instances(
+        self,
+        project_id: str,
+        app_name: str,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List application instances.
+
+        List all instances of an application.
+
+        :param str project_id: The ID of the project.
+        :param str app_name: The name of your application.
+        :param int limit: (optional) Optional maximum number of apps per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `AppInstanceList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not app_name:
+            raise ValueError('app_name must be provided')
+        request_template = self._get_request_template(
+            'list_app_instances',
+            '/projects/{project_id}/apps/{app_name}/instances',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'limit': limit,
+            'start': start,
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, app_name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def list_app_revisions(
+        self,
+        project_id: str,
+        app_name: str,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List application revisions.
+
+        List all application revisions in a particular application.
+
+        :param str project_id: The ID of the project.
+        :param str app_name: The name of your application.
+        :param int limit: (optional) Optional maximum number of apps per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `AppRevisionList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not app_name:
+            raise ValueError('app_name must be provided')
+        request_template = self._get_request_template(
+            'list_app_revisions',
+            '/projects/{project_id}/apps/{app_name}/revisions',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'limit': limit,
+            'start': start,
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, app_name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_app_revision(
+        self,
+        project_id: str,
+        app_name: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete an application revision.
+
+        Delete an application revision.
+
+        :param str project_id: The ID of the project.
+        :param str app_name: The name of your application.
+        :param str name: The name of your application revision.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not app_name:
+            raise ValueError('app_name must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_app_revision',
+            '/projects/{project_id}/apps/{app_name}/revisions/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, app_name, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_app_revision(
+        self,
+        project_id: str,
+        app_name: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get an application revision.
+
+        Display the details of an application revision.
+
+        :param str project_id: The ID of the project.
+        :param str app_name: The name of your application.
+        :param str name: The name of your application revision.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `AppRevision` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not app_name:
+            raise ValueError('app_name must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_app_revision',
+            '/projects/{project_id}/apps/{app_name}/revisions/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, app_name, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_app(
+        self,
+        project_id: str,
+        name: str,
+        *,
+        keep_service_access: Optional[bool] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete an application.
+
+        Delete an application.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your application.
+        :param bool keep_service_access: (optional) Determines if connected service
+               access secrets remain intact after app deletion.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_app',
+            '/projects/{project_id}/apps/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'keep_service_access': keep_service_access,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_app(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get an application.
+
+        Display the details of an application.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your application.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `App` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_app',
+            '/projects/{project_id}/apps/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def update_app(
+        self,
+        project_id: str,
+        name: str,
+        if_match: str,
+        app: 'AppPatch',
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Update an application.
+
+        An application contains one or more revisions. A revision represents an immutable
+        version of the configuration properties of the application. Each update of an
+        application configuration property creates a new revision of the application.
+        [Learn more](https://cloud.ibm.com/docs/codeengine?topic=codeengine-update-app).
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your application.
+        :param str if_match: Version of the app settings to be updated. Specify the
+               version that you retrieved as entity_tag (ETag header) when reading the
+               app. This value helps identifying parallel usage of this API. Pass * to
+               indicate to update any version available. This might result in stale
+               updates.
+        :param AppPatch app: App patch.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `App` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        if not if_match:
+            raise ValueError('if_match must be provided')
+        if app is None:
+            raise ValueError('app must be provided')
+        app = convert_model(app)
+        request_template = self._get_request_template(
+            'update_app',
+            '/projects/{project_id}/apps/{name}',
+            accept='application/json',
+            content_type='application/merge-patch+json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None), {'If-Match': if_match})
+
+        params = {
+            'version': self.version,
+        }
+
+        data = self.json_codec.dumps(app)
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='PATCH',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    #########################
+    # Jobs
+    #########################
+
+    def list_job_runs(
+        self,
+        project_id: str,
+        *,
+        job_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List job runs.
+
+        List all job runs in a project.
+
+        :param str project_id: The ID of the project.
+        :param str job_name: (optional) Optional name of the job that you want to
+               use to filter.
+        :param int limit: (optional) Optional maximum number of job runs per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `JobRunList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_job_runs',
+            '/projects/{project_id}/job_runs',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'job_name': job_name,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_job_run(
+        self,
+        project_id: str,
+        *,
+        image_reference: Optional[str] = None,
+        image_secret: Optional[str] = None,
+        job_name: Optional[str] = None,
+        name: Optional[str] = None,
+        run_arguments: Optional[List[str]] = None,
+        run_as_user: Optional[int] = None,
+        run_commands: Optional[List[str]] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        run_env_variables: Optional[List['EnvVarPrototype']] = None,
+        run_mode: Optional[str] = None,
+        run_service_account: Optional[str] = None,
+        run_volume_mounts: Optional[List['VolumeMountPrototype']] = None,
+        scale_array_size_variable_override: Optional[int] = None,
+        scale_array_spec: Optional[str] = None,
+        scale_cpu_limit: Optional[str] = None,
+        scale_ephemeral_storage_limit: Optional[str] = None,
+        scale_max_execution_time: Optional[int] = None,
+        scale_memory_limit: Optional[str] = None,
+        scale_retry_limit: Optional[int] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create a job run.
+
+        Create an job run.
+
+        :param str project_id: The ID of the project.
+        :param str image_reference: (optional) The name of the image that is used
+               for this job. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where
+               `REGISTRY` and `TAG` are optional. If `REGISTRY` is not specified, the
+               default is `docker.io`. If `TAG` is not specified, the default is `latest`.
+               If the image reference points to a registry that requires authentication,
+               make sure to also specify the property `image_secret`.
+        :param str image_secret: (optional) The name of the image registry access
+               secret. The image registry access secret is used to authenticate with a
+               private registry when you download the container image. If the image
+               reference points to a registry that requires authentication, the job / job
+               runs will be created but submitted job runs will fail, until this property
+               is provided, too. This property must not be set on a job run, which
+               references a job template.
+        :param str job_name: (optional) Optional name of the job on which this job
+               run is based on. If specified, the job run will inherit the configuration
+               of the referenced job.
+        :param str name: (optional) The name of the job. Use a name that is unique
+               within the project.
+        :param List[str] run_arguments: (optional) Set arguments for the job that
+               are passed to start job run containers. If not specified an empty string
+               array will be applied and the arguments specified by the container image,
+               will be used to start the container.
+        :param int run_as_user: (optional) The user ID (UID) to run the job.
+        :param List[str] run_commands: (optional) Set commands for the job that are
+               passed to start job run containers. If not specified an empty string array
+               will be applied and the command specified by the container image, will be
+               used to start the container.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        :param List[EnvVarPrototype] run_env_variables: (optional) Optional
+               references to config maps, secrets or literal values.
+        :param str run_mode: (optional) The mode for runs of the job. Valid values
+               are `task` and `daemon`. In `task` mode, the `max_execution_time` and
+               `retry_limit` properties apply. In `daemon` mode, since there is no timeout
+               and failed instances are restarted indefinitely, the `max_execution_time`
+               and `retry_limit` properties are not allowed.
+        :param str run_service_account: (optional) The name of the service account.
+               For built-in service accounts, you can use the shortened names `manager`,
+               `none`, `reader`, and `writer`. This property must not be set on a job run,
+               which references a job template.
+        :param List[VolumeMountPrototype] run_volume_mounts: (optional) Optional
+               mounts of config maps or a secrets.
+        :param int scale_array_size_variable_override: (optional) Optional value to
+               override the JOB_ARRAY_SIZE environment variable for a job run.
+        :param str scale_array_spec: (optional) Define a custom set of array
+               indices as a comma-separated list containing single values and
+               hyphen-separated ranges, such as  5,12-14,23,27. Each instance gets its
+               array index value from the environment variable JOB_INDEX. The number of
+               unique array indices that you specify with this parameter determines the
+               number of job instances to run.
+        :param str scale_cpu_limit: (optional) Optional amount of CPU set for the
+               instance of the job. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param str scale_ephemeral_storage_limit: (optional) Optional amount of
+               ephemeral storage to set for the instance of the job. The amount specified
+               as ephemeral storage, must not exceed the amount of `scale_memory_limit`.
+               The units for specifying ephemeral storage are Megabyte (M) or Gigabyte
+               (G), whereas G and M are the shorthand expressions for GB and MB. For more
+               information see [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_max_execution_time: (optional) The maximum execution time
+               in seconds for runs of the job. This property can only be specified if
+               `run_mode` is `task`.
+        :param str scale_memory_limit: (optional) Optional amount of memory set for
+               the instance of the job. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_retry_limit: (optional) The number of times to rerun an
+               instance of the job before the job is marked as failed. This property can
+               only be specified if `run_mode` is `task`.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `JobRun` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if run_env_variables is not None:
+            run_env_variables = [convert_model(x) for x in run_env_variables]
+        if run_volume_mounts is not None:
+            run_volume_mounts = [convert_model(x) for x in run_volume_mounts]
+        request_template = self._get_request_template(
+            'create_job_run',
+            '/projects/{project_id}/job_runs',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'image_reference': image_reference,
+            'image_secret': image_secret,
+            'job_name': job_name,
+            'name': name,
+            'run_arguments': run_arguments,
+            'run_as_user': run_as_user,
+            'run_commands': run_commands,
+            'run_compute_resource_token_enabled': run_compute_resource_token_enabled,
+            'run_env_variables': run_env_variables,
+            'run_mode': run_mode,
+            'run_service_account': run_service_account,
+            'run_volume_mounts': run_volume_mounts,
+            'scale_array_size_variable_override': scale_array_size_variable_override,
+            'scale_array_spec': scale_array_spec,
+            'scale_cpu_limit': scale_cpu_limit,
+            'scale_ephemeral_storage_limit': scale_ephemeral_storage_limit,
+            'scale_max_execution_time': scale_max_execution_time,
+            'scale_memory_limit': scale_memory_limit,
+            'scale_retry_limit': scale_retry_limit,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_job_run(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete a job run.
+
+        Delete a job run.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your job run.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_job_run',
+            '/projects/{project_id}/job_runs/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_job_run(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get a job run.
+
+        Display the details of a job run.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your job run.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `JobRun` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_job_run',
+            '/projects/{project_id}/job_runs/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def list_jobs(
+        self,
+        project_id: str,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List jobs.
+
+        List all jobs in a project.
+
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of jobs per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `JobList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_jobs',
+            '/projects/{project_id}/jobs',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_job(
+        self,
+        project_id: str,
+        image_reference: str,
+        name: str,
+        *,
+        image_secret: Optional[str] = None,
+        run_arguments: Optional[List[str]] = None,
+        run_as_user: Optional[int] = None,
+        run_commands: Optional[List[str]] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        run_env_variables: Optional[List['EnvVarPrototype']] = None,
+        run_mode: Optional[str] = None,
+        run_service_account: Optional[str] = None,
+        run_volume_mounts: Optional[List['VolumeMountPrototype']] = None,
+        scale_array_spec: Optional[str] = None,
+        scale_cpu_limit: Optional[str] = None,
+        scale_ephemeral_storage_limit: Optional[str] = None,
+        scale_max_execution_time: Optional[int] = None,
+        scale_memory_limit: Optional[str] = None,
+        scale_retry_limit: Optional[int] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create a job.
+
+        Create a job.
+
+        :param str project_id: The ID of the project.
+        :param str image_reference: The name of the image that is used for this
+               job. The format is `REGISTRY/NAMESPACE/REPOSITORY:TAG` where `REGISTRY` and
+               `TAG` are optional. If `REGISTRY` is not specified, the default is
+               `docker.io`. If `TAG` is not specified, the default is `latest`. If the
+               image reference points to a registry that requires authentication, make
+               sure to also specify the property `image_secret`.
+        :param str name: The name of the job. Use a name that is unique within the
+               project.
+        :param str image_secret: (optional) The name of the image registry access
+               secret. The image registry access secret is used to authenticate with a
+               private registry when you download the container image. If the image
+               reference points to a registry that requires authentication, the job / job
+               runs will be created but submitted job runs will fail, until this property
+               is provided, too. This property must not be set on a job run, which
+               references a job template.
+        :param List[str] run_arguments: (optional) Set arguments for the job that
+               are passed to start job run containers. If not specified an empty string
+               array will be applied and the arguments specified by the container image,
+               will be used to start the container.
+        :param int run_as_user: (optional) The user ID (UID) to run the job.
+        :param List[str] run_commands: (optional) Set commands for the job that are
+               passed to start job run containers. If not specified an empty string array
+               will be applied and the command specified by the container image, will be
+               used to start the container.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        :param List[EnvVarPrototype] run_env_variables: (optional) Optional
+               references to config maps, secrets or literal values.
+        :param str run_mode: (optional) The mode for runs of the job. Valid values
+               are `task` and `daemon`. In `task` mode, the `max_execution_time` and
+               `retry_limit` properties apply. In `daemon` mode, since there is no timeout
+               and failed instances are restarted indefinitely, the `max_execution_time`
+               and `retry_limit` properties are not allowed.
+        :param str run_service_account: (optional) The name of the service account.
+               For built-in service accounts, you can use the shortened names `manager`,
+               `none`, `reader`, and `writer`. This property must not be set on a job run,
+               which references a job template.
+        :param List[VolumeMountPrototype] run_volume_mounts: (optional) Optional
+               mounts of config maps or a secrets.
+        :param str scale_array_spec: (optional) Define a custom set of array
+               indices as a comma-separated list containing single values and
+               hyphen-separated ranges, such as  5,12-14,23,27. Each instance gets its
+               array index value from the environment variable JOB_INDEX. The number of
+               unique array indices that you specify with this parameter determines the
+               number of job instances to run.
+        :param str scale_cpu_limit: (optional) Optional amount of CPU set for the
+               instance of the job. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param str scale_ephemeral_storage_limit: (optional) Optional amount of
+               ephemeral storage to set for the instance of the job. The amount specified
+               as ephemeral storage, must not exceed the amount of `scale_memory_limit`.
+               The units for specifying ephemeral storage are Megabyte (M) or Gigabyte
+               (G), whereas G and M are the shorthand expressions for GB and MB. For more
+               information see [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_max_execution_time: (optional) The maximum execution time
+               in seconds for runs of the job. This property can only be specified if
+               `run_mode` is `task`.
+        :param str scale_memory_limit: (optional) Optional amount of memory set for
+               the instance of the job. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param int scale_retry_limit: (optional) The number of times to rerun an
+               instance of the job before the job is marked as failed. This property can
+               only be specified if `run_mode` is `task`.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Job` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if image_reference is None:
+            raise ValueError('image_reference must be provided')
+        if name is None:
+            raise ValueError('name must be provided')
+        if run_env_variables is not None:
+            run_env_variables = [convert_model(x) for x in run_env_variables]
+        if run_volume_mounts is not None:
+            run_volume_mounts = [convert_model(x) for x in run_volume_mounts]
+        request_template = self._get_request_template(
+            'create_job',
+            '/projects/{project_id}/jobs',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'image_reference': image_reference,
+            'name': name,
+            'image_secret': image_secret,
+            'run_arguments': run_arguments,
+            'run_as_user': run_as_user,
+            'run_commands': run_commands,
+            'run_compute_resource_token_enabled': run_compute_resource_token_enabled,
+            'run_env_variables': run_env_variables,
+            'run_mode': run_mode,
+            'run_service_account': run_service_account,
+            'run_volume_mounts': run_volume_mounts,
+            'scale_array_spec': scale_array_spec,
+            'scale_cpu_limit': scale_cpu_limit,
+            'scale_ephemeral_storage_limit': scale_ephemeral_storage_limit,
+            'scale_max_execution_time': scale_max_execution_time,
+            'scale_memory_limit': scale_memory_limit,
+            'scale_retry_limit': scale_retry_limit,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_job(
+        self,
+        project_id: str,
+        name: str,
+        *,
+        keep_service_access: Optional[bool] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete a job.
+
+        Delete a job.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your job.
+        :param bool keep_service_access: (optional) Determines if connected service
+               access secrets remain intact after job deletion.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_job',
+            '/projects/{project_id}/jobs/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'keep_service_access': keep_service_access,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_job(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get a job.
+
+        Display the details of a job.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your job.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Job` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_job',
+            '/projects/{project_id}/jobs/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def update_job(
+        self,
+        project_id: str,
+        name: str,
+        if_match: str,
+        job: 'JobPatch',
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Update a job.
+
+        Update the given job.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your job.
+        :param str if_match: Version of the job settings to be updated. Specify the
+               version that you retrieved as entity_tag (ETag header) when reading the
+               job. This value helps identifying parallel usage of this API. Pass * to
+               indicate to update any version available. This might result in stale
+               updates.
+        :param JobPatch job: Job patch prototype.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Job` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        if not if_match:
+            raise ValueError('if_match must be provided')
+        if job is None:
+            raise ValueError('job must be provided')
+        job = convert_model(job)
+        request_template = self._get_request_template(
+            'update_job',
+            '/projects/{project_id}/jobs/{name}',
+            accept='application/json',
+            content_type='application/merge-patch+json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None), {'If-Match': if_match})
+
+        params = {
+            'version': self.version,
+        }
+
+        data = self.json_codec.dumps(job)
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='PATCH',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    #########################
+    # Functions
+    #########################
+
+    def list_function_runtimes(
+        self,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List the function runtimes.
+
+        List all valid function runtimes.
+
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `FunctionRuntimeList` object
+        """
+
+        request_template = self._get_request_template(
+            'list_function_runtimes',
+            '/function_runtimes',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        url = request_template.get_url()
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def list_functions(
+        self,
+        project_id: str,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List functions.
+
+        List all functions in a project.
+
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of functions per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the 'next_url' field of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `FunctionList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_functions',
+            '/projects/{project_id}/functions',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_function(
+        self,
+        project_id: str,
+        code_reference: str,
+        name: str,
+        runtime: str,
+        *,
+        code_binary: Optional[bool] = None,
+        code_main: Optional[str] = None,
+        code_secret: Optional[str] = None,
+        managed_domain_mappings: Optional[str] = None,
+        run_compute_resource_token_enabled: Optional[bool] = None,
+        run_env_variables: Optional[List['EnvVarPrototype']] = None,
+        scale_concurrency: Optional[int] = None,
+        scale_cpu_limit: Optional[str] = None,
+        scale_down_delay: Optional[int] = None,
+        scale_max_execution_time: Optional[int] = None,
+        scale_memory_limit: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create a function.
+
+        Create a function.
+
+        :param str project_id: The ID of the project.
+        :param str code_reference: Specifies either a reference to a code bundle or
+               the source code itself. To specify the source code, use the data URL scheme
+               and include the source code as base64 encoded. The data URL scheme is
+               defined in [RFC 2397](https://tools.ietf.org/html/rfc2397).
+        :param str name: The name of the function. Use a name that is unique within
+               the project.
+        :param str runtime: The managed runtime used to execute the injected code.
+        :param bool code_binary: (optional) Specifies whether the code is binary or
+               not. Defaults to false when `code_reference` is set to a data URL. When
+               `code_reference` is set to a code bundle URL, this field is always true.
+        :param str code_main: (optional) Specifies the name of the function that
+               should be invoked.
+        :param str code_secret: (optional) The name of the secret that is used to
+               access the specified `code_reference`. The secret is used to authenticate
+               with a non-public endpoint that is specified as`code_reference`.
+        :param str managed_domain_mappings: (optional) Optional value controlling
+               which of the system managed domain mappings will be setup for the function.
+               Valid values are 'local_public', 'local_private' and 'local'. Visibility
+               can only be 'local_private' if the project supports function private
+               visibility.
+        :param bool run_compute_resource_token_enabled: (optional) Optional flag to
+               enable the use of a compute resource token mounted to the container file
+               system.
+        :param List[EnvVarPrototype] run_env_variables: (optional) Optional
+               references to config maps, secrets or literal values.
+        :param int scale_concurrency: (optional) Number of parallel requests
+               handled by a single instance, supported only by Node.js, default is `1`.
+        :param str scale_cpu_limit: (optional) Optional amount of CPU set for the
+               instance of the function. For valid values see [Supported memory and CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+        :param int scale_down_delay: (optional) Optional amount of time in seconds
+               that delays the scale down behavior for a function.
+        :param int scale_max_execution_time: (optional) Timeout in secs after which
+               the function is terminated.
+        :param str scale_memory_limit: (optional) Optional amount of memory set for
+               the instance of the function. For valid values see [Supported memory and
+               CPU
+               combinations](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo).
+               The units for specifying memory are Megabyte (M) or Gigabyte (G), whereas G
+               and M are the shorthand expressions for GB and MB. For more information see
+               [Units of
+               measurement](https://cloud.ibm.com/docs/codeengine?topic=codeengine-mem-cpu-combo#unit-measurements).
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Function` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if code_reference is None:
+            raise ValueError('code_reference must be provided')
+        if name is None:
+            raise ValueError('name must be provided')
+        if runtime is None:
+            raise ValueError('runtime must be provided')
+        if run_env_variables is not None:
+            run_env_variables = [convert_model(x) for x in run_env_variables]
+        request_template = self._get_request_template(
+            'create_function',
+            '/projects/{project_id}/functions',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'code_reference': code_reference,
+            'name': name,
+            'runtime': runtime,
+            'code_binary': code_binary,
+            'code_main': code_main,
+            'code_secret': code_secret,
+            'managed_domain_mappings': managed_domain_mappings,
+            'run_compute_resource_token_enabled': run_compute_resource_token_enabled,
+            'run_env_variables': run_env_variables,
+            'scale_concurrency': scale_concurrency,
+            'scale_cpu_limit': scale_cpu_limit,
+            'scale_down_delay': scale_down_delay,
+            'scale_max_execution_time': scale_max_execution_time,
+            'scale_memory_limit': scale_memory_limit,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_function(
+        self,
+        project_id: str,
+        name: str,
+        *,
+        keep_service_access: Optional[bool] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete a function.
+
+        Delete a function.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your function.
+        :param bool keep_service_access: (optional) Determines if connected service
+               access secrets remain intact after function deletion.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_function',
+            '/projects/{project_id}/functions/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'keep_service_access': keep_service_access,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_function(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get a function.
+
+        Display the details of a function.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your function.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Function` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_function',
+            '/projects/{project_id}/functions/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def update_function(
+        self,
+        project_id: str,
+        name: str,
+        if_match: str,
+        function: 'FunctionPatch',
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Update a function.
+
+        Update the given function.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your function.
+        :param str if_match: Version of the function settings to be updated.
+               Specify the version that you retrieved as entity_tag (ETag header) when
+               reading the function. This value helps identifying parallel usage of this
+               API. Pass * to indicate to update any version available. This might result
+               in stale updates.
+        :param FunctionPatch function: Function patch.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Function` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        if not if_match:
+            raise ValueError('if_match must be provided')
+        if function is None:
+            raise ValueError('function must be provided')
+        function = convert_model(function)
+        request_template = self._get_request_template(
+            'update_function',
+            '/projects/{project_id}/functions/{name}',
+            accept='application/json',
+            content_type='application/merge-patch+json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None), {'If-Match': if_match})
+
+        params = {
+            'version': self.version,
+        }
+
+        data = self.json_codec.dumps(function)
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='PATCH',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    #########################
+    # Service bindings
+    #########################
+
+    def list_bindings(
+        self,
+        project_id: str,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List bindings.
+
+        List all bindings in a project.
+
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of bindings per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `BindingList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_bindings',
+            '/projects/{project_id}/bindings',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_binding(
+        self,
+        project_id: str,
+        component: 'ComponentRef',
+        prefix: str,
+        secret_name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create a binding.
+
+        Create a binding. Creating a service binding with a Code Engine app will update
+        the app, creating a new revision. For more information see the
+        [documentation](https://cloud.ibm.com/docs/codeengine?topic=codeengine-service-binding).
+
+        :param str project_id: The ID of the project.
+        :param ComponentRef component: A reference to another component.
+        :param str prefix: Optional value that is set as prefix in the component
+               that is bound. Will be generated if not provided.
+        :param str secret_name: The service access secret that is bound to a
+               component.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Binding` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if component is None:
+            raise ValueError('component must be provided')
+        if prefix is None:
+            raise ValueError('prefix must be provided')
+        if secret_name is None:
+            raise ValueError('secret_name must be provided')
+        component = convert_model(component)
+        request_template = self._get_request_template(
+            'create_binding',
+            '/projects/{project_id}/bindings',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'component': component,
+            'prefix': prefix,
+            'secret_name': secret_name,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_binding(
+        self,
+        project_id: str,
+        id: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete a binding.
+
+        Delete a binding.
+
+        :param str project_id: The ID of the project.
+        :param str id: The ID of the binding.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not id:
+            raise ValueError('id must be provided')
+        request_template = self._get_request_template(
+            'delete_binding',
+            '/projects/{project_id}/bindings/{id}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, id)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_binding(
+        self,
+        project_id: str,
+        id: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get a binding.
+
+        Display the details of a binding.
+
+        :param str project_id: The ID of the project.
+        :param str id: The ID of the binding.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Binding` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not id:
+            raise ValueError('id must be provided')
+        request_template = self._get_request_template(
+            'get_binding',
+            '/projects/{project_id}/bindings/{id}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    #########################
+    # Image builds
+    #########################
+
+    def list_build_runs(
+        self,
+        project_id: str,
+        *,
+        build_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List build runs.
+
+        List all build runs in a project.
+
+        :param str project_id: The ID of the project.
+        :param str build_name: (optional) Optional name of the build that should be
+               filtered for.
+        :param int limit: (optional) Optional maximum number of build runs per
+               page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `BuildRunList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_build_runs',
+            '/projects/{project_id}/build_runs',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'build_name': build_name,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_build_run(
+        self,
+        project_id: str,
+        *,
+        build_name: Optional[str] = None,
+        name: Optional[str] = None,
+        output_image: Optional[str] = None,
+        output_secret: Optional[str] = None,
+        run_build_params: Optional[List['BuildParamPrototype']] = None,
+        service_account: Optional[str] = None,
+        source_context_dir: Optional[str] = None,
+        source_revision: Optional[str] = None,
+        source_secret: Optional[str] = None,
+        source_type: Optional[str] = None,
+        source_url: Optional[str] = None,
+        strategy_size: Optional[str] = None,
+        strategy_spec_file: Optional[str] = None,
+        strategy_type: Optional[str] = None,
+        timeout: Optional[int] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create a build run.
+
+        Create a build run.
+
+        :param str project_id: The ID of the project.
+        :param str build_name: (optional) Optional name of the build on which this
+               build run is based on. If specified, the build run will inherit the
+               configuration of the referenced build. If not specified, make sure to
+               specify at least the fields `strategy_type`, `source_url`, `output_image`
+               and `output_secret` to describe the build run.
+        :param str name: (optional) Name of the build run. This field is optional,
+               if the field `build_name` is specified and its value will be generated like
+               so: `[BUILD_NAME]-run-[timestamp with format: YYMMDD-hhmmss] if not set.`.
+        :param str output_image: (optional) The name of the image.
+        :param str output_secret: (optional) The secret that is required to access
+               the image registry. Make sure that the secret is granted with push
+               permissions towards the specified container registry namespace.
+        :param List[BuildParamPrototype] run_build_params: (optional) Optional
+               references to config maps and secret keys, or literal values that are
+               exposed as build arguments within the Docker file.
+        :param str service_account: (optional) Optional service account, which is
+               used for resource control.
+        :param str source_context_dir: (optional) Optional directory in the
+               repository that contains the buildpacks file or the Dockerfile.
+        :param str source_revision: (optional) Commit, tag, or branch in the source
+               repository to pull. This field is optional if the `source_type` is `git`
+               and uses the HEAD of default branch if not specified. If the `source_type`
+               value is `local`, this field must be omitted.
+        :param str source_secret: (optional) Name of the secret that is used access
+               the repository source. This field is optional if the `source_type` is
+               `git`. Additionally, if the `source_url` points to a repository that
+               requires authentication, the build will be created but cannot access any
+               source code, until this property is provided, too. If the `source_type`
+               value is `local`, this field must be omitted.
+        :param str source_type: (optional) Specifies the type of source to
+               determine if your build source is in a repository or based on local source
+               code.
+               * local - For builds from local source code.
+               * git - For builds from git version controlled source code.
+        :param str source_url: (optional) The URL of the code repository. This
+               field is required if the `source_type` is `git`. If the `source_type` value
+               is `local`, this field must be omitted. If the repository is publicly
+               available you can provide a 'https' URL like
+               `https://github.com/IBM/CodeEngine`. If the repository requires
+               authentication, you need to provide a 'ssh' URL like
+               `git@github.com:IBM/CodeEngine.git` along with a `source_secret` that
+               points to a secret of format `ssh_auth`.
+        :param str strategy_size: (optional) Optional size for the build, which
+               determines the amount of resources used. Build sizes are `small`, `medium`,
+               `large`, `xlarge`, `xxlarge`.
+        :param str strategy_spec_file: (optional) Optional path to the
+               specification file that is used for build strategies for building an image.
+        :param str strategy_type: (optional) The strategy to use for building the
+               image.
+        :param int timeout: (optional) The maximum amount of time, in seconds, that
+               can pass before the build must succeed or fail.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `BuildRun` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if run_build_params is not None:
+            run_build_params = [convert_model(x) for x in run_build_params]
+        request_template = self._get_request_template(
+            'create_build_run',
+            '/projects/{project_id}/build_runs',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'build_name': build_name,
+            'name': name,
+            'output_image': output_image,
+            'output_secret': output_secret,
+            'run_build_params': run_build_params,
+            'service_account': service_account,
+            'source_context_dir': source_context_dir,
+            'source_revision': source_revision,
+            'source_secret': source_secret,
+            'source_type': source_type,
+            'source_url': source_url,
+            'strategy_size': strategy_size,
+            'strategy_spec_file': strategy_spec_file,
+            'strategy_type': strategy_type,
+            'timeout': timeout,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_build_run(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete a build run.
+
+        Delete a build run.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your build run.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_build_run',
+            '/projects/{project_id}/build_runs/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_build_run(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get a build run.
+
+        Display the details of a build run.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your build run.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `BuildRun` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_build_run',
+            '/projects/{project_id}/build_runs/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def list_builds(
+        self,
+        project_id: str,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List builds.
+
+        List all builds in a project.
+
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of builds per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `BuildList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_builds',
+            '/projects/{project_id}/builds',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_build(
+        self,
+        project_id: str,
+        name: str,
+        output_image: str,
+        output_secret: str,
+        strategy_type: str,
+        *,
+        run_build_params: Optional[List['BuildParamPrototype']] = None,
+        source_context_dir: Optional[str] = None,
+        source_revision: Optional[str] = None,
+        source_secret: Optional[str] = None,
+        source_type: Optional[str] = None,
+        source_url: Optional[str] = None,
+        strategy_size: Optional[str] = None,
+        strategy_spec_file: Optional[str] = None,
+        timeout: Optional[int] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create a build.
+
+        Create a build.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of the build. Use a name that is unique within
+               the project.
+        :param str output_image: The name of the image.
+        :param str output_secret: The secret that is required to access the image
+               registry. Make sure that the secret is granted with push permissions
+               towards the specified container registry namespace.
+        :param str strategy_type: The strategy to use for building the image.
+        :param List[BuildParamPrototype] run_build_params: (optional) Optional
+               references to config maps and secret keys, or literal values that are
+               exposed as build arguments within the Docker file.
+        :param str source_context_dir: (optional) Optional directory in the
+               repository that contains the buildpacks file or the Dockerfile.
+        :param str source_revision: (optional) Commit, tag, or branch in the source
+               repository to pull. This field is optional if the `source_type` is `git`
+               and uses the HEAD of default branch if not specified. If the `source_type`
+               value is `local`, this field must be omitted.
+        :param str source_secret: (optional) Name of the secret that is used access
+               the repository source. This field is optional if the `source_type` is
+               `git`. Additionally, if the `source_url` points to a repository that
+               requires authentication, the build will be created but cannot access any
+               source code, until this property is provided, too. If the `source_type`
+               value is `local`, this field must be omitted.
+        :param str source_type: (optional) Specifies the type of source to
+               determine if your build source is in a repository or based on local source
+               code.
+               * local - For builds from local source code.
+               * git - For builds from git version controlled source code.
+        :param str source_url: (optional) The URL of the code repository. This
+               field is required if the `source_type` is `git`. If the `source_type` value
+               is `local`, this field must be omitted. If the repository is publicly
+               available you can provide a 'https' URL like
+               `https://github.com/IBM/CodeEngine`. If the repository requires
+               authentication, you need to provide a 'ssh' URL like
+               `git@github.com:IBM/CodeEngine.git` along with a `source_secret` that
+               points to a secret of format `ssh_auth`.
+        :param str strategy_size: (optional) Optional size for the build, which
+               determines the amount of resources used. Build sizes are `small`, `medium`,
+               `large`, `xlarge`, `xxlarge`.
+        :param str strategy_spec_file: (optional) Optional path to the
+               specification file that is used for build strategies for building an image.
+        :param int timeout: (optional) The maximum amount of time, in seconds, that
+               can pass before the build must succeed or fail.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Build` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if name is None:
+            raise ValueError('name must be provided')
+        if output_image is None:
+            raise ValueError('output_image must be provided')
+        if output_secret is None:
+            raise ValueError('output_secret must be provided')
+        if strategy_type is None:
+            raise ValueError('strategy_type must be provided')
+        if run_build_params is not None:
+            run_build_params = [convert_model(x) for x in run_build_params]
+        request_template = self._get_request_template(
+            'create_build',
+            '/projects/{project_id}/builds',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'name': name,
+            'output_image': output_image,
+            'output_secret': output_secret,
+            'strategy_type': strategy_type,
+            'run_build_params': run_build_params,
+            'source_context_dir': source_context_dir,
+            'source_revision': source_revision,
+            'source_secret': source_secret,
+            'source_type': source_type,
+            'source_url': source_url,
+            'strategy_size': strategy_size,
+            'strategy_spec_file': strategy_spec_file,
+            'timeout': timeout,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_build(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete a build.
+
+        Delete a build.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your build.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_build',
+            '/projects/{project_id}/builds/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_build(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get a build.
+
+        Display the details of a build.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your build.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Build` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_build',
+            '/projects/{project_id}/builds/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def update_build(
+        self,
+        project_id: str,
+        name: str,
+        if_match: str,
+        build: 'BuildPatch',
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Update a build.
+
+        Update a build.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your build.
+        :param str if_match: Version of the build settings to be updated. Specify
+               the version that you retrieved as entity_tag (ETag header) when reading the
+               build. This value helps identifying parallel usage of this API. Pass * to
+               indicate to update any version available. This might result in stale
+               updates.
+        :param BuildPatch build: Build patch.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Build` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        if not if_match:
+            raise ValueError('if_match must be provided')
+        if build is None:
+            raise ValueError('build must be provided')
+        build = convert_model(build)
+        request_template = self._get_request_template(
+            'update_build',
+            '/projects/{project_id}/builds/{name}',
+            accept='application/json',
+            content_type='application/merge-patch+json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None), {'If-Match': if_match})
+
+        params = {
+            'version': self.version,
+        }
+
+        data = self.json_codec.dumps(build)
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='PATCH',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    #########################
+    # Domain mappings
+    #########################
+
+    def list_domain_mappings(
+        self,
+        project_id: str,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List domain mappings.
+
+        List all domain mappings in a project.
+
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of domain mappings per
+               page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `DomainMappingList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_domain_mappings',
+            '/projects/{project_id}/domain_mappings',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_domain_mapping(
+        self,
+        project_id: str,
+        component: 'ComponentRef',
+        name: str,
+        tls_secret: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create a domain mapping.
+
+        Create a domain mapping.
+
+        :param str project_id: The ID of the project.
+        :param ComponentRef component: A reference to another component.
+        :param str name: The name of the domain mapping.
+        :param str tls_secret: The name of the TLS secret that includes the
+               certificate and private key of this domain mapping.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `DomainMapping` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if component is None:
+            raise ValueError('component must be provided')
+        if name is None:
+            raise ValueError('name must be provided')
+        if tls_secret is None:
+            raise ValueError('tls_secret must be provided')
+        component = convert_model(component)
+        request_template = self._get_request_template(
+            'create_domain_mapping',
+            '/projects/{project_id}/domain_mappings',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'component': component,
+            'name': name,
+            'tls_secret': tls_secret,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_domain_mapping(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete a domain mapping.
+
+        Delete a domain mapping.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your domain mapping.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_domain_mapping',
+            '/projects/{project_id}/domain_mappings/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_domain_mapping(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get a domain mapping.
+
+        Get domain mapping.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your domain mapping.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `DomainMapping` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_domain_mapping',
+            '/projects/{project_id}/domain_mappings/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def update_domain_mapping(
+        self,
+        project_id: str,
+        name: str,
+        if_match: str,
+        domain_mapping: 'DomainMappingPatch',
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Update a domain mapping.
+
+        Update a domain mapping.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your domain mapping.
+        :param str if_match: Version of the domain mapping to be updated. Specify
+               the version that you retrieved as entity_tag (ETag header) when reading the
+               domain mapping. This value helps identify parallel usage of this API. Pass
+               * to indicate to update any version available. This might result in stale
+               updates.
+        :param DomainMappingPatch domain_mapping: DomainMapping patch.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `DomainMapping` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        if not if_match:
+            raise ValueError('if_match must be provided')
+        if domain_mapping is None:
+            raise ValueError('domain_mapping must be provided')
+        domain_mapping = convert_model(domain_mapping)
+        request_template = self._get_request_template(
+            'update_domain_mapping',
+            '/projects/{project_id}/domain_mappings/{name}',
+            accept='application/json',
+            content_type='application/merge-patch+json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None), {'If-Match': if_match})
+
+        params = {
+            'version': self.version,
+        }
+
+        data = self.json_codec.dumps(domain_mapping)
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='PATCH',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    #########################
+    # Secrets and configmaps
+    #########################
+
+    def list_config_maps(
+        self,
+        project_id: str,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List config maps.
+
+        List all config maps in a project.
+
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of config maps per
+               page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ConfigMapList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_config_maps',
+            '/projects/{project_id}/config_maps',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_config_map(
+        self,
+        project_id: str,
+        name: str,
+        *,
+        data: Optional[dict] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create a config map.
+
+        Create a config map.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of the configmap. Use a name that is unique
+               within the project.
+        :param dict data: (optional) The key-value pair for the config map. Values
+               must be specified in `KEY=VALUE` format. Each `KEY` field must consist of
+               alphanumeric characters, `-`, `_` or `.` and must not be exceed a max
+               length of 253 characters. Each `VALUE` field can consists of any character
+               and must not be exceed a max length of 1048576 characters.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ConfigMap` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if name is None:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'create_config_map',
+            '/projects/{project_id}/config_maps',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'name': name,
+            'data': data,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_config_map(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete a config map.
+
+        Delete a config map.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your configmap.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_config_map',
+            '/projects/{project_id}/config_maps/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_config_map(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get a config map.
+
+        Display the details of a config map.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your configmap.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ConfigMap` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_config_map',
+            '/projects/{project_id}/config_maps/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def replace_config_map(
+        self,
+        project_id: str,
+        name: str,
+        if_match: str,
+        *,
+        data: Optional[dict] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Update a config map.
+
+        Update a config map.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your configmap.
+        :param str if_match: Version of the config map settings to be updated.
+               Specify the version that you retrieved as entity_tag (ETag header) when
+               reading the config map. This value helps identifying parallel usage of this
+               API. Pass * to indicate to update any version available. This might result
+               in stale updates.
+        :param dict data: (optional) The key-value pair for the config map. Values
+               must be specified in `KEY=VALUE` format. Each `KEY` field must consist of
+               alphanumeric characters, `-`, `_` or `.` and must not be exceed a max
+               length of 253 characters. Each `VALUE` field can consists of any character
+               and must not be exceed a max length of 1048576 characters.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ConfigMap` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        if not if_match:
+            raise ValueError('if_match must be provided')
+        request_template = self._get_request_template(
+            'replace_config_map',
+            '/projects/{project_id}/config_maps/{name}',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None), {'If-Match': if_match})
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'data': data,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='PUT',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def list_secrets(
+        self,
+        project_id: str,
+        *,
+        format: Optional[str] = None,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List secrets.
+
+        List all secrets in a project.
+
+        :param str project_id: The ID of the project.
+        :param str format: (optional) Secret format to filter results by.
+        :param int limit: (optional) Optional maximum number of secrets per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `SecretList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_secrets',
+            '/projects/{project_id}/secrets',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'format': format,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_secret(
+        self,
+        project_id: str,
+        format: str,
+        name: str,
+        *,
+        data: Optional['SecretData'] = None,
+        service_access: Optional['ServiceAccessSecretPrototypeProps'] = None,
+        service_operator: Optional['OperatorSecretPrototypeProps'] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create a secret.
+
+        Create a secret.
+
+        :param str project_id: The ID of the project.
+        :param str format: Specify the format of the secret. The format of the
+               secret will determine how the secret is used.
+        :param str name: The name of the secret.
+        :param SecretData data: (optional) Data container that allows to specify
+               config parameters and their values as a key-value map. Each key field must
+               consist of alphanumeric characters, `-`, `_` or `.` and must not exceed a
+               max length of 253 characters. Each value field can consists of any
+               character and must not exceed a max length of 1048576 characters.
+        :param ServiceAccessSecretPrototypeProps service_access: (optional)
+               Properties for Service Access Secrets.
+        :param OperatorSecretPrototypeProps service_operator: (optional) Properties
+               for the IBM Cloud Operator Secrets.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Secret` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if format is None:
+            raise ValueError('format must be provided')
+        if name is None:
+            raise ValueError('name must be provided')
+        if data is not None:
+            data = convert_model(data)
+        if service_access is not None:
+            service_access = convert_model(service_access)
+        if service_operator is not None:
+            service_operator = convert_model(service_operator)
+        request_template = self._get_request_template(
+            'create_secret',
+            '/projects/{project_id}/secrets',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'format': format,
+            'name': name,
+            'data': data,
+            'service_access': service_access,
+            'service_operator': service_operator,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_secret(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete a secret.
+
+        Delete a secret.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your secret.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_secret',
+            '/projects/{project_id}/secrets/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_secret(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get a secret.
+
+        Get a secret.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your secret.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Secret` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_secret',
+            '/projects/{project_id}/secrets/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def replace_secret(
+        self,
+        project_id: str,
+        name: str,
+        if_match: str,
+        format: str,
+        *,
+        data: Optional['SecretData'] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Update a secret.
+
+        Update a secret.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your secret.
+        :param str if_match: Version of the secret settings to be updated. Specify
+               the version that you retrieved as entity_tag (ETag header) when reading the
+               secret. This value helps identifying parallel usage of this API. Pass * to
+               indicate to update any version available. This might result in stale
+               updates.
+        :param str format: Specify the format of the secret. The format of the
+               secret will determine how the secret is used.
+        :param SecretData data: (optional) Data container that allows to specify
+               config parameters and their values as a key-value map. Each key field must
+               consist of alphanumeric characters, `-`, `_` or `.` and must not exceed a
+               max length of 253 characters. Each value field can consists of any
+               character and must not exceed a max length of 1048576 characters.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Secret` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        if not if_match:
+            raise ValueError('if_match must be provided')
+        if format is None:
+            raise ValueError('format must be provided')
+        if data is not None:
+            data = convert_model(data)
+        request_template = self._get_request_template(
+            'replace_secret',
+            '/projects/{project_id}/secrets/{name}',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None), {'If-Match': if_match})
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'format': format,
+            'data': data,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='PUT',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    #########################
+    # Persistent data stores
+    #########################
+
+    def list_persistent_data_stores(
+        self,
+        project_id: str,
+        *,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        List persistent data stores.
+
+        List all persistent data stores in a project.
+
+        :param str project_id: The ID of the project.
+        :param int limit: (optional) Optional maximum number of persistent data
+               stores per page.
+        :param str start: (optional) An optional token that indicates the beginning
+               of the page of results to be returned. If omitted, the first page of
+               results is returned. This value is obtained from the 'start' query
+               parameter in the `next` object of the operation response.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `PersistentDataStoreList` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        request_template = self._get_request_template(
+            'list_persistent_data_stores',
+            '/projects/{project_id}/persistent_data_stores',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+            'limit': limit,
+            'start': start,
+        }
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def create_persistent_data_store(
+        self,
+        project_id: str,
+        name: str,
+        storage_type: str,
+        *,
+        data: Optional['StorageData'] = None,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Create a persistent data store.
+
+        Create a persistent data store.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of the persistent data store.
+        :param str storage_type: Specify the storage type of the persistent data
+               store.
+        :param StorageData data: (optional) Data container that allows to specify
+               config parameters and their values as a key-value map. Each key field must
+               consist of alphanumeric characters, `-`, `_` or `.` and must not exceed a
+               max length of 253 characters. Each value field can consists of any
+               character and must not exceed a max length of 1048576 characters.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `PersistentDataStore` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if name is None:
+            raise ValueError('name must be provided')
+        if storage_type is None:
+            raise ValueError('storage_type must be provided')
+        if data is not None:
+            data = convert_model(data)
+        request_template = self._get_request_template(
+            'create_persistent_data_store',
+            '/projects/{project_id}/persistent_data_stores',
+            accept='application/json',
+            content_type='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        data = {
+            'name': name,
+            'storage_type': storage_type,
+            'data': data,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = self.json_codec.dumps(data)
+
+        url = request_template.get_url(project_id)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def delete_persistent_data_store(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Delete a persistent data store.
+
+        Delete a persistent data store.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your persistent data store.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'delete_persistent_data_store',
+            '/projects/{project_id}/persistent_data_stores/{name}',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='DELETE',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+    def get_persistent_data_store(
+        self,
+        project_id: str,
+        name: str,
+        **kwargs,
+    ) -> DetailedResponse:
+        """
+        Get a persistent data store.
+
+        Get a persistent data store.
+
+        :param str project_id: The ID of the project.
+        :param str name: The name of your persistent data store.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `PersistentDataStore` object
+        """
+
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        if not name:
+            raise ValueError('name must be provided')
+        request_template = self._get_request_template(
+            'get_persistent_data_store',
+            '/projects/{project_id}/persistent_data_stores/{name}',
+            accept='application/json',
+        )
+        headers = request_template.get_headers(kwargs.pop('headers', None))
+
+        params = {
+            'version': self.version,
+        }
+
+        url = request_template.get_url(project_id, name)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, operation_id=request_template.operation_id, **kwargs)
+        return response
+
+
+class ListSecretsEnums:
+    """
+    Enums for list_secrets parameters.
+    """
+
+    class Format(str, Enum):
+        """
+        Secret format to filter results by.
+        """
+
+        GENERIC = 'generic'
+        SSH_AUTH = 'ssh_auth'
+        REGISTRY = 'registry'
+        BASIC_AUTH = 'basic_auth'
+        HMAC_AUTH = 'hmac_auth'
+        TLS = 'tls'
+        SERVICE_ACCESS = 'service_access'
+        SERVICE_OPERATOR = 'service_operator'
@@ -0,0 +1,143 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compact variants of the models of the Code Engine V2 service.
+
+Every model of `code_engine_v2`, such as App, JobRun or EnvVar, has a variant
+of the same name in this module whose instances keep their properties in
+`__slots__` instead of a per-instance `__dict__`, which takes a fraction of the
+memory. The variants are built from the models when this module is imported,
+so they have the same constructors, `from_dict()`, `to_dict()` and enums, and
+the nested models that their `from_dict()` creates are compact as well:
+
+    from ibm_code_engine_sdk import compact_models
+
+    job_runs = compact_models.JobRunList.from_dict(response.get_result()).job_runs
+
+Compact models have no `__dict__`, except for the models that support
+additional properties, and cannot be given attributes other than their
+properties.
+"""
+
+from inspect import signature
+from typing import Dict, List
+import sys
+import types
+
+from . import code_engine_v2
+from .code_engine_v2 import models
+from .decoders import install_decoders
+from .encoders import install_encoders
+
+# Placeholder for an unset property when comparing compact models.
+_UNSET = object()
+
+
+def _is_model(cls: type) -> bool:
+    # Models define to_dict(), or are the abstract base classes of models.
+    return (
+        isinstance(cls, type)
+        and cls.__module__.startswith(models.__name__ + '.')
+        and ('to_dict' in vars(cls) or any('to_dict' in vars(subclass) for subclass in cls.__subclasses__()))
+    )
+
+
+def _get_fields(cls: type) -> List[str]:
+    if 'to_dict' not in vars(cls):
+        # Abstract base classes are never instantiated.
+        return []
+    fields = []
+    for name, parameter in signature(cls.__init__).parameters.items():
+        if parameter.kind is parameter.VAR_KEYWORD:
+            # Models with additional properties keep them in a __dict__.
+            fields.append('__dict__')
+        elif name != 'self':
+            fields.append(name)
+    return fields
+
+
+def _rebind(value, namespace: dict):
+    # Returns a copy of a function whose global names are looked up in `namespace`.
+    if isinstance(value, (classmethod, staticmethod)):
+        return type(value)(_rebind(value.__func__, namespace))
+    if isinstance(value, types.FunctionType):
+        # The decoders of the models are generated again for the compact models.
+        value = getattr(value, '__wrapped__', value)
+        function = types.FunctionType(value.__code__, namespace, value.__name__, value.__defaults__, value.__closure__)
+        function.__kwdefaults__ = value.__kwdefaults__
+        function.__doc__ = value.__doc__
+        function.__qualname__ = value.__qualname__
+        function.__annotations__ = value.__annotations__
+        return function
+    return value
+
+
+def _eq(self, other) -> bool:
+    """Return `true` when self and other are equal, false otherwise."""
+    if not isinstance(other, self.__class__):
+        return False
+    return all(getattr(self, name, _UNSET) == getattr(other, name, _UNSET) for name in self._fields)
+
+
+def _ne(self, other) -> bool:
+    """Return `true` when self and other are not equal, false otherwise."""
+    return not self == other
+
+
+def _build_compact_models() -> Dict[str, type]:
+    # Importing every name of code_engine_v2 imports all the modules of its models.
+    exports = [getattr(code_engine_v2, name) for name in code_engine_v2.__all__]
+    namespace = {}
+    fields = {}
+    for module in sorted({cls.__module__ for cls in exports}):
+        namespace.update(vars(sys.modules[module]))
+        fields.update(getattr(sys.modules[module], '_FIELDS', {}))
+    compact_models = {}
+
+    def build(cls: type) -> type:
+        if cls.__name__ in compact_models:
+            return compact_models[cls.__name__]
+        bases = tuple(build(base) for base in cls.__bases__ if base is not object)
+        inherited = set()
+        for base in bases:
+            inherited.update(base._fields)
+        fields = _get_fields(cls)
+        class_namespace = {
+            name: _rebind(value, namespace)
+            for name, value in vars(cls).items()
+            if name not in ('__dict__', '__weakref__', '__eq__', '__ne__')
+        }
+        class_namespace.update(
+            __module__=__name__,
+            __slots__=tuple(name for name in fields if name not in inherited),
+            _fields=tuple(fields),
+            __eq__=_eq,
+            __ne__=_ne,
+        )
+        compact_models[cls.__name__] = type(cls.__name__, bases, class_namespace)
+        return compact_models[cls.__name__]
+
+    for cls in exports:
+        if _is_model(cls):
+            build(cls)
+    namespace.update(compact_models)
+    install_decoders(compact_models.values(), namespace, fields)
+    install_encoders(compact_models.values(), fields, eq=True)
+    return compact_models
+
+
+globals().update(_build_compact_models())
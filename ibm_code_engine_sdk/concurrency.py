@@ -0,0 +1,254 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Adaptive concurrency of the bulk operations of the Code Engine V2 clients.
+
+An AdaptiveConcurrencyLimiter bounds the number of calls in flight, and
+adjusts the bound to what the API sustains with additive increase and
+multiplicative decrease (AIMD): the limit grows by one per window of calls
+while their latency stays close to the lowest latency observed, and is cut
+by half when the API throttles a call with 429 Too Many Requests or 503
+Service Unavailable. A Retry-After header of a throttled call also holds
+back new calls until it has elapsed, and a throttled call without one is
+attempted again after a jittered exponential backoff. The limit is reported
+to a metrics sink:
+
+    limiter = AdaptiveConcurrencyLimiter(max_limit=32, metrics_sink=service.get_metrics_sink())
+    results = create_job_runs(service, project_id, job_runs, concurrency=limiter)
+"""
+
+from typing import Callable, Optional
+import logging
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+
+from .metrics import MetricsSink
+from .waiters import Backoff
+
+# The status codes with which the API throttles calls.
+THROTTLING_STATUS_CODES = frozenset([429, 503])
+
+# The delays before attempting again a call throttled without a Retry-After header.
+DEFAULT_BACKOFF = Backoff(delay=0.1, max_delay=10.0)
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AdaptiveConcurrencyLimiter limits the number of concurrent calls to a
+    limit that it adapts to the responses of the API. It is thread-safe.
+
+    Calls run through `call()`, or between `acquire()` and `release()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        max_attempts: int = 5,
+        backoff: Backoff = DEFAULT_BACKOFF,
+        on_change: Optional[Callable[[int], None]] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize an AdaptiveConcurrencyLimiter object.
+
+        :param int initial_limit: (optional) The number of concurrent calls to
+               start with.
+        :param int min_limit: (optional) The lowest limit.
+        :param int max_limit: (optional) The highest limit.
+        :param float decrease_factor: (optional) The factor by which the limit is
+               multiplied when a call is throttled, between 0 and 1.
+        :param float latency_tolerance: (optional) The limit grows only after the
+               calls whose latency is at most this multiple of the lowest
+               latency observed.
+        :param int max_attempts: (optional) The number of times that `call()`
+               attempts a call which is throttled.
+        :param Backoff backoff: (optional) The delays before `call()` attempts
+               again a call which is throttled without a Retry-After header.
+        :param Callable on_change: (optional) Called with the new limit whenever
+               the limit changes.
+        :param MetricsSink metrics_sink: (optional) The sink to which the limit
+               is reported, such as the metrics sink of the client.
+        :param Callable clock: (optional) Returns the current time in seconds.
+        :param Callable sleep: (optional) Waits for a number of seconds.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError('the limits must satisfy 1 <= min_limit <= initial_limit <= max_limit')
+        if not 0 < decrease_factor < 1:
+            raise ValueError('decrease_factor must be between 0 and 1')
+        if latency_tolerance < 1:
+            raise ValueError('latency_tolerance must be at least 1')
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self._on_change = on_change
+        self._metrics_sink = metrics_sink
+        self._clock = clock
+        self._sleep = sleep
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._ticket = 0
+        # Calls acquired up to this ticket were in flight at the last decrease, and do not decrease the limit again.
+        self._decrease_ticket = 0
+        self._paused_until = 0.0
+        self._min_latency = None
+        self._condition = threading.Condition()
+        if metrics_sink is not None:
+            metrics_sink.record_concurrency_limit(initial_limit, 0)
+
+    @property
+    def limit(self) -> int:
+        """The number of calls that can be in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of calls in flight."""
+        return self._in_flight
+
+    def acquire(self) -> int:
+        """
+        Waits until a call can start, and counts it in flight.
+
+        :return: The ticket of the call, to be passed to `release()`.
+        :rtype: int
+        """
+        with self._condition:
+            while True:
+                delay = self._paused_until - self._clock()
+                if delay > 0:
+                    self._condition.wait(delay)
+                elif self._in_flight >= int(self._limit):
+                    self._condition.wait()
+                else:
+                    break
+            self._in_flight += 1
+            self._ticket += 1
+            return self._ticket
+
+    def release(
+        self,
+        ticket: int,
+        *,
+        latency: Optional[float] = None,
+        throttled: bool = False,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Records the outcome of a call and lets the next call start.
+
+        :param int ticket: The ticket returned by `acquire()`.
+        :param float latency: (optional) The latency of a successful call, in
+               seconds. Calls that failed for other reasons than throttling
+               are released without a latency, and leave the limit as is.
+        :param bool throttled: (optional) Whether the API throttled the call.
+        :param float retry_after: (optional) The number of seconds that the API
+               asked to wait before the next call.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            previous_limit = int(self._limit)
+            if throttled:
+                if ticket > self._decrease_ticket:
+                    self._limit = max(float(self.min_limit), int(self._limit) * self.decrease_factor)
+                    self._decrease_ticket = self._ticket
+                if retry_after:
+                    self._paused_until = max(self._paused_until, self._clock() + retry_after)
+            elif latency is not None:
+                min_latency = self._min_latency
+                if min_latency is None or latency < min_latency:
+                    self._min_latency = latency
+                else:
+                    # The lowest latency rises slowly, so that it follows a lasting change of the API.
+                    self._min_latency = min_latency + (latency - min_latency) * 0.01
+                if latency <= self.latency_tolerance * self._min_latency and self._limit < self.max_limit:
+                    self._limit = min(float(self.max_limit), self._limit + 1 / int(self._limit))
+            limit = int(self._limit)
+            self._condition.notify_all()
+        if limit != previous_limit:
+            logger.debug('Concurrency limit changed from %d to %d', previous_limit, limit)
+            if self._on_change is not None:
+                self._on_change(limit)
+            if self._metrics_sink is not None:
+                self._metrics_sink.record_concurrency_limit(limit, previous_limit)
+
+    def call(self, operation: Callable, *args, **kwargs):
+        """
+        Runs a call within the limit, and attempts it again when the API
+        throttles it, up to `max_attempts` times. A call throttled without a
+        Retry-After header is attempted again after a delay of the backoff.
+
+        :param Callable operation: The call, such as `service.create_job_run`.
+        :param args: The positional arguments of the call.
+        :param kwargs: The keyword arguments of the call.
+        :return: The result of the call.
+        :raises ApiException: The call failed, or was throttled on every attempt.
+        """
+        attempt = 1
+        delays = None
+        while True:
+            ticket = self.acquire()
+            start = self._clock()
+            try:
+                result = operation(*args, **kwargs)
+            except ApiException as e:
+                retry_after = get_retry_after(e)
+                throttled = e.status_code in THROTTLING_STATUS_CODES or retry_after is not None
+                self.release(ticket, throttled=throttled, retry_after=retry_after)
+                if not throttled or attempt >= self.max_attempts:
+                    raise
+                if retry_after is None:
+                    if delays is None:
+                        delays = self.backoff.delays()
+                    self._sleep(next(delays))
+                attempt += 1
+                continue
+            except BaseException:
+                self.release(ticket)
+                raise
+            self.release(ticket, latency=self._clock() - start)
+            return result
+
+
+def get_retry_after(exception: ApiException) -> Optional[float]:
+    """
+    Returns the number of seconds of the Retry-After header of the response of
+    a failed call, or None when it has none.
+
+    :param ApiException exception: The error of the call.
+    :rtype: float
+    """
+    http_response = exception.http_response
+    retry_after = http_response.headers.get('Retry-After') if http_response is not None else None
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+    return None
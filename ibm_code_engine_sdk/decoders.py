@@ -0,0 +1,189 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generated decoders for the `from_dict()` methods of the models.
+
+The generated `from_dict()` of a model looks up every property with a walrus
+`_dict.get()` check, collects the arguments in a dict and passes them to the
+constructor as keyword arguments. The decoders that this module generates for
+a model read the properties into locals and assign them to a new instance
+directly, which avoids building the arguments and binding them to the
+constructor.
+
+A decoder is generated the first time that its model is decoded, from the
+properties of the model in a static table, `MODEL_FIELDS` of the
+`code_engine_v2.models.fields` module, so no source code is needed at run
+time. It raises the same errors and produces instances with identical
+properties, in the same order. Models that are not in the table, such as the
+models with additional properties, keep their `from_dict()`.
+"""
+
+from inspect import Parameter, signature
+from typing import Callable, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple
+import logging
+import weakref
+
+logger = logging.getLogger(__name__)
+
+# The message of the ValueError that is raised when a required property is missing, by property and model name.
+REQUIRED_MESSAGE = 'Required property \'{0}\' not present in {1} JSON'
+
+# The names that the generated decoders use besides the properties.
+_RESERVED_NAMES = frozenset(['cls', '_dict', 'get', 'new', 'self'])
+
+# The expressions that the generated decoders convert a property with, by the kind of the property.
+_CONVERSIONS = {
+    'value': None,
+    'model': '{1}.from_dict({0})',
+    'list': '[{1}.from_dict(v) for v in {0}]',
+    'dict': '{{k: {1}.from_dict(v) for k, v in {0}.items()}}',
+}
+
+
+class ModelField(NamedTuple):
+    """
+    A property of a model, as read by its `from_dict()` and written by its
+    `to_dict()`.
+
+    :param str name: The name of the property, which is also its key in the
+          dict of the model.
+    :param str kind: How `from_dict()` converts the property: 'value' for
+          none, 'model' for a nested model, 'list' for a list and 'dict' for a
+          dict of nested models.
+    :param str model: The name of the nested model, if any.
+    :param bool required: Whether `from_dict()` raises a ValueError when the
+          property is missing.
+    :param str to_dict_kind: How `to_dict()` converts the property, if not
+          like `kind`, such as the properties that `from_dict()` keeps as dicts.
+    """
+
+    name: str
+    kind: str = 'value'
+    model: Optional[str] = None
+    required: bool = False
+    to_dict_kind: Optional[str] = None
+
+
+# The properties of the models with installed decoders.
+_model_fields: 'weakref.WeakKeyDictionary[type, Tuple[ModelField, ...]]' = weakref.WeakKeyDictionary()
+
+
+def install_decoders(models: Iterable[type], namespace: dict, fields: Mapping[str, Tuple[ModelField, ...]]) -> None:
+    """
+    Replaces the `from_dict()` of the models with one that generates a decoder
+    on its first call.
+    :param Iterable[type] models: The model classes.
+    :param dict namespace: The namespace in which the decoders look up the
+           models of nested properties, usually the globals of the module of
+           the models.
+    :param Mapping fields: The properties of the models by model name, such
+           as `MODEL_FIELDS`. Models without properties keep their
+           `from_dict()`.
+    """
+    for model in models:
+        from_dict = vars(model).get('from_dict')
+        model_fields = fields.get(model.__name__)
+        if isinstance(from_dict, classmethod) and model_fields is not None:
+            _model_fields[model] = tuple(model_fields)
+            model.from_dict = classmethod(_lazy_from_dict(model, from_dict.__func__, namespace))
+
+
+def get_fields(model: type) -> Optional[Tuple[ModelField, ...]]:
+    """
+    Returns the properties that the decoder of a model reads.
+    :param type model: The model class.
+    :return: The properties, or None if the model has no decoder.
+    :rtype: tuple
+    """
+    return _model_fields.get(model)
+
+
+def _lazy_from_dict(model: type, original: Callable, namespace: dict) -> Callable:
+    # The decoder is kept for callers that hold on to this function, such as a bound method.
+    decoders = []
+
+    def from_dict(cls, _dict):
+        if not decoders:
+            try:
+                decoders.append(_generate_decoder(model, original, namespace) or original)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.debug('No decoder generated for %s', model.__name__, exc_info=True)
+                decoders.append(original)
+            model.from_dict = classmethod(decoders[0])
+        return decoders[0](cls, _dict)
+
+    _wrap(from_dict, original)
+    return from_dict
+
+
+def _wrap(function: Callable, original: Callable) -> None:
+    function.__name__ = original.__name__
+    function.__qualname__ = original.__qualname__
+    function.__doc__ = original.__doc__
+    function.__wrapped__ = original
+
+
+def _generate_decoder(model: type, original: Callable, namespace: dict) -> Optional[Callable]:
+    # Returns a decoder for `model`, or None if its constructor does not match its properties.
+    fields = _model_fields[model]
+    parameters: Dict[str, Parameter] = dict(signature(model.__init__).parameters)
+    parameters.pop('self', None)
+    names = [field.name for field in fields]
+    if not set(names) <= set(parameters) or _RESERVED_NAMES.intersection(parameters):
+        return None
+    lines = ['def from_dict(cls, _dict):', '    get = _dict.get']
+    for field in fields:
+        name = field.name
+        lines.append('    {0} = get({0!r})'.format(name))
+        if field.required:
+            lines.append('    if {0} is None:'.format(name))
+            lines.append('        raise ValueError({0!r})'.format(REQUIRED_MESSAGE.format(name, model.__name__)))
+        elif parameters[name].default is Parameter.empty:
+            # The constructor would fail on a missing argument.
+            return None
+        conversion = _CONVERSIONS[field.kind]
+        if conversion is not None:
+            converted = conversion.format(name, field.model)
+            if field.required:
+                lines.append('    {0} = {1}'.format(name, converted))
+            else:
+                lines.append('    if {0} is not None:'.format(name))
+                lines.append('        {0} = {1}'.format(name, converted))
+    lines.append('    self = new(cls)')
+    defaults = {}
+    # The properties are assigned in the order of the table, which is the order of the constructor.
+    for name in names + [name for name in parameters if name not in names]:
+        default = parameters[name].default
+        if name not in names:
+            if default is Parameter.empty:
+                return None
+            defaults['_' + name] = default
+            lines.append('    self.{0} = _{0}'.format(name))
+        elif default is None or default is Parameter.empty:
+            lines.append('    self.{0} = {0}'.format(name))
+        else:
+            defaults['_' + name] = default
+            lines.append('    self.{0} = {0} if {0} is not None else _{0}'.format(name))
+    lines.append('    return self')
+    factory = ['def make(new, {0}):'.format(', '.join(defaults)) if defaults else 'def make(new):']
+    factory.extend('    ' + line for line in lines)
+    factory.append('    return from_dict')
+    scope = {}
+    exec(compile('\n'.join(factory), '<{0} decoder>'.format(model.__name__), 'exec'), namespace, scope)
+    decoder = scope['make'](object.__new__, **defaults)
+    _wrap(decoder, original)
+    return decoder
@@ -0,0 +1,160 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generated `to_dict()` and `__eq__()` methods for the models.
+
+The generated `to_dict()` of a model checks every property with `hasattr()`
+before reading it again. The `to_dict()` that this module generates for a model
+reads every property once, and converts lists and dicts of nested models with
+comprehensions.
+
+The `__eq__()` that this module generates compares the properties of two
+models one by one, stopping at the first difference, and is used for the
+models that keep their properties in `__slots__`, such as the compact models.
+The models that keep their properties in a `__dict__` keep comparing their
+`__dict__`, which is faster than comparing the properties one by one.
+
+Like the decoders of the decoders module, the methods are generated from the
+properties of the model in `MODEL_FIELDS` the first time that they are called,
+and models that are not in the table keep their methods.
+"""
+
+from typing import Callable, Iterable, List, Mapping, Optional, Tuple
+import logging
+
+from .decoders import ModelField, _wrap
+
+logger = logging.getLogger(__name__)
+
+# Placeholder for an unset property when comparing models.
+_UNSET = object()
+
+# The expressions that the generated methods convert a property with, by the kind of the property.
+_CONVERSIONS = {
+    'value': 'value',
+    'model': 'value if isinstance(value, dict) else value.to_dict()',
+    'list': '[v if isinstance(v, dict) else v.to_dict() for v in value]',
+    'dict': '{k: v if isinstance(v, dict) else v.to_dict() for k, v in value.items()}',
+}
+
+
+def install_encoders(models: Iterable[type], fields: Mapping[str, Tuple[ModelField, ...]], *, eq: bool = False) -> None:
+    """
+    Replaces the `to_dict()` of the models with one that generates a faster one
+    on its first call.
+    :param Iterable[type] models: The model classes.
+    :param Mapping fields: The properties of the models by model name, such
+           as `MODEL_FIELDS`. Models without properties keep their methods.
+    :param bool eq: (optional) Whether to replace the `__eq__()` of the models
+           as well, with one that compares their properties one by one. Two
+           models are then equal when they are of the same class and their
+           properties are equal.
+    """
+    for model in models:
+        to_dict = vars(model).get('to_dict')
+        model_fields = fields.get(model.__name__)
+        if to_dict is None or model_fields is None:
+            continue
+        model_fields = tuple(model_fields)
+        model.to_dict = _lazy_method(model, 'to_dict', to_dict, _generate_to_dict, model_fields)
+        if eq and '__eq__' in vars(model):
+            model.__eq__ = _lazy_method(model, '__eq__', vars(model)['__eq__'], _generate_eq, model_fields)
+
+
+def _lazy_method(
+    model: type, name: str, original: Callable, generate: Callable, fields: Tuple[ModelField, ...]
+) -> Callable:
+    # The method is kept for callers that hold on to this function, such as a bound method.
+    generated = []
+
+    def method(self, other=_UNSET):
+        if not generated:
+            try:
+                generated.append(generate(model, original, fields) or original)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.debug('No %s generated for %s', name, model.__name__, exc_info=True)
+                generated.append(original)
+            setattr(model, name, generated[0])
+        return generated[0](self) if other is _UNSET else generated[0](self, other)
+
+    _wrap(method, original)
+    return method
+
+
+def _generate_to_dict(model: type, original: Callable, fields: Tuple[ModelField, ...]) -> Optional[Callable]:
+    # Returns a to_dict() for `model`.
+    lines = ['def to_dict(self):', '    _dict = {}']
+    for field in fields:
+        name = field.name
+        kind = field.to_dict_kind or field.kind
+        lines.extend(
+            [
+                '    try:',
+                '        value = self.{0}'.format(name),
+                '    except AttributeError:',
+                '        value = None',
+                '    if value is not None:',
+                '        _dict[{0!r}] = {1}'.format(name, _CONVERSIONS[kind]),
+            ]
+        )
+    lines.append('    return _dict')
+    return _compile(model, 'to_dict', original, lines)
+
+
+def _generate_eq(model: type, original: Callable, fields: Tuple[ModelField, ...]) -> Optional[Callable]:
+    # Returns an __eq__() for `model`.
+    names = [field.name for field in fields]
+    lines = [
+        'def __eq__(self, other):',
+        '    if self is other:',
+        '        return True',
+        '    if not isinstance(other, self.__class__):',
+        '        return False',
+    ]
+    if names:
+        comparisons = ['((a := self.{0}) is (b := other.{0}) or a == b)'.format(name) for name in names]
+        lines.extend(
+            [
+                '    try:',
+                '        return {0}'.format(' and '.join(comparisons)),
+                '    except AttributeError:',
+                '        return _eq_unset(self, other, {0!r})'.format(tuple(names)),
+            ]
+        )
+    else:
+        lines.append('    return True')
+    return _compile(model, '__eq__', original, lines)
+
+
+def _eq_unset(self, other, names: tuple) -> bool:
+    # Compares models of which some properties are unset.
+    for name in names:
+        a = getattr(self, name, _UNSET)
+        b = getattr(other, name, _UNSET)
+        if not (a is b or a == b):
+            return False
+    return True
+
+
+def _compile(model: type, name: str, original: Callable, lines: List[str]) -> Callable:
+    scope = {}
+    source = '\n'.join(lines)
+    exec(compile(source, '<{0} {1}>'.format(model.__name__, name), 'exec'), {'_eq_unset': _eq_unset}, scope)
+    method = scope[name]
+    _wrap(method, original)
+    method.__annotations__ = original.__annotations__
+    return method
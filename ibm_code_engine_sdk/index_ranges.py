@@ -0,0 +1,244 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compact sets of array job indices, such as `0-3,7,9-9999`.
+"""
+
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+class IndexRangeSet:
+    """
+    IndexRangeSet is an immutable set of non-negative array indices, stored as
+    sorted, disjoint intervals rather than as individual indices.
+
+    It is created from an index list as used by the `*_indices` properties of
+    JobRunStatus and by `scale_array_spec`: a comma-separated list of single
+    indices and hyphen-separated ranges, such as `0-3,7,9-9999`. The list is
+    only parsed when the set is first used. Membership tests take logarithmic
+    time, and counting, union, intersection and difference take time linear in
+    the number of intervals, regardless of how many indices they span.
+    """
+
+    __slots__ = ('_spec', '_starts', '_ends', '_count')
+
+    def __init__(self, spec: Optional[str] = None) -> None:
+        """
+        Initialize an IndexRangeSet object.
+        :param str spec: (optional) The index list, such as `0-3,7,9-9999`.
+               Omitting it creates an empty set.
+        """
+        self._spec = spec or ''
+        self._starts = None
+        self._ends = None
+        self._count = None
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Tuple[int, int]]) -> 'IndexRangeSet':
+        """
+        Creates a set from (first, last) intervals of indices, which may
+        overlap and be in any order.
+        """
+        index_set = cls()
+        index_set._set_intervals(_merge(sorted(intervals)))
+        return index_set
+
+    @classmethod
+    def from_indices(cls, indices: Iterable[int]) -> 'IndexRangeSet':
+        """
+        Creates a set from individual indices.
+        """
+        return cls.from_intervals((index, index) for index in indices)
+
+    def _set_intervals(self, intervals: List[Tuple[int, int]]) -> None:
+        # _starts is set last, since a set shared by get_index_set() may be read while another thread parses it.
+        self._ends = array('q', [end for _, end in intervals])
+        self._starts = array('q', [start for start, _ in intervals])
+
+    def _parse(self) -> None:
+        intervals = []
+        for part in self._spec.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            first, separator, last = part.partition('-')
+            try:
+                start = int(first)
+                end = int(last) if separator else start
+            except ValueError:
+                raise ValueError('Invalid index list: {0!r}'.format(self._spec)) from None
+            intervals.append((start, end))
+        self._set_intervals(_merge(sorted(intervals)))
+
+    @property
+    def intervals(self) -> List[Tuple[int, int]]:
+        """The sorted, disjoint (first, last) intervals of the set."""
+        if self._starts is None:
+            self._parse()
+        return list(zip(self._starts, self._ends))
+
+    def __contains__(self, index: int) -> bool:
+        if self._starts is None:
+            self._parse()
+        position = bisect_right(self._starts, index) - 1
+        return position >= 0 and index <= self._ends[position]
+
+    def __len__(self) -> int:
+        if self._count is None:
+            if self._starts is None:
+                self._parse()
+            self._count = sum(self._ends) - sum(self._starts) + len(self._starts)
+        return self._count
+
+    def __bool__(self) -> bool:
+        if self._starts is None:
+            self._parse()
+        return len(self._starts) > 0
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in self.intervals:
+            yield from range(start, end + 1)
+
+    def union(self, other: 'IndexRangeSet') -> 'IndexRangeSet':
+        """
+        Returns the indices that are in either set.
+        """
+        return IndexRangeSet.from_intervals(self.intervals + other.intervals)
+
+    def intersection(self, other: 'IndexRangeSet') -> 'IndexRangeSet':
+        """
+        Returns the indices that are in both sets.
+        """
+        intervals = []
+        theirs = other.intervals
+        position = 0
+        for start, end in self.intervals:
+            while position < len(theirs) and theirs[position][1] < start:
+                position += 1
+            other_position = position
+            while other_position < len(theirs) and theirs[other_position][0] <= end:
+                other_start, other_end = theirs[other_position]
+                intervals.append((max(start, other_start), min(end, other_end)))
+                other_position += 1
+        index_set = IndexRangeSet()
+        index_set._set_intervals(intervals)
+        return index_set
+
+    def difference(self, other: 'IndexRangeSet') -> 'IndexRangeSet':
+        """
+        Returns the indices of this set that are not in `other`.
+        """
+        intervals = []
+        theirs = other.intervals
+        position = 0
+        for start, end in self.intervals:
+            while position < len(theirs) and theirs[position][1] < start:
+                position += 1
+            other_position = position
+            while other_position < len(theirs) and theirs[other_position][0] <= end:
+                other_start, other_end = theirs[other_position]
+                if other_start > start:
+                    intervals.append((start, other_start - 1))
+                start = other_end + 1
+                if start > end:
+                    break
+                other_position += 1
+            if start <= end:
+                intervals.append((start, end))
+        index_set = IndexRangeSet()
+        index_set._set_intervals(intervals)
+        return index_set
+
+    def chunks(self, size: int) -> List['IndexRangeSet']:
+        """
+        Splits the set, in ascending order, into sets of at most `size`
+        indices each.
+        """
+        if size < 1:
+            raise ValueError('size must be at least 1')
+        chunks = []
+        intervals = []
+        count = 0
+        for start, end in self.intervals:
+            while start <= end:
+                last = min(end, start + size - count - 1)
+                intervals.append((start, last))
+                count += last - start + 1
+                start = last + 1
+                if count == size:
+                    chunks.append(IndexRangeSet.from_intervals(intervals))
+                    intervals = []
+                    count = 0
+        if intervals:
+            chunks.append(IndexRangeSet.from_intervals(intervals))
+        return chunks
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def to_array_spec(self) -> str:
+        """
+        Returns the canonical index list of the set, such as `0-3,7,9-9999`,
+        which can be passed as `scale_array_spec` to `create_job_run()`, e.g.
+        to rerun only the failed indices of a job run.
+        """
+        return ','.join(str(start) if start == end else '{0}-{1}'.format(start, end) for start, end in self.intervals)
+
+    def __str__(self) -> str:
+        return self.to_array_spec()
+
+    def __repr__(self) -> str:
+        return 'IndexRangeSet({0!r})'.format(self.to_array_spec())
+
+    def __eq__(self, other: 'IndexRangeSet') -> bool:
+        if not isinstance(other, IndexRangeSet):
+            return NotImplemented
+        return self.intervals == other.intervals
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.intervals))
+
+
+@lru_cache(maxsize=256)
+def get_index_set(spec: Optional[str]) -> IndexRangeSet:
+    """
+    Returns the set of an index list, such as the `*_indices` properties of
+    JobRunStatus. Pollers read the same index lists over and over again, so the
+    sets of the recent index lists are kept and parsed only once.
+
+    :param str spec: The index list, or None for an empty set.
+    :rtype: IndexRangeSet
+    """
+    return IndexRangeSet(spec)
+
+
+def _merge(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    # Merges sorted intervals that overlap or are adjacent.
+    merged = []
+    for start, end in intervals:
+        if start < 0 or end < start:
+            raise ValueError('Invalid index range: {0}-{1}'.format(start, end))
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
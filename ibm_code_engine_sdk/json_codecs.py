@@ -0,0 +1,115 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+JSON codecs that encode the request bodies and decode the response bodies of
+the Code Engine V2 service.
+
+The default codec uses the json module of the standard library, like the core
+of the SDK. A client uses the codec that is passed to its `set_json_codec()`
+method, which can be any object with the `dumps()` and `loads()` methods of
+JSONCodec, such as an OrjsonJSONCodec, which requires the `orjson` extra:
+
+    pip install "ibm-code-engine-sdk[orjson]"
+
+    service.set_json_codec(OrjsonJSONCodec())
+"""
+
+from typing import Any, Union
+import json
+
+
+class JSONCodec:
+    """
+    JSONCodec is the base class of the JSON codecs.
+    """
+
+    def dumps(self, obj: Any) -> Union[str, bytes]:
+        """
+        Encodes a request body.
+        :param obj: The request body, such as a dict.
+        :return: The JSON document, as a str or as UTF-8 encoded bytes.
+        """
+        raise NotImplementedError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decodes a response body.
+        :param data: The JSON document.
+        :return: The decoded document.
+        :raises ValueError: The document is not valid JSON.
+        """
+        raise NotImplementedError
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    StdlibJSONCodec uses the json module of the standard library, like the
+    core of the SDK does. Control characters are allowed inside strings.
+    """
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data, strict=False)
+
+
+class OrjsonJSONCodec(JSONCodec):
+    """
+    OrjsonJSONCodec uses orjson, which encodes and decodes large documents,
+    such as config maps and secrets with large values, several times faster
+    than the standard library.
+
+    Documents that orjson does not support are handled by the standard
+    library, such as integers that do not fit in 64 bits, NaN, or control
+    characters inside strings.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an OrjsonJSONCodec object.
+        :raises ImportError: orjson is not installed.
+        """
+        try:
+            import orjson  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise ImportError(
+                'OrjsonJSONCodec requires the orjson package. '
+                'Install it with: pip install "ibm-code-engine-sdk[orjson]"'
+            ) from None
+        self._orjson = orjson
+        self._fallback = StdlibJSONCodec()
+
+    def dumps(self, obj: Any) -> Union[str, bytes]:
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except ValueError:
+            return self._fallback.loads(data)
+
+
+def get_default_codec() -> JSONCodec:
+    """
+    Returns the default codec, a StdlibJSONCodec. Other codecs, such as an
+    OrjsonJSONCodec, are set on a client with `set_json_codec()`.
+    """
+    return StdlibJSONCodec()
@@ -0,0 +1,178 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lazy views of the models of the Code Engine V2 service.
+
+A lazy view wraps the dict of a resource, such as an element of the
+`job_runs` of a list_job_runs() result, and only converts a property to
+models when it is first read, such as `status_details`,
+`computed_env_variables` or `run_volume_mounts`. Listings that read only a few
+properties of every resource, such as `name` and `status`, skip the conversion
+of the others:
+
+    from ibm_code_engine_sdk.lazy_models import lazy_view, lazy_views
+
+    job_runs = lazy_view(JobRunList, response.get_result()).job_runs
+    failed = [job_run.name for job_run in lazy_views(JobRun, pager) if job_run.status == 'failed']
+
+A view is an instance of a subclass of its model, so it has the same
+properties and methods and is equal to the model of the same dict. Nested
+models are views as well, and converted properties are cached in the view.
+Properties can be assigned as usual, which does not change the wrapped dict.
+Unlike `from_dict()`, a view does not check that the required properties of
+its model are present.
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, Optional
+import threading
+
+from . import code_engine_v2
+from .decoders import get_fields
+
+# Placeholder for a property that is not cached in a view.
+_UNSET = object()
+
+_view_classes: Dict[type, type] = {}
+_lock = threading.Lock()
+
+
+class LazyModel:
+    """
+    LazyModel is the base class of the lazy views of the models.
+    """
+
+    __slots__ = ('_lazy_dict',)
+
+    _model: type = None
+    _fields: tuple = ()
+
+    def __eq__(self, other) -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self._model):
+            return False
+        return all(getattr(self, name) == getattr(other, name, None) for name in self._fields)
+
+    def __ne__(self, other) -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    def __reduce__(self):
+        return lazy_view, (self._model, self._lazy_dict), self.__dict__ or None
+
+
+class _LazyProperty:
+    # A property of a view that is read from the wrapped dict until it is assigned or converted.
+
+    __slots__ = ('_name', '_convert')
+
+    def __init__(self, name: str, convert: Optional[Callable]) -> None:
+        self._name = name
+        self._convert = convert
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        cached = instance.__dict__
+        value = cached.get(self._name, _UNSET)
+        if value is not _UNSET:
+            return value
+        value = instance._lazy_dict.get(self._name)
+        if self._convert is not None and value is not None:
+            value = self._convert(value)
+            cached[self._name] = value
+        return value
+
+    def __set__(self, instance, value) -> None:
+        instance.__dict__[self._name] = value
+
+    def __delete__(self, instance) -> None:
+        instance.__dict__[self._name] = None
+
+
+def lazy_view(model: type, _dict: dict):
+    """
+    Returns a lazy view of a dict as a model.
+    :param type model: The model class, such as JobRunList or App.
+    :param dict _dict: The dict of the model, such as the result of a response.
+    :return: An instance of a subclass of `model` that converts the properties
+             of `_dict` when they are first read, or the result of
+             `model.from_dict()` for models that have no view, such as the
+             models with additional properties.
+    """
+    view_class = get_view_class(model)
+    if view_class is None:
+        return model.from_dict(_dict)
+    view = object.__new__(view_class)
+    view._lazy_dict = _dict
+    return view
+
+
+def lazy_views(model: type, dicts: Iterable[dict]) -> Iterator:
+    """
+    Returns lazy views of dicts as models, such as the resources of a pager.
+    :param type model: The model class, such as JobRun.
+    :param Iterable[dict] dicts: The dicts of the models.
+    :return: An iterator of lazy views, see `lazy_view()`.
+    """
+    for _dict in dicts:
+        yield lazy_view(model, _dict)
+
+
+def get_view_class(model: type) -> Optional[type]:
+    """
+    Returns the class of the lazy views of a model.
+    :param type model: The model class.
+    :return: The subclass of `model` and LazyModel, or None if the model has no
+             view.
+    :rtype: type
+    """
+    view_class = _view_classes.get(model, _UNSET)
+    if view_class is _UNSET:
+        with _lock:
+            view_class = _view_classes.get(model, _UNSET)
+            if view_class is _UNSET:
+                view_class = _view_classes[model] = _build_view_class(model)
+    return view_class
+
+
+def _build_view_class(model: type) -> Optional[type]:
+    fields = get_fields(model)
+    if fields is None:
+        return None
+    namespace = {
+        '__module__': __name__,
+        '__qualname__': model.__qualname__,
+        '__doc__': model.__doc__,
+        '__slots__': (),
+        '_model': model,
+        '_fields': tuple(field.name for field in fields),
+    }
+    for field in fields:
+        convert = None
+        if field.kind != 'value':
+            convert = _get_converter(field.kind, getattr(code_engine_v2, field.model))
+        namespace[field.name] = _LazyProperty(field.name, convert)
+    return type(model.__name__, (LazyModel, model), namespace)
+
+
+def _get_converter(kind: str, nested: type) -> Callable:
+    # Nested models are converted to views as well, when their class is first needed.
+    if kind == 'model':
+        return lambda value: lazy_view(nested, value)
+    if kind == 'list':
+        return lambda value: [lazy_view(nested, item) for item in value]
+    return lambda value: {key: lazy_view(nested, item) for key, item in value.items()}
@@ -0,0 +1,524 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-operation metrics of the Code Engine V2 clients.
+
+A client with a metrics sink reports every call of an operation to the sink:
+its duration, the status code of the response, the number of retries and the
+sizes of the request and response bodies. MetricsCollector aggregates the
+calls in memory, and PrometheusMetricsSink and OpenTelemetryMetricsSink
+forward them to the optional `prometheus-client` and `opentelemetry-api`
+packages:
+
+    collector = MetricsCollector()
+    service.set_metrics_sink(collector)
+    ...
+    print(collector.report())
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import bisect
+import logging
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+from .version import __version__
+
+logger = logging.getLogger(__name__)
+
+# The upper bounds of the buckets of the latency histograms, in seconds.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# The upper bounds of the buckets of the body size histograms, in bytes.
+DEFAULT_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class OperationMetrics(NamedTuple):
+    """
+    The metrics of one call of an operation.
+
+    :param str operation_id: The operation, such as `list_apps`.
+    :param str method: The HTTP method of the request.
+    :param int status_code: The status code of the last response, or None when
+          no response was received, such as on a connection error. A read that
+          is revalidated by the resource cache reports 304.
+    :param float duration: The time of the call, in seconds, including the
+          retries and the decoding of the response.
+    :param int retries: The number of times that the request was retried.
+    :param int request_size: The size of the request body, in bytes.
+    :param int response_size: The size of the last response body, in bytes.
+    :param bool cancelled: Whether the call was cancelled or interrupted
+          before it completed, such as by an `asyncio` timeout or a
+          KeyboardInterrupt.
+    """
+
+    operation_id: str
+    method: str
+    status_code: Optional[int]
+    duration: float
+    retries: int
+    request_size: int
+    response_size: int
+    cancelled: bool = False
+
+
+class MetricsSink:
+    """
+    MetricsSink receives the metrics of the calls of a client. Subclasses
+    implement record(), which is called once per call, from the thread or the
+    task that made the call, and must be thread-safe.
+    """
+
+    def record(self, metrics: OperationMetrics) -> None:
+        """
+        Record the metrics of a call.
+
+        :param OperationMetrics metrics: The metrics of the call.
+        """
+        raise NotImplementedError
+
+    def record_concurrency_limit(self, limit: int, previous_limit: int) -> None:
+        """
+        Record a change of the limit of an AdaptiveConcurrencyLimiter, starting
+        from 0 when the limiter is created. The sinks report the sum of the
+        limits of the limiters that use them. Does nothing by default.
+
+        :param int limit: The new limit.
+        :param int previous_limit: The previous limit.
+        """
+
+
+class OperationMeasurement:
+    """
+    OperationMeasurement measures one call of an operation, and reports it to
+    a sink when the call ends. The clients create one per call.
+    """
+
+    __slots__ = ('operation_id', 'method', 'request_size', 'status_code', 'retries', 'response_size', '_start')
+
+    def __init__(self, operation_id: Optional[str], request: dict) -> None:
+        """
+        Initialize an OperationMeasurement object and start measuring.
+
+        :param str operation_id: The operation, or None when the request was not
+               sent by an operation.
+        :param dict request: The request prepared by `prepare_request()`.
+        """
+        self.operation_id = operation_id or 'unknown'
+        self.method = request['method']
+        self.request_size = _get_size(request.get('data'))
+        self.status_code = None
+        self.retries = 0
+        self.response_size = 0
+        self._start = time.perf_counter()
+
+    def add_hook(self, kwargs: dict) -> dict:
+        """
+        Returns the keyword arguments of a `requests` call with a response
+        hook that records the last response of the call.
+        """
+        hooks = dict(kwargs.get('hooks') or {})
+        response_hooks = hooks.get('response') or []
+        hooks['response'] = [response_hooks] if callable(response_hooks) else list(response_hooks)
+        hooks['response'].append(self._on_requests_response)
+        return dict(kwargs, hooks=hooks)
+
+    def _on_requests_response(self, response, **kwargs) -> None:
+        # pylint: disable=unused-argument
+        retries = getattr(response.raw, 'retries', None)
+        self.on_response(response, len(retries.history) if retries is not None else 0)
+
+    def on_response(self, response, retries: int) -> None:
+        """
+        Record the last response of the call.
+
+        :param response: The `requests.Response` or `httpx.Response`.
+        :param int retries: The number of times that the request was retried.
+        """
+        self.status_code = response.status_code
+        self.retries = retries
+        content_length = response.headers.get('Content-Length')
+        self.response_size = int(content_length) if content_length is not None else len(response.content)
+
+    def finish(
+        self,
+        sink: Optional[MetricsSink],
+        *,
+        response: Optional[DetailedResponse] = None,
+        exception: Optional[BaseException] = None,
+    ) -> OperationMetrics:
+        """
+        Stop measuring and report the call to a sink. Errors of the sink are
+        logged and do not fail the call.
+
+        :param MetricsSink sink: The sink, or None to only return the metrics.
+        :param DetailedResponse response: (optional) The response of the call.
+        :param BaseException exception: (optional) The exception that the call raised.
+        :return: The metrics of the call.
+        :rtype: OperationMetrics
+        """
+        duration = time.perf_counter() - self._start
+        status_code = self.status_code
+        if status_code is None:
+            if response is not None:
+                status_code = response.get_status_code()
+            elif isinstance(exception, ApiException):
+                status_code = exception.status_code
+        metrics = OperationMetrics(
+            self.operation_id,
+            self.method,
+            status_code,
+            duration,
+            self.retries,
+            self.request_size,
+            self.response_size,
+            # A cancelled or interrupted call raises a BaseException which is not an Exception.
+            exception is not None and not isinstance(exception, Exception),
+        )
+        if sink is not None:
+            try:
+                sink.record(metrics)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception('The metrics sink failed to record a call of %s', self.operation_id)
+        return metrics
+
+
+def _get_size(data: object) -> int:
+    if data is None:
+        return 0
+    if isinstance(data, str):
+        return len(data.encode('utf-8'))
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    return 0
+
+
+class OperationStats:
+    """
+    The aggregated metrics of the calls of one operation.
+
+    :attr int count: The number of calls.
+    :attr int errors: The number of calls that failed, with a status code of
+          400 or above or without a response.
+    :attr int cancelled: The number of calls that were cancelled or
+          interrupted, which are also counted as errors.
+    :attr Counter status_codes: The number of calls by status code.
+    :attr int retries: The number of retries of all calls.
+    :attr float total_duration: The time of all calls, in seconds.
+    :attr float max_duration: The time of the slowest call, in seconds.
+    :attr List[int] latency_buckets: The number of calls by latency bucket: one
+          count per upper bound of the buckets of the collector, and one for the
+          calls above the last bound.
+    :attr int request_bytes: The size of all request bodies, in bytes.
+    :attr int response_bytes: The size of all response bodies, in bytes.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.count = 0
+        self.errors = 0
+        self.cancelled = 0
+        self.status_codes = Counter()
+        self.retries = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.latency_buckets = [0] * (len(buckets) + 1)
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    @property
+    def mean_duration(self) -> float:
+        """The mean time of a call, in seconds."""
+        return self.total_duration / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns an estimate of a quantile of the latency, such as 0.95, in
+        seconds: the upper bound of the bucket that contains it.
+        """
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.latency_buckets):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.max_duration
+
+    def _add(self, metrics: OperationMetrics) -> None:
+        self.count += 1
+        if metrics.status_code is None or metrics.status_code >= 400:
+            self.errors += 1
+        if metrics.cancelled:
+            self.cancelled += 1
+        self.status_codes[metrics.status_code] += 1
+        self.retries += metrics.retries
+        self.total_duration += metrics.duration
+        self.max_duration = max(self.max_duration, metrics.duration)
+        self.latency_buckets[bisect.bisect_left(self.buckets, metrics.duration)] += 1
+        self.request_bytes += metrics.request_size
+        self.response_bytes += metrics.response_size
+
+
+class MetricsCollector(MetricsSink):
+    """
+    MetricsCollector aggregates the metrics of the calls in memory, by
+    operation, to find the operations that take most of the time of a program.
+
+    :param int concurrency_limit: The sum of the limits of the
+          AdaptiveConcurrencyLimiters that report to the collector.
+    """
+
+    def __init__(self, *, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """
+        Initialize a MetricsCollector object.
+
+        :param Iterable[float] buckets: (optional) The upper bounds of the
+               buckets of the latency histograms, in seconds.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._stats: Dict[str, OperationStats] = {}
+        self.concurrency_limit = 0
+
+    def record(self, metrics: OperationMetrics) -> None:
+        with self._lock:
+            stats = self._stats.get(metrics.operation_id)
+            if stats is None:
+                stats = self._stats[metrics.operation_id] = OperationStats(self.buckets)
+            stats._add(metrics)  # pylint: disable=protected-access
+
+    def record_concurrency_limit(self, limit: int, previous_limit: int) -> None:
+        with self._lock:
+            self.concurrency_limit += limit - previous_limit
+
+    def get_stats(self) -> Dict[str, OperationStats]:
+        """
+        Returns the aggregated metrics by operation, from the operation with
+        the largest total time to the one with the smallest.
+        """
+        with self._lock:
+            operations = sorted(self._stats.items(), key=lambda item: item[1].total_duration, reverse=True)
+        return dict(operations)
+
+    def reset(self) -> None:
+        """
+        Discard the aggregated metrics.
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def report(self) -> str:
+        """
+        Returns a table of the aggregated metrics by operation, from the
+        operation with the largest total time to the one with the smallest.
+        """
+        lines: List[str] = [
+            '{0:40} {1:>7} {2:>7} {3:>7} {4:>10} {5:>10} {6:>10} {7:>12}'.format(
+                'operation', 'calls', 'errors', 'retries', 'total', 'mean', 'p95', 'bytes in'
+            )
+        ]
+        for operation_id, stats in self.get_stats().items():
+            lines.append(
+                '{0:40} {1:7} {2:7} {3:7} {4:8.3f} s {5:7.1f} ms {6:7.1f} ms {7:12}'.format(
+                    operation_id,
+                    stats.count,
+                    stats.errors,
+                    stats.retries,
+                    stats.total_duration,
+                    stats.mean_duration * 1e3,
+                    stats.quantile(0.95) * 1e3,
+                    stats.response_bytes,
+                )
+            )
+        return '\n'.join(lines)
+
+
+class PrometheusMetricsSink(MetricsSink):
+    """
+    PrometheusMetricsSink exports the metrics of the calls with the
+    `prometheus-client` package, labeled by operation:
+
+    - `{namespace}_client_requests_total`, also labeled by method and status
+      code, which is `cancelled` for the calls that were cancelled or
+      interrupted and `none` for the other calls without a response
+    - `{namespace}_client_request_duration_seconds`, a histogram
+    - `{namespace}_client_retries_total`
+    - `{namespace}_client_request_size_bytes` and
+      `{namespace}_client_response_size_bytes`, histograms
+    - `{namespace}_client_concurrency_limit`, a gauge of the limit of the
+      AdaptiveConcurrencyLimiters that use the sink
+
+    The metrics can only be registered once per registry, so several clients
+    should share one sink.
+    """
+
+    def __init__(
+        self,
+        *,
+        registry: Optional['prometheus_client.CollectorRegistry'] = None,
+        namespace: str = 'code_engine',
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """
+        Initialize a PrometheusMetricsSink object and register its metrics.
+
+        :param CollectorRegistry registry: (optional) The registry of the
+               metrics. Defaults to the default registry of prometheus-client.
+        :param str namespace: (optional) The prefix of the names of the metrics.
+        :param Iterable[float] buckets: (optional) The upper bounds of the
+               buckets of the latency histogram, in seconds.
+        :raises ImportError: prometheus-client is not installed.
+        """
+        try:
+            import prometheus_client  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise ImportError(
+                'PrometheusMetricsSink requires the prometheus-client package. '
+                'Install it with: pip install "ibm-code-engine-sdk[prometheus]"'
+            ) from None
+        options = {'namespace': namespace, 'subsystem': 'client'}
+        if registry is not None:
+            options['registry'] = registry
+        self.requests = prometheus_client.Counter(
+            'requests', 'Requests sent by operation.', ['operation', 'method', 'status_code'], **options
+        )
+        self.duration = prometheus_client.Histogram(
+            'request_duration_seconds',
+            'Duration of the calls of operations.',
+            ['operation'],
+            buckets=buckets,
+            **options,
+        )
+        self.retries = prometheus_client.Counter(
+            'retries', 'Retries of requests by operation.', ['operation'], **options
+        )
+        self.request_size = prometheus_client.Histogram(
+            'request_size_bytes',
+            'Size of the request bodies by operation.',
+            ['operation'],
+            buckets=DEFAULT_SIZE_BUCKETS,
+            **options,
+        )
+        self.response_size = prometheus_client.Histogram(
+            'response_size_bytes',
+            'Size of the response bodies by operation.',
+            ['operation'],
+            buckets=DEFAULT_SIZE_BUCKETS,
+            **options,
+        )
+        self.concurrency_limit = prometheus_client.Gauge(
+            'concurrency_limit', 'Limit of the concurrent calls of the bulk operations.', **options
+        )
+
+    def record(self, metrics: OperationMetrics) -> None:
+        operation_id = metrics.operation_id
+        if metrics.cancelled:
+            status_code = 'cancelled'
+        else:
+            status_code = str(metrics.status_code) if metrics.status_code is not None else 'none'
+        self.requests.labels(operation_id, metrics.method, status_code).inc()
+        self.duration.labels(operation_id).observe(metrics.duration)
+        if metrics.retries:
+            self.retries.labels(operation_id).inc(metrics.retries)
+        self.request_size.labels(operation_id).observe(metrics.request_size)
+        self.response_size.labels(operation_id).observe(metrics.response_size)
+
+    def record_concurrency_limit(self, limit: int, previous_limit: int) -> None:
+        self.concurrency_limit.inc(limit - previous_limit)
+
+
+class OpenTelemetryMetricsSink(MetricsSink):
+    """
+    OpenTelemetryMetricsSink records the metrics of the calls with the
+    OpenTelemetry metrics API, with the attributes `code_engine.operation`,
+    `http.request.method` and `http.response.status_code`, and `error.type`
+    `cancelled` for the calls that were cancelled or interrupted:
+
+    - `code_engine.client.requests`, a counter
+    - `code_engine.client.request.duration`, a histogram in seconds
+    - `code_engine.client.retries`, a counter
+    - `code_engine.client.request.body.size` and
+      `code_engine.client.response.body.size`, histograms in bytes
+    - `code_engine.client.concurrency.limit`, an up-down counter of the limit
+      of the AdaptiveConcurrencyLimiters that use the sink
+
+    The metrics are exported by the meter provider that the application
+    configures with the OpenTelemetry SDK.
+    """
+
+    def __init__(
+        self,
+        *,
+        meter: Optional['otel_metrics.Meter'] = None,
+        meter_provider: Optional['otel_metrics.MeterProvider'] = None,
+    ) -> None:
+        """
+        Initialize an OpenTelemetryMetricsSink object and create its instruments.
+
+        :param Meter meter: (optional) The meter of the instruments.
+        :param MeterProvider meter_provider: (optional) The provider of the meter,
+               when no meter is given. Defaults to the global meter provider.
+        :raises ImportError: opentelemetry-api is not installed.
+        """
+        try:
+            from opentelemetry import metrics as otel_metrics  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise ImportError(
+                'OpenTelemetryMetricsSink requires the opentelemetry-api package. '
+                'Install it with: pip install "ibm-code-engine-sdk[opentelemetry]"'
+            ) from None
+        if meter is None:
+            meter = otel_metrics.get_meter('ibm_code_engine_sdk', __version__, meter_provider)
+        self.requests = meter.create_counter(
+            'code_engine.client.requests', unit='{request}', description='Requests sent by operation.'
+        )
+        self.duration = meter.create_histogram(
+            'code_engine.client.request.duration', unit='s', description='Duration of the calls of operations.'
+        )
+        self.retries = meter.create_counter(
+            'code_engine.client.retries', unit='{retry}', description='Retries of requests by operation.'
+        )
+        self.request_size = meter.create_histogram(
+            'code_engine.client.request.body.size', unit='By', description='Size of the request bodies by operation.'
+        )
+        self.response_size = meter.create_histogram(
+            'code_engine.client.response.body.size', unit='By', description='Size of the response bodies by operation.'
+        )
+        self.concurrency_limit = meter.create_up_down_counter(
+            'code_engine.client.concurrency.limit',
+            unit='{request}',
+            description='Limit of the concurrent calls of the bulk operations.',
+        )
+
+    def record(self, metrics: OperationMetrics) -> None:
+        attributes = {'code_engine.operation': metrics.operation_id, 'http.request.method': metrics.method}
+        if metrics.status_code is not None:
+            attributes['http.response.status_code'] = metrics.status_code
+        if metrics.cancelled:
+            attributes['error.type'] = 'cancelled'
+        self.requests.add(1, attributes)
+        self.duration.record(metrics.duration, attributes)
+        if metrics.retries:
+            self.retries.add(metrics.retries, attributes)
+        self.request_size.record(metrics.request_size, attributes)
+        self.response_size.record(metrics.response_size, attributes)
+
+    def record_concurrency_limit(self, limit: int, previous_limit: int) -> None:
+        self.concurrency_limit.add(limit - previous_limit)
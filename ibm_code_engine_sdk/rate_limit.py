@@ -0,0 +1,349 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client-side rate limiting of the requests of the Code Engine V2 clients.
+
+A RateLimiter holds token buckets that refill at a steady rate. Before a
+client sends a request, it takes a token from every bucket whose limit
+applies to the request, and waits until the tokens are available. Requests
+are thereby spread evenly instead of being sent in bursts that the API
+answers with 429 Too Many Requests:
+
+    limiter = get_shared_rate_limiter()
+    limiter.add_limit(10, kinds=['job_runs'], methods=['POST'], per_project=True)
+    limiter.add_limit(50)
+    service.set_rate_limiter(limiter)
+
+A limit applies to the requests of a family of operations, selected by the
+kind of resource in their path, such as `job_runs`, and by their HTTP method.
+It is either shared by all projects of the account, or kept for every project
+on its own. One RateLimiter can be shared by all the clients of a process,
+including threads and asyncio clients.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    TokenBucket allows `rate` tokens per second on average, and bursts of up
+    to `burst` tokens. It is thread-safe.
+
+    Tokens are reserved in the order of the calls: a caller that reserves a
+    token which is not available yet is told how long to wait for it, and
+    later callers wait behind it.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize a TokenBucket object, full.
+
+        :param float rate: The number of tokens added per second.
+        :param float burst: (optional) The capacity of the bucket. Defaults to
+               `rate`, or 1 if the rate is lower.
+        :param Callable clock: (optional) Returns the current time in seconds.
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if burst is None:
+            burst = max(rate, 1.0)
+        if burst < 1:
+            raise ValueError('burst must be at least 1')
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Takes tokens from the bucket.
+
+        :param float tokens: (optional) The number of tokens.
+        :return: The number of seconds to wait before the tokens are available,
+                 or 0 when they are available now.
+        :rtype: float
+        """
+        with self._lock:
+            now = self._clock()
+            available = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens = remaining = available - tokens
+        return -remaining / self.rate if remaining < 0 else 0.0
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens available now, negative when callers wait for tokens."""
+        with self._lock:
+            return min(self.burst, self._tokens + (self._clock() - self._updated) * self.rate)
+
+
+class RateLimit:
+    """
+    A limit of a RateLimiter.
+
+    :param float rate: The number of requests per second.
+    :param float burst: The number of requests that can be sent at once.
+    :param frozenset kinds: The kinds of resource of the limited requests, or
+          None for all requests.
+    :param frozenset methods: The HTTP methods of the limited requests, or None
+          for all methods.
+    :param bool per_project: Whether every project has a bucket of its own.
+    :param int max_buckets: The number of buckets above which the full buckets
+          are dropped.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: Optional[float] = None,
+        kinds: Optional[Iterable[str]] = None,
+        methods: Optional[Iterable[str]] = None,
+        per_project: bool = False,
+        max_buckets: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize a RateLimit object.
+
+        :param float rate: The number of requests per second.
+        :param float burst: (optional) The number of requests that can be sent at
+               once. Defaults to `rate`.
+        :param Iterable[str] kinds: (optional) The kinds of resource of the
+               limited requests, as the collection of their path, such as
+               `job_runs` or `apps`. Requests outside projects have the kind of
+               the first segment of their path, such as `projects`. Defaults to
+               all requests.
+        :param Iterable[str] methods: (optional) The HTTP methods of the limited
+               requests, such as `POST`. Defaults to all methods.
+        :param bool per_project: (optional) Whether every project has a bucket
+               of its own, rather than one bucket for the whole account. The
+               requests outside projects share one bucket.
+        :param int max_buckets: (optional) When a limit per project holds more
+               buckets, the buckets of the projects that are idle long enough
+               to be full again are dropped. A full bucket is the same as a
+               new one, so dropping it does not change the limit.
+        :param Callable clock: (optional) Returns the current time in seconds.
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if burst is None:
+            burst = max(rate, 1.0)
+        if burst < 1:
+            raise ValueError('burst must be at least 1')
+        if max_buckets < 1:
+            raise ValueError('max_buckets must be at least 1')
+        self.rate = rate
+        self.burst = burst
+        self.kinds = frozenset(kinds) if kinds is not None else None
+        self.methods = frozenset(method.upper() for method in methods) if methods is not None else None
+        self.per_project = per_project
+        self.max_buckets = max_buckets
+        self._clock = clock
+        self._buckets: Dict[Optional[str], TokenBucket] = {}
+        # The number of buckets at which the full buckets are dropped next.
+        self._prune_at = max_buckets
+        self._lock = threading.Lock()
+
+    def matches(self, method: str, kind: str) -> bool:
+        """
+        Returns whether the limit applies to the requests with a method and a
+        kind of resource.
+        """
+        return (self.kinds is None or kind in self.kinds) and (self.methods is None or method in self.methods)
+
+    def get_bucket(self, project_id: Optional[str]) -> TokenBucket:
+        """
+        Returns the bucket of a project, or of the whole account when the limit
+        is not per project.
+
+        :param str project_id: The ID of the project of a request, or None.
+        :rtype: TokenBucket
+        """
+        key = project_id if self.per_project else None
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    if len(self._buckets) >= self._prune_at:
+                        self._prune()
+                    bucket = TokenBucket(self.rate, self.burst, clock=self._clock)
+                    self._buckets[key] = bucket
+        return bucket
+
+    def _prune(self) -> None:
+        # Drops the full buckets. When most buckets are in use, pruning again
+        # waits until their number has doubled, so that it stays amortized.
+        self._buckets = {key: bucket for key, bucket in self._buckets.items() if bucket.tokens < self.burst}
+        self._prune_at = max(self.max_buckets, 2 * len(self._buckets))
+
+
+class RateLimiter:
+    """
+    RateLimiter delays the requests of the clients that use it so that they
+    stay under its limits. It is thread-safe, and can be shared by the clients
+    of a process with `set_rate_limiter()`.
+
+    :param float wait_time: The total number of seconds that requests waited.
+    :param int waits: The number of requests that waited.
+    """
+
+    def __init__(
+        self,
+        limits: Iterable[RateLimit] = (),
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize a RateLimiter object.
+
+        :param Iterable[RateLimit] limits: (optional) The limits. More limits can
+               be added with `add_limit()`.
+        :param Callable clock: (optional) Returns the current time in seconds.
+        :param Callable sleep: (optional) Waits for a number of seconds.
+        """
+        self._clock = clock
+        self._sleep = sleep
+        self._limits: Tuple[RateLimit, ...] = tuple(limits)
+        self._matching: Dict[Tuple[str, str], List[RateLimit]] = {}
+        self._lock = threading.Lock()
+        self.wait_time = 0.0
+        self.waits = 0
+
+    @property
+    def limits(self) -> Tuple[RateLimit, ...]:
+        """The limits of the rate limiter."""
+        return self._limits
+
+    def add_limit(
+        self,
+        rate: float,
+        *,
+        burst: Optional[float] = None,
+        kinds: Optional[Iterable[str]] = None,
+        methods: Optional[Iterable[str]] = None,
+        per_project: bool = False,
+    ) -> RateLimit:
+        """
+        Adds a limit. A request waits for the tokens of all the limits that
+        apply to it.
+
+        :param float rate: The number of requests per second.
+        :param float burst: (optional) The number of requests that can be sent at
+               once. Defaults to `rate`.
+        :param Iterable[str] kinds: (optional) The kinds of resource of the
+               limited requests, such as `job_runs`. Defaults to all requests.
+        :param Iterable[str] methods: (optional) The HTTP methods of the limited
+               requests, such as `POST`. Defaults to all methods.
+        :param bool per_project: (optional) Whether every project has a bucket
+               of its own, rather than one bucket for the whole account.
+        :return: The limit.
+        :rtype: RateLimit
+        """
+        limit = RateLimit(rate, burst=burst, kinds=kinds, methods=methods, per_project=per_project, clock=self._clock)
+        with self._lock:
+            self._limits += (limit,)
+            self._matching = {}
+        return limit
+
+    def clear(self) -> None:
+        """
+        Removes all limits.
+        """
+        with self._lock:
+            self._limits = ()
+            self._matching = {}
+
+    def reserve(self, method: str, path: str) -> float:
+        """
+        Takes a token for a request from the buckets of all the limits that
+        apply to it.
+
+        :param str method: The HTTP method of the request.
+        :param str path: The path of the request, relative to the service URL,
+               such as `/projects/{project_id}/job_runs`.
+        :return: The number of seconds to wait before sending the request.
+        :rtype: float
+        """
+        project_id, kind = _parse_path(path)
+        # add_limit() replaces the dict, so that a list computed from the previous limits is not kept.
+        matching_by_key = self._matching
+        matching = matching_by_key.get((method, kind))
+        if matching is None:
+            matching = [limit for limit in self._limits if limit.matches(method, kind)]
+            matching_by_key[(method, kind)] = matching
+        delay = 0.0
+        for limit in matching:
+            delay = max(delay, limit.get_bucket(project_id).reserve())
+        if delay > 0:
+            with self._lock:
+                self.wait_time += delay
+                self.waits += 1
+        return delay
+
+    def acquire(self, method: str, path: str) -> float:
+        """
+        Waits until a request can be sent.
+
+        :param str method: The HTTP method of the request.
+        :param str path: The path of the request, relative to the service URL.
+        :return: The number of seconds waited.
+        :rtype: float
+        """
+        delay = self.reserve(method, path)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+
+def _parse_path(path: str) -> Tuple[Optional[str], str]:
+    # Returns the project ID and the kind of resource of a path, e.g. /projects/{project_id}/apps/{name}.
+    segments = path.split('/', 4)
+    if len(segments) > 2 and segments[1] == 'projects':
+        return segments[2], segments[3] if len(segments) > 3 else 'projects'
+    return None, segments[1] if len(segments) > 1 else ''
+
+
+_shared_rate_limiter = None
+_shared_rate_limiter_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> RateLimiter:
+    """
+    Returns the rate limiter shared by the process, which has no limits until
+    they are added.
+
+    :rtype: RateLimiter
+    """
+    global _shared_rate_limiter  # pylint: disable=global-statement
+    if _shared_rate_limiter is None:
+        with _shared_rate_limiter_lock:
+            if _shared_rate_limiter is None:
+                _shared_rate_limiter = RateLimiter()
+    return _shared_rate_limiter
@@ -0,0 +1,137 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Request templates hold the parts of the requests of an operation that are the
+same for every call: the SDK headers, the media type headers and the URL
+template with its path parameters.
+
+A client builds the template of an operation on the first call of the
+operation, and reuses it for the following calls, so that an operation only
+merges the headers of the call and encodes its path parameters.
+"""
+
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, Optional
+
+import requests
+
+
+@lru_cache(maxsize=1024)
+def encode_path_var(value: str) -> str:
+    """
+    Encodes a path parameter to be substituted into a URL path, like
+    BaseService.encode_path_vars() does. Callers such as pollers pass the same
+    project IDs and names over and over again, so the encoded values are cached.
+
+    :param str value: The path parameter.
+    :return: The encoded path parameter.
+    :rtype: str
+    """
+    return requests.utils.quote(value, safe='')
+
+
+class RequestTemplate:
+    """
+    The parts of the requests of an operation that do not depend on the
+    arguments of a call.
+
+    :attr str operation_id: The ID of the operation, such as 'get_job_run'.
+    :attr str path: The URL template of the operation, such as
+          '/projects/{project_id}/job_runs/{name}'.
+    :attr List[str] path_param_keys: The names of the path parameters, in the
+          order of the URL template.
+    """
+
+    __slots__ = ('operation_id', 'path', 'path_param_keys', '_path_format', '_headers', '_accept')
+
+    def __init__(
+        self,
+        operation_id: str,
+        path: str,
+        sdk_headers: Dict[str, str],
+        *,
+        accept: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a RequestTemplate object.
+
+        :param str operation_id: The ID of the operation.
+        :param str path: The URL template of the operation.
+        :param dict sdk_headers: The headers returned by `get_sdk_headers()`
+               for the operation.
+        :param str accept: (optional) The value of the Accept header, which
+               cannot be overridden by the headers of a call.
+        :param str content_type: (optional) The value of the content-type
+               header, which can be overridden by the headers of a call.
+        """
+        self.operation_id = operation_id
+        self.path = path
+        self.path_param_keys = []
+        path_format = []
+        for literal_text, field_name, _, _ in Formatter().parse(path):
+            path_format.append(literal_text.replace('{', '{{').replace('}', '}}'))
+            if field_name is not None:
+                path_format.append('{%d}' % len(self.path_param_keys))
+                self.path_param_keys.append(field_name)
+        self._path_format = ''.join(path_format)
+        self._headers = dict(sdk_headers)
+        if content_type is not None:
+            self._headers['content-type'] = content_type
+        self._accept = accept
+
+    def get_headers(self, headers: Optional[dict] = None, operation_headers: Optional[dict] = None) -> dict:
+        """
+        Returns the headers of a request.
+
+        :param dict headers: (optional) The headers passed to the operation by
+               the caller, which override the SDK and content-type headers.
+        :param dict operation_headers: (optional) The header parameters of the
+               operation, such as If-Match.
+        :return: The headers of the request.
+        :rtype: dict
+        """
+        if operation_headers:
+            result = dict(operation_headers)
+            result.update(self._headers)
+        else:
+            result = self._headers.copy()
+        if headers:
+            result.update(headers)
+        if self._accept is not None:
+            result['Accept'] = self._accept
+        return result
+
+    def get_url(self, *path_params: str) -> str:
+        """
+        Returns the URL path of a request, with the encoded path parameters.
+
+        :param str path_params: The path parameters, in the order of
+               `path_param_keys`.
+        :return: The URL path of the request.
+        :rtype: str
+        """
+        if len(path_params) != len(self.path_param_keys):
+            raise TypeError(
+                '{0} takes {1} path parameters but {2} were given'.format(
+                    self.operation_id, len(self.path_param_keys), len(path_params)
+                )
+            )
+        if not path_params:
+            return self.path
+        return self._path_format.format(*map(encode_path_var, path_params))
@@ -0,0 +1,182 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+OpenTelemetry tracing of the Code Engine V2 clients.
+
+A client with tracing enabled opens a span for every call of an operation,
+and sends the context of the span to the service in the trace context
+headers of the request. The pagers open a span for every page that they
+retrieve, and the waiters for every wait and every poll, so that the calls
+that they make are grouped under them:
+
+    service.enable_tracing()
+
+Tracing requires the optional `opentelemetry-api` package. The spans are
+exported by the tracer provider that the application configures with the
+OpenTelemetry SDK.
+"""
+
+from contextlib import nullcontext
+from typing import ContextManager, Optional
+from urllib.parse import unquote, urlsplit
+import re
+
+from .metrics import OperationMetrics
+from .version import __version__
+
+# Matches the path of a project and of its resources, e.g. /projects/{project_id}/apps/{name}/revisions
+_PROJECT_PATH = re.compile(r'/projects/([^/]+)((?:/[^/]+)*)$')
+
+# Returned by start_span() while tracing is disabled.
+_NO_SPAN = nullcontext()
+
+
+class CodeEngineTracer:
+    """
+    CodeEngineTracer opens the spans of the calls of a client, of its pagers
+    and of the waiters that use it.
+
+    The span of a call is named after its operation, such as
+    `code_engine.list_apps`, and has the attributes `code_engine.operation_id`,
+    `code_engine.project_id`, `code_engine.resource_name`,
+    `http.request.method`, `url.full`, `http.response.status_code` and
+    `http.request.resend_count`, the number of retries.
+
+    opentelemetry-api is imported when the first tracer is created, so that
+    the clients without tracing do not import it.
+    """
+
+    def __init__(
+        self,
+        tracer: Optional['trace.Tracer'] = None,
+        *,
+        tracer_provider: Optional['trace.TracerProvider'] = None,
+    ) -> None:
+        """
+        Initialize a CodeEngineTracer object.
+
+        :param Tracer tracer: (optional) The OpenTelemetry tracer of the spans.
+        :param TracerProvider tracer_provider: (optional) The provider of the
+               tracer, when no tracer is given. Defaults to the global tracer
+               provider.
+        :raises ImportError: opentelemetry-api is not installed.
+        """
+        try:
+            # pylint: disable=import-outside-toplevel
+            from opentelemetry import context as otel_context, propagate, trace
+        except ImportError:
+            raise ImportError(
+                'Tracing requires the opentelemetry-api package. '
+                'Install it with: pip install "ibm-code-engine-sdk[opentelemetry]"'
+            ) from None
+        if tracer is None:
+            tracer = trace.get_tracer('ibm_code_engine_sdk', __version__, tracer_provider)
+        self.tracer = tracer
+        self.context = otel_context
+        self.propagate = propagate
+        self.trace = trace
+
+    def start_operation(self, operation_id: str, request: dict) -> 'OperationSpan':
+        """
+        Opens the span of a call of an operation, makes it the current span
+        until it ends, and adds its context to the headers of the request.
+
+        :param str operation_id: The operation.
+        :param dict request: The request prepared by `prepare_request()`.
+        :return: The span, which must be ended with `end()`.
+        :rtype: OperationSpan
+        """
+        return OperationSpan(self, operation_id, request)
+
+    def start_span(self, name: str, attributes: Optional[dict] = None) -> ContextManager:
+        """
+        Returns a context manager that opens a span, such as the span of a
+        page of a pager, and makes it the current span within its block. The
+        attributes whose value is None are left out.
+
+        :param str name: The name of the span.
+        :param dict attributes: (optional) The attributes of the span.
+        """
+        if attributes:
+            attributes = {name: value for name, value in attributes.items() if value is not None}
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+
+class OperationSpan:
+    """
+    The span of a call of an operation.
+    """
+
+    __slots__ = ('_tracer', '_span', '_token')
+
+    def __init__(self, tracer: CodeEngineTracer, operation_id: str, request: dict) -> None:
+        parts = urlsplit(request['url'])
+        attributes = {
+            'code_engine.operation_id': operation_id,
+            'http.request.method': request['method'],
+            'url.full': request['url'],
+        }
+        match = _PROJECT_PATH.search(parts.path)
+        if match is not None:
+            attributes['code_engine.project_id'] = unquote(match.group(1))
+            # The segments alternate between collections and names, e.g. apps/{app_name}/revisions/{name}.
+            names = match.group(2).split('/')[2::2]
+            if names:
+                attributes['code_engine.resource_name'] = unquote(names[-1])
+        trace = tracer.trace
+        self._tracer = tracer
+        self._span = tracer.tracer.start_span(
+            'code_engine.' + operation_id, kind=trace.SpanKind.CLIENT, attributes=attributes
+        )
+        self._token = tracer.context.attach(trace.set_span_in_context(self._span))
+        tracer.propagate.inject(request['headers'])
+
+    def end(self, metrics: OperationMetrics, exception: Optional[BaseException] = None) -> None:
+        """
+        Records the outcome of the call and ends the span.
+
+        :param OperationMetrics metrics: The metrics of the call.
+        :param BaseException exception: (optional) The exception that the call raised.
+        """
+        span = self._span
+        trace = self._tracer.trace
+        self._tracer.context.detach(self._token)
+        if metrics.status_code is not None:
+            span.set_attribute('http.response.status_code', metrics.status_code)
+        if metrics.retries:
+            span.set_attribute('http.request.resend_count', metrics.retries)
+        if exception is not None:
+            span.record_exception(exception)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(exception)))
+        elif metrics.status_code is not None and metrics.status_code >= 400:
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+        span.end()
+
+
+def start_span(client: object, name: str, attributes: Optional[dict] = None) -> ContextManager:
+    """
+    Returns a context manager that traces a block as a span of the tracer of a
+    client, or that does nothing while the tracing of the client is disabled.
+
+    :param CodeEngineV2 client: The client.
+    :param str name: The name of the span.
+    :param dict attributes: (optional) The attributes of the span.
+    """
+    tracer = getattr(client, 'tracer', None)
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.start_span(name, attributes)
@@ -0,0 +1,376 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Waiters that poll Code Engine V2 resources until they reach a desired state.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional
+import random
+import time
+
+from .code_engine_v2 import App, AppStatus, CodeEngineV2, JobRun, JobRunsPager, JobRunStatus
+from .tracing import start_span
+
+# The reasons of an app status that no amount of waiting resolves.
+APP_FAILURE_REASONS = frozenset(
+    [
+        AppStatus.ReasonEnum.NO_REVISION_READY.value,
+        AppStatus.ReasonEnum.READY_BUT_LATEST_REVISION_FAILED.value,
+    ]
+)
+
+# The states of a job run in which it has finished.
+JOB_RUN_FINAL_STATES = frozenset([JobRun.StatusEnum.COMPLETED.value, JobRun.StatusEnum.FAILED.value])
+
+
+class WaiterError(Exception):
+    """
+    WaiterError is raised when a resource reaches a state from which it does
+    not recover, such as a failed app.
+
+    :param str message: A description of the error.
+    :param dict resource: (optional) The resource as last retrieved.
+    :param dict revision: (optional) The latest revision of the resource, if
+          the resource has revisions and the revision could be retrieved.
+    """
+
+    def __init__(self, message: str, *, resource: Optional[dict] = None, revision: Optional[dict] = None) -> None:
+        super().__init__(message)
+        self.resource = resource
+        self.revision = revision
+
+
+class WaiterTimeoutError(WaiterError):
+    """
+    WaiterTimeoutError is raised when a resource does not reach the desired
+    state before the deadline of the waiter.
+    """
+
+
+class Backoff:
+    """
+    Backoff computes the delays between the polls of a waiter. The delay starts
+    at `delay` seconds and is multiplied by `multiplier` after every poll, up to
+    `max_delay` seconds. Each delay is reduced by a random fraction of up to
+    `jitter`, so that many waiters started together do not poll in lockstep.
+    """
+
+    def __init__(
+        self,
+        *,
+        delay: float = 1.0,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+    ) -> None:
+        """
+        Initialize a Backoff object.
+        :param float delay: (optional) The delay before the second poll, in
+               seconds.
+        :param float max_delay: (optional) The maximum delay between two polls,
+               in seconds.
+        :param float multiplier: (optional) The factor by which the delay grows
+               after every poll.
+        :param float jitter: (optional) The maximum fraction, between 0 and 1,
+               by which a delay is randomly reduced.
+        """
+        if delay <= 0 or max_delay < delay:
+            raise ValueError('delay must be positive and at most max_delay')
+        if multiplier < 1:
+            raise ValueError('multiplier must be at least 1')
+        if not 0 <= jitter <= 1:
+            raise ValueError('jitter must be between 0 and 1')
+        self.delay = delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def delays(self):
+        """
+        Returns an endless iterator over the delays between consecutive polls.
+        :rtype: Iterator[float]
+        """
+        delay = self.delay
+        while True:
+            yield delay * (1 - self.jitter * random.random())
+            delay = min(delay * self.multiplier, self.max_delay)
+
+
+class AppWaitResult:
+    """
+    The outcome of waiting for an app.
+
+    :param dict app: The app as last retrieved.
+    :param dict revision: (optional) The latest created revision of the app.
+    """
+
+    def __init__(self, app: dict, revision: Optional[dict] = None) -> None:
+        self.app = app
+        self.revision = revision
+
+    @property
+    def status(self) -> Optional[str]:
+        """The status of the app."""
+        return self.app.get('status')
+
+    @property
+    def reason(self) -> Optional[str]:
+        """The reason of the status of the app, if any."""
+        return (self.app.get('status_details') or {}).get('reason')
+
+    @property
+    def revision_status(self) -> Optional[str]:
+        """The status of the latest created revision, if it was retrieved."""
+        return self.revision.get('status') if self.revision is not None else None
+
+
+def wait_until_app_ready(
+    client: CodeEngineV2,
+    project_id: str,
+    name: str,
+    *,
+    timeout: float = 600.0,
+    backoff: Optional[Backoff] = None,
+    fetch_revision: bool = True,
+    fail_on_warning: bool = True,
+    on_poll: Optional[Callable[[dict], None]] = None,
+) -> AppWaitResult:
+    """
+    Wait until an app is ready.
+
+    Polls the app with `get_app()` and an exponential, jittered backoff until
+    its latest created revision is ready. Stops early when the app fails, or
+    when the reason of its status shows that the latest revision cannot become
+    ready, and raises a WaiterError. An app with the `warning` status also
+    stops the wait, unless `fail_on_warning` is False.
+
+    :param CodeEngineV2 client: The client used to poll the app.
+    :param str project_id: The ID of the project.
+    :param str name: The name of your application.
+    :param float timeout: (optional) Number of seconds to wait before a
+           WaiterTimeoutError is raised.
+    :param Backoff backoff: (optional) The delays between the polls. Defaults
+           to `Backoff()`.
+    :param bool fetch_revision: (optional) Whether to retrieve the latest
+           created revision of the app once the wait ends, to report its
+           status.
+    :param bool fail_on_warning: (optional) Whether to raise a WaiterError when
+           the app has the `warning` status, rather than to keep waiting for it
+           to recover until the timeout.
+    :param Callable on_poll: (optional) Called with the app after every poll.
+    :return: The app and its latest created revision.
+    :rtype: AppWaitResult
+    :raises WaiterError: The app failed, or has a warning.
+    :raises WaiterTimeoutError: The app was not ready before the timeout.
+    """
+    if not project_id:
+        raise ValueError('project_id must be provided')
+    if not name:
+        raise ValueError('name must be provided')
+    deadline = time.monotonic() + timeout
+    delays = (backoff or Backoff()).delays()
+    attributes = {'code_engine.project_id': project_id, 'code_engine.resource_name': name}
+    with start_span(client, 'wait_until_app_ready', attributes):
+        while True:
+            with start_span(client, 'wait_until_app_ready.poll', attributes):
+                app = client.get_app(project_id=project_id, name=name).get_result()
+                if on_poll is not None:
+                    on_poll(app)
+            status = app.get('status')
+            status_details = app.get('status_details') or {}
+            reason = status_details.get('reason')
+            latest_created_revision = status_details.get('latest_created_revision')
+            latest_revision_ready = status_details.get('latest_ready_revision') == latest_created_revision
+            if status == App.StatusEnum.FAILED or reason in APP_FAILURE_REASONS:
+                revision = _get_latest_revision(client, project_id, name, status_details, fetch_revision)
+                raise WaiterError(
+                    'App {0} failed: {1}'.format(name, reason or status),
+                    resource=app,
+                    revision=revision,
+                )
+            if status == App.StatusEnum.WARNING and fail_on_warning:
+                revision = _get_latest_revision(client, project_id, name, status_details, fetch_revision)
+                raise WaiterError(
+                    'App {0} has a warning: {1}'.format(name, reason or 'no reason given'),
+                    resource=app,
+                    revision=revision,
+                )
+            if status == App.StatusEnum.READY and latest_revision_ready:
+                revision = _get_latest_revision(client, project_id, name, status_details, fetch_revision)
+                return AppWaitResult(app, revision)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                revision = _get_latest_revision(client, project_id, name, status_details, fetch_revision)
+                raise WaiterTimeoutError(
+                    'App {0} was not ready after {1} seconds'.format(name, timeout),
+                    resource=app,
+                    revision=revision,
+                )
+            time.sleep(min(next(delays), remaining))
+
+
+class JobRunsWaiter:
+    """
+    JobRunsWaiter waits for many job runs of a project at once.
+
+    Rather than retrieving every job run on its own, each poll lists the job
+    runs of the project, optionally filtered by the name of their job, and
+    updates the status of all tracked job runs from that single sweep. Listing
+    stops as soon as every unfinished job run has been seen, so a poll costs a
+    few pages instead of one request per job run.
+
+    :param dict job_runs: The tracked job runs as last listed, by name.
+    :param dict statuses: The JobRunStatus of the tracked job runs, by name.
+    """
+
+    def __init__(
+        self,
+        client: CodeEngineV2,
+        project_id: str,
+        names: Iterable[str] = (),
+        *,
+        job_name: Optional[str] = None,
+        limit: int = 100,
+        on_complete: Optional[Callable[[dict], None]] = None,
+    ) -> None:
+        """
+        Initialize a JobRunsWaiter object.
+        :param CodeEngineV2 client: The client used to list the job runs.
+        :param str project_id: The ID of the project.
+        :param Iterable[str] names: (optional) The names of the job runs to
+               track. More job runs can be tracked with `add()`.
+        :param str job_name: (optional) The name of the job of all tracked job
+               runs, which narrows down the listing.
+        :param int limit: (optional) Maximum number of job runs per page.
+        :param Callable on_complete: (optional) Called with a job run once it has
+               completed or failed.
+        """
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        self._client = client
+        self._project_id = project_id
+        self._job_name = job_name
+        self._limit = limit
+        self._on_complete = on_complete
+        self._pending = set()
+        self._missing = set()
+        self.job_runs: Dict[str, dict] = {}
+        self.statuses: Dict[str, JobRunStatus] = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str) -> None:
+        """
+        Tracks a job run, such as one that was just created.
+        :param str name: The name of the job run.
+        """
+        if name not in self.job_runs or self.job_runs[name].get('status') not in JOB_RUN_FINAL_STATES:
+            self._pending.add(name)
+
+    @property
+    def pending(self) -> frozenset:
+        """The names of the tracked job runs that have not finished yet."""
+        return frozenset(self._pending)
+
+    @property
+    def missing(self) -> frozenset:
+        """The names of the unfinished job runs that the latest poll did not find."""
+        return frozenset(self._missing)
+
+    @property
+    def completed(self) -> Dict[str, dict]:
+        """The tracked job runs that have completed or failed, by name."""
+        return {name: job_run for name, job_run in self.job_runs.items() if name not in self._pending}
+
+    @property
+    def failed(self) -> Dict[str, dict]:
+        """The tracked job runs that have failed, by name."""
+        return {
+            name: job_run
+            for name, job_run in self.completed.items()
+            if job_run.get('status') == JobRun.StatusEnum.FAILED
+        }
+
+    def poll(self) -> List[dict]:
+        """
+        Lists the job runs once and updates the status of the tracked job runs.
+        :return: The job runs that finished since the previous poll.
+        :rtype: List[dict]
+        """
+        attributes = {'code_engine.project_id': self._project_id, 'code_engine.job_runs.pending': len(self._pending)}
+        with start_span(self._client, 'JobRunsWaiter.poll', attributes):
+            unseen = set(self._pending)
+            finished = []
+            if unseen:
+                pager = JobRunsPager(
+                    client=self._client,
+                    project_id=self._project_id,
+                    job_name=self._job_name,
+                    limit=self._limit,
+                )
+                while unseen and pager.has_next():
+                    for job_run in pager.get_next():
+                        name = job_run.get('name')
+                        if name not in unseen:
+                            continue
+                        unseen.discard(name)
+                        self.job_runs[name] = job_run
+                        self.statuses[name] = JobRunStatus.from_dict(job_run.get('status_details') or {})
+                        if job_run.get('status') in JOB_RUN_FINAL_STATES:
+                            self._pending.discard(name)
+                            finished.append(job_run)
+                pager.close()
+            self._missing = unseen
+            if self._on_complete is not None:
+                for job_run in finished:
+                    self._on_complete(job_run)
+        return finished
+
+    def wait(self, *, timeout: float = 3600.0, backoff: Optional[Backoff] = None) -> Dict[str, dict]:
+        """
+        Polls until all tracked job runs have finished.
+        :param float timeout: (optional) Number of seconds to wait before a
+               WaiterTimeoutError is raised.
+        :param Backoff backoff: (optional) The delays between the polls. Defaults
+               to `Backoff(delay=5.0, max_delay=60.0)`.
+        :return: The finished job runs, by name.
+        :rtype: Dict[str, dict]
+        :raises WaiterTimeoutError: Some job runs did not finish before the
+                timeout.
+        """
+        deadline = time.monotonic() + timeout
+        delays = (backoff or Backoff(delay=5.0, max_delay=60.0)).delays()
+        with start_span(self._client, 'JobRunsWaiter.wait', {'code_engine.project_id': self._project_id}):
+            while True:
+                self.poll()
+                if not self._pending:
+                    return self.completed
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise WaiterTimeoutError(
+                        '{0} job runs did not finish after {1} seconds'.format(len(self._pending), timeout)
+                    )
+                time.sleep(min(next(delays), remaining))
+
+
+def _get_latest_revision(
+    client: CodeEngineV2, project_id: str, app_name: str, status_details: dict, fetch_revision: bool
+) -> Optional[dict]:
+    revision_name = status_details.get('latest_created_revision')
+    if not fetch_revision or not revision_name:
+        return None
+    return client.get_app_revision(project_id=project_id, app_name=app_name, name=revision_name).get_result()
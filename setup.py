@@ -51,7 +51,7 @@ setup(
     long_description=readme,
     long_description_content_type='text/markdown',
     url='https://github.com/IBM/code-engine-python-sdk',
-    packages=[PACKAGE_NAME],
+    packages=[PACKAGE_NAME, PACKAGE_NAME + '.code_engine_v2', PACKAGE_NAME + '.code_engine_v2.models'],
     include_package_data=True,
     keywords=PACKAGE_NAME,
     classifiers=[
@@ -0,0 +1,970 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An in-memory emulator of the Code Engine V2 API, for tests and benchmarks
+that must run without an IBM Cloud account.
+
+The emulator keeps projects and their resources in memory and implements the
+endpoints of CodeEngineV2: creating, reading, updating, replacing and
+deleting resources, paginated lists with `next.start` tokens, entity tags
+with `If-Match` and `If-None-Match`, app revisions and instances, and the
+status of apps, job runs and build runs. It can add latency to every request
+and answer a fraction of the requests with errors.
+
+An emulator can answer the requests of a client in-process:
+
+    emulator = CodeEngineEmulator(latency=0.01, error_rate=0.01)
+    service = emulator.new_client()
+
+or be served over HTTP on a local port:
+
+    python test/code_engine_emulator.py --port 8080
+
+The emulator is a test helper, and is not part of the ibm_code_engine_sdk
+package. The tests get an emulator and a client that it answers from the
+`emulator` and `emulator_client` fixtures of `test/conftest.py`.
+"""
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+import argparse
+import asyncio
+import copy
+import datetime
+import json
+import random
+import threading
+import time
+import uuid
+
+from ibm_cloud_sdk_core import BaseService
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+import requests
+
+from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2
+from ibm_code_engine_sdk.index_ranges import IndexRangeSet
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+# The URL of the clients created by new_client(). The emulator answers requests for any host.
+EMULATOR_URL = 'https://codeengine.emulator/v2'
+
+# The default and the largest page size of lists.
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 100
+
+# The fields that the server sets, which cannot be changed by an update.
+_READ_ONLY_FIELDS = ('created_at', 'entity_tag', 'href', 'id', 'name', 'project_id', 'region', 'resource_type')
+
+# The resource type of a secret, by its format.
+_SECRET_RESOURCE_TYPES = {
+    'basic_auth': 'secret_basic_auth_v2',
+    'generic': 'secret_generic_v2',
+    'hmac_auth': 'secret_hmac_auth_v2',
+    'other': 'secret_other_v2',
+    'registry': 'secret_registry_v2',
+    'service_access': 'secret_service_access_v2',
+    'service_operator': 'secret_operator_v2',
+    'ssh_auth': 'secret_auth_ssh_v2',
+    'tls': 'secret_tls_v2',
+}
+
+_FUNCTION_RUNTIMES = [
+    {'default': True, 'deprecated': False, 'family': 'nodejs', 'id': 'nodejs-20', 'name': 'Node.js 20'},
+    {'default': False, 'deprecated': False, 'family': 'python', 'id': 'python-3.11', 'name': 'Python 3.11'},
+]
+
+
+class _Collection(NamedTuple):
+    # The resource type of the resources, if they have one.
+    resource_type: Optional[str]
+    # The field that identifies a resource in its collection.
+    key: str = 'name'
+    # The method that updates a resource: PATCH for a merge patch, PUT for a replacement.
+    update_method: Optional[str] = None
+    # The values of the optional fields that the server sets when they are not given.
+    defaults: Tuple[Tuple[str, object], ...] = ()
+
+
+# The values of the fields of the apps, jobs and job runs that the server sets when they are not given.
+_COMPONENT_DEFAULTS = (
+    ('computed_env_variables', []),
+    ('run_arguments', []),
+    ('run_commands', []),
+    ('run_env_variables', []),
+    ('run_service_account', 'default'),
+    ('run_volume_mounts', []),
+    ('scale_cpu_limit', '1'),
+    ('scale_ephemeral_storage_limit', '400M'),
+    ('scale_memory_limit', '4G'),
+)
+
+# The values of the fields of the builds and build runs that the server sets when they are not given.
+_BUILD_DEFAULTS = (
+    ('run_build_params', []),
+    ('source_type', 'git'),
+    ('strategy_size', 'medium'),
+    ('strategy_type', 'dockerfile'),
+)
+
+# The collections of resources of a project, by their path.
+_COLLECTIONS: Dict[str, _Collection] = {
+    'allowed_outbound_destinations': _Collection(None, update_method='PATCH'),
+    'apps': _Collection(
+        'app_v2',
+        update_method='PATCH',
+        defaults=_COMPONENT_DEFAULTS
+        + (
+            ('image_port', 8080),
+            ('managed_domain_mappings', 'local_public'),
+            ('scale_concurrency', 100),
+            ('scale_max_instances', 10),
+            ('scale_min_instances', 0),
+            ('scale_request_timeout', 300),
+        ),
+    ),
+    'bindings': _Collection('binding_v2', key='id'),
+    'build_runs': _Collection('build_run_v2', defaults=_BUILD_DEFAULTS + (('service_account', 'default'),)),
+    'builds': _Collection('build_v2', update_method='PATCH', defaults=_BUILD_DEFAULTS),
+    'config_maps': _Collection('config_map_v2', update_method='PUT'),
+    'domain_mappings': _Collection('domain_mapping_v2', update_method='PATCH'),
+    'functions': _Collection(
+        'function_v2',
+        update_method='PATCH',
+        defaults=(
+            ('code_binary', False),
+            ('computed_env_variables', []),
+            ('managed_domain_mappings', 'local_public'),
+            ('run_env_variables', []),
+            ('scale_concurrency', 1),
+            ('scale_cpu_limit', '1'),
+            ('scale_down_delay', 1),
+            ('scale_max_execution_time', 60),
+            ('scale_memory_limit', '4G'),
+        ),
+    ),
+    'job_runs': _Collection('job_run_v2', defaults=_COMPONENT_DEFAULTS),
+    'jobs': _Collection(
+        'job_v2',
+        update_method='PATCH',
+        defaults=_COMPONENT_DEFAULTS
+        + (
+            ('run_mode', 'task'),
+            ('scale_array_spec', '0'),
+            ('scale_max_execution_time', 7200),
+            ('scale_retry_limit', 3),
+        ),
+    ),
+    'persistent_data_stores': _Collection('persistent_data_store_v2'),
+    'secrets': _Collection('secret_v2', update_method='PUT'),
+}
+
+# The query parameters that filter the lists of a collection, by the field that they match.
+_LIST_FILTERS = {
+    'build_runs': ('build_name',),
+    'job_runs': ('job_name',),
+    'secrets': ('format',),
+}
+
+# The fields of a job and of a build that a run inherits when it does not set them.
+_RUN_TEMPLATES = {
+    'job_runs': ('job_name', 'jobs'),
+    'build_runs': ('build_name', 'builds'),
+}
+
+
+class EmulatorResponse(NamedTuple):
+    """
+    The response of the emulator to a request.
+    """
+
+    status_code: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class _ApiError(Exception):
+    def __init__(self, status_code: int, code: str, message: str) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+        self.message = message
+
+
+def _merge_patch(target: object, patch: object) -> object:
+    """
+    Applies a JSON merge patch (RFC 7386) to a value.
+    """
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for name, value in patch.items():
+        if value is None:
+            result.pop(name, None)
+        else:
+            result[name] = _merge_patch(result.get(name), value)
+    return result
+
+
+def _matches(entity_tag: str, header: str) -> bool:
+    """
+    Returns whether an entity tag matches the value of an If-Match or If-None-Match header.
+    """
+    for tag in header.split(','):
+        tag = tag.strip()
+        if tag == '*' or tag.replace('W/', '', 1).strip('"') == entity_tag:
+            return True
+    return False
+
+
+class CodeEngineEmulator:
+    """
+    CodeEngineEmulator emulates the Code Engine V2 API in memory. An emulator
+    is thread-safe, and can serve several clients and an HTTP server at once.
+
+    Apps, job runs and build runs are created in a transient state, and reach
+    their final state after `app_ready_delay`, `job_run_duration` and
+    `build_run_duration` seconds. By default they are final immediately.
+
+    :attr Counter request_counts: The number of requests to every endpoint,
+          keyed by the method and the path of the endpoint, e.g.
+          `GET /projects/{project_id}/apps/{name}`.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: Union[float, Callable[[], float]] = 0.0,
+        error_rate: float = 0.0,
+        error_status_codes: Iterable[int] = (429, 500, 503),
+        seed: Optional[int] = None,
+        app_ready_delay: float = 0.0,
+        job_run_duration: float = 0.0,
+        build_run_duration: float = 0.0,
+        region: str = 'us-east',
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize a CodeEngineEmulator object.
+
+        :param latency: (optional) The time in seconds that every request takes, or
+               a function that returns it, e.g. to draw it from a distribution.
+        :param float error_rate: (optional) The fraction of the requests that fail
+               with one of `error_status_codes`, at random.
+        :param Iterable[int] error_status_codes: (optional) The status codes of the
+               random errors.
+        :param int seed: (optional) The seed of the random errors.
+        :param float app_ready_delay: (optional) The time in seconds that a new
+               revision of an app takes to become ready.
+        :param float job_run_duration: (optional) The time in seconds that a job
+               run takes to complete.
+        :param float build_run_duration: (optional) The time in seconds that a
+               build run takes to succeed.
+        :param str region: (optional) The region of the projects.
+        :param clock: (optional) The clock of the emulator, in seconds since the epoch.
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status_codes = list(error_status_codes)
+        self.app_ready_delay = app_ready_delay
+        self.job_run_duration = job_run_duration
+        self.build_run_duration = build_run_duration
+        self.region = region
+        self.request_counts = Counter()
+        self._clock = clock
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._failures: List[int] = []
+        self._entity_tags = 0
+        self._projects: Dict[str, dict] = {}
+        self._resources: Dict[Tuple[str, str], Dict[str, dict]] = {}
+
+    def reset(self) -> None:
+        """
+        Deletes all projects and resources, and clears the request counts and the pending failures.
+        """
+        with self._lock:
+            self._projects.clear()
+            self._resources.clear()
+            self._failures.clear()
+            self.request_counts.clear()
+
+    def fail_next(self, status_code: int = 500, count: int = 1) -> None:
+        """
+        Makes the next `count` requests fail with `status_code`.
+        """
+        with self._lock:
+            self._failures.extend([status_code] * count)
+
+    ##########################
+    # Transports
+    ##########################
+
+    def new_client(self, service_url: str = EMULATOR_URL) -> CodeEngineV2:
+        """
+        Returns a CodeEngineV2 client whose requests are answered by the emulator.
+        """
+        return self.mount(CodeEngineV2(authenticator=NoAuthAuthenticator()), service_url)
+
+    def mount(self, service: BaseService, service_url: Optional[str] = None) -> BaseService:
+        """
+        Answers the requests of a client to its service URL with the emulator,
+        by mounting an EmulatorAdapter on its HTTP session.
+
+        :param BaseService service: The client.
+        :param str service_url: (optional) The service URL to set first.
+        :return: The client.
+        """
+        if service_url is not None:
+            service.set_service_url(service_url)
+        service.get_http_client().mount(service.service_url, EmulatorAdapter(self))
+        return service
+
+    def mount_async(self, service: CodeEngineV2, service_url: Optional[str] = None) -> CodeEngineV2:
+        """
+        Answers the requests of an asyncio client with the emulator, by giving
+        it an `httpx.AsyncClient` with the transport of httpx_transport().
+
+        :param AsyncCodeEngineV2 service: The client.
+        :param str service_url: (optional) The service URL to set first.
+        :return: The client.
+        """
+        if service_url is not None:
+            service.set_service_url(service_url)
+        service.set_async_http_client(httpx.AsyncClient(transport=self.httpx_transport()))
+        return service
+
+    def httpx_transport(self) -> 'httpx.MockTransport':
+        """
+        Returns an httpx transport that answers the requests of an
+        `httpx.AsyncClient` with the emulator. The latency of the requests is
+        awaited without blocking the event loop.
+        """
+        if httpx is None:
+            raise ImportError('The httpx transport requires the httpx package')
+
+        async def handler(request: 'httpx.Request') -> 'httpx.Response':
+            await asyncio.sleep(self._get_latency())
+            response = self.dispatch(request.method, str(request.url), request.headers, await request.aread())
+            return httpx.Response(response.status_code, headers=response.headers, content=response.body)
+
+        return httpx.MockTransport(handler)
+
+    def serve(self, host: str = '127.0.0.1', port: int = 0) -> ThreadingHTTPServer:
+        """
+        Returns an HTTP server that answers requests with the emulator. The
+        service URL of the server is `http://{host}:{port}/v2`. Call
+        `serve_forever()` of the server to start it, and `shutdown()` to stop it.
+
+        :param str host: (optional) The address to listen on.
+        :param int port: (optional) The port to listen on, or 0 for any free port.
+        """
+        emulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def answer(self) -> None:
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else None
+                url = 'http://{0}{1}'.format(self.headers.get('Host') or '{0}:{1}'.format(host, port), self.path)
+                response = emulator.handle(self.command, url, self.headers, body)
+                self.send_response(response.status_code)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(response.body)))
+                self.end_headers()
+                self.wfile.write(response.body)
+
+            do_DELETE = do_GET = do_PATCH = do_POST = do_PUT = answer
+
+            def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        return server
+
+    ##########################
+    # Requests
+    ##########################
+
+    def handle(
+        self, method: str, url: str, headers: Optional[dict] = None, body: Optional[bytes] = None
+    ) -> EmulatorResponse:
+        """
+        Waits for the latency of the emulator, then answers a request.
+
+        :param str method: The HTTP method of the request.
+        :param str url: The URL of the request, or its path and query string.
+        :param dict headers: (optional) The headers of the request.
+        :param bytes body: (optional) The body of the request.
+        :return: The response to the request.
+        :rtype: EmulatorResponse
+        """
+        latency = self._get_latency()
+        if latency > 0:
+            time.sleep(latency)
+        return self.dispatch(method, url, headers, body)
+
+    def dispatch(
+        self, method: str, url: str, headers: Optional[dict] = None, body: Optional[bytes] = None
+    ) -> EmulatorResponse:
+        """
+        Answers a request immediately, without the latency of the emulator.
+        """
+        headers = CaseInsensitiveDict(headers or {})
+        parts = urlsplit(url)
+        index = parts.path.find('/v2/')
+        base_url = '{0}://{1}{2}'.format(parts.scheme or 'http', parts.netloc or 'localhost', parts.path[: index + 3])
+        segments = parts.path[index + 4 :].strip('/').split('/') if index >= 0 else []
+        segments = [unquote(segment) for segment in segments]
+        query = {name: values[-1] for name, values in parse_qs(parts.query).items()}
+        try:
+            with self._lock:
+                status_code = self._next_failure()
+                if status_code is not None:
+                    raise _ApiError(status_code, 'injected_error', 'Injected error {0}'.format(status_code))
+                status_code, result = self._route(method.upper(), base_url, segments, query, headers, body)
+        except _ApiError as e:
+            error = {
+                'errors': [{'code': e.code, 'message': e.message}],
+                'status_code': e.status_code,
+                'trace': uuid.uuid4().hex,
+            }
+            response_headers = {'Content-Type': 'application/json'}
+            if e.status_code == 429:
+                response_headers['Retry-After'] = '1'
+            return EmulatorResponse(e.status_code, response_headers, json.dumps(error).encode('utf-8'))
+        if result is None:
+            return EmulatorResponse(status_code, {}, b'')
+        response_headers = {'Content-Type': 'application/json'}
+        if 'entity_tag' in result:
+            response_headers['ETag'] = result['entity_tag']
+            if_none_match = headers.get('If-None-Match')
+            if method.upper() == 'GET' and if_none_match and _matches(result['entity_tag'], if_none_match):
+                return EmulatorResponse(304, response_headers, b'')
+        return EmulatorResponse(status_code, response_headers, json.dumps(result).encode('utf-8'))
+
+    def _get_latency(self) -> float:
+        return self.latency() if callable(self.latency) else self.latency
+
+    def _next_failure(self) -> Optional[int]:
+        if self._failures:
+            return self._failures.pop(0)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self._random.choice(self.error_status_codes)
+        return None
+
+    def _route(
+        self, method: str, base_url: str, segments: List[str], query: dict, headers: dict, body: Optional[bytes]
+    ) -> Tuple[int, Optional[dict]]:
+        """
+        Calls the handler of the endpoint of a request, and returns the status code and the result.
+        """
+        n = len(segments)
+        if segments == ['function_runtimes']:
+            endpoint, handler = '/function_runtimes', {'GET': lambda: (200, {'function_runtimes': _FUNCTION_RUNTIMES})}
+        elif segments == ['projects']:
+            endpoint = '/projects'
+            handler = {
+                'GET': lambda: (
+                    200,
+                    self._list(base_url, '/projects', 'projects', list(self._projects.values()), query),
+                ),
+                'POST': lambda: (201, self._create_project(base_url, _parse(body))),
+            }
+        elif n == 2 and segments[0] == 'projects':
+            endpoint = '/projects/{id}'
+            handler = {
+                'GET': lambda: (200, self._get_project(segments[1])),
+                'DELETE': lambda: (202, self._delete_project(segments[1])),
+            }
+        elif n == 3 and segments[0] == 'projects' and segments[2] in ('egress_ips', 'status_details'):
+            endpoint = '/projects/{project_id}/' + segments[2]
+            handler = {'GET': lambda: (200, self._get_project_details(segments[1], segments[2]))}
+        elif n == 3 and segments[0] == 'projects' and segments[2] in _COLLECTIONS:
+            project_id, collection = segments[1:]
+            endpoint = '/projects/{project_id}/' + collection
+            path = '/projects/{0}/{1}'.format(project_id, collection)
+            handler = {
+                'GET': lambda: (200, self._list_resources(base_url, path, project_id, collection, query)),
+                'POST': lambda: (201, self._create(base_url, project_id, collection, _parse(body))),
+            }
+        elif n == 4 and segments[0] == 'projects' and segments[2] in _COLLECTIONS:
+            project_id, collection, key = segments[1:]
+            endpoint = '/projects/{{project_id}}/{0}/{{{1}}}'.format(collection, _COLLECTIONS[collection].key)
+            handler = {
+                'GET': lambda: (200, self._get(project_id, collection, key)),
+                'DELETE': lambda: (202, self._delete(project_id, collection, key, headers)),
+            }
+            update_method = _COLLECTIONS[collection].update_method
+            if update_method is not None:
+                handler[update_method] = lambda: (
+                    200,
+                    self._update(project_id, collection, key, headers, _parse(body), update_method == 'PATCH'),
+                )
+        elif n in (5, 6) and segments[0] == 'projects' and segments[2] == 'apps' and segments[4] == 'revisions':
+            project_id, app_name = segments[1], segments[3]
+            if n == 5:
+                endpoint = '/projects/{project_id}/apps/{app_name}/revisions'
+                path = '/projects/{0}/apps/{1}/revisions'.format(project_id, app_name)
+                handler = {'GET': lambda: (200, self._list_revisions(base_url, path, project_id, app_name, query))}
+            else:
+                endpoint = '/projects/{project_id}/apps/{app_name}/revisions/{name}'
+                handler = {
+                    'GET': lambda: (200, self._get_revision(project_id, app_name, segments[5])),
+                    'DELETE': lambda: (202, self._delete_revision(project_id, app_name, segments[5])),
+                }
+        elif n == 5 and segments[0] == 'projects' and segments[2] == 'apps' and segments[4] == 'instances':
+            project_id, app_name = segments[1], segments[3]
+            endpoint = '/projects/{project_id}/apps/{app_name}/instances'
+            path = '/projects/{0}/apps/{1}/instances'.format(project_id, app_name)
+            handler = {'GET': lambda: (200, self._list_instances(base_url, path, project_id, app_name, query))}
+        else:
+            raise _ApiError(404, 'not_found', 'No endpoint at /{0}'.format('/'.join(segments)))
+        if method not in handler:
+            raise _ApiError(405, 'method_not_allowed', 'Method {0} is not allowed on {1}'.format(method, endpoint))
+        self.request_counts['{0} {1}'.format(method, endpoint)] += 1
+        return handler[method]()
+
+    ##########################
+    # Projects
+    ##########################
+
+    def _create_project(self, base_url: str, body: dict) -> dict:
+        name = _require(body, 'name')
+        if any(project['name'] == name for project in self._projects.values()):
+            raise _ApiError(409, 'already_exists', 'Project with name {0} already exists'.format(name))
+        project_id = str(uuid.uuid4())
+        project = {
+            'account_id': 'emulator',
+            'created_at': self._now(),
+            'crn': 'crn:v1:bluemix:public:codeengine:{0}:a/emulator:{1}::'.format(self.region, project_id),
+            'href': '{0}/projects/{1}'.format(base_url, project_id),
+            'id': project_id,
+            'name': name,
+            'region': self.region,
+            'resource_group_id': body.get('resource_group_id') or 'default',
+            'resource_type': 'project_v2',
+            'status': 'active',
+        }
+        self._projects[project_id] = project
+        return project
+
+    def _get_project(self, project_id: str) -> dict:
+        project = self._projects.get(project_id)
+        if project is None:
+            raise _ApiError(404, 'not_found', 'Project {0} not found'.format(project_id))
+        return project
+
+    def _delete_project(self, project_id: str) -> None:
+        self._get_project(project_id)
+        del self._projects[project_id]
+        for collection in [key for key in self._resources if key[0] == project_id]:
+            del self._resources[collection]
+
+    def _get_project_details(self, project_id: str, endpoint: str) -> dict:
+        self._get_project(project_id)
+        if endpoint == 'egress_ips':
+            return {'private': ['10.0.0.1', '10.0.0.2'], 'public': ['192.0.2.1', '192.0.2.2']}
+        return {
+            'cbr': {'data_plane': {'enforcement': 'applied'}},
+            'domain': 'ready',
+            'project': 'enabled',
+            'vpe': 'ready',
+            'vpe_not_enabled': False,
+        }
+
+    ##########################
+    # Resources
+    ##########################
+
+    def _table(self, project_id: str, collection: str) -> Dict[str, dict]:
+        self._get_project(project_id)
+        return self._resources.setdefault((project_id, collection), {})
+
+    def _find(self, project_id: str, collection: str, key: str) -> dict:
+        resource = self._table(project_id, collection).get(key)
+        if resource is None:
+            raise _ApiError(404, 'not_found', 'Resource {0} of {1} not found'.format(key, collection))
+        return resource
+
+    def _get(self, project_id: str, collection: str, key: str) -> dict:
+        return self._refresh(self._find(project_id, collection, key))
+
+    def _list_resources(self, base_url: str, path: str, project_id: str, collection: str, query: dict) -> dict:
+        resources = self._table(project_id, collection).values()
+        for name in _LIST_FILTERS.get(collection, ()):
+            if query.get(name):
+                resources = [resource for resource in resources if resource.get(name) == query[name]]
+        return self._list(base_url, path, collection, list(resources), query)
+
+    def _create(self, base_url: str, project_id: str, collection: str, body: dict) -> dict:
+        table = self._table(project_id, collection)
+        spec = _COLLECTIONS[collection]
+        resource = copy.deepcopy(dict(spec.defaults))
+        if collection in _RUN_TEMPLATES:
+            template_field, templates = _RUN_TEMPLATES[collection]
+            template_name = body.get(template_field)
+            if template_name:
+                template = self._table(project_id, templates).get(template_name)
+                if template is None:
+                    raise _ApiError(404, 'not_found', 'Resource {0} of {1} not found'.format(template_name, templates))
+                resource.update(
+                    (name, value)
+                    for name, value in template.items()
+                    if name not in _READ_ONLY_FIELDS and not name.startswith(('_', 'status'))
+                )
+            body.setdefault('name', '{0}-{1}'.format(template_name or 'run', uuid.uuid4().hex[:5]))
+        resource.update(body)
+        if spec.key == 'id':
+            resource['id'] = str(uuid.uuid4())
+        key = _require(resource, spec.key)
+        if key in table:
+            raise _ApiError(409, 'already_exists', 'Resource {0} of {1} already exists'.format(key, collection))
+        resource['created_at'] = self._now()
+        resource['href'] = '{0}/projects/{1}/{2}/{3}'.format(base_url, project_id, collection, quote(key, safe=''))
+        resource['project_id'] = project_id
+        resource['region'] = self.region
+        if spec.resource_type is not None:
+            resource['id'] = resource.get('id') or str(uuid.uuid4())
+            resource['resource_type'] = spec.resource_type
+        if collection == 'secrets':
+            resource['resource_type'] = _SECRET_RESOURCE_TYPES.get(resource.get('format'), spec.resource_type)
+        self._set_entity_tag(resource)
+        self._start(base_url, project_id, collection, resource)
+        table[key] = resource
+        return self._refresh(resource)
+
+    def _update(self, project_id: str, collection: str, key: str, headers: dict, body: dict, patch: bool) -> dict:
+        resource = self._find(project_id, collection, key)
+        self._refresh(resource)
+        self._check_if_match(resource, headers)
+        updated = _merge_patch(resource, body) if patch else dict(body)
+        for name in _READ_ONLY_FIELDS:
+            if name in resource:
+                updated[name] = resource[name]
+            else:
+                updated.pop(name, None)
+        for name, value in resource.items():
+            if name.startswith('_'):
+                updated[name] = value
+        self._set_entity_tag(updated)
+        self._start(resource['href'].split('/projects/')[0], project_id, collection, updated)
+        self._table(project_id, collection)[key] = updated
+        return self._refresh(updated)
+
+    def _delete(self, project_id: str, collection: str, key: str, headers: dict) -> None:
+        resource = self._get(project_id, collection, key)
+        self._check_if_match(resource, headers)
+        del self._table(project_id, collection)[key]
+        if collection == 'apps':
+            self._resources.pop((project_id, 'apps/{0}/revisions'.format(key)), None)
+
+    def _check_if_match(self, resource: dict, headers: dict) -> None:
+        if_match = headers.get('If-Match')
+        if if_match and not _matches(resource['entity_tag'], if_match):
+            raise _ApiError(
+                412,
+                'precondition_failed',
+                'The entity tag {0} does not match the current entity tag {1}'.format(if_match, resource['entity_tag']),
+            )
+
+    ##########################
+    # Revisions and instances
+    ##########################
+
+    def _get_app(self, project_id: str, app_name: str) -> dict:
+        return self._get(project_id, 'apps', app_name)
+
+    def _list_revisions(self, base_url: str, path: str, project_id: str, app_name: str, query: dict) -> dict:
+        self._get_app(project_id, app_name)
+        revisions = self._resources.get((project_id, 'apps/{0}/revisions'.format(app_name)), {}).values()
+        return self._list(base_url, path, 'revisions', list(revisions), query)
+
+    def _get_revision(self, project_id: str, app_name: str, name: str) -> dict:
+        self._get_app(project_id, app_name)
+        revision = self._resources.get((project_id, 'apps/{0}/revisions'.format(app_name)), {}).get(name)
+        if revision is None:
+            raise _ApiError(404, 'not_found', 'Revision {0} of app {1} not found'.format(name, app_name))
+        return self._refresh(revision)
+
+    def _delete_revision(self, project_id: str, app_name: str, name: str) -> None:
+        self._get_revision(project_id, app_name, name)
+        del self._resources[(project_id, 'apps/{0}/revisions'.format(app_name))][name]
+
+    def _list_instances(self, base_url: str, path: str, project_id: str, app_name: str, query: dict) -> dict:
+        app = self._get_app(project_id, app_name)
+        instances = []
+        revision_name = app['status_details'].get('latest_ready_revision')
+        if revision_name is not None:
+            for index in range(max(app.get('scale_min_instances') or 0, 1)):
+                name = '{0}-deployment-{1}'.format(revision_name, index)
+                instances.append(
+                    {
+                        'app_name': app_name,
+                        'created_at': app['created_at'],
+                        'href': '{0}{1}/{2}'.format(base_url, path, name),
+                        'id': str(uuid.uuid5(uuid.NAMESPACE_URL, app['id'] + name)),
+                        'name': name,
+                        'project_id': project_id,
+                        'region': self.region,
+                        'resource_type': 'app_instance_v2',
+                        'revision_name': revision_name,
+                        'scale_cpu_limit': app.get('scale_cpu_limit'),
+                        'scale_ephemeral_storage_limit': app.get('scale_ephemeral_storage_limit'),
+                        'scale_memory_limit': app.get('scale_memory_limit'),
+                        'status': 'running',
+                    }
+                )
+        return self._list(base_url, path, 'instances', instances, query)
+
+    ##########################
+    # Status
+    ##########################
+
+    def _start(self, base_url: str, project_id: str, collection: str, resource: dict) -> None:
+        """
+        Puts a new or updated resource in its transient state.
+        """
+        now = self._clock()
+        if collection == 'apps':
+            revisions = self._resources.setdefault((project_id, 'apps/{0}/revisions'.format(resource['name'])), {})
+            resource['_revision_number'] = number = resource.get('_revision_number', 0) + 1
+            revision_name = '{0}-{1:05d}'.format(resource['name'], number)
+            revision = {
+                name: resource[name]
+                for name in resource
+                if name.startswith(('image_', 'run_', 'scale_'))
+                or name in ('computed_env_variables', 'probe_liveness', 'probe_readiness')
+            }
+            revision.update(
+                app_name=resource['name'],
+                created_at=self._now(),
+                href='{0}/projects/{1}/apps/{2}/revisions/{3}'.format(
+                    base_url, project_id, quote(resource['name'], safe=''), revision_name
+                ),
+                id=str(uuid.uuid4()),
+                name=revision_name,
+                project_id=project_id,
+                region=self.region,
+                resource_type='app_revision_v2',
+                status='loading',
+                status_details={'actual_instances': 0, 'reason': 'deploying'},
+                _ready_at=now + self.app_ready_delay,
+            )
+            revisions[revision_name] = revision
+            previous = resource.get('status_details') or {}
+            resource['status'] = 'deploying'
+            resource['status_details'] = {
+                'latest_created_revision': revision_name,
+                'latest_ready_revision': previous.get('latest_ready_revision'),
+                'reason': 'deploying',
+            }
+            resource['endpoint'] = 'https://{0}.{1}.{2}.codeengine.appdomain.cloud'.format(
+                resource['name'], project_id[:12], self.region
+            )
+            resource['_ready_at'] = now + self.app_ready_delay
+        elif collection == 'job_runs':
+            indices = IndexRangeSet(resource.get('scale_array_spec') or '0')
+            resource['status'] = 'running'
+            resource['status_details'] = {
+                'failed': 0,
+                'pending': 0,
+                'requested': len(indices),
+                'running': len(indices),
+                'running_indices': indices.to_array_spec(),
+                'start_time': self._now(),
+                'succeeded': 0,
+                'unknown': 0,
+            }
+            resource['_ready_at'] = now + self.job_run_duration
+        elif collection == 'build_runs':
+            resource['status'] = 'running'
+            resource['status_details'] = {'reason': 'running', 'start_time': self._now()}
+            resource['_ready_at'] = now + self.build_run_duration
+        elif collection == 'builds':
+            resource['status'] = 'ready'
+            resource['status_details'] = {'reason': 'registered'}
+        elif collection == 'functions':
+            resource['status'] = 'ready'
+            resource['status_details'] = {'reason': 'ready'}
+
+    def _refresh(self, resource: dict) -> dict:
+        """
+        Moves a resource to its final state when its time has come, and
+        returns the resource without the private fields of the emulator.
+        """
+        ready_at = resource.get('_ready_at')
+        if ready_at is not None and self._clock() >= ready_at:
+            del resource['_ready_at']
+            resource_type = resource.get('resource_type')
+            if resource_type == 'app_v2':
+                details = resource['status_details']
+                resource['status'] = 'ready'
+                details.update(latest_ready_revision=details['latest_created_revision'], reason='ready')
+                revisions = self._resources.get((resource['project_id'], 'apps/{0}/revisions'.format(resource['name'])))
+                revision = (revisions or {}).get(details['latest_created_revision'])
+                if revision is not None:
+                    self._refresh(revision)
+            elif resource_type == 'app_revision_v2':
+                resource['status'] = 'ready'
+                resource['status_details'] = {'actual_instances': 1, 'reason': 'ready'}
+            elif resource_type == 'job_run_v2':
+                details = resource['status_details']
+                resource['status'] = 'completed'
+                details.update(
+                    completion_time=self._now(),
+                    running=0,
+                    running_indices='',
+                    succeeded=details['requested'],
+                    succeeded_indices=details['running_indices'],
+                )
+            elif resource_type == 'build_run_v2':
+                resource['status'] = 'succeeded'
+                resource['status_details'].update(completion_time=self._now(), reason='succeeded')
+            if 'entity_tag' in resource:
+                self._set_entity_tag(resource)
+        return {name: value for name, value in resource.items() if not name.startswith('_')}
+
+    ##########################
+    # Helpers
+    ##########################
+
+    def _list(self, base_url: str, path: str, collection: str, items: List[dict], query: dict) -> dict:
+        """
+        Returns the page of a list that the `limit` and `start` query parameters select.
+        Only the resources of the page are refreshed.
+        """
+        try:
+            limit = int(query.get('limit', DEFAULT_LIMIT))
+            offset = int(query.get('start') or 0)
+        except ValueError as e:
+            raise _ApiError(400, 'invalid_parameter', 'Invalid limit or start: {0}'.format(e)) from e
+        if not 1 <= limit <= MAX_LIMIT:
+            raise _ApiError(400, 'invalid_parameter', 'limit must be between 1 and {0}'.format(MAX_LIMIT))
+        if offset < 0:
+            raise _ApiError(400, 'invalid_parameter', 'Invalid start: {0}'.format(offset))
+        result = {
+            collection: [self._refresh(item) for item in items[offset : offset + limit]],
+            'first': {'href': '{0}{1}?limit={2}'.format(base_url, path, limit)},
+            'limit': limit,
+        }
+        if offset + limit < len(items):
+            start = str(offset + limit)
+            result['next'] = {'href': '{0}{1}?limit={2}&start={3}'.format(base_url, path, limit, start), 'start': start}
+        return result
+
+    def _set_entity_tag(self, resource: dict) -> None:
+        self._entity_tags += 1
+        resource['entity_tag'] = str(self._entity_tags)
+
+    def _now(self) -> str:
+        return datetime.datetime.fromtimestamp(self._clock(), datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _parse(body: Optional[bytes]) -> dict:
+    """
+    Parses the JSON body of a request.
+    """
+    try:
+        result = json.loads(body) if body else {}
+    except ValueError as e:
+        raise _ApiError(400, 'invalid_body', 'Invalid JSON body: {0}'.format(e)) from e
+    if not isinstance(result, dict):
+        raise _ApiError(400, 'invalid_body', 'The body must be a JSON object')
+    return result
+
+
+def _require(body: dict, name: str) -> str:
+    value = body.get(name)
+    if not value:
+        raise _ApiError(400, 'missing_field', 'Missing required field {0}'.format(name))
+    return value
+
+
+class EmulatorAdapter(BaseAdapter):
+    """
+    EmulatorAdapter answers the requests of a `requests` session with a
+    CodeEngineEmulator, without any network I/O.
+    """
+
+    def __init__(self, emulator: CodeEngineEmulator) -> None:
+        """
+        Initialize an EmulatorAdapter object.
+        :param CodeEngineEmulator emulator: The emulator that answers the requests.
+        """
+        super().__init__()
+        self.emulator = emulator
+
+    def send(self, request, **kwargs) -> requests.Response:  # pylint: disable=arguments-differ
+        body = request.body.encode('utf-8') if isinstance(request.body, str) else request.body
+        result = self.emulator.handle(request.method, request.url, request.headers, body)
+        response = requests.Response()
+        response.status_code = result.status_code
+        response.headers = CaseInsensitiveDict(result.headers)
+        response._content = result.body  # pylint: disable=protected-access
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serves an in-memory emulator of the Code Engine V2 API.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0, help='the latency of every request, in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='the fraction of the requests that fail')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--app-ready-delay', type=float, default=0.0)
+    parser.add_argument('--job-run-duration', type=float, default=0.0)
+    parser.add_argument('--build-run-duration', type=float, default=0.0)
+    args = parser.parse_args()
+
+    emulator = CodeEngineEmulator(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        app_ready_delay=args.app_ready_delay,
+        job_run_duration=args.job_run_duration,
+        build_run_duration=args.build_run_duration,
+    )
+    server = emulator.serve(args.host, args.port)
+    print('Serving the Code Engine V2 API at http://{0}:{1}/v2'.format(*server.server_address[:2]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
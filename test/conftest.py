@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Fixtures shared by the tests
+"""
+
+import pytest
+from code_engine_emulator import CodeEngineEmulator
+
+
+@pytest.fixture
+def emulator():
+    """
+    An in-memory emulator of the Code Engine API.
+    """
+    return CodeEngineEmulator()
+
+
+@pytest.fixture
+def emulator_client(emulator):
+    """
+    A CodeEngineV2 client whose requests are answered by the emulator.
+    """
+    service = emulator.new_client()
+    yield service
+    service.get_http_client().close()
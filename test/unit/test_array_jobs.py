@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the array_jobs module
+"""
+
+import json
+import re
+import time
+import pytest
+import responses
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_code_engine_sdk.array_jobs import FailedIndexRetrier
+from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2
+from ibm_code_engine_sdk.index_ranges import IndexRangeSet
+from ibm_code_engine_sdk.waiters import Backoff, WaiterTimeoutError
+
+_service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+
+_base_url = 'https://api.au-syd.codeengine.cloud.ibm.com/v2'
+_service.set_service_url(_base_url)
+
+_project_id = '15314cc3-85b4-4338-903f-c28cdee6d005'
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """
+    Lets the retrier poll without waiting.
+    """
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+
+
+class FakeJobRuns:
+    """
+    Serves the job runs of a project. Every job run finishes on the poll after
+    its creation; the indices that `fails` returns for a job run and its
+    attempt fail, all other indices succeed.
+    """
+
+    def __init__(self, fails, *, array_spec='0-9', job_name='my-job'):
+        self.fails = fails
+        self.job_runs = {}
+        self.created = []
+        self.add_job_run('my-job-run', array_spec, 0, job_name=job_name)
+        responses.add_callback(
+            responses.GET,
+            _base_url + '/projects/{0}/job_runs/my-job-run'.format(_project_id),
+            callback=lambda request: (200, {}, json.dumps(self.job_runs['my-job-run'])),
+            content_type='application/json',
+        )
+        responses.add_callback(
+            responses.GET,
+            re.compile(_base_url + '/projects/{0}/job_runs'.format(_project_id) + r'(\?.*)?$'),
+            callback=self.list_job_runs,
+            content_type='application/json',
+        )
+        responses.add_callback(
+            responses.POST,
+            _base_url + '/projects/{0}/job_runs'.format(_project_id),
+            callback=self.create_job_run,
+            content_type='application/json',
+        )
+
+    def add_job_run(self, name, array_spec, attempt, **properties):
+        """
+        Adds a running job run.
+        """
+        job_run = dict(properties, name=name, scale_array_spec=array_spec, status='running')
+        job_run['status_details'] = {'requested': len(IndexRangeSet(array_spec)), 'start_time': 'start'}
+        self.job_runs[name] = job_run
+        job_run['_attempt'] = attempt
+        return job_run
+
+    def list_job_runs(self, request):
+        """
+        Finishes the running job runs and lists all job runs.
+        """
+        for job_run in self.job_runs.values():
+            if job_run['status'] == 'running':
+                indices = IndexRangeSet(job_run['scale_array_spec'])
+                failed = IndexRangeSet.from_indices(self.fails(job_run['_attempt'], indices)) & indices
+                job_run['status'] = 'failed' if failed else 'completed'
+                job_run['status_details'].update(
+                    failed=len(failed),
+                    failed_indices=str(failed),
+                    succeeded_indices=str(indices - failed),
+                    completion_time='end-{0}'.format(job_run['name']),
+                )
+        job_runs = [{k: v for k, v in job_run.items() if k != '_attempt'} for job_run in self.job_runs.values()]
+        return (200, {}, json.dumps({'job_runs': job_runs, 'limit': 100}))
+
+    def create_job_run(self, request):
+        """
+        Creates a job run that retries indices.
+        """
+        body = json.loads(request.body)
+        self.created.append(body)
+        name = 'my-job-run-retry-{0}'.format(len(self.created))
+        attempt = max(job_run['_attempt'] for job_run in self.job_runs.values()) + 1
+        job_run = self.add_job_run(name, body.pop('scale_array_spec'), attempt, **body)
+        return (201, {}, json.dumps({k: v for k, v in job_run.items() if k != '_attempt'}))
+
+
+class TestFailedIndexRetrier:
+    """
+    Test Class for FailedIndexRetrier
+    """
+
+    @responses.activate
+    def test_retry_failed_indices(self):
+        """
+        Test that only the failed indices are retried until they succeed.
+        """
+        fake = FakeJobRuns(lambda attempt, indices: {0: [3, 7, 8], 1: [7]}.get(attempt, []))
+        retried = []
+
+        retrier = FailedIndexRetrier(_service, _project_id, 'my-job-run', on_retry=retried.append)
+        status = retrier.run(backoff=Backoff(delay=1, jitter=0))
+
+        assert [body['job_name'] for body in fake.created] == ['my-job', 'my-job']
+        assert [job_run['scale_array_spec'] for job_run in retried] == ['3,7-8', '7']
+        assert all(body['scale_array_size_variable_override'] == 10 for body in fake.created)
+        assert retrier.job_runs == {'my-job-run': 0, 'my-job-run-retry-1': 1, 'my-job-run-retry-2': 2}
+        assert status.requested == 10
+        assert status.succeeded == 10
+        assert status.succeeded_indices == '0-9'
+        assert status.failed == 0
+        assert status.failed_indices == ''
+        assert status.start_time == 'start'
+        assert status.completion_time == 'end-my-job-run-retry-2'
+
+    @responses.activate
+    def test_retry_budget(self):
+        """
+        Test that indices that keep failing are reported as failed once the budget is spent.
+        """
+        fake = FakeJobRuns(lambda attempt, indices: [5], array_spec='0-99')
+
+        status = FailedIndexRetrier(_service, _project_id, 'my-job-run', max_retries=2).run()
+
+        assert len(fake.created) == 2
+        assert status.failed_index_set == IndexRangeSet('5')
+        assert status.succeeded == 99
+        assert status.get_retry_array_spec() == '5'
+
+    @responses.activate
+    def test_bounded_parallelism(self):
+        """
+        Test that the failed indices are split over job runs, at most max_parallel_runs at a time.
+        """
+        fake = FakeJobRuns(lambda attempt, indices: range(10) if attempt == 0 else [], array_spec='0-19')
+        active = []
+
+        def on_retry(job_run):
+            active.append(sum(1 for run in fake.job_runs.values() if run['status'] == 'running'))
+
+        retrier = FailedIndexRetrier(
+            _service,
+            _project_id,
+            'my-job-run',
+            max_parallel_runs=2,
+            max_indices_per_run=3,
+            on_retry=on_retry,
+        )
+        status = retrier.run()
+
+        assert len(fake.created) == 4
+        assert [run['scale_array_spec'] for run in fake.job_runs.values()][1:] == ['0-2', '3-5', '6-8', '9']
+        assert max(active) == 2
+        assert status.succeeded == 20
+
+    @responses.activate
+    def test_standalone_job_run(self):
+        """
+        Test that the image of a job run without a job is passed on to the retries.
+        """
+        fake = FakeJobRuns(lambda attempt, indices: [1] if attempt == 0 else [], array_spec='0-2', job_name=None)
+        fake.job_runs['my-job-run'].update(image_reference='icr.io/codeengine/helloworld', run_commands=['run'])
+
+        FailedIndexRetrier(_service, _project_id, 'my-job-run').run()
+
+        assert fake.created[0]['image_reference'] == 'icr.io/codeengine/helloworld'
+        assert fake.created[0]['run_commands'] == ['run']
+        assert 'job_name' not in fake.created[0]
+
+    @responses.activate
+    def test_timeout(self, monkeypatch):
+        """
+        Test that the retrier gives up at its deadline.
+        """
+        responses.add(
+            responses.GET,
+            _base_url + '/projects/{0}/job_runs/my-job-run'.format(_project_id),
+            json={'name': 'my-job-run', 'scale_array_spec': '0-9', 'status': 'running'},
+        )
+        responses.add(
+            responses.GET,
+            _base_url + '/projects/{0}/job_runs'.format(_project_id),
+            json={'job_runs': [{'name': 'my-job-run', 'status': 'running'}]},
+        )
+        now = [0.0]
+        monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+        monkeypatch.setattr(time, 'sleep', lambda seconds: now.__setitem__(0, now[0] + seconds))
+
+        with pytest.raises(WaiterTimeoutError):
+            FailedIndexRetrier(_service, _project_id, 'my-job-run').run(timeout=60)
+
+    def test_invalid_arguments(self):
+        """
+        Test that invalid arguments are rejected.
+        """
+        with pytest.raises(ValueError):
+            FailedIndexRetrier(_service, _project_id, None)
+        with pytest.raises(ValueError):
+            FailedIndexRetrier(_service, _project_id, 'my-job-run', max_parallel_runs=0)
+        with pytest.raises(ValueError):
+            FailedIndexRetrier(_service, _project_id, 'my-job-run', max_indices_per_run=0)
@@ -0,0 +1,457 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for AsyncCodeEngineV2
+"""
+
+import asyncio
+import json
+import ssl
+import threading
+import time
+import jwt
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+httpx = pytest.importorskip('httpx')
+
+# pylint: disable=wrong-import-position
+from ibm_code_engine_sdk.async_code_engine_v2 import (
+    AsyncAppsPager,
+    AsyncBuildsPager,
+    AsyncCodeEngineV2,
+    AsyncJobRunsPager,
+    AsyncSecretsPager,
+)
+from ibm_code_engine_sdk.code_engine_v2 import EnvVarPrototype
+
+_base_url = 'https://api.au-syd.codeengine.cloud.ibm.com/v2'
+
+
+def new_service(handler, **kwargs) -> AsyncCodeEngineV2:
+    """
+    Returns an AsyncCodeEngineV2 whose requests are answered by `handler`.
+    """
+    service = AsyncCodeEngineV2(authenticator=NoAuthAuthenticator(), version='2026-03-27', **kwargs)
+    service.set_service_url(_base_url)
+    service.set_async_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return service
+
+
+def paged_handler(collection: str, pages: int, requests: list):
+    """
+    Returns a handler that serves `pages` single-item pages of `collection`.
+    """
+
+    def handler(request):
+        requests.append(request)
+        index = int(request.url.params.get('start', '0'))
+        result = {collection: [{'name': '{}-{}'.format(collection, index)}], 'limit': 1}
+        if index + 1 < pages:
+            result['next'] = {'start': str(index + 1)}
+        return httpx.Response(200, json=result)
+
+    return handler
+
+
+class TestAsyncCodeEngineV2:
+    """
+    Test Class for AsyncCodeEngineV2
+    """
+
+    def test_new_instance(self, monkeypatch):
+        """
+        new_instance()
+        """
+        monkeypatch.setenv('TEST_SERVICE_AUTH_TYPE', 'noAuth')
+
+        service = AsyncCodeEngineV2.new_instance(service_name='TEST_SERVICE')
+
+        assert isinstance(service, AsyncCodeEngineV2)
+
+    def test_list_apps(self):
+        """
+        list_apps()
+        """
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={'apps': [{'name': 'my-app'}], 'limit': 100})
+
+        async def run():
+            async with new_service(handler) as service:
+                return await service.list_apps(project_id='15314cc3-85b4-4338-903f-c28cdee6d005', limit=100)
+
+        response = asyncio.run(run())
+
+        assert response.get_status_code() == 200
+        assert response.get_result()['apps'][0]['name'] == 'my-app'
+        assert len(requests) == 1
+        assert requests[0].method == 'GET'
+        assert requests[0].url.path == '/v2/projects/15314cc3-85b4-4338-903f-c28cdee6d005/apps'
+        assert requests[0].url.params['limit'] == '100'
+        assert requests[0].url.params['version'] == '2026-03-27'
+        assert requests[0].headers['Accept'] == 'application/json'
+        assert 'code-engine-python-sdk' in requests[0].headers['User-Agent']
+
+    def test_create_job_run(self):
+        """
+        create_job_run()
+        """
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(201, json={'name': 'my-job-run'})
+
+        async def run():
+            async with new_service(handler) as service:
+                return await service.create_job_run(
+                    project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+                    job_name='my-job',
+                    run_env_variables=[EnvVarPrototype(type='literal', name='SOME', value='VALUE')],
+                )
+
+        response = asyncio.run(run())
+
+        assert response.get_status_code() == 201
+        assert response.get_result() == {'name': 'my-job-run'}
+        assert bodies[0]['job_name'] == 'my-job'
+        assert bodies[0]['run_env_variables'] == [{'name': 'SOME', 'type': 'literal', 'value': 'VALUE'}]
+
+    def test_delete_app(self):
+        """
+        delete_app()
+        """
+
+        async def run():
+            async with new_service(lambda request: httpx.Response(202)) as service:
+                return await service.delete_app(project_id='15314cc3-85b4-4338-903f-c28cdee6d005', name='my-app')
+
+        response = asyncio.run(run())
+
+        assert response.get_status_code() == 202
+        assert response.get_result() is None
+
+    def test_value_error(self):
+        """
+        Test that parameters are validated before a request is sent.
+        """
+        service = new_service(lambda request: httpx.Response(200))
+
+        with pytest.raises(ValueError):
+            service.get_app(project_id=None, name='my-app')
+
+    def test_api_exception(self):
+        """
+        Test that error responses raise an ApiException.
+        """
+
+        def handler(request):
+            return httpx.Response(404, json={'errors': [{'code': 'not_found', 'message': 'App not found'}]})
+
+        async def run():
+            async with new_service(handler) as service:
+                await service.get_app(project_id='15314cc3-85b4-4338-903f-c28cdee6d005', name='my-app')
+
+        with pytest.raises(ApiException) as e:
+            asyncio.run(run())
+        assert e.value.status_code == 404
+        assert e.value.message == 'App not found'
+
+    def test_retries(self):
+        """
+        Test that retryable responses are retried once retries are enabled.
+        """
+        status_codes = [429, 503, 200]
+
+        def handler(request):
+            return httpx.Response(status_codes.pop(0), headers={'Retry-After': '0'}, json={'apps': []})
+
+        async def run():
+            async with new_service(handler) as service:
+                service.enable_retries(max_retries=3, retry_interval=0.0)
+                return await service.list_apps(project_id='15314cc3-85b4-4338-903f-c28cdee6d005')
+
+        response = asyncio.run(run())
+
+        assert response.get_status_code() == 200
+        assert not status_codes
+
+    def test_concurrent_requests(self):
+        """
+        Test that operations can be awaited concurrently on one client.
+        """
+
+        def handler(request):
+            return httpx.Response(200, json={'name': request.url.path.rsplit('/', 1)[-1]})
+
+        async def run():
+            async with new_service(handler) as service:
+                return await asyncio.gather(
+                    *[
+                        service.get_app(project_id='15314cc3-85b4-4338-903f-c28cdee6d005', name='app-{}'.format(i))
+                        for i in range(10)
+                    ]
+                )
+
+        responses = asyncio.run(run())
+
+        assert [response.get_result()['name'] for response in responses] == ['app-{}'.format(i) for i in range(10)]
+
+    def test_resource_cache(self):
+        """
+        Test that resources reported as not modified are served from the cache.
+        """
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get('If-None-Match') == '1':
+                return httpx.Response(304)
+            return httpx.Response(200, json={'name': 'my-app', 'entity_tag': '1'})
+
+        async def run():
+            async with new_service(handler) as service:
+                service.enable_resource_cache()
+                await service.get_app(project_id='15314cc3-85b4-4338-903f-c28cdee6d005', name='my-app')
+                return await service.get_app(project_id='15314cc3-85b4-4338-903f-c28cdee6d005', name='my-app')
+
+        response = asyncio.run(run())
+
+        assert response.get_status_code() == 200
+        assert response.get_result() == {'name': 'my-app', 'entity_tag': '1'}
+        assert requests[1].headers['If-None-Match'] == '1'
+
+
+class TestAuthenticationAndHttpConfig:
+    """
+    Test Class for the authentication and HTTP settings of AsyncCodeEngineV2
+    """
+
+    def test_token_refresh(self, monkeypatch):
+        """
+        Test that a token is fetched on a worker thread when the request is sent.
+        """
+        authenticator = IAMAuthenticator('my-api-key')
+        threads = []
+
+        def request_token():
+            threads.append(threading.get_ident())
+            now = int(time.time())
+            return {
+                'access_token': jwt.encode(
+                    {'iat': now, 'exp': now + 3600}, 'a-secret-of-at-least-thirty-two-bytes', algorithm='HS256'
+                )
+            }
+
+        monkeypatch.setattr(authenticator.token_manager, 'request_token', request_token)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={'projects': []})
+
+        async def run():
+            service = AsyncCodeEngineV2(authenticator=authenticator)
+            service.set_async_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            assert service.get_authenticator() is authenticator
+            async with service:
+                pending = service.list_projects()
+                # The request is not authenticated before it is sent
+                assert not threads
+                await pending
+                await service.list_projects()
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+
+        assert len(threads) == 1
+        assert threads[0] != loop_thread
+        assert all(request.headers['Authorization'].startswith('Bearer ') for request in requests)
+
+    def test_http_config(self):
+        """
+        Test that the SSL verification, proxies and cookies of the service apply to its httpx client.
+        """
+
+        async def run():
+            service = AsyncCodeEngineV2(authenticator=NoAuthAuthenticator())
+            service.set_http_config({'verify': False, 'proxies': {'https': 'http://proxy.example.com:3128'}})
+            async with service:
+                return service.get_async_http_client(), service.jar
+
+        http_client, jar = asyncio.run(run())
+
+        pattern, transport = [(pattern, transport) for pattern, transport in http_client._mounts.items() if transport][
+            0
+        ]
+        assert pattern.pattern == 'https://'
+        assert transport._pool._proxy_url.host == b'proxy.example.com'
+        assert http_client.cookies.jar is jar
+
+    @pytest.mark.parametrize('cert', ['client.pem', ('client.crt', 'client.key')])
+    def test_client_certificate(self, monkeypatch, cert):
+        """
+        Test that the client certificate of the service is loaded into the SSL context of its httpx client.
+        """
+        loaded = []
+        monkeypatch.setattr(ssl.SSLContext, 'load_cert_chain', lambda context, *args: loaded.append((context, args)))
+
+        async def run():
+            service = AsyncCodeEngineV2(authenticator=NoAuthAuthenticator())
+            service.set_http_config({'cert': cert, 'proxies': {'https': 'http://proxy.example.com:3128'}})
+            async with service:
+                return service.get_async_http_client()
+
+        http_client = asyncio.run(run())
+
+        ((context, args),) = loaded
+        assert args == ((cert,) if isinstance(cert, str) else cert)
+        assert context.verify_mode == ssl.CERT_REQUIRED
+        assert http_client._transport._pool._ssl_context is context
+        assert all(transport._pool._ssl_context is context for transport in http_client._mounts.values())
+
+
+class TestAsyncPagers:
+    """
+    Test Class for the asyncio pagers
+    """
+
+    def test_async_apps_pager_get_all(self):
+        """
+        AsyncAppsPager.get_all()
+        """
+        requests = []
+
+        async def run():
+            async with new_service(paged_handler('apps', 2, requests)) as service:
+                pager = AsyncAppsPager(client=service, project_id='15314cc3-85b4-4338-903f-c28cdee6d005', limit=1)
+                return await pager.get_all()
+
+        all_results = asyncio.run(run())
+
+        assert [app['name'] for app in all_results] == ['apps-0', 'apps-1']
+        assert len(requests) == 2
+        assert not any('start' in request.url.params for request in requests[:1])
+
+    def test_async_job_runs_pager_async_for(self):
+        """
+        async for item in AsyncJobRunsPager
+        """
+        requests = []
+
+        async def run():
+            names = []
+            async with new_service(paged_handler('job_runs', 3, requests)) as service:
+                pager = AsyncJobRunsPager(
+                    client=service,
+                    project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+                    job_name='my-job',
+                    limit=1,
+                )
+                async for job_run in pager:
+                    names.append(job_run['name'])
+                    # Pages are only retrieved once the previous one has been consumed
+                    assert len(requests) == len(names)
+            return names
+
+        names = asyncio.run(run())
+
+        assert names == ['job_runs-0', 'job_runs-1', 'job_runs-2']
+        assert all(request.url.params['job_name'] == 'my-job' for request in requests)
+
+    def test_async_secrets_pager_prefetch(self):
+        """
+        AsyncSecretsPager with prefetch
+        """
+        requests = []
+
+        async def run():
+            async with new_service(paged_handler('secrets', 4, requests)) as service:
+                pager = AsyncSecretsPager(
+                    client=service,
+                    project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+                    limit=1,
+                    prefetch=2,
+                )
+                first_page = await pager.get_next()
+                # Let the background task retrieve the pages ahead of the caller
+                for _ in range(10):
+                    await asyncio.sleep(0)
+                prefetched = len(requests)
+                return first_page + await pager.get_all(), prefetched
+
+        all_results, prefetched = asyncio.run(run())
+
+        assert prefetched == 3
+        assert [secret['name'] for secret in all_results] == ['secrets-0', 'secrets-1', 'secrets-2', 'secrets-3']
+        assert len(requests) == 4
+
+    def test_async_secrets_pager_prefetch_break(self):
+        """
+        AsyncSecretsPager with prefetch, left early
+        """
+        requests = []
+
+        async def run():
+            async with new_service(paged_handler('secrets', 10, requests)) as service:
+                pager = AsyncSecretsPager(
+                    client=service,
+                    project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+                    limit=1,
+                    prefetch=2,
+                )
+                async for _ in pager:
+                    break
+                # Let the event loop close the asynchronous generator
+                for _ in range(10):
+                    await asyncio.sleep(0)
+                task = pager._prefetcher._task  # pylint: disable=protected-access
+                assert task.done()
+                assert not pager.has_next()
+
+        asyncio.run(run())
+
+    def test_async_builds_pager_prefetch_error(self):
+        """
+        AsyncBuildsPager with prefetch and a failing page
+        """
+
+        def handler(request):
+            if 'start' in request.url.params:
+                return httpx.Response(500, json={'errors': [{'message': 'internal error'}]})
+            return httpx.Response(200, json={'builds': [{'name': 'my-build'}], 'next': {'start': '1'}})
+
+        async def run():
+            async with new_service(handler) as service:
+                pager = AsyncBuildsPager(
+                    client=service,
+                    project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+                    prefetch=1,
+                )
+                assert len(await pager.get_next()) == 1
+                with pytest.raises(ApiException):
+                    await pager.get_next()
+                with pytest.raises(ApiException):
+                    await pager.get_next()
+                pager.close()
+                assert not pager.has_next()
+
+        asyncio.run(run())
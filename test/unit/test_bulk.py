@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the bulk module
+"""
+
+import json
+import re
+import threading
+import time
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_code_engine_sdk.bulk import CrossProjectPager, create_job_runs, run_bulk
+from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2
+from ibm_code_engine_sdk.concurrency import AdaptiveConcurrencyLimiter
+
+_service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+
+_base_url = 'https://api.au-syd.codeengine.cloud.ibm.com/v2'
+_service.set_service_url(_base_url)
+
+
+def add_paged_collection(collection: str, pages: int, *, failing_project: str = None):
+    """
+    Registers a mock that serves `pages` single-item pages of `collection` for
+    every project, and a 403 error for `failing_project`.
+    """
+    url = re.compile(_base_url + r'/projects/([^/]+)/' + collection)
+
+    def callback(request):
+        project_id = url.match(request.url).group(1)
+        if project_id == failing_project:
+            return (403, {}, json.dumps({'errors': [{'message': 'forbidden'}]}))
+        index = int(request.params.get('start', '0'))
+        result = {collection: [{'name': '{0}-{1}'.format(project_id, index)}], 'limit': 1}
+        if index + 1 < pages:
+            result['next'] = {'start': str(index + 1)}
+        return (200, {}, json.dumps(result))
+
+    responses.add_callback(responses.GET, url, callback=callback, content_type='application/json')
+
+
+class TestCrossProjectPager:
+    """
+    Test Class for CrossProjectPager
+    """
+
+    @responses.activate
+    def test_get_all(self):
+        """
+        CrossProjectPager.get_all()
+        """
+        add_paged_collection('apps', 2)
+
+        pager = CrossProjectPager(client=_service, project_ids=['p1', 'p2', 'p3'], kind='apps', max_workers=2)
+        all_results = pager.get_all()
+
+        assert sorted((project_id, app['name']) for project_id, app in all_results) == [
+            ('p1', 'p1-0'),
+            ('p1', 'p1-1'),
+            ('p2', 'p2-0'),
+            ('p2', 'p2-1'),
+            ('p3', 'p3-0'),
+            ('p3', 'p3-1'),
+        ]
+        assert pager.errors == {}
+
+    @responses.activate
+    def test_errors_do_not_abort(self):
+        """
+        Test that the failure of one project is reported without aborting the others.
+        """
+        add_paged_collection('secrets', 2, failing_project='p2')
+        errors = []
+
+        pager = CrossProjectPager(
+            client=_service,
+            project_ids=['p1', 'p2', 'p3'],
+            kind='secrets',
+            on_error=lambda project_id, error: errors.append(project_id),
+        )
+        project_ids = {project_id for project_id, _ in pager}
+
+        assert project_ids == {'p1', 'p3'}
+        assert list(pager.errors) == ['p2']
+        assert isinstance(pager.errors['p2'], ApiException)
+        assert pager.errors['p2'].status_code == 403
+        assert errors == ['p2']
+
+    @responses.activate
+    def test_pager_kwargs(self):
+        """
+        Test that additional parameters are passed to the pagers.
+        """
+        add_paged_collection('job_runs', 1)
+
+        pager = CrossProjectPager(client=_service, project_ids=['p1'], kind='job_runs', job_name='my-job', limit=5)
+
+        assert len(pager.get_all()) == 1
+        assert 'job_name=my-job' in responses.calls[0].request.url
+        assert 'limit=5' in responses.calls[0].request.url
+
+    @responses.activate
+    def test_bounded_concurrency(self):
+        """
+        Test that projects are listed concurrently, up to max_workers at a time.
+        """
+        active = []
+        peak = []
+        lock = threading.Lock()
+        url = re.compile(_base_url + r'/projects/([^/]+)/jobs')
+
+        def callback(request):
+            with lock:
+                active.append(request)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(request)
+            return (200, {}, json.dumps({'jobs': [{'name': 'my-job'}]}))
+
+        responses.add_callback(responses.GET, url, callback=callback, content_type='application/json')
+
+        pager = CrossProjectPager(
+            client=_service,
+            project_ids=['p{0}'.format(i) for i in range(12)],
+            kind='jobs',
+            max_workers=4,
+        )
+        started = time.time()
+        all_results = pager.get_all()
+
+        assert len(all_results) == 12
+        assert max(peak) == 4
+        assert time.time() - started < 12 * 0.05
+
+    @responses.activate
+    def test_stop_early(self):
+        """
+        Test that the workers stop when the caller stops iterating.
+        """
+        add_paged_collection('config_maps', 1000)
+
+        pager = CrossProjectPager(client=_service, project_ids=['p1', 'p2'], kind='config_maps', buffer_size=1)
+        results = iter(pager)
+        next(results)
+        results.close()
+        time.sleep(0.3)
+        calls = len(responses.calls)
+        time.sleep(0.3)
+
+        assert len(responses.calls) == calls
+        assert calls < 10
+
+    @responses.activate
+    def test_adaptive_concurrency(self):
+        """
+        Test that the pages throttled by the API are retrieved again within a smaller limit.
+        """
+        throttled = [True, True]
+        url = re.compile(_base_url + r'/projects/([^/]+)/apps')
+
+        def callback(request):
+            project_id = url.match(request.url).group(1)
+            if project_id == 'p2' and throttled:
+                throttled.pop()
+                return (503, {}, json.dumps({'errors': [{'message': 'unavailable'}]}))
+            return (200, {}, json.dumps({'apps': [{'name': project_id}], 'limit': 1}))
+
+        responses.add_callback(responses.GET, url, callback=callback, content_type='application/json')
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+        pager = CrossProjectPager(client=_service, project_ids=['p1', 'p2'], kind='apps', concurrency=limiter)
+
+        assert sorted(project_id for project_id, _ in pager.get_all()) == ['p1', 'p2']
+        assert pager.errors == {}
+        assert limiter.limit < 4
+
+    def test_invalid_kind(self):
+        """
+        Test that an unknown kind of resource is rejected.
+        """
+        with pytest.raises(ValueError):
+            CrossProjectPager(client=_service, project_ids=['p1'], kind='projects')
+
+
+class TestRunBulk:
+    """
+    Test Class for run_bulk and create_job_runs
+    """
+
+    def test_run_bulk(self):
+        """
+        Test that every item is called once, and failures are reported in order.
+        """
+
+        def square(item):
+            if item == 3:
+                raise ValueError('3')
+            return item * item
+
+        results = run_bulk(square, range(5), max_workers=3)
+
+        assert [result.item for result in results] == [0, 1, 2, 3, 4]
+        assert [result.result for result in results] == [0, 1, 4, None, 16]
+        assert isinstance(results[3].error, ValueError)
+
+    def test_create_job_runs(self, emulator, emulator_client):
+        """
+        Test that throttled submissions of job runs are attempted again.
+        """
+        service = emulator_client
+        project_id = service.create_project(name='my-project', resource_group_id='b91e849c').get_result()['id']
+        service.create_job(project_id, image_reference='icr.io/codeengine/helloworld', name='my-job')
+        emulator.fail_next(503, count=3)
+        changes = []
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8, on_change=changes.append)
+
+        results = create_job_runs(
+            service, project_id, [{'job_name': 'my-job'}] * 20, concurrency=limiter, max_workers=4
+        )
+
+        assert all(result.error is None for result in results)
+        assert {result.result['job_name'] for result in results} == {'my-job'}
+        assert len(service.list_job_runs(project_id, limit=100).get_result()['job_runs']) == 20
+        assert changes[0] == 4
+        assert limiter.in_flight == 0
+
+    def test_create_job_runs_errors(self, emulator_client):
+        """
+        Test that failed submissions do not abort the others.
+        """
+        service = emulator_client
+        project_id = service.create_project(name='my-project', resource_group_id='b91e849c').get_result()['id']
+
+        results = create_job_runs(service, project_id, [{'job_name': 'missing-job'}])
+
+        assert results[0].error.status_code == 404
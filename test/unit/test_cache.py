@@ -0,0 +1,476 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the cache module
+"""
+
+import json
+import time
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_code_engine_sdk.cache import CachedRequest, ResourceCache, TTLCache
+from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2
+
+_base_url = 'https://api.au-syd.codeengine.cloud.ibm.com/v2'
+_project_id = '15314cc3-85b4-4338-903f-c28cdee6d005'
+
+
+def new_service() -> CodeEngineV2:
+    """
+    Returns a CodeEngineV2 client with the resource cache enabled.
+    """
+    service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    service.enable_resource_cache()
+    return service
+
+
+def add_conditional_resource(path: str, resource: dict, entity_tag: str):
+    """
+    Registers a mock that answers 304 when the request carries `entity_tag`
+    in the If-None-Match header, and returns `resource` otherwise.
+    """
+
+    def callback(request):
+        if request.headers.get('If-None-Match') == entity_tag:
+            return (304, {}, '')
+        return (200, {'ETag': entity_tag}, json.dumps(resource))
+
+    responses.add_callback(responses.GET, _base_url + path, callback=callback, content_type='application/json')
+
+
+class TestResourceCache:
+    """
+    Test Class for ResourceCache
+    """
+
+    def test_resource_key(self):
+        """
+        resource_key()
+        """
+        cache = ResourceCache()
+
+        assert cache.resource_key('/projects/p1/apps/my-app') == ('p1', 'apps', 'my-app')
+        assert cache.resource_key('/projects/p1/jobs/my%20job') == ('p1', 'jobs', 'my job')
+        assert cache.resource_key('/projects/p1/apps') is None
+        assert cache.resource_key('/projects/p1/apps/my-app/revisions/my-app-00001') is None
+        assert cache.resource_key('/projects/p1/config_maps/my-config-map') is None
+
+    def test_eviction(self):
+        """
+        Test that the least recently used resource is evicted first.
+        """
+        cache = ResourceCache(max_entries=2)
+        for name in ['app-1', 'app-2', 'app-3']:
+            cache.store(('p1', 'apps', name), DetailedResponse(response={'name': name, 'entity_tag': '1'}))
+
+        assert len(cache) == 2
+        assert cache.get('p1', 'apps', 'app-1') is None
+        assert cache.get('p1', 'apps', 'app-3') == {'name': 'app-3', 'entity_tag': '1'}
+
+    def test_invalidate(self):
+        """
+        invalidate()
+        """
+        cache = ResourceCache()
+        for key in [('p1', 'apps', 'a'), ('p1', 'apps', 'b'), ('p1', 'jobs', 'a'), ('p2', 'apps', 'a')]:
+            cache.store(key, DetailedResponse(response={'entity_tag': '1'}))
+
+        cache.invalidate('p1', 'apps', 'a')
+        assert cache.get('p1', 'apps', 'a') is None
+        assert len(cache) == 3
+
+        cache.invalidate('p1')
+        assert len(cache) == 1
+        assert cache.get('p2', 'apps', 'a') is not None
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_max_entries(self):
+        """
+        Test that the cache must hold at least one resource.
+        """
+        with pytest.raises(ValueError):
+            ResourceCache(max_entries=0)
+
+
+class TestConditionalGet:
+    """
+    Test Class for conditional reads through CodeEngineV2
+    """
+
+    @responses.activate
+    def test_get_app_not_modified(self):
+        """
+        Test that a resource reported as not modified is served from the cache.
+        """
+        app = {'name': 'my-app', 'entity_tag': '2385407409', 'status': 'ready'}
+        add_conditional_resource('/projects/{0}/apps/my-app'.format(_project_id), app, '"2385407409"')
+        service = new_service()
+
+        first = service.get_app(project_id=_project_id, name='my-app')
+        second = service.get_app(project_id=_project_id, name='my-app')
+
+        assert first.get_result() == app
+        assert second.get_status_code() == 200
+        assert second.get_result() == app
+        assert 'If-None-Match' not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers['If-None-Match'] == '"2385407409"'
+        assert responses.calls[1].response.status_code == 304
+
+    @responses.activate
+    def test_get_job_modified(self):
+        """
+        Test that a modified resource replaces the cached one.
+        """
+        url = _base_url + '/projects/{0}/jobs/my-job'.format(_project_id)
+        for entity_tag in ['1', '2']:
+            responses.add(
+                responses.GET,
+                url,
+                json={'name': 'my-job', 'entity_tag': entity_tag},
+                status=200,
+            )
+        service = new_service()
+
+        service.get_job(project_id=_project_id, name='my-job')
+        second = service.get_job(project_id=_project_id, name='my-job')
+
+        assert responses.calls[1].request.headers['If-None-Match'] == '1'
+        assert second.get_result()['entity_tag'] == '2'
+        assert service.resource_cache.get(_project_id, 'jobs', 'my-job')['entity_tag'] == '2'
+
+    @responses.activate
+    def test_get_build_not_cached_when_disabled(self):
+        """
+        Test that no conditional reads are sent once the cache is disabled.
+        """
+        add_conditional_resource(
+            '/projects/{0}/builds/my-build'.format(_project_id), {'name': 'my-build', 'entity_tag': '1'}, '1'
+        )
+        service = new_service()
+
+        service.get_build(project_id=_project_id, name='my-build')
+        service.disable_resource_cache()
+        service.get_build(project_id=_project_id, name='my-build')
+
+        assert 'If-None-Match' not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_get_function_caller_if_none_match(self):
+        """
+        Test that an If-None-Match header set by the caller is left untouched.
+        """
+        add_conditional_resource(
+            '/projects/{0}/functions/my-function'.format(_project_id), {'name': 'my-function', 'entity_tag': '1'}, '1'
+        )
+        service = new_service()
+
+        service.get_function(project_id=_project_id, name='my-function')
+        with pytest.raises(ApiException) as e:
+            service.get_function(project_id=_project_id, name='my-function', headers={'If-None-Match': '1'})
+
+        assert e.value.status_code == 304
+
+    @responses.activate
+    def test_get_config_map_not_cached_by_default(self):
+        """
+        Test that only the configured kinds of resource are cached.
+        """
+        responses.add(
+            responses.GET,
+            _base_url + '/projects/{0}/config_maps/my-config-map'.format(_project_id),
+            json={'name': 'my-config-map', 'entity_tag': '1'},
+            status=200,
+        )
+        service = new_service()
+
+        service.get_config_map(project_id=_project_id, name='my-config-map')
+        service.get_config_map(project_id=_project_id, name='my-config-map')
+
+        assert 'If-None-Match' not in responses.calls[1].request.headers
+        assert len(service.resource_cache) == 0
+
+
+class TestWriteThrough:
+    """
+    Test Class for the invalidation of cached resources by writes
+    """
+
+    def test_after_write(self):
+        """
+        ResourceCache.after_write()
+        """
+        cache = ResourceCache()
+        for key in [('p1', 'apps', 'a'), ('p1', 'apps', 'b'), ('p1', 'jobs', 'j'), ('p2', 'apps', 'a')]:
+            cache.store(key, DetailedResponse(response={'entity_tag': '1'}))
+
+        cache.after_write('PATCH', '/projects/p1/apps/a', DetailedResponse(response={'entity_tag': '2'}))
+        assert cache.get('p1', 'apps', 'a') == {'entity_tag': '2'}
+
+        cache.after_write('POST', '/projects/p1/apps', DetailedResponse(response={'name': 'c', 'entity_tag': '1'}))
+        assert cache.get('p1', 'apps', 'c') is not None
+
+        cache.after_write('DELETE', '/projects/p1/apps/b', DetailedResponse(status_code=202))
+        assert cache.get('p1', 'apps', 'b') is None
+
+        cache.after_write('DELETE', '/projects/p1/apps/a/revisions/a-00001', DetailedResponse(status_code=202))
+        assert cache.get('p1', 'apps', 'a') is None
+
+        cache.after_write('PUT', '/projects/p1/config_maps/a', None)
+        cache.after_write('POST', '/projects/p1/job_runs', DetailedResponse(response={'name': 'j-run-1'}))
+        assert cache.get('p1', 'jobs', 'j') is not None
+
+        cache.after_write(
+            'POST',
+            '/projects/p1/bindings',
+            DetailedResponse(response={'component': {'name': 'j', 'resource_type': 'job_v2'}}),
+        )
+        assert cache.get('p1', 'jobs', 'j') is None
+        assert cache.get('p1', 'apps', 'c') is not None
+
+        cache.after_write('DELETE', '/projects/p1/bindings/my-binding', None)
+        assert cache.get('p1', 'apps', 'c') is None
+
+        cache.store(('p1', 'builds', 'b'), DetailedResponse(response={'entity_tag': '1'}))
+        cache.after_write('DELETE', '/projects/p1', DetailedResponse(status_code=202))
+        assert len(cache) == 1
+        assert cache.get('p2', 'apps', 'a') is not None
+
+    def test_failed_write(self):
+        """
+        Test that a failed write removes the resource that it addressed.
+        """
+        resource_cache = ResourceCache()
+        resource_cache.store(('p1', 'apps', 'a'), DetailedResponse(response={'entity_tag': '1'}))
+        request = {'method': 'PATCH', 'params': None, 'headers': {}}
+
+        cached_request = CachedRequest(request, '/projects/p1/apps/a', resource_cache=resource_cache)
+        assert cached_request.before_send(request) is None
+        assert cached_request.on_error(ApiException(412, message='precondition failed')) is None
+
+        assert resource_cache.get('p1', 'apps', 'a') is None
+
+    @responses.activate
+    def test_update_app_refreshes_cache(self):
+        """
+        Test that an updated resource is served as not modified on the next read.
+        """
+        url = _base_url + '/projects/{0}/apps/my-app'.format(_project_id)
+        responses.add(responses.GET, url, json={'name': 'my-app', 'entity_tag': '1'}, status=200)
+        responses.add(responses.PATCH, url, json={'name': 'my-app', 'entity_tag': '2', 'image_port': 8080}, status=200)
+        responses.add(responses.GET, url, status=304)
+        service = new_service()
+
+        service.get_app(project_id=_project_id, name='my-app')
+        service.update_app(project_id=_project_id, name='my-app', if_match='1', app={'image_port': 8080})
+        response = service.get_app(project_id=_project_id, name='my-app')
+
+        assert responses.calls[2].request.headers['If-None-Match'] == '2'
+        assert response.get_result()['image_port'] == 8080
+
+    @responses.activate
+    def test_delete_job_invalidates_cache(self):
+        """
+        Test that a deleted resource is removed from the cache.
+        """
+        url = _base_url + '/projects/{0}/jobs/my-job'.format(_project_id)
+        responses.add(responses.GET, url, json={'name': 'my-job', 'entity_tag': '1'}, status=200)
+        responses.add(responses.DELETE, url, status=202)
+        responses.add(responses.GET, url, json={'errors': [{'message': 'not found'}]}, status=404)
+        service = new_service()
+
+        service.get_job(project_id=_project_id, name='my-job')
+        service.delete_job(project_id=_project_id, name='my-job')
+
+        assert len(service.resource_cache) == 0
+        with pytest.raises(ApiException):
+            service.get_job(project_id=_project_id, name='my-job')
+        assert 'If-None-Match' not in responses.calls[2].request.headers
+
+    @responses.activate
+    def test_read_of_deleted_resource(self):
+        """
+        Test that a resource that was deleted by another client is removed from the cache.
+        """
+        url = _base_url + '/projects/{0}/builds/my-build'.format(_project_id)
+        responses.add(responses.GET, url, json={'name': 'my-build', 'entity_tag': '1'}, status=200)
+        responses.add(responses.GET, url, json={'errors': [{'message': 'not found'}]}, status=404)
+        service = new_service()
+
+        service.get_build(project_id=_project_id, name='my-build')
+        with pytest.raises(ApiException):
+            service.get_build(project_id=_project_id, name='my-build')
+
+        assert len(service.resource_cache) == 0
+
+    @responses.activate
+    def test_delete_project_invalidates_ttl_cache(self):
+        """
+        Test that deleting a project removes its cached endpoint responses.
+        """
+        responses.add(responses.GET, _base_url + '/projects/p1/egress_ips', json={'public': []}, status=200)
+        responses.add(responses.DELETE, _base_url + '/projects/p1', status=202)
+        service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_ttl_cache()
+
+        service.get_project_egress_ips(project_id='p1')
+        service.delete_project(id='p1')
+
+        assert len(service.ttl_cache) == 0
+
+
+class TestTTLCache:
+    """
+    Test Class for TTLCache
+    """
+
+    def test_request_key(self):
+        """
+        request_key()
+        """
+        cache = TTLCache()
+        request = {'method': 'GET', 'params': {'version': '2026-03-27'}}
+
+        assert cache.request_key(request, '/function_runtimes') == (
+            None,
+            'function_runtimes',
+            (('version', '2026-03-27'),),
+        )
+        assert cache.request_key(request, '/projects/p1/egress_ips')[:2] == ('p1', 'egress_ips')
+        assert cache.request_key(request, '/projects/p1/status_details')[:2] == ('p1', 'status_details')
+        assert cache.request_key(request, '/projects/p1/apps') is None
+        assert cache.request_key(request, '/projects/p1/apps/status_details') is None
+        assert cache.request_key(dict(request, method='POST'), '/function_runtimes') is None
+
+    def test_expiry(self, monkeypatch):
+        """
+        Test that responses are only served for their time to live.
+        """
+        now = [1000.0]
+        monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+        cache = TTLCache(ttl=10)
+        key = (None, 'function_runtimes', ())
+        response = DetailedResponse(response={'function_runtimes': []}, status_code=200)
+        cache.store(key, response)
+
+        now[0] += 9
+        assert cache.get_response(key) is response
+        now[0] += 1
+        assert cache.get_response(key) is None
+        assert len(cache) == 0
+
+    def test_eviction_and_invalidate(self):
+        """
+        Test that the least recently used response is evicted first, and that
+        responses can be invalidated explicitly.
+        """
+        cache = TTLCache(max_entries=2)
+        for project_id in ['p1', 'p2', 'p3']:
+            cache.store((project_id, 'egress_ips', ()), DetailedResponse(response={}))
+
+        assert len(cache) == 2
+        assert cache.get_response(('p1', 'egress_ips', ())) is None
+
+        cache.store(('p3', 'status_details', ()), DetailedResponse(response={}))
+        cache.invalidate(project_id='p3')
+        assert len(cache) == 0
+
+    def test_invalid_ttl(self):
+        """
+        Test that the time to live must be positive.
+        """
+        with pytest.raises(ValueError):
+            TTLCache(ttl=0)
+
+
+class TestTTLCacheService:
+    """
+    Test Class for the TTL cache of CodeEngineV2
+    """
+
+    @responses.activate
+    def test_list_function_runtimes(self):
+        """
+        Test that list_function_runtimes is served from the cache.
+        """
+        responses.add(
+            responses.GET,
+            _base_url + '/function_runtimes',
+            json={'function_runtimes': [{'id': 'nodejs-20'}]},
+            status=200,
+        )
+        service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_ttl_cache()
+
+        first = service.list_function_runtimes()
+        second = service.list_function_runtimes()
+
+        assert len(responses.calls) == 1
+        assert second.get_result() == first.get_result()
+
+        service.ttl_cache.invalidate(endpoint='function_runtimes')
+        service.list_function_runtimes()
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_get_project_egress_ips(self):
+        """
+        Test that the responses of different projects are cached separately.
+        """
+        for project_id in ['p1', 'p2']:
+            responses.add(
+                responses.GET,
+                _base_url + '/projects/{0}/egress_ips'.format(project_id),
+                json={'private': ['10.0.0.1'], 'public': ['1.2.3.4']},
+                status=200,
+            )
+        service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_ttl_cache()
+
+        for _ in range(3):
+            service.get_project_egress_ips(project_id='p1')
+            service.get_project_egress_ips(project_id='p2')
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_errors_are_not_cached(self):
+        """
+        Test that error responses are not cached.
+        """
+        url = _base_url + '/projects/p1/status_details'
+        responses.add(responses.GET, url, json={'errors': [{'message': 'unavailable'}]}, status=503)
+        responses.add(responses.GET, url, json={'project': 'enabled'}, status=200)
+        service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_ttl_cache()
+
+        with pytest.raises(ApiException):
+            service.get_project_status_details(project_id='p1')
+        assert service.get_project_status_details(project_id='p1').get_result() == {'project': 'enabled'}
+        assert service.get_project_status_details(project_id='p1').get_result() == {'project': 'enabled'}
+        assert len(responses.calls) == 2
+
+        service.disable_ttl_cache()
+        service.get_project_status_details(project_id='p1')
+        assert len(responses.calls) == 3
@@ -17,7 +17,9 @@
 Unit Tests for CodeEngineV2
 """
 
+from ibm_cloud_sdk_core import ApiException
 from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import gc
 import inspect
 import json
 import os
@@ -25,6 +27,7 @@ import pytest
 import re
 import requests
 import responses
+import time
 import urllib
 from ibm_code_engine_sdk.code_engine_v2 import *
 
@@ -239,6 +242,41 @@ class TestListProjects:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_projects_with_pager_iter(self):
+        """
+        test_list_projects_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects')
+        mock_response1 = '{"next":{"start":"1"},"projects":[{"account_id":"4329073d16d2f3663f74bfa955259139","created_at":"2021-03-29T12:18:13.992359829Z","crn":"crn:v1:bluemix:public:codeengine:eu-de:a/4329073d16d2f3663f74bfa955259139:4e49b3e0-27a8-48d2-a784-c7ee48bb863b::","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b","id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","name":"project-name","region":"us-east","resource_group_id":"5c49eabcf5e85881a37e2d100a33b3df","resource_type":"project_v2","status":"active"}],"total_count":2,"limit":1}'
+        mock_response2 = '{"projects":[{"account_id":"4329073d16d2f3663f74bfa955259139","created_at":"2021-03-29T12:18:13.992359829Z","crn":"crn:v1:bluemix:public:codeengine:eu-de:a/4329073d16d2f3663f74bfa955259139:4e49b3e0-27a8-48d2-a784-c7ee48bb863b::","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b","id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","name":"project-name","region":"us-east","resource_group_id":"5c49eabcf5e85881a37e2d100a33b3df","resource_type":"project_v2","status":"active"}],"total_count":2,"limit":1}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = ProjectsPager(
+            client=_service,
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateProject:
     """
@@ -806,6 +844,42 @@ class TestListAllowedOutboundDestinations:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_allowed_outbound_destinations_with_pager_iter(self):
+        """
+        test_list_allowed_outbound_destinations_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/allowed_outbound_destinations')
+        mock_response1 = '{"next":{"start":"1"},"allowed_outbound_destinations":[{"entity_tag":"2385407409","name":"allow-all","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","status":"ready","status_details":{"endpoint_gateway":{"account_id":"4329073d16d2f3663f74bfa955259139","created_at":"2025-09-13T11:41:35+02:00","ips":["ips"],"name":"my-endpoint-gateway"},"private_path_service_gateway":{"id":"r006-7268d425-59b7-48fd-9735-81a7271657d5","name":"my-private-path-service-gateway","service_endpoints":["service_endpoints"]},"reason":"ready"},"type":"cidr_block","cidr_block":"cidr_block"}],"total_count":2,"limit":1}'
+        mock_response2 = '{"allowed_outbound_destinations":[{"entity_tag":"2385407409","name":"allow-all","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","status":"ready","status_details":{"endpoint_gateway":{"account_id":"4329073d16d2f3663f74bfa955259139","created_at":"2025-09-13T11:41:35+02:00","ips":["ips"],"name":"my-endpoint-gateway"},"private_path_service_gateway":{"id":"r006-7268d425-59b7-48fd-9735-81a7271657d5","name":"my-private-path-service-gateway","service_endpoints":["service_endpoints"]},"reason":"ready"},"type":"cidr_block","cidr_block":"cidr_block"}],"total_count":2,"limit":1}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = AllowedOutboundDestinationsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateAllowedOutboundDestination:
     """
@@ -1845,6 +1919,42 @@ class TestListApps:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_apps_with_pager_iter(self):
+        """
+        test_list_apps_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/apps')
+        mock_response1 = '{"next":{"start":"1"},"total_count":2,"limit":1,"apps":[{"build":"my-build","build_run":"my-build-run","computed_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"created_at":"2022-09-13T11:41:35+02:00","endpoint":"https://my-app.vg67hzldruk.eu-de.codeengine.appdomain.cloud","endpoint_internal":"http://my-app.vg67hzldruk.svc.cluster.local","entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/apps/my-app","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","image_port":8080,"image_reference":"icr.io/codeengine/helloworld","image_secret":"my-secret","managed_domain_mappings":"local_public","name":"my-app","probe_liveness":{"failure_threshold":5,"initial_delay":5,"interval":5,"path":"path","port":8080,"timeout":300,"type":"tcp"},"probe_readiness":{"failure_threshold":5,"initial_delay":5,"interval":5,"path":"path","port":8080,"timeout":300,"type":"tcp"},"project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"app_v2","run_arguments":["run_arguments"],"run_as_user":1001,"run_commands":["run_commands"],"run_compute_resource_token_enabled":true,"run_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"run_service_account":"default","run_volume_mounts":[{"mount_path":"/app","read_only":true,"reference":"my-secret","sub_path":"some-path","type":"secret"}],"scale_concurrency":100,"scale_concurrency_target":80,"scale_cpu_limit":"1","scale_down_delay":300,"scale_ephemeral_storage_limit":"4G","scale_initial_instances":1,"scale_max_instances":10,"scale_memory_limit":"4G","scale_min_instances":1,"scale_request_timeout":300,"status":"ready","status_details":{"latest_created_revision":"my-app-00001","latest_ready_revision":"my-app-00001","reason":"ready"}}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"apps":[{"build":"my-build","build_run":"my-build-run","computed_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"created_at":"2022-09-13T11:41:35+02:00","endpoint":"https://my-app.vg67hzldruk.eu-de.codeengine.appdomain.cloud","endpoint_internal":"http://my-app.vg67hzldruk.svc.cluster.local","entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/apps/my-app","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","image_port":8080,"image_reference":"icr.io/codeengine/helloworld","image_secret":"my-secret","managed_domain_mappings":"local_public","name":"my-app","probe_liveness":{"failure_threshold":5,"initial_delay":5,"interval":5,"path":"path","port":8080,"timeout":300,"type":"tcp"},"probe_readiness":{"failure_threshold":5,"initial_delay":5,"interval":5,"path":"path","port":8080,"timeout":300,"type":"tcp"},"project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"app_v2","run_arguments":["run_arguments"],"run_as_user":1001,"run_commands":["run_commands"],"run_compute_resource_token_enabled":true,"run_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"run_service_account":"default","run_volume_mounts":[{"mount_path":"/app","read_only":true,"reference":"my-secret","sub_path":"some-path","type":"secret"}],"scale_concurrency":100,"scale_concurrency_target":80,"scale_cpu_limit":"1","scale_down_delay":300,"scale_ephemeral_storage_limit":"4G","scale_initial_instances":1,"scale_max_instances":10,"scale_memory_limit":"4G","scale_min_instances":1,"scale_request_timeout":300,"status":"ready","status_details":{"latest_created_revision":"my-app-00001","latest_ready_revision":"my-app-00001","reason":"ready"}}]}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = AppsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateApp:
     """
@@ -2426,6 +2536,43 @@ class TestListAppInstances:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_app_instances_with_pager_iter(self):
+        """
+        test_list_app_instances_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/apps/my-app/instances')
+        mock_response1 = '{"next":{"start":"1"},"instances":[{"app_name":"my-app","created_at":"2022-09-13T11:41:35+02:00","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/apps/my-app/instances","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-app-00001-deployment-6c9b5cf966-wjs44","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"app_instance_v2","revision_name":"my-app","scale_cpu_limit":"1","scale_ephemeral_storage_limit":"4G","scale_memory_limit":"4G","status":"pending","status_details":{"restarts":4,"system_container":{"current_state":{"completed_at":"2022-09-22T17:40:00Z","container_status":"running","exit_code":0,"reason":"some_error_reason","started_at":"2022-09-22T17:34:00Z"},"last_observed_state":{"completed_at":"2022-09-22T17:40:00Z","container_status":"running","exit_code":0,"reason":"some_error_reason","started_at":"2022-09-22T17:34:00Z"}},"user_container":{"current_state":{"completed_at":"2022-09-22T17:40:00Z","container_status":"running","exit_code":0,"reason":"some_error_reason","started_at":"2022-09-22T17:34:00Z"},"last_observed_state":{"completed_at":"2022-09-22T17:40:00Z","container_status":"running","exit_code":0,"reason":"some_error_reason","started_at":"2022-09-22T17:34:00Z"}}}}],"total_count":2,"limit":1}'
+        mock_response2 = '{"instances":[{"app_name":"my-app","created_at":"2022-09-13T11:41:35+02:00","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/apps/my-app/instances","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-app-00001-deployment-6c9b5cf966-wjs44","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"app_instance_v2","revision_name":"my-app","scale_cpu_limit":"1","scale_ephemeral_storage_limit":"4G","scale_memory_limit":"4G","status":"pending","status_details":{"restarts":4,"system_container":{"current_state":{"completed_at":"2022-09-22T17:40:00Z","container_status":"running","exit_code":0,"reason":"some_error_reason","started_at":"2022-09-22T17:34:00Z"},"last_observed_state":{"completed_at":"2022-09-22T17:40:00Z","container_status":"running","exit_code":0,"reason":"some_error_reason","started_at":"2022-09-22T17:34:00Z"}},"user_container":{"current_state":{"completed_at":"2022-09-22T17:40:00Z","container_status":"running","exit_code":0,"reason":"some_error_reason","started_at":"2022-09-22T17:34:00Z"},"last_observed_state":{"completed_at":"2022-09-22T17:40:00Z","container_status":"running","exit_code":0,"reason":"some_error_reason","started_at":"2022-09-22T17:34:00Z"}}}}],"total_count":2,"limit":1}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = AppInstancesPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            app_name='my-app',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestListAppRevisions:
     """
@@ -2633,6 +2780,43 @@ class TestListAppRevisions:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_app_revisions_with_pager_iter(self):
+        """
+        test_list_app_revisions_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/apps/my-app/revisions')
+        mock_response1 = '{"next":{"start":"1"},"total_count":2,"limit":1,"revisions":[{"app_name":"my-app","computed_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"created_at":"2022-09-13T11:41:35+02:00","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/apps/my-app/revisions/my-app-00001","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","image_port":8080,"image_reference":"icr.io/codeengine/helloworld","image_secret":"my-secret","name":"my-app-00001","probe_liveness":{"failure_threshold":5,"initial_delay":5,"interval":5,"path":"path","port":8080,"timeout":300,"type":"tcp"},"probe_readiness":{"failure_threshold":5,"initial_delay":5,"interval":5,"path":"path","port":8080,"timeout":300,"type":"tcp"},"project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"app_revision_v2","run_arguments":["run_arguments"],"run_as_user":1001,"run_commands":["run_commands"],"run_compute_resource_token_enabled":true,"run_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"run_service_account":"default","run_volume_mounts":[{"mount_path":"/app","read_only":true,"reference":"my-secret","sub_path":"some-path","type":"secret"}],"scale_concurrency":100,"scale_concurrency_target":80,"scale_cpu_limit":"1","scale_down_delay":300,"scale_ephemeral_storage_limit":"4G","scale_initial_instances":1,"scale_max_instances":10,"scale_memory_limit":"4G","scale_min_instances":1,"scale_request_timeout":300,"status":"ready","status_details":{"actual_instances":1,"reason":"ready"}}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"revisions":[{"app_name":"my-app","computed_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"created_at":"2022-09-13T11:41:35+02:00","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/apps/my-app/revisions/my-app-00001","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","image_port":8080,"image_reference":"icr.io/codeengine/helloworld","image_secret":"my-secret","name":"my-app-00001","probe_liveness":{"failure_threshold":5,"initial_delay":5,"interval":5,"path":"path","port":8080,"timeout":300,"type":"tcp"},"probe_readiness":{"failure_threshold":5,"initial_delay":5,"interval":5,"path":"path","port":8080,"timeout":300,"type":"tcp"},"project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"app_revision_v2","run_arguments":["run_arguments"],"run_as_user":1001,"run_commands":["run_commands"],"run_compute_resource_token_enabled":true,"run_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"run_service_account":"default","run_volume_mounts":[{"mount_path":"/app","read_only":true,"reference":"my-secret","sub_path":"some-path","type":"secret"}],"scale_concurrency":100,"scale_concurrency_target":80,"scale_cpu_limit":"1","scale_down_delay":300,"scale_ephemeral_storage_limit":"4G","scale_initial_instances":1,"scale_max_instances":10,"scale_memory_limit":"4G","scale_min_instances":1,"scale_request_timeout":300,"status":"ready","status_details":{"actual_instances":1,"reason":"ready"}}]}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = AppRevisionsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            app_name='my-app',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestDeleteAppRevision:
     """
@@ -3678,6 +3862,136 @@ class TestListJobRuns:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_job_runs_with_pager_iter(self):
+        """
+        test_list_job_runs_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/job_runs')
+        mock_response1 = '{"next":{"start":"1"},"job_runs":[{"computed_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"created_at":"2022-09-13T11:41:35+02:00","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/job_runs/my-job-run","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","image_reference":"icr.io/codeengine/helloworld","image_secret":"my-secret","job_name":"my-job","name":"my-job-run","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"job_run_v2","run_arguments":["run_arguments"],"run_as_user":1001,"run_commands":["run_commands"],"run_compute_resource_token_enabled":true,"run_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"run_mode":"task","run_service_account":"default","run_volume_mounts":[{"mount_path":"/app","read_only":true,"reference":"my-secret","sub_path":"some-path","type":"secret"}],"scale_array_size_variable_override":2,"scale_array_spec":"1-5,7-8,10","scale_cpu_limit":"1","scale_ephemeral_storage_limit":"4G","scale_max_execution_time":7200,"scale_memory_limit":"4G","scale_retry_limit":3,"status":"failed","status_details":{"completion_time":"2022-09-22T17:40:00Z","failed":0,"failed_indices":"1,5","indices_details":{"mapKey":{"finished_at":"2024-12-23T16:30:45Z","last_failure_reason":"OOMKilled","retries":3,"started_at":"2024-12-23T16:20:30Z","status":"running"}},"pending":0,"pending_indices":"9,12-15","requested":0,"running":0,"running_indices":"10-11","start_time":"2022-09-22T17:34:00Z","succeeded":1,"succeeded_indices":"2-4,6-8","unknown":0}}],"total_count":2,"limit":1}'
+        mock_response2 = '{"job_runs":[{"computed_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"created_at":"2022-09-13T11:41:35+02:00","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/job_runs/my-job-run","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","image_reference":"icr.io/codeengine/helloworld","image_secret":"my-secret","job_name":"my-job","name":"my-job-run","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"job_run_v2","run_arguments":["run_arguments"],"run_as_user":1001,"run_commands":["run_commands"],"run_compute_resource_token_enabled":true,"run_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"run_mode":"task","run_service_account":"default","run_volume_mounts":[{"mount_path":"/app","read_only":true,"reference":"my-secret","sub_path":"some-path","type":"secret"}],"scale_array_size_variable_override":2,"scale_array_spec":"1-5,7-8,10","scale_cpu_limit":"1","scale_ephemeral_storage_limit":"4G","scale_max_execution_time":7200,"scale_memory_limit":"4G","scale_retry_limit":3,"status":"failed","status_details":{"completion_time":"2022-09-22T17:40:00Z","failed":0,"failed_indices":"1,5","indices_details":{"mapKey":{"finished_at":"2024-12-23T16:30:45Z","last_failure_reason":"OOMKilled","retries":3,"started_at":"2024-12-23T16:20:30Z","status":"running"}},"pending":0,"pending_indices":"9,12-15","requested":0,"running":0,"running_indices":"10-11","start_time":"2022-09-22T17:34:00Z","succeeded":1,"succeeded_indices":"2-4,6-8","unknown":0}}],"total_count":2,"limit":1}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = JobRunsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            job_name='my-job',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_list_job_runs_with_pager_prefetch(self):
+        """
+        test_list_job_runs_with_pager_prefetch()
+        """
+        # Set up a three-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/job_runs')
+        mock_response1 = '{"next":{"start":"1"},"job_runs":[{"name":"my-job-run-1"}],"total_count":3,"limit":1}'
+        mock_response2 = '{"next":{"start":"2"},"job_runs":[{"name":"my-job-run-2"}],"total_count":3,"limit":1}'
+        mock_response3 = '{"job_runs":[{"name":"my-job-run-3"}],"total_count":3,"limit":1}'
+        for mock_response in [mock_response1, mock_response2, mock_response3]:
+            responses.add(
+                responses.GET,
+                url,
+                body=mock_response,
+                content_type='application/json',
+                status=200,
+            )
+
+        # Exercise the pager class for this operation
+        pager = JobRunsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            job_name='my-job',
+            limit=1,
+            prefetch=2,
+        )
+        first_page = pager.get_next()
+        assert len(first_page) == 1
+
+        # The remaining pages are retrieved in the background
+        deadline = time.time() + 5
+        while len(responses.calls) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(responses.calls) == 3
+        assert 'start=1' in responses.calls[1].request.url
+        assert 'start=2' in responses.calls[2].request.url
+
+        all_results = first_page + pager.get_all()
+        assert [job_run['name'] for job_run in all_results] == ['my-job-run-1', 'my-job-run-2', 'my-job-run-3']
+        assert len(responses.calls) == 3
+        assert not pager.has_next()
+
+    @responses.activate
+    def test_list_job_runs_with_pager_prefetch_break(self):
+        """
+        test_list_job_runs_with_pager_prefetch_break()
+        """
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/job_runs')
+        for start in range(5):
+            responses.add(
+                responses.GET,
+                url,
+                body='{"next":{"start":"%d"},"job_runs":[{"name":"my-job-run"}],"limit":1}' % (start + 1),
+                content_type='application/json',
+                status=200,
+            )
+
+        # Leaving the iteration early stops the prefetching thread
+        pager = JobRunsPager(client=_service, project_id='15314cc3-85b4-4338-903f-c28cdee6d005', limit=1, prefetch=2)
+        for _ in pager:
+            break
+        thread = pager._prefetcher._thread  # pylint: disable=protected-access
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not pager.has_next()
+
+    @responses.activate
+    def test_list_job_runs_with_pager_prefetch_abandoned(self):
+        """
+        test_list_job_runs_with_pager_prefetch_abandoned()
+        """
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/job_runs')
+        for start in range(5):
+            responses.add(
+                responses.GET,
+                url,
+                body='{"next":{"start":"%d"},"job_runs":[{"name":"my-job-run"}],"limit":1}' % (start + 1),
+                content_type='application/json',
+                status=200,
+            )
+
+        # Abandoning a pager after get_next() stops the prefetching thread once the pager is collected
+        pager = JobRunsPager(client=_service, project_id='15314cc3-85b4-4338-903f-c28cdee6d005', limit=1, prefetch=1)
+        pager.get_next()
+        prefetcher = pager._prefetcher  # pylint: disable=protected-access
+        prefetcher._pages.get(timeout=5)  # pylint: disable=protected-access
+        del pager
+        gc.collect()
+        prefetcher._thread.join(5)  # pylint: disable=protected-access
+        assert not prefetcher._thread.is_alive()  # pylint: disable=protected-access
+        assert len(responses.calls) == 2
+
 
 class TestCreateJobRun:
     """
@@ -4425,6 +4739,42 @@ class TestListJobs:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_jobs_with_pager_iter(self):
+        """
+        test_list_jobs_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/jobs')
+        mock_response1 = '{"next":{"start":"1"},"total_count":2,"jobs":[{"build":"my-build","build_run":"my-build-run","computed_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"created_at":"2022-09-13T11:41:35+02:00","entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/jobs/my-job","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","image_reference":"icr.io/codeengine/helloworld","image_secret":"my-secret","name":"my-job","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"job_v2","run_arguments":["run_arguments"],"run_as_user":1001,"run_commands":["run_commands"],"run_compute_resource_token_enabled":true,"run_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"run_mode":"task","run_service_account":"default","run_volume_mounts":[{"mount_path":"/app","read_only":true,"reference":"my-secret","sub_path":"some-path","type":"secret"}],"scale_array_spec":"1-5,7-8,10","scale_cpu_limit":"1","scale_ephemeral_storage_limit":"4G","scale_max_execution_time":7200,"scale_memory_limit":"4G","scale_retry_limit":3}],"limit":1}'
+        mock_response2 = '{"total_count":2,"jobs":[{"build":"my-build","build_run":"my-build-run","computed_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"created_at":"2022-09-13T11:41:35+02:00","entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/jobs/my-job","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","image_reference":"icr.io/codeengine/helloworld","image_secret":"my-secret","name":"my-job","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"job_v2","run_arguments":["run_arguments"],"run_as_user":1001,"run_commands":["run_commands"],"run_compute_resource_token_enabled":true,"run_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"run_mode":"task","run_service_account":"default","run_volume_mounts":[{"mount_path":"/app","read_only":true,"reference":"my-secret","sub_path":"some-path","type":"secret"}],"scale_array_spec":"1-5,7-8,10","scale_cpu_limit":"1","scale_ephemeral_storage_limit":"4G","scale_max_execution_time":7200,"scale_memory_limit":"4G","scale_retry_limit":3}],"limit":1}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = JobsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateJob:
     """
@@ -5448,22 +5798,56 @@ class TestListFunctions:
         )
 
         # Exercise the pager class for this operation
-        all_results = []
+        all_results = []
+        pager = FunctionsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            limit=100,
+        )
+        while pager.has_next():
+            next_page = pager.get_next()
+            assert next_page is not None
+            all_results.extend(next_page)
+        assert len(all_results) == 2
+
+    @responses.activate
+    def test_list_functions_with_pager_get_all(self):
+        """
+        test_list_functions_with_pager_get_all()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/functions')
+        mock_response1 = '{"next":{"start":"1"},"functions":[{"code_binary":false,"code_main":"main","code_reference":"data:text/plain;base64,<base64encoded-source-code>","code_secret":"my-secret","computed_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"created_at":"2022-09-13T11:41:35+02:00","endpoint":"https://my-function.vg67hzldruk.eu-de.codeengine.appdomain.cloud","endpoint_internal":"http://my-function.vg67hzldruk.svc.cluster.local","entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/functions/my-function","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","managed_domain_mappings":"local_public","name":"my-function","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"function_v2","run_compute_resource_token_enabled":true,"run_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"runtime":"nodejs-20","scale_concurrency":1,"scale_cpu_limit":"1","scale_down_delay":300,"scale_max_execution_time":60,"scale_memory_limit":"1G","status":"offline","status_details":{"reason":"offline"}}],"total_count":2,"limit":1}'
+        mock_response2 = '{"functions":[{"code_binary":false,"code_main":"main","code_reference":"data:text/plain;base64,<base64encoded-source-code>","code_secret":"my-secret","computed_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"created_at":"2022-09-13T11:41:35+02:00","endpoint":"https://my-function.vg67hzldruk.eu-de.codeengine.appdomain.cloud","endpoint_internal":"http://my-function.vg67hzldruk.svc.cluster.local","entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/functions/my-function","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","managed_domain_mappings":"local_public","name":"my-function","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"function_v2","run_compute_resource_token_enabled":true,"run_env_variables":[{"key":"MY_VARIABLE","name":"SOME","prefix":"PREFIX_","reference":"my-secret","type":"literal","value":"VALUE"}],"runtime":"nodejs-20","scale_concurrency":1,"scale_cpu_limit":"1","scale_down_delay":300,"scale_max_execution_time":60,"scale_memory_limit":"1G","status":"offline","status_details":{"reason":"offline"}}],"total_count":2,"limit":1}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
         pager = FunctionsPager(
             client=_service,
             project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
             limit=100,
         )
-        while pager.has_next():
-            next_page = pager.get_next()
-            assert next_page is not None
-            all_results.extend(next_page)
+        all_results = pager.get_all()
+        assert all_results is not None
         assert len(all_results) == 2
 
     @responses.activate
-    def test_list_functions_with_pager_get_all(self):
+    def test_list_functions_with_pager_iter(self):
         """
-        test_list_functions_with_pager_get_all()
+        test_list_functions_with_pager_iter()
         """
         # Set up a two-page mock response
         url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/functions')
@@ -5490,9 +5874,11 @@ class TestListFunctions:
             project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
             limit=100,
         )
-        all_results = pager.get_all()
-        assert all_results is not None
-        assert len(all_results) == 2
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
 
 
 class TestCreateFunction:
@@ -6448,6 +6834,42 @@ class TestListBindings:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_bindings_with_pager_iter(self):
+        """
+        test_list_bindings_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/bindings')
+        mock_response1 = '{"next":{"start":"1"},"total_count":2,"bindings":[{"component":{"name":"my-app-1","resource_type":"app_v2"},"href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/bindings/my-binding","id":"a172ced-b5f21bc-71ba50c-1638604","prefix":"MY_COS","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","resource_type":"binding_v2","secret_name":"my-service-access","status":"active"}],"limit":1}'
+        mock_response2 = '{"total_count":2,"bindings":[{"component":{"name":"my-app-1","resource_type":"app_v2"},"href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/bindings/my-binding","id":"a172ced-b5f21bc-71ba50c-1638604","prefix":"MY_COS","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","resource_type":"binding_v2","secret_name":"my-service-access","status":"active"}],"limit":1}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = BindingsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateBinding:
     """
@@ -7094,6 +7516,85 @@ class TestListBuildRuns:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_build_runs_with_pager_iter(self):
+        """
+        test_list_build_runs_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/build_runs')
+        mock_response1 = '{"next":{"start":"1"},"total_count":2,"limit":1,"build_runs":[{"build_name":"build_name","created_at":"2022-09-13T11:41:35+02:00","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/build_runs/my-build-run","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-build-run","output_image":"private.de.icr.io/icr_namespace/image-name","output_secret":"ce-auto-icr-private-eu-de","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"build_run_v2","run_build_params":[{"key":"MY_VARIABLE","name":"SOME","reference":"my-secret","type":"literal","value":"VALUE"}],"service_account":"default","source_context_dir":"some/subfolder","source_revision":"main","source_secret":"source_secret","source_type":"git","source_url":"https://github.com/IBM/CodeEngine","status":"succeeded","status_details":{"completion_time":"2022-09-22T17:40:00Z","git_branch_name":"main","git_commit_author":"John Doe","git_commit_sha":"9a3d845c629d2b4a6b271b1d526dfafc1e7d9511","output_digest":"sha256:9a3d845c629d2b4a6b271b1d526dfafc1e7d9511f8863b43b5bb0483ef626384","reason":"succeeded","source_timestamp":"2022-09-22T17:34:00Z","start_time":"2022-09-22T17:34:00Z"},"strategy_size":"medium","strategy_spec_file":"Dockerfile","strategy_type":"dockerfile","timeout":600}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"build_runs":[{"build_name":"build_name","created_at":"2022-09-13T11:41:35+02:00","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/build_runs/my-build-run","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-build-run","output_image":"private.de.icr.io/icr_namespace/image-name","output_secret":"ce-auto-icr-private-eu-de","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"build_run_v2","run_build_params":[{"key":"MY_VARIABLE","name":"SOME","reference":"my-secret","type":"literal","value":"VALUE"}],"service_account":"default","source_context_dir":"some/subfolder","source_revision":"main","source_secret":"source_secret","source_type":"git","source_url":"https://github.com/IBM/CodeEngine","status":"succeeded","status_details":{"completion_time":"2022-09-22T17:40:00Z","git_branch_name":"main","git_commit_author":"John Doe","git_commit_sha":"9a3d845c629d2b4a6b271b1d526dfafc1e7d9511","output_digest":"sha256:9a3d845c629d2b4a6b271b1d526dfafc1e7d9511f8863b43b5bb0483ef626384","reason":"succeeded","source_timestamp":"2022-09-22T17:34:00Z","start_time":"2022-09-22T17:34:00Z"},"strategy_size":"medium","strategy_spec_file":"Dockerfile","strategy_type":"dockerfile","timeout":600}]}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = BuildRunsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            build_name='my-build',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_list_build_runs_with_pager_prefetch_error(self):
+        """
+        test_list_build_runs_with_pager_prefetch_error()
+        """
+        # Set up a mock response whose second page fails
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/build_runs')
+        mock_response1 = '{"next":{"start":"1"},"build_runs":[{"name":"my-build-run-1"}],"total_count":2,"limit":1}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body='{"errors":[{"code":"internal_error"}]}',
+            content_type='application/json',
+            status=500,
+        )
+
+        # Exercise the pager class for this operation
+        pager = BuildRunsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            build_name='my-build',
+            limit=1,
+            prefetch=1,
+        )
+        assert pager.get_next()[0]['name'] == 'my-build-run-1'
+        with pytest.raises(ApiException) as e:
+            pager.get_next()
+        assert e.value.status_code == 500
+
+        # The error is reported again rather than blocking the caller
+        with pytest.raises(ApiException):
+            pager.get_next()
+        pager.close()
+        assert not pager.has_next()
+
 
 class TestCreateBuildRun:
     """
@@ -7786,6 +8287,42 @@ class TestListBuilds:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_builds_with_pager_iter(self):
+        """
+        test_list_builds_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/builds')
+        mock_response1 = '{"next":{"start":"1"},"total_count":2,"limit":1,"builds":[{"created_at":"2022-09-13T11:41:35+02:00","entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/builds/my-build","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-build","output_image":"private.de.icr.io/icr_namespace/image-name","output_secret":"ce-auto-icr-private-eu-de","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"build_v2","run_build_params":[{"key":"MY_VARIABLE","name":"SOME","reference":"my-secret","type":"literal","value":"VALUE"}],"source_context_dir":"some/subfolder","source_revision":"main","source_secret":"source_secret","source_type":"git","source_url":"https://github.com/IBM/CodeEngine","status":"ready","status_details":{"reason":"registered"},"strategy_size":"medium","strategy_spec_file":"Dockerfile","strategy_type":"dockerfile","timeout":600}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"builds":[{"created_at":"2022-09-13T11:41:35+02:00","entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/builds/my-build","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-build","output_image":"private.de.icr.io/icr_namespace/image-name","output_secret":"ce-auto-icr-private-eu-de","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"build_v2","run_build_params":[{"key":"MY_VARIABLE","name":"SOME","reference":"my-secret","type":"literal","value":"VALUE"}],"source_context_dir":"some/subfolder","source_revision":"main","source_secret":"source_secret","source_type":"git","source_url":"https://github.com/IBM/CodeEngine","status":"ready","status_details":{"reason":"registered"},"strategy_size":"medium","strategy_spec_file":"Dockerfile","strategy_type":"dockerfile","timeout":600}]}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = BuildsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateBuild:
     """
@@ -8719,6 +9256,42 @@ class TestListDomainMappings:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_domain_mappings_with_pager_iter(self):
+        """
+        test_list_domain_mappings_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/domain_mappings')
+        mock_response1 = '{"next":{"start":"1"},"domain_mappings":[{"cname_target":"custom.abcdabcdabc.us-east.codeengine.appdomain.cloud","component":{"name":"my-app-1","resource_type":"app_v2"},"created_at":"2022-09-13T11:41:35+02:00","entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/domain_mappings/www.example.com","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"www.example.com","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"domain_mapping_v2","status":"ready","status_details":{"reason":"ready"},"tls_secret":"my-tls-secret","user_managed":true,"visibility":"public"}],"total_count":2,"limit":1}'
+        mock_response2 = '{"domain_mappings":[{"cname_target":"custom.abcdabcdabc.us-east.codeengine.appdomain.cloud","component":{"name":"my-app-1","resource_type":"app_v2"},"created_at":"2022-09-13T11:41:35+02:00","entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/domain_mappings/www.example.com","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"www.example.com","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"domain_mapping_v2","status":"ready","status_details":{"reason":"ready"},"tls_secret":"my-tls-secret","user_managed":true,"visibility":"public"}],"total_count":2,"limit":1}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = DomainMappingsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateDomainMapping:
     """
@@ -9533,6 +10106,42 @@ class TestListConfigMaps:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_config_maps_with_pager_iter(self):
+        """
+        test_list_config_maps_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/config_maps')
+        mock_response1 = '{"next":{"start":"1"},"config_maps":[{"created_at":"2022-09-13T11:41:35+02:00","data":{"mapKey":"inner"},"entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/config_maps/my-config-map","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-config-map","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"config_map_v2"}],"total_count":2,"limit":1}'
+        mock_response2 = '{"config_maps":[{"created_at":"2022-09-13T11:41:35+02:00","data":{"mapKey":"inner"},"entity_tag":"2385407409","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/config_maps/my-config-map","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-config-map","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"config_map_v2"}],"total_count":2,"limit":1}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = ConfigMapsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateConfigMap:
     """
@@ -10258,6 +10867,43 @@ class TestListSecrets:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_secrets_with_pager_iter(self):
+        """
+        test_list_secrets_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/secrets')
+        mock_response1 = '{"next":{"start":"1"},"total_count":2,"limit":1,"secrets":[{"created_at":"2022-09-13T11:41:35+02:00","data":{"mapKey":"inner"},"entity_tag":"2385407409","format":"generic","generated_by":"user","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/secrets/my-secret","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-secret","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"secret_v2","service_access":{"resource_key":{"id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","name":"name"},"role":{"crn":"crn:v1:bluemix:public:iam::::serviceRole:Writer","name":"Manager"},"service_instance":{"id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","type":"type"},"serviceid":{"crn":"crn","id":"ServiceId-8fa4bc74-6441-4e5b-af3a-2b1af325a637"}},"service_operator":{"apikey_id":"ApiKey-17041d26-55e4-40a8-8ab5-5a69b68e204b","resource_group_ids":["resource_group_ids"],"serviceid":{"crn":"crn","id":"ServiceId-8fa4bc74-6441-4e5b-af3a-2b1af325a637"},"user_managed":true}}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"secrets":[{"created_at":"2022-09-13T11:41:35+02:00","data":{"mapKey":"inner"},"entity_tag":"2385407409","format":"generic","generated_by":"user","href":"https://api.eu-de.codeengine.cloud.ibm.com/v2/projects/4e49b3e0-27a8-48d2-a784-c7ee48bb863b/secrets/my-secret","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-secret","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"secret_v2","service_access":{"resource_key":{"id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","name":"name"},"role":{"crn":"crn:v1:bluemix:public:iam::::serviceRole:Writer","name":"Manager"},"service_instance":{"id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","type":"type"},"serviceid":{"crn":"crn","id":"ServiceId-8fa4bc74-6441-4e5b-af3a-2b1af325a637"}},"service_operator":{"apikey_id":"ApiKey-17041d26-55e4-40a8-8ab5-5a69b68e204b","resource_group_ids":["resource_group_ids"],"serviceid":{"crn":"crn","id":"ServiceId-8fa4bc74-6441-4e5b-af3a-2b1af325a637"},"user_managed":true}}]}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = SecretsPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            format='ssh_auth',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateSecret:
     """
@@ -11170,6 +11816,42 @@ class TestListPersistentDataStores:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_persistent_data_stores_with_pager_iter(self):
+        """
+        test_list_persistent_data_stores_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/projects/15314cc3-85b4-4338-903f-c28cdee6d005/persistent_data_stores')
+        mock_response1 = '{"next":{"start":"1"},"persistent_data_stores":[{"created_at":"2022-09-13T11:41:35+02:00","data":{"bucket_location":"bucket_location","bucket_name":"bucket_name","secret_name":"secret_name"},"entity_tag":"2385407409","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-persistent-data-store","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"persistent_data_store_v2","storage_type":"object_storage"}],"total_count":2,"limit":1}'
+        mock_response2 = '{"persistent_data_stores":[{"created_at":"2022-09-13T11:41:35+02:00","data":{"bucket_location":"bucket_location","bucket_name":"bucket_name","secret_name":"secret_name"},"entity_tag":"2385407409","id":"e33b1cv7-7390-4437-a5c2-130d5ccdddc3","name":"my-persistent-data-store","project_id":"4e49b3e0-27a8-48d2-a784-c7ee48bb863b","region":"us-east","resource_type":"persistent_data_store_v2","storage_type":"object_storage"}],"total_count":2,"limit":1}'
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response1,
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=mock_response2,
+            content_type='application/json',
+            status=200,
+        )
+
+        # Exercise the pager class for this operation
+        pager = PersistentDataStoresPager(
+            client=_service,
+            project_id='15314cc3-85b4-4338-903f-c28cdee6d005',
+            limit=100,
+        )
+        results = iter(pager)
+        assert next(results) is not None
+        assert len(responses.calls) == 1
+        assert len(list(results)) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreatePersistentDataStore:
     """
@@ -14031,6 +14713,25 @@ class TestModel_JobRunStatus:
         job_run_status_model_json2 = job_run_status_model.to_dict()
         assert job_run_status_model_json2 == job_run_status_model_json
 
+    def test_job_run_status_index_sets(self):
+        """
+        Test the index sets of JobRunStatus
+        """
+        job_run_status_model = JobRunStatus.from_dict(
+            {'failed_indices': '3,7-9', 'succeeded_indices': '0-2,4-6,10-9999', 'running_indices': ''}
+        )
+
+        assert 8 in job_run_status_model.failed_index_set
+        assert job_run_status_model.failed_index_set is job_run_status_model.failed_index_set
+        assert len(job_run_status_model.succeeded_index_set) == 9996
+        assert not job_run_status_model.running_index_set
+        assert not job_run_status_model.pending_index_set
+        assert job_run_status_model.get_retry_array_spec() == '3,7-9'
+        assert JobRunStatus(failed_indices='').get_retry_array_spec() is None
+        assert job_run_status_model.to_dict()['failed_indices'] == '3,7-9'
+        job_run_status_model.failed_indices = '3'
+        assert job_run_status_model.get_retry_array_spec() == '3'
+
 
 class TestModel_ListFirstMetadata:
     """
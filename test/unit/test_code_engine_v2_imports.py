@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the lazy imports of the code_engine_v2 module
+"""
+
+import json
+import pickle
+import subprocess
+import sys
+import pytest
+from ibm_code_engine_sdk import code_engine_v2
+
+# Prints the submodules of code_engine_v2 that a statement imports.
+_SCRIPT = '''
+import json, sys
+{0}
+print(json.dumps(sorted(name for name in sys.modules if name.startswith('ibm_code_engine_sdk.code_engine_v2.'))))
+'''
+
+
+def imported_submodules(statement: str) -> list:
+    """
+    Returns the submodules of code_engine_v2 that a statement imports in a new interpreter.
+    """
+    output = subprocess.run(
+        [sys.executable, '-c', _SCRIPT.format(statement)], check=True, capture_output=True, text=True
+    ).stdout
+    return [name[len(code_engine_v2.__name__) + 1 :] for name in json.loads(output)]
+
+
+class TestImports:
+    """
+    Test Class for the lazy imports of code_engine_v2
+    """
+
+    def test_import_client(self):
+        """
+        Test that importing the client does not import the models and the pagers.
+        """
+        assert imported_submodules('from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2') == ['service']
+
+    def test_import_model(self):
+        """
+        Test that importing a model only imports the models of its resource family and the models that they use.
+        """
+        assert imported_submodules('from ibm_code_engine_sdk.code_engine_v2 import JobRun') == [
+            'models',
+            'models.common',
+            'models.jobs',
+        ]
+
+    def test_import_pager(self):
+        """
+        Test that importing a pager imports the client but no models.
+        """
+        assert imported_submodules('from ibm_code_engine_sdk.code_engine_v2 import JobRunsPager') == [
+            'pagers',
+            'service',
+        ]
+
+    def test_all_names(self):
+        """
+        Test that every exported name is defined by its submodule.
+        """
+        for name in code_engine_v2.__all__:
+            value = getattr(code_engine_v2, name)
+            assert value.__name__ == name
+            assert value.__module__.startswith(code_engine_v2.__name__ + '.')
+        assert set(code_engine_v2.__all__) <= set(dir(code_engine_v2))
+
+    def test_unknown_name(self):
+        """
+        Test that an unknown name raises an AttributeError.
+        """
+        with pytest.raises(AttributeError):
+            code_engine_v2.UnknownModel  # pylint: disable=pointless-statement
+        with pytest.raises(ImportError):
+            from ibm_code_engine_sdk.code_engine_v2 import (  # pylint: disable=import-outside-toplevel,unused-import
+                UnknownModel,
+            )
+
+    def test_pickle(self):
+        """
+        Test that models can be pickled and unpickled.
+        """
+        env_var = code_engine_v2.EnvVar(type='literal', name='NAME', value='value')
+
+        assert pickle.loads(pickle.dumps(env_var)) == env_var
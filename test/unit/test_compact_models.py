@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the compact_models module
+"""
+
+import copy
+import pickle
+import pytest
+from ibm_code_engine_sdk import code_engine_v2, compact_models
+
+env_var_model = {
+    'key': 'MY_VARIABLE',
+    'name': 'SOME',
+    'prefix': 'PREFIX_',
+    'reference': 'my-secret',
+    'type': 'literal',
+    'value': 'VALUE',
+}
+
+volume_mount_model = {
+    'mount_path': '/app',
+    'read_only': True,
+    'reference': 'my-secret',
+    'sub_path': 'some-path',
+    'type': 'secret',
+}
+
+job_run_model_json = {
+    'computed_env_variables': [env_var_model],
+    'image_reference': 'icr.io/codeengine/helloworld',
+    'job_name': 'my-job',
+    'name': 'my-job-run',
+    'run_arguments': ['testString'],
+    'run_commands': ['testString'],
+    'run_env_variables': [env_var_model, dict(env_var_model, name='OTHER')],
+    'run_mode': 'task',
+    'run_volume_mounts': [volume_mount_model],
+    'scale_array_spec': '1-5,7-8,10',
+    'status': 'failed',
+    'status_details': {'failed_indices': '3', 'indices_details': {'3': {'retries': 1}}},
+}
+
+
+class TestCompactModels:
+    """
+    Test Class for compact_models
+    """
+
+    def test_all_models(self):
+        """
+        Test that every model has a compact variant with the same properties and enums.
+        """
+        for name in code_engine_v2.__all__:
+            model = getattr(code_engine_v2, name)
+            if isinstance(model, type) and 'to_dict' in vars(model):
+                compact_model = getattr(compact_models, name)
+                assert compact_model is not model
+                assert compact_model.__module__ == compact_models.__name__
+                assert compact_model.__doc__ == model.__doc__
+        assert compact_models.JobRun.StatusEnum is code_engine_v2.JobRun.StatusEnum
+
+    def test_job_run_serialization(self):
+        """
+        Test serialization/deserialization for compact JobRun
+        """
+        job_run_model = compact_models.JobRun.from_dict(job_run_model_json)
+
+        assert not hasattr(job_run_model, '__dict__')
+        assert isinstance(job_run_model.run_env_variables[0], compact_models.EnvVar)
+        assert isinstance(job_run_model.run_volume_mounts[0], compact_models.VolumeMount)
+        assert isinstance(job_run_model.status_details, compact_models.JobRunStatus)
+        assert isinstance(job_run_model.status_details.indices_details['3'], compact_models.IndexDetails)
+        assert job_run_model.to_dict() == job_run_model_json
+        assert job_run_model.to_dict() == code_engine_v2.JobRun.from_dict(job_run_model_json).to_dict()
+        assert job_run_model.status_details.failed_index_set == job_run_model.status_details.failed_index_set
+        assert 3 in job_run_model.status_details.failed_index_set
+
+    def test_equality(self):
+        """
+        Test that compact models compare by their properties.
+        """
+        job_run_model = compact_models.JobRun.from_dict(job_run_model_json)
+        job_run_model2 = compact_models.JobRun.from_dict(job_run_model_json)
+
+        assert job_run_model == job_run_model2
+        job_run_model2.run_env_variables[1].value = 'CHANGED'
+        assert job_run_model != job_run_model2
+        assert job_run_model != code_engine_v2.JobRun.from_dict(job_run_model_json)
+
+    def test_constructor(self):
+        """
+        Test that compact models have the constructors of the models.
+        """
+        env_var = compact_models.EnvVar(type='literal', name='SOME', value='VALUE')
+
+        assert env_var.to_dict() == {'type': 'literal', 'name': 'SOME', 'value': 'VALUE'}
+        with pytest.raises(AttributeError):
+            env_var.unknown = 'value'
+        with pytest.raises(TypeError):
+            compact_models.EnvVar(name='SOME')
+
+    def test_copy_and_pickle(self):
+        """
+        Test that compact models can be copied and pickled.
+        """
+        job_run_model = compact_models.JobRun.from_dict(job_run_model_json)
+
+        assert copy.deepcopy(job_run_model) == job_run_model
+        assert pickle.loads(pickle.dumps(job_run_model)) == job_run_model
+
+    def test_subclasses(self):
+        """
+        Test the compact variants of the models with subclasses.
+        """
+        patch = compact_models.AllowedOutboundDestinationPatchCidrBlockDataPatch(cidr_block='10.0.0.0/24')
+
+        assert isinstance(patch, compact_models.AllowedOutboundDestinationPatch)
+        assert not hasattr(patch, '__dict__')
+        assert patch.to_dict() == {'cidr_block': '10.0.0.0/24'}
+        with pytest.raises(Exception):
+            compact_models.AllowedOutboundDestinationPatch()
+
+    def test_additional_properties(self):
+        """
+        Test the compact variants of the models with additional properties.
+        """
+        secret_data = compact_models.SecretDataGenericSecretData.from_dict({'key1': 'value1'})
+
+        assert secret_data.to_dict() == {'key1': 'value1'}
+        assert secret_data == compact_models.SecretDataGenericSecretData(key1='value1')
+        assert secret_data != compact_models.SecretDataGenericSecretData(key1='value2')
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the concurrency module
+"""
+
+import threading
+import time
+import pytest
+import requests
+from ibm_cloud_sdk_core import ApiException
+from ibm_code_engine_sdk.concurrency import AdaptiveConcurrencyLimiter, get_retry_after
+from ibm_code_engine_sdk.metrics import MetricsCollector
+from ibm_code_engine_sdk.waiters import Backoff
+
+
+def throttled(status_code=429, retry_after=None):
+    """
+    Returns the error of a throttled call.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return ApiException(status_code, message='throttled', http_response=response)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """
+    Test Class for AdaptiveConcurrencyLimiter
+    """
+
+    def test_additive_increase(self):
+        """
+        Test that the limit grows by one per window of calls of stable latency.
+        """
+        changes = []
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4, on_change=changes.append)
+
+        for _ in range(2):
+            limiter.release(limiter.acquire(), latency=0.1)
+        assert limiter.limit == 3
+        for _ in range(3):
+            limiter.release(limiter.acquire(), latency=0.1)
+        assert limiter.limit == 4
+        for _ in range(10):
+            limiter.release(limiter.acquire(), latency=0.1)
+        assert limiter.limit == 4
+        assert changes == [3, 4]
+
+    def test_latency(self):
+        """
+        Test that the limit does not grow while the latency is high.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_tolerance=2.0)
+        limiter.release(limiter.acquire(), latency=0.1)
+
+        for _ in range(10):
+            limiter.release(limiter.acquire(), latency=0.5)
+        assert limiter.limit == 2
+
+    def test_clock(self):
+        """
+        Test that call() measures the latency of the calls with the clock of the limiter.
+        """
+        now = [0.0]
+        latencies = iter([0.1, 0.1, 0.5, 0.5, 0.5])
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4, clock=lambda: now[0])
+
+        def get():
+            now[0] += next(latencies)
+
+        for _ in range(2):
+            limiter.call(get)
+        assert limiter.limit == 3
+        for _ in range(3):
+            limiter.call(get)
+        assert limiter.limit == 3
+
+    def test_multiplicative_decrease(self):
+        """
+        Test that throttling halves the limit once for the calls in flight at the time.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=3)
+        tickets = [limiter.acquire() for _ in range(8)]
+
+        for ticket in tickets:
+            limiter.release(ticket, throttled=True)
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+        limiter.release(limiter.acquire(), throttled=True)
+        assert limiter.limit == 3
+
+    def test_limit(self):
+        """
+        Test that no more calls than the limit are in flight.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        in_flight = []
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                in_flight.append(limiter.in_flight)
+            time.sleep(0.01)
+
+        threads = [threading.Thread(target=limiter.call, args=(work,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max(in_flight) == 2
+        assert limiter.in_flight == 0
+
+    def test_retry_after(self):
+        """
+        Test that a Retry-After header holds back the next calls.
+        """
+        limiter = AdaptiveConcurrencyLimiter()
+        limiter.release(limiter.acquire(), throttled=True, retry_after=0.1)
+
+        start = time.monotonic()
+        limiter.release(limiter.acquire())
+        assert time.monotonic() - start >= 0.09
+
+    def test_call(self):
+        """
+        Test that a throttled call is attempted again, and other errors are raised.
+        """
+        sleeps = []
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_attempts=3, sleep=sleeps.append)
+        errors = [throttled(503), throttled(429, retry_after='0')]
+
+        def create():
+            if errors:
+                raise errors.pop(0)
+            return 'created'
+
+        # Halved twice by the throttled attempts, and grown by the successful one.
+        assert limiter.call(create) == 'created'
+        assert limiter.limit == 2
+        # Only the call throttled without a Retry-After header waits for the backoff.
+        assert len(sleeps) == 1 and 0.05 <= sleeps[0] <= 0.1
+
+        def get():
+            raise throttled(404)
+
+        with pytest.raises(ApiException):
+            limiter.call(get)
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
+
+    def test_max_attempts(self):
+        """
+        Test that a call throttled on every attempt raises the last error.
+        """
+        limiter = AdaptiveConcurrencyLimiter(max_attempts=2, sleep=lambda seconds: None)
+        attempts = []
+
+        def create():
+            attempts.append(1)
+            raise throttled(503)
+
+        with pytest.raises(ApiException):
+            limiter.call(create)
+        assert len(attempts) == 2
+
+    def test_backoff(self):
+        """
+        Test that the attempts of a call throttled without a Retry-After header are spaced by the backoff.
+        """
+        sleeps = []
+        limiter = AdaptiveConcurrencyLimiter(
+            max_attempts=4, backoff=Backoff(delay=1, max_delay=3, jitter=0), sleep=sleeps.append
+        )
+
+        def create():
+            raise throttled(503)
+
+        with pytest.raises(ApiException):
+            limiter.call(create)
+        assert sleeps == [1, 2, 3]
+
+    def test_metrics_sink(self):
+        """
+        Test that the limit is reported to a metrics sink.
+        """
+        collector = MetricsCollector()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, metrics_sink=collector)
+        assert collector.concurrency_limit == 4
+
+        limiter.release(limiter.acquire(), throttled=True)
+        assert collector.concurrency_limit == 2
+
+        AdaptiveConcurrencyLimiter(initial_limit=3, metrics_sink=collector)
+        assert collector.concurrency_limit == 5
+
+    def test_get_retry_after(self):
+        """
+        Test the parsing of the Retry-After header.
+        """
+        assert get_retry_after(throttled(retry_after='3')) == 3.0
+        assert get_retry_after(throttled()) is None
+        assert get_retry_after(ApiException(500, message='error')) is None
+
+    def test_invalid(self):
+        """
+        Test the validation of the arguments.
+        """
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=100, max_limit=10)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(decrease_factor=1)
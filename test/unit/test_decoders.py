@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the decoders module
+"""
+
+import importlib.util
+import inspect
+import os
+import sys
+import pytest
+from ibm_code_engine_sdk import code_engine_v2, compact_models
+from ibm_code_engine_sdk.code_engine_v2 import EnvVar, JobRun, SecretDataGenericSecretData
+from ibm_code_engine_sdk.decoders import ModelField, get_fields, install_decoders
+
+_models = [
+    model
+    for model in (getattr(code_engine_v2, name) for name in code_engine_v2.__all__)
+    if isinstance(model, type) and 'from_dict' in vars(model)
+]
+
+
+def original(model: type):
+    """
+    Returns the generated from_dict() of a model.
+    """
+    from_dict = vars(model)['from_dict'].__func__
+    return getattr(from_dict, '__wrapped__', from_dict)
+
+
+# The models whose from_dict() follows the generated patterns.
+_decoded_models = [model for model in _models if get_fields(model) is not None]
+
+
+def sample(model: type, *, required_only: bool = False) -> dict:
+    """
+    Returns the dict of an instance of `model` with every property set.
+    """
+    result = {}
+    for field in get_fields(model):
+        name = field.name
+        if required_only and not field.required:
+            continue
+        nested = getattr(code_engine_v2, field.model) if field.model else None
+        result[name] = {
+            'value': lambda: '{0}-value'.format(name),
+            'model': lambda: sample(nested, required_only=required_only),
+            'list': lambda: [sample(nested, required_only=required_only)] * 2,
+            'dict': lambda: {'a': sample(nested, required_only=required_only)},
+        }[field.kind]()
+    return result
+
+
+def assert_identical(decoded, expected):
+    """
+    Asserts that two models have the same type and the same properties, in the same order.
+    """
+    assert type(decoded) is type(expected)
+    assert list(vars(decoded)) == list(vars(expected))
+    for name, value in vars(expected).items():
+        if isinstance(value, list):
+            assert len(vars(decoded)[name]) == len(value)
+            for item, expected_item in zip(vars(decoded)[name], value):
+                assert_identical(item, expected_item)
+        elif hasattr(value, '__dict__'):
+            assert_identical(vars(decoded)[name], value)
+        else:
+            assert vars(decoded)[name] == value
+
+
+class TestDecoders:
+    """
+    Test Class for the generated decoders
+    """
+
+    @pytest.mark.parametrize('model', _decoded_models, ids=lambda model: model.__name__)
+    def test_identical_models(self, model):
+        """
+        Test that the decoder of every model creates the same instance as its generated from_dict().
+        """
+        for required_only in (False, True):
+            _dict = sample(model, required_only=required_only)
+
+            assert_identical(model.from_dict(_dict), original(model)(model, _dict))
+
+    def test_decoder_replaces_itself(self):
+        """
+        Test that the decoder of a model is generated on its first use.
+        """
+        EnvVar.from_dict({'type': 'literal', 'value': 'v'})
+
+        decoder = vars(EnvVar)['from_dict'].__func__
+        assert decoder.__wrapped__ is original(EnvVar)
+        assert decoder.__name__ == 'from_dict'
+        assert decoder.__doc__ == original(EnvVar).__doc__
+        assert EnvVar.from_dict({'type': 'literal', 'value': 'v'}) == EnvVar(type='literal', value='v')
+
+    def test_required_property(self):
+        """
+        Test that a missing required property raises the same error.
+        """
+        job_run = sample(JobRun, required_only=True)
+        assert job_run
+        for key in job_run:
+            _dict = dict(job_run)
+            del _dict[key]
+            with pytest.raises(ValueError) as expected:
+                original(JobRun)(JobRun, _dict)
+            with pytest.raises(ValueError) as e:
+                JobRun.from_dict(_dict)
+            assert str(e.value) == str(expected.value)
+
+    def test_additional_properties(self):
+        """
+        Test that models with additional properties keep their from_dict().
+        """
+        secret_data = SecretDataGenericSecretData.from_dict({'key': 'value'})
+
+        assert not hasattr(vars(SecretDataGenericSecretData)['from_dict'].__func__, '__wrapped__')
+        assert len(_decoded_models) == len(_models) - 7
+        assert secret_data.to_dict() == {'key': 'value'}
+
+    def test_default_values(self):
+        """
+        Test that the defaults of the constructor apply to missing properties.
+        """
+
+        class Model:
+            def __init__(self, name: str, *, mode: str = 'task', labels: list = None) -> None:
+                self.mode = mode
+                self.name = name
+                self.labels = labels
+
+            @classmethod
+            def from_dict(cls, _dict: dict) -> 'Model':
+                args = {}
+                if (name := _dict.get('name')) is not None:
+                    args['name'] = name
+                else:
+                    raise ValueError('Required property \'name\' not present in Model JSON')
+                if (mode := _dict.get('mode')) is not None:
+                    args['mode'] = mode
+                return cls(**args)
+
+        install_decoders([Model], {}, {'Model': (ModelField('name', required=True), ModelField('mode'))})
+
+        assert vars(Model.from_dict({'name': 'a'})) == {'mode': 'task', 'name': 'a', 'labels': None}
+        assert vars(Model.from_dict({'name': 'a', 'mode': 'daemon'}))['mode'] == 'daemon'
+        assert vars(Model)['from_dict'].__func__.__code__.co_filename == '<Model decoder>'
+
+    def test_compact_models(self):
+        """
+        Test that compact models get decoders that create compact models.
+        """
+        _dict = sample(JobRun)
+        job_run = compact_models.JobRun.from_dict(_dict)
+
+        assert isinstance(job_run.run_env_variables[0], compact_models.EnvVar)
+        assert job_run.to_dict() == JobRun.from_dict(_dict).to_dict()
+        assert vars(compact_models.JobRun)['from_dict'].__func__.__wrapped__ is not original(JobRun)
+
+    def test_without_source(self, monkeypatch):
+        """
+        Test that decoders are generated when the source of the models is not available, e.g. in a zipped install.
+        """
+
+        def getsource(_):
+            raise OSError('could not get source code')
+
+        class Model:
+            def __init__(self, *, name: str = None) -> None:
+                self.name = name
+
+            @classmethod
+            def from_dict(cls, _dict: dict) -> 'Model':
+                return cls(name=_dict.get('name'))
+
+        monkeypatch.setattr(inspect, 'getsource', getsource)
+        install_decoders([Model], {}, {'Model': (ModelField('name'),)})
+
+        assert Model.from_dict({'name': 'a'}).name == 'a'
+        assert vars(Model)['from_dict'].__func__.__code__.co_filename == '<Model decoder>'
+
+
+class TestFieldTables:
+    """
+    Test Class for the tables of the properties of the models
+    """
+
+    def test_up_to_date(self):
+        """
+        Test that the tables match the source of the models, as generated by tools/generate_model_fields.py.
+        """
+        path = os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'generate_model_fields.py')
+        spec = importlib.util.spec_from_file_location('generate_model_fields', path)
+        generator = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(generator)
+
+        for module, module_models in generator.get_models().items():
+            source = inspect.getsource(sys.modules[module])
+            assert generator.update(source, generator.render(module_models)) == source, module
@@ -0,0 +1,451 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the emulator module
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_code_engine_sdk.async_code_engine_v2 import AsyncCodeEngineV2
+from ibm_code_engine_sdk.code_engine_v2 import (
+    App,
+    AppRevision,
+    Build,
+    BuildRun,
+    CodeEngineV2,
+    ConfigMap,
+    Job,
+    JobRun,
+    JobRunsPager,
+    Project,
+    Secret,
+)
+from ibm_code_engine_sdk.waiters import wait_until_app_ready
+from code_engine_emulator import CodeEngineEmulator, MAX_LIMIT
+
+
+@pytest.fixture
+def now():
+    """
+    The time of the clock of the emulator, which the tests advance.
+    """
+    return [1000.0]
+
+
+@pytest.fixture
+def timed_emulator(now):
+    """
+    An emulator with a fake clock and a fixed seed, unlike the emulator fixture of conftest.py.
+    """
+    return CodeEngineEmulator(clock=lambda: now[0], seed=1)
+
+
+@pytest.fixture
+def service(timed_emulator):
+    """
+    A client whose requests are answered by the emulator.
+    """
+    return timed_emulator.new_client()
+
+
+@pytest.fixture
+def project_id(service):
+    """
+    The ID of a new project.
+    """
+    return service.create_project(name='my-project', resource_group_id='b91e849c').get_result()['id']
+
+
+class TestProjects:
+    """
+    Test Class for the projects of the emulator
+    """
+
+    def test_create_get_delete(self, service, project_id):
+        """
+        Test creating, reading and deleting a project.
+        """
+        project = service.get_project(project_id).get_result()
+        assert Project.from_dict(project).name == 'my-project'
+        assert project['resource_type'] == 'project_v2'
+
+        assert service.delete_project(project_id).get_status_code() == 202
+        with pytest.raises(ApiException) as e:
+            service.get_project(project_id)
+        assert e.value.status_code == 404
+
+    def test_duplicate_name(self, service, project_id):
+        """
+        Test that a project name can only be used once.
+        """
+        with pytest.raises(ApiException) as e:
+            service.create_project(name='my-project', resource_group_id='b91e849c')
+        assert e.value.status_code == 409
+
+    def test_delete_resources(self, service, project_id):
+        """
+        Test that deleting a project deletes its resources.
+        """
+        service.create_config_map(project_id, 'my-config-map', data={'key': 'value'})
+        service.delete_project(project_id)
+
+        project_id = service.create_project(name='my-project', resource_group_id='b91e849c').get_result()['id']
+        assert service.list_config_maps(project_id).get_result()['config_maps'] == []
+
+    def test_status_details(self, service, project_id):
+        """
+        Test the status details and the egress IPs of a project.
+        """
+        assert service.get_project_status_details(project_id).get_result()['project'] == 'enabled'
+        assert service.get_project_egress_ips(project_id).get_result()['public']
+
+
+class TestResources:
+    """
+    Test Class for the resources of the emulator
+    """
+
+    def test_create_get(self, service, project_id):
+        """
+        Test that created resources can be read and parsed into models.
+        """
+        service.create_job(project_id, image_reference='icr.io/codeengine/helloworld', name='my-job')
+        service.create_config_map(project_id, 'my-config-map', data={'key': 'value'})
+        service.create_secret(project_id, 'generic', 'my-secret', data={'key': 'value'})
+        service.create_build(
+            project_id, 'my-build', 'private.de.icr.io/icr_namespace/image-name', 'ce-auto-icr', 'dockerfile'
+        )
+
+        job = Job.from_dict(service.get_job(project_id, 'my-job').get_result())
+        assert job.run_mode == 'task'
+        assert job.project_id == project_id
+        assert ConfigMap.from_dict(service.get_config_map(project_id, 'my-config-map').get_result()).data == {
+            'key': 'value'
+        }
+        secret = Secret.from_dict(service.get_secret(project_id, 'my-secret').get_result())
+        assert secret.resource_type == 'secret_generic_v2'
+        assert Build.from_dict(service.get_build(project_id, 'my-build').get_result()).status == 'ready'
+
+    def test_not_found(self, service, project_id):
+        """
+        Test that reading a missing resource fails with 404.
+        """
+        with pytest.raises(ApiException) as e:
+            service.get_app(project_id, 'my-app')
+        assert e.value.status_code == 404
+        assert 'my-app' in e.value.message
+
+    def test_duplicate_name(self, service, project_id):
+        """
+        Test that creating a resource with the name of another resource fails with 409.
+        """
+        service.create_config_map(project_id, 'my-config-map')
+        with pytest.raises(ApiException) as e:
+            service.create_config_map(project_id, 'my-config-map')
+        assert e.value.status_code == 409
+
+    def test_update(self, service, project_id):
+        """
+        Test that an update is applied as a merge patch and changes the entity tag.
+        """
+        job = service.create_job(
+            project_id, image_reference='icr.io/codeengine/helloworld', name='my-job', run_arguments=['a']
+        ).get_result()
+
+        response = service.update_job(project_id, 'my-job', job['entity_tag'], {'scale_array_spec': '0-9'})
+        updated = response.get_result()
+        assert updated['scale_array_spec'] == '0-9'
+        assert updated['run_arguments'] == ['a']
+        assert updated['entity_tag'] != job['entity_tag']
+        assert response.get_headers()['ETag'] == updated['entity_tag']
+
+    def test_update_with_stale_entity_tag(self, service, project_id):
+        """
+        Test that an update with a stale entity tag fails with 412 and that `*` matches any entity tag.
+        """
+        job = service.create_job(project_id, image_reference='icr.io/codeengine/helloworld', name='my-job').get_result()
+        service.update_job(project_id, 'my-job', job['entity_tag'], {'scale_array_spec': '0-9'})
+
+        with pytest.raises(ApiException) as e:
+            service.update_job(project_id, 'my-job', job['entity_tag'], {'scale_array_spec': '0-4'})
+        assert e.value.status_code == 412
+        service.update_job(project_id, 'my-job', '*', {'scale_array_spec': '0-4'})
+
+    def test_replace(self, service, project_id):
+        """
+        Test that replacing a config map replaces its data.
+        """
+        service.create_config_map(project_id, 'my-config-map', data={'a': '1'})
+        config_map = service.replace_config_map(project_id, 'my-config-map', '*', data={'b': '2'}).get_result()
+        assert config_map['data'] == {'b': '2'}
+        assert config_map['name'] == 'my-config-map'
+
+    def test_if_none_match(self, service, project_id):
+        """
+        Test that the resource cache is answered with 304 Not Modified while a resource is unchanged.
+        """
+        service.create_config_map(project_id, 'my-config-map', data={'a': '1'})
+        service.enable_resource_cache()
+
+        first = service.get_config_map(project_id, 'my-config-map')
+        second = service.get_config_map(project_id, 'my-config-map')
+        assert second.get_result() == first.get_result()
+        response = service.get_http_client().get(
+            first.get_result()['href'], headers={'If-None-Match': first.get_headers()['ETag']}
+        )
+        assert response.status_code == 304
+
+    def test_delete(self, service, project_id):
+        """
+        Test deleting a resource.
+        """
+        binding_id = service.create_binding(
+            project_id, {'name': 'my-app', 'resource_type': 'app_v2'}, 'MY', 'my-secret'
+        ).get_result()['id']
+        assert service.delete_binding(project_id, binding_id).get_status_code() == 202
+        assert service.list_bindings(project_id).get_result()['bindings'] == []
+
+
+class TestPagination:
+    """
+    Test Class for the lists of the emulator
+    """
+
+    def test_pages(self, service, project_id):
+        """
+        Test that lists are split into pages linked by `next.start`.
+        """
+        for i in range(7):
+            service.create_config_map(project_id, 'config-map-{0}'.format(i))
+
+        page = service.list_config_maps(project_id, limit=3).get_result()
+        assert [c['name'] for c in page['config_maps']] == ['config-map-0', 'config-map-1', 'config-map-2']
+        assert page['limit'] == 3
+        page = service.list_config_maps(project_id, limit=3, start=page['next']['start']).get_result()
+        page = service.list_config_maps(project_id, limit=3, start=page['next']['start']).get_result()
+        assert [c['name'] for c in page['config_maps']] == ['config-map-6']
+        assert 'next' not in page
+
+    def test_invalid_limit(self, service, project_id):
+        """
+        Test that a limit above the largest page size fails with 400.
+        """
+        with pytest.raises(ApiException) as e:
+            service.list_config_maps(project_id, limit=MAX_LIMIT + 1)
+        assert e.value.status_code == 400
+
+    def test_pager_with_filter(self, service, project_id):
+        """
+        Test that a pager reads every page of a filtered list.
+        """
+        service.create_job(project_id, image_reference='icr.io/codeengine/helloworld', name='job-a')
+        service.create_job(project_id, image_reference='icr.io/codeengine/helloworld', name='job-b')
+        for _ in range(5):
+            service.create_job_run(project_id, job_name='job-a')
+        service.create_job_run(project_id, job_name='job-b')
+
+        job_runs = JobRunsPager(client=service, project_id=project_id, job_name='job-a', limit=2).get_all()
+        assert len(job_runs) == 5
+        assert {job_run['job_name'] for job_run in job_runs} == {'job-a'}
+
+
+class TestStatus:
+    """
+    Test Class for the status of the resources of the emulator
+    """
+
+    def test_app_revisions(self, service, timed_emulator, now, project_id):
+        """
+        Test that every change of an app creates a revision, which becomes ready after the delay.
+        """
+        timed_emulator.app_ready_delay = 10
+        app = service.create_app(project_id, 'icr.io/codeengine/helloworld', 'my-app').get_result()
+        assert app['status'] == 'deploying'
+        assert app['status_details']['latest_created_revision'] == 'my-app-00001'
+        assert service.list_app_instances(project_id, 'my-app').get_result()['instances'] == []
+
+        now[0] += 10
+        app = App.from_dict(service.get_app(project_id, 'my-app').get_result())
+        assert app.status == 'ready'
+        assert app.status_details.latest_ready_revision == 'my-app-00001'
+        revision = AppRevision.from_dict(service.get_app_revision(project_id, 'my-app', 'my-app-00001').get_result())
+        assert revision.status == 'ready'
+        assert len(service.list_app_instances(project_id, 'my-app').get_result()['instances']) == 1
+
+        app = service.update_app(project_id, 'my-app', '*', {'scale_max_instances': 3}).get_result()
+        assert app['status_details'] == {
+            'latest_created_revision': 'my-app-00002',
+            'latest_ready_revision': 'my-app-00001',
+            'reason': 'deploying',
+        }
+        revisions = service.list_app_revisions(project_id, 'my-app').get_result()['revisions']
+        assert [r['name'] for r in revisions] == ['my-app-00001', 'my-app-00002']
+
+        service.delete_app(project_id, 'my-app')
+        with pytest.raises(ApiException):
+            service.get_app_revision(project_id, 'my-app', 'my-app-00001')
+
+    def test_wait_until_app_ready(self, service, timed_emulator, now, project_id, monkeypatch):
+        """
+        Test that the app waiter polls the emulator until the app is ready.
+        """
+        timed_emulator.app_ready_delay = 5
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        monkeypatch.setattr(time, 'sleep', sleep)
+        service.create_app(project_id, 'icr.io/codeengine/helloworld', 'my-app')
+
+        result = wait_until_app_ready(service, project_id, 'my-app')
+        assert result.status == 'ready'
+        assert result.revision_status == 'ready'
+
+    def test_job_run(self, service, timed_emulator, now, project_id):
+        """
+        Test that a job run inherits the spec of its job and completes after the duration.
+        """
+        timed_emulator.job_run_duration = 30
+        service.create_job(project_id, image_reference='icr.io/codeengine/helloworld', name='my-job')
+        service.update_job(project_id, 'my-job', '*', {'scale_array_spec': '0-4'})
+        job_run = service.create_job_run(project_id, job_name='my-job').get_result()
+        assert job_run['name'].startswith('my-job-')
+        assert job_run['scale_array_spec'] == '0-4'
+        assert job_run['status'] == 'running'
+        assert job_run['status_details']['running_indices'] == '0-4'
+
+        now[0] += 30
+        job_run = JobRun.from_dict(service.get_job_run(project_id, job_run['name']).get_result())
+        assert job_run.status == 'completed'
+        assert job_run.status_details.succeeded == 5
+        assert job_run.status_details.succeeded_indices == '0-4'
+
+    def test_job_run_of_missing_job(self, service, project_id):
+        """
+        Test that a run of a missing job fails with 404.
+        """
+        with pytest.raises(ApiException) as e:
+            service.create_job_run(project_id, job_name='my-job')
+        assert e.value.status_code == 404
+
+    def test_build_run(self, service, timed_emulator, now, project_id):
+        """
+        Test that a build run succeeds after the duration.
+        """
+        timed_emulator.build_run_duration = 60
+        service.create_build(
+            project_id, 'my-build', 'private.de.icr.io/icr_namespace/image-name', 'ce-auto-icr', 'dockerfile'
+        )
+        build_run = service.create_build_run(project_id, build_name='my-build').get_result()
+        assert build_run['status'] == 'running'
+
+        now[0] += 60
+        build_run = BuildRun.from_dict(service.get_build_run(project_id, build_run['name']).get_result())
+        assert build_run.status == 'succeeded'
+        assert build_run.output_image == 'private.de.icr.io/icr_namespace/image-name'
+
+
+class TestFaults:
+    """
+    Test Class for the latency and the errors of the emulator
+    """
+
+    def test_fail_next(self, service, timed_emulator, project_id):
+        """
+        Test that the next requests fail with the given status code.
+        """
+        timed_emulator.fail_next(503, count=2)
+        for _ in range(2):
+            with pytest.raises(ApiException) as e:
+                service.list_apps(project_id)
+            assert e.value.status_code == 503
+        service.list_apps(project_id)
+
+    def test_error_rate(self, service, timed_emulator, project_id):
+        """
+        Test that a fraction of the requests fail at random.
+        """
+        timed_emulator.error_rate = 0.5
+        timed_emulator.error_status_codes = [500]
+        failures = 0
+        for _ in range(200):
+            try:
+                service.list_apps(project_id)
+            except ApiException as e:
+                assert e.status_code == 500
+                failures += 1
+        assert 50 < failures < 150
+
+    def test_latency(self, timed_emulator):
+        """
+        Test that every request takes the latency of the emulator.
+        """
+        timed_emulator.latency = lambda: 0.02
+        start = time.perf_counter()
+        timed_emulator.handle('GET', '/v2/projects')
+        assert time.perf_counter() - start >= 0.02
+
+    def test_request_counts(self, service, timed_emulator, project_id):
+        """
+        Test that the requests are counted by endpoint.
+        """
+        service.list_apps(project_id)
+        service.list_apps(project_id)
+        assert timed_emulator.request_counts['GET /projects/{project_id}/apps'] == 2
+        assert timed_emulator.request_counts['POST /projects'] == 1
+
+
+class TestTransports:
+    """
+    Test Class for the HTTP server and the asyncio transport of the emulator
+    """
+
+    def test_server(self, timed_emulator):
+        """
+        Test that a client can use the emulator over HTTP.
+        """
+        server = timed_emulator.serve()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+            service.set_service_url('http://{0}:{1}/v2'.format(*server.server_address[:2]))
+            project_id = service.create_project(name='my-project', resource_group_id='b91e849c').get_result()['id']
+            service.create_config_map(project_id, 'my-config-map', data={'key': 'value'})
+            assert service.get_config_map(project_id, 'my-config-map').get_result()['data'] == {'key': 'value'}
+            assert service.delete_config_map(project_id, 'my-config-map').get_status_code() == 202
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def test_async(self, timed_emulator):
+        """
+        Test that an asyncio client can use the emulator.
+        """
+
+        async def main():
+            service = timed_emulator.mount_async(AsyncCodeEngineV2(authenticator=NoAuthAuthenticator()))
+            async with service:
+                project = (await service.create_project(name='my-project', resource_group_id='b91e849c')).get_result()
+                return (await service.list_projects()).get_result()['projects'], project
+
+        projects, project = asyncio.run(main())
+        assert projects == [project]
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the encoders module
+"""
+
+import pytest
+from ibm_code_engine_sdk import code_engine_v2, compact_models
+from ibm_code_engine_sdk.code_engine_v2 import EnvVar, SecretDataGenericSecretData
+from ibm_code_engine_sdk.decoders import get_fields
+
+_models = [
+    model
+    for model in (getattr(code_engine_v2, name) for name in code_engine_v2.__all__)
+    if isinstance(model, type) and 'to_dict' in vars(model)
+]
+
+
+def original(model: type, name: str):
+    """
+    Returns the generated method of a model.
+    """
+    method = vars(model)[name]
+    return getattr(method, '__wrapped__', method)
+
+
+# The models whose to_dict() follows the generated patterns.
+_encoded_models = [model for model in _models if get_fields(model) is not None]
+
+
+def properties(model: type):
+    """
+    Returns the (name, kind) of the properties that the to_dict() of a model writes.
+    """
+    return [(field.name, field.to_dict_kind or field.kind) for field in get_fields(model)]
+
+
+def sample(model: type, *, skip: int = 0):
+    """
+    Returns an instance of `model` with every property set, except every `skip`th
+    one. Nested models are set to both dicts and models.
+    """
+    instance = object.__new__(model)
+    for index, (name, kind) in enumerate(properties(model)):
+        if skip and index % skip == 0:
+            continue
+        env_var = EnvVar(type='literal', name='NAME', value='value')
+        setattr(
+            instance,
+            name,
+            {
+                'value': '{0}-value'.format(name),
+                'model': env_var if index % 2 else {'type': 'literal'},
+                'list': [env_var, {'type': 'literal'}],
+                'dict': {'a': env_var, 'b': {'type': 'literal'}},
+            }[kind],
+        )
+    return instance
+
+
+class TestEncoders:
+    """
+    Test Class for the generated to_dict() and __eq__() methods
+    """
+
+    @pytest.mark.parametrize('model', _encoded_models, ids=lambda model: model.__name__)
+    def test_identical_dicts(self, model):
+        """
+        Test that the to_dict() of every model creates the same dict as its generated to_dict().
+        """
+        for skip in (0, 2, 3):
+            instance = sample(model, skip=skip)
+            expected = original(model, 'to_dict')(instance)
+
+            _dict = instance.to_dict()
+
+            assert _dict == expected
+            assert list(_dict) == list(expected)
+
+    def test_models_without_encoder(self):
+        """
+        Test that models with additional properties keep their methods.
+        """
+        secret_data = SecretDataGenericSecretData(key='value')
+
+        assert secret_data.to_dict() == {'key': 'value'}
+        assert secret_data == SecretDataGenericSecretData(key='value')
+        assert secret_data != SecretDataGenericSecretData(key='other')
+        assert not hasattr(vars(SecretDataGenericSecretData)['to_dict'], '__wrapped__')
+        assert not hasattr(vars(SecretDataGenericSecretData)['__eq__'], '__wrapped__')
+        assert len(_encoded_models) == len(_models) - 7
+
+    def test_unset_properties(self):
+        """
+        Test that unset properties are skipped like by the generated to_dict().
+        """
+        env_var = EnvVar(type='literal', name='NAME', value='value')
+        del env_var.name
+
+        assert env_var.to_dict() == {'type': 'literal', 'value': 'value'}
+
+    def test_models_keep_equality(self):
+        """
+        Test that models that keep their properties in a __dict__ keep their __eq__().
+        """
+        env_var = EnvVar(type='literal', name='NAME')
+
+        assert env_var == EnvVar(type='literal', name='NAME')
+        assert not hasattr(vars(EnvVar)['__eq__'], '__wrapped__')
+
+    @pytest.mark.parametrize(
+        'model', [compact_models.App, compact_models.EnvVar, compact_models.JobRun], ids=lambda model: model.__name__
+    )
+    def test_equality(self, model):
+        """
+        Test that compact models are equal when their properties are equal.
+        """
+        instance = sample(model)
+
+        assert instance == instance
+        assert instance == sample(model)
+        assert not instance != sample(model)
+        assert instance != sample(model, skip=3)
+        assert instance != object()
+        for name, _ in properties(model):
+            other = sample(model)
+            setattr(other, name, 'changed')
+            assert instance != other
+            assert other != instance
+
+    def test_equality_with_unset_properties(self):
+        """
+        Test that an unset property is only equal to an unset property.
+        """
+        env_var = compact_models.EnvVar(type='literal', name='NAME')
+        other = compact_models.EnvVar(type='literal', name='NAME')
+        del env_var.value
+
+        assert env_var != other
+        assert other != env_var
+        del other.value
+        assert env_var == other
+
+    def test_equality_of_identical_values(self):
+        """
+        Test that a property is equal to itself, even if its value is not equal to itself.
+        """
+        nan = float('nan')
+
+        assert compact_models.EnvVar(type='literal', value=nan) == compact_models.EnvVar(type='literal', value=nan)
+
+    def test_compact_models(self):
+        """
+        Test that compact models get their own methods.
+        """
+        job_run = compact_models.JobRun(
+            computed_env_variables=[], run_arguments=[], run_commands=[], run_env_variables=[], run_volume_mounts=[]
+        )
+        job_run.run_env_variables = [compact_models.EnvVar(type='literal', name='NAME', value='value')]
+
+        assert job_run.to_dict()['run_env_variables'] == [{'type': 'literal', 'name': 'NAME', 'value': 'value'}]
+        assert job_run == compact_models.JobRun.from_dict(job_run.to_dict())
+        assert vars(compact_models.JobRun)['to_dict'].__code__.co_filename == '<JobRun to_dict>'
+        assert vars(compact_models.JobRun)['__eq__'].__code__.co_filename == '<JobRun __eq__>'
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the index_ranges module
+"""
+
+import random
+import pytest
+from ibm_code_engine_sdk.index_ranges import IndexRangeSet, get_index_set
+
+
+class TestIndexRangeSet:
+    """
+    Test Class for IndexRangeSet
+    """
+
+    def test_parse(self):
+        """
+        Test that index lists are parsed into sorted, merged intervals.
+        """
+        index_set = IndexRangeSet('9-9999, 0-3,7,4')
+
+        assert index_set.intervals == [(0, 4), (7, 7), (9, 9999)]
+        assert str(index_set) == '0-4,7,9-9999'
+        assert repr(index_set) == "IndexRangeSet('0-4,7,9-9999')"
+        assert len(index_set) == 9997
+
+    def test_empty(self):
+        """
+        Test that an empty or missing index list is an empty set.
+        """
+        for index_set in [IndexRangeSet(), IndexRangeSet(''), IndexRangeSet(None)]:
+            assert not index_set
+            assert len(index_set) == 0
+            assert 0 not in index_set
+            assert index_set.to_array_spec() == ''
+
+    def test_parse_is_lazy(self):
+        """
+        Test that an index list is only parsed when the set is used.
+        """
+        index_set = IndexRangeSet('0-3,x')
+
+        with pytest.raises(ValueError):
+            len(index_set)
+
+    @pytest.mark.parametrize('spec', ['x', '1-', '-1', '5-3', '1,2-x'])
+    def test_invalid(self, spec):
+        """
+        Test that malformed index lists are rejected.
+        """
+        with pytest.raises(ValueError):
+            IndexRangeSet(spec).intervals
+
+    def test_contains(self):
+        """
+        Test membership, including at the bounds of the intervals.
+        """
+        index_set = IndexRangeSet('0-3,7,9-9999')
+
+        assert all(index in index_set for index in [0, 3, 7, 9, 9999])
+        assert not any(index in index_set for index in [4, 6, 8, 10000])
+        assert -1 not in index_set
+
+    def test_large_ranges(self):
+        """
+        Test that large ranges are handled without expanding them.
+        """
+        index_set = IndexRangeSet('0-999999999') - IndexRangeSet('500000000')
+
+        assert len(index_set) == 999999999
+        assert index_set.intervals == [(0, 499999999), (500000001, 999999999)]
+
+    def test_set_operations(self):
+        """
+        Test union, intersection and difference against Python sets.
+        """
+        rng = random.Random(42)
+        for _ in range(500):
+            first = set(rng.sample(range(50), rng.randint(0, 30)))
+            second = set(rng.sample(range(50), rng.randint(0, 30)))
+            first_set = IndexRangeSet.from_indices(first)
+            second_set = IndexRangeSet(IndexRangeSet.from_indices(second).to_array_spec())
+
+            assert set(first_set | second_set) == first | second
+            assert set(first_set & second_set) == first & second
+            assert set(first_set - second_set) == first - second
+            assert len(first_set) == len(first)
+
+    def test_chunks(self):
+        """
+        IndexRangeSet.chunks()
+        """
+        chunks = IndexRangeSet('0-4,7,9-12').chunks(3)
+
+        assert [str(chunk) for chunk in chunks] == ['0-2', '3-4,7', '9-11', '12']
+        assert IndexRangeSet().chunks(3) == []
+        with pytest.raises(ValueError):
+            IndexRangeSet('0').chunks(0)
+
+    def test_equality(self):
+        """
+        Test that sets with the same indices are equal, however they were written.
+        """
+        assert IndexRangeSet('0,1,2,5') == IndexRangeSet('0-2,5')
+        assert IndexRangeSet.from_intervals([(3, 5), (0, 2)]) == IndexRangeSet('0-5')
+        assert hash(IndexRangeSet('0,1,2')) == hash(IndexRangeSet('0-2'))
+        assert IndexRangeSet('0') != IndexRangeSet('1')
+        assert IndexRangeSet('0') != '0'
+
+    def test_get_index_set(self):
+        """
+        Test that the sets of the same index list are parsed once.
+        """
+        index_set = get_index_set('0-3,7')
+
+        assert index_set == IndexRangeSet('0-3,7')
+        assert get_index_set('0-3,7') is index_set
+        assert not get_index_set(None)
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the json_codecs module
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import asyncio
+import json
+import sys
+import threading
+import pytest
+import requests
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2
+from ibm_code_engine_sdk.json_codecs import JSONCodec, OrjsonJSONCodec, StdlibJSONCodec, get_default_codec
+
+_base_url = 'https://api.au-syd.codeengine.cloud.ibm.com/v2'
+
+_project_id = '15314cc3-85b4-4338-903f-c28cdee6d005'
+
+
+class RecordingCodec(StdlibJSONCodec):
+    """
+    A codec that records the documents that it encodes and decodes.
+    """
+
+    def __init__(self):
+        self.dumped = []
+        self.loaded = []
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj).encode('utf-8')
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+def new_service(json_codec: JSONCodec = None) -> CodeEngineV2:
+    """
+    Returns a CodeEngineV2 client with the given codec.
+    """
+    service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    service.set_json_codec(json_codec)
+    return service
+
+
+class TestCodecs:
+    """
+    Test Class for the codecs
+    """
+
+    def test_stdlib(self):
+        """
+        StdlibJSONCodec
+        """
+        codec = StdlibJSONCodec()
+
+        assert json.loads(codec.dumps({'name': 'ä', 'value': 1})) == {'name': 'ä', 'value': 1}
+        assert codec.loads(b'{"value": "a\tb"}') == {'value': 'a\tb'}
+        with pytest.raises(ValueError):
+            codec.loads('{')
+
+    def test_orjson(self):
+        """
+        OrjsonJSONCodec
+        """
+        pytest.importorskip('orjson')
+        codec = OrjsonJSONCodec()
+        value = 'x' * 2**20
+
+        assert codec.loads(codec.dumps({'data': {'key': value}})) == {'data': {'key': value}}
+        with pytest.raises(ValueError):
+            codec.loads(b'{')
+
+    def test_orjson_fallback(self):
+        """
+        Test that documents that orjson does not support are handled by the standard library.
+        """
+        pytest.importorskip('orjson')
+        codec = OrjsonJSONCodec()
+
+        assert json.loads(codec.dumps({'value': 2**70})) == {'value': 2**70}
+        assert codec.loads(b'{"value": "a\tb"}') == {'value': 'a\tb'}
+        assert codec.loads('{"value": NaN}')['value'] != 0
+
+    def test_orjson_not_installed(self, monkeypatch):
+        """
+        Test that OrjsonJSONCodec explains how to install orjson when it is not installed.
+        """
+        monkeypatch.setitem(sys.modules, 'orjson', None)
+
+        assert type(get_default_codec()) is StdlibJSONCodec
+        with pytest.raises(ImportError, match=r'ibm-code-engine-sdk\[orjson\]'):
+            OrjsonJSONCodec()
+
+
+class TestClientCodec:
+    """
+    Test Class for the codec of CodeEngineV2
+    """
+
+    def test_default_codec(self):
+        """
+        Test that a client uses the standard library unless another codec is set, even with orjson installed.
+        """
+        pytest.importorskip('orjson')
+        codec = OrjsonJSONCodec()
+        service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+
+        assert type(service.get_json_codec()) is StdlibJSONCodec
+        service.set_json_codec(codec)
+        assert service.get_json_codec() is codec
+        service.set_json_codec(None)
+        assert type(service.get_json_codec()) is StdlibJSONCodec
+
+    @responses.activate
+    def test_request_and_response(self):
+        """
+        Test that the codec encodes the request body and decodes the response body.
+        """
+        responses.add(
+            responses.POST,
+            _base_url + '/projects/{0}/config_maps'.format(_project_id),
+            body='{"name": "my-config-map", "data": {"key": "value"}}',
+            content_type='application/json',
+            status=201,
+        )
+        codec = RecordingCodec()
+        service = new_service(codec)
+
+        response = service.create_config_map(project_id=_project_id, name='my-config-map', data={'key': 'value'})
+
+        assert response.get_status_code() == 201
+        assert response.get_result() == {'name': 'my-config-map', 'data': {'key': 'value'}}
+        assert codec.dumped == [{'name': 'my-config-map', 'data': {'key': 'value'}}]
+        assert codec.loaded == [b'{"name": "my-config-map", "data": {"key": "value"}}']
+        assert json.loads(responses.calls[0].request.body) == codec.dumped[0]
+        assert responses.calls[0].request.headers['content-type'] == 'application/json'
+
+    @responses.activate
+    def test_responses_without_json(self):
+        """
+        Test that empty and non-JSON responses are not decoded.
+        """
+        url = _base_url + '/projects/{0}/config_maps/my-config-map'.format(_project_id)
+        responses.add(responses.DELETE, url, status=202)
+        responses.add(responses.GET, url, body='plain text', content_type='text/plain', status=200)
+        codec = RecordingCodec()
+        service = new_service(codec)
+
+        assert service.delete_config_map(project_id=_project_id, name='my-config-map').get_result() is None
+        assert service.get_config_map(project_id=_project_id, name='my-config-map').get_result().text == 'plain text'
+        assert codec.loaded == []
+
+    def test_connections_released(self):
+        """
+        Test that the connections of 204 and HEAD responses return to the pool.
+        """
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_DELETE(self):  # pylint: disable=invalid-name
+                self.send_response(204)
+                self.end_headers()
+
+            def do_HEAD(self):  # pylint: disable=invalid-name
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', '2')
+                self.end_headers()
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        service = new_service(RecordingCodec())
+        service.set_service_url('http://{0}:{1}/v2'.format(*server.server_address[:2]))
+        # A single connection, which a request waits for until the previous response releases it.
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1, pool_block=True)
+        service.get_http_client().mount('http://', adapter)
+        results = []
+
+        def send():
+            for _ in range(3):
+                results.append(service.delete_config_map(project_id=_project_id, name='my-config-map').get_result())
+                request = service.prepare_request(method='HEAD', url='/projects')
+                results.append(service.send(request).get_result())
+
+        thread = threading.Thread(target=send, daemon=True)
+        try:
+            thread.start()
+            thread.join(5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert not thread.is_alive()
+        assert results == [None] * 6
+
+    @responses.activate
+    def test_invalid_json(self):
+        """
+        Test that a response body that is not valid JSON raises an ApiException.
+        """
+        responses.add(
+            responses.GET,
+            _base_url + '/projects/{0}/config_maps/my-config-map'.format(_project_id),
+            body='{',
+            content_type='application/json',
+            status=200,
+        )
+        service = new_service(RecordingCodec())
+
+        with pytest.raises(ApiException) as e:
+            service.get_config_map(project_id=_project_id, name='my-config-map')
+
+        assert e.value.message == 'Error processing the HTTP response'
+
+    @responses.activate
+    def test_error_response(self):
+        """
+        Test that error responses raise an ApiException as before.
+        """
+        responses.add(
+            responses.GET,
+            _base_url + '/projects/{0}/config_maps/my-config-map'.format(_project_id),
+            json={'errors': [{'message': 'not found'}]},
+            status=404,
+        )
+        service = new_service(RecordingCodec())
+
+        with pytest.raises(ApiException) as e:
+            service.get_config_map(project_id=_project_id, name='my-config-map')
+
+        assert e.value.status_code == 404
+        assert e.value.message == 'not found'
+
+    @responses.activate
+    def test_stream(self):
+        """
+        Test that streamed responses are returned as they are.
+        """
+        responses.add(
+            responses.GET,
+            _base_url + '/projects/{0}/config_maps/my-config-map'.format(_project_id),
+            json={'name': 'my-config-map'},
+            status=200,
+        )
+        codec = RecordingCodec()
+        service = new_service(codec)
+
+        response = service.get_config_map(project_id=_project_id, name='my-config-map', stream=True)
+
+        assert response.get_result().json() == {'name': 'my-config-map'}
+        assert codec.loaded == []
+
+    def test_async_client(self):
+        """
+        Test that the asyncio client decodes response bodies with its codec.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_code_engine_sdk.async_code_engine_v2 import (  # pylint: disable=import-outside-toplevel
+            AsyncCodeEngineV2,
+        )
+
+        codec = RecordingCodec()
+        service = AsyncCodeEngineV2(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.set_json_codec(codec)
+        service.set_async_http_client(
+            httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={'name': 'a'})))
+        )
+
+        response = asyncio.run(service.create_config_map(project_id=_project_id, name='a', data={'key': 'value'}))
+
+        assert response.get_result() == {'name': 'a'}
+        assert codec.dumped == [{'name': 'a', 'data': {'key': 'value'}}]
+        assert len(codec.loaded) == 1
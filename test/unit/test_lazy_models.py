@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the lazy_models module
+"""
+
+import copy
+import inspect
+import pickle
+from ibm_code_engine_sdk.code_engine_v2 import (
+    EnvVar,
+    JobRun,
+    JobRunList,
+    JobRunStatus,
+    SecretDataGenericSecretData,
+    VolumeMount,
+)
+from ibm_code_engine_sdk import lazy_models
+from ibm_code_engine_sdk.lazy_models import LazyModel, get_view_class, lazy_view, lazy_views
+
+_env_var = {'type': 'literal', 'name': 'MY_VARIABLE', 'value': 'my-value'}
+_volume_mount = {'mount_path': '/data', 'name': 'data', 'reference': 'my-pds', 'type': 'persistent_data_store'}
+
+
+def job_run_dict(name: str = 'my-job-run') -> dict:
+    """
+    Returns the dict of a job run.
+    """
+    return {
+        'computed_env_variables': [_env_var],
+        'image_reference': 'icr.io/codeengine/helloworld',
+        'job_name': 'my-job',
+        'name': name,
+        'run_arguments': [],
+        'run_commands': [],
+        'run_env_variables': [_env_var, _env_var],
+        'run_mode': 'task',
+        'run_volume_mounts': [_volume_mount],
+        'status': 'completed',
+        'status_details': {'requested': 10, 'succeeded': 10, 'succeeded_indices': '0-9'},
+    }
+
+
+class TestLazyView:
+    """
+    Test Class for lazy_view
+    """
+
+    def test_view(self):
+        """
+        Test that a view has the properties and methods of its model.
+        """
+        job_run = lazy_view(JobRun, job_run_dict())
+
+        assert isinstance(job_run, JobRun)
+        assert isinstance(job_run, LazyModel)
+        assert job_run.name == 'my-job-run'
+        assert job_run.status == 'completed'
+        assert job_run.run_arguments == []
+        assert job_run.run_as_user is None
+        assert job_run.status_details.succeeded_index_set.to_array_spec() == '0-9'
+        assert job_run.to_dict() == JobRun.from_dict(job_run_dict()).to_dict()
+        assert str(job_run) == str(JobRun.from_dict(job_run_dict()))
+
+    def test_nested_models_are_converted_on_access(self):
+        """
+        Test that nested models are only converted when read, and then cached.
+        """
+        job_run = lazy_view(JobRun, job_run_dict())
+        assert job_run.name == 'my-job-run'
+        assert vars(job_run) == {}
+
+        run_env_variables = job_run.run_env_variables
+
+        assert list(vars(job_run)) == ['run_env_variables']
+        assert job_run.run_env_variables is run_env_variables
+        assert [type(env_var) for env_var in run_env_variables] == [get_view_class(EnvVar)] * 2
+        assert run_env_variables[0].value == 'my-value'
+        assert isinstance(job_run.run_volume_mounts[0], VolumeMount)
+        assert isinstance(job_run.status_details, JobRunStatus)
+
+    def test_list(self):
+        """
+        Test that the resources of a list are views.
+        """
+        result = {'job_runs': [job_run_dict('run-a'), job_run_dict('run-b')], 'limit': 2}
+
+        job_run_list = lazy_view(JobRunList, result)
+
+        assert [job_run.name for job_run in job_run_list.job_runs] == ['run-a', 'run-b']
+        assert job_run_list.limit == 2
+        assert job_run_list.first is None
+        assert job_run_list == JobRunList.from_dict(result)
+
+    def test_lazy_views(self):
+        """
+        lazy_views()
+        """
+        job_runs = lazy_views(JobRun, iter([job_run_dict('run-a'), job_run_dict('run-b')]))
+
+        assert [job_run.name for job_run in job_runs] == ['run-a', 'run-b']
+
+    def test_equality(self):
+        """
+        Test that a view is equal to the model of the same dict.
+        """
+        job_run = lazy_view(JobRun, job_run_dict())
+        model = JobRun.from_dict(job_run_dict())
+
+        assert job_run == model
+        assert model == job_run
+        assert job_run == lazy_view(JobRun, job_run_dict())
+        assert job_run != lazy_view(JobRun, job_run_dict('other'))
+        assert job_run != lazy_view(JobRunStatus, {})
+
+    def test_assignment(self):
+        """
+        Test that properties can be assigned without changing the wrapped dict.
+        """
+        _dict = job_run_dict()
+        job_run = lazy_view(JobRun, _dict)
+
+        job_run.name = 'renamed'
+        job_run.run_env_variables = []
+        del job_run.status_details
+
+        assert job_run.name == 'renamed'
+        assert job_run.status_details is None
+        assert job_run.to_dict()['run_env_variables'] == []
+        assert _dict == job_run_dict()
+
+    def test_copy_and_pickle(self):
+        """
+        Test that views can be copied and pickled.
+        """
+        job_run = lazy_view(JobRun, job_run_dict())
+        job_run.name = 'renamed'
+
+        for copied in (copy.copy(job_run), pickle.loads(pickle.dumps(job_run))):
+            assert type(copied) is type(job_run)
+            assert copied == job_run
+            assert copied.name == 'renamed'
+
+    def test_model_without_view(self):
+        """
+        Test that models with additional properties are converted with from_dict().
+        """
+        secret_data = lazy_view(SecretDataGenericSecretData, {'key': 'value'})
+
+        assert get_view_class(SecretDataGenericSecretData) is None
+        assert type(secret_data) is SecretDataGenericSecretData
+        assert secret_data.to_dict() == {'key': 'value'}
+
+    def test_without_source(self, monkeypatch):
+        """
+        Test that views are built when the source of the models is not available, e.g. in a zipped install.
+        """
+
+        def getsource(_):
+            raise OSError('could not get source code')
+
+        monkeypatch.setattr(inspect, 'getsource', getsource)
+        monkeypatch.setattr(lazy_models, '_view_classes', {})
+
+        job_run = lazy_view(JobRun, job_run_dict())
+
+        assert isinstance(job_run, LazyModel)
+        assert job_run == JobRun.from_dict(job_run_dict())
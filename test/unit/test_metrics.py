@@ -0,0 +1,415 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the metrics module
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2
+from ibm_code_engine_sdk.metrics import (
+    MetricsCollector,
+    MetricsSink,
+    OpenTelemetryMetricsSink,
+    OperationMetrics,
+    OperationStats,
+    PrometheusMetricsSink,
+)
+
+
+class RecordingSink(MetricsSink):
+    """
+    Keeps the metrics of every call.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def record(self, metrics):
+        self.calls.append(metrics)
+
+
+@pytest.fixture
+def sink():
+    """
+    A sink that keeps the metrics of every call.
+    """
+    return RecordingSink()
+
+
+@pytest.fixture
+def service(emulator, sink):
+    """
+    A client of the emulator that reports its calls to the sink.
+    """
+    service = emulator.new_client()
+    service.set_metrics_sink(sink)
+    return service
+
+
+@pytest.fixture
+def server(emulator):
+    """
+    The emulator served over HTTP.
+    """
+    server = emulator.serve()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestClient:
+    """
+    Test Class for the metrics of the calls of a client
+    """
+
+    def test_no_sink(self, emulator):
+        """
+        Test that a client has no metrics sink by default.
+        """
+        assert emulator.new_client().get_metrics_sink() is None
+
+    def test_operations(self, service, sink):
+        """
+        Test that every call is reported with its operation, status code and body sizes.
+        """
+        project = service.create_project(name='my-project', resource_group_id='b91e849c')
+        service.list_apps(project.get_result()['id'])
+
+        create, list_apps = sink.calls
+        assert create.operation_id == 'create_project'
+        assert create.method == 'POST'
+        assert create.status_code == 201
+        body = service.get_json_codec().dumps({'name': 'my-project', 'resource_group_id': 'b91e849c'})
+        assert create.request_size == len(body)
+        assert create.response_size == len(json.dumps(project.get_result()))
+        assert create.retries == 0
+        assert create.duration > 0
+        assert list_apps.operation_id == 'list_apps'
+        assert list_apps.method == 'GET'
+        assert list_apps.request_size == 0
+
+    def test_error(self, service, sink):
+        """
+        Test that a failed call is reported with the status code of the error.
+        """
+        with pytest.raises(ApiException):
+            service.get_project('15314cc3-85b4-4338-903f-c28cdee6d005')
+
+        assert sink.calls[0].operation_id == 'get_project'
+        assert sink.calls[0].status_code == 404
+
+    def test_resource_cache(self, service, sink):
+        """
+        Test that a read revalidated by the resource cache is reported with 304.
+        """
+        project_id = service.create_project(name='my-project', resource_group_id='b91e849c').get_result()['id']
+        service.create_config_map(project_id, 'my-config-map', data={'key': 'value'})
+        service.enable_resource_cache(kinds=['config_maps'])
+
+        service.get_config_map(project_id, 'my-config-map')
+        response = service.get_config_map(project_id, 'my-config-map')
+
+        assert response.get_status_code() == 200
+        assert [call.status_code for call in sink.calls[-2:]] == [200, 304]
+        assert sink.calls[-1].response_size == 0
+
+    def test_retries(self, emulator, server, sink):
+        """
+        Test that the retries of a request are counted.
+        """
+        service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+        service.set_service_url('http://{0}:{1}/v2'.format(*server.server_address[:2]))
+        service.enable_retries(max_retries=3, retry_interval=0)
+        service.set_metrics_sink(sink)
+        emulator.fail_next(503, count=2)
+
+        service.list_projects()
+
+        assert sink.calls[0].operation_id == 'list_projects'
+        assert sink.calls[0].status_code == 200
+        assert sink.calls[0].retries == 2
+
+    def test_async(self, emulator, sink):
+        """
+        Test that the calls of an asyncio client are reported with their retries.
+        """
+        pytest.importorskip('httpx')
+        from ibm_code_engine_sdk.async_code_engine_v2 import (  # pylint: disable=import-outside-toplevel
+            AsyncCodeEngineV2,
+        )
+
+        async def main():
+            service = emulator.mount_async(AsyncCodeEngineV2(authenticator=NoAuthAuthenticator()))
+            service.enable_retries(max_retries=3, retry_interval=0)
+            service.set_metrics_sink(sink)
+            emulator.fail_next(500)
+            async with service:
+                await service.list_projects()
+
+        asyncio.run(main())
+        assert sink.calls[0].operation_id == 'list_projects'
+        assert sink.calls[0].status_code == 200
+        assert sink.calls[0].retries == 1
+        assert sink.calls[0].response_size > 0
+
+    def test_interrupted(self, service, sink):
+        """
+        Test that an interrupted call is reported as cancelled.
+        """
+
+        def interrupt(response, **kwargs):
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            service.list_projects(hooks={'response': interrupt})
+
+        assert sink.calls[0].operation_id == 'list_projects'
+        assert sink.calls[0].cancelled
+
+    def test_async_cancelled(self, emulator):
+        """
+        Test that a cancelled call of an asyncio client is reported as cancelled.
+        """
+        pytest.importorskip('httpx')
+        from ibm_code_engine_sdk.async_code_engine_v2 import (  # pylint: disable=import-outside-toplevel
+            AsyncCodeEngineV2,
+        )
+
+        collector = MetricsCollector()
+
+        async def main():
+            service = emulator.mount_async(AsyncCodeEngineV2(authenticator=NoAuthAuthenticator()))
+            service.set_metrics_sink(collector)
+            emulator.latency = 10
+            async with service:
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(service.list_projects(), 0.05)
+
+        asyncio.run(main())
+        stats = collector.get_stats()['list_projects']
+        assert stats.count == stats.errors == stats.cancelled == 1
+        assert stats.status_codes == {None: 1}
+        assert stats.total_duration >= 0.05
+
+    def test_failing_sink(self, service, caplog):
+        """
+        Test that an error of the sink is logged and does not fail the call.
+        """
+
+        class FailingSink(MetricsSink):
+            def record(self, metrics):
+                raise RuntimeError('failed')
+
+        service.set_metrics_sink(FailingSink())
+        assert service.list_projects().get_status_code() == 200
+        assert 'list_projects' in caplog.text
+
+
+def _metrics(operation_id, duration, status_code=200, **kwargs):
+    return OperationMetrics(
+        operation_id,
+        kwargs.get('method', 'GET'),
+        status_code,
+        duration,
+        kwargs.get('retries', 0),
+        kwargs.get('request_size', 0),
+        kwargs.get('response_size', 100),
+        kwargs.get('cancelled', False),
+    )
+
+
+class TestMetricsCollector:
+    """
+    Test Class for MetricsCollector
+    """
+
+    def test_stats(self):
+        """
+        Test that the calls are aggregated by operation.
+        """
+        collector = MetricsCollector()
+        collector.record(_metrics('list_apps', 0.02))
+        collector.record(_metrics('list_apps', 0.2, retries=2))
+        collector.record(_metrics('get_app', 0.001, status_code=404))
+        collector.record(_metrics('get_app', 0.003, status_code=None))
+
+        list_apps, get_app = collector.get_stats().values()
+        assert list(collector.get_stats()) == ['list_apps', 'get_app']
+        assert list_apps.count == 2
+        assert list_apps.retries == 2
+        assert list_apps.total_duration == pytest.approx(0.22)
+        assert list_apps.max_duration == 0.2
+        assert list_apps.response_bytes == 200
+        assert get_app.errors == 2
+        assert get_app.status_codes == {404: 1, None: 1}
+        assert 'list_apps' in collector.report()
+
+        collector.reset()
+        assert collector.get_stats() == {}
+
+    def test_quantile(self):
+        """
+        Test that quantiles are estimated by the upper bound of their bucket.
+        """
+        stats = OperationStats((0.01, 0.1, 1.0))
+        for duration in [0.005] * 90 + [0.05] * 9 + [5.0]:
+            stats._add(_metrics('list_apps', duration))  # pylint: disable=protected-access
+
+        assert stats.latency_buckets == [90, 9, 0, 1]
+        assert stats.quantile(0.5) == 0.01
+        assert stats.quantile(0.95) == 0.1
+        assert stats.quantile(1.0) == 5.0
+
+    def test_client(self, emulator):
+        """
+        Test collecting the calls of a client.
+        """
+        collector = MetricsCollector()
+        service = emulator.new_client()
+        service.set_metrics_sink(collector)
+        project_id = service.create_project(name='my-project', resource_group_id='b91e849c').get_result()['id']
+        for _ in range(3):
+            service.list_apps(project_id)
+
+        stats = collector.get_stats()
+        assert stats['list_apps'].count == 3
+        assert stats['create_project'].status_codes == {201: 1}
+
+
+class TestPrometheusMetricsSink:
+    """
+    Test Class for PrometheusMetricsSink
+    """
+
+    def test_record(self):
+        """
+        Test that the calls are exported as Prometheus metrics.
+        """
+        prometheus_client = pytest.importorskip('prometheus_client')
+        registry = prometheus_client.CollectorRegistry()
+        sink = PrometheusMetricsSink(registry=registry)
+
+        sink.record(_metrics('list_apps', 0.02, retries=2, response_size=300))
+        sink.record(_metrics('get_app', 0.01, status_code=None))
+        sink.record(_metrics('get_app', 0.01, status_code=None, cancelled=True))
+
+        labels = {'operation': 'list_apps', 'method': 'GET', 'status_code': '200'}
+        assert registry.get_sample_value('code_engine_client_requests_total', labels) == 1
+        assert registry.get_sample_value(
+            'code_engine_client_requests_total', {'operation': 'get_app', 'method': 'GET', 'status_code': 'none'}
+        )
+        assert registry.get_sample_value(
+            'code_engine_client_requests_total', {'operation': 'get_app', 'method': 'GET', 'status_code': 'cancelled'}
+        )
+        assert registry.get_sample_value('code_engine_client_retries_total', {'operation': 'list_apps'}) == 2
+        assert registry.get_sample_value(
+            'code_engine_client_request_duration_seconds_sum', {'operation': 'list_apps'}
+        ) == pytest.approx(0.02)
+        assert (
+            registry.get_sample_value('code_engine_client_response_size_bytes_sum', {'operation': 'list_apps'}) == 300
+        )
+
+        sink.record_concurrency_limit(4, 0)
+        sink.record_concurrency_limit(2, 4)
+        assert registry.get_sample_value('code_engine_client_concurrency_limit') == 2
+
+    def test_not_installed(self, monkeypatch):
+        """
+        Test that PrometheusMetricsSink explains how to install prometheus-client when it is not installed.
+        """
+        monkeypatch.setitem(sys.modules, 'prometheus_client', None)
+
+        with pytest.raises(ImportError, match=r'ibm-code-engine-sdk\[prometheus\]'):
+            PrometheusMetricsSink()
+
+
+class TestOpenTelemetryMetricsSink:
+    """
+    Test Class for OpenTelemetryMetricsSink
+    """
+
+    def test_record(self):
+        """
+        Test that the calls are recorded with the OpenTelemetry metrics API.
+        """
+        pytest.importorskip('opentelemetry.sdk.metrics')
+        from opentelemetry.sdk.metrics import MeterProvider  # pylint: disable=import-outside-toplevel
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader  # pylint: disable=import-outside-toplevel
+
+        reader = InMemoryMetricReader()
+        sink = OpenTelemetryMetricsSink(meter_provider=MeterProvider(metric_readers=[reader]))
+
+        sink.record(_metrics('list_apps', 0.02, retries=2))
+        sink.record(_metrics('list_apps', 0.04))
+        sink.record_concurrency_limit(4, 0)
+        sink.record_concurrency_limit(2, 4)
+
+        metrics = {
+            metric.name: metric.data.data_points
+            for resource_metrics in reader.get_metrics_data().resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+        }
+        (requests,) = metrics['code_engine.client.requests']
+        assert requests.value == 2
+        assert requests.attributes == {
+            'code_engine.operation': 'list_apps',
+            'http.request.method': 'GET',
+            'http.response.status_code': 200,
+        }
+        (retries,) = metrics['code_engine.client.retries']
+        assert retries.value == 2
+        (duration,) = metrics['code_engine.client.request.duration']
+        assert duration.sum == pytest.approx(0.06)
+        (concurrency_limit,) = metrics['code_engine.client.concurrency.limit']
+        assert concurrency_limit.value == 2
+
+    def test_not_installed(self, monkeypatch):
+        """
+        Test that OpenTelemetryMetricsSink explains how to install opentelemetry-api when it is not installed.
+        """
+        monkeypatch.setitem(sys.modules, 'opentelemetry', None)
+
+        with pytest.raises(ImportError, match=r'ibm-code-engine-sdk\[opentelemetry\]'):
+            OpenTelemetryMetricsSink()
+
+
+class TestImports:
+    """
+    Test Class for the imports of the metrics module
+    """
+
+    def test_lazy_imports(self):
+        """
+        Test that importing the client does not import the optional metrics packages.
+        """
+        script = (
+            'import sys\n'
+            'from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2\n'
+            'print(sorted(name for name in ["prometheus_client", "opentelemetry.metrics"] if name in sys.modules))'
+        )
+        output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+        assert output.strip() == '[]'
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the rate_limit module
+"""
+
+import asyncio
+import threading
+import pytest
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_code_engine_sdk.rate_limit import RateLimit, RateLimiter, TokenBucket, get_shared_rate_limiter
+
+
+class FakeClock:
+    """
+    A clock that only moves when it sleeps.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """
+    A fake clock.
+    """
+    return FakeClock()
+
+
+class TestTokenBucket:
+    """
+    Test Class for TokenBucket
+    """
+
+    def test_burst(self, clock):
+        """
+        Test that a full bucket allows a burst, and then one token per 1/rate seconds.
+        """
+        bucket = TokenBucket(10, 3, clock=clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+        assert bucket.reserve() == pytest.approx(0.1)
+        assert bucket.reserve() == pytest.approx(0.2)
+        assert bucket.tokens == pytest.approx(-2)
+
+    def test_refill(self, clock):
+        """
+        Test that tokens are added at the rate, up to the burst.
+        """
+        bucket = TokenBucket(2, 4, clock=clock)
+        for _ in range(4):
+            bucket.reserve()
+
+        clock.now = 1.0
+        assert bucket.tokens == pytest.approx(2)
+        clock.now = 100.0
+        assert bucket.tokens == 4
+
+    def test_defaults(self):
+        """
+        Test the default burst and the validation of the arguments.
+        """
+        assert TokenBucket(5).burst == 5
+        assert TokenBucket(0.1).burst == 1
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+        with pytest.raises(ValueError):
+            TokenBucket(1, 0.5)
+
+    def test_threads(self, clock):
+        """
+        Test that concurrent reservations are all accounted for.
+        """
+        bucket = TokenBucket(100, 1, clock=clock)
+
+        def reserve():
+            for _ in range(1000):
+                bucket.reserve()
+
+        threads = [threading.Thread(target=reserve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert bucket.tokens == pytest.approx(1 - 8000)
+
+
+class TestRateLimit:
+    """
+    Test Class for RateLimit
+    """
+
+    def test_defaults(self):
+        """
+        Test that the rate and burst of a limit are checked like those of its buckets.
+        """
+        assert RateLimit(5).burst == 5
+        assert RateLimit(0.1).burst == 1
+        with pytest.raises(ValueError, match='rate must be positive'):
+            RateLimit(0)
+        with pytest.raises(ValueError, match='burst must be at least 1'):
+            RateLimit(1, burst=0.5)
+        with pytest.raises(ValueError, match='max_buckets must be at least 1'):
+            RateLimit(1, max_buckets=0)
+
+    def test_prune(self, clock):
+        """
+        Test that the buckets of idle projects are dropped once there are too many.
+        """
+        limit = RateLimit(1, per_project=True, max_buckets=3, clock=clock)
+        for project_id in ['p1', 'p2', 'p3']:
+            limit.get_bucket(project_id).reserve()
+        clock.now += 0.5
+        busy = limit.get_bucket('p3')
+        busy.reserve()
+        clock.now += 0.6
+
+        limit.get_bucket('p4')
+
+        assert sorted(limit._buckets) == ['p3', 'p4']  # pylint: disable=protected-access
+        assert limit.get_bucket('p3') is busy
+        assert limit.get_bucket('p1').tokens == 1
+
+    def test_prune_amortized(self, clock):
+        """
+        Test that the buckets in use are kept, and are not scanned again on every new project.
+        """
+        limit = RateLimit(1, per_project=True, max_buckets=2, clock=clock)
+        for project_id in ['p1', 'p2', 'p3', 'p4', 'p5']:
+            limit.get_bucket(project_id).reserve()
+
+        assert len(limit._buckets) == 5  # pylint: disable=protected-access
+        # The buckets were scanned at the third and at the fifth project.
+        assert limit._prune_at == 8  # pylint: disable=protected-access
+
+
+class TestRateLimiter:
+    """
+    Test Class for RateLimiter
+    """
+
+    def test_families(self, clock):
+        """
+        Test that a limit applies to the requests of its kinds and methods.
+        """
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.add_limit(1, kinds=['job_runs'], methods=['post'])
+
+        assert limiter.reserve('POST', '/projects/p1/job_runs') == 0
+        assert limiter.reserve('POST', '/projects/p1/job_runs') == 1
+        assert limiter.reserve('GET', '/projects/p1/job_runs/my-job-run') == 0
+        assert limiter.reserve('POST', '/projects/p1/apps') == 0
+        assert limiter.reserve('POST', '/projects') == 0
+        assert limiter.waits == 1
+        assert limiter.wait_time == 1
+
+    def test_per_project(self, clock):
+        """
+        Test that a limit per project keeps a bucket for every project.
+        """
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.add_limit(1, per_project=True)
+
+        assert limiter.reserve('GET', '/projects/p1/apps') == 0
+        assert limiter.reserve('GET', '/projects/p2/apps/my-app') == 0
+        assert limiter.reserve('GET', '/projects/p1') == 1
+        assert limiter.reserve('GET', '/projects') == 0
+        assert limiter.reserve('GET', '/function_runtimes') == 1
+
+    def test_account_and_family(self, clock):
+        """
+        Test that a request waits for the longest of the limits that apply to it.
+        """
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.add_limit(10, burst=1)
+        limiter.add_limit(1, kinds=['apps'], per_project=True)
+
+        assert limiter.reserve('GET', '/projects/p1/apps') == 0
+        assert limiter.reserve('GET', '/projects/p1/apps') == pytest.approx(1)
+        assert limiter.acquire('GET', '/projects/p1/jobs') == pytest.approx(0.2)
+        assert limiter.acquire('GET', '/projects/p1/apps') == pytest.approx(1.8)
+        assert clock.sleeps == [pytest.approx(0.2), pytest.approx(1.8)]
+        assert len(limiter.limits) == 2
+
+        limiter.clear()
+        assert limiter.acquire('GET', '/projects/p1/apps') == 0
+
+    def test_shared(self):
+        """
+        Test that the shared rate limiter is the same for the whole process.
+        """
+        assert get_shared_rate_limiter() is get_shared_rate_limiter()
+
+
+class TestClient:
+    """
+    Test Class for the rate limiting of the requests of a client
+    """
+
+    def test_client(self, clock, emulator):
+        """
+        Test that the requests of clients sharing a rate limiter wait for their tokens.
+        """
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.add_limit(2, burst=1, kinds=['job_runs'], methods=['POST'], per_project=True)
+        services = [emulator.new_client(), emulator.new_client()]
+        for service in services:
+            service.set_rate_limiter(limiter)
+        assert services[0].get_rate_limiter() is limiter
+
+        project_id = services[0].create_project(name='my-project', resource_group_id='b91e849c').get_result()['id']
+        services[0].create_job(project_id, image_reference='icr.io/codeengine/helloworld', name='my-job')
+        for service in services:
+            service.create_job_run(project_id, job_name='my-job')
+        services[1].list_job_runs(project_id)
+
+        assert clock.sleeps == [pytest.approx(0.5)]
+        assert emulator.request_counts['POST /projects/{project_id}/job_runs'] == 2
+
+    def test_ttl_cache(self, clock, emulator_client):
+        """
+        Test that reads served from the TTL cache do not wait.
+        """
+        service = emulator_client
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.add_limit(1)
+        service.set_rate_limiter(limiter)
+        service.enable_ttl_cache()
+
+        for _ in range(3):
+            service.list_function_runtimes()
+
+        assert not clock.sleeps
+
+    def test_async(self, clock, emulator):
+        """
+        Test that the requests of an asyncio client wait for their tokens without blocking.
+        """
+        pytest.importorskip('httpx')
+        from ibm_code_engine_sdk.async_code_engine_v2 import (  # pylint: disable=import-outside-toplevel
+            AsyncCodeEngineV2,
+        )
+
+        limiter = RateLimiter()
+        limiter.add_limit(100, burst=1)
+
+        async def main():
+            service = emulator.mount_async(AsyncCodeEngineV2(authenticator=NoAuthAuthenticator()))
+            service.set_rate_limiter(limiter)
+            async with service:
+                await asyncio.gather(*(service.list_projects() for _ in range(3)))
+
+        asyncio.run(main())
+        assert limiter.waits == 2
+        assert limiter.wait_time == pytest.approx(0.03, abs=0.005)
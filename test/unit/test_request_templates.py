@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the request_templates module
+"""
+
+import pytest
+import responses
+from ibm_cloud_sdk_core import BaseService
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2
+from ibm_code_engine_sdk.common import get_user_agent
+from ibm_code_engine_sdk.request_templates import RequestTemplate, encode_path_var
+
+_base_url = 'https://api.au-syd.codeengine.cloud.ibm.com/v2'
+
+_project_id = '15314cc3-85b4-4338-903f-c28cdee6d005'
+
+
+def new_service() -> CodeEngineV2:
+    """
+    Returns a CodeEngineV2 client for the tests.
+    """
+    service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+class TestRequestTemplate:
+    """
+    Test Class for RequestTemplate
+    """
+
+    def test_url(self):
+        """
+        Test that the path parameters are encoded like encode_path_vars() does.
+        """
+        template = RequestTemplate('get_app_revision', '/projects/{project_id}/apps/{app_name}/revisions/{name}', {})
+
+        assert template.path_param_keys == ['project_id', 'app_name', 'name']
+        assert template.get_url('p', 'my app', 'a/b?c') == '/projects/p/apps/my%20app/revisions/a%2Fb%3Fc'
+        for value in ['my app', 'a/b?c', 'ä', '{name}']:
+            assert encode_path_var(value) == list(BaseService.encode_path_vars(value))[0]
+        with pytest.raises(TypeError):
+            template.get_url('p', 'my-app')
+
+    def test_url_without_path_parameters(self):
+        """
+        Test the URL of an operation without path parameters.
+        """
+        template = RequestTemplate('list_projects', '/projects', {})
+
+        assert template.path_param_keys == []
+        assert template.get_url() == '/projects'
+
+    def test_headers(self):
+        """
+        Test that the headers of a call override the content-type header but not the Accept header.
+        """
+        template = RequestTemplate(
+            'update_app',
+            '/projects/{project_id}/apps/{name}',
+            {'User-Agent': 'sdk'},
+            accept='application/json',
+            content_type='application/merge-patch+json',
+        )
+
+        assert template.get_headers() == {
+            'User-Agent': 'sdk',
+            'content-type': 'application/merge-patch+json',
+            'Accept': 'application/json',
+        }
+        assert template.get_headers({'content-type': 'text/plain', 'Accept': 'text/plain', 'X-Test': '1'}) == {
+            'User-Agent': 'sdk',
+            'content-type': 'text/plain',
+            'Accept': 'application/json',
+            'X-Test': '1',
+        }
+        assert template.get_headers(None, {'If-Match': '*', 'User-Agent': 'other'}) == {
+            'If-Match': '*',
+            'User-Agent': 'sdk',
+            'content-type': 'application/merge-patch+json',
+            'Accept': 'application/json',
+        }
+
+    def test_headers_are_copied(self):
+        """
+        Test that changing the headers of a request does not change the template.
+        """
+        template = RequestTemplate('delete_app', '/projects/{project_id}/apps/{name}', {'User-Agent': 'sdk'})
+
+        template.get_headers()['X-Test'] = '1'
+
+        assert template.get_headers() == {'User-Agent': 'sdk'}
+
+
+class TestClientTemplates:
+    """
+    Test Class for the request templates of CodeEngineV2
+    """
+
+    def test_templates_per_client(self):
+        """
+        Test that a client builds the template of an operation once.
+        """
+        service = new_service()
+        service.send = lambda request, **kwargs: request
+
+        request = service.get_job_run(project_id=_project_id, name='my-job-run')
+        template = service._get_request_template('get_job_run', '/projects/{project_id}/job_runs/{name}')
+        service.get_job_run(project_id=_project_id, name='other-job-run')
+
+        assert request['url'] == _base_url + '/projects/{0}/job_runs/my-job-run'.format(_project_id)
+        assert request['headers']['User-Agent'] == get_user_agent()
+        assert template is service._get_request_template('get_job_run', '/projects/{project_id}/job_runs/{name}')
+        assert template is not new_service()._get_request_template(
+            'get_job_run', '/projects/{project_id}/job_runs/{name}'
+        )
+
+    @responses.activate
+    def test_request(self):
+        """
+        Test the headers and the URL of a request.
+        """
+        url = _base_url + '/projects/{0}/apps/my%20app'.format(_project_id)
+        responses.add(responses.PATCH, url, json={'name': 'my app'}, status=200)
+        service = new_service()
+
+        service.update_app(
+            project_id=_project_id, name='my app', if_match='*', app={'image_port': 8080}, headers={'X-Test': '1'}
+        )
+        service.update_app(project_id=_project_id, name='my app', if_match='2', app={'image_port': 8080})
+
+        first, second = [call.request for call in responses.calls]
+        assert first.url == url
+        assert first.headers['If-Match'] == '*'
+        assert first.headers['X-Test'] == '1'
+        assert first.headers['Accept'] == 'application/json'
+        assert first.headers['content-type'] == 'application/merge-patch+json'
+        assert second.headers['If-Match'] == '2'
+        assert 'X-Test' not in second.headers
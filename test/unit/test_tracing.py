@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the tracing module
+"""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_code_engine_sdk.code_engine_v2 import AppsPager, CodeEngineV2
+from ibm_code_engine_sdk.tracing import CodeEngineTracer, start_span
+from ibm_code_engine_sdk.waiters import Backoff, JobRunsWaiter, wait_until_app_ready
+
+pytest.importorskip('opentelemetry.sdk.trace')
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import StatusCode
+
+
+@pytest.fixture
+def exporter():
+    """
+    An exporter that keeps the finished spans.
+    """
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer_provider(exporter):
+    """
+    A tracer provider that exports its spans to the exporter.
+    """
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return tracer_provider
+
+
+@pytest.fixture
+def service(emulator, tracer_provider):
+    """
+    A traced client of the emulator.
+    """
+    service = emulator.new_client()
+    service.enable_tracing(tracer_provider=tracer_provider)
+    return service
+
+
+@pytest.fixture
+def project_id(service, exporter):
+    """
+    The ID of a project of the emulator.
+    """
+    project_id = service.create_project(name='my-project', resource_group_id='b91e849c').get_result()['id']
+    exporter.clear()
+    return project_id
+
+
+def _spans(exporter, name):
+    return [span for span in exporter.get_finished_spans() if span.name == name]
+
+
+class TestOperations:
+    """
+    Test Class for the spans of the calls of a client
+    """
+
+    def test_disabled(self, emulator, exporter):
+        """
+        Test that a client does not trace its calls by default.
+        """
+        service = emulator.new_client()
+        assert service.tracer is None
+        service.list_projects()
+        assert not exporter.get_finished_spans()
+
+    def test_operation(self, service, project_id, exporter):
+        """
+        Test that a call opens a client span with the operation, project, resource and status.
+        """
+        service.create_app(project_id, 'icr.io/codeengine/helloworld', 'my-app')
+        service.get_app(project_id, 'my-app')
+
+        create, get = exporter.get_finished_spans()
+        assert create.name == 'code_engine.create_app'
+        assert create.kind == trace.SpanKind.CLIENT
+        assert create.attributes['code_engine.project_id'] == project_id
+        assert create.attributes['http.response.status_code'] == 201
+        assert get.name == 'code_engine.get_app'
+        assert get.attributes['code_engine.operation_id'] == 'get_app'
+        assert get.attributes['code_engine.resource_name'] == 'my-app'
+        assert get.attributes['http.request.method'] == 'GET'
+        assert get.attributes['url.full'].endswith('/projects/{0}/apps/my-app'.format(project_id))
+        assert get.status.status_code == StatusCode.UNSET
+        assert 'http.request.resend_count' not in get.attributes
+
+    def test_nested_resource_name(self, service, project_id, exporter):
+        """
+        Test that the resource name of a call is the last name of its path.
+        """
+        service.create_app(project_id, 'icr.io/codeengine/helloworld', 'my-app')
+        service.list_app_revisions(project_id, 'my-app')
+        with pytest.raises(ApiException):
+            service.get_app_revision(project_id, 'my-app', 'my-app-00002')
+
+        list_revisions, get_revision = exporter.get_finished_spans()[1:]
+        assert list_revisions.attributes['code_engine.resource_name'] == 'my-app'
+        assert get_revision.attributes['code_engine.resource_name'] == 'my-app-00002'
+
+    def test_trace_context(self, service, project_id, exporter, tracer_provider):
+        """
+        Test that the context of the span is sent in the traceparent header, under the current span.
+        """
+        sent = []
+        with tracer_provider.get_tracer(__name__).start_as_current_span('parent'):
+            service.list_apps(project_id, hooks={'response': lambda response, **kwargs: sent.append(response.request)})
+
+        parent = _spans(exporter, 'parent')[0]
+        span = _spans(exporter, 'code_engine.list_apps')[0]
+        assert span.parent.span_id == parent.context.span_id
+        assert sent[0].headers['traceparent'] == '00-{0:032x}-{1:016x}-{2:02x}'.format(
+            span.context.trace_id, span.context.span_id, span.context.trace_flags
+        )
+        assert trace.get_current_span() is trace.INVALID_SPAN
+
+    def test_error(self, service, project_id, exporter):
+        """
+        Test that a failed call sets the error status of its span.
+        """
+        with pytest.raises(ApiException):
+            service.get_app(project_id, 'missing-app')
+
+        (span,) = exporter.get_finished_spans()
+        assert span.attributes['http.response.status_code'] == 404
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.events[0].name == 'exception'
+
+    def test_interrupted(self, service, project_id, exporter):
+        """
+        Test that the span of an interrupted call is ended, and its context detached.
+        """
+
+        def interrupt(response, **kwargs):
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            service.list_apps(project_id, hooks={'response': interrupt})
+
+        (span,) = exporter.get_finished_spans()
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.events[0].attributes['exception.type'] == 'KeyboardInterrupt'
+        assert trace.get_current_span() is trace.INVALID_SPAN
+
+    def test_async_cancelled(self, emulator, tracer_provider, exporter):
+        """
+        Test that the span of a cancelled asyncio call is ended, and its context detached.
+        """
+        pytest.importorskip('httpx')
+        from ibm_code_engine_sdk.async_code_engine_v2 import (  # pylint: disable=import-outside-toplevel
+            AsyncCodeEngineV2,
+        )
+
+        async def main():
+            service = emulator.mount_async(AsyncCodeEngineV2(authenticator=NoAuthAuthenticator()))
+            service.enable_tracing(tracer_provider=tracer_provider)
+            emulator.latency = 10
+            async with service:
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(service.list_projects(), 0.05)
+                return trace.get_current_span()
+
+        assert asyncio.run(main()) is trace.INVALID_SPAN
+        (span,) = exporter.get_finished_spans()
+        assert span.name == 'code_engine.list_projects'
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.events[0].attributes['exception.type'].endswith('CancelledError')
+
+    def test_retries(self, emulator, tracer_provider, exporter):
+        """
+        Test that the retries of a request are recorded on its span.
+        """
+        server = emulator.serve()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+            service.set_service_url('http://{0}:{1}/v2'.format(*server.server_address[:2]))
+            service.enable_retries(max_retries=3, retry_interval=0)
+            service.enable_tracing(tracer_provider=tracer_provider)
+            emulator.fail_next(503, count=2)
+            service.list_projects()
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        (span,) = exporter.get_finished_spans()
+        assert span.attributes['http.request.resend_count'] == 2
+        assert span.attributes['http.response.status_code'] == 200
+
+    def test_async(self, emulator, tracer_provider, exporter):
+        """
+        Test that the calls and pages of an asyncio client are traced.
+        """
+        pytest.importorskip('httpx')
+        from ibm_code_engine_sdk.async_code_engine_v2 import (  # pylint: disable=import-outside-toplevel
+            AsyncCodeEngineV2,
+            AsyncProjectsPager,
+        )
+
+        async def main():
+            service = emulator.mount_async(AsyncCodeEngineV2(authenticator=NoAuthAuthenticator()))
+            service.enable_tracing(tracer_provider=tracer_provider)
+            async with service:
+                await service.create_project(name='my-project', resource_group_id='b91e849c')
+                return await AsyncProjectsPager(client=service).get_all()
+
+        assert len(asyncio.run(main())) == 1
+        create, list_projects, page = exporter.get_finished_spans()
+        assert create.name == 'code_engine.create_project'
+        assert page.name == 'AsyncProjectsPager.get_page'
+        assert list_projects.parent.span_id == page.context.span_id
+
+    def test_disable(self, service, exporter):
+        """
+        Test that disabling tracing stops opening spans.
+        """
+        service.disable_tracing()
+        service.list_projects()
+        assert not exporter.get_finished_spans()
+
+
+class TestPagersAndWaiters:
+    """
+    Test Class for the spans of the pagers and waiters
+    """
+
+    @pytest.mark.parametrize('prefetch', [0, 2])
+    def test_pager(self, service, project_id, exporter, prefetch):
+        """
+        Test that the calls of a pager are traced under a span per page.
+        """
+        for name in ['app-1', 'app-2', 'app-3']:
+            service.create_app(project_id, 'icr.io/codeengine/helloworld', name)
+        exporter.clear()
+
+        assert len(AppsPager(client=service, project_id=project_id, limit=2, prefetch=prefetch).get_all()) == 3
+
+        pages = _spans(exporter, 'AppsPager.get_page')
+        calls = _spans(exporter, 'code_engine.list_apps')
+        assert len(pages) == len(calls) == 2
+        assert [call.parent.span_id for call in calls] == [page.context.span_id for page in pages]
+        assert 'code_engine.page.start' not in pages[0].attributes
+        assert pages[1].attributes['code_engine.page.start']
+
+    def test_wait_until_app_ready(self, emulator, service, project_id, exporter):
+        """
+        Test that every poll of an app waiter is traced under the span of the wait.
+        """
+        emulator.app_ready_delay = 0.05
+        service.create_app(project_id, 'icr.io/codeengine/helloworld', 'my-app')
+        exporter.clear()
+
+        wait_until_app_ready(service, project_id, 'my-app', backoff=Backoff(delay=0.02, jitter=0))
+
+        (wait,) = _spans(exporter, 'wait_until_app_ready')
+        polls = _spans(exporter, 'wait_until_app_ready.poll')
+        assert len(polls) >= 2
+        assert all(poll.parent.span_id == wait.context.span_id for poll in polls)
+        assert wait.attributes['code_engine.resource_name'] == 'my-app'
+        get_app = _spans(exporter, 'code_engine.get_app')[0]
+        assert get_app.parent.span_id == polls[0].context.span_id
+
+    def test_job_runs_waiter(self, service, project_id, exporter):
+        """
+        Test that the polls of a job runs waiter are traced under the span of the wait.
+        """
+        service.create_job(project_id, image_reference='icr.io/codeengine/helloworld', name='my-job')
+        job_run = service.create_job_run(project_id, job_name='my-job').get_result()
+        exporter.clear()
+
+        JobRunsWaiter(service, project_id, [job_run['name']]).wait(backoff=Backoff(delay=0.01))
+
+        (wait,) = _spans(exporter, 'JobRunsWaiter.wait')
+        (poll,) = _spans(exporter, 'JobRunsWaiter.poll')
+        (page,) = _spans(exporter, 'JobRunsPager.get_page')
+        assert poll.parent.span_id == wait.context.span_id
+        assert page.parent.span_id == poll.context.span_id
+        assert poll.attributes['code_engine.job_runs.pending'] == 1
+
+    def test_start_span_disabled(self, emulator):
+        """
+        Test that start_span() does nothing for a client without tracing.
+        """
+        with start_span(emulator.new_client(), 'my-span', {'key': 'value'}) as span:
+            assert span is None
+
+
+class TestImports:
+    """
+    Test Class for the imports of the tracing module
+    """
+
+    def test_lazy_imports(self):
+        """
+        Test that the clients without tracing do not import opentelemetry.
+        """
+        script = (
+            'import sys\n'
+            'from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator\n'
+            'from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2\n'
+            'from ibm_code_engine_sdk.tracing import start_span\n'
+            'with start_span(CodeEngineV2(authenticator=NoAuthAuthenticator()), "my-span"):\n'
+            '    pass\n'
+            'print(sorted(name for name in sys.modules if name.startswith("opentelemetry")))'
+        )
+        output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+        assert output.strip() == '[]'
+
+    def test_not_installed(self, monkeypatch):
+        """
+        Test that enabling tracing explains how to install opentelemetry-api when it is not installed.
+        """
+        monkeypatch.setitem(sys.modules, 'opentelemetry', None)
+
+        with pytest.raises(ImportError, match=r'ibm-code-engine-sdk\[opentelemetry\]'):
+            CodeEngineTracer()
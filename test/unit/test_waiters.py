@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the waiters module
+"""
+
+import json
+import time
+import pytest
+import responses
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_code_engine_sdk import waiters
+from ibm_code_engine_sdk.code_engine_v2 import CodeEngineV2
+from ibm_code_engine_sdk.waiters import (
+    Backoff,
+    JobRunsWaiter,
+    WaiterError,
+    WaiterTimeoutError,
+    wait_until_app_ready,
+)
+
+_service = CodeEngineV2(authenticator=NoAuthAuthenticator())
+
+_base_url = 'https://api.au-syd.codeengine.cloud.ibm.com/v2'
+_service.set_service_url(_base_url)
+
+_project_id = '15314cc3-85b4-4338-903f-c28cdee6d005'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replaces the clock of the waiters with a fake one that advances on sleep.
+    """
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(time, 'sleep', sleep)
+    monkeypatch.setattr(waiters.random, 'random', lambda: 0.5)
+    return sleeps
+
+
+def add_app_states(*states):
+    """
+    Registers a mock of get_app that answers with the given (status, status_details)
+    states in turn, and repeats the last one.
+    """
+    states = list(states)
+
+    def callback(request):
+        status, status_details = states.pop(0) if len(states) > 1 else states[0]
+        return (200, {}, json.dumps({'name': 'my-app', 'status': status, 'status_details': status_details}))
+
+    responses.add_callback(
+        responses.GET,
+        _base_url + '/projects/{0}/apps/my-app'.format(_project_id),
+        callback=callback,
+        content_type='application/json',
+    )
+
+
+def add_revision(name: str, status: str):
+    """
+    Registers a mock of get_app_revision.
+    """
+    responses.add(
+        responses.GET,
+        _base_url + '/projects/{0}/apps/my-app/revisions/{1}'.format(_project_id, name),
+        json={'name': name, 'status': status},
+        status=200,
+    )
+
+
+def add_job_run_sweeps(sweeps, *, page_size=2):
+    """
+    Registers a mock of list_job_runs that serves one sweep over the job runs
+    per poll, in pages of `page_size`. Each sweep maps job run names to their
+    status.
+    """
+    sweeps = list(sweeps)
+
+    def callback(request):
+        start = int(request.params.get('start', '0'))
+        job_runs = sweeps[0]
+        names = sorted(job_runs)
+        page = names[start : start + page_size]
+        result = {
+            'job_runs': [
+                {'name': name, 'status': job_runs[name], 'status_details': {'requested': 1, job_runs[name]: 1}}
+                for name in page
+            ],
+            'limit': page_size,
+        }
+        if start + page_size < len(names):
+            result['next'] = {'start': str(start + page_size)}
+        elif len(sweeps) > 1:
+            sweeps.pop(0)
+        return (200, {}, json.dumps(result))
+
+    responses.add_callback(
+        responses.GET,
+        _base_url + '/projects/{0}/job_runs'.format(_project_id),
+        callback=callback,
+        content_type='application/json',
+    )
+
+
+class TestBackoff:
+    """
+    Test Class for Backoff
+    """
+
+    def test_delays(self, clock):
+        """
+        Backoff.delays()
+        """
+        delays = Backoff(delay=1, max_delay=5, multiplier=2, jitter=0.5).delays()
+
+        assert [next(delays) for _ in range(5)] == [0.75, 1.5, 3.0, 3.75, 3.75]
+
+    def test_without_jitter(self):
+        """
+        Test that the delays are exact without jitter.
+        """
+        delays = Backoff(delay=2, max_delay=8, jitter=0).delays()
+
+        assert [next(delays) for _ in range(4)] == [2, 4, 8, 8]
+
+    def test_invalid_arguments(self):
+        """
+        Test that invalid arguments are rejected.
+        """
+        with pytest.raises(ValueError):
+            Backoff(delay=0)
+        with pytest.raises(ValueError):
+            Backoff(delay=10, max_delay=5)
+        with pytest.raises(ValueError):
+            Backoff(multiplier=0.5)
+        with pytest.raises(ValueError):
+            Backoff(jitter=2)
+
+
+class TestWaitUntilAppReady:
+    """
+    Test Class for wait_until_app_ready
+    """
+
+    @responses.activate
+    def test_ready(self, clock):
+        """
+        Test that the waiter returns once the latest revision is ready.
+        """
+        add_app_states(
+            ('deploying', {'latest_created_revision': 'my-app-00001', 'reason': 'deploying'}),
+            ('deploying', {'latest_created_revision': 'my-app-00001', 'reason': 'deploying'}),
+            ('ready', {'latest_created_revision': 'my-app-00001', 'latest_ready_revision': 'my-app-00001'}),
+        )
+        add_revision('my-app-00001', 'ready')
+        polled = []
+
+        result = wait_until_app_ready(
+            _service,
+            _project_id,
+            'my-app',
+            backoff=Backoff(delay=1, jitter=0),
+            on_poll=polled.append,
+        )
+
+        assert result.status == 'ready'
+        assert result.revision_status == 'ready'
+        assert len(polled) == 3
+        assert clock == [1, 2]
+
+    @responses.activate
+    def test_ready_waits_for_latest_revision(self, clock):
+        """
+        Test that an app serving an older revision is not reported as ready.
+        """
+        add_app_states(
+            ('ready', {'latest_created_revision': 'my-app-00002', 'latest_ready_revision': 'my-app-00001'}),
+            ('ready', {'latest_created_revision': 'my-app-00002', 'latest_ready_revision': 'my-app-00002'}),
+        )
+
+        result = wait_until_app_ready(_service, _project_id, 'my-app', fetch_revision=False)
+
+        assert result.app['status_details']['latest_ready_revision'] == 'my-app-00002'
+        assert result.revision is None
+        assert len(clock) == 1
+
+    @responses.activate
+    def test_failed_revision(self, clock):
+        """
+        Test that the waiter stops early when the latest revision failed.
+        """
+        add_app_states(
+            ('deploying', {'latest_created_revision': 'my-app-00002'}),
+            (
+                'warning',
+                {
+                    'latest_created_revision': 'my-app-00002',
+                    'latest_ready_revision': 'my-app-00001',
+                    'reason': 'ready_but_latest_revision_failed',
+                },
+            ),
+        )
+        add_revision('my-app-00002', 'failed')
+
+        with pytest.raises(WaiterError) as e:
+            wait_until_app_ready(_service, _project_id, 'my-app')
+
+        assert not isinstance(e.value, WaiterTimeoutError)
+        assert e.value.resource['status'] == 'warning'
+        assert e.value.revision == {'name': 'my-app-00002', 'status': 'failed'}
+        assert 'ready_but_latest_revision_failed' in str(e.value)
+
+    @responses.activate
+    def test_failed(self, clock):
+        """
+        Test that the waiter stops at a failed app.
+        """
+        add_app_states(('failed', {}))
+
+        with pytest.raises(WaiterError):
+            wait_until_app_ready(_service, _project_id, 'my-app')
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_warning(self, clock):
+        """
+        Test that the waiter stops at an app with a warning, with its reason.
+        """
+        add_app_states(
+            ('warning', {'latest_created_revision': 'my-app-00001', 'reason': 'container_failed_exit_code_1'})
+        )
+
+        with pytest.raises(WaiterError) as e:
+            wait_until_app_ready(_service, _project_id, 'my-app', fetch_revision=False)
+
+        assert not isinstance(e.value, WaiterTimeoutError)
+        assert str(e.value) == 'App my-app has a warning: container_failed_exit_code_1'
+        assert e.value.resource['status'] == 'warning'
+        assert len(responses.calls) == 1
+        assert not clock
+
+    @responses.activate
+    def test_warning_not_failing(self, clock):
+        """
+        Test that the waiter keeps waiting for an app with a warning when asked to.
+        """
+        add_app_states(
+            ('warning', {'latest_created_revision': 'my-app-00001', 'reason': 'container_failed_exit_code_1'}),
+            ('ready', {'latest_created_revision': 'my-app-00001', 'latest_ready_revision': 'my-app-00001'}),
+        )
+
+        result = wait_until_app_ready(_service, _project_id, 'my-app', fetch_revision=False, fail_on_warning=False)
+
+        assert result.status == 'ready'
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_timeout(self, clock):
+        """
+        Test that the waiter gives up at its deadline.
+        """
+        add_app_states(('deploying', {'reason': 'waiting_for_resources'}))
+
+        with pytest.raises(WaiterTimeoutError) as e:
+            wait_until_app_ready(
+                _service,
+                _project_id,
+                'my-app',
+                timeout=10,
+                backoff=Backoff(delay=1, max_delay=4, jitter=0),
+            )
+
+        assert clock == [1, 2, 4, 3]
+        assert sum(clock) == 10
+        assert e.value.resource['status_details']['reason'] == 'waiting_for_resources'
+        assert e.value.revision is None
+
+    def test_value_error(self):
+        """
+        Test that the required parameters are validated.
+        """
+        with pytest.raises(ValueError):
+            wait_until_app_ready(_service, None, 'my-app')
+        with pytest.raises(ValueError):
+            wait_until_app_ready(_service, _project_id, '')
+
+
+class TestJobRunsWaiter:
+    """
+    Test Class for JobRunsWaiter
+    """
+
+    @responses.activate
+    def test_wait(self, clock):
+        """
+        JobRunsWaiter.wait()
+        """
+        add_job_run_sweeps(
+            [
+                {'run-a': 'running', 'run-b': 'pending', 'run-c': 'running', 'other': 'running'},
+                {'run-a': 'completed', 'run-b': 'running', 'run-c': 'failed', 'other': 'running'},
+                {'run-a': 'completed', 'run-b': 'completed', 'run-c': 'failed', 'other': 'running'},
+            ]
+        )
+        completed = []
+
+        waiter = JobRunsWaiter(
+            _service,
+            _project_id,
+            ['run-a', 'run-b', 'run-c'],
+            job_name='my-job',
+            limit=2,
+            on_complete=lambda job_run: completed.append(job_run['name']),
+        )
+        job_runs = waiter.wait(backoff=Backoff(delay=1, jitter=0))
+
+        assert sorted(job_runs) == ['run-a', 'run-b', 'run-c']
+        assert sorted(waiter.failed) == ['run-c']
+        assert sorted(completed) == ['run-a', 'run-b', 'run-c']
+        assert waiter.statuses['run-b'].succeeded is None
+        assert waiter.statuses['run-b'].requested == 1
+        assert not waiter.pending
+        assert clock == [1, 2]
+        assert all(call.request.params['job_name'] == 'my-job' for call in responses.calls)
+
+    @responses.activate
+    def test_poll_stops_listing_early(self):
+        """
+        Test that a poll stops listing once every unfinished job run was seen.
+        """
+        add_job_run_sweeps([{'run-a': 'running', 'run-b': 'running', 'run-c': 'running', 'run-d': 'running'}])
+
+        waiter = JobRunsWaiter(_service, _project_id, ['run-a'])
+        assert waiter.poll() == []
+
+        assert len(responses.calls) == 1
+        assert waiter.pending == {'run-a'}
+        assert waiter.job_runs['run-a']['status'] == 'running'
+        assert waiter.statuses['run-a'].running == 1
+
+    @responses.activate
+    def test_missing_job_runs(self):
+        """
+        Test that job runs that are not listed are reported as missing.
+        """
+        add_job_run_sweeps([{'run-a': 'completed'}])
+
+        waiter = JobRunsWaiter(_service, _project_id, ['run-a', 'run-z'])
+        finished = waiter.poll()
+
+        assert [job_run['name'] for job_run in finished] == ['run-a']
+        assert waiter.missing == {'run-z'}
+        assert waiter.pending == {'run-z'}
+
+    @responses.activate
+    def test_warning(self, clock):
+        """
+        Test that the waiter stops at an app with a warning, with its reason.
+        """
+        add_app_states(
+            ('warning', {'latest_created_revision': 'my-app-00001', 'reason': 'container_failed_exit_code_1'})
+        )
+
+        with pytest.raises(WaiterError) as e:
+            wait_until_app_ready(_service, _project_id, 'my-app', fetch_revision=False)
+
+        assert not isinstance(e.value, WaiterTimeoutError)
+        assert str(e.value) == 'App my-app has a warning: container_failed_exit_code_1'
+        assert e.value.resource['status'] == 'warning'
+        assert len(responses.calls) == 1
+        assert not clock
+
+    @responses.activate
+    def test_warning_not_failing(self, clock):
+        """
+        Test that the waiter keeps waiting for an app with a warning when asked to.
+        """
+        add_app_states(
+            ('warning', {'latest_created_revision': 'my-app-00001', 'reason': 'container_failed_exit_code_1'}),
+            ('ready', {'latest_created_revision': 'my-app-00001', 'latest_ready_revision': 'my-app-00001'}),
+        )
+
+        result = wait_until_app_ready(_service, _project_id, 'my-app', fetch_revision=False, fail_on_warning=False)
+
+        assert result.status == 'ready'
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_timeout(self, clock):
+        """
+        Test that the waiter gives up at its deadline.
+        """
+        add_job_run_sweeps([{'run-a': 'running'}])
+
+        waiter = JobRunsWaiter(_service, _project_id, ['run-a'])
+        with pytest.raises(WaiterTimeoutError):
+            waiter.wait(timeout=30, backoff=Backoff(delay=10, jitter=0))
+
+        assert sum(clock) == 30
+
+    def test_no_job_runs(self):
+        """
+        Test that waiting without tracked job runs sends no requests.
+        """
+        waiter = JobRunsWaiter(_service, _project_id)
+
+        assert waiter.wait() == {}
@@ -0,0 +1,321 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generates the tables of the properties of the models, `_FIELDS` in every
+module of `ibm_code_engine_sdk/code_engine_v2/models`, from which the
+decoders, the encoders and the lazy views of the models are built.
+
+The tables are read from the source of the generated `from_dict()`,
+`to_dict()` and `__init__()` of every model. Models whose methods do not follow
+the generated patterns, such as the models with additional properties, are
+left out of the tables and keep their methods. Run it again whenever the
+models are regenerated:
+
+    make model-fields
+
+Usage, with the SDK installed:
+
+    python tools/generate_model_fields.py [--check]
+"""
+
+from inspect import getsource, signature
+from textwrap import dedent
+from typing import Callable, Dict, List, Optional
+import argparse
+import ast
+import sys
+
+from ibm_code_engine_sdk import code_engine_v2
+from ibm_code_engine_sdk.code_engine_v2 import models
+from ibm_code_engine_sdk.decoders import REQUIRED_MESSAGE, ModelField
+
+# The first line of the table of a module, which ends at the next line that closes a brace.
+TABLE_START = '# The properties of the models, generated by tools/generate_model_fields.py.\n'
+
+# The table is written before this line, the first time that it is generated.
+TABLE_BEFORE = '# Replace the from_dict() and to_dict() of the models'
+
+# The statements of a generated to_dict() for a property, by the kind of the property.
+TO_DICT_TEMPLATES = {
+    'value': [
+        "if hasattr(self, 'X') and self.X is not None:\n    _dict['X'] = self.X",
+        "if hasattr(self, 'X') and getattr(self, 'X') is not None:\n    _dict['X'] = getattr(self, 'X')",
+    ],
+    'model': [
+        "if hasattr(self, 'X') and self.X is not None:\n"
+        "    if isinstance(self.X, dict):\n"
+        "        _dict['X'] = self.X\n"
+        "    else:\n"
+        "        _dict['X'] = self.X.to_dict()",
+    ],
+    'list': [
+        "if hasattr(self, 'X') and self.X is not None:\n"
+        "    X_list = []\n"
+        "    for v in self.X:\n"
+        "        if isinstance(v, dict):\n"
+        "            X_list.append(v)\n"
+        "        else:\n"
+        "            X_list.append(v.to_dict())\n"
+        "    _dict['X'] = X_list",
+    ],
+    'dict': [
+        "if hasattr(self, 'X') and self.X is not None:\n"
+        "    X_map = {}\n"
+        "    for k, v in self.X.items():\n"
+        "        if isinstance(v, dict):\n"
+        "            X_map[k] = v\n"
+        "        else:\n"
+        "            X_map[k] = v.to_dict()\n"
+        "    _dict['X'] = X_map",
+    ],
+}
+
+
+def get_models() -> Dict[str, List[type]]:
+    """
+    Returns the models of the service, by the name of their module.
+    """
+    exports = [getattr(code_engine_v2, name) for name in code_engine_v2.__all__]
+    by_module = {}
+    for model in exports:
+        if isinstance(model, type) and model.__module__.startswith(models.__name__ + '.'):
+            by_module.setdefault(model.__module__, []).append(model)
+    return by_module
+
+
+def get_model_fields(model: type) -> Optional[List[ModelField]]:
+    """
+    Returns the properties of a model, or None if its methods do not follow
+    the generated patterns.
+    """
+    from_dict = _original(vars(model)['from_dict'].__func__)
+    to_dict = _original(vars(model)['to_dict'])
+    read = _parse_from_dict(model, from_dict)
+    written = _parse_to_dict(to_dict)
+    assigned = _parse_init(model)
+    if read is None or written is None or assigned is None:
+        return None
+    names = [field.name for field in read]
+    if names != [name for name, _ in written] or names != assigned:
+        return None
+    return [
+        field._replace(to_dict_kind=kind if kind != field.kind else None) for field, (_, kind) in zip(read, written)
+    ]
+
+
+def render(module_models: List[type]) -> str:
+    """
+    Returns the source of the table of the properties of the models of a
+    module.
+    """
+    lines = [TABLE_START.rstrip('\n'), '_FIELDS = {']
+    for model in module_models:
+        fields = get_model_fields(model) if 'from_dict' in vars(model) and 'to_dict' in vars(model) else None
+        if fields is None:
+            continue
+        if len(fields) == 1:
+            lines.append('    {0!r}: ({1},),'.format(model.__name__, _render_field(fields[0])))
+        else:
+            lines.append('    {0!r}: ('.format(model.__name__))
+            lines.extend('        {0},'.format(_render_field(field)) for field in fields)
+            lines.append('    ),')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def update(source: str, table: str) -> str:
+    """
+    Returns the source of a module with its table replaced by `table`.
+    """
+    start = source.find(TABLE_START)
+    if start < 0:
+        start = end = source.index(TABLE_BEFORE)
+        table += '\n'
+    else:
+        end = source.index('\n}\n', start) + 3
+    return source[:start] + table + source[end:]
+
+
+def _render_field(field: ModelField) -> str:
+    arguments = [repr(field.name)]
+    if field.kind != 'value':
+        arguments.extend([repr(field.kind), repr(field.model)])
+    if field.required:
+        arguments.append('required=True')
+    if field.to_dict_kind is not None:
+        arguments.append('to_dict_kind={0!r}'.format(field.to_dict_kind))
+    return 'ModelField({0})'.format(', '.join(arguments))
+
+
+def _original(function: Callable) -> Callable:
+    return getattr(function, '__wrapped__', function)
+
+
+def _parse_body(function: Callable, first: str, last: str) -> Optional[List[ast.stmt]]:
+    body = ast.parse(dedent(getsource(function))).body[0].body
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]
+    if not body or ast.unparse(body[0]) != first or ast.unparse(body[-1]) != last:
+        return None
+    return body[1:-1]
+
+
+def _parse_from_dict(model: type, from_dict: Callable) -> Optional[List[ModelField]]:
+    # Returns the properties that a generated from_dict() reads.
+    body = _parse_body(from_dict, 'args = {}', 'return cls(**args)')
+    if body is None:
+        return None
+    fields = []
+    for statement in body:
+        field = _parse_property(model, statement)
+        if field is None:
+            return None
+        fields.append(field)
+    return fields
+
+
+def _parse_property(model: type, statement: ast.stmt) -> Optional[ModelField]:
+    # Parses: if (name := _dict.get('name')) is not None: args['name'] = <conversion of name> [else: raise ValueError(...)]
+    if not isinstance(statement, ast.If) or len(statement.body) != 1:
+        return None
+    test = statement.test
+    if not (
+        isinstance(test, ast.Compare)
+        and isinstance(test.left, ast.NamedExpr)
+        and isinstance(test.ops[0], ast.IsNot)
+        and ast.unparse(test.comparators[0]) == 'None'
+    ):
+        return None
+    variable = test.left.target.id
+    lookup = test.left.value
+    if not (ast.unparse(lookup.func) == '_dict.get' and isinstance(lookup.args[0], ast.Constant)):
+        return None
+    key = lookup.args[0].value
+    assign = statement.body[0]
+    if not (isinstance(assign, ast.Assign) and ast.unparse(assign.targets[0]) == 'args[{0!r}]'.format(key)):
+        return None
+    kind, nested = _parse_conversion(ast.unparse(assign.value), variable)
+    if kind is None:
+        return None
+    required = False
+    if statement.orelse:
+        raise_statement = statement.orelse[0]
+        if not (
+            len(statement.orelse) == 1
+            and isinstance(raise_statement, ast.Raise)
+            and ast.unparse(raise_statement.exc.func) == 'ValueError'
+            and raise_statement.exc.args[0].value == REQUIRED_MESSAGE.format(key, model.__name__)
+        ):
+            return None
+        required = True
+    return ModelField(key, kind, nested, required=required)
+
+
+def _parse_conversion(value: str, variable: str) -> tuple:
+    if value == variable:
+        return 'value', None
+    for kind, suffix, prefix in [
+        ('model', '.from_dict({0})'.format(variable), ''),
+        ('list', '.from_dict(v) for v in {0}]'.format(variable), '['),
+        ('dict', '.from_dict(v) for k, v in {0}.items()}}'.format(variable), '{k: '),
+    ]:
+        if value.startswith(prefix) and value.endswith(suffix):
+            nested = value[len(prefix) : -len(suffix)]
+            if nested.isidentifier():
+                return kind, nested
+    return None, None
+
+
+def _parse_to_dict(to_dict: Callable) -> Optional[List[tuple]]:
+    # Returns the (name, kind) of the properties that a generated to_dict() writes.
+    body = _parse_body(to_dict, '_dict = {}', 'return _dict')
+    if body is None:
+        return None
+    names = []
+    for statement in body:
+        if not (isinstance(statement, ast.If) and isinstance(statement.test, ast.BoolOp)):
+            return None
+        hasattr_call = statement.test.values[0]
+        if not (isinstance(hasattr_call, ast.Call) and isinstance(hasattr_call.args[1], ast.Constant)):
+            return None
+        name = hasattr_call.args[1].value
+        source = ast.unparse(statement)
+        kind = next(
+            (
+                kind
+                for kind, templates in TO_DICT_TEMPLATES.items()
+                if any(source == template.replace('X', name) for template in templates)
+            ),
+            None,
+        )
+        if kind is None or not name.isidentifier():
+            return None
+        names.append((name, kind))
+    return names
+
+
+def _parse_init(model: type) -> Optional[List[str]]:
+    # Returns the properties in the order in which __init__() assigns them, if
+    # it does nothing but assign its arguments.
+    body = ast.parse(dedent(getsource(model.__init__))).body[0].body
+    names = []
+    for statement in body:
+        if isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant):
+            continue
+        if not (
+            isinstance(statement, ast.Assign)
+            and len(statement.targets) == 1
+            and isinstance(statement.targets[0], ast.Attribute)
+            and ast.unparse(statement.targets[0].value) == 'self'
+            and isinstance(statement.value, ast.Name)
+            and statement.value.id == statement.targets[0].attr
+        ):
+            return None
+        names.append(statement.value.id)
+    parameters = [name for name in signature(model.__init__).parameters if name != 'self']
+    if sorted(names) != sorted(parameters):
+        return None
+    return names
+
+
+def main() -> int:
+    """
+    Writes the tables, or checks that they are up to date with `--check`.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0].strip())
+    parser.add_argument('--check', action='store_true', help='fail if a table is not up to date')
+    args = parser.parse_args()
+    outdated = []
+    for module, module_models in get_models().items():
+        path = sys.modules[module].__file__
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+        updated = update(source, render(module_models))
+        if updated == source:
+            continue
+        outdated.append(path)
+        if not args.check:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(updated)
+    if args.check and outdated:
+        print('Not up to date, run make model-fields: {0}'.format(', '.join(outdated)), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())